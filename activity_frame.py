@@ -0,0 +1,74 @@
+"""
+The athlete's activities as one compact, typed DataFrame.
+
+The intervals.icu payload carries ~100 fields per activity; the dashboard reads
+a handful. build_activity_frame() projects just those, parses the dates once
+into a DatetimeIndex (newest first, like the payload) and stores numbers in
+small dtypes. It runs once per fetched payload and every section reads the
+same frame.
+
+Columns: id, name (object), type (category), moving_time (int32),
+icu_training_load, distance (m) and average_heartrate (float32, missing = 0)
+and load (float32, the estimate from metrics.estimate_load). The raw payload
+isn't kept alongside it.
+"""
+import numpy as np
+import pandas as pd
+
+from metrics import estimate_load
+
+
+def _field(activities, key):
+    return [a.get(key) for a in activities]
+
+
+def _float32(activities, key):
+    values = pd.to_numeric(pd.Series(_field(activities, key), dtype=object), errors='coerce')
+    return values.fillna(0).astype(np.float32)
+
+
+def build_activity_frame(activities):
+    """Typed frame indexed by start_date_local; accepts the raw JSON list or a DataFrame."""
+    if isinstance(activities, pd.DataFrame):
+        activities = activities.to_dict('records')
+    activities = activities or []
+
+    start = pd.to_datetime(_field(activities, 'start_date_local'), format='ISO8601', errors='coerce')
+    moving_time = pd.to_numeric(pd.Series(_field(activities, 'moving_time'), dtype=object), errors='coerce')
+    raw = pd.DataFrame({
+        'suffer_score': pd.to_numeric(pd.Series(_field(activities, 'suffer_score'), dtype=object), errors='coerce'),
+        'moving_time': moving_time,
+    })
+
+    frame = pd.DataFrame({
+        'id': pd.Series(_field(activities, 'id'), dtype=object).astype(str),
+        'name': pd.Series(_field(activities, 'name'), dtype=object),
+        'type': pd.Series(_field(activities, 'type'), dtype=object).astype('category'),
+        'moving_time': moving_time.fillna(0).astype(np.int32),
+        'icu_training_load': _float32(activities, 'icu_training_load'),
+        'distance': _float32(activities, 'distance'),
+        'average_heartrate': _float32(activities, 'average_heartrate'),
+        'load': np.nan_to_num(estimate_load(raw)).astype(np.float32),
+    })
+    frame.index = pd.DatetimeIndex(start, name='start_date_local')
+
+    frame = frame[frame.index.notna()]
+    if not frame.index.is_monotonic_decreasing:
+        frame = frame.sort_index(ascending=False, kind='stable')
+    return frame
+
+
+def recent_activities(frame, n=3):
+    """The newest n activities as dicts, in the shape build_ai_prompt() expects (missing fields left out)."""
+    if frame is None:
+        return []
+    head = frame.head(n)
+    recent = []
+    for ts, name, type_ in zip(head.index, head['name'], head['type']):
+        act = {'start_date_local': ts.strftime('%Y-%m-%dT%H:%M:%S')}
+        if pd.notna(name):
+            act['name'] = name
+        if pd.notna(type_):
+            act['type'] = type_
+        recent.append(act)
+    return recent
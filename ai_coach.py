@@ -0,0 +1,220 @@
+"""
+AI coach: prompt construction and Gemini workout generation.
+
+Responses are cached on (model, prompt hash) in a bounded in-process LRU,
+optionally mirrored to disk (AETHERIUM_AI_CACHE_DIR, the newest
+AETHERIUM_AI_CACHE_DISK_SIZE files kept) so identical prompts survive
+restarts. Empty answers are never cached. A regenerate request skips the cache lookup. Output is
+streamed chunk by chunk so the UI can render from the first token.
+Every call goes through the shared rate-limited scheduler (gemini_scheduler),
+which retries 429s and falls back to the next model in the chain, and
+identical requests that are already in flight share one call.
+"""
+import logging
+import os
+import tempfile
+from itertools import chain
+
+from cache_utils import LRUCache, SingleFlight, content_key
+from gemini_scheduler import FALLBACK_MODELS, get_scheduler
+
+DEFAULT_MODEL = FALLBACK_MODELS[0]  # gemini-2.0-flash-lite unless AETHERIUM_AI_MODELS says otherwise
+AI_STREAMING = os.environ.get("AETHERIUM_AI_STREAM", "1") != "0"  # Set to 0 for one-shot responses
+AI_CACHE_SIZE = int(os.environ.get("AETHERIUM_AI_CACHE_SIZE", 256))
+AI_CACHE_DIR = os.environ.get("AETHERIUM_AI_CACHE_DIR")  # Unset = memory only
+AI_CACHE_DISK_SIZE = int(os.environ.get("AETHERIUM_AI_CACHE_DISK_SIZE", 2000))  # Files kept on disk
+GENAI_BASE_URL = os.environ.get("AETHERIUM_GENAI_BASE_URL")  # Unset = Google; set for the load-test stub
+
+logger = logging.getLogger(__name__)
+
+_response_cache = LRUCache(AI_CACHE_SIZE)
+_in_flight = SingleFlight()
+
+
+def build_ai_prompt(sport, discipline, goal, time_str, form, recent_activities):
+    """
+    Constructs the prompt for the AI, now including the specific Discipline.
+    """
+    # 1. Summarize last 3 workouts
+    recent_context = "None"
+    if recent_activities:
+        sorted_acts = sorted(recent_activities, key=lambda x: x['start_date_local'], reverse=True)[:3]
+        recent_context = ""
+        for act in sorted_acts:
+            name = act.get('name', 'Unknown')
+            type_ = act.get('type', 'Workout')
+            date = act.get('start_date_local', '')[:10]
+            recent_context += f"- {date}: {type_} ({name})\n"
+
+    # 2. Determine Biological State
+    bio_state = "Neutral"
+    if form < -20: bio_state = "High Fatigue"
+    elif -20 <= form < -5: bio_state = "Fatigued"
+    elif -5 <= form <= 15: bio_state = "Fresh"
+    elif form > 15: bio_state = "Very Fresh"
+
+    # 1. Handle Time String
+    if str(time_str).lower() == "no limit":
+        time_text = "Unlimited (Design the optimal duration for this specific workout)"
+    else:
+        # Strip " mins" from the string if it exists to get just the number
+        clean_time = str(time_str).replace(" mins", "")
+        time_text = f"{clean_time} minutes"
+    
+    # 2. The Strict Prompt (Update the 'Time Available' line)
+    prompt = f"""
+    Act as an elite {sport} coach. Write a specific {discipline} workout for today.
+    
+    **Context:**
+    - Macro Sport: {sport}
+    - Specific Discipline: {discipline}
+    - Goal: {goal}
+    - Time Available: {time_text}
+    - Athlete Status: {int(form)} ({bio_state})
+    - Recent History:
+    {recent_context}
+    
+    **Strict Output Rules:**
+    1. NO conversational filler.
+    2. BE CONCISE. Use short bullet points.
+    3. Format exactly like this:
+       **Workout Name**
+       **Warm Up** (Bullet points)
+       **Main Set** (Bullet points, specific intervals)
+       **Cool Down** (Bullet points)
+       **Coach's Logic** (1 sentence explaining why this fits the history/status)
+    """
+    return prompt
+
+
+def _disk_path(key):
+    return os.path.join(AI_CACHE_DIR, f"{key}.txt")
+
+
+def _cache_get(key):
+    text = _response_cache.get(key)
+    if text is None and AI_CACHE_DIR:
+        try:
+            with open(_disk_path(key), encoding="utf-8") as f:
+                text = f.read()
+            os.utime(_disk_path(key))  # Recently used: pruned last
+        except OSError:
+            return None
+        if text:
+            _response_cache.put(key, text)
+    return text or None  # "" (an empty answer from an older version) counts as a miss
+
+
+def _prune_disk_cache():
+    """Keeps the AI_CACHE_DISK_SIZE most recently used files."""
+    with os.scandir(AI_CACHE_DIR) as entries:
+        files = [e for e in entries if e.name.endswith(".txt")]
+    if len(files) <= AI_CACHE_DISK_SIZE:
+        return
+    files.sort(key=lambda e: e.stat().st_mtime)
+    for entry in files[:len(files) - AI_CACHE_DISK_SIZE]:
+        try:
+            os.remove(entry.path)
+        except FileNotFoundError:
+            pass  # Another process pruned it first
+
+
+def _cache_put(key, text):
+    if not text:
+        return  # Blocked / empty candidates: let the next request ask again
+    _response_cache.put(key, text)
+    if not AI_CACHE_DIR:
+        return
+    # The disk copy is best effort: the answer has already been shown, so a
+    # failure here is logged rather than raised to every joined request
+    try:
+        os.makedirs(AI_CACHE_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=AI_CACHE_DIR, suffix=".tmp")  # Unique per writer
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp_path, _disk_path(key))  # Atomic, so readers never see half a file
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        _prune_disk_cache()
+    except OSError:
+        logger.warning("Could not write the AI response cache to %s", AI_CACHE_DIR, exc_info=True)
+
+
+def _model_chain(model):
+    """The requested model first, then the rest of the fallback chain."""
+    return [model] + [m for m in FALLBACK_MODELS if m != model]
+
+
+def _fresh_pieces(client, prompt, model, stream):
+    """
+    Calls Gemini through the scheduler and yields the text (in chunks when
+    streaming). The full answer is cached before the flight finishes, so a
+    request arriving right after it lands on the cache. It is cached under the
+    model that actually answered, so a fallback answer never sits behind the
+    requested model's key.
+
+    Rate limits are retried up to the first chunk; once text is on screen a
+    failure is raised as-is rather than restarting on another model.
+    """
+    if stream:
+        def open_stream(m):
+            # The SDK only sends the request when the stream is iterated, so pull
+            # the first chunk here, inside the scheduler's retry loop
+            chunks = iter(client.models.generate_content_stream(model=m, contents=prompt))
+            return next(chunks, None), chunks
+
+        (first, chunks), answered = get_scheduler().run(open_stream, _model_chain(model))
+        pieces = (c.text for c in chain([first] if first is not None else [], chunks) if c.text)
+    else:
+        response, answered = get_scheduler().run(
+            lambda m: client.models.generate_content(model=m, contents=prompt),
+            _model_chain(model),
+        )
+        pieces = [response.text] if response.text else []  # None for blocked / empty candidates
+
+    parts = []
+    for piece in pieces:
+        parts.append(piece)
+        yield piece
+    _cache_put(content_key(answered, prompt), "".join(parts))
+
+
+def _shared_pieces(client, prompt, model, stream):
+    # Identical requests already in flight (other sessions, other tabs) are joined, not repeated
+    return _in_flight.stream(content_key(model, prompt), lambda: _fresh_pieces(client, prompt, model, stream))
+
+
+def generate_workout(client, prompt, model=DEFAULT_MODEL, use_cache=True):
+    """
+    Returns (workout_text, from_cache). Identical prompts for the same model are
+    answered from the cache; pass use_cache=False to force a fresh generation
+    (the new answer replaces the cached one).
+    """
+    if use_cache:
+        cached = cached_workout(prompt, model)
+        if cached is not None:
+            return cached, True
+
+    return "".join(_shared_pieces(client, prompt, model, stream=False)), False
+
+
+def cached_workout(prompt, model=DEFAULT_MODEL):
+    """The cached answer for this prompt, or None."""
+    return _cache_get(content_key(model, prompt))
+
+
+def stream_workout(client, prompt, model=DEFAULT_MODEL, use_cache=True, stream=AI_STREAMING):
+    """
+    Yields the workout text in pieces as Gemini produces them, so the card can
+    render from the first token. Cache hits (and stream=False) yield it in one
+    piece. The full text is cached once the stream has finished.
+    """
+    if use_cache:
+        cached = cached_workout(prompt, model)
+        if cached is not None:
+            yield cached
+            return
+
+    yield from _shared_pieces(client, prompt, model, stream)
@@ -1,20 +1,30 @@
 from google import genai
-from fpdf import FPDF
 import os
 import textwrap
 import streamlit.components.v1 as components
 import urllib.parse
 import streamlit as st
-import base64
 import requests
-import json
 import pandas as pd
 import plotly.express as px
-import plotly.graph_objects as go
-import tempfile
 from datetime import datetime, timedelta
+from functools import partial
+from data_store import AthleteStore, athlete_key
+from intervals_api import (
+    AUTHORIZE_URL, RECENT_DAYS, TIMEOUTS, TOKEN_URL, cancel_history_backfill, fetch_dashboard_data, start_history_backfill
+)
+from activity_frame import build_activity_frame, recent_activities
+from classifier import TYPE_MAPPING, classify_activities, muscle_focus
+from metrics import forget_training_state, incremental_training_load, reconcile_training_load, server_training_load
+from charts import cached_fitness_figure, muscle_distribution_figure, waterfall_figure
+from history import GRANULARITIES, aggregate_history, history_table_html, muscle_distribution
+from media import LOGO_LOGIN, asset_data_uri, theme_stylesheet_url
+from ai_coach import GENAI_BASE_URL, build_ai_prompt, cached_workout, stream_workout
+from gemini_scheduler import get_scheduler, is_rate_limited
+from token_store import TokenStore, needs_refresh, remove_legacy_token_file
+from workout_pdf import export_week_booklet, export_week_zip, get_workout_pdf, pdf_file_name
+from profiler import PROFILER_FLAG, TraceLog, begin_rerun, end_rerun, is_enabled, section, span, traced
 
-LOGO_BASE64 = "iVBORw0KGgoAAAANSUhEUgAABlcAAAZXCAYAAAD6rSYVAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAAMsAAADLAAShkWtsAAP+lSURBVHhe7P15vHX3XR/2ftfe55xn0CxLHiTZsjwJDxiDnQAGEjsQUkMCJAQnaXvT0JtL0tumbZr0RdPbe7m+t0MgAUIZUkoS9wYIxTRtIIFCS3BMgDCZ0djgWbNkTY/0zOecvX73D519tM7av2Htc84ja3i//0ie/fl8vos8SMdBayMpAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA4FikFF1ERPpQbEVEpPfHRkRE/+1xavn57m+/7VRERP9TcWLY9T/6VP7It8S16f1/dOMj3xrXpPf/0Y0H/kZclVLqBv9lov+up27Ttzz1/JRiNuwBAJYO/A8RAAAAAM+Ex/52XHf9m19z6b5f+fjN17/kqu1z952/6uT1J+KG//zyp858x4lXxeWTjz+5ff7N115/+t6zZy+9JS26c7G1uDi7HG/sTm59cvfS9ttmaeOu3di96UTMf//SvH/F1kb3YCzSi3Z2I8272VUpLTZTNz/fRbopojszi/6Vi5h/KEV/0+YsPrG76F7Rpe7sot996dZW99Dudn9utjXb6Lv+M7M0e+nGddf81uUzT9ze95u/tzFf3HzTVRsPPnJ+96WvOH3irgcuXL79pX/+yz9094++/5Yb5ltPnk9nZy+77uaLH3v44dlrvvA1l2df9fHLy99rel/Mu3fH4uB/BwCA5zJfrgAAAABH8pF/ENd8zqv/6MUHf/0DN1578tTGPY9c3L7h5OatL371yz997yfu+vxrT52+78yT5784xXxrHt2ZRfSvj9ns0mLRv2Zz1j28WKQvjq772Cylq1IfGxFxbR/pJbNZ7PZ9vGo2i0/t7sZr5l08niJuixRd18U9qYutSLGdIm6MFBdSxOlIMe+62EoRZ7qI6yPFxdTFyS7FqS7iYynFDamLLiJORYroulh0XTyS+rgpRZydRZyKiHN9xJkuxc5sHjt9ij762IyInW7eXYxFRKR4MnXp5fN59/E+pdvms9nPLVK6LaXuFzfm3bV9P3tg1u9ev3F6/qm03V/fdfGx3cs7Z178ouvSw+eemC/i9Lk73nPhwXv/23jRbf9lPJqe+n/3/hcw6anfYzr432kA4NnClysAAABAVfrOuL7763Hm0//N1htu/7e/+JN3/5Nf+LKTJzYvXry8c6Lb7T53sTFL3aL/3FnMPpWif2N06cFYdHemWXpRLOJ0n+K2FHFpFnFNdHF1SnGh6+J0dPFgRFyf+lh0KTZTxDxSRDeLeUrRd93oH8s1+qph5ZuHlaCQjbU2KRYRMR/HS12K7dTFPPV7b1q6uBQpLs9msR0pTsQs/iDtxkuii8dmEZsx634tRbrURffhWde9eDaPT6SYXbtIs/s3YvvMbLa5sxOLC1fNu/OPnN2+//V/J85GRKTvj83ur8TO+L8+APDM8+UKAAAAvIA99e8V+Ybu7m/7sZdsXH/DxqK/tNh4fPvzupOzu7bPL94WMTuZonvtou+vnUV3R+rS9dF3D8+69Pl9inMR8dKIuDoiHo4U13YpZn3ErOvKX0asaH+5sWIlWgkGal00+lo31eozLqUUm5Fi1kWcj4itmMVj0cc8urgrUry66+LjMes+Po/uvq5PZ+NE97FFH6fmu+l3FylddfuLX/Y7dz358LXXx8kzu6efWNz8zU99AQMAPDN8uQIAAAAvAOnXY7N7W+x85r/det1Nr37xI/fe/dAt0cfndv18c3ex+8e6rru/79NrZxGzFOnmlOK1KeLaWR+bKaJPKTaaX5isfokwzZS7webAvHZb62JCHxM3NbX7WhcRXR/bKSJSF5sRcS4iHu0iFjGLhyPFyZS6D0cX85jPfjR2Y/u2W0589P6HL77s5OmTH+m3t2+45dU33HfX4qHFHd8Yl8bPBgCOxpcrAAAA8DyRUnTx1L+QJD3wnSde+ZI3XP/wXR985MtmMd9KKd4ci3RL18XOIvVfMYt4chHxhi7i2i7FwynFVnRx3fiZEe0vASImbsam3Iw2KycrwUCpK+VDUzZTlJ5Tyof2NsXpU8WZSHFVzOLhro/zqYsL0XWPdV3c3UdcvvrE5s9e2t15TbdIv7J1snvyZe+49UP3/Ku7Tr/iPfHY+HEAwHS+XAEAAIDnmJRi1nXRn/n2uPG6U9el33voiROnTszfduOpE/c+fn73T3RpcWo+696ym9JtEXFV6uPW2VPv4k9ExNb4eeW393tqfa1rad3Wvlip3da6pdam1beU7kv50LQvVYpSH4vl32W09++DeTS6+ESXYtFtzH4jontiPkt3RR9b3Sz91qXt3Udf87JrH48nn9ydvSeeHD8PAFjlyxUAAAB4jvj0d8TLrt+69qonLl14abcd74yN+WO724t3dJEuR8RrUoo7uxRXHfh3njRexEc0NrUuJvQ5U25qX6xkgz2lfOmo/VSl55TypdYXK9Eq831K0XddzOKpl0GPR4rouvhYH3HHfNb9XB+xtbEx/+l53z/Rb8SHL+7E7HVvfe1Hzt5997XX/s1zj9z91+PUK74zLo6fCwAvVL5cAQAAgGeZ/qdec6I7deviod/4xbed7jbmj1/euTG6+BORZin6/s/2EedTitT3cWMXcV100XXx1IvzFZkX7ftq3VJpU8qnaN0O+uw0G1bypaP2U5SeUcqH9jbVabWc0BekiIuR4sn5LB5e7MZWzLt7NyLu6eazT8667rGUdu85uTn79LmdnU+/+lvjiYin/w6q8bMA4IXAlysAAADwWZa+/+qbIq658KnHP/NlJzfnV2/vpi+NRbo9pdiOlN6RurgmUnRdxKn9m/3/o6DWLdU2tS4m9DlTbkablZOVYE8pXzpqP0XuGblsbG9TnVbLCX1L6T7F430Xp2YR98767lPzefqNlLoL81OzX+9St33dxsbvPBnn+1vfE4+MTwHg+cyXKwAAAPAMuu9b4vTVr7rm1LWfPPvE3Sfn75p3s5t2+vQlEelzuy5ORx+3pogbIsVOdLEZcfDF9/4vSy/Dl2p9rVuqbWpdTe1u1GWn2bCSLx21n6L0jFI+tLepTqvlhL5lyn2//3epnIvuqX+sWHTdPd189ptdinOpX3xiM3UPvvzbd39leZJSdF036ekA8JziyxUAAAC4gh77/rjuhre+defBX/3g1TtPzL5ic2O+e3k33hGpf2NEvGTRxy2zLq5J6el/Cfm+zCvp/SjTRVTyodqm1sWEPmfKzWizcrISFLKx1qbVt5TuS/nQ3qY6rZZ7pmxKptw2Nl0fZ1PEdszi/lnX/dpsFnd1EZ+Ja7Z+beNif/KWV5760IMffXz3Zd8e58e3APBc5csVAAAAOEYP/OO46mV/Mc5/8lvjzo3ZxpdvdPPd7d3Fl0TEdbFIr4yIV6SIG7JfpgyVvmxovOiu9rVuqbQp5VPUbjPdSrQS7CnlS0ftpyg9o5QvDfrsNBuOTNmUTLk9xCal2I2I1EWc67roInU/P5vFwxuz+a/1G9HNNtK/3JpvnH3Jey48ePASAJ5bfLkCAAAAR9D/UpyavT0u3vUd8aqN2PziRT+7frGz+xcjxcWuixf1i7glUlzXdZGii43xfdH4pXUmW3GUvtYtTdmMtW5yv8/sh4FSPtTatPqW2n2ti4N9cVosBqZsSqbctjatPp7e9H2cmXVxzyx1D803ut+fbcavbe92FzZOdr+5s3159pq/Ex8bnwLAs5kvVwAAAOAQ7vt7G186j/mp1Hc3XLq8++9HRJf69EXRxdWziO0+xayL2BrfTZJ7+b7Gi+wVpXzpqH1J7S7TrUQrwZ5SHo1uacqmpnRfypdyf1zHisXAlE3JlNvWptUvFXZ9H30XcbGLeDB13e+f2Oh+t4/4cNpNH7/mxOY9N33bxXvHNwDwbOPLFQAAAJjgru878aqXnzy9c99nnvjTO333hfN5d6rfTe/ouriqTzE/8I/4KrxUnmR0u/+x9sxaF42+1i1N2Yy1bgb9ynQlGKh1cQx9S+2+1kXj9xylcKDVt0y5fwY2adSliJ2ui0Us4q5ZFz8/m8c/S9Gdn5+46nc2blrMb3nrW8/Ev/pA370n+oOXAPDZ48sVAAAAyEjpW2Zd957+rv9u/qdic/aybpG+fNGnt/cpTncRV1f/rpTKi+Wi1RfO2XzFlexrXcmUm9LvtRjsKeXR6JambGpK96V8aG9TnBaLgSmbkim3x7Gp9OMvVcZSHylSRPfU9OHZLD4xm83e33WzT5y+4dRv3Lxx+t7u8v1n0xe+ppt91ccvj+8B4JnkyxUAAAAYuOfbNz/v6hOb3ZkLO18fKX1+16dX9Slu67q4JqL+8rjatYxu9z/WnlnrotHXupjQl7TuBv3KdCUYqHXR6GvdOkrPKeVLqTGplhP6mim3z9Cm9eVKRP4ZfR+XIsXD89n8X5+cz/6PfiM9dNufufkDD/wvZ6669TvOPZK+JTa698Tu+A4AriRfrgAAAPCC1X9XnIjT117V/eXXnv303/nNb5jPZq9Oi3h736e3pj5ujIjoZhP/cV+1rmV0u/+x9cxaX+ui0de6kik3pd9nMdhTypeO2reU7kv50N6mOq2WE/qa1m2rj4mbKO8O+6VK1iIudynuTxuze+aRPtOdnP9UbCw+8srbr/lIxOMXur8SO+MTALgSfLkCAADAC85d3xc3xPn5l87nGxcXO/3X9NF/UUpxUxdxc6S4eryPaLz8rXUtmdtUyPfVungG+pzazajLTrNhJV+q9bVuHaXnlPJ4uqtN6uWEvmbK7RXeHOuXKhndbpxfzGJjNpv94mwnPXHiuhPft9FtfuYl/+2rPxLxwUXX+Xe0AHDl+HIFAACA5717vztedMP1N5567NFzp/rtnX+3T7Pro4vPS328qYt4UUqx2P8X0o9f9o4/50zZlAxu939Ze16tiyP2ta6mdTfqV+YrQSEba21afUvpvpQP7W2K02Kxp9XXtG5bfRzP5kp/ubIvRcQitlOKM12a/c7GovtId/3mj1+62N23edW5B179rfHE+AQAjsqXKwAAADxvPfB34o7tjc0vizQ73e0u3tWn9LqU4qYUcbqLOH1gXHvJW+pK+RSZ2/0o00VU8qHa5rBdTetu0Gen2bCSLx21ryndlvKhvU11Wi0n9C2t+1YfR9s8Y1+qLOWetd09MtuIR9LF9P441X30utO7//DxS9G97rvjyfEUAA7DlysAAAA8b3zofbH1xm94a7r72z/45n4x/8bZrNvqU/qCLsUrUoqbx/sDci9oc9lQq68Z3O7/svW8Wl/rotHXuprWXaY/EGX6bDbW2rT6ltJ9KR/a22Sn2XCg1be07lt9HG3zjH+pEo3npYi+j9TtxBOxO/vwxon4jY3N/idjY/Hxl39HfKLrqtcAUOXLFQAAAJ7zPvU98dIXz07f+vgivWr30vbfSn1sdSmu7bt40f7foVJ7jVrq1s2nGt3vf6w997BdHENfUrsr/R6LwZ5SHo1uacqmpHRbyof2NtVptdwzZZNTu6t1Q1N2hc1+XOj3tfqppj4nDf7YpFjMduOJxW5378bp2S9tpvSrJ2/ofmFrd/uR6/92PD4+BYAaX64AAADwnPXJb407T21ufOVO6m7pd/q/lLp4aaTYSRGz/X+HSjRexJa6Ur7U6ktGdymTZZU2pXyotql1Ja2bTH8gyvTZbKy2qXVTlZ5RypdSY1It90zZlEy5bW1afdQ3zb9rpdWvY+qzCru0iD6l6LsU52cRZ7e2Nr9rvug+dvbk/BfvfNW5S91/FOfGNwAw5ssVAAAAnjOe+O5rXnTtO19++ZM/8eHXb2zO/+MU3U0ppS+JFNeMt/sKL1gjKl0pj0bXMrrd/1h7Zq2LRl/rYkKfU7vJdCvRSrCnlEejW5qyKand1ro42Gen2XCg1ddMuW1tWn3UN80vVaJ+v7YpzyptcnkfKfWxE6m7e3Zp9m9mp+e/ftPrb/2RJx94qL/tb599dDwHgCVfrgAAAPCsd/93bb51Y2N+9c5ueu3lS7v/xSzimtTF9RGxlX1hOlTrc10uG2r1NXu3Bx7Rel6tP2wXE/qcKTeDzcp8JdhTypdqfa2bqvSMUh6N3+dSsRiYssmZelfb1bqhwu4Z/WJlynNam1YfEd2FOBuz7jNpd/Gr8xPdj6fof/rV/2M8Md4BgC9XAAAAeNa669vmXxvz7g1d6l6xs+jfPevixvGm+MK0lC/l+lw21OpLRncHPpaeWcqXan2tW5qyGavd1H6P2WBPKY9GtzRlU1K7rXXxdF+cFYs9rb5myu1xbCp984uVVr+Oqc8q7Ur50HiTIvUXukfmffepfhY/O99K/+yqm3bvful/Fw+NlgC8QPlyBQAAgGeNlKLrukif+Luzv7yZui9ZpO4V0aU/VPzHfo1fiA4dpivl0ehaBrf7v2w9r9bXumj0ta5kyk3u97jyYaTWRaOvdVPlnpHLxvY2xWmxGJiyyWndtfqYsKn0zS9Von6/tinPKm1KeU5mm/qILkVKi9jttrt7uhS/cfVLN3+wezA9dvNbbvpg95/de7nroh/fAfDC4MsVAAAAPuvOfN91N1z3R27d+fTPfPSvpb5/V0R3c0S8sktxcrzdl3kZuq/WRaYffx5r9SWZu/0o00VU8qWj9LWupnY36rLTXJjLho7at5TuS/nSXl+cFYs9rb5mym1r0+qjvnnGvlyZ8ozaptYNTdkt/5hvx25EbM/62S+mPt3/6vf+B3/lnv/yH5++/W8/8fj4BIDnP1+uAAAA8Flzz9/beu3VpzeuunB+90/s7iz+w0UXN3d9bEYX8/H2gNYL0VK/bh6NrmV0mzLZilpf66LR17qSKTeDzcp8JdhTypdqfa2bonRfyof2NtVprax1NVPujmNT6Z+xL1VijefUdrUuJvRDo22KiLQTl7vL3f2zjf53Y2P+IxsXdn7nlT8cHz64BOD5zJcrAAAAPOMe+M6NL0yz2csXi3jdYrH4axHx0mFffZFb66LR57pctlTrWjIvZHP5vlI+VNvUupjQ59RuSr+/oVyYy4aO2reU7kt5HOyKs2Kxp9XXtG6P2kd9U/15XJqymWLKc2qbWrc0ZRP53TjqFhFpEWdnl2cf6VL32ydv7n/wlpdc9aHub/m7WQCe73y5AgAAwDPmnu+Yf/U8dZ+ziO41O4v+z826uGG8ab7IrfWlbt08Gt0Ue/cHHtN6Zqkv5Uu1vtbVtO4G/cp0JdhTypeO2teUbkv5UO6P5VCx2NPqa1q3rT6Otmn+PEb5di1TnlHb1LqhKbvMJhM9Za/od6Pv+tiZXe7u39jd+OeLJ/uf3nnT9i+8/u/E2fEJAM8PvlwBAADgivvU3539pZh1X9T13e2R0pdEFP4F9bWXuaU8Gl0U+lw21OpLRnf7H2vPq3XR6GtdTOhzajeZbiVaCQrZUK2vdVOVnlHK4+muNqmXE/qa1u1R+yhvij+HQ1M2Les8o7atdTGhX8rsMlEhfEq6HIt56h6Oi/2HNq859QPXpfnPXveHnzwb3xS7XVe7BOC5xJcrAAAAHLv+o6850b3283fv+bv/23/ad/2/Fal7WYp4VRdxarwdqr7QPUxXyuMIXcvgNo0+F5U2pXyotql1Ja2bUX/gY+m2lC8dta+p3da6eLrPzrLhQKtvad23+piwqfTVn8WlKZspWs+p9bVuacom8ruVaCUoSBFpJxZpp9vtLnUfim728zecSP/Di39w+6PjKQDPTb5cAQAA4NikH77uhnT1ia17P/n4f7pY9N/QpXhR6uOabtb4F9TXXuaW8qV1+/HnsVZfMrrb/1h7Xq1bKm1K+VKrLyndZfKVaCUoZENH7VtK96U8nu5qk3q5Z8pmrHXT6uNom+LP4dCUzRSt59T6WjfW2mb6lWglWE+6HJe6x+e/v7u7+NfXvOWG79792NmdO3708qfHOwCeO3y5AgAAwJE99N7TL7329MbVj9978T/a6fs/kyJePt60VF/qlrpSHpWulEejaxndpky2otbXumj0ta6kdTPoV6YrwUCpK+VDUzYltdtaF0/1xUmxGJiyKWndXqG++vO3NGUzxdTn1Ha1bqm1yfSZ6CnFYg2LiH47+vn57oHZyfnPbj2+8T+ll57/nVf8w3hsPAXg2c+XKwAAABzafd9/8hWnt2Y3nnts56/sRP81sz5uGW9aqi91a100+lyXy4Zafcng7sAjSs8r5UOlTSlfavU5rZtRvzJfCQrZ0FH7ltx9Lhsq/XEcKhaNrmXKbWvT6qO+qf4sRv12La3n1PpatzRlE/ndSrQSHNLgOamP6HYiYrt7NC72v7pxXffeO25f/Hh8OBbdj8VieAbAs5cvVwAAAFjbmR848ZpF3734woXdv7xYpHdFxEsjDvcisvpCt9SV8qVcn8uWal1L5jYV8n2H7aLR17qSKTd7m5XpSjBw2C4m9DW121oXT/XFSbEYmLLJad0dtY/6pvozGPXbtbSeU+tr3dAhdytnK8EhtZ6TItK57smNC93Pza/Z+LmrHut+6eafvPDB8QyAZx9frgAAADDZx79v803Xp9kt5y8v/lL06Z1p+aVKTHiJmFF8qVvKl2p9qSvl0ehqSi9oa8+rddHoa11M6HNqN6XfXzEoZGOlTSlfR+4ZuWxsb1OcFotG1zLltrapdVHviz9/Q1M2Les8o7Qt5UOH2BRPisVEa9ynxVMv6PqL3YX5bvdL/QP93z/5hVu/3J+++Ngd74lL4z0Azw6+XAEAAKDp/u/afOsiujsWu/1fiJS+LCJuPjBY40XiUvXF7mG7KPS5bKnW1ZRe0taed9guGn2tK2ndlH5/xWBPKY9GFxP6ltJ9KY+nu+KkWAxM2eS07lp9TNhU+urP4NKUTcuUZ5Q2pXxoyibyu5VoJTiEqc/I7LqIiPPd2X4RD2xtpG++/dU3/dJd/+qhJ+/4gC9ZAJ5tfLkCAABA0b3ftfH2zY3uNZe305/t+/TFkeKm8SYi/5KwpvpSt9ZFpS/lUelK+RSD2/1ftp5X6w/bxYQ+p3Yz6rLTcTj+nFPb1Lopcve5bGxvU5wWi0bX0rq9gn31529pyqZlyjNqm1q3NGUTq7vsWTZc05RnTNnsROqf7HZnafZrs8vdD80u7973qp9d/MR4BsBnjy9XAAAAWHH3d2380c2IN+0s4msXfXprF3HjeLNvyovCkeLL3VIejS4KfS4bavUlpRe1tecdtotKX8pbWnd7fXaWDSt5NLqlKZuS0m0pj8bvcalaTuhzptwcx6bQF3/2hqZsWqY8o7apdUuH2GRPsuGa1nnGlO3ept+N6HZjJ53tPtyd7/73ndduftebvu/Cg+M5AM88X64AAACw767vmH9FF90X9JG+uuvjzamL6yMaLwNrXUb15e5xd6U8Gl3L3u3+I1rPqvWH7WJCX1K6y+QHokyfzcZqm1o3Re4+l42N/xgOZcOBVl/Tur2CffVnb2nKpmXKM0qbUj40ZROru+JZsZhgndsp28ImbUek3e5yeqJ/cOP0/P91S7/xL09/6uJnug/GzngLwDPDlysAAADEp79j/tVbG93bLu+mr+xSvDEirosov+jb1+pHii93S/nSYfpcNtTqc0ova2vPqnXR6A/blbRuBv3KdCXYU8qj0S1N2ZSUbkt5PN3VJtWy1rW0bq9gX/zZW2r1U0x5Rm1T64am7Eab7Ek2XNOUZ0zZxMRdHxFnuki7s3+zFfP3zR+PX3zFz1/8tfEMgCvPlysAAAAvYHd95/xr5l180e5u/PHo4s6IuObAoPayr9YVVF/wlrpSHpWulEejaxncptHnrKP0tS4m9GO1faZbiVaCQjZU62tdS+221sXTfXaWDQdafUnrrtXH0TbVn7ulKZuWKc+obWpdTOhjdZM9yYZrmvKMKZulKdvlpo+I3Yi06C7Pzs1/bvvMzk9c/9bT/8st15x7rHtP9KMrAK4QX64AAAC8AH362+dfP+vi7Sm6z0mRvizS6EuVmPCyr9UPNF/u1vp1u1w21Opzai9sS88r5dHootHXupLWzWF+f1HpSvnQlE1J6baUx9NdbVIta11L6/YK9c2fuyjfrmXKM2qbWhcT+shvMtFTisUE69xO2U7ZLOW2uxHpcnc+XYg/6M7Mv/nOD1z+2fQtMfMlC8CV58sVAACAF5C7/t78GyLFH+lT9/pI6Yu6iKvGm325F3lRySuqL3lLXSlfyvW5bKnWtYxuUyZbUetLXSkfmrIZq93kfm/VoJAN1fpaN0XpvpQv7fXZWTYcmbIZa920+jjapvpzF+W7tUx5Rm1T65YOuVmJVoI1Tb2fspuyWSptB3m6HH262F2c78a/2Tix9Z2bT+x+4raf2f6D4RyA4+XLFQAAgBeAu7999ucjunf28/icfhFvm3VxuvjCLiov86LRZRzpBW+pWzePRleSudmPMl1EJV86Sl/rcqbs9zYr05VgoNSV8qEpm5LSbSmPg11xViwaXUvtttbFhD7Km+bPXJRv19Z6Tq2vdUutTaZfiVaCQ5jyjCmbOMZdrr8cqbvYndm4vPFDly8ufvHkxs7Pv/Jn4oHxDICj8+UKAADA89in//vZvzvruy/v+7gzRXxeF3E6ovBSbumwXUb1Je9huyj0uSwq+RSj2/2PtWdeiS4m9Dm1m9LvrRgUsrHSppRPVbov5UupMikWA1M2Y1NuWptD9tWfuSjfra31nFpf65Zam0yfiQrhGqbcT9ksTdm2Nq0+ItK5LlKKh+dPpJ852Z/+npf/n2d/JaXoum7KNQBT+HIFAADgeehT3zn7S13XfWWkeG1K8cYu4tSBQen1WilfavUj1Re9h+lKeVS6Ut4yutv/WHterYtGX+pKec2Um8FmZb4S7Cnl0ehiQt+Su89lQ3t9dpYNB1p9Te221sWEPuqb6s9c1G8nm/KM2qbWLbU2mX4lWgnWNPV+ym7KZqm0LeU5KaLvI+JCdyme7B6anet/8KYvf/EPXP+J/tHZDz10fjwHYH2+XAEAAHgeufu7Zv/+IsW7utS9LlK8LiJOjjfVF3SH7TKqL3mPs8tlS7WuZXSbMtmKUl/Kl2p9rSup3eR+X9WgkI2VNqV8qtJ9KV96Pv4dK5Wu+vMW9du1tJ5T62vdUmuT6VeileCQWs9p9TFxs1TalvKcve3wJO1E6ra73e5M9+lZf/qbI3Y/1n/q/Mde9/G4PJgBsCZfrgAAADwP3PUds2/qZ/Eno+9ePeviVSllvlSJxku6w3YZ1Re9x92V8mh0NYO7/V/WnlXrotEftitp3eR+b8VgTymPRrc0ZVMyvh1/ztnbFKfFotG11G5r3VJrU+irP29RvltL6xm1vtYtHXKzEq0Eh9B6RqsfmrKtbWrd0N6uOr8UkS53kc6lX9i8tPm9/WLjX77uF849PJ4BMI0vVwAAAJ7DPv2ds/+47+Jr51338r6P27sUW+PNvtpbt8N2GYd+0VvKl3J9LluqdTWju/2PtecdtotGX+tKajel31spGH/OqW1qXUvptpTHwa44KxaNrmbKXW1T66LeN3/eon4/2ZRn5Da5bGzKJlZ3K2crwZqm3k/ZfZY2U+ZxKSKd6e7pLnY/eWqn//FX/MLip8cTANp8uQIAAPAcktJbNyNe1d/79/7p3+wjvqFL3W2LFDd1s5g/NRhfDJS6Uh6NrqD6svcw3bp5NLqW8YvK1rMO25fypVY/1tqP+gMfS7elPBpdTOhbcve5bGivL86KRaOrad21+piwKfTVn7Uo361lyjNKm1I+dIjNyslKcAhTnnFcm6XattaN7W3XOYlFRH+h253txB9sfGb2T3Zv2P6f7/zJ+OR4BkCZL1cAAACeA/qfuvHauHRy8957H/4bi77/812Kl6UUm1034UuVaPSH7UaO9KL3MN26ecvo7sDH0jNLeTS6aPS1rqR0k8lXopWgkA3V+lrXUrstdXt5qY5olRP6ktZdra91Ue+bP29Rv5+kdV/qS/nQITeZqBCuYcr9cW2isat1Y3vbdU4OSBGznYidS92T3YX+U/PHZ+997Vfufm/3ntgdTwFY5csVAACAZ7H03tMvja3N0/c8euGvpUX/9Sni5ePNvtIbtlIela6UV1Rf9h5nl8uWal3L4Hb/l63n1for0ZW0bnK/t5UPI6WulA9N2ZTkbnPZ0F6fnWXDgVZf0rpr9TFhU+irP2tRvlvLlGeUNqV86BCb7Ek2nGjK7ZRNTNwd82bKdKp+J9LG5e5sf2b203Gy/447f2L3V8YbAA7y5QoAAMCz0OP/44k7YmN+w9mz2391N6WvnqW4ZbzZ13rDVutLXSmvqL7wPUy3bh6NrmZ0t/+x9LxSHo0uGn2tK6ndlH5fxaCQDdX6WtdSu210tbpeTuhLane1Lib0Ud5Uf86ifDfZlPvSppQPHWKTPcmGa5h639q1+qXWrtXHwc2U+STDB/URcanbTY+lB9K5+bc/uLX9ve+IiO4D/k4WgBxfrgAAADyLPPA/br5xkWYvW1xe/MXUpz8eES+NaLxJK3WlPBpdTOgHqi97a100+lyXy6KST1F6YVl75jPdlbRunsnfW0zoa3K3uWxor8/OsuHIlM1Y66bVR2NT6Ko/Z0tTNi2tZ9T6WhcT+shvVqKVYE1T7lubVj9U29a6sb3tOidFlYekRUSc61Jc6P/lidNXfef8E7u//YrfvnjfeAfwQufLFQAAgGeBu757423zrdkdi0v9n08pfVlE3HxgUHkRdqiulEejKyi++C3lUelKeVS6Ut4yutv/WHpeKV86bF/Ka1o3gz47HYfjzzmlTSmfonZb6lq/t6gVja6ldlvrYkIf5U3xZyzKN2uZ8ozaptbFhD5WN9mTbDjRlNspm5i4q21q3djedp2TookP6RZP/Uvvd890nzl5cfbtu5e739x+/PK/edOH49x4C/BC5csVAACAz6K7vm/jy2Z99zl9n75u0acvmkXceGBQexF22C4afa0bOdIL31Kfy3PZUKsvGdzt/7L2rCvRxYR+rLUf9Qc+lm5LeTS6mNDX5G5z2djeJjvNhgOtPmfKTW1T66LcV3/GlqZsWmrPOGwXE/pY3WRPsuGapjzjODatPtbbTJk2rfOQ4fZyRNruIj0ev3ni7Nbf3zmz86t3fmzntwcLgBcsX64AAAB8Ftz1vfM/Neu7N/Up/nhapLdEFzeMN/tKL8VKeVS6Uh6NrqD44reUxyG7Uh6NrmZwt//L2rMO20WlL+U1U272NtlpLsxlQ6W+lE9Vui/l0fi9Ra1odC2121oXh++LP19LrX6q1nNqfa2LCX3kNyvRSrCGKbfHtYnGrtYtDTZT5pO1HlbqU0RsRywudE90j8X7T2/P3nv7r2z/xHgG8ELjyxUAAIBn0Ke/a/bvdF33xZG6Vy369KWzLq4Zb/aVXnTFZ6HLqL74Pc4ulw21+pzRzf7H2rNKXSlfOmo/VtuXfl/FoJAt1bqY0Lfk7nPZ0F6/MlsJMqZsxqbc1Da1Lup99Wcs6reTtO5rfa1bam0y/Uq0Eqxhyu2UTRzDrpTn7G3XOama+qDaLkV0fUTajkX/xOyj6cHFj1x1w+Y/uf39lz8xngK8UPhyBQAA4ApKKbqui3T3d8/+w76Pr0zR3Rop3tBFnBpvV5RedJXyuEJdRvWl72G7yPTjz0O1rmX88rL2rFoXjf6wXUntZtStTFeCQjZU62tdS+m2lEfmj1lOrax1NbW7WrdU2xS66s9XlO/W1npOrs9lY61Nps9EhXCiqbdTdkfZlPKcve06J1VTH1Tb5brLEXG+eyQ9Gb+7uDd91xs/sfjx8QTghcCXKwAAAFfA4++/7vrrd1+UPvXhe/+Tjdj9mpS6WyPFi1IXm+NtVu6F1lCpL+VR6Up5RfXlb6kr5VHpSnk0upLRzYGPpeeV8jhCFxP6nNJNJt+PMl1EJV86al8zvh1/zkmVWbHY0+pzptzUNrUu6n315yvqt5NMuS9tSvlQa5PpV6KVYA1Tbo9rE41drVva20yZTjL1Qa1dpU99RJzv+jgbv5d24lfmZ07+l6/7rXMPj3cAz2e+XAEAADhG9//Qyduv2Z5fe+bi9jctdvqvSyleFl10XcRsvC2qvNB6xruRI730Xacbfx5r9SWDu/1f1p5V66LSl/KlVj/W2ud+X8WgkA3V+lrXUrttdLW6WJbyKWq3tW6ptil0zZ+vKN9O1rov9aV8qLXJ9CvRSrCGKbdTNnEMu1I+trebOq+a+pApu4mbfjeiO9M9mi50v5ceXvzgdX/2Jf/k1vc8cGE8BXg+8uUKAADAMXjo729+XmzMXnb50uLf7vv0xyPipfvllJdUQ7V9qSvlcYQuo/ry9zi7XLZU62pGd/sfS88r5dHootHXupLaTen3tfJhoJRHo4sJfU3uNpcN7fXZWTYcaPUlrbtaX+uWCpvqz1eU7yabcl/alPKlQ/Qr0Uqwhqm3U3ZH2ZTynL3tOidVrQe1+pi4WRps0yJSerJ7JD2ZfuANH1j8P4YzgOcrX64AAAAcwT3fO39nzGavSTvpT6VIX5RS3HxgsM6Lqmjsn+kuo/ryt9SV8ih0uWyo1eeMbvY/1p51mK6UL7X6nNbNXr8yWwn2lPI4QtdSuy11pd/XUK2sdTW1u1oXh++rP1dLUzYlU25Lm1I+dIjNyslKsKbWfauPY9q0+nh6M2U6ydQH1Xa1biyzTf3e/32mOz97Iv3m1o2zv3bHj+/81ngH8HziyxUAAIBD+NT3zr9uHt2bo09f0S/iTdHFDeNNRP4lVFFt+0x3GcUXwKV8qdbnulwWlXyKwe3+L0vPK+VLh+1LeU3tZtStTFeCQrZU62JCX5O7zWVDe312lg1HpmzGWje1vtYtZTbFn6ulVj9F6xmlvpQvtfpY3aycrARrat23+qWj7kr50N5mynSSdR5U2pbynCnbRUR/ORbpkXgynY3//o0fXPy/xxOA5wtfrgAAAKzh3u+Z/fup675s0cfbUh93dBFXjTf7pryIGqrtD9OV8mh0GdUXwIfpcnkuG2r1JaO7/Y+l55XyOEIXE/qhKdvBZmW+Euwp5VHpSvkUtdsJXXFSLBpdSeum1UdjU+iqP1dLUzYlU25Lm1I+1Npk+pVoJVjDlNtnYlPrhga7qSdFUx/Q2rX6mLhZ2tumnYg4313qH+t/9aoXzf7G7T+x++vjKcBznS9XAAAAKh74p1e9+KWb1/Z33/voN6XF7ru61L0mdXFDpDgR0XjpVOvGatvj7kp5QfUF8HF2uWyp1tWM7lImO6DWRaMvdaW8pnUz6LPTcTj+PFbra90U4/vx55zSv8A+G45M2Yy1bmp9rVvKbKo/V5G/WVvrGaW+lC+1+ljdZE+y4URTblubVh+NTa0bGuymnlRNeUhr0+qXjrDrdyO6J7rteLI7u3Pv4m+/8U/13z377rg83gE8V/lyBQAAIOOBf7D5pq35/LrzF3b/vd1F+uquj5dEF9F1Md8fZV4m7at1OaV9KY9KV8qXWv1I9SVwqSvlUelKeTS6ktHN/sfas0pdKV86aj/U2g76lelKUMiGan2tayndlvJ4uitOikWjq2ndHaUvdNWfqSjfTTblvrY5bLc02GTn2XCiKbfHtYnGrtbFhP8+rGvqQ2q7Wjd2TNt0KVJ/pou40P/c5Xv7v/z5d8WnxxuA5yJfrgAAAAx86u/P3zFPs1dFpK/ud9OXRYz+BfVLlRdJ1S6ntj9MV8qj0Y0c6QXwul0ui0o+xeB2/5el55XypVp/2K6kdJPJV6JxMP6cU9vUupbx7fhzzrPp71ipdTGhj/zmSD9XU9WecdguJvSxusmeZMOJpty2Nq0+Gptat7S3mTJtWuchpW0pzznm7fJfdt892sXiyfTIfD77m3f+653/33gH8FzjyxUAAICIuPu/n/2Fxbz7/FnE27tFvKF/6h/9VXbYbqy2Pe6ulBdUXwKXulK+lOtz2VKtKxnd7H+sPeuwXTT6WpdT25d+XysfBkp5NLqY0JeU7kp5PN0VJ8Wi0dW07mp9rYt6f6ifq3W0nlHqS/nSmn12ng0nmnLb2rT6aGxq3djedp2ToikPqW1q3dDUXay5XeojYjdicV/06VJ82xt/ffG3xhOA5xJfrgAAAC84KcU8fvaGq+MrXnXhru/9zb8y6+Idfd99Xop42f6/oL724qjUlfKa0k0pj0N2pbziUC+BS3kUuly2VOtqRncpk62o9aWulC+1+rHaPvd7qgXjz2NH7Wtyt7lsaK/PzrLhQKvPad1cgb768xT5m7W07mt9rVtqbQZ9dpoNJ5py+0xsat3S3mbKtGnKQ45j0+qH1tkWpO2I/ny30z/c/8LGzf03f86/iF8bbwCeC3y5AgAAvGCk74/Tl09vvTxOneg/8/Clv9rv9u9KKW6LFKe72eDfpRKNF0ilrpSX1PaH6Up5NLqM4ovgUh6NLgp9LotKPsXgdv+XteeVulK+VOtrXUntZtR91n5fNbW7UreXl+qISlnKa6bc1Da1Lup98WdqqdW3tO5zfS4ba20y/Uq0Eqxhyu1xbGp9rVva20yZNk19SGvX6oda21a/prSISIvo497ZY7tnFt/5pj/b/93uPbE93gE8m/lyBQAAeN676/vihtia/6GtND+xvdt/Q+rTl0eKWyIKL4xy2dJhu7HattSV8jhCV1B8EVzKo9Ktm0ejK8ncpEK+75nuclr7Qb8yXQkK2VCtr3UtudtcNrTXZ2fZcKDVl5TuSvlQbVPoij9LQ1M2JVNuS5tSPlTaZPKVaCVYw5Tb49jU+lo3trdd52TFOse1ba0bm7Kdsplq9Kz+YqTuQneufyz9cP/g4j1vuisePLgAePby5QoAAPC8k1LMui76T/xAvOTE9uxP73azl3Qp/kif0lu6iBsPjg98Wv08dNgup7YvdaU8jtCNVF8E17qo9Lk8ly3Vupa92/1H1J512C4qfSmvqd2MugMfS3fr5kutvqZ0W8rjqa5WF8tS3tK6u0L9kX6mpqg9o9SV8qFDbFZOVoI1TLm90ptSPrS3mTJtmvKQ2qbWjU3dTt21VJ6T+oh4vLvQP95/MHbmf/8NH9z5kfEG4NnIlysAAMDzRv+Dce2l7vobnph1V28/8eQ3Rp9elVL3+hTx8v1/l8pS6UVPKY8jdGOlbSmPRheVvpQXFF8El/I4ZLdu3jK62/9Ye16pK+XR6GJCP1bbl35PxaCQDZX6Uj5F7jaXDe312Vk2HJmyGSvdlPKh2qbQFX+WhqZsSqbcljalPBrd0mizcrISrGHK7ZXelPKhvc2UadOUhzyTm1hj17LOcy7EYvFg3LX7aPq2N/9B//3jGuDZxpcrAADAc94nvyduv+b01lsu73Y3LBaLr+379PldxIuijxPRxeZ4H1F54bNuHo1urLY9TFfKo9FlNF8Gl/pSHoUuly3VuprBXRp9zqr1h+lKeU3tZtStTFeCQrZU62JCX1K6K+XxdFecFItGV9K6qfW1bqmwqf481bqpas8odaV8aM3NynwlmGjK3TOxqXVDe7up86x1jmvbWjc0ZTdlM9XUZw12/eVIs3Pdo/359FOLS4tvftOv+ceEAc9evlwBAACec1KKrusi3fU98cbZfP7nU5pdk6L/Q6mP10YXNx8cH/j0tFyey6KSR6PLqe1LXSmPI3Qjh34RvG6Xy5ZqXc3gbv+XtWeVulK+dNR+qLUd9Qc+lm5LeVS6Uj5V7j6XDe31K7OVIGPKZqx2U+vicH31Z2lpyqZkym1pU8qj0S2NNisnK8GaWvetPo64KeVDe5sp06YpD6ltat1Ya9vq17XO88Z/Xm1HdJe6J9On5z+TZv2Pv/63d3744ALg2cGXKwAAwHPGQ98TV7/4i141v+e37v68tNP/5xGzLvp0W0rxyujiuvF+/MJmXy7PZUuH7cZq21JXyqPSlfKK6gvhUlfKo9KV8mh0JaOblMlW1PpSV8qj0ZWUbjL5gSjTZ7Oho/Y5pZtSHk93xUmxaHQlU25Km1I+VNgc6mdpHbVnlLpSPtTajPoDH1u3La37Vh9H3JTyob3NlOkkrQcdtV867l3LOs+pbFMfkc52i7gYvxf3x4+dPr/7vbffHY+PdwCfTb5cAQAAnvXu/vtx66mrTtx5aTte3W/v/j9Tiqu6iN0+4pou4tR4H1F/aZPtclkcIq8p3ZTyOGRXygsO/TJ4nW78eajWtezd7j+i9qxaF43+sF1ObT/oVmYrwZ5SHkfoWnK3uWxo/MdqlFdN2YzVbmpdNPpCV/05WpqyKZlym9vksqFWH6ublZOVYA2t26P20djUuqG93dR50ZQHtDatPiZultbZlqzzjDW26XJEPDK7J52LH0uPpJ94w6d3PzDeAHy2+HIFAAB41rrv++Nz5t3GV20vutv7vv8Lk/+RX1HpcnkuWyp1pbyktj9MV8qj0Y1UXwgfd7duXjO6OfCx9LxSHpWulC+1+rHavvZ7ygaFbKjW17qa3F0uG0qNSaks5TVTbmqbWhf5PhXyfbVuitZ9ra910ehHXXaaDSeactvatPpobGpdPN23ZpNMfUhpV8rHjntXs84zDrvdiVg8ls7GE7N/Ho/H97zhE7v/ZtACfNb4cgUAAHjWeOQH49oXXX3d7N77nrhzsTn/613f3dyn9IVdxFXjbfElTSmPQpfLlg7bjdW2pa6UxxG6jGP/ciWX57KhVp8zukmZ7IBaF5W+lEejK6ndDLoDs4k3B5TypVZfUror5fF0l51kw4FWn1O7qXVLpU0pj8bPUdRvJ6ndl7pSvtTqY3WzcrISTDTlrrVp9dHY1Lqlvc2UadOUh5Q2pTxnynbKpmWdZxzHNkX0Z7pYPJJ+bWtn9v1Pznd+5G0fjAvjGcAzyZcrAADAZ929/yhePu+23twvuldt7+5+86yPa/o+rupmMR9v91VewBTlulwWlTwaXU5pX8rjCnUj1RfCx9nlsqjkLaO7/Y+l55XyOEIXE/qh1nbQr0xXgkK2VOtiQl+Tu81lS8/k37ESE+5qfa2Lcn/on6MpWvelvpQvrdln59lwotbtUftobGrd0mAzZV405bi1afUxcRNr7FqmPucYd2kREWe7SGe734/HZ3/v+qviZ172K5c/Pd4BPFN8uQIAADzjUnrrZtd9cOdT3xNvmc/nfy667tbFIv3JrosbUkTqWn+tUnsJs26Xy6KSR6MbK21LeVS6Uh6NrqD4UriUR6VbN49GVzO6S5lsXylfqvWlrpTX1G5yv5/sh4F182h0LaXbUh5Pd8VJsWh0NaW7Uj5U2xS64s/QUqtvqd2XulI+1NoM+uw0G04w5e44NrW+1sWE3/tU6xyXtqV8aMpmaZ1tyTrPmLqdulu60EV6Ms5vLWbfesfi1Pd0v/CEf9E98FlR/wsWAACAY3TvP9i689oTW/Ozu4vXLbZ3/pPo03WLPu7sujg93hbVXsKUulyey5YO243VtofpSnk0uozqS+HDdLk8ly3VuprB3f4va886TFfKl1r9WGu/12dnuTCXLR22qyndlfJo/J6iVjS6ktZNra91S5lN9Wco8jeTTbnNbXLZ0CH6lWglmKh11+pjwqbW17o42Lemk0x5SGlTynOmbKdsWtZ5xpXe9nv/18NddOfivXd+65d8U/fOD+wOpwDPBF+uAAAAV9zdPzD/tzbns1tS3718Z3fxV6OPF/UpZl1X+cd+ldRexJS6XJ7LopJHo8up7UtdKY8jdCPVl8KlrpQv5fpctlTrSkY3KZMd8Ex3ObV97vdTDQrZ0mG7mtpdqRvk2Uk2HGj1OaWbUj5U2xS66s9QlO8mq92XulI+VNuMupXpSrCGKbfHsan1tW5pbzNlWjTluLapdUNTdlM2Les84xnepp2IdL5L6aH+A93D/b/z+nvi/vEG4Ery5QoAAHDs+l++8droT+/c++H7v7FbdG/vuu6qfpHekSKuj+F7ksILk6Lafp1u/HnosN1YbVvqSnlUulJeUX0xXOpKeRS6XBaVfIq92/1HtJ5V6kv5Uq2vdWOt7aBfma4EhWyo1JfyKXK3uWxo/MdpKBvuqXUlrZtaX+uWRpuUyVa0+popt6VNKY9Gt5T7vVaDCabcHMem1te6pb3NlGnR1OPW7qj90tRdy5TnTNksXYFtOtft9mfTI4tHu2/93N/d/XvjHuBK8eUKAABwbB5878YXzefz05cv91/X9/2X9ymu6yJuihQnlpv9dyUTX5ocULop5VHocllU8mh0OaV9KY9DdqW84FBfrMSa3fjzUK0rGd3sf6w967i7Ul5Tuyn9nkrB+PNQrYsJfUnprpTH0112kg0HWn1O6aaUD9U2ha768xPlu0lat6W+lA/VNqNuZboSrGHKbWtz2L6UDw02U+ZVUx5Q29S6pSmbWGPXMuU5Uzaxxi4Ot03nu8XifNyT7uq/I070P/amD8eD4ynAcfPlCgAAcGjp1192Ot56/8X7/8H8L8y72Wsv78YfiZQ+N7q4+eBw9Mt1XpwMle7WyXPZUqkr5SW1/bpdLluqdRnVF8OlrpRHoctlQ60+Z3CTRp+zav2V6HJq+/HvZ2glKGRDtb7WtYxvx5/H9vrsLBvuqXU1rbtSX8qHMpvqz0/kbyabcpvb5LKhVh+rmwMfp9yXtG5bfRxxU8qH9jZTpkVTjmubWjc0ZTdlM8XU50zZTdksHXW7G5Eenj0Q5+Of7j4c//BNd+381ngCcJx8uQIAAKzt8fduvmVxemPr0rndf7ff6d/ad3FL18dLo4uTB4aZlx+pkFfV9ut0489Dh+3GattSV8rjCF1G9eVwqSvlUehy2VKtKxnd7H8sPauUxxXqcmr70u+nFIw/jx21zyndlPJ4uitOikWjK6nd1Lpo9IWu+rMT5bvJavelrpQP1TajbmW6Eqyhdlvrlo6yKeVDe5sp06Kpx63dUfuYuJli6nOm7mKN7THsuv6pn9X+4e7JxWe698679L7X/97uL413AMfFlysAAEDVR78rTrzmc16yMfsTD52/6wdmf24es9cs+nh716UvSCleGlF/2bHyEqu2LandlLpcnsuWSl0pLyntS3lcoW6k+HK4lEeji0Kfy6KSt4zuUiY74DBdKY9GV1K7GXQrs5WgkC0dtmvJ3eayoVSZFItGlzNlX9qU8qHMpvizs9Tqa1q3pb6UL7X6OLhZma8Ea2jdtvqYsCn1pXyo9vteV+sBtb7WxYR+aJ1tyZRnTNksfTa2y243Il3sdrpH4qf7R+NvP3559zfffm9cHK0BjsyXKwAAQNYnvj+uu/bE5ms2Tm8uzj2x8/UpLb6kj+6O6OPFXRen94dTXnQsf1nb1pTuSnkUulwWlTwa3VhpW8qj0pXyaHQFxRfEpTwq3XHlU+zd7j+i9KxSvlTrD9uNtbaj/sDH3G0uW6p1MaEvKd018lJdLhpdSeum1h+yK/7sRP1uktr9lehitc/Os2FD66bVxxE3pXxobzNlWtV6QK2vdWOtbaufqvWcVj/02dwONykinelidn72r6/vTv8/ty8vPnTbr519dLAAODJfrgAAABER0f9SnOq++Fsuf/p73/PizZOzr4qYXb/o449Fn/5wSnFj10VEF/MDR7WXHaMuZbKm2n6dbvx56LBdTmlfyqPSlfJodBmHfjlc6nJ5LotK3jK62/9Ye16pK+VxhC6nti/9flY+DKybL7X6ktJdKY+nu+wkGw60+rHWvtbXusj31Z+byN+spXWf63PZUKuPg5uV+UqwhtbtlepL+dDeZsq0asoDWptWHxM2rX6qqc+ZspuyWTrubWnTR6QLXezekx7eSqe/5oY7tn7v5p949Ox4BnBYvlwBAIAXuHt+MG7bjFO3bcxmV5+/cPnd84hbFim9OiJujYhrIiovLkp5ZF5m1bYltZtSl8tz2VKpK+UltX2pK+VxhG6k+oK41JXyKHS5bKnW1Qzu0ujziloXjb7UlfKa2s349zO0EhSypcN2LbnbXLZU+0eBReW2lLeU7kr5UGlTyuOQPztTtG5r/WG7WO2z82zYMOWmtWn1UdmU8qG9zZRpVesBtb7WLR3XpmWdZ0zZTtnEGruYuJ2yiYj+XBeLx2Jn43z8N5/zO7vvGfcAh+XLFQAAeIF55Afj2hvvuDPd+3t/8Dn9bP7vzLrZ1iylOxeR3pAWcXNERDeb8Heo5LKlQbf/y9q+pHZT6nJ5LlsqdaU8p7Qt5XHIrpRXFF8Ql/I4RJfLopK3DO72f1l7Vqkr5dHoYkI/VNuOupXpSlDIlg7b1ZTuSnkU/hgVg5FWn1O7OWwX+T4V8gNafU3rNtfnsrHaZtStTFeCNbRua32tW6ptal083bdmTa0H1PpaN3Tcu5Kp91N3MWHb6oembKdsBtJTfwdLSme7Rxb37v7Q1S869W13/NqFB8c7gHX5cgUAAF4gHvjHccdu2vzSWepuWWwv/q99xGzWxVZKcf3+36EyVnuBUepGecpkk5RuSnkUulwWlTwaXU5pX8rjkF0pzyh+qRKN56zb5bKlWlcyukmZbEWtL3WlPBpdSekm9/vJfhgo5VHpSvkUudtctrTXFSfFotGV1G5qXTT6Qnfon50pWvelvpRHo4t8vxKtBBNMuWltDtuX8qG9zZRp0dTj2q7WLR3XpmXKM6ZslqZup+yOa1ORdiLSme7h+YX4ycX98QOvv3v3l8YbgHX4cgUAAJ6nPvMjW687OdvaePLCxZel3fjLad5dHYv0pSni+oiI1Mdi/+9QKb2wKOVR6Qb5/i9L25rSTSmPTDf+PFTqSnlJbV/qSnlUulJecKgXxKU8Cl0uW6p1NYO7NPq84rBdNPpaN9bajn8/Q+Ng/Hmo1sWEviR3l8uG9vqV2UqQMWUzVNsftlvKbKo/N5G/max2W+pK+VBtM+pWpivBGmq3tW6ptan1tW5pbzNlWjTluLQp5UPHtWmZ+ozj3sUa29qu1q2jf+pR6aHuTH9u/o82dhfvO7u5+xtv+2DsjKcAU/hyBQAAnif6X7rtVPfF916+9x/N/8xs1r0qpe6GPvV/KfVxdXRxIiI2sy8octlSrstlS6Nu/2PtJqe2L3W5PJctlbpSnlPblrpSHpWulFdUXxKXulIehS6XRSVvGdwdeETpeaU8Kl0pj0ZXUrrJ5PtRpouo5HGErmV8O/48VPrjs5QN99S6ktZNrT9Ed6ifmala97k+lw21+ljdHPg45T5nyl1rc9i+lA/tbaZMi6YclzalfGjKZmmd7dg6t1O2UzZLU7e1Xa07grQdkc53EQ/Hv7hx+/R/+uJv+ROf7t79Y4vxDqDFlysAAPAc9/APbvyhmM+vuXS5/+q+7794lmLeR7whIq4eb1deVIw/L5XymN6l0efJajelLpfnsqjk0ehySvtSHleoGym+JC7lUenWzaPRlYxuUiY74Jnuclr7vX5lthIUsqVaFxP6nNJNKY/K7ydK4UCrH2vta32ti3xf/JlZavU1tdtSV8qHaptRtzJdCSZq3bX6mLCp9bUunu5bs6opx7VNrVs6rk3LlGdM2cRnaTdlcxjpqZ/5/vEuZhfj/bOt+f/tde+//InxDKDFlysAAPAc8+iPnHz5jdecOHfvI2e/IXa71/Vd99aI9KZIcVNKsei60b+Mfin3kiKXRSWPad3+pLYtqd2Uulyey6KSR6Mbq23X7XLZUq0rKL4oLuVR6XJ5LluqdTWDu/1flp5VyuMKdTm1/ag78LF0t24eja5lfDv+PJYak1JZymtqN7UuGn2hK/68LLX6kil3pU0pj0a3NNiszFeCNdRua10csa91S3ubKdOiKcelTSkfOq5Ny5RnTNksTdlO2cTE3ZTNYYyem/qIdLFbxP2zD15+dPG33nL34ucOLgDqfLkCAADPYh96X2y94ZYXnei+5D86/+AP/dfv6tPspf1u+vI+pbenFDfHU/9D/enx3Yrci4pctrRuN35hsfKLiWr7Unel85LSvpRHpSvl0egyqi+KD9Pl8lwWlbwmc5MK+b7j7kp5SWs/6A9MS3elPI7Q1eTuctnSXpedZMOBVp9Tu6l10egzXfXnJfI3k7VuS30pj0YXq/3KfCWYqHXX6mPCJtfnsrG9zZRp0ZTj0qaUjx33Lmed2ynbKZul1rbVx8TNYRSeu4zT2e5y/3D6jcVD8S1vvmfxf45mAEW+XAEAgGehu74vbjh59fwLN+ebF89vL74mpXRn36dXzFK8PHVP/Qvp1zJ+sTD+PFTqSnkc7NLo81pKd5+tvKS2L3WlPI7QjRRfFJfyOESXy5ZqXc3e3f557TnPdDfW2g76A9PS3br5Uqsvyd3lsqHa37VSLBpdTmt/lL7QFX9monwzSeu21JfyaHRLg82B+ZTbmtp9rYsJfVQ2pXxobzNlWjTluLapdTGhj4mbmqn3U3ZTNktTt7VdrTuKwnPHcbcT0S+iT/fMfn6x6L/n6icWP3nHXXFpNANY4csVAAB4FnjkB+O2xamTt88v7+5c2F78uYjZPPXd53YpfW7q4uYuYidFbEZk3gpMkbvJZXGIPJ7u9ie1bU3prpRHpht/Hip1pTyntj1Mt25eUXxRXMpjzW78eajWlYxu9j/WnlXqSnkcocup7QfdymwlKGRLh+1acre5LJ7OS3W5aHQ1pbtSHo0uyn3x5yXKN5OV7kt5NLpo9KMuO82GDa2bK9WX8qG9zZRp0ZTj2qbWxYQ+Jm5apjxjyiauwC4q21J+VIXnZuNheLaL9ET61a1z1/zNV72k+53uZx9/YtACrPDlCgAAfBac+dG4cePFN289du/jL5/vpnfHxiwWu+kLIqXPSSluTBF99h/3lX0z0JC7yWVRyaPQZbJUyKtq+1J3XHk0urHattSV8qh0pTzjUC+JS3lUulIeja5kdJMy2QGH6Ur5Uqtfau0GfXY6Dsefx0p9KW8p3ZXyeLrLTrLhnlpX0rqp9aWulMchf2amaN3m+lw2tGa/Ml8J1lC7rXUxoY/KppQvDfrWNGvKUW1T65ambGKNXc6U2ymbpSnbKZul1rbVr6vyvGI1KtL5Lvp7u4e3rr76a1/zi4/9ctd1xVMAX64AAMAz4FPvjZN3fGNcevgH486dfuOdfTe7Ke0uvrHvYmMW0aUU10bEdRGVl36lvCZ3k8uikkelG7+UyGSTlG5KeRS6XBaHyEtq+1JXyuMI3Ujxz5moPKeUR6HLZUu1rmbvbv+89pxSV8qXSn0pryndjPKV2UpQyJZKXSmfanw//jw0/mMzViwaXUnpppQvrdmnTLai1dfUbktdKV+q9ZnuQJTpJ5lyV9vUuqj0pXxobzNlWtV6QK2vdUutTauvWed2ynbKZmnKtrVp9YeVeW4mekqxiOjPdrF4OG2nx9N/8uZP9v/DuAdY8uUKAABcAel9sdW9O7YffO/8y+Pk/OpuZ/e6yzvxV2I+u5T69LYu4trxzVLxRXkpr8nd5LI4RB4Hu/1f1vYlpZtSHplu/Hmo1JXynNq21JXyqHSlvKL450xUnlfKI9ONPw/VupLRzf7H0rNKeVyhLqe2H3Qrs3Ew/jxW62tdTe4ulw3t9SuzlWCk1efUbo65q/6sRPmuacpdbpPLhtboV6YrwUStu6P2UdjksrHav/9nqtYDan2tW2ptWv1Uree0+pi4WZqybW1a/WFlnpuJnlIsDuqf7FL/me5j80v9vzh9fvFf3353PD7eAPhyBQAAjkF6f2x074zdh/7njS/ZiI24cHnn61Ifr5jNutmiT3+si7gxpei7LmZPHx14xFNRJovIb5tyN7ksKnlM79Lo82Slm1IehS6XLZW6Ul5S2q+bxxG6kUP9OVPq1s2j0ZUMbvZ/WXvOYbpSHo0up7TP5AeiTJ/NlkpdKZ9qfD/+PFZ7gV0sGl1J7abWRaPPdMWflaVWX1O7LXWlPBpd5PuVaCWYYMpNbVProtHXujjYt6ZFrcNaX+uWjmtT07pv9UNTtlM2S6VtKT+qzHMz0VOKRcbeNl3sYvFI+uTssc3/T78Z73/Thy/dPZ4CL2y+XAEAgDWlFLOuiz4i4v4f3nzridNb2xfOXv6T80h3LFLcmfp4Q4p4UdfFTkRsrfwF/fjzQPHlXymvyd3ksjhEHge7NPo8We2m1OXyXBaVPBrdWG17mK6UR6MbKf75Eo3nlLpcnsuikreM7lImO+AwXSmPRldSuxl0B2a5m1w2VOtrXU3uLpct7XXZSTYcaPVDU7alTSlfyvSH/llpmXKb2+SyoVo/6lamK8FErbtWH41NqSvlS4O+Na1qHdf6WrfU2rT6lnXuW9tWHxM3S7VtrTuszDMz0VOKRUZmm57soj/T3XNic+u/eNU1L/uns5/++OXxBnjh8uUKAABM9NEfjGtvmG2+dv7iqx++8NDZP9WldEdK3ZtSnz6/j7ime+p/vj554CjzF+rZLK7Ay7/xzfjzUKmbkO//srStqd2Uulyey6KSR6MbK21LeVS6Uh6NLuNQf86U8ih0uSwqeU3mJhXyfaWulMcRurHWdtCvTFeCQhaVPBpdy/h2/Hlsry/OSkUpr6nd1Lpo9IXuUD8rU9RuS10pX1qzX5mvBBO0bq5kX+vi6b41K2od1vpat3Rcm5Ypz2htWv3QlO1xbaaqPGulWgkqatvFU38HS3q0u7j94OI/e8s9/h0swNN8uQIAAAWP/m/x8sv9qZf2l3d3FzuLr+pms/ks4gsWffq8WcR1fcSJLuJ0ROUvzHN5LovKy79SXjO+GX8eKnWlPA52afR5LaW7dfJctlTqSnlJab9uHkfoRg7158u6XS5bqnU1e3f757XnlLpSHkfocmr7Udf8/ZTyOEJXk7vLZUvjPy5jxaLR5bT2pb6UD43/uLRuWn1N6zbX57KhWj/+vR38mAkmat21+qhsSnk0uqW9zZRpUeu41te6mNAvTd3lTLk9rk1M3B3XZqrKs1aqlaBiynZvky52/eLx9MDGo+nvbu727331J+OJ8RR44fHlCgAA7Ln3R+Ll1586fdMTly6/eLGIr5rFLBa76U0R6dYu4rqIuCoirhnfFf/iPJfnsmi8AKx1Obl9LotKHpVukO//srStKd2U8sh0489Dpa6Ul5T2pTwqXSmPRpdR/HOmlMea3fjzUK0rGd2kTHbAcXelvKS13+tXZitBIVuqdTGhz8nd5LKhZ+rfs1Lb17po9JXuUD8rLbXbK9HFan/gY+u2pnZb6+KIfa2Lp/rWpGrKcWlTyoeOa1My5XbKJibupmyWattadxiF52XjbFhR24+7/qko3TX7/bTo3nv9xa1/dOtHzz0yWgEvML5cAQDgBeuRH934wxsnNvsLl7dv2tmJr95Is40++q9LfWx0XSwWfZyedZkvU4bGf/E9NO7GnweO9eVf7iaXRSWPSjfI939Z2taUbtbJc9lSqSvlObVtqSvlUelKeUHxz5coPCuXLZW6Uh6NrmRwk0afs0p9KY8jdGO17ag78LF0V8qj0pXyKXK3uSyezkt1uWh0JbWbY+6qPydRvmtq3eX6XDa0Rr8yXQkmat0dpT9st7S3mTLNah3W+loXE/qYuGmZ8oxnchONXa07rMwzM9FTikXGlG1pc6mL/mx/T9x/8v/++ltv/tnuA3ddGk+AFw5frgAA8ILxmR/b/Pyt+cbm+XM779idpdvns26r301fm7qYdymuihQn4qm/nu67iNn4vij3F+BTsz3Fl4ClvKS0z+W5bKnUjfKUySYp3VzpPBrdWG1b6tbNo9GNFP9cicpzSnkUuly2VOtq9u72z2vPKXWlPI7QlZRuBvnKZCUoZEuH7UpKN6U8Mn9chrLhnlpXUrupdVHpC/mhfk6mqt2XulIejS5W+wMfW7c1tdtaFxP6KGxy2dBe35pVTTkubUr50HFtSqbcHtcmJu5am1a/rszzMtFTikXGlO2ETdqJiPu7z/SL+be84TcufX/XdROugOcjX64AAPC8kt4XW927Yzsi4vF/tvn5s9jYOndu5x19pNu7rruzX6TP7SI20lP/rpQT4/spf1G9r7Ydd+PPS7V/7EmxqBjfjD8PlbpSHge7NPo8WemmlEemG38eKnWlvKS0L+VxyK6UFxRfGpfyWLMbfx6qdSWjm/2PpWeV8rhC3VhtW/q9lILx56HDdi3j2/Hnob2uOCkWjS6ntj9sF/m++DOy1OpLWnelvpTHel12mg0bWjdXqi/lQ3ubKdMVU45Km1I+dFybkim3UzZLrW2rj2PcTFV4VjbOhgVTtlM2Symivxxp9zPxiZ0H42+89Z7FT4wnwAuDL1cAAHhOO/Mv4obrvvr2i/f947uu2jy18fpZbF28vHPpj3az7rWpf+rLlOji6hQx6yK2in/xXMprSje5PJdF4yVgrSsZ34w/D5W6Uh5Pd/uT2rakdFPKo9DlsjhEnlPbHqYr5dHoRg7158tx5dHoSgY3+78sPaeUR6Ur5Uutfqy0H+UHPk68OaDUlfKW0l0pj6e7lclKMNLqx1r7Wn+I7lA/J1OUbkt5HKGL1X5lvhJMULupdUutTakv5Ut7fWtWNeW4tCnl0eiGpu5ypt5O2bU2rX6otq1166o8a6VaCSqmbKdslkbb/lwX/ZnuDzbOzr7rsbOX/6e33xsXDy6A5ztfrsBn0SM/Fde+6LZXzNO9d1+466Ho7vjG8M/qBICGB388XvLik1elhx4//+KNbuOP7s7mFxeL/vO7Pl29SPHKLqU3pohrU4qui9ga34//wnhfKa8p3eTyXBbH+BKwtM3luWyp1I3y/Y+lfUltX+pyeS6LSh6Nbqy2XbfLZUu1LqP450spj0qXy3NZVPKW0V3KZAccpivl0ehyWvu9fmU2Dsafx2p9rasZ340/jx3275qrdSWlm1K+tGZf/PlYavU1rdtxP/6cU9uMf28HP2aCCabclDalfKi0KeVLe31rVjTlsLapdTGhj4mbkim3x7WJibvaptYdRuF5K/FKUDFlO2WzVNr2Ef2FLmaPzD64efnkf3D1TSc+8pIPPHxuPAOev3y5Ap9FD/34ta+ZdXHD4vL2nX3s3pwi/V4sorv6ttOf3n7kcpyYbT26e+rczg1fkZ68/593p279mrgwfgYAPF+lD8VW96bY/syPbX7+1tbs7BPn+uvm8/Qn5123sUj918du7HRdzFOKW/qIq/f+0vfpL1NyfyGcy5ZqXU5pn8tzWVReBJbymtxNLotKHpVulKdM1lTbl7pcnsuikkejGyttS3kcsivlBcU/X6LyrFIehS6XRSWvydykQh5RyeMKdWO17ag78LF0t24eja4md5fLlva67CQbDrT6oda21h+iO9TPyBS121JXypdq/ag78LF211K7rXVxyD6Xje1tpkyzWoe1vtbFhD4mbkqm3E7ZLE3ZtjZH7Q9j9Mzif4liMXBcm6WJ2/6JLhafSY/Mdjff9saPXLpr3APPX75cgc+ilNLsMz/5yhef2jp7w7knzn7TYrf/8lkXi76LzS66304R1250s19KXff4dVdt/Va/cen8E+dO3n9y5+zJm/5c3JfeH1d37wz/WxEAPC/0PxNXzf5EnH/ofRtferLb3Dm7vfMls430yohZt9jp/2x0sUgRN3cRWynFIlJEN4t5lP63r8fh+PNQrcup7cfd+PNA8UVgKa8Z34w/Dx2m28v369KupXS3Tp7LopJHoxsrbUt5VLpSHo1u5FB/rqzb5bKlWlezd7d/XntOqSvlUelKeU3tZtAdmOVuctlQra91JaWbUh5PdcW6VJTymtrNYbvI98WfkaVWX1O7zXW5bKjWj7qV6UowQeum1te6pdpmQlebNLWOa32tW2ptWn3NlNtnchONXa07jNHzqo+vlgO1Xa0bW2cbEd0iot+JfvHJ7q556v+r1/9B/0/GG+D5yZcr8CzxiffdcN21W5dee/nS4t+KtHh3inh56uOabhbzFHF/18VDs9Q9mmbxZKT0SMy7e6/eOvHLi9id7/T9fRdjdvaVX3f5nvQrN141+6LHnhw/HwCeTfofjVP3b15z+rY/c/bR+/7X+VdudvONne3F29Mi7phFvLzv4s6UYpb6uGH5BUpR7iXhSlDIlmpdTm0/7safB4ovA0t5SW6fy5ZyXS5bGnT7v6ztc2r7UpfLc1lU8mh0Y7Xtul0uW6p1GYf6c2Wdbvx5qNaVjG5SJjvguLtSXlLbD7qV2UpQyKKSR6Oryd3lsqW9rjgpFo0up7Uv9aV8KdMXfz4iv5+sdZvrc9lSrVsabQ58nHKfU7urdUulTSmPRhcH+9Y0q3VU62vdUmvT6lta960+Jm7iGHal/LAKz8vG2TCjtqt1Jevc7G1TikhPdIs4m/5Nejj+u8+8cvF/vPMDsTueA88vvlyBZ6F031tPP/QrH/qLi53Fl6c+/bEUceOy6yJ2+i7mkaKbd3Hvoo+Nbt79bvTp0dlm9zubMX+479JjGye6s5FmH9ne3rnlZbdf89Ez9zze3fCn48zB/0oAcGX1vxSnZm+Piw/9aLxm89TJWxezxblLFxZfNkvz8yn6ty4W6ZWzeXdzvxuv7FJcF7PouojZgYfU/gJ3+Re04zwy4fjzUikvqe1zXSY79heB45vx56VSHpVulKdMNknpppRHoctlcYg8p7YtdaU8jtCNHPrPl1KXy3PZUq0rGdyk0ecVpa6UxxG6nNp+1B34WLpbN49GV1K7KXW5L6OXikWjy6nta100+kJ36J+RmtZdqS/l0ejiYL8yXQkmmHJT29S6aPSlrvZ7XEfruNSX8qWj9i1T7qdsYuLuKJtSfliF52XjbJgxZTdls3QM2/RoF/Fw97/d9Iqb/9bNP3P/H4x74PnFlyvwLJTSN8wf+pcfuOn07oUbLp67/G9f3kl3dl360ujjhuji1HgfEduDf8b8w9FFH1081vVxLmbdR1PExa2N2cdTH1vRL345zeLES15y6lfue/jciZd/fdybUur2/uOg67roDz4aAKZ7+J9t3XnT1/7Qx+/7X9795q2NzS/oU3f1zk7/FbMuLqQ+vSy6uKFPcfUsxfUp4voDx4W/SI0odOu+JJyatZRucnkui8qLwFLeMr4bf14q5VHpBvn+L0vbmtLNOnkuWyp1pTynti11pTwqXSnPKP65EpXnlPIodLlsqdbljPb7H2vPKXWlPI7Q5dT2e112Mg7Hn4dqXUzoc3I3uWxpnd/LUK0rqd0cc3eon5GW2t2V6OJgvzJdCSZo3RylP2y3tLeZMl0x5ai0KeVDrU2rb2ndt/o4xk00drXuMEbPyz4+G2ZM2U3ZLB3ndhGxONNFPNb/9MVH+//L2x6IR8YT4PnDlyvwLJfS++aP/uRffd3i/IW3bcfu10ekt6RF3Np1sTHe1qSI87MuHukjTnYRn+xm3f2R4tIsusfnG/Nfi6471y+2H9s4NTs7v7Dz8Ru+4fbLEa/c/dj//oH5674qLo+fB8ALW3p/XN+9M87c/083/tDpzc24eHH3cxdd/7pIs9OR+q+JFGdTxO1dxIkU0aeIvos4PX7OAaW/WK3k2SoX5rKo5DWlm1yey6LyMrCUl5T26+ZR6EbZ/sfctqa0L+WR6cafh0pdKc+pbdftctlSrcs41J8r63Tjz0O1rmR0s/+x9KxSHleoG6ttB93KbCUoZEulrpRPkbvNZXGI38tQqx+r7WtdVPpMngr5vlrXUrvNdblsqNaPupXpSjBR667W17qo9KV8aa9vzapqx6WulA+1Nq2+pXXf6mPiJo5hV8oPa/S84uOLxcBxbZau1DYi+s90T+483v38yYvp/3vnp3Z/ddwDzw++XIHniPT9b918+NqP3nF5dukLo0vvjpReHX28frxbS4qLEbEZT31RczYizqfofmNjFg+kWXe5S90nI/qLV83jN7b7dPJFr3jJ7555+LGrt0/OLz1+7vyF139dnE3vj43unf45ogDPR/1vxVXddbcvHvzoXfOt3c1X3fhVb/79T/+T3/rjV52aXbezE29N/eKVKbrbu4hXRxc7KcV1EXFi/JxJSn/B2siz9Tgcfx6qdSW5m6nZnuwL81zWMr4Zfx4qdaU8DnZp9Hmy2k2py+W5LCp5NLqx0raUR6Ur5dHoRrJ/niwdpsvluWyp1pUMbvZ/WXpOKY9KV8qj0eXU9qPuwMfcXS6LSr7U6kvGd+PPQ7k/JkPZcE+tKyndlPJodJHviz8fpXyq2n2pK+VLtX7UHfhYu6up3dW6pdqm1JXypb2+NSuacljalPKlo/YtU+6fDZtSfliZ52WipxSLkdqu1o1dqe1A2o7oz6YnNx7d+rat3fTDr/zzl+/u3uOfFALPN75cgeeY/hdedE1s3NA9cu+979re3f3yrotb+j59aXRxTaTRP6P+EFIfi4iIvX958Lno4mJKsdFFfHzWxWZ03YdSRMxns9/tu917XnTV6d8+d/7SNXHV5n2Xz12c3fruuPuRn4prb/qqeHL/mb8em93bYufAfyEAnjVSesNW1314+5F/Hrdunrzmqu1zl67ZXsRb5vONRxfb229Lfcz6WXfnPKU39imuSSmuixQno4voupiPn7e22l+0NrqVeiUoZEu1bqy2HXfjz0u5/zcvFYuK8c3481CpK+XxdLc/qW1LajelLpfnsqjk0ejGSttSHpWulEejGznUy+NSl8tz2VKtKxndpEx2wGG6Uh6NLqe2H3QHZrmbXLZ02K4md5fLlva6lclKMNLqx1r7Wr9mV/zZWGr1NaXbdfNodHGwz06zYUPtptbFhD4Km1w2tNe3ZlW141JXyoeOa1My5ba1afVxTJtWP1XhOdk4GxaUtqU850ptC7o+YveeWcx2Z9/5Of/V1/zn3bt/bDHeAM9tvlyB56j+R287df76nWvOXXzij812+1fs7Cz+ah/xoi7i2vH2uKWIxyPFiVkXj0QX5yLiXET3cBdxX0Tamm/MP5RmsRmL3U9ubm70p66b/3J35mJ3+k/HPf0v3Xaq++J7L3/6f4qtO74xLo2fDcCVd+anTrz6unf9e3ff975/+K4TW/PZImandy7tfsXGPHZ3F+krui4u7724uj5SnIouTkfE5vg5x6b0F6+lPJ7qsvU4HH8eqnU5tf24G3/eU30hWOtKxjfjz0ulPArdKNv/mNvWlPalPApdLotD5CWlfSmPQ3S5rKH458u6eRS6XBaVvCZzkwp5xCHyOEKXU9sPugOz3E0uG6r1ta4kd5PLhqb+5+VQrSsp3ZTypVqf6Yo/F5HfT9a6zfW5bKnWxWp/4GPrtqR2V+uWaptSV8qX9vrWrGjKYWlTypeO2tdMuW1tWv3SUXel/LBGz8s+PhsW1La1bmjqLtbcTnE5YvFwPNQ/2H337mz3ez//rjgzngDPXb5cgeeJ+37kxFfGRv9H+p3+XRHxpuj2/wX3z4jUx6Kb7f9vL59NKR7tZvFIl2I3dd1ds4h5N+/uSxG7G93s04v57gPdIh7bjcW9N197TVw8f/bhiyeu3rzlq849nFJ0XXfs/yMNwAvC3T8ap17x5+Lip94b17/spq2bT/6p7Y/d82Pzd5w+sXn54vbuW9Ii3TrruzenSHd083hysRtv6rroUsSJLp7Z/79jX+4/8XPZ0l63MlkJCllU8prazbgbf95zbC8FS9tcnsuWSt0oT5lsktJNKY9MN/48VOpKeU5pW8qj0pXyaHQjh/7zJNflsqjk0ehKBjf7v6w9p9SV8qh0pbymdJP7fRSDQrZU6kr5FOPb8eehvS47yYYDrX6ota31h+gO/fPRUrstdaU8Kl0mX4lWgglaN7W+1i2NN+PPOXubKdOs1mGpL+VDx7Upad22+niGNrVuXaNnFR9dLEZau1Y/dKW2U6SI2I7oH5/dPbu88a3XdPP33frBc/4l9/A84csVeB5J/+errjt34aE//OSl7S9Jkb4oUrozpXjlePfZMPzHjaWI87MuHkopro0uHk5d95HNWfeR1PfztDH/1ei7m05udL+3u9i5Zn79dR+Kixfj1IlI589eTC/++nhg/GyAF6L+t15yVfd5t23f+0MffMk1L71u6+Kl8zfNt7s3L3Y3H+hn22/a6OL8IsVbFn3/2q7vbuy6uDWlOBVP/TXeyfHzPmtKfwFbyuPpbmWyEhSyqOQlpX0uz2VReSFYymtyN7ksKnlUutx/j0vbmtJNKY9MN/48VOpKeU5tW+rWzaPRjRT/XInKc0p5ZLrx56FaVzK6SZnsgOPuSnlObZv7fVSDQhaVPBpdSemmlMfTXXaSDSt5Te2m1kWlz+TVn4vI30wy5W68GX8eq/WjbmW6EkzQuqn1tS4qfSlf2utbs6Iph7lNLhtq9TFxUzLl9jg2rT4am1q3rsyzMtFTisVAa9Pqh67Udorx8y50sXi0+9TVF0/8xds/fO4XRi3wHOXLFXgeuu+HX3bTfOPJl8V854/v7vZfnVJ6Q6S4LrqnXqo9Wyz/CQXdU/9ZdCml6OezuNyn2I0uUqT4WBdx7Xze/fLubtx+4tT8fdu7O2lra+Mz/W5sbkb62HafrnrpTSc/cf/Zc3Hr18Qjd/2LuOEVX53OdF03/h9lAJ4z0vtiq3t3bEdEPP7+uP6Gd8aZR//p5ptOv/j0hScevPD2iDgVMZvv9os/Nu/izGKR3pm6OBcp5hFx86yLE32KUyniRKSIrnsW/898pf+0ruSlaqUYf14q5SW1/bgbfx4ovhgs5TXjm/HnoVJXyuNgl0afJyvdHEeey5ZqXU5un8uWDtOV8oK1/1wp5VHoctlSrSvZu9k/rT2j1JXyOEKXU9uPuurvJ5ctHbarGd+NP4+t85+VQ7Uup7Uv9aU8yl3x5yLKN5PUbnNdLhuq9aNuZboSTNC6qfW1Lgp9Lhvb20yZrphyVNvUujiGvmTK3XFsWv1QbVvr1lF4zkq8ElSUtqU850ptp6g8r3+i6+NM+kR8Jv76G+5b/OS4B557nr1/oQ0cWf/P7rzm/p27PnfW9+9cRP+O6NNXjDfPIWe7iI2IuJy6OBsRfeqjn8+7X0kpru8iHurmkVI3+62IPk6e6P5lXErX3vClb/jtz/zyR1518frT92xc3L76tndduO+RH++uvvnr4uz4vwDAM+2Rn7rx2he968vPP/QTP3bT4vLJE/3upevnJ7Zed+2pU584e/7ca/r57Pp0OT43ZumWiLgxUnpFpLiYIm6PiGue+ocMfJb+UV7HpfQXoLl8L8tV2TCXRSWvKd2M8/HngeKLwVJektvnsjhEHge7/V/W9jmlfSmPTDf+PFTqSnlObVvqSnlUulKeUfxzJBrPKXW5PJct1bqavbv989pzSl0pj0pXymtKN4N8ZbISFLKlUlfKW0p3jTxbZ8M9tS6ntq910egzXfVnI/I3Ta2bXJ/LxmqbUbf/sXZT07o7Sl/qSnkc7GqzqtZhqS/lS60+Jm5Kptwex6bVR2NT69aVedZKtBJUlLalPOdKbaeY8rydiHSx217cPftfT13d/aNXzS//q+6DsTOeAc8dvlyBF4D+R287dc/Jx1+1dXnnq3f7/p0ppTu7iFsi4sR4+1yVIra7FIvZLC4t+ui7Li5FF2ci4lJEnIvUPbAx6z6+iNg6eXL+4e1LuzdubHQf6BbRvei6rXsevnT+2pd8bXw8fer2k90dd1166H1x9UveHeeG/9vjAFOk98dG987Yve/74/Qt3/QNl7vuxxbnf/bUrVd9xcX77nrfxpdec+LEk+cvb3/RbJa2um7eL3YXX7Ax657Y3e2/vpt1H44+XZUiXpNSzFIX13b9U/9ZPfj3Wj0/1P4CtNTt5dl6HI4/D9W6nNI+lxeyXBxR2LeMb8afh0pdKY+DXRp9nqx0U8r//+z9eZhl2Vneib7rnBhyHitrnqQqqVSl0liSEGKQxChkWWJQISwwugwWxm1zGzfddtvulum+bj99292YvtcDdNs0GBpLBUbCMmA8YNo2jUHFKBVSqSTVXJWVWTlnxnTOXv1H7H1inW9/77fW3udEZmTW93se0Fm/9/3W2RG541TsszMyoGRyncIy5jWsbp+sq1cw30Duk2leczC8hZiJipvicmcS1tU+DnVhuIa+GYPNMI/NjMYsYN7CmumTMQ/ja4P5EqxZljGPTIbpvFVtiQJyM7PkLGO+wfoYS8gNWXnfDAW5RcnsPDq5HJmOlXVF2UtRRCrkerkchZ2GLt0SuuwXN/+vOhswPoVfWVpd/PA9n195RtYcx7l68JsrjvMSIcY4AB4KJ//V97+hurh+78ba6LsQ4l2xwl2ye42S/u3ukwg4OYhYq4AYY3h2YYC1MeKpwXD4xVhVdyyE6k8qDNaXhvi99YDlm7919Jtn/9nSKy+sLJ0a7b2wdMc349lzv4zrDrwXk19E17yhuvWUjuNcy8QYQwghPvlrOHLrgVtXnnzq6ZftW16+eRSr4xiPXzNcXHx+tIp7I8ZHIvDqCBwYRJyJiF+JgDNVhTsB7A/AagR2xYgqbH5nNpDPdU1iXYiyjL1hKKVcp1iZButrXnMw3hQEnzGRM3LdwDyMLPGTh6xrwWY0rznM0TNYv6uHkTFP6HWubLe3SGYmD9k+zMPImEcm07D6daZWNKk5GB6ZzEKb0xzIn0eKKmusTMPqWxmMXPHm1wT0mSJyc1quuQYrQzufWuZmGdZc3wyZvCCzKia5QZYzn5Lr5HJGbi6X4zJ2cnkJZA9Vq1JwOTvo0Cul635JPwKonhlUo/PVTyyeH/839z2LF9Oq4zhXD35zxXFegjzzc/uuG++JNy1h9GWj9dF3V2PcGQJui0AVXipv6gGIEXHyewgixhEYhAHW4xgLGAAh4LEQsYaA9RiwPkQ4H4HnAnC0ivGR4XDh0XE1ProQFp4d7BqcGm9sPIVR3HPjt//1T1361f/vzXvfvfL06d84eOjQO77hPP7dQ4vhnViNn8ZSuN9/EsZxdipf+insetn3YDVGDPGZY7vD/ScunP8Ebtj/Phx/4RcX37h0aPfZ8ycvvmF5cbC4MRoOKmx8+UIYvDgeV+8aIDxfxXg0AosIOBQr3DQIGEdgV6ywiACEcI399MkssAtS5rGZteKWIA6Gt7BmZCbXNeabg1YmYd1t8JOHrMuw+izTvOZgeGQyCesyDyNjHplMQM8T5tExk+sUK7NI5qJYt+iTMY9MJmFdxU8pJVddA8uYz8HmmMdmpsaqrLEyBpthHv0y+nUBPlMEm2UeRsZ8Q5K3qi1RiDVnZeiZa05Sd0qqLUqGtI7mUmbNc+Tmcznm1LFyK+uKsldLtYSB1bUySUm3pFNKn73qmanRdWB8Jp7F8cGPLYwHH33VE+ufTWPHca4O/OaK47yEifHBpZO/8MnXVhXu3Igb3wXEe2LEq2TPASIQAxAisB7qn4CpgFMB2IcKp8ICno0VdoWAMwHhRAhYDyG8MBiEL8YKy1UYPb4QBkeHi7s/tTG6dHR5vPjHcXm8f/HA8vEzL1w4dPsH8NjFX999895vWHn25K/gwNFvevDi5IZMxDAEjOUxOY5jEz+GYfj26a+d6lEsD16Jteaf6Xrul3Dn4b37F89dWt03HuOeEKuToyretnth4cJaxB2xGu+L4/CKGHB9QNyNCjdgiLPjEV45CNgPYGXzl8ujihFhR//i+J2GdmGquQbtolQVxMHwDNbv4Okbg8xbyBm5TmEZ85jOolgXY82wTPOag+GRySSsyzyMrKsn9DpXWKZ5zcHwFmJmsmR7MQ8jYx6ZTMPqJ9lUTZvRXEPfzELOyXVKndEKDTKZJNe18o4Z/ZpoyOUMa07LNJdi5SJrVVsiQ65v5VbWwDrMYyuzKpSSIdZhPsXqWFmO3Gwux5w6Vm5lfRD7tbZvCQOra2WS0m5pL0effeoZNhpXAbwweH6wsvDfjwb7fub+R05ckB3HcXY2/gaA4zg4/4s3XH9hHy6Gi2c+uLE+/gogfk1VYe8g4IjsOmVE4GIAFgEs1Y83EHESASshYA3ARUQsAOEEBqgGg3gaGLwwjji8EMLjCAiLC+NPbaxi9403XP9/P33qxN0HF3c9tr6wfv2RQ7uef/qpc7j9Azh18ldw4Lp349yZT+LwwT/1wIUQHvZfhue8ZIgRiyFgI0YshIDRmU/iMHAQa5fObiwe2HPXoTt2f/HFz529Z9/h4Ytnnx+9frhr4ezGenxjxPggqkEA4lsjcDpW8QEM8FSIOBQC9sSIQQXcgAgEYDECC9j8pukl85N92w69wpSiJvGtSkt0cDnYjPRynUDfHGTeQpvRHHp4bGWTitVlsJkuXnMNWqY5C6uvZZpr6JsJ6HkCY5/t9hbJzOQh24d59MyYt2Az2sdBBXEwPDKZhTanuYY6a1VaIsHKGGyG+QYrV7JeXxMlWLMs6+obRN6qt0QBuRkr75Mxn8J+WqqEkkHZkWuNXCeXW5TM5jq5HHPoWFkXxD50WxokWB0rk5R2S3uldNmv7paMxBWgehbP4dzif/nq7/krPx9+9Ecr2XEcZ+fiN1ccx5kQf+Ptu06e+d1Xj9ZHXzFC9bWo4jcA2CV7zuzEiHHyzwONY8QAwKUQNm/IhIAvVhUGg4BLERgHYDUMwoUY8TyA5eHC4D+NRuN7FxeGj22Mx7sWl5YersJ4YWEQv7ixXh3bd+Oexy88fenOweF9jy7FtdGR5YWVM2cu7Dt4dN/F4ysXLt30jbgIANWvYHnwbqyxf64sRgxCgH9z52w7zU9oNTcMn/0ojt20Gxc/v4CFQyuLdx87cujRZ188/bp9g8GJ1Th++QDDpcGe5RPrF1feMRwOX9hYHX/dYBg+X1XVnXGAp1CFV4chQhxjX0S8dRCwe1zhyAC4VAEHUWHo/0zXFYRdaRqeRa1ArhuYZ1h9mcl1An2DkHmG1tccDA+SKS4Sb8L6zEPJ5DqFZcxrWF2WMQ8jY57Q+TxhHkom1ylWZpHMRbFuMe+MeQ2rK7LJks0wjxkyhjajuZQur5MNzDNyfZYzD57RrwnwmSy5OS3XXArLFT9RSlaENWdl6JlrLqXOczVKbpDlzKdYHSvLkZvN5bgMHeb7oOzVUi2hcDk76NArpct+dbdoJCnFs2EcTsXfqU6FH371M6P/lNYcx9nZ+M0Vx3FafOmn7th17NiJQxdWR2+tqurd4434JgS8Fv4m5BVF3JABgPMALgIYRmAhBLwA4CiACwGoADxVRdwQQvitGOPXDQaDXw7AYBjCc1WowmAQnoujeHRxYfDoOsL1C4P41MZadXbxwNIljDbCMA53H/6KPX98/N+fOnLTt+Dxi/969y2711dOngx7jlz36iNnTvz208Mbvh0XvvRLOPSyb8GZ+BtYCO/EqD7WEELZ95TOtcOTH8Xu2z+AleMfw77rH3xg7cWPPXz90W9/4IXH/4+H995w664Du0+vPv/8cPGVC2sLpzZ2bbwijLEaq+oVS3sXn1+vFjcW1lbfuBEHMcTqTWE4+PR4NL4+RhxBCLsGAdfHKi7FgBsBHI8RrwvA+QAcqn+C5XwVMUTEHgywFoA98vicHYT26qA5ZC5SpZTrFCtjaDOlrkZ9g1BzOeSMXDcwDyNL/OQh61qwGeahZHKdwjLmNViXefTMmFdQz5EGljEPJZPrFCtjiJmouCm0THMNfTMNq19nrUpLENfQN7OQc3Kdwj4OMJmQy1OsrpUhk4vM/HpAu19Mbk7LNddgZZjOW9WWKMCasTJkcpYxn2Ld0MtRMig7cq0xr45Gbm7WHHPoWFlXxF6trVvCwOpaWUpJr6TThS771d2iEaUUKwCnIjZODP/doWrpL97xhYufkR3HcXYmfnPFcRxK9ei7lnHi0YOnTjz3FatrG9+PGO+MEffJnnNVUMWIMAhYi5vXrbsCcKECNoabv0vmUojYFwNOVcDBQcAXBwjPh4ATETgagQthgGGosBJCeCpG7I8DXAxVtTRcXPzMxnh99/LS4qPVWnVrtTh4cjiKu4cL8emNcXXDoev2PHH6xdXlwd7F4VIYn1sKg7WN0yurB47u3j34upVn4icPHsbes+fPLhzcf/ArX3/+uY/95uGbP4AT8TewK7wTq1M3bT6FxfAm0H/6rLmp4zd3dJLPz6D+tj7gM/cthPsfWT/3y7juwHtxsvnl7cd/A/uuxzE89+KJo7uHy+HUysLKgaWNw8fev/7Z5z668JYbbjn49DNPn3n9wYOL58+dHb0mLIS1GMcjVIM7hoPBmTGqtwyqwaMVqltiCFWIcX8AdseIQxHxQIhYjsCNm7/KEccQMY4RS4MBxlXE+RCwBGB/nS/Jj8W5SrG+KlnGLlZbgrgGK5NYXZnJdY35BqGVMeSMXKewrMBPHrIuw+qzTPOag+GRySSsOy+PTCbodZ4wD5JpDobPUc9Nxq19WMY8jIx5jVw3yVvVliCugWXMW1gzLJN/HimqNLyFNcMy5sGzXl8TJVizWqa5FJYrfkopeZbcDMuZT2Ed5rGVWRWT3CDLmUcmayjpMEpmc51cjhk7zHdF7KNuq0oFq2dlktJuaS9Hl33qbtFIrlQB4xNhNDgX//HoxfF/+9oXcFxWHMfZefjNFcdxspz5uYOHq4PhwKWV1S/DePQDMca7ANwQgSX/HQTXPnHzp2Ca3zexAWAREStxgOVQ4YX6vyTjEDCKQIgV9g4GOFvfwHkawFGE8FSM8aYQwiOocLJCvLg4CHsqhBirOAiDcB6D8AKquC8Mw2o1Hu9dWlz84/X10c0L+4Z/GNer2+Nw8CxGcd8CsLI+Gg8XhguX1sfjc8u7hkeGcXx6bTQ8VIXBZ8JgdN0t3/zXPn3yF//23ctLSyfHyxv7D+7dd/K5J86+bs91w2fOnFqLN77sYLj4zNmN4b6Di4duueWZxx9//Midf+reF5//+MO33PQtePzir+Pmvd+AZ6tfwQHgCJ5dPbV4yyvvO//47z6y58h9+4cHv+z8i/FThw+GN50+e+pjhw8efvDUuef/6a47bviKY8dP/u7Th657861nXvj9pw/c+D4cf+5fYu++1b379r/v4vFnfwXHbn43Tpz5NRw59C6cevKjOHL7B3DqqV/ErXF04BJwbmX54PItN7xr7bGnfhG33vZtePrCb+y5ce+JS6deWFy8b7i8cPLS+ZW4fP2e8fj0pcMLcXH3xfHGs3t3Ld68C8tPbozXbhotLp7AhbXXDfYMn9hYGd+PxWGF0foTg+HCmzZGS08P4sY7FvYsf2K8sfrqwWjwwkao7ggDLIYqXB+ratdwODgVq/iaOAhfrMbV1wyH4eFqjLsR4mMxhv2I1a0hhn0xYCEAVQw4hohTiLgNAyzGiHEA9gI4jYhdMW7eGAkDDGOFcRhgGIHKXzteolgXlSxjfzNWSrlOsTIN1te85jDnNwi1vuYwu4+Ky2L1WSa9XKf0zVKsHsuYxwyZgJ4nzMPIpJfrFCtjiJmouCkudyZhXe3jUBeGa+ibMbQZzTWw10fk5zph9a0MRq54+vXQkMs1cjNarrkGK2uoO61qSxSQm7FyKwPJNZeS5LmqSm5IyzUnmVdHUjKT6+RyzNhhvitkH1WrMsHKrUyyXV1Glz2SbnYsW9girgLVmXB+/BT+P4sHl/7JfZ+99JzsOI6zs/CbK47jdKL610duee7FlbdEbPypGOPbEHGv7DhOEXHzp1EQsICINQQsA0D9BvzzAPZVEePBABex+QvGdy8EXBxXOIwBngkBhwLwAiIOx4gzIeBSjNhAwC5EXAwIIyDui8PB76GqvmkQwu/EGO8IITwREe8bIPwOKoziMFyoAnYNY1wYVziIGDcWFwbPjMbx5cNheKKq4j2D4eA/jsfVXYtD/OEYg6OIVTWO4ebhEKfjGIdRxX2DhcEj1bh6LYbhaVTxnhjDE9Wo2rcwxPOjweDQ0iA+V0XcixCfXxgufHpjffR2xMG5OIi3DAbhyTiuDsQQHl+IuK1CPFUh3BkCIiL2VDEeHCA8EWO8FwinKsRXh0F4BEAIiHtjhXEM2I+IS/WNjQEijmKAcyHi9jFwaQDsQ8QYm/983H5ELIUBNmLE3vr3nazGCrtCQIxAaP4JughcrPd0nNmxLi61rHatqCWIg+EttBnNgXv1TULN5dBmNIceHtNZFOtirBmWaV5z6OEZrN/Vw8iYJ6jnCTL7sEzzmoPhLcRMVNwE5mFkzCOTaVj9OlMrUsp1CsuYL0Gb1Rw6fhwpVsZgM8yjX9br6yGHNatlmkuxcpG1qi2RIde3ciuDkTOPrcyqUEqGWId5ZLKGkg4jNztrjoIOy5nvi9hP3V6Vglwnl6Ow09Cly+iyR8nnKSVbEESgWgeqk3hs98quj7z89pt+cfBrj63JmuM4Owe/ueI4Tmee+5kbrscNuBjOnPngaFC9Zjyq3jEA7gBwQHYd50rCfkIibv5TUwib/9zUKoBdTR8RIQDj5AbDeURUMWJf/QvQL0Vgub7xAQDLiBghYCF5ikv1fgvN88SAi4jYjc1/misAkxtJYwBrAHYhYrB5ZwOIAQGbjyfHLz+eWB9BCAgxIjb7Os6OhF1cMo+trFVpCeJgeAbrd/BzfYNQzsh1CsuYx3QWxboYNsM8lEyuG5hHJpOwLvMgmeYarExAzxFk9mGZ5jXXYGWMZGbykO3DPIyMeWQyCesq/rJ/HAw2k/Es5kEm02B95htYTnzvrwkLa07LNNdgZWjnU8vcrEZupm/OPDIZNvNcxcQaZhnzDbPmjJK5eXRyOTIdKytF7KFuqUoC6zIvmXcvR5d9km7RWFGpJt272vx3u6snhn+A9erPv/rz/gvuHWcn42/COI7Tm+q33rr7xbOfv3393PlvHoTq/tE4flf9S9b3y67jOI7zEoddYDKPzUyNpZTrBuYt2Iz0cp1A3yRk3kLOyHUD8zCy9EK+9aAQ1p+H11yDlUlYl3kYGfPIZIJe5wjLNK85GD5HMjd5yPZiHj0z5hmsr30MVBDX0DdjaDOaa6gztaJKw1uwGeaRyaDn9OsBer8YNtvVo1vWqrZEAdaMlSGTa5nmUpI8V1XJDbGceWSyhpKORm4ul6Ogk8uR6VhZKWQPVatSwDrMa5R0SzqldNmr7haNFJVqjG48E1ar8/g31fnwkdd+YeNhmTuOszPwmyuO48zMkx+9dfdg6eJ1C3Hl7aP10bvHMb55ANyJ+m/tO47jOA69eNS8dQGryVKXw5qRmVwn0DcKmWdo/VLXwLLETx6yrgWbYR5KJtcpLGNew+qyrKtHJhP0Oke6ZHKdYmWMZCaK9RTMo2fGPMPqy48hpSWIg+GRyRjajOZSSm88p1iZhtWfY0a/FhpyuUZuRss112BlaOeTZW6OYc1ZGTI5y5hvYOdbKWyYeWQyzCFnlMzNo9M3Z74Pyl4t1RIKuU4uR2GnoUuX0WWPuls0UlSqKexWx8Pq6FT4e3fs3vO3Dv3x2dMydxznyuM3VxzHmQsxxgGAuPovr7/r9MXzb6s2Rt+DGA9H4HWy6ziO47zEYBeQGa/GUsp1ipVpsL7mFWe+SWhlGlpfczA8jCzxk4esy7D6LJNerlNYxryG1WUZ8yCZ5gzoecI8jEzzmmuwMkYyM3nI9mEePTPmNayuyC77x2GhzWiugb3RrcoaK9Ow+n0ztHP6tdCQyxlsjnkYGfNoZ61qSxRgzfTNGrSO5lLqPFdTKRmSHbnWyHVyOSM3l8sxp46VW1kpyh4t1RIEq2dlDSWdhi5dRpc96m7RSFGppksXm7/gPp7ChdGJwV9+3ZMb/5vMHce58vjNFcdx5s6XPrbnxt2L4VioNr5xtFG9q0L8alQYoP4F2Y7jOM5LDHYhaXg10qTmYHgG62tec8i8UWhlGlpfc+jhMZ1FsS5Gm9Fcg5ZpDj08g/W7ehgZ8wq9zhHmoWRynWJlDDETFTeBefTMmGdY/TprVVqCOBgemSyHnJXrlC4fR0oul1h9ljEPnvX6erDIzWi55lKsXGRTS2uOkZux8j4Z8w11nqup5IZYznyDlVtZCda8laEgR0HHyq2sFLKHqlUpYB3mJfPuWXTZo+4WjRSVarp0G5pj2QDic4PPDtYG/+PFc2sfe9Nzm7/f03GcnYHfXHEcZ9uoHr17+fwjx++8ONp4SzUefX0cx69HwI2y5ziO41zDWBeTLNNurrRETVfPYH3Naw7GG4XMM7S+5hq0THMNIouKy2L1WSa9XKewjHkNq8uyrh6ZTEDPERj7MA8lk+sUK2MkM1GsW7CMeRgZ8xq5rvwY1EVCV49MxtBmNNegvS420CCTSXJdK++QmV8HaPeLseZYxjy6Za1qS2Sw+laGnrnmUuo8V1PJDbGc+YZZc0ZuLpdjTh2WM98VZZ+WagkF1mFeo6Rb0imhdJ+6V1QvKtV06TYoM/FcQHUyPvyyYzd+857r3/ZceOihsew4jnNl8JsrjuNcFqr/cHT/s8+e/bODCm8ex/gNiLgewX8ni+M4zksC5SJRdTAubqWQ6xQrY2gzmgP36huGmsshZ+Q6hWXMYzqLYl0Mm5mH11yDlaVYPZYxDyNjntD5HGHZvLxFMjM1ru2luYbtyCSsK/wV+TgY2ozmsOXVWJU1VqZh9VnGfIOSq18HDVZmkZvTcs2lsFz4qSWbscjNWHmfjPkG60ZeCdYwy5hHJmso6Wjk5mbNUdCxcisrRdmjpVqCkOvNmqd06Vrk9lFyRW1CA8K8+8fD+sZp/Nrowuj73/g8TsjYcZwrg99ccRznslH9h3v2v/DCs/eP1lc/CFSvqSLeECJ2IWBJdh3HcZxrAOsikWW1b8UtQRwMz2B9zWsOxpuFzFvIGbluYB5GlvjJQ9ZlWH0tK3UNLGNew+qyrKtHJhP0OkdYpnnNwfAWYiYqbgqWMQ8jY55h9etMrUgp1yksYz6HNqe5hi4fRwPzFtZMn0zx9OugIZdrWDMsYx6ZDNN5q9oSBVgzfTOQXHMpdZ6rqeSGWM58w6w5IzeXy1HQ6Zsz3xVlH0URKbA6VoaCPKVL16J0n6SXHckWErajuwbEM/E0nhv+g+HuwT+65/NrX5QVx3EuP35zxXGcK8KLn9j76o3VjW8cxerrYoxvBXBYdhzHcZyrHHaxyDw2MzWWUq4bmGdYfZnJdQJ9w5B5Czkj1w3Mg2TCRcVlsfos07zmYHhkMgnrMg8j6+oJnc8R5kEyzcHwFsnM5CHbh3kYGfPIZBLWVfxl/zgYbCbj1ViVNVYmsbp9M+h556+DEqxZLdNcipWLbGppzWnk+lZuZSC55iTsv8E5ckMsZ75h1pyRm5s1x4wd5rsi9mlt2xIKVsfKUkp6JZ0SSvdJetmRbCFhu7o1cSVg/Bxe3I2F/+KuV7/858NDj6zLjuM4lxe/ueI4zhUhxgeHALD6L//dy148d/obQsQ3jav4mgDcIbuO4zjOVYp20ai5BvamjpRy3cC8BZvRvOZq1DcMNWeh9TUHw8PIEj95yLoW2ozmGrRMcw1apjkLra+5BpYxj0wmUM8PGHswD5JpDoa3EDOTJdurq8cMmYR12cfQWhiuoW/G0GY011BnrUpLJFgZg80wDyNjHj2+FnJYc1qmuZTCvFVriQKsGStDJmcZ8zA+rhJKhmRHrjVynVzOKJmzOlaGghxGh/muiH1a27YEIdebNUdhp4TSfZJediRbSNiurqQCsBJQPY1Pjy/Ev/za58b/SlYcx7m8+M0Vx3GuOGd+7dYjaxun3jxaGb2hqsY/gIiD/pMsjuM4VznswjHj1VhKuW5g3oLNSC/XNfSNQvAZitbXHHp4TGeTh1Zfg/WZh5LJdQPzyGQS1u3qYWTMK/Q6R5iHksl1A/M5krko1i1YxjyMjHmG1ZcfQ0pLEAfDI5MxtBnNNbAbzsjPFWN1rQxGrvheXwclsNmuHt2yVrUlDEq6VqdPxjw2MyvOYg1vR4aCXKNkJtfJ5SjosJz5rij7tFRLKFgdK0NBntKlyyjZI+lk69lCwnZ1M8TnwwiX8KuLF8LffMWTG78nc8dxLh9+c8VxnB1BjA8Oz/6fv35gZdfqG6pxfFNVjb8ZEa8FsFd2HcdxnKsAdgGZ8WospVw3MG+hzZQ6zPkNQ9mX6xSWFfqouCyszzxIpjn08BpWl2XMg2SaM6DnCPMwMs1rDobPUc9Nxq19WMY8jIx5DasrsuzHwTxmyBhyRq5T5J+D8JRcLmF95tEvo18H4DNZrDkt01yDlWE6n6rm5hhsjvkGK2cZ8zA+rlKsIZYx3zBrziiZYx3mU2bpMN8VsY+6rSoTrNzKUkp6JZ0SSvYp+bzAChS2q1vKGlC9gDGOx7/06uerfyBjx3EuH35zxXGcHUdVvX/3i7/8q29dWV37joB4LyK+SnYcx3GcHYx1EalltdMiVZa6HGxG85qD8YYh8wytrzn08JjOolgXY81oWalr0DLNWbB+Vw8jY16Bnh8g+2iuQcs012BlGqI/WVr7aJnmGvpmEqtbZ61KSxAHwyOTMdgM89jM1FiVNVamkeuznHnoWeevgxLYHPMwMubRzqaW1hwjN2PlfTLmG9h5VoI1yDLmkckaSjqSkpl5dKycZcx3ReyjbqtKQa6Ty1HQyeWldNmn7tIRGihsV7cLzcezGlCdis/gZPifX71/9PfCI/Dfv+I4VwC/ueI4zo7lxMeP3jzeuPg14/HoPVWMXwVgXwT2B3/tchzH2dmwi8mMb8UtQRwMz7D6WqY4+oYh8xZyRq5TWFbgJw9Zl2H1WSa9XKewjHkN1mUeRtbVK9DzA8Y+zEPJ5DrFyhjJTBTrFn2yrt6CzciPIaUliIPhkckY2ozmGqw3vGmQySRWd45Zr6+DEqxZmcm1xMqTrFVriQLYDPMpVodlzGMrsyqU3JCWa05idazMwpqzsoZcJ5cj07GyUpI96HY0qLFyK2uYVydHlz3qbtFISamk09ClW4rYM1ZAWAkIzyz+3I2Liz906JFzp6YbjuNcDvwNSsdxdjQxxnDyE9fdNNpYeSPGG+8eoXoPIm6TPcdxHGcHoV1Qaq6BvZGoSc3B8AytrzlwT980ZN5Czsh1A/MwssRHsS6GzXTxmoPhkckkrMs8jIx5ZDJB53Nku71FPTMZtfbokzGPTCZhXeGnltqM5hr6ZgxtRnNQ/hxSVGl4C2uGZcyDZ/RrAHzGxJphGfMwMuFbtZYowJrpm4Hkmkup81ytRckA6zCPTIaCXKNkZpYO8ylWx8pKEXuoW6oywcqtrKGk09Clq1E6X/eK6kWlDj107JaQ2W98OmzgNH5jaWP04CsfwzmZO46zvfjNFcdxrhr+5ONH9+9fP/f+EPHmWFXvihE3I2BZ9hzHcZwrCLsAZB6bWStuCeIarExidWUm1wn0TUPmGVq/1DWwLPFRrIuxZlimec3B8MhkEtbVvOYaWMa8Aj03kNlHyzSHHp4h+pOltY+Waa6hbyaxunWmVqSU6xSWMW/BZpjHZkZjFjDPsPpzysyvAbT7xVhzWqa5FJbLj4cuCrFmrAyZnGXMYyuzKpTckJZrLsXKrSyHNWtlDfPoaLnmuiL2oFvSIIF1mJeU9Eo6OUr2qDsl1bJShx46dkso3W8VGF8Iz+L4wl+7df/yLx/647OnZcVxnO3Db644jnNVET/1wJ7jX/rs3bFa/1AV4+urGB9AxBICdsuu4ziOcwVgF4KGVyMp5bqBeQs2o3nN1ahvHmrOQutrDoaHkSU+inUxbKaL1xwMj0yWYvVY1tUjkwnUcwOZPVimec3B8BZiJipuAvMwMuaRyTRYX/sY1IXhGljGvIU2ozlM+1alJQS5PMXqzjGjXwPQ+0VYc1qmuYYOWavaEhlyfZYz36Dlmkup81xNJTfEcuaRyRpKOpLczJXMrawUsYe6pSoFrMN8yrw6OUr3SHrmiBkKSrulvVK67Nd0V0Icn44nVo4PvunNz238nmg5jrON+M0Vx3GuWl78xN5Xb6yPvmpUjd8Vx/FrELBfdhzHcZzLiHUxqGW106KWlOsG5i3YjPRy3cBuCMGYYWh9zaGHh/I5troMNtPFaw49vAbrMo+eGfMK9I3lrh4k0xwMb5HMTB6yfZiHkTGPTCZhXeGnltqM5hr6Zhqszzw2MzVWZY2VabA+8w0sVzw9/xtyuYY1wzLm0S2bLK0ZhjVjZcjkLGMeW5lVoVhDLGM+xepYmYU1Z2UNuU7fnPkuKHu0VEsosA7zKSWdhi5dSZfZumuOmKGgtFvaK6XLfrI7BuJG2Fj/HH72wJ6lH3/55y/9oWg4jrNN+M0Vx3GuWmJ8cAgAJz7+q28br6++YQy8qxrH+0Pw38niOI5z2ZEXeSkssy6GpZTrBuYZrC+9XCfQNw6ZZ2h9zTVomeag+0i8CeszDyWT6xSWMa/BusyDZJprsDJBr/ODZZrXHAxvIWai4qbQMs019M0kVjfJWrWWIA6GRyZjaDOaa2A3VpCfK8bq9smI7/U1kIPNal5zKVaeZK1aSxRgzfTNoORyrWGdYzmsQZYxj0yGgpyRm7uSuZWVIObpdjTIZCjIMceORel83Suql5RKOujQK6XrfqxfAeOzYW3hxeH/dM8rj/zt8MnnLsmK4zjzx2+uOI5zTXDm1249sr526m2j1dEbxuPx30DARQCHZc9xHMfZJtiFHoyMvdEjpVw3MG/BZjSvOczxjUPZl+sUljGPrWxSsboMNtPFaw49vAbrMg8j6+oV6LkBYx/moWRynWJljGQminULljEPI2OeYfXlxyDcFMzDyJjPIefkOqXOWpWWSLAyDavfJyO+19dADmtOyzTX0CGbWlpzGrl+35x5GFntWWySG9JyzUmsjpVZ5Oa2M++blaLs0VItocA6zKfMq5OjZI+6U1ItKxX2Sjpd6LOfMRPq76urLw6eWhrhR17xhY2PyY7jOPPHb644jnPNEOODw7P/8l8eXLm49vrxKL4xVuPviBFvCAED2XUcx3HmDLvYYx6bWStuCeJgeAs2I71c19A3Dpm3kDNyncKyAh/Fuhg208VrDj28htVlGfMwMuYV6PkBY58uXnMNVqaR9CcP2R7Mo2fGvIbV1T6G1sJwDSxj3oLNMI/NTI1VWWNlGlafZcxDz3qd/zmsOS3TXArLhZ9aspkcbI55ZDKQXHMp7PwqwRpkGfPIZA0lHYk1Y2UoyFHQYTnzpSjzLdUSCqzDvGTePY0us3XXHDFDwXZ1GX326DATz4cxTuP/WroUfujuL258WuaO48wXv7niOM41SYxxeOITe9+1urb+AxjFmzDAfQHYI3uO4zjOnNAu+jTXwC6MpZDrFCuTWF0tU9zc3ziUM3LdwDxIJlxUXBarzzLNaw6GRyZLsXosm5dX6HV+MA8lk+sUK2MkM1GsW3TNNNdgZRKrK48/pSWIg+GRyRhyRq5T6kytqDIhl6dYXZYx36Dkvb4GLKwZlnX1aGetaktkyPWtvE9W4FnFxBpiGfPIZCjIGbm5K5Uz3wVlj5ZqCYGVW1nDvDqMLrN11xwxQ8F2dS267tOln3THzw5G8RL+599652v/mx/4yYc30prjOPPFb644jnNN8/TPH75taeHS16+Pxx8A4pfFCrsQsCx7juM4zgywCz/Ds0gNSp2F1ZeZXCfQNw+ZZ2j9UtfAssRHsS6GzWyn15wF68/LI5MJep0bLNO85mB4i2QminWLPhnzyGQSqys/BnVhuIa+GUOb0Ry2vBqr0vAWbIZ5dMvouY92txPWrMzkWmLlSdaqtUQBbIb5BitnGfMN1n9vLawhljGPTNZQ0pHkZqzcyhpyHZYz3wWxR2vLllCwOlaGghyFnRwle9SdkmpRqaTT0KWbo8teM3bjSkA8E18IJwZ/4967N34q/CZGsuM4znzwmyuO41zzxPiRwYlf+l/u3hhtvBlx9L5xFb8mAEdlz3Ecx+mJclEH2L4VtURNV89gfc1rDsYbiMwztL7mYHgYWe0nMetZsJkuXnPo4TVYl3kYGfPIZIJe54eWaQ49PEP0J0u2T1cPI2OewfqJb1WkkOsUljFvwWaYx2ZGYxYwr2F155jRcx96P0tuRss118Ay4Vu1lijAmpl3xjy2MqtCsYZYxnyDlVsZo2Qm17FyK2tgHeZLEfPqdqpMsHIrayjpoENPo2Q26WTr2UJhp6FLN0eXvebYrc4GjE/G39o32P3XXv7ZC78pc8dx5oPfXHEc5yXF2V+/7hUrp889uFFVX40Y34aA/bLjOI7jdES7uNMctrwaSynXDcxbaDOlrkZ9A1FzObQZzaGHh/I5troarM88lEyuG5hHJpOwLvMwsq5eQT03YOzBPJRMrlOsjCFmouImMA+Saa7ByjRYXzt+dWG4BpYxb6HNaA5bXo1VWWNlGla/T6Z4eu435HINa0bLNJfCcuGnlmzGgs0w39A1l2sN68adRW5IyzWXYuVWZpGbuxK55vog9lG3VWWClVtZQ66Tyy26zCZdOkYDhZJuSaeULnvNuRsjECqgOo9RfGbwv42XFv6H1z228rTsOY4zO/5Lnh3HeUlx8BtOfn7Xwev/4fLywt8OC+HXY8CjAC7FiLHsOo7jOAUUXOAV0WWfrn89qHRvo5d9A7GULvuwruVlJtfbQZfnYH92XfZgsD20z0tDV68wt3PjMjP5tLDjZx6ZbB4U7j9V02Y012BlXem6F/s6uFxYx2tlXZicYNuM9RwdjqGwxum7gTXX4fgn1DNdx4CC59JyzaVYuZUxSj4ns+Sz7D/r17V4bvVQVJlg5VbWkOvk8nmRPA99ShoolHZLOiWUPh+2p9t8XxIHQNiPhXAE37RrKf7ZGOOsZ6njOAr+heU4zkuW+KmXH3zxyee/bG19471jVG8KEV8mO47jOI6BdYHHMvamj5RynWJlGqyvec0lF6otmGfIvlynsKzATx6yLoP1mYeSyXUD88hkKVaPZczDyJhXoOcGjH2Yh5LJdYqVMeqZyai1B8u6emQyidVNsqmanJHrlL4ZQ5vRXAN7HUR+rhjWZR5GRnyc/D8F5i2sGZYxj27ZZGnNMKyZvhlIrrmUOs/VVKwhljGPTIaCnMHmmE/Jday8b1ZKsoe6nSoTrNzKGubVscjN5z4HKdlCYaehS5fRZY9t6qrfk6wGVM/H/zg6N/ze1z+7/qiMHceZDb+54jjOS5pnfuKmPQCAI6e+M6J6AKPqjRF4DYBdsus4juMItAu4Bi2rXStqCeJgeAttptSxC1XwvomckesUlhX4KNbFaDOaa9AyzaGH17C6LGMeJNOcgXp+aK6BZV285nKImai4CcyjR6Y5C6ufZFM1NjMvn0POyXVKnbUqLZFgZRpWv0+mePW8b7CyHGxW85prsDL0/HNgWDMsY75ByzXXwD6eEnJDWq65lFlzjdzMlcqZL0XMq9upMsHKrawh18nlOUrn655ZN8Oakk5Dly6jyx5dug0FM+ZrMoD4YjgzXMOvHsTyf37TH118QeaO4/THb644juMAiM88sOfx33/ywK5LZ7+7qqp3VDF+EyJWELBbdh3HcZwadiGX8a1YCrlOsTIN1pdermvMi1Ur09D6msNsfvKQdRlWn2Wa1xx6eA3WnZdHJhPQ86Orh5LJdYqVMZKZKNYtWMY8jIx5Dasrjz9FCrlO6ZtpsD7z2MzUWJU1ViZhXeaRyaDn9NyH3s9izbCsq0c7m1pacxpW38qQyVnGPLYyq0KxhljGPDIZCnIGm2M+Jdex8r5ZKcke6naqrOmbNeQ6ubyE0j3qHq3TQKGkW9IppXSv0l5DQd98LU5ZA8an8Gw8Ofgrr31m42dl7DhOf/zmiuM4TkL85Zv2nFu8cNvqxbX3jarqgfEovjsE7JM9x3Ech1z0aa6h9E1FuW5g3oLNSC/XNfSilXkLOSPXDczDyBIfxboYNjMPrzkYXoN1mYeRMY9MJuh8fjAPJZPrFCtj1DOTUWuPrpnmGqxMYnWTrFWTQq4bmEcmY2gzmoPy+U9RZY2VaVh9ljEPPaPnPfR+EWyuq0d5NlWzZizYHPPomTGPzcyKKSVDsiPXGlbHyhi5GSu3soZcR8s11xVlj5ZqCQXWYT5lXh1GyWzdMatmmFDSK+mU0mWvOXfN12FJ070QRtW5+AeL54bffc8T638iWo7j9MRvrjiO4whifHAIACc+/qtv21hf+7qqqt4L4GUR2B+Agew7juO8JGEXdcxjM2vFLdHB5bBmZCbXNfTilXmG1tccDA8jq/0kZj0LNqP5UtfAMuY1WJd5GFlXr0DPDZB9NNegZaWuhGRu8pDt1dXDyJhnsL52/K1FQlePTMbQZjSHLa/GqjQ8w+rPKet83pdgzWmZ5mD4hiRvVVsig9W3Mhh5V4+tzKpQrKE+GfMNuZxhzVkZZsz7ZjmU2ZZqCQXWYT5lXh1GyWzdyVazhcJOQ5euRek+pT2Udc3XYInohgoYn4nAc8Mfv+9b7vgrg//fY2vTDcdx+uA3VxzHcQyqP3jt3ucfe+ztIW58/WhUfT/gP8XiOI4jL9amYJl2YwVKX64bmGdYfS1THL2AZd5Cm9EciNdcQ5JNHlp9idXtksl1A/PIZBLW1bzmGljGvEKvc4NlmtccDG8hZqLiJjAPI2MemUzCuolvVaSQ65S+mQbrM4/NjMYsYF7D6rKMefCMnvvgMybWDMu6erSzqaU1x2AzzCOTgeSaS7HOK4vckJZrLsXKrYxRMsM6zKfkOlquua4oe7RUSySwjPmUeXUsSufrHq3TIKGk09Cla1G6T2kPZV3ztVdidGMFxFOD4wtn8SOvesz/eTDHmQd+c8VxHCdDjA8O43/8t3uOP3/+HdU4vn00rt43CLhb9hzHcV4ysIu2jFdjKeW6gXkG62tec9aFLPMWckauG2b0UXFFsJkuvtQ1WFmK1WNZV49MJuh1brBM85qD4S2SmclDtg/zMLKunsH62vEzIdcpLGPeQpvRHLa8Gquyxso0rD7LmIee0fMeer8Ia05mcp1iZZjhz0HD6vfJmEdZZlUobKirRyZDQc6w5qwMmdzKGliH+RKU2ZZqCQXWYT5lXh1GyWzdMatmmFDSK+mUULpPaQ9lXfN1V1LSjQBWAnB84V/vWsf3v/zx1SdkxXGcbvjNFcdxnELipx7Ys3L2mWPnTp/65vX16psHg/jKWOE6BCzJruM4zjWLdeHGMnYh3RLEwfAM1te85qwLWuY1WHcb/OQh6zJYv4vXHHp4DavLsq4emUzQ69zQslLXYGUaSX/ykO3R1cPImGewvvBTS21GczA8MhlDm9Ectrwaq7LGylKsXt8Met7rvLew5rRMcw0sE75Va4kMrM98Q9dcriX+EyscK0MmZxnzXRB7tLZsCQHLmU+ZV4dRMlt3SqrZUi5vKO3lKNmnpNNQ0KWvt4yO/Xg6rI/P4H+ozo7+zuuP46LMHccpx2+uOI7j9ODpf7L/nsU961+7sT76kQi8TOaO4zjXLOziLePVWEq5bmDeQpvRHLhXL2w1l0POyHUKyzQv3GSpdRmsyzyUTK5TWMa8BusyD5JprsHKEtRzooFlzEPJ5DrFyhjJTBTrFixjHkbGvIbVFdlkKWfkOqVvxtBmNNdgvQlOg0wmYV3mYWTE9zr3LawZLdNcCssT36q0RAFshnn0zJjHVmZVKNYQy5hHJkNBrmHNWFkD6zCfwjrMlyLmW9u1hALrMN8wa56jdL7umXUzLMhTunQtSvcp6RV0zNdaRpeZ5s9hNSCeCo/uOjf83rve9erfCT/58IasOo5Tht9ccRzH6cmzH73xWBieeusY8SviqHpPiLgj+u9kcRznWoddwGV8K24J4mB4ButLL9cJ9OKWeYbW1xxm81Gsi7FmWCa9XKdomeYstL7mGljW1SvQ8wLGPsxDyeQ6xco0kv7kIduDefTINGdh9eusVWkJ4mB4ZDKGnJHrlC7H32BlGla/T6Z4et4zXwKb1bzmGjpkrWpLGFhdK0Mm1zLNpVg37CxyQzKXa4mVWxkjN7OdOcuY70Kyh7qdKhOs3MpQkKOwwyiZrTtm1QwTSnolnRK67FPaNXr0ddaiy4zWPRsQzuGnD4x3/cgtj144KWPHccrwmyuO4zgzEOPHhhd/7S9cf3Hl4pevr2/8QIjxFTHiRgTsll3HcZyrHu3CDIbHZqbGmtQcDK9hdWUm1zXmBa6VSbSu5tDDYzqLYl0Mm+niNYceXoN1mYeRdfUKvc4NzWsOPTxD9CdLts+8PDKZxOom2VRNm9FcA8uYt9BmNNfQ5fWvwcokrMs8+mX0vGc+B5tjHkbGPNrZZGnNMKwZljHfoOWaa6gzq0KxhljGPDIZCnINa8bKGqyOlcHImS9FzKvbqbKGZcw35HIUdhgls0knW88WCjq5vJQu+8ypS19jGV36VncNiGcHp6oT+OEjNy7/yi0P+w0Wx+mD31xxHMeZE8f/6Z7XDfbE29cvbfy/qyq+FQF7ZcdxHOeqhl2gGV6NVEm85ixYX/OaQ4/jZsi+XKewjHlsZZOK1WVoM5oD8ZqD4ZHJJKzb1YNkmjNQ3wDRXAPLpJfrFCtjJDNRrFuwjHnMkKVYPZFNLeWcXDcwj0zG0GY018BeR2DMMc+w+ixjHnqmnvMNVsawZrRMcw0sE75Va4kMrM98g5WzjHlsZVZFJTeg5ZpLsXIrY+RmrNzKGliHeWSyHGJW3UqVCVZuZSjIUdhhlMzWHbNqhjXz6uTossccu+ZrrGQbuvFSQHUmfungysI33P6Ftcdk7jhOHr+54jiOM0fipx7Yc+KJP37naAOvGsfxhwC8HPCbLI7jXCOwCzXDt6KWIK7ByjRYX3q5rqEXucxbaDOaw2x+8pB1NawuyzSvOfTwGqw7L49MJuh1brBM85qD4S3qmalRtk9XDyNjXsPqasevCuIaWMa8hTajORjHDyYNz7D6c8roOY92t4jcjJZrDoZHO5taWnMaVr9vBpJrrkH772kJuSEt11yDlaEgZ7A55hu2K2e+FDHf2q4lBCxnPiXXyeU5cvN1btbMsKak09ClyyjZo6TTkOmar6+S7eoCiCMA58O4eib+T2Fh+E/uf3L9EdlxHMfGb644juNsA+f/5Q3Xj8crd1w4e+l/jCHeC2APIg7InuM4zlWFdsGmOWQurqWU6xQr09D6pc662GXeQs7IdcOMPioui9VnmfRy3cA8MlmK1WNZV49MJuh8bjAPJZPrFCuTKN1IPDBHj0wmsbpJNlXTZjTXwDLmLbQZzTVYb4SzgHkNq8sy5sEzes6Dz5iwGc1rrsHKsJWrNVUScl0rZxnzMLLEswrFGpCZXGtYHStj5Gas3MoaWId5ZLIcYlbdSpUJVm5lmENukZtN8lw1X5hjJ0fpHnPqma+rku3qSlaB6iyOY2Pfu179mTN/GEKYZTfHecnhN1ccx3G2kad//vBty0uXXrE2Hn9/NYpfGwKulx3HcZyrAnaZlfGtuCU6uBxsRvOasy56mWdo/VLXwLLETx6yLsPqa1mpQw+vYXVZ1tUjkyXQ8wJkD82ho9dcDjETFTeBeRgZ88hkEtbVjl9dGA49vIU2o7mG7b6xgkyfZcyjnXU+30ths5rXXAPL5MdBF4VYMyxjvkHLNZdinVMWbIh5zJChIJfk+rPkVgaSa64rYo+pZcn+rMN8Sq6Ty3Pk5pOcVmmQMK9Oji57lHQzHfN1VbJdXUKogPFKqMaP4V8vLeNH731y9Fuy4zgOx2+uOI7jXAZO/OLuN4+q6i3j8eg7qgq3hoA7ZcdxHGfHYl24sYy9GSSlXDcwb8FmNK84euHLvIWckesULdNcQ5JNHlp9CesyDyWT6xSWMa/ButvtFeh5AWOfLl5zDVamkfQnD609WNbVI5NJWFc7fibkOqVvpqH1NYeOx59iZSlWb45Zr3PewprRMs01FGatWktksPrzzpjHVmZVVKwBLdNcipVbGSM3Y+VWhkzeN8uhzLZUSyjIjlxr5Dq5PEduPslplQYJJZ2GLl1Jl9k5dM3XU0mXLnr0DeIYqM7EM4svLv+/9h1b+A+3/u75F2XHcRydgRSO4zjO/Dn2bSu/eyne8rNLu3b/9cXB8B8gYj0Ap2TPcRxnR9L1r+Owiz3p5Xo70J5Dc1eKrsei9TV3pWDHwrwG63b12812P+889rf2YFkfzzKJ1WUemUzCutZzdyGzx7yeRqXra3GObTvQbcI63r6ZhtXvmzGsmTqzKirWgJVpbOsJTZjl+XKz2tfQnD/G1nYtoVDSudyUHFOS56pzoeSY5kGX5zG6V8uNFQAIARgcCofWVtb/9rmTa18uc8dxONp/WhzHcZxtJH7y2I1PX7hw5yCM3hVRvb8a474Q/PXYcZwdDLuAy/hW3BLEwfAM1pdermvMC2Ark7Cu5jUHw0P53FpdBpvRvOYwR6/Bul09jIx5BXpuzMNrDoa3SGaiWLdgGfMwMuY1rK48fnVhOBgemYwhZ+Q6pc7UiioNz7D6fTLFdz7fLawZljEPIxN+aslmLKwZljEPI2MeW5lVUckNaLnmUljOvEVuxsqtrMHqsIz5EpTZlmqJBJYxnzKvDqNktu7QKg0S5tXJUbJHSaehoEtfTyWlPXTs9iCeDZeWzy3+1wcr/MKxz608K3PHcdr4m3mO4zhXiBg/tOu5X/yn31ONRh+qIm4JwK2y4ziOsyPQLuQ013C5/0kwqy8zuU5QL4I1ZyH7cp3CsgI/eci6DNbv4jUHwyOTSVi3i9dcg5UJ1HMCmT1YJr1cp1gZI5mJYt2CZV09MpnE6tZZq9ISxMHwyGQaWl9zDV2Ov8HKJKzLPPplvc55Czanec01FGatWksY5LpW3jXTXAr776hFbkDLNddgZSjINawZK0MmtzKQXHNdSfZobdcSCqzDfMOsuUXJbN2hVRoklHTQocfoMl/SLejQ11FJaQ8du31I9q++ODi5MMZfftXjG/8krTiOo+P/LJjjOM4VIoSfXg37D/3MUrX8g0uLC/89Ih71fyrMcZwdB7uY6/pXdNg+ktLenCm+EO5K189TF7brmOdN6XFGo9vVXym6HA87N7rs0ZDMZMezBYHVt7JSuv65aw6GRyabB/Ub4dv9NCrsPOpIxDa8Ds5rP2ufvllXrL26ZpprqE8kq9KLeW7Y52TvM5NypWYtZtmXfT6YT8nls1Cyd90xq3N6XbKfJEPJ57KhtJvpxFj4Olr6fOjY7YOyf7g+Hh7sx1d8/tblu6cTx3E05vWS5ziO48zAiY8fvXk4uPiK1ZXxN4/H1VcDeB0ChrLnOI5z2WEXdIZXIynlOsXKJKzbwdMLYeYZWl9zmM1PHrKuBZsp9XKdwjLmJazHPIyMeWSyBHpewNhD85pDD89I+pOHbA/mYWTMI5NJWFc7fibkOoVlzFtoM5rDlldjVRqeYfX7ZIrvdb5bsJmuHuXZVM2aYVgzfbKuHluZVWmRK2u55lJmzSVW38qQya2sQXbkuitivrVdSyiwDvPIZA0lHUbJbN0xq2ZYkKOwk6Nkj5JOg9E1Xz9TSnvo2O1DZv/41GA0GMf/4t7Pj/5XmTmOM43fXHEcx9lBxC88cPD47336z4xGow9F4HoAL5cdx3Gcywq7+NK8ddEtpVw3MM9gfenlOoFeFDPPkH25bmAeRpb4yUPWtdBmNAfFy3UKy5jXYF3mQTLNwfAKvc4JlmleczC8RTIzecj2YR5G1tVrWF3t+FsLwzWwjHkG62e8GqvS8BpWl2XMg2e9znkLNqd5zTUUZq1aSxhYXStDJtcyzTWwv5yQwxpiGfOYIWPkZqzcypDJ+2Y5xGxrq5ZI6JthDjmjZK7umFUzLMgbSnuM0vk59OjrpqS0h47dPpTsH4FqJcTBBfxqOI2/9aonRv93CEWTjvOSxP9ZMMdxnB1EuOvhs7uHSw9Vg10fXlwc/hQCfl92HMdxLhvsMop5Rte+k6fr5zT2mNkJWMdsZdvF1fBX09jnhXkYWVffBeucZJ7B+sx3he1j/XNgqtx5mP+MDfMW9BNi+D5Ye1mZRt+va/Y81ueAUfc7H0rX50HPme2gz+cpxZpl2SzPKWbVrVqiEGtOfSJBLt9u5vX8s+xT8nlqKOl12W8ebPfzleyfdAa7Y4gxvHu8a+Hr8Tc/0vmlyXFeSvgXiOM4zg7l9C/dcWhcvfCq1dHG9yHGt1QV7gkBy7LnOI6zbbCLMMOrkZRy3cA8g/U1rzlsw5uK1rqBeZBMuKi4LFafZdLLdUNXr8G6XT2MjHmFXueFlpW6BivTEP2ouAldPYyMeQ2rW2etihRyncIy5nPIOblOKT3+FCuTWF2WMQ89o+c69H4Wa0bLNNdQkKkVVRKsrpXByDWvuRT2388cbIh5GBnzDblckutbuZUhk/fNcojZqWVuXyu3MswhZ5TM1R2zaoYFOQo7JeT2yeUNmZ75uikp7Zb2ulKyL+nElRAHF+Pvj07ir528a/xv3vmbGMmO4zh+c8VxHGdHE2McAAgnf2nPe9bWNn4wxvg6BNwoe47jONsCudhSPbsAbwniYHgG60sv1zXmxbGVaWj9UgfDYzqLYl2MNqO5Bi0rdQ1WlmL1WMY8SKY5A/Xc0BwMDyWT6xQrY9Qzk1FrD5bNy2tY3SRr1VqCOPTwOeScXKewN8RVaXgG6zMPIyNePdcbrIxhzchMrlNYpvgppeQmrM88embMYyuzKirWgJZpLsXKrYxhzfTN0DPXXBeSeXUrVSZoueYkuU4ut8jNste3BjOsmVcnR26PXJ5idM3XS8l2dUsp2bOgE08FYGXw9++7/30/FB56aCxzx3H85orjOM5VwZmfO3j44vL4hoD1d1fj8ffGiHsQsSB7juM4c8G62GJZ7VtxSxAHw2tYXZnJdY15kWxlEq2rOfTwUD63VleD9bt4zcHwyGQS1tW85mB4ZLKE3ucEy6SX6xQr00j6k4dsj64eJNOchdXfzuNn3oLNaL52WqTLGiuTWN0+meLp+c68hTXDMuZhZMJPLdkMI9dnOfMgmeZScm9ia1gDLOvqG3K5Rm6G5cynsA7zyGQ5kll1G1UmsJx5ZDIU5Dly83Vu1sywJtfJ5TlK50t6Roe+VmpsV7eUkj1LOg3rQHUOT+AUfgT7xr98/yNYlxXHeanjN1ccx3GuIqo/eO3e0088+vq1tfG3V+PqyyNwH4C9suc4jjMT1kUXy9ibQ5osdRasr3nNsYtlzeXQZjSHjl64yVLrMqwuyzSvOfTwEqvHsq4emSxBPScaWNbFaw6GZ4h+VNwUWqa5BpYxr2F1k2yqps1oDoZHJmPIGblOqbNWpSUSrEyD9bt68Iye78znYHPSy3WKlWE6b1VbwsDq9s2g5HKdUmdWhWINaZnmGvpmDGvGypDJrQwk11wpymxLtUQCy5hPyXVyOSM3V+dmzQxrcp1cnqPLfK6by2G8VqaUdBq6dEsp2bOkI4lAPBMQzw5+Bm+4+8/d/9AjfnPFcQR+c8VxHOcq5Omf3v/K5QPVbWurq38LEdfFgLtkx3EcpzfWxRfLtJsrLUEcDM9gfenluoZeKDNvoc2UOpT5yUPWtWAzmi91DVqmOQbrMg8jYx6ZLEE9LzTXwDLNaw6Gt0hmJg/ZPszDyLp6htbXjp0K4hpYxryFnJHrFO31roEFzGtYXZYxDz1Tz/UGK9Ow+izr6tHOJktrRiPXZznzIJnmUuo8V5siV9ZyzTX0zRi5GZYz39A3Z74EMdvaqiUELGcemQwFeY7cfJ3TGg0S5tWxKJkv6cDuma+TKfPudaFkz5KOJJ1ZB+JZnKpeCH9j3/Lop172BFaT1HFe8gykcBzHcXY+t37o/KNHj+36naWl5b8wXF74sRDwJUSsyZ7jOM7ciMbFmfVGY0pRqQC2D/OXm51yHDCOhXmJ1bOyWWF/BYw9p+VZJih+E+VK0+U4rS7LmO9Ch8+7ibUHy5hndD1W1rX2YV7D6lpZB8xz3cq6wvZivhDrUz0zbGPmGbl+/d/NXK0T2maaK6HPnDWT+2DZaz4yc4zc81kos62tWkKg5cq+nZh11ppPclqjQcK8Oozcx4HCDuxejJnXyZR590oxjn9CSUeizSwBWA5Hwh68D3feIULHcaz/hDmO4zhXAdWTb9195lN/8MDaxvi7qlh9ZRVxp/9TYY7j9EZeUDUU+FZFCrluYJ7B+prXHMhFs+ZyaDOlroFl8nPLehbajOYaZCbXKSxjXsJ6zMPIunoF9ZxAZg+WSS/XKVYmUbqReGCOHplMwrrCTy3ljFynsIx5C21Gc9jyaqxKwzNYv6sHz3qd6xZsTvOag+HRzqaW1pyG1Z9nprmGOrMqKrkBmct1ipWhIJfk+lZuZcjkLGO+BDE7tSzZl3WYRyZrKOkwrNk6oxUaJMyrY1E6n+sZOX1t1Niubgm5/XK5Rm5mBIzPxrXq+OC/Gx4e/R3/3SuOs4X/5IrjOM5VzuD231458q2r/2GA3X9n94Hd/1kM4T8BOC17juM420nummwn0eni2ULbR3Mw/koT6yeeVbKwQXYsXWB7bydX4jkZ0Tge5jW6dDH9Zzc5BLYH8xbs3OizV4apLbdh/95kjiUTz8a2bl6fM+w5mLeYnIQKzDPYuSfouu0U1vA8M8011JlVUbEGtD8Hue7CLLMS7dhSclkul+RmcojZTlux52a+lFnmZ5ndSZR8DCUfay4voeR5Grp050Gf5yudWQAGuwbLw334uo2LyzfL2HFeyvjNFcdxnGuEGz5w7rHx+vLvhcXh3xouDv+XAPyx7DiO48yV+mKsdU1WeqGGDr0c2j6au1LMeiyzzqewvaSX6wbLs0xS2iuB7cW8wlzfcJbMY4+GLnuxN6vZHl3+/CzYHsxrWF2WMW/RZ0Zifd6Y17C6Vna1kPs8sSyhoNIPa+O+mUbXfkPXuVw/l3el7365OfYahoLZGWmdki1RSG6m7745SvatO7RKg4R5dRglsyWdDMX/DFhJB/M5JpV57ttlr7obliKwt3rLcG38rU+85uBhWXOclyrWf64cx3Gcq5TqD16794UvPvre0froW0KID4zHuD0ELMie4zjOFOwiK+NbcUsQB8MzWF96uU6gF9DMa2hdzaGHh/K5tboaVl/LSh16eIbW1xx6eGSyBHo+wNiji9ccDG+RzESxnoJ5GFlXr2F15bGrC8PB8MhkDDkj1yl11qq0RIKVSawuyzr6Xue6hTUjM7lOYZnwU0s2w7D6fTLNay6l9PeTSawhLdNcQ9+MYc1YGTK5lYHkmitFzLa2aomEvhkyuZXlyM0muVpVZUIuR2HHonS+pEc65muipKRb0ulDbt9cnjJrdzVg4wX8u+Hq8M/d//TaYzJ2nJcifnPFcRznGubkJ/fdO17d+LK10ejPhYi3ydxxHGcK7SJKcw3sjSJNag6G17C6MpPrGnohzTxD62sOhgfJEjd5qPUYVpdlmtccengN1p2XRyZLoOcEjD00X+oarEwj6U8esj26ehgZ8xpWt85alZYgDoZHJtPQ+prDpmcRDzKZhHWZh5Epnp7nzFtYMyxjHkaW+FalJQys7jwzzTXUmVVRsQZY1tU35HINa4ZlzDdYed8sRzLb2qYlBFquuZRcjsKOpGSm7phVMyzIUdhhlMzOoUNfF1NKOg1duiXk9svlKfPqVkB1Pq6EZwd/NR5e+tj9j1x6XlYc56WG/7NgjuM41zDXvefCn1z/be/9J7sHyz80GA7+DgI+KzuO4ziAcSHF/ioO62teczA8gx3LrHQ9Dg22B/PIZCmlvQb2eeq6jwbbg3kN1mWeYfWtLIG+sRKNPZjvQtc9uvYZXc8N5jWsLss0rzkYHplMQ+trziJ3jrBMg3WZRyYT0PP8cmB9LnIZw8rmhfUcVmbQecwaYFlX35DLJdafHTKZRZ+53LFYiNlO2/R93txM331LsP4ZMBQ8dy5HYYdRMlvSgd0p+mfASp8HHbsl5PbL5SlduuDdZps4AMKesHtjL75l5fx4r+w5zksRv7niOI5zjRPCQ+Prjr35Mzcfu/lvLS0t/L1BCB8DcDxGjGXXcRynBbnIgh1tUVQqhO3FvCB7IV3KPPZheySeVbJ0HdT6mrtSdD2Wrv2rFfZxWp5l20mX5+zSbegzI7H2YBm7UdUVtr+FNWNl88DaX8tm/Dy1TlvtOSysvpV1oXWQCXXG4rnS90n6zjGs/azMwvocz4nW9n2fs8/MrJQc63bnKOwwZpmVkL2KbqqAz7co+bx3IbdfLk/p0m1Q+uo2A2DxUPXWXRvjb3zutXuvl7HjvNSY8Vsdx3Ec52oixhhe/KX9r1qr1t9XbYy/E8D9suM4zkuU1pVTjeZrp0UtKdcNzFtoM6UOxgU18wzZl+sG5lGWTSpWV8K6zEPJ5DqFZcxLrB7L5uUVOp8TzEPJ5LqBeYboR8VNwbKuHplMwrq1V2Mp5TqFZcwzWF/zXY49xcokVpdlzKOd0XMc7W4RbKarR1nWqrSEgdVlGfMNWq65BvZx5LAGtExzDX0zRm6G5cwjk4HkmitFmW2plkhgGfPIZCjILazZOrMqdliT6+Ryi5LZGTrm66CkpFvS6QPbl3mNLt0GZUZRmzTn0wjAs/ijhY2Fb37Vk2tfkjXHeSnhP7niOI7zEiKEEK/71gt/Mh5f/+PDpYX/cmFh8ONVxDOy5zjOSwx2BcU8++s5rD8PtnPvnYT8OOV63sxj/9I9rB7LmGd07WuwPZiHksl1A/MWyddbdjxbEFh9Kysl2aP1slG6fzS6zDO0vrW/HbXJ7NWCda19mEcmk3Tp9oU9R+7js7LtpnWiJmjPrzlBQWUaa8DKutJnL2vG+rObhe3YM6F12C1RQJ+ZlCs1i4L53MeWyy1KZks6sDvB+rpuKH2e7cB6buYl1h4MZUZRm4hgMADC0fjKai1+x5Ov2H1LWnWclxp+c8VxHOclyO0feHrlpsX7/6/di7t/dtfy8O8G4JEYcSIClew6juO0KP0nTliJ+W2E/q1F5rcLetVq+MuJdQxWdrmZw7HQc2I7KXmDR1J6nFbPyjS69K1zOmGqovU1Z9G13xVrfysrpc8e1oySzfUct/6cmWcUfh103XaCdayYIetCfQzz2o5ifaxWNm9yz2PlVsboM4M5fE76zveZyZE7ljo3azS4yjA+juw/BWZ+ggRduiXMe79SlOdV1CYkiAMAe8Ou0b7xgxvjOJS547yUKPy2xnEcx7lWifHDi8c/+vMPjIer76rG1Z9BxCtlx3GcaxzlogkgvnatqCWIg+EZVl9mcl1DL6yZZ8i+XDd09ZjOolgXo81oDsRrDoZHJkthve32CvR8gLFPF685GJ4h+lFxE7p6GBnzGla3zlqVliAOhkcm09D6mmvQ3hxviQQrk1hdljGPdtbrHLewZmQm1ymF2VTNmmGwGeZhZF09tjKr0sIqs4x5zJAx2AzzyGTI5CxjvhT2Z9MSCrIj1xpWx8py5GbZx9lAg5pZ8xy5+VwOu2O+BqaU9Eo6XSjZr6SDDj3wrqpV2WZ8Ma4NHl/468PDw5+/93Mrz8rccV4K+M0Vx3EcBwDwzE/ctCceOflgAF5TjavvQsQNsuM4zjUIu3jKeDWWUq4bmNewujKT6wR6kc28htbVHGbzk4esy2D9Ll5z6OE1tK7mGljGPDJZAj0fQPbQHIjXHAxvkcxEsW7BMuZBMs1ZaH3hppYF/QldvYU2ozlseTVWpeEZrN/VQ8/oOc58DmtOZnKdwjLhp5ZshmH1+2Sa11xDnVkVChvSvOYarAwFeUqua+V9Myi5XHdFzLe2a4kEljGPTNZQ0pHkZpKcVmlQM2tuUTI7hw59DUzJdXJ5V0r2K+mgQw92txW1RJ74FB5Gtfit939x9UmZOc5LAf9nwRzHcRwAwC0/8Nylm19x7y8shOVfWlgc/EMEfBHAquw5juOo112qVCjtXQ52yrFox6G57YY9Z1ev0aVrYe1jZQn0DZdYvsdlITmW3odlDVpZKV330Pqag+HnRZ/9+8xosH2Yt1Bm6DneB+vrwspmYKYt2bB1rLnscjDPY7D61vN0JbeXlVmwfWf5q8Fiv6kle74cfWZSZp3XqPekHxINEnL5TsA4xuw/A4bCz8PlpvSYSnuwu62oJQqoP9fxUHzd8GL1zc+9du/1suI4LwVm+c+T4ziOc40SP33fvuc/+6V3jkYb34kY3wnAv1FynGsR6yKKZaX/TI7mYHgG62teczAusplnaP1ShzI/eci6FmxG87O4BiuTsO52e4Ve5wPLpJfrBuYtkpko1i1Y1tUjk0lYt/ZqLKVcNzCPTKah9TXXUPo612BlGqzf1UPPep3jDGtGZnKd0iGbLK0ZhjXDMuZBMs01aOdOCWyoq8cMmUauz3LmkclAcs2VImbVrVRpeBgZ8yklHUnJTN2hVRpksoaSDqNkNtcxcvq6JynplXS6YO1nZSmlPdjdVtQSBciZMTB+Bl9aHi591T2fX3lGpI5zzeM/ueI4juO0CPc/cuGm96/88713v+4HhoPBPw4D/HaIWJE9x3GuUeRFUwPzktJeDraP5jXX5WK7D9u5d1fYsTAvYb0r8Vex2LHsNEqPs7SXksxkx7OFbaLr88YeMxrbvUffN8dLYZt39dCzbX3NyzHj68VMp4g1bGVdsfaxMouuc1a/b6Zh9ef5OU3Zjj1r1ENWZYY+Mw2zzFrU+9LtaXCZKHnukg6h+HUv15v352le+5XuYTyfEZXDNgnA8HC8Ka7iwWce2HedjB3nWsdvrjiO4ziUI296+GxV7fv7ywsLfx2D8O9DwEnZcRzHKUa7ILtakMcu1/NkXnvPYx+2B/MarMs8g/WZV6BvwFieZZLS3uWCHY/lWSaxelaWYj1fV2/RZaZLt6HLTJduD+j5jZ7PzWbYn53mdjLs40Am06i7XUaAzICWaa6EvnNdyX3e+mTM55j1WKyc0WcmR99jacjNluxf0mGUzM3QMV/3GmY5/j6UPF9JZw7Qp6GBQq47ALA77Fofrv/wuQvjJRk7zrWO31xxHMdxTG79M6efOvZta/92edfiXx+Ghb8aBuHXI/CC7DmOc5XBLpKYr8nEVwZ2UMwjk20H7PkSH8W6GDbD/hY565fSZb5Ltw/bvf9OgX2czDO69ruy3ftfBjp9CJ3Kc+ZKPrcGO544Q7aTsI61JhO36TqQ67OceUbuY7UyC2uOZcx3pLVNSwi0/37mPi8Ws8xa1Ptu1/YzbVwyO0On6HerQJ9VKe3NCvl4VLp2xVIdpYFCl+4ACIfjzeOz4w/EDz+wKGPHuZbR/pPhOI7jOCpn/9nNR3cdXrnpxAvnf7Sq4msA3BKAPbLnOM5VALtYMrwaSSnXDcxbaDOlDh2OuQQ5I9cNM/go1kVYfZZJL9cNzCOTpVg9lmleczC8gvkmDMs0rzn08AzRj4qb0NXDyJjXYN3ET1W0vuYatExzOeSMXKfUWavSEglWJrG6LOvo6TnOvIU1o2Wag+ExnbVqLUGwevPMNNdQZ1ZFxRrQMs01sIx5C2umb4ZMrmWaK0GZa6mWSGAZ88hkKMg1SmbqjlpVZUIuR2FHo3SupEc69PUuZV6dUqy9rEwyQ5eO0kChSzdlLWD8XPythfXh99z37PqjMnacaxX/yRXHcRynmIPf+uyLy+88/ell7P5ri4d2fTgE/F6sMJY9x3FeIvS9+CqhdG+jZ0TdKN2otKcww6gO25D5LpTuwXoxk20Tgf21MvaczEu26eOZbDvDHi3YXsxrsG7ipypaX3PIfC6vVebw8Zp/g5t5C2tGyzRnIf6cW+dLl/3Y13Vfujx3Qucxa0Bmuc+JlXXF2svKLPocv+Z60un80rLcTI4+s7mZ+phmPTTKLBuXzJXsTzrm610DmZ2ipFNKbi8rS8ntkyK6dJQGCl26CmEYMTgQXz9C+Er/6RXnpcS8vxVxHMdxXiLE+ODSiY9/4uvG6/FrRlX1HgC3ANgne47j7FC0iyfNYcursZRy3cC8htWVmVzX0Atv5i3kjFw3MA+SJW7yUOsxrG6XTK4bunoJ6zEPI+vqBfR8gLFHqZfrFCvTSPpRrFuwbF5ew+rKY1cXhoPhkckYckauG2qvxprUXA42MydPz3HmLawZmcl1CsuEn1qyGYbV75NpXnPY8iw2YUOa11xD34zBZphvsPI+GfM5xFxrm5ZIYBnzyGQNJR1JbqbO1ZoqBblOLmfk5nI5eIe+xknm3bMo2WNenQbSbemWMOjSzRBWAqoX8e+wPvjP7n9y/RGZO861iP/kiuM4jtOLEB5av/5b1n9lA/t/bHFp+BNhgOabpzVRdRxnpzGvi6jSfUp7Ddv113+6Hgd6zkhK9yjtNbDPE9snGpmE9ZifB2zvrr4L89hjXlypY2HnUU+25cPoummPc12tq7Ij1rHMydM3HZm3sGasrCczbcmGc59zK5NoLiET67Ah5i8XfZ/fmrMyDevPZxb67NtnJqXvvDVT79l36+xgLt9uZn3ukvnL9THO+3nIfqpuCYI6PCMLEXFP9aaqGt4jI8e5Vpnzt9KO4zjOS5Xn/vnut4TV8VdsVOPvQoU3ytxxnB2CdRHFstLfXSLXDcwzWF96ua6hbzSCz1C0vuZAvOYw7ScPWZfB+qVerlNYxryG1tUcDA8jY16BnhOzerluYN4imZk8ZPswD5JpDobXsLrasbcWyjqFZcxbyBm5TqmzVqUlEqxMwrrMw8gU3/nctrBmtExzDSwTfrJkfQtrhmXMQ8nkWsL+22hhDWiZ5mD4hlwuYX3mG/rmzCOTMcRMa4uWSGAZ88hkDSUdiTVTZ7RCg4RcJ5czcnO5HLxDX+NS5tUpxdrLyiSlXaWnKCINuvZzNPtdCnF8Ej+zLy585OWPrz4hWo5zzeE/ueI4juPMhRtvuu/TS4du/ceLC8NfHITwL0LA07LjOM4OoOtfrWEXXtLL9byZx/5d99D6moPhtwv2fMxfbnbKccB4Y4b5nY513Fa2XVyJ55wz18CH0Kbra/08KfiExrKajjWcyxhWptG1j8yMlXVlnntZ5J4nl0usP7sOtLZoiQyzHkffeWvGylCYW51cbpGby+XgHfrf7yvJPI6py+db9LqMmsxlkxp5UAsxhH3xW9ar4d2JdZxrliv5LZfjOI5zDVI9+q7lC1/83ZddvHDuw6ON6kMAjkSgCn5D33F2BuxiKuNbcUsQB8NrWF2ZyXUNvRhnniH7cp3CsgIfxboI1u/iNdegZZrTsHosm5dX6Hw+MA8lk+sG5hmiHxU3YV4emUzCuolvVaSQ6wbmkck0tH7GteKWqGFew+r2yRTf+dzOweY0r7kGlvX5nGtYXZYxDyPLeBZT2IDmNddgZSjIU6yulSGTd800V4KYU7dRpeFhZMynlHQkuRnrp6RokJDr5HJGbi6Xw+7Q17iGXI7CTgm5fXI5CjsNomuOmqGgSzeHsVe8EKrBRfzS3ouLP3THUyvPytxxriX8jS7HcRxnrgxe+WtrB9714mex/8h/gzj87jAIPxOAF2XPcZwdhHFxhHy8CSsx35XCfeiFOPOMrv0ubOfepbBjiEa2XbDn6+oV6PnAsPpWllLaI8TJ/5sT7K/TzeM52B5dziPW67JHg9bX3E6lw7F2PrdzsP00rzlk/syYRya7EhR8HCymdB7ogXXc8yT3PF0zzc2D3HFq9Jlp6DNbMmPlVoY57G+RmyvJSSfGzGucMTuhpDMP5v08Xfbbrm6Ogr3CUhxUi/GrhstLN8QHHxzK3HGuJfzmiuM4jrMt3PSNxy8u3XT3b+47eOMPD0L4lQA8hui/7N5xrijsQqjrm6/MS0p7fdjOvTWs52MZ8wlx8v/mANuH+cvNTjkO9DgWra+5PsxjH7ZHNLJSCvcwK4V7TMFel+ZIn8O6Imz3QW73/gkzfc6t4VzGsDJC5xFrQMs012BlXbH2sjILa87K+pDsZ/3xq3Qq93mCOVA/J31qVSaU5LkOo+9cAeZNlSuB9XliXmLt0UA6qlYloUs3R5e9loCwHI5eWFr90MMP/+t9Mnaca4nL8C2r4ziO81Ln0m8evu3U8ZWvQBx9RxzHtyPgkOw4jnMZYBdEhlcjKeU6xcokrCu9XCfQi3LmNbSu5mB4GFntp2LW1WDdLl5zIF5zFlpfcw0s07zmDNTzQXMNLJNerlOsTCPpTx6yPbbba1jdOmtVpJDrFJYxz9D6mmvQXt9aIsHKNLS+5hpYpnj1vG6wMgab0bzmGgqyVqUlMrA+8zAyzWuugX0MOawBmcl1St9Mw+r3zZDJZSbXXVBmp5SST6Hlmmvom1nk5uqc1miQyRpKOpKSmVzHyM3XtoZcJ5eXktsnl6Ow0yC66qgqCV26OfrsFQGMgOoUnti/55Yvv+PhJ54PIfTZyXF2PH5zxXEcx7lsnPgXB960fmHl+8exen2IuBfAAdlxHGcbYZc0mq+dFrWkXDcwz2B96eU6Qb0w15yF1tccDA+SCRcVl4X1S71cN3T1Gqy73V5BPReQ2UPLSl2DlUmS7uQhm+/qMUOWYvXqbKqi9TXXoGWayyFn5DpFO25VJFiZhHWZh5Epvte5zbBmZCbXKSwTfmrJZhhWn2Vz9ixWscosYx5GxryFNdMnY75ByzVXSjLb2qYlEljGPDIZCnINa6bOrIodZnIry5Gb7ZnT17SUXCeXd4Xtx3xKSadBdM1RM6wp6ZTSZy/58ZwLG4trg79+fs/Rv/emh5+7NJ06zrWB31xxHMdxLiunfuHQHdXC2ptXVtf/MiK+XOaO42wT7AIp41txSxAHwzNYX3q5rqEX58wztH6pa2BZ4qNYF6PNaA7Eaw49vAbrbrdX6Hw+lHq5TrEyjaQ/ecj22G6vwbrCTy3ljFw3MI9MxpAzcp1SZ61KS9Qwr2F1WcY89Kzzuc2w+lqmuQaWJb5VaQkD1mUePTLNNWg/6VQCG9K85hr6ZhpW/3JlmitBmZtSSj6FzOVag3WYz5Gbq3O1psqEXI7CjqRkZoYOfU1LmVcnB9uDeY2SruiYI2aYUNrL0WcfNjMCqhfxZLg4fsP9T+OUjB3nWsB/54rjOI5zWTny/jNPHD34sl9bWl78kcHi8K8NAv5YdhzH2Rmw66QpWIl5BuszLyi6MC9B20dzFl37XZh171nnLbru3bXfgc5bswHmNbp0GWwP5ncAV/zQYseDsH6HgUZxMQPbh3m0M/OXPDM/L6z9rYzRZ0ZjXn9dlB1Pp5Mloe+chrWPlXXF2qtvptG1bzC1lbVvnz+PPjOz0vX1qQt9N87NlOxLOuZrWgOZnaKkk+Ny7UE66ksZ6aqU9uZN7hgXgOHuwZHFI7u/K95335KMHedawG+uOI7jOJed8M5HLlx/6K/8zs13vubHFwYL/zAA/1eMOBGj+a2Z4ziXC/aVyPzl5HIfwzY93zZt2x92QMxLrJ6VabA+84JoXegzz1Df7ZgTpcdi9VjG/HZifd5LmcceFtbeVlbKPPbYCXT5OKxukk3VrBkN1rfOF8uzTKN+DegyYsKeX3Pzhj33djHv5xN7TS37PE+fmYY+s7nPRy6zchTkfdiOPWt2zE2VEnLPMeNxtMZbwqBLN0eXvTp0q+Vq33ht9N6HVx/ZLTPHuRbYzssFx3Ecx8kS48eGT338w/ctji9+x2hU/SAiDsuO4zhzQLsA0hy2fCtuCeJgeA2rKzO5rqEX6cwzZF+uU1hW4CcPWVfD6mpZqUMPL7F6LOviNUeg5wKMfUq9XDcwb5HMRLFuwbJ5eYnVk8etLgyHHt5Cm9EctnwrbokEK5OwLvMwMsXTc5v5HNqc5jCbb1VawsDqsox5KJlcS67kPwfGfEMul7A+88hkyORaprlS6tnWFi0h0HLNNVhZQ0lHwmbYx5VihVaGgpyRm8vl4B36WpYyr04Oaw8rSynpKZ2WagmDLt0cXfbq0m2IQDg1ODPYWPrz97zu3b8QHnpoLCuOczXjN1ccx3GcHcGpXzh0xxou/Ok4xtePq/i1APbKjuM4PWEXQoZXI02WOgvW17zmQC7UNZdDzsh1A/MgmXBRcVlYv9TLdQPzyGQprDcvj0yWoJ4LyMxrWamD4S3qmcko26OrB8k0x7C6STZVkzNyncIy5i3kjFynzPraZmH1tUxzDUrW67xmWDMyk+uUwqxVawkDq8sy5qFkcp1SZ1alhVVmWVePTKaR67OcefTMmLcQM60tWiKBZcxjhoxRMsNem1AwP2vOyM1ZOcno61jKvDo5cnvk8oZcT8kVtQkNEko6pXTZq0u3IZmpVkIcvBh+Zbx36fte++mLx9Oa41zt+D8L5jiO4+wIjrz/zBM3rt38cxgs/cPhIPw8Ih4NESuy5zhOR/pcDGlo+2huOyHPV3SxXkLpPlbPymoKKuWwzZjvQukerMd8Hwr3oucC88hkKaW9HHEOe1nzVjZHLtPT2JQehPU5Z77LX0Nke8DIOuxPz+sriXVMfTMJ6/b580QmI/QY6ca2P0HmOfp+Li20Oet5OtDaoiUSWMY8Mtl2UH9e6NPSoOBzmssZublcvt1cjucueY7c5yGXp3TpzoMuz9el26DMDHbHEBfjqxZObRycThzn6qfDt3SO4ziOc3l46heP3BpGF9+DOP76GOOfBrAoO47jdEC7KNIcNr0aSSnXKVYmYV3Naw7GG4/Ma2hdzaGHx3Q2eWj1JazLPJRMrhs0rzkG63b1MDLmBZ3PBeZBslJnIfpRcRPm5ZHJJFpXO2510dE1WBlDzsh1SulrWwPzDK2vuQaWKZ6e19D7WbQZzcHwMLLat+KWyMD6zMPINK85GMefwxrQMs01sIx5C2uGZcwjk4HkmishmVO3UGUPjxkyi9xcnbdqLaFgdawsR27Wyo3MfB2DPTuhpJPD2sPKGko60Hst1RIGXboWpfuU9lKMmQCguhjHw+cX/mrYt/R/vOrRCydlx3GuVvzmiuM4jrNjufDPD73u3KUL/1OFeGuscK/MHccpRLvYybhWLIVcNzDPYH3Naw7kgl1zOeSMXDfM6KPisrB+F1/qYHgN1u3iNddgZQL1XICxh+Y1hx6eUfenxtge2+01WDfx2WPXHAyPTKah9TWHTa9GqqyxMgnrzsmr57XmclgzWqY5GB7TWavWEgZWt2umOeQ9i1WsMsuYh5Exz2B95husvGumuRLE3NQyt6eWay7Fyq2MYc3UGa3QoGbWXCM3k8vBO+prWMqseSnWPlaWkuspuaKIVCjt5Sjdp7SXUjITgTAC4gk8vH+w9L7bP7/yjKw4ztWK/7NgjuM4zo5l7027P797194fCIsLP4aAT8nccZw5U/+1m5JrpJ1C9oK9lFn3KZiPZbXZ0Z5Ec9sJez7mt/OvfLHnZF6DdZkvYPIhz7DHFPPaJ0PraebxZ9faNIPW15yF1bcyCesy35G5vcZ1pc/zWjNWJmHd2DPTyHQzcZsuXwfWseayywF7HuvYQDLN9aDTNp3KNdaMlWnkPk81aqVk1spL5rtSsqfRyb6G5fLLQckxGB/jBCVXFJGCkucrZV77SEqOMe0MAOyLr7q4Ut0fP/yA/8sUzjVDl28BHMdxHOeKEOPHhmc/+aEHLl7a+IvjcfzKEPAy2XEch8AuejTf5W93l7oc2kypg3HRzjxD9uW6YQY/eci6DNYv9XKdwjLmJaw3L49MltD5XOjiNddgZZKkG8V6CuZhZF09Q+sLN1lqXRCvORjeQpvRHLa8GqvS8BpWV8s016Bknc9rC2tGZnKdwrLET1VYn2H1WcY8lEyuG9jx57DKWqa5hr6ZxOpaGYyceZBMcyWIudY2LSGQuVxLrNzKGNZMndEKDTJZQ0lHUjKT6yg5fe1qyOUo7JTA9mE+paTTILqt0ZYglPZK6LJXabekxzorAfE8/tnRO45+903/6vhFGTvO1Yj/5IrjOI6z4wnh28cHn/2zv3/zm173l5Z2DX88Ak8DeFH2HMcRsAsb5oPyN2+0rub6ULpPaa8v271/yuV8robWH2oNOxbmJaW9HGyfaGSC7Js4s2DtbWWzwP7MtpPCz7dZKdxjR8COk3kNq2tlGkp/ruc126vLn5nVZb4r1j5WpmEdr8a8f3pT20hzJfSd64L1+WKe0bVPaG3TEgnW8TOsvpUx+sw0zDKLnvO5mdznNJdbXI7/zs1yfF0Qz9N62pYwKO3l6PqcXboWmb3iQsRgKb5+9TPnXyEzx7la8ZsrjuM4zlVB+IGf3Ah3PXx2Y9e+X1zctfgjA4R/JTuO4xTCLmi1n1xh3VlpPVF36BuPzG8X7PmY78JO2UODnRvs+ZhnsP3nATsW5jW6dAXZUVaYl7+a0T4mzWHTRy1uiRrmNawuy5hXoK9v6LZPL2bcf2p8xr0msH3UP2ADq6v9N/ByYX0czDOsvpX1wTruPsx7L2s/K5s39bHkDkmlZCiXa+RmeuYxZl6/UPAx5fJZKdm/R0cdaQmCOtyDLvvMs5vLa8IiEBFuv7C4/u74IIYyd5yrke28ZHEcx3GcbSHGB4cnPvHrr90YrbxrvDH+tgA8IDuO4xgXOYZXIynlmrkcbEZ6ua5RL941l0POyHXDDH7ykHUttBnNgfhS12BlKay33V5BPRdg7FHq5TrFyjSS/uShtofmYHgYGfMaVrfOpipaX3Po4S3kjFw3aMfcoMoaK0uxeizr4Duf0xbWjMzkOqUga1VawsDqsox5KJlcp7Djt7DKLOvqkck0WJ95ZDIYueY1Vwr7c2gJgZZrrqFvZmHNsY8LTCZYuZXlsGatrEHp0NethlnzUtg+zKfM0FG1KhNyeSld9plnN5crxLWAcCn+8X0Lt351+MMnzsjcca42/CdXHMdxnKuOEB4aH3vf//ZHw8VD/3iwsPBTg0H45zEiImIsu47jCNhFEPPbBXs+6eW6JnsBX8q89tkO4hyOj82zv2LF+qXMOt8wj33msQdjHnvPYw/MaR9rDytLYT3m+9Blrz7nuJWlWD2WdfBze32Dvv8EK5OwbsxkpVhdK2P0mOkxUk6fz5M1w+jaR2bGOgbm+2A9Tw5tTnPbifV8fX9iBX2HMvQ+mBoyP5fXLfa63QV2HMzPAfVTokpBLi+ldJ+SY2rIdXO5RjOzFBHj4M7Prj3/7bLiOFcj83jpchzHcZwrygsP7fqq0Xj0Z8eIX42Ie2TuOC9J2AVPxrfilujgLLR+qYNxEc88Q/bluoF5kEy4qLgsrM88lEyuG7p6idXTMs2hh1fodS5o2SwuRzIzecj22W6vwbracbcWhoPhkck0ZF+uU0p/Eq+BeQ3WZR5Gpvhe5zSDzWhecw0sS3yr0hIGrMs8jKynZ7GKVdYyzTWwjHmG1Z931tXnSOZaW7SEQMs1B8M35HJJSb/ra1EK6zCfIzeXy6F36GtWQy5HYSeHtYeVoSBHu6OOqJLQpcso2aOk05Dr5nKNZKZ5GNdC3LWCn3rFZ0bft5U6ztWJ/+SK4ziOc9Vz7NThh2/ac+w/X1ga/qOqwu8iwn+82HF60LpeagniujKPPXYKBR9LnPy/bab0OViP+S7MY48O9Hq60qHS3uWAHQvzc6b1NLP+Fb2obZpB9uU6hWXMXyl22vEw+hxnn5nthB1P7VmsYpWtTKNrn2Htsx2ZRtd+QzLXaYuoDGiulL5zjPpYem07y8exXZBjyt5YKWHWPcixAZkMBXlDSaeU0ue0mMceXejzfMmMHA/LMWyshz/92Jcd9H/e27nq8ZsrjuM4zlVP+IHnLoX3Pndp955d/2j/ruU/N1gI/wzAedlzHIfQ9WLpCkMv5JnfLgqer6CiwwaZ1+jSnQfs+ZifB1337tqfB9pzag6G70qXfVjX8jKT6wbm58GsN3hSuhwn6zKPTCaY2+ub9ufUoHnNWXTdn9F3H5ZpXnMJmXg25v3xXS6s57eyrlh7WZ+7PsxzL8y4X9/Zvp+T3FwuJ9DXq4aSfXP5LMxrb7GP+mGpUlDSydFlj+3q5kj2sraN++KhjTOr3ym941xtzPNbUsdxHMfZEZz75L57V1fX3rYxqr43Aq+OEQdlx3GuaehVjBQ1yQWQ5rMOhtdgXenluoZezDPPkH25bujqoXxOra7E6rJM85pDDy9hve32AnoewNiji9ccDM+o+5MxNs88jEzzmrNg/cRPVWRfrlNYxryFnJHrButvimuB5ixYv6tHO+t1TluwGenlOqUga1VawoB1mUePLOO0mGKVtUxzDX0zidW9HJlcd8H6c2iJBC3TXArLmbewZuqMVmiQyRpKOhJrxspg5+ZrFuxZMyvF2sPKUJCj3VFHVEno0pV0mZ1nN5enJN3sWF0YHl/4nUN7D33NTX90/KKsOM7Vgv/kiuM4jnPNceA9F/4krB/41b17ln8UIfx2BM7FmP8ez3FeyhR9gbAS812Qe8j1vNnO/bdzb415PN889tgpzONjYXswPw+6/rW3eRxLwR4Fle0ldjgIq2dlpcxjj4Z57qXB9tc8O/e0boOV7STYcdYfM4s7o22kOWTOaSvrirUPy3LPb2VdmPfzWP3cc10uZj2OPvO5GSsziDFzYyX3vPOA7V/y3LkchZ1SSo5pHnR5nlw3l6ck3exYWqiAau/4vjPnz70rPoBF0XScqwa/ueI4juNckxz74IvPHnrvpV9fXFr6qwvDwT9AwOOy4zjXJOYVjQLrM79T2SnHqx2H5vpQuo91Zcv8dsGej/nt4kp9TuTect1wpY6PwZ6Teck8Px7tjf+ue2w37HiYV8i+UdkF1te89WfFYP0ue1ld5mFk2n5ynWL9hNPVxLw/CO3rrUF7Ls2VkDxP64/O2rNVnpGue+Wevz6v1Ir1uQUb2kZyz0c/kBmZx76zzudQ9m+pko+jpJOjdI+SDgr2y+UpSTc7phQiACxhXzXa+IbPvPy+3FeI4+xY/OR1HMdxrnnip+9bOv65L3zPxvr424D4VQB2yY7jXDOwK5uMb8VSyHWKlUlYV3q5bmBviKnSQOuXOpT5yUPWZWh9zTXITK5TWMa8hPW22wvoG9HMw8g0rzkYXkN0o+ImdPUwMuYlVi/JJg+1vuZgeGQyDa2vOWx6NVKl4TVYt6uHnvU6pxlsRvOag+ExnU3VrBmJ1WUZ8yCZ5rDlWaxilVnW1SOTSViXeWQyZHIt01wOMdPaoiUSZCbXkllzidWvM7WiygQrtzJGyYzVIRl9nWrI5SjsMKxZK2vIdZS8pVqCUNpjdJkv6c6rA72nqC2MMG4AgxV8bvTi4IOve27j92TuOFcD/pMrjuM4zjVPuP+R9Rvuee9PDZaW/moYhF+JASdlx3GuaYyLGuRjm5mGDbS/ArRdz4Vt3rsLO+U4unA1HDM7RuY1unQFM4zqsA2Zl1g9K7vcaMeiOYuu/XmhvYZdDub18bLjT/af11NtC5mDy8SzEY0nsDzLusL+7HKw52fHprlZYM/TYGUaVj/3XBoF/YLKNH2OY1Zyz0mymW+s5J53u7mczz3rc5XOz+tzWrqP0lPUNGYIhABU43DPwnL8Gpk5ztXCUArHcRzHuVZ414//peXHfu13xh/5qZ/a9fOP31H92K+uLz+xtv/ZA8v44h6s3TkI2DscxAU55zhXLZkLmGLmtc8saMcQdN0ZuYlcz5Pt3BvK/nLdwDwyWQrrdX0jj+3D/HbBno/57YI9H/PzoODPrPfTs0Hmu2DtYWUaXfsa1h4sE57VgFzYEW0vzcHwFl1mWJd5GBnzDPbTTX2Z62aFWM9pZfOk7/Mkc60trNelVpm47cJ6rjqjFRr0+Jhz9JlJIfPZGyuXA3YMzKf06LRGWkKhpJOjZI+SToPVtbIUpaeoabKFmgEQYsDC4uBz/91tB37rf3xudU1WHGenY72UO47jOM5VwQMffs+eh3/yk5e+/Hu/9Y7zK+u79+05NDp38dTdu3ctDtZXR1+LGGIYVONqXN0dEV91eNfo9pcfXLn43fd+9uiRXWvDI8trYTgo/Q7QcXYw7DQ2vBpJKdcNzDNYX/OKoxf3zDNkX65TtExzmPZRrIthM5ovdejhNVh3u72Cei5oDoaHksl1A/MM0Y+KmzAvj0yWwnqJb1WkkOuGrt5Czsh1A3stgz1TDOvOwavncoOVaVh9mcl1CssS36q0hAHrMg8j07zmsOVZrGKVWTYvz7D6LGMePTLNlSDmppa5PbVcczB8Qy6XWP0kU2uqrLEyFOQa1oyVNSgd8zUK+swUubwEtgfzDbkc7Y46okpBSceidH6evZIOpnvZkWxBYT0Ap8OZiPinXvOF0W/J2HF2On5zxXEcx9nx3Pfgg0uPPPTQ+p/6wR88fOLcub3/6Wd/9rn73v/Nb9u9a3ljNV768ljFRcR4aIBwYFyNbxlEvCFisBZCtYwYdiHghslmYfM7vgDg3qPncPehC/iOex7D0WX/SzLONQC7oNF87VpRSxAHwzNYX3q5TlAv8jVnIfty3TCDj2JdBOt38ZpDD6/BuprXXAPLmBeo5wCM+S5ecw1WJkm6UaynYB5G1tVraF3hppYF/QldvYWckesGdnNFlYbXsLosYx7trPP5zLD6Wqa5Bi2Tx00XGawuy5gHyTSHTc8iijUgM7lOYRnzFtZMn4x5kExzOcRMa4uWqOnqMUPGsGbqrFVpCQXWYT5Hbs7KSUZfn1KsjpWVwvZgPqVjR62rUlDSYXSZLenOq9NQd4tGiko64VwY7RoO/qu7/nD9x2TmODsdv7niOI7jXHEe+PCHFx/+yZ/ceM9PfGTPU7/1B0t/+NOfOHP/d/zp146GCycG6/EdVagWEcYHQhgeqmJ8RRyPvwIIawHj6xEGz8cq3h0QlxARgYjBYDBs/gs39R+6+sZK6o/t3sBX3/oc3nLjSbzy0BnsXhhPOo5zVcEuaDJejaWU6wbmNayuzOS6hl7kM6+hdUtdA8vk55T1GKzfxZc6GF6DdZmHkWlecwr0HICxR6mX6wbmLZKZKNYttExz6OE1WFces7owXIOWac5C62sOW16NVWl4DaurZZoD9+o5rbkc1ozM5DqFZYmfqrA+Q+trrqFrpjlseRZT2IDmNdfQN5OwLvOYIYOSy3UpYm6yzO2n5ZprsDIU5Cm5rnWzjgY1Vm5lFmyO+RTSUV+fGqysoaTDYLPMp/TotEZaQqGkk6Nkj5JOg9W1MkndLRopKmWoADw7/Ff7D+7+wB1/fPa0jB1nJ+M3VxzHcZxt560//MO7f/vHfmzl/f/zD+/+/B998YY4vnRiZbz06oXdB49XF1a+MgxGC9XGwj4Mq72oRreMI945QHg+hmrzJ06qcAditScEVAAQQlhuvosLyk2UyeOg/IcuxJbbu1jhlUfO4Vvvehyvu+5FLA0r0XCcqwB2YWN4NZJSrhuYt9BmCh29wGeeIfty3cA8SJa4yUOtZ8H6pV6uG7p6Ddbdbq/Q6VzQHBQv1ylWxqhnJqNsj+32Gqyb+KmK7Mt1CsuYZ2h9zUH5XAuvYmUprMc8jEzxnc7lHGxG85qD4dHz8yyxuixjHkom1yns+C1YuYvXXIOVMdgM8zAy5kEyzZWQzLW2aIkELdNcCsuZt7Bm6kytqDLByq2MkZuxcpLR16YUq2NlpWh7aC4ll6PdaY20BKG0Z5HbI5enWF0rk9TdopGiUhmxAnAWJ5ZOD99+z/PrfyJzx9nJyPeXHMdxHKeYt3/k7Qu/+aO/OfpY/Njw28O3j9/+kQ/tOvHFS9fvHq1cuhAHdw4Xl1+oVquviBjvHsfBMoajY3EUb46o3hgwOBHj+JYBBqMqxttjVR0MwzACgICwZ/N/MfmurbmJsuWBoPwkytRjeXNF6W91I27Zt4q333ocD1x/Eq86fAaDpO84OxrrVGWZdnOlJYiD4RmsL71c15gX+lYmkV25bmAeJEtcFOtitBnNQfFy3cA8MpmEdbt4zTVYWQI9D+bhNQfDM5L+5KG2h+ZgeJBMcxZaX7jLctwWWl9z2PRqpEnNWbB+V492Rs9ltLtFaDOaQw+PrWyqYvU1WL+rB8k0V2N+vhlsRvOag+GRyTSsfp+MeSiZXJci5qaWuT1lLtcSK7cyjVy/y+tOg5U1lHQk1oyVQc+zXyu5HIUdhjVrZSjI0e6oI6pMyOU5SudLelbHyiR1t2ikqNSRCsBq2BieH/69e7+w9sMydpydjN9ccRzHcSiv/a7v2vtHP/uzF+/+nvcfe+ynfuHEl/3Q993w7JMv7js4Hl9YWwz3HL3jrk+/8NxTb1+sxntWx9UdgxAOIMY1jMffGEO4hFgdRAgxArcjxgODEJYj4qUQsRxCGG4+i/hJkqmbKFvfuak/oaLcLJk8ljdWsHVzRes2x3HzvlXcd/QcvufVn8NiqLBvcSNpO84ORrvQ0RyMCygp5DrFyiSsq3nNwbjYZ54h+3Ld0NNPYtZjsH6pl+sULdOchtVjGfMgmeYI6nmguQaWSS/XDcwzRD8qbsJ2e4nVS7KpmjajORgemUyidTWHLd+KWyLByiSsyzxIpjj1XG6wMg3Wl16uU1gm/NSSzWiwblcPkmmugb0RbsEGNK+5hr6ZhHWZx5wzzZWQzLW2aImarh4zZBpWv85ohQYzZIzcjJUbmfnaBHvWzEpg88w35HK0O+qIKhNyeY4u87luLke/jjlihrMT1wIGK/jnywtHv//uPzr+gswdZ6fSet/JcRzHeenwmh/84OE3Xv+KlX/32c/e+MRHP/r4HR/84Ovj+oX15cGuxbX19dcs7xp+fmVl9M2LC4PzozjeBQxuGlbx/Liq3hMGeC4i3hxCCDHiJlTVchiEYUS8FCosh0EYyhsc+uP8zRXtp1aAqPqJ6nlzBQD2Lo5x18ELePPNJ/FNtz+FPQujZMJxdijaBY/msOVbcUt0cBZWX2ZyXaNe7Gsuh5yRa+YaWJb4KNZZWJd5KJlcN3T1EqvHsnl5gXoOwJjv4ktdjmRm8pDts91eg3W1424tOroGK9OQfblOqbNWpSVqmGdofc3B8Ghn9FxGu5vF6stMrlNYlvhWpSUMWJd5GJn0cp1SZ1alhVWWmVynsIx5C2uGZczDyLp6i2SmNd4SCTKTa4mVWxnDmqkztaLKGitDQa7BZphPUTrm6xL0mRYlHYY1a2XonrfqLaFQ0slRskdJB5melUnqrjlihnOg2X8ELFwanFveffAdL/vUyd8XLcfZsbTed3Icx3GuPmKMIdQ/xvH2v/AX9v3m3//7F449+OC+gzfeuBGee+66lfH48FP/7J89ctv73/+BcYxPLlTV3WMMju5eDl+4tDL+NgxDNRhXRyMG64NQVeOIrw2xWsMgABFjBBwOMS6GEBarGFcGwDICBmjd+Nj8zmhyo0P8V6Z1UwMAyM2Vzf+p95t6joatmyvqvjPcXGn+9+WHLuEtN7yA1x07hVcdOYOlgf8uFmcHo134aA6bXo2klOsG5hmsL71c19ALfuYZWr/UwfDYyiYVqyth3S6+1MHwGqzLPIxM85ojdD4PSr1cNzDPEP3Jku2jec3B8MhkKVavzqYqWl9z6OEt5IxcN7DXMdgzRVg9lnXwnc9lC2tGZnKdwrLat+KWyKD1NdfAsp6exSpWWWZyncIy5jWsbp+MeRgZ8xZiZmpp7adlmmvomzGsGes1B8Ys88hkFrk5KycZfV0Cn5mQy3OweeYbcjn0Tku1hEJJh1EyW9JBpmdlkrpbNFJU6oGyb7gURnsGw7//+Kkb/8o7n3hiVeaOsxNpve/kOI7jXHke+PCHFx/+yZ/caG6a3PGhD+0aPnNp+fDXPYCnf//3Dx//6Ecfv+sDH7gt7Ll+Na6evHt1PD5chXB+vLLxzoWFwYlqNL6tCoP9oYrPIsb3DEI4PYrVvYMQNwLCmQrhvoBqFTEeQsD5QYwHI0IIIQyAaiOEwSLETY/pGyVb3wlN3+DY9JObFOK/Mq2bGgCmnicpTO3X8vyfBJusO95cmfonyCaPIvYtjvFVt57A2246jjdefxIVAgbad4KOcyVhp6Tm2ZsDUsp1A/MW2kypg3HBzzxD9uW6YQY/eci6Gqxb6uW6gXlkshStp7kGlnX1Cp3OA801yEyuG5hnJP0o1i1YNi8vsXryuNWFsk5hGfMMrW84LdKl4TVYl3mQTHPoeC5bsH4Xr7mGJJuqWTMSq8uyLl5zDey/dxZsYF4emUxidVnGPHpkmishmWtt0RI1XT1myDSsfp2pFVUmWLmVMawZKwPP6WsS+MwUJR2GNds3g563VEsolHQYXWZzXSu3MkndLRopKvXA2nctYPHiwr/F4T3ffc9vn3pGxo6zE2m97+Q4juPMTvqTJM2Nkia753u/d//JkyfxF3/4DSv/xz98/FbswvNhY+OGxfWF0en19eurjdF1+/ctnbi0Mn7NcBBWNqp45yCOFzEM56qqendAPIUq3hgGWB8DN4cYbw8Bz0bghhCxgYA9iHFXABYBDDZ/wDbGEAZL6U2M9OZFrTb/d1LK31xp3/Soff3/5H9kWjc1yE+tbD5Mjq3208cz/V3Z5PiTxfTeyseaCPlTN5tsHt/yMOJlhy/gPXc+jZcfOofb912YajnOFcW6QGGZ9oaTFHKdYmUS1pVerhPoRT/zGlpXc5jNR7EuQutrDsRrDj28hPWYh5F19YLO50AXrzkYnlH3J2PWPMu6eM0xWFf4qaWckeuGrt5Czsh1g/xcp6jS8BqsOwff+Vy2YDPSy3UKy4SfWrIZDdZlHkamec1hy7NYxSrLTK5TWMa8hTXTJ2MeSibXJYiZ1hYtkaBlmoPhG3K5xOrXGa3QYIZMo6TPOszDeE1qsHIrK4HNM5+S6yj5lFLyFiUdi5L5XCeXo3snW88WepLbt84Hlwbnb9x/3f1H/uNzT8qK4+xE5PtejuM4juC+Bx9ceuShh9ZTd/d3fueBz//sz56/61t/8NiZlfOrr3rNzfHxzz1782Bp7cTapaXbl5b3nFwdr90YN1YOD3fvvTQerdxVoTpTVYu3DmN1fQzxhRDHbw4BL1RxcDcQ9yNWsari3YNhOB0rXB9CvIiI6xHCEhBiQLUbiBvYfPFe3vwpk/QGgbhR0Wjt8eTmw+Z3MNM3LZpH23dzZfqYku+ypvZjz4HW80/vtyWmnp/91Eqd5Y5tebj5+Jte/ize+/InsG9hA3sW/XexODsAdqFieDWSUq4bmGewvvRyXUMv+plnaH3NgXjNYdpPHrIuQ+trDsRrDsRrjsG6XT1IpjlC5/Og1Mt1A/OMpD95yPbYbq/ButpxMyHXDZrXXA5tRnPY9GqkyhorS2G9rh7tjJ7HaHeLYDPSy3UKyxLfqrSEAetut8dmZsUtrLLM5Dqlb5Zi9eaddfUWYmZqae3Hsq4emYzBZhKvVlSZwHLmLawZK2uQfzY9ZqawslLYHswjk0HPW6olFEo6jJLZkk4D6zIvSXrmiBnOQG7f9PgqIK7E8dKl8LcvHBr/d296GJO/pOo4OxX5vpfjOM5VyUc+8pHBj/7oj05+IUb6kyMPxgeHD4WHxne/6y8tn166uHTyE//owj0f/ODRR3/+508efe/37t8XLh6tdof1ldW47+THP/roDd/2Ha+O68P91eLKixsrg9uGy3sujANux8ZqxGAQsIHDGIzH44j7FgaD06MYD6LCHQi4UI2rVyKEUYhxF4Dr4iCOQ4x7BkAEwjJivB4DnMY47guDwVIMuIgYl0IIi2HzwMcIESGEYfOxTN703yxMuanHBTdXJmvxkytT+00WyQ0HuUkzl/hmv63jIcc59Vj/yZWpXDz35Hlaz508bu2DXjdXpj4H9f8e3bWB2w9ewNfc/jy++pbn/J8Ic6487BTUvHVxJYVcM5eDzUgv1zX04p95huzLdcMMfvKQdTVYt9TLdUNXr8G6mtccDI9MJuh0HmgOxGsOhmck/SjWU3T1MDLmNbSucJOl1gXxmmuwMgnrGr4VtUQN8xpWl2XMo53R8xjtronV1TLNodxPlqyvYXVZxjxIpjlseRarsHJXDyNjnsH6zMPImIeSyXUXktnWNi1Ro3nNNVgZCvKUXFd7rWmgQSZDQS7J9a2cZObrEfgckMlKYPPMp+Q6Sa5WVZmQy3OUzpf0WId5jbprjpjhDOT2ZfkGMFgffOr6W/Z/7XW/duqcjB1npyHesnIcxynjwQcfHD700EPj1Ml//goA7vjQh3Y98dM/PfWLyG56z4f3PPfJn7z01h/+4d1PP/UUnv6FX1i572MfWzr2mWPV43/wd/ddiHF88hOfuHDsW7/rxutvOnj+xOMX962NLq4vHVteXjiPw3ElPBEPjO6KYe+lDazsDqsbB2+46dAXTr549hXr4+Hu4XK4EMZh7/I4vnhxfePrB4uDZ+J4sBwi9o4XqlNYj18egNUqDhYDqmUM4snxGG8LIZ6METeEAS4gIsaIBwLiszGEXQFYiDHsAuKhAJyLiLuAsBQiBhHVYgiDxRhxKQTsaT7OACCiGocQhuob+mIx1dFuBARMvgNp7Sd+Z4hk6gZBvdj8H2W/Sb61n/ZTK6lP92rW+k0R+Tj/+1bQep7GTT/f1GPlp2bozRXj9620us3jANx33Xl8/e1P4/6jp3HDnpUkdZzLjPalr7kG9kaBlHLNnAXrSy/XNeaFv5VJtK7mMJuPYl0E65d6uW7o6iWsNy+PTJZAz4N5eM3B8BqiGxU3oauHkTEvYb3ET1W0vubQwzO0vuaw5VtxSyRYmYR1Na+5BiVTz2XN5WAzmtccDI/pbKpmzUisLsuYh5LJdQr775wFG9C85mB4ZDINq69lmmvommkuhzIzUUo2hZZrroFlzFtYM3WmVlSZwHLmc7A55lOUjvpalDJrnkOb11xKLke70xppCYWSDqNkdtaOlaXUvaJ6UakjuT2NfFAB1Xms7B0s/KmXfWbtN2TuODuN1ntPjuP0577v+74jL7/11tXf/sMv3rr34P5za6fPHlmrqoPHbt7/+VPPrN2xa/fF59fGg+vixuLw5ntu/NzJ55+/dXm868ylldHuWMUDb/+zL/vsf/w/v3jnygWs7j20dOHSaP2GUx//J39y63f/wC2jCxsLd95x8IXPf+Gp21/85V/43I3f85eOLZw/uwRcWrl0Ybxn1659K+t7q6WlC6OFOL744triwSPrK2try4duWFy6cG4B2H1y/83Ys7awtnDufLW0dG4wOP6Jn378Zd/3QzfcdGT50pNfOn5gsDyunvy5n3vutu/+7rsO7d176oUT5w9tXLqw69SvfPxPbvyW73zz+trowtKehTBaibtvufvYF5578syrqvXVxRg2ToyHi8cW9h14bHxh9Q1YXRsvHtx9dn117ehwHC9WC0t7qtHa+tLi8urGeOOu4SCcXRuNji2Exd0hVCdGEfeGGF+o4mBfCONDIcbT1Ti+YbCIPxlXw1uB8aFQDZ6NsXpjCHiqQrgxhHgpxMGFKoxfg2pwAiHegBiOYxCPoYo3BmA9ImyEiPUY4mFgsIgYR4jVXgyGawFxf6yq9TAYLE3/KcaY3BaI0++1x4ggbxlwNt+43/yuQX2TXuzULLWbKM1NANXXD9jNldZz10K7oTD90yBJLo4V6k+UiI+14CdX2D8Jtrms95s6pgb9J1emP74E5UZMepyob6SIQ1A/R0iO6YY9a3jPXU/jTTe8gFv2XkoajnOZ0L/sTa9Gmix1FqwvvVzX0It/5hmyL9cpLNO8cFFxWVi/xLMOjIx5CevNyyOTJXQ+D7r4UmeR9CcP2R5dvOYarCzF6tVZqyKFXKewjHmG7Mt1SulxNzCvwbpz8J3PYwtrRmZy3cA8enyONayulmmuQcs018D+W8ewylqmORgemUzCusyjZ9bV56jnWuMtkaBlmkthOfOMXJ+dR6pMsHIrY1gzPTL6WgQ+M0VJh8FmmU+xOiJrVVtCoaTDKJkt6SDTs7KGpJOtZws9ye2bywHgQohLCH//lZ/e+IsycpydhnwfyXGcGbj+Wz/48irgnrhWvXx1tPH9AYPTMWC9qnBTQDgdAr4UY/XVYTD4g1jFo2EQXkQML8Rq9NXDwfA/VgHXhYj1MMSXqqr6jhAH/3cALsSA3cMBnh5V8R0B4XMxjlcHGA4QqlEVBzeEEFdCwEpEtRSq4VoV440YYAkIzwTEPYhYiTHehEG4NAjhhaqKtwbE01UVbhoMcRwhnoxx8EDA+ImIcDQA52II5zCOr4sBF4B4AAhnBwhPVzG+DWHwZIzjoyEMziHEMar42oDwhYhqV8DwdBWqgwHh9gB8HhHLiDgYAxaAuAcBQBVOA/FADGEQQgxACIgRAeEwgNMxVntDGCxFhPOoqqUQ4gIQAkIYxBhXASxO/tmsqhpHAGEwmPwzWtpRQ4sAAP/0SURBVDuFzTf6N79zaL2h36DcCOA3V6bd1GMla2j1J8/Zntm6YWH9vhVsHd/U8Sf7KT850jqO5BimpNyv5Tcz9adZkgfy+bV/Nm3zWNlPqDA/fUx7Fiu8/vpT+MpbjuMNx05i74L/HhbnMsIuTgzfilqCOBhew+rKTK5r6BsAzDNkX64bZvBRrIvRZjQH4ksdDC+xeizTvOZgeAV6DsDYR/OlDoZnJP3JQ20PzaGHRyaTaF3tmFsLw6GHt5Azcp2ivY6BzGiOwbrMw8gUT89l5i20Gc2hoxduaqn1GazLPIxM85prYOcHwyprmeYaWMY8w+qzjHkYmeY1l0PMtLZoiQSZyXVK30zD6tcZrdBghoxhzVgZ9Jy+DjVYuZWVwOaZb8jlaHdaIy0hyOU5SuZn6TAvSXrmiBnOQMm+JR0AYS1gcBafedVte78y/ObZMzJ3nJ2EfJ/JcZwZ+UiMg5/5M3/m2IWLC/vXxxuvrarqg3GAl8dxXAZwAxB2x1gtp79TA7FajxHD5gZBjHElBCwBW50YcSmgWkYYBMQYEELYdHEJISxs9eIKYlxK9tr8J7liXGw5xMUQalfFNWy+abw0+emMGDciIkIYLDb7b/5OkOTYFWKsxs2+L2W0N+4nfuqB9sb95ncdjWc3PWA8T0PrBsE2/r6VrcftuYmfGP33rWw9ZM8D+58Eqx+0Dlu5ARVq3z42tI5v67kTWXN49wYWhwF//nWP4ObdF3Gz/xSLc7nQLlA0hy2vxlLKdQPzGqyrecXRNwCYZ2h9zYF4zTXIz6nV1WD9Ll5zIF5zGqy33V6h83lQ6uU6xcokohsVN2FeHpkshfUSP1WRfblOYRnzDNmX64baq7EqDa/BunPy6rmsuRxsRnq5TmFZ4luVljBgXeZhZJrXHLY8i1WssszkOoVlzDNYn3kYGfMwMuYtxMxkae3FMuZhZMxbWDN1plZUafiGXK5hzfTM1NehBitDQW5hzfbN0M7VuioTcrlFyewsHeY16q45YoYzULJvSQeid3pwZtdo6dvu/uLFf5tYx9lxKG8ROY4zT2KMg5u//btvXVsbvSNUcf/aRvXWOKjuC1U8FCNuQQjLJTcsnKuLrTf5N787UN+8V24aAPqNg/SGy5Sf/L/8zZWtbvM/08eGyfOg9U+MTd9QqOdax5/sV/BPgrWOeWq/5GOdOubGtT8Xk8fGjRUk/aabHsf0nO61mysAMBwCt+27hNdedxp/+uVP+O9hcbYfdpGS8a24JTo4C61f6mC8AcA8Q/bluoF5GJn8nLKehtVlmfRy3dDVS1hvu71Cp/NAcw0yk+sG5hlJP4p1C5ZpXnMwvAbrCj+1lDNy3cA8MplE62oOW16NVWl4idVjWaGn5zDa3SxWX2ZyncKyxLcqLUGweizr4jXXcKV+aoV5ZDKJ1WUZ8+iYyXUX6ll1C1USr7mGvpmG1c+dQyxkHpmMYc1YGfTcfB2CPjPBykpg88w35HJMd9S6KmusLEfJ7Dw6uRxbnZJqWakDJfuVdNDuxQqoLsY4PDf8X+9/euM/n04dZ2dB3iJyHGc7OPbuB29cXxzsevnRvfGx4+feP6gGd8VYXT+u8AAC7gRwHsB+Oedcnai/lD55PH0zIXmsveFfu8lDJdNe0Fvd+oH2u0TkDZT2MTXUxzF1/GK/Od1cad/Aweac4qc/PgH7swhof64nj9ufI4hjSmn8nsUxvvKW43jLjSdx7+Ez2Le4IauOMzvWhQrL2BsGUsp1A/MMrS+dXCfQNwKY19C6msNsPop1MWxG87O4BitrYB3mQTLNwfAKvc4Blkkv1w3MM5J+FOsWWqY59PAaVrfOpipaX3MgXnM5tBnNYdOrkSoNr8G6XT3aGT2P0e5mYX3Naw7lfrJkfQ2ryzLmoWRynVJnVqUFK2tecw19M4nVZRnz6JjJdQliZmpp7ceyrh6ZTMPq15laUWWNlaEgl+T6Vk4y+jrEfEpJh2HN9s3QztW6KhNyuUXJ7KwdK8N0nqvmCx0p2a+kA7sX1wL2rISP79p33Xfe8vBz/k9DODsW/5vyjnMZufT5Ry6sfe4zZ77qv/6vL1z69FN/dPBNd/2Liy9c/KNxNfr0rqXw8QqDClXcQMAKYtyFELb+OS7nqmLrjXv5hr2+mLy5X7/ZP+XShbaf8jwNrW79INQrOaM+vyzVdLnBUfJY+zi050i9upeSaS4ovpVrj6c23qL53I2qgGcu7Mf5jWXsXRzhxj0rGCY/OeM4c4GchxR2CjJ/uZjXx8Houn8pXY9Dg+3BvIT1tutjZrDjuBKwY2FeUtpTyI5mC5eR0mNhPea389xjz8l8F+axR8M895J02Zt1mRcU1hxkPllWJmFd5tEzY35GirdlReYtus4U9Asq5fTZzJqxMug5valSyqzzGrk9O+ateksIcnmO3HwuR6ZjZV2Z514o3K+kg7LeIALjMQ6PTq//h///udGTMnecncJ2fgvsOE4HfuInfmLxb/ybf38f1gcX1kerr4ljfGtVVfdExFsCQoyIN6W/g8XZ2Wy+cb/5HQN7k16+sY/kDfrUb+7V9mkm/xmvBr3b0P5pl+b528fUsPU80zc4xDGLjVvHAUw/T1KY2q/lQf9JsMm640+u6D+hUv77VtA6zq39bti3jnfd/gxee+xF3HXw3FbJcWZF/5LP+lbcEsTB8BqsK71c19A3A5hnaP1SB8ND+ZxaXQ2tr7kGmcl1Q1cvYb0uXnMNVibofB5ovtTB8IykP3mo7aE5GB4k0xyDdYWf63EzbyFn5Lqh9q24JRKsLIX1unq0s87nsAWb0bzmYHhMZ1M1a0bCuszDyDSvOWx6FlHYQBevuQYr02B95mFkzEPJ5LoUMdfapiVqNK85GL4hl0tYP/FqRZU1fTOGNdMjo69B4DMTcrmFNds3g563VEskWFmO3GwuR0EnlzfUPVqnwYxY+1pZSmmv4fRgfN3B3R+64c5v/KfhoYfGMnacnQB5m8hxnCvJTe95z57nPvnJS0fe/YF7B4Pha0fV+j2jCm8JEXsqxLuBcJuccXYWm2/cb37noL1Jn8qpPGDyHcfkDX1s7dXy9YPczZXpLqa+q5l0yA0C7eZK+6aHOOapGfExAoC8scP2q/3UvPgpkMlzJovpvZWPNRGTf4KsccDU8YkPpfWxTbvpj2spRNx4YBX3Hj2LP/2yJ3B4aQ17F0dJw3FmQH7Zy3UKe+NJSrluYJ7B+pqXjh0rlK6F1tUcZvOTh6yrYXW1rNSBeM0xtK7mYHiQTHMG6ptCmkNHrzkYXkN0o+ImbLeXWL0ka9WkkOsGzWsuh5yR6xT2uqBKw2uw7hy8eg5D72ZhM5rXHMr8VIX1NVi3q4eSyXVKnVmVFqysec019M0kVrdrprkGLdNcDmVmopRsgpZprqFvxmAztVdjVdb0zTRy/R45ff1pYDnzpbB55lOsjsha1ZZQKOkwSmZzHSu3soa6k61mCx2x9rMyja79lVDtGg1+YjRa+m9f9eiFkzJ2nJ2A8haR4zg7jds/+MHD66s4EDcGg0sb6+8bBNxQId4Wq+prI8KNsu9cebSfrph+w199mL25MtWdPGj/BApot/kfZb/JIv+TK+bNFeUnR6Y+lsnj5Durqf2Sz93keBumn396vy0x9fyFnzt6bEmm3VjBlFd+4iUAexfHePmh83jHLcfxlbc8h6VBlbQcpwfswsTwraglOrgcbEZ6ua5R3xDQnIXsy3UKyzQvXFRcFtYv9XLdwDwyWQrraV5z6OEV1HMAxh5dfKmzSPqTh2yPLl5zDVaWYvW0424tlHVDV28hZ+Q6pfQ1DIbXYF3mQTLNocd5zGB96eU6hWWJb1VagmD1+mTSy3VKnVmVFlZZZnLdwDwymYR1mUfPrKvPwT7vLZEgM7mWsJx5htVnH0cDC5hHJrNgc8yDZ/S1p8HKrawEbV5zKT3yKaXkU+Ryi5LZXMfKrawh6Zh1M+xByX4lnYYe3TAG4qnB07ffc/SNB37t+ROy5jg7AfI2keM4O5W3vv/9u2976KH1f/MtH3xgfQ23hTi+LaL6dsSwEBFvRoxHEcIuOedcXvr/Mvut7zim39A39iu4uTJZi59cmX7u5lFyw0Fu0sy1jn/6n/hSj3Pqcf4nV+Rza761dy2m91Y+1iRrHk8/ne7lMTWon7tJiMnNmrsPX8RbbngBb77hRdxx4HzTcJzusIsTw7ciKeS6gXkG62tecyBvCmjOQutrDsRrDtM+inUxbEbzpQ49vIT1unjNwfAK6p9/A8tKvVw3MM9I+pOH2h6aQw+PTJZi9a7EcWtofc1h06uRKg2vwbpz8PQ8Zp5h9WUm1yksS/xUhfU1rC7LmIeSyXUKOz8stAHNYY6eYfVZxjyMTPOayyFmppbWflqmuQaWMW9hzbDzR5U1VoaCXJLrW7mS0deeBiu3shxslvkU1lF8S7WEQklHIzeXy5HpWFlK3aN1GvSkZL+STsMs3REQVnF+4Wz4+nueGf0nkTrOjoC8TeQ4ztVCjDHc+l1/7paz5y7dMRyNvz4Cd43j+M1A3I8q7AHifgT/XS2Xk803+Te/K1Df0BeL6TfvlbmAyXcZrf3qjL2YT73RXy82/0fZb5JvfUej/dRK6rfirf3kDYjWMQPtY1aODeR5cjdXxNPzPwvj962k66m51uabqJ+7yYPpj/X6Pev4hpc9i6++6Xlct3slSRynEHnRkaJltWtFUsh1A/MM1pderhPUNwY0ZyH7ct0wg588ZF0N1u3iNYceXsJ6XbzmGqwsQf3zb9AyzYF4zcHwjKQfxXqK7fYS1hN+ailn5DqFZcxraF3NYcursSoNL7F6LNO84jqfwxZWX2Zy3cA8prPJQ6uvwfrb6WunRRSrLDO5TumbSaxu10xzDSxj3iKZmRq39mJZV49MpsH6tWcxD2bIGGyG+QYlN197oM9Mkcst2CzzyGQNSadVbwlBLrcomZ2lw3xK3aFVGsxAbs9cnjKnbrwYxsNL4X+/70sbf15mjrMTIG8TOY5zNXLTe96zJ+y97ujG2tod4/Hgro3R+lsqhHegGi8C4SYA++SMM38237jf/O6g9Ya+lOmb+AGT7yqm3thXfJrJf8KqQetu/s9Wf/q5G5fk4lih/kSJ2K/rT66Q/fSbKPrNlXSvqe20nwSaEpvHIQ6h/TE1j2WxdZztz8XUx1qr5WGFVx49h/e+7Cncc+QM9i7472FxOqB/yWd9K5ZCrhuYZ7C+9HJdQ98YYF5D65a6BpYlPop1EazfxZc6GF6Ddbt4zcHwCp3PgVIv1ylWJkm6k4dsfh5ecwzW1Y6ZCblu6OoZWl9z2PJqrEnNaVg9ljGPdkbPYbS7JlZXy0pdgzzu1oMCWJd5GJnmNYctz2IVqywzuU5hGfMaVpdlzKNjJtelJHPqFqpUvFynsIz5HGyu9mqsypq+GcOa6ZH1fu2xshK0ec2ldMxb9ZYQ5HJGydwsHeZTkk62ni10wNrLyiTz7q4EDDfiv7/n/pu+cfALT/vfTnR2HMrbRI7jXO3EGMOr/+bfXDz1u5+/aWOwunthsOumS+OND2AcRhHxrTHGVwA4IOec+bD5pvrmdwmtN/QbatF+416ZM28QTPdT5Bv6W8/Zntm6QWD9vhVsHV/ip/aTNzfk80z+N/kuamovkOdo2Lq5ou2rPb/8yRFMjlX5XE8etz/nEMfUdu2bKJv/T/cHlsdY3wD+0gOfxf1HTmPf4kbSchwDdhFieDWSUq6Zy6HNFLrebwpIZFeuG2b0UXFZWF/zpQ49vIbW1Rzm6BXU80BzDSyTXq4bmGck/SjWLbRMc+jhNVhXHrNwU8zLM2RfrhvYaxfsmSKsHss6ePUcht41YX3Naw6Gx3Q2VbNmJKzb1UPJ5DrFOj8YbEDzmmvQMs1ZWH2WMY+OmVyXIGamltZ+Wqa5hr6ZxOrWGa2wgHlkMoY1Y2XQc/q6A70/RS63YLPMI5M1JJ2pesfZzuRmczkyHStrqDtm1Qw7Yu1lZZLt6gLA+eGLR/YN33Xz7658SkaOc6VR3iZyHOda42MxDv/u9/1Xe54Zv7D34un1d6yuj4+EgNtirL46VvENCGE3EDeAsChnne40b9zLF9ipdb1ov3G/+V1G49kb9FtZ2zdob+hvuunnwOS5N7PJc7c23voOaPoGhzhmMTfxUy75bioJpvZreai/k2bqMbm5UkdbqvYtB7Q+1+zjatA+d5g8x7RvH2fEnQcv4c03vIivu/0ZHN212jQcR4ddiDCPzawVtwRxMLwG60ov1zUzvTGQIrty3TCDj2JdBOuXerlOYRnzEtbbbi+g5wDzINksLkc9Mxlle2y3l7Ce8OZxaw6GRyaTaF3NQfk8C69iZSmsxzxIprhe5zCDzWhecyjzrUpLEKyelmmuQcs016D9t82ClTWvORgemUxidbtmmmtgGfMWyUxrvCVqNK85GL4hl0tYv/ZqrMoEK7cyjVyf5cTT1x3wGSCT5bBmrQyZXGRqVZU1VmZRMjdLh/mUumNWzbAjJXvNq9PQpVsTK2CwMljbMwh/9WV/vP53Ze44VxryVpHjONcyB9/+vkOHXn3LrtVnT9++vrbxsmoQ7h+P8I0xxlfHgEsB8aDfaOnH1pvnm981tN5sF3IqV24cpDdcpvzk/+Vvrmhv6E/5yfOg9U+MTd9QqOdax5/s1/WfBJsO1H+SbPo425+LyWPjxgqSftPd/J/25yI9vunnThYJuZsrrZ+Cmfq4NrMDyxW+6Y6nce/R03jFobNYHlaTGceZgl2QGF6NpJTrBuY1rK7M5LqGvjnAPEP25bpB85prqLNJxepqsH6pl+sULdOchtVjWRevOULnc6DUy3UD8wzRj4oDcw0s6+olrJf4qYrW1xx6eIbsy3VK6etXA/MaWldzDSwTnp6/aHeL0GZKXYOWyeNuPSjA6rKMeSiZXKfUmVVpwcqa1xwMj0wmYV3mYWTMQ8nkuhQxN7Vke87LI5NpWP06UyuqrGEZ8xbWTI/MfN0BnwMyWQ5tVnMpHfNWvSUEudwiN9s3Z15S97L1bKGQ3D65PKW0W9praPoVUI0DFk+Hv7f2Vff+ldf/7B9dFE3HuaL4L7l2nJcga098bvXs7/7uhTs+8G0nnvrf/8EfHXvdfb8dA/7tMAz+YACciMBiRNw9AE4DYb+cd2y0GwBT78sni+k37zdX7A197Y176Rta3fqB5uVNA/b8mtNuHGjPYT1OF9oxbT3s+PtWapf8z9bjgM39Upd73Np8ky7HNO23Pnfr44CnLuzD8Ut7cd3eVRzbvdr+WBynK10vYLaLWY9j1nkG25d98bF+KbPOW2zn3hrs+ZjfLi738wni5P/NAbYP8z3IbpUtXEa63ljpwjz2ILDvFXpRepysx7ygsFZOnw27zLBzw6LLQJduQ5+ZqwXxsU0tu37cXft9sJ6jztSKKncQ5PjMGytWhoLcYpZZhnWuqSLBynKUzJZ0ZsE6NxvMsCPWXlYmuVzdAIQqYDiMuy8+du5j//vZjQui4ThXlHl+++c4zlXOgx/72PB3HvoXx86cX7tpIWA4Hoy/YVTFt6HC0Yj4GiDslTNOm+bmivqmulhM3owPmHwXMfUGveJlpr2Qt7r1g83H7Rn1+WWpyRPf+skPdjNh6rH+kyvNsaH1HA35mytTayDzE0Ts5srWd3NTfmrjLZrPXes5TL/18W4dz+b/3HHwIr7m1ufx2utO4dZ9/pdynAR5odGQ8WospVw3MK/ButLLdQ19g4B5htYvdQ1alrgo1kWwfhdf6hqsLIX1ttsLOp8DXbzmYHhG3Z+Msfnt9hpaVzjzuDWHHt5Czsh1g/YGekskWJmEdefgO5/DDKsvM7luYB5bWavSEgasyzxIVur+H/b+NFqW7L7uA3fknd481DxPAAooEIUZIAACLHAAxQHiJACkSLlpy70oW4O725KXJfeSYcir3S3bGtjLdotUW2qt9rK9ALptyZI8SKIEixYngSSIiQBBgJhRVajhjXfKzNMfMk7kif/Z+x8n8uZ9NZ3fh/fi/PY+JyIzo/Lljah7b4SdGx5e2WZ2HFEeA5nF666SrcsP0c7LpmciwWZ2nKIy5T28Oet4HClexvD6Xgaey/ebiJd72RBqrvIYyCLq9YGSCUO5YmjeUA6no3yK95gjbjgSby0vszwX3SnQXJ8cnDyBf+Whjx9+2MaVynOJuFRUqVRe6oQQmtf+9E9fePbqiZOXppdfC+BNszne2gQ8BOB8AO6p7yE5i4vni08F2UV1M+jl7YX41C8vxIv1zHc/pPBuRN9cyY8pstxP9Iu/zDGbhbPjAPr7SQq99TK/yPr7XtK0f1gvXwv247qA/DmIf2cLL1keE1mP/V4X8+PZUr8g4L6zu3jrnU/hJ17x+zicT7A1qT8mrNLC/pNnDgtPIyZL3RB2jh0rB+cigfIK27fjiPIQWeu6iHU8VJ/5UocVPIN1mYuojHnmBKPPgVJvxxHlFUm/21RrMM9cRGXKW1SPHXM2IOMUlSmvsH07jrSexlQ6nqG6zDMH7ek5zNwQ3hyb2XFEefSzbtPrM1ifuYjKmGcOS69iiiozz1xEZcozvK7KlIeTMc/cEGZOb6jWG+vhZMorvL76TITheRTlh1DzlIfO6PtNxMtQkCvUPOUxkIHnPUXyDi8rYWj+qrnyEZO7dTccwdA6QzkKO5E1drtzfbfBma2t//iBf++9f7H5wEcOTK1Sec5wLhdVKpXKkg/+03+6+Tf/xt96aL43ffn12eyNmOGV89n8FaHBowBOLf5fAmzaeS81FhfJF//6ZxfVjezlDbpPFd0F/e4P4tuN8TdXlv1uvd4xJXm6SDyG7PjNsfXmkOOwN3bUeplH78et9Xwy6K9NHmsisu+6AXrHZx5K9tj6jt9Eoet1x5rsv7f2wt98aopHbnkW33H743jzbd9KC5WXKvw/d9dnUSaEg+MVqm+9HbfIiwTKK2zfjiNH8MGMB1Fd5UEyO46M9RbVO25PGH0OMF/q4HhF0g9m3GOsh8iYY3i9NssqVthxZKxXsD5zGHHMEeUZqrsGL89f8L7E69rMjiOFvjdUcxiqO9ZDZMxh6VVMUWXmmYPjMZBZVFd5OJnyEBlzQyRzetO9tWxmxymrZgyv32a0QmXLqhnD63sZ8tx9r0He7+FlJbD5zKV4uX1s/SERhqFcMTRvKMdAx8vQz2VVBiMZWmcoR2EnssauPdfDYRN2rm/+s81zJ3/sZR975lI/rVSeO8ilokqlUvG5+R0/fPYWAE/ecu7VzezwjdOmuX9+MHvHvAnvAsJVoDlj57xUWP33raD7dNGbp27UmAv3lmzf7Qa7oSBvEPQWb+dlx5+sR75zJDvu5Bh60nj+HSr8O1fivq2Xz12bLY9nib1Z1cvsg+s5fnOFfzdL3O4/dwuW/Y1m4b/znifxltu+hZdfuISLO/tdXnkJor4AYb51WWSFHad4mUV1mSfOfvHUobyC9ZmD8Myh77tN1WWo7hjPHIRnTqG6x+0J9DxgDiM9c3A8w3QDcR3H7S1er816FdYvdREvU9g5dhxhN4Yh+swpvK7KCj09dyNexlB95plDmc8qmRB4PZUxzxx8ryKKV2YZc1jBM7zuKtm6vEcyJ5ueiRbmmYuoTHkPb4537qhAeQxkCjVHeejsSO83Q7lCzVM+4uUky1QmErzMY2jeUXIvQz+XVRmsiFpPeUZJt6QTGeiqc7yZA9idPLNz5sy7XvEbz3zK5pXKc0X9hfaVSmU0u1/57MFTX/nswVv/xs89fuqWc7918uzOP7v29Wd+b2tr4+9PJvhmaJqzQJgFhFmD5oSd/2JGXvwnA3XhPm4y19smNzNanY+934VC9sNuJEB1E2GnZR17Q6i33mJg970Y8t+30m23gq2ddduN/NjycdexpRZ2TGwfg96s37SfOUMAntg9hc8/cw5ndqa4/eQutjfqjwirFCDO2QzVE1/UjEatf6NQj0P55yvqeJU/Lo5xf+oL6WPjCPs7wtQctZjyYyhdo7R3FEr3oXrKH+d7jNqn8owx3eeKdR2jWkd59tqprvIebH3Fca+/Cus6plXW8eZ42bpgj8NDHVPrVayDNbPG/Rzp38qjzGUMreflJsuqmTAM5YpV55UwtPZQjsJOKWot5RljuiUMrDd0fjcAwm7YCJfn/+I/vzT9pM0rleeKsf9sVSqViuT9H/7wxm/9rf/ppqc2rt0+nzWPzBHegzB/ZA7chhDuQNOcs3NeTCwuki8+EWQXz8mg12Hf8dKg+wSSrddm6k28WyMZLP4i63V5cgy9hXO/jJfr2RsQ2TED+TGTY4PYD7uR0W2TGzvytVDfUWKem968bPEF9LnrNvh3syz+Mv2uSI65HTx08TrefNu38LY7nsCdp69jMvTptPLig73kzGHps9gKO44or1B96+24RX4xpTyDdZnD0Xww4yJYnzkIzxxW8BbVO25vkK8/nDWYL3VwvCLpd5tsDeawRs9gXeNuyDErWJ85LH0WZ6JFeYvqKQ8ns8+t6iHvDqL6zDOHMt+rqD7D66psjGcu4n33AUOVmWcOjsdAZvG6KlMeTsY8c0Mkc7LpmWhhnjk4HgOZQs1pPY2pdHxkKLeovvIRkcv3G+UjQ7kHm8tcysi8Nxw5t5iheUfJvSzSdmRVBiMZWmcoR2EnsoauPK8ZlxvsbE/+zsOfPPhXbVSpPFeIy0WVSqVydB57//vP/MGtt565/OWnHpvPZm+YBjwC4LUIzUUgnLf9FzqLi+SLTwbZRXUrbcfMW15wF+uN/H0ri7+W/W4/SVnfXAFgbm7A9ts/sn1n20f/ZfapT9fKDpk9p93G4jjsnOwxxW1bzI6TzCu4udI/JvDXOxncfOIQD990BX/kZV/E7ad2sb0xS5qVFzX8P/dBn8WpyMIW5T3YnFIH8UUVcx62b8cpKmPeuEDcIKzPHIRnDsIzp1DddXjmBPT1h7NGqbfjiPIK0w/EdRy3t6he4rOKFXYcYZ65IewcO05RF9CpdLxF9ZSHkxFPz2HmhlBzrLfjiPLoZ72aN8eiumM9SGbHKeq8UKgy88zB8RjIGKzPXERlykNkzA1h5vSGar11eQxkDK/vnTcqUB4DmULNUR46o+8zkVWzIdhc5lJG5Fk1E4SSjmVozqq58iltR1ZlsCJqPeVTSjqRNXfd8zshHDY4sR/+9+vbJ3789b9z7QmbVyrPBeRyUaVSqayfP/Nn/szOf/+Nb73u4CDcsXsY3jIPs+9ugFMhhJe3v6MlvNDfk+h3n3QmF12nQfeJozfPW6+dk61vL8wnIrug3+0b2Vr5zYR2bu/4k/W6faR5vt27IdRbC2IfEef3rbQb2SGrG12Jt3PoTRJzTLlTN1G4XzhzbMlavWGyn+gaAG+8/Rm8484n8Obbn8ROvcHy4sf7YkNl7IJCJoSD4xmqa70dJ8gvqJRnsG6pQ5kPZlwMm8MciLfjyFjPUF3mmcMKnjDq9WcuYjM7TvEyS9INZtxDeTgZ88wpVLf1WWyFHUfGeoXqOz6LMtGiPEN1lYfIiBt1/np4fZvZcUR5LLOskgkH1WWeuQjLmINz3B6qzDxzcDwGMovqKg8nUx4ks+MSyJxOkayDZczB8RjIGKqf+KySCYOXe5nF63oZeC7fZ8D7PYZyhZqnPAYy5HlvOHJuMUPzhnI4HeUjSS6rMhiJWkd5Rkm3pBMp6LrnNiMAk0uTZ26/++xrb/no01+1caXyXEAuF1UqlcrxcvFHfuLeb7vv1N4nfn//hwMO3xZm4UII4W2hae4Bwh5eoL+nZXHxPL/h0RubC+XoLp4vPlWkF9AXf4j1yH4ivbXbPxauvw90+15k3b6zhZefePoX+s0xm3md77nk01MS9NbLPL9x1dseeXMlc0D2XKvHFWHPHbp99H1+nObY2n5vSPbdJNmFUzP86dd9CvecuYbzWwf9YuXFhfqiY8BnsRV2HFFeofrMEye/qFKewbrMYXXfi1WXobrMH8VFvMzCusxhjZ5AzwHm4HiQzI4jyiuSfjDjDJYxhxU8Q3XtMRvXwRxW8Arbt+MUdmMFzhzlGazLHByPPKPnLvJeEWoO86UuYo872yhAdZWHkzHPHBZeRRSvzDLmsIJneF2VKQ8nY565Etp52fRMJNjMjlNUpryHN0edN1S2qEx5D2+OypTHiu81XjaEmqs8xmW0SmWLl3kMzVs1Vz6l7bhVNyxkaI2hHIUdrLcnz+khpkCzj71zm5N//d4fP/xvmw+h/kLSynNO/YX2lUrlhrP32U9d/vKv//b1l/3Uj3/q3N23/sOr3/zW7wHNZzY2mo82DZqAyZ1A2Lbzns/0L5KTC/pG9nJy44DdcOlts5sJLd0aiaBrdPvxPXNsvaEc9kaR6rcD5jKfiP7a5DlN/ui5BObZc4GRx8Sc9XHD7o4+HwAOZhP8/qVzeHr/BB46f6V+B0tlfdiTcF2s+kXUKqh9Ka9I+t3TMnaNMdjn/jj3dZxrj2DlL64tpeuU9giDUwcLa0btL/GqAgyFa2DM+mO6YznOtdfFmGMc00XeHzt9ZdSOmGcOC6+i0bCFmMMKfixqHeXhZMwzN4Q3R2XKHzfeftuMVqhs8bKxrHGttf0bOQa1T+UxkJXgzfcyRcmcks6qeOchvGDNDO1nKE8p6RZ0jnxOT4DmoJkAW79707f92C9/6KOfrl8EV55z7JdwlUql8pzwpp//+a2Dj/72ma9deeqVBzNsb21M3nZ4OP1jIeAehPlpNJPn/c0WepOkM/1B70J5A8B+90PrYLvdH/w7V7Juu7HYJut1A7b/SDuvd/zmsXo3cLot7+YK20eE/76VbpvdaJLftYLecfTz/PWDOaYU+dy1f9D1mE/W6Xmzb3bMALCzGfB9938Vr7v1GbzqwrPYmBz1E2vleQd7SZmLqItRVtpxRHmG6lpvxy3uF1heZrFdO44cwQczLobNYQ7Clzo43qJ6ykNkzMHxBHkOjPGlDo5XJP1uk63BHBwPkTGnUF12zNlgpIPjFazPHBaeRlQ63uL1VMY8c1jh/FWoPvPMocxnlUwIVG8dnjksvYopXtlmdpyiMuUZXldlysPJmGduCDOnG3pr2cyOU1bNGF5/7HsJjpAp1BzloTP5HgM9BxjIPNQ85TGQoZ/TKpUtXjaEmqt8iuoon9J23KobFuKt4WWRkg5G9OB33XN5JM1eE7YPmo+euW3nA3f98tUnbV6p3GjsNZpKpVJ5XvCqP/Wnbn78y0/dMT2YvhGTyXsD5mfCHK9FwDk0OGf7zwfsL6W32+mgf/G8P295wV2s12bsDTzrthuLbbIe2U9+M6HNE5/9/pbn4OZKuu/eGNA3V9osWyM5hsz3Fl5Cn7tkkK3XO87kueg2yDEnA37MABBwZmuON9/5FN56xxN4/S1PJY3KiwL1xQjzrcuiTIxwHqpvvR23yC+0lFfYvh1HjuCDGReh+qXejiPMM6dQ3eP2BHoOMIeRnjk4nmG6gbiO4/YWr9dmvQrrM4cVvML27TjCjpeKBC9L8XosYw7ajzp/Pdgc5jDSG9cNWVfhdVWmPEhmx5HWq5iiyswzhxU8w+uukikPktlxKer5zkSCzew4RWXKe3hznsubK0NdLycZfX9JUbnyJbC5zKV4ucl6Q28eCnLF0LxVcuYsbcetumEh3hpeZhnqDuUpTnfwPF6BZg5sXZl8/eLpE+++7bev/J7NK5UbTf2xYJVK5XnJt37jN3b3PvfJJw9+/9O/830//b5/+PXHn/rsxmTzm5Nm/hvzBuebgNniJ27ipJ37XJBfPM+3aa4unhNvs97aLUNdOyfuXx1T+kmp303/tHPIcZBte2ww6zBvdtM9Ruvp2u0fmQMA9t0n5ngsi2z5I8YWo7hB1jM3uVKf0puXDLpjWqpu+2De4EuXT+PSwQ42NoDzO4f1x4S9WFjhC5JsSiaEe7GjHrPyCQWV48F5D7phHOODP44vuF2OsL8jTD0e1LlReqCqp/xY1rXOcXHE41vruTtmLdVVPqGgcvyMPIhR9THlMd0bgXc8YzI7LsGbs2o2BvVeplD7bT2NqXR8ZCgfg1pLePc9xsuOwirrenNM5lXXhrcTL4uUdFblONceQ8lxlHQw3HPP4yPQzID5YdjY253/yn/+7OzTNq9UbjRj/ymrVCqV54z7f+ZnThzu7d0a5hu3IUxuunx1/wMI4bEmYCsg3IWmec5+dNjiIvni0wO7+J3K/OJ5f95irdynWe8XwyfwLnqffLr99I4pydNF4jFkx2+OuTeHHId9LGq9zKP349Z6PhG93Xs/ni157vqHzL+bBeaYmOPfoULWazey/Xcb+XGxm0r59vK5O7UVcGpnhve97At41U2XcPPOHibm+au8wPBePpaV/h+bdhxRnqG6zBMnv+BS3sPOseMI88yh77tN1WV4XZaVOgjPHEP1xnqIjDnB6HOg1NtxRHlF0u821RrMMwfHYyBLUT12zNmAjFNYxpyH7dtxSun7VkR5BusyF1GZ8fLcRd518bo2s+OI8uhnvZo3x6K66/DMYelVTFFl5pmD4zGQWVRXeTjZGM/cEGZOb6jWY545OB4DmULNUe8j8OdIvIzh9Udm7vsL+JwOLxvCzrVji5eTrKdI3mMoZwzN8XKVKZ/SdtyqGxbireFlkZIOCnsFncHzeFXadSfXJoc78+Yvbt902//zvl/96q6tVSo3kvqdK5VK5QXDpY9/fHrlU5+6/Gc/9eOPn2ze9Qdf+dRnf+Psqe0PzxG+OA/z/QaTAyCcA278TZaj/b6Vvm8AfYOgAWB/vFZCtu92I/O9fXu/b2UxsDcY7DHZ4+mt1/5Jlm03k8dqjtfzcd/WM9dtyx8J1qeX2bDnvO9QSZzybO34d5KxY7bjpgEO5w2uH0zw5O5JPLV3Erefuo5z24dJq/KiYcwXLGO6Y7AnZMT649p/xK5vxxHl7fFCdJlbhdJ1VE959jiOE3UchYz+olv1lT8O1L6UH0vpOqqXeFUZZOWJK6IuiFLpeMaYLpy+8owx3XVR8N9+77DWcYxqDeUZA92BuIy1LLKmdbw1VKb8MXGDdzcO7+DGvo+sG28/q2YKb46Xeawyb8ScrJqJBC/z8OZ52RBD769Daw/lJXhreFlKSa+kg+He6M93pdh159jY3G7C2Vtv/u/+488/vW/SSuWGMvRWUalUKs97fvbnf37r7//DX7pjPzS37x3O3rvRTM7MZ/O3B4R32O5xscrvW0F7QTx+UuhdQPfWMz9yqtNsPPj7VhZZt2+7SJyXHX//d4bYab3H0m0nn4jYemYR5vvrLUVvauFz198duUkC9nwsoM9dF/Yfa9+j/1ok6/SGZt/ZPnpj9hoFbDUB33nv43jn3U/gFRcuLcPKCwv7hYRyWHoap5IWHK9QfeaJk198Kc9gXeawuu9i1VOwPnMRm9lxZKy3qN4Yz1zEyxJGv/6l3o5TvMySdLtNNX8dnjmF6rJjzgYjHRyvYH3msPA0otLxDNUd44kbfe56qDnW23FEefSzXs2bY1Hd4/StY5FElZlnDit4htdV2VgPkTHnQfqdIlkHy5iLqEx5heq3nsZUtqhMeQ9vjsqEl+8v0HOAgcyDzWMuZUSeVTNhGMoZQ3O8fNUMA48zIoORqHWUT1lXB37PPXePglo3AJu7G79z7sL2T9z9K1d/18aVyo3EXqepVCqVFzSv/OE/fnb37MaZK5ef/cMH07C9AbxpFsJjCM0Dx/Wet7x4nt/0SC+sk03+HS8Nuk8RvW73R76fSLdGIhbbZL12wL5zZEk7r+saT+Zkxwzkx9xbL99/b14yMVub3NiRN1ca9I4j3Uc67s3LFl9An7tug9yo6fro768rkmNOBvTYAOe5W/iz2zM8cvMl/MhDX8L956523coLBOeLCQm7UJmJEc6D9UsdxBdhzA1h59hxZIw3LhDnorrKg2R2HBnrLazHHFbwGMgSRr/+KrPejiPKK5J+MOMMljGHFTxDde0xG9fBHFbwCtu340jracwkcx6qzzxzEZPRcxd5rwg2p9Sh3PeGao7F66mM+VIXYf+OeXhlm9lxisqUZ3hdlSkPJ7PejktJ5vWW8NazmR1HlMdAplBzWk9jKltUprzC64/M5HsLeL/HUM7w5qhM+UiSZ9VMJHjZEN5cL4OTK4+BxxiRwUjUOsqnlHRQ2HM67nl7FIbWnQG4Nrl6xz3n3nzrP33qszauVG4k4rJRpVKpvDi46yf+lYev7O6+opk2j4Z5+L55wMMIuAUNttf1Hri4SL781z+7EG720r+AvpiXX1Qnvv1jzO9bWf7VX89+l0O3nT0j7TzVb//I9p1t97/Tpb/J9hHhN1fStbJDZs9p9we7uYL8McXtbHF7nGSee3Mlf+4WkGPu7af/99Kr565/jjxyy2V8++3fwlvu/BbOb9Xvmn7BwP9Tdz2NrLTjiPIMr2szO26hX4wx58H6pQ6OxzLrKl7XorpjfKmD4xmsyxzW6A30tcfAfJYdxQ3RzummqjWO21tUz3j3uJnDCl5h+3Ycsc+x8RnKW7yeykb4lc5fhupbb8cpKkt8VsmEgPWYi6iMeeaw9CqmqDLzzEVYxpyH12cZcxGVMc/cEMmcbHomEmxmxykqU57hddssq2QiYdWM4fVXyFZ6b/GyIdhc5lK83GS9oTcPBTljaI6Xr5qhn9MqlSPx1vCySEkHBb2hHM55uyqF6zVzALuTw60w+bMP/+7+f9aoiySVyg2g/s6VSqXyoubKp37nqYPPfvr39n/v07987s1v+p359OCfbTQb10IIASHcAuA6mmaLXLcupn/x3Hgy6C6UMwcU3ahhB5vtu+su1uvl3cDcCGALu8fad2q7tyxZC2IfyneK3lzp/bXcTrydk3Xjti32nHcTxfddbtZn+87WYtvJIPtc2QCXDnZwMN/E4XyCh85dQQgNJmbflRc46ssJ5Y+Lwv2t5QsxtgZzq7CudUpg+2Lu+c5xHnPp2qW9Ida1znPEWg9/rYvlFC9fXDxe5HuX8utA/Xut9pn4rJIJQWnvuWbMcaqu8mNR6yjvoeYwz9wQao7yEBlzEZUpvyJrW25tC41Hvq8cF6vsb2hOkg9VM0ZPKJgzlCuG5rW5rMlgTZSsv67OAGs/b8esF9p/G+eYbDfNyZt+5/X/9Yc+9o25rVUqN4p6c6VSqbxkuP7J3/nmwe995vceuO38/3b93MV/MWmaL08mG18KwGkgHC7+kW527Lwh2MVzu03z3gXx5O82sF9LL7LhHwnWbXvfUUL2bX36Cce70G9vQHSeODtQ+2aeridurljXANlzt9zm3j6uFHlMjs9ct5E8z/Fvs+/GrBldt50MbA/N4sPvk9d38LWrp3E9bOPCzkH9RfcvVMZ84fF84EYe73Hua8zaqqu8pbS3CmPWVl3lj4sbvT+GOgblFaqv/AoMLqUKyo+ldB3VUz77x20F1Npj/ToYs/aYrse61mGMWVt1W6/iUaxjkTFrjOlGVplzDKx8GN5ElSmvUH3vXKGyxcvGvMd463gZCnKL1/eysRxlLW+ul6EgZ6wyJ0XNVz7inXfwghGoNZRPWVcnIrprv6kCva8hmnnTbIeNve3J3kf+o9+7Xn8GduU5o95cqVQqLzme+spXDvY/+8lvvuyn3vcb+5eu/sbhQfObO9sbH5sDuyGEeybAZYSwjaYpeo90L6ob2b8gvvwU0b+ovvBqLfXZP+urC/rdfnzPHFtvKIf4fStmk67DXLfdiv7a5DntRJM7M1bHk+IfU/+1U8eZ+rhhdydv4HTbyWPtdc1KyXlwGCb4/DNn0TQNbjm1j62NOTaT56zywqbolVQl5Rmqq/yNwv5HNIQ63sQHMy5i7HFY1Hx1HMpbSnsRdRxHRH5RrrxibL8U+/qvwsoTV0TtT3lLaW8Itg5zq1C6juop/1zgHYvN7DiifEJBZT14O/Ky5zvH9B4IDDwvKlN+LMk661qymDHP6boPzlvPyxhjHkcK2Y/8N3GIGzmvcE5hbcnoCQWssmbJnLZTUl0Ztbjyx4XY38rn6hBj1jXd0ADhcL4xvTT9X//6k9Mv99NK5cax6j8LlUql8qLi0Z/6qYvfvDK5eX+6e2F7sv3yvXD4x8NheA0mzVkAZ2w/hd4k6Ux/0Ls43gCw3zXROthu98fwd650ecEvs7fr9W8otPN6x28eq3MDZzn2bq4k67W+fzz5c9ttsxtNa/x9K0iOiTvyHS/md+J0OfPJOj1v9suOeTFmrw/yT53ZaxRwbmeGe85fx48/9Ad4+MKlJK08b1BfaDDfuizKhHBwvIL1rbPjBPoFGnMetm/HkSP4blN1Gapb6u04MtYzVJd55rCCN9DXHs78Um/HEeU92jndVLUG88zB8RjIUlQv8b2K7dtxCsuY87B9O04p/R1RyilUV3k4mfGjz12F17eZHaewLHG9mHUVqjvWg2R2nKLOCYUqW2/HKSpTnuF1VTbWg2R2XIKZ0xuq9Y7bK7y+d66oQHkMZJahrpfb539EN2MoV7B5zKWo3D6e/pCIBC/z8OZ5GZxc+Uiby5oMRuCt4WUoyLGejnu+rsKY9VR3DjS72DuL7Q/c/9nd/9HGlcqNouj/yq5UKpUXO0984hN71z/3O0/vf/4zX/+hn/ojn3vyqcv/eBK2fmXWHB4CeLxpmqsA7rTzkFzczi60k8HgxXPibWYvslvXbWcX1du/zQLKR+Sxtht2Wtaxx8zWIw4Fv8y+NxaOHSvNzdh/Phaf8HrrDe57MUpdSm9eMhg6Zta1ws7dn0/wrd0TeGbvBJ7cO4l7z17F9qT+mNoXLNkLL1BfmIzliOus/Yszj3Xsax1rKErXLu15qDWUH0PhGmt77de1DsOubccR5RXqv9PSdVRP+TGsYw2GesyK4zoOD7VP5Y+TMfsc032uGHOM3sXyMaxlkTXxfDoWwpEOT01WfizeOupcobJl1WwM3jpetgqrrsfmMRfxMkNWzUSCl3l487wMImfO0nZkVQaFePO9DAV5pLQnWNtnt8iY9Ya6DdAcNs1kK5z4sUfu/Xt/50uXprZSqdwI6s2VSqVSMXz6ox+dXfndT1y+9rmPf+G/+7v/5H+7dDD7wmQy3wuY/FbTYA8h3ISmOYF43UBcwLaD/IL48tNCY9Yym3I/kaGunRP3nx9TJDm23lrpn3YOOQ6ybY8NZh3mzW66x2g9Xbv9I3NA/hyk29niCxZ++SPGFqO4QdYz30GU+hS177iZrRu3SdeKbG57TN/aO4Hrs02c3pzhvrP1x9S+YBn6wiOSnSAtpfPXwNq/QFsVdRzK3yjU/o/rtTvq/JGo91V5HMpbSntDrGsdxnGtnTynvV0cdX9HnQ9nDXVx9LhQO1OeIN+7lFeoPvPMocyryiArTzSwdZhbFbWWeo95IaAeEwayUrw1vMwyprtu1r3vda438tyT7ylY83FF1r3mutcbwtufl6EgZyRz5HQZPI8oOUbRcc/RVRiz3ohuM8Nk5+TWL1/YPv3Pfu5Ll/ZsXqncCEb+E1CpVCovTT74T//p5n/xc3/7fkymd+xeP3gtmsmbMZ+/Ewj3osFJsAvYRto33Pgjr6KPF73jp4lsPfOjpVJ4F71PJt1+eseU5L0DbI8hO/7+evZCWXYc9rGI9fL9LJ+fzCfC7D77sWD9bv68YuTNFfncdRvkR4+1G9n+u438uOjzsVTttnrukuet23f8O2QOAO46s4+33/EE3nbXE7jt5G6SVJ4T+H/mgz6LrbDjiPIK1bfejjHwhZqXWWzXjiNH8MGMi2FzmAPxdhwZ6y1ej2XMYQVvkK//Onyp80j6wYwzVMY8c3A8Q3XtMdMBGUeUx0BmYd0Bl8WZaFHeonpr8KPPXYXqW2/HKSpTz63qW1RPeTgZ88xh6VWc4RVZVuoiXpbi9VSmPJyMeeaGSOb0pntrsYw5rOA91JzW05jKFpUpz/C6K2Qrvad42RB2rh1bCvOslgnDUM7w5ngZnFz5iHp8ERkU4s33MhTkOHpHnp+rUrpeaQ/LbnPQYGMfX7zl1edfd+vfe+qKrVUqN4L02kqlUqlUCnj/Bz+4/YUrV8595bNfftduwBuA8J1hjjc2wOn2WvfyvdW8y3YXuRt0nwh6F8/J7xhZ+LjNP3H0uslGdkG/2zcAe2Mh+xeh/2O5YNcjNzd663V/J8ecFNiNnf56y/1n6xJvb6z0ttlNDyB/DtLtftE4Ms/c/FruO273n7sl5LjbAT9ms14SZudH9h07/ObKpD1rf/hlX8Vjd38dF7cPsptblRsIe+qZi6j/C9xKO1bOQ/WZJ05+saa8wvbtOIVlzGHpu1j1FKpf6u1YOTieobrH7Q309WcuwrJSB8cr2n5vGluDOazgMZClsJ5x3bCg2zHWK2zfjlPYe1YmWpS3eD2VMc8cxLkL3ZeovvV2HFEe/axX8+akqJ7ycDLmmfOeW4XqM88cVvAMr6sy5eFkzDM3RDsnm5qJFuaZi6hMeYbXHXv8OELG8PoqE16e88pHhnKGN0dlyiPPsmomErxM4c3xMji58lhmXsUPC1FrKB8ZylHYgd+T5+gqlKxV0onY7gyY7DVP3HZh44/e+uv7v2TSSuWGYK/XVCqVSmUk9/30v/bqK5evv3M+D29o5vMH5/PwdgA7aLADLN9p84vni08GTZoV3iBIsa5p/+hdgE/zbpDccLCLxHmJz9Zzbq70jz/5BETWs/tmvr/eUvSmFj53/d2RmyRgz8cC+tx1Yf+x9j2y525B3meP2x5Ob71e33zaZDdXjE+P89yJGb799ifx1juexCvO1190/5xhv2iIOD6LMjHCeai+9XackH3BZscl2Dl2HBnjE9dtsp7C66rMejuOjPUW1mMOjoeTKW/IXvsI88yBeDuOKO+RzAlm3OO4vUX17PGmWGHHEeaZG8LOseMIe7+C3y+GdZlDuQ/EdSjvweYcxUXYcRPvorrKQ2SlDkuv4gyvaDM7TlGZ8gyvqzLmmYuwjDkP0+8NvbVsZscpq2YWrzv2vQNOprzC63sZ8lz+O4i828PLPNg85lK8PMl6NW8OCnLG0BwvV5nyEfX4qFgBbw0viwx1hnL4Hff8HMuYtY7QbQBMrmxcOXVu69+8/8//4H/bfOAjs36jUjl+6u9cqVQqlSNy6RO//eTtb3/zp06c2vpfDg5n39jE5meA5ksB4W40OIsQDtA0G72L3Ow7VMhF9d42uZkRYRfK6RpiP8M3E8h63j66LXNDqB3Y3cX9DB1nt036zLFutm/ih56PbB9AdnOH7dv6novbyYAeG9D7VMmOKRXZXPW6NcD+dIIvXjqDzUmDU1tTnNyYYWuj/qL75wXqiw51scGiStmJc7zQL9rGHgNbg1Hai9jjGDtfodZR3qJ6yltKe0OodZQ30Nf+OLGv5xDJ8QUz7qH8WNa1DsOubccR5cdSuo7qKT+GdazBWOe6pWuV9ghHmMpRCyrPGOgOxH3Uf9dsEdVVsDXG4q3hZaWsY42It5aXlbKONYbw9uFlY/DWGZmt/O/gjZrn9U3mVTNGlVu8OV6GgpyRzFll+iDeol4WGeoM5fA7K5+bjDFrraMbgFkI2/OD+e/f9jc+8b/auFK5EdSbK5VKpbIGLn3849NLH//49KGffN9Xztx1y6/vfuOZz8xx+E82sfH7YYKTAO4DwrUGzTbEBXF2Ub3bLrix0m2ztdNtlovF1XdFsGMa3O6the4Tknzcyrd/ZIfcCtZNfZaz7WxxfTzdmD0f3b7z5y5F7Zsdc8+Tbo/ed6i0x0CeO3v8T+yexJcun8Utp/Zxx6n6O1ieF9gXDcsvMlhUjPpCZQxHXeO5nh9J1mH/na4VdszMvRQ4rsd9XOuq80LtT/nj4kbvj7GuYzjqOkedv06O81jWsfY61rgRlB6n1/OyUtaxxg0mO2T1XjaWbOGWMeurNbDMvEqGV/YyxpjH4TB48Vrlyg+h5o31JXhzvew4UPtT3kBrVI7kKOfROvZ/oyg91tIeCroNMDlsms355At/6Y3nfukvf2Fv31YqlePmKP+JVyqVSmWAV/7wHz/75PblezcPdl55ONv9nhCaHwNwCggXkLwJLy7kLT859Hy3MfxjwdILgtkFfaQX44d/34r19vetJH/JbfUjwRZDto8I/7FgnSI3COx3jnTbDbrHa+ew5wjmmHLX34/dR2Tpl/tJj38BOeZuTuKybfXc9Z/v/rw2M+v3j3NJg4BHbrqCN9z+FB695WncXn/R/Y1BfQHheBpZaccR5Rmqa70dt7gXFrzMYrt2HDmCD2Y8iOoqD5LZcWSst6ge88zB8RjIEuTrP8YfxQ3RzummqjWO21tUL/G9iu3bcYrKlGewLnNYeBpR6XiL6q3B0/OWuSG8OTaz4wjzxvWGrM/weiob45nDwquIosrMMwfHYyCzqO5YD5ExB8crkn5vqreOyphnLuJlFq/rnScqUB4DmcXrqkx4+l4SUZnyQ6h5Y30kyWmVSsd7DM1ZJWcupc1lTQaFqPnKp6yj4+TueTmWkrVKOpGSbuwcNNgO+OST8/PveOdn6y+1r9x46neuVCqVyjHy1Gd/62D3059+8s/97o9/7jf/u8ufCeHwH0w2my81AWcCmk0AoQF2Fhe4F5e20wvc3Vj8vhVkF8TzC+W9PBkon36S8S702xsQdH/JdirUvpmn69GbK7lrgOy5W25zbx9Xijwmx2eu20ie5/i32Xdj1oyu204GQ79vBWj0MYnjv3q4gyd3d3Byc46HztfPqS8Y7BcjdhxRXmFPRqywBmPMGmO6jIL5BZWjc9SdlM5XPeXHUriO/OJdeYU9B8fOV5Suo3rKK8b2jwN1DMofF2p/yt9A5Hm7Tuw+7DiifEJBhWP/uxpC7ch6O07xsrGMPf6jMvbYvb6XpZT2UtY1h7khVpkzBm/9VbMxrGsdrHktj1X3Y+b1/nNbdU3F0HperjLlDbRG5ZoYWnsoR0HHydf671vpWuvsmU6YADvTrW/deRN+7T/96sFX+mmlcvzc6I8ilUql8pLnPX/2z57+ra9+9e751ea1E0x/OiDcOp/PX9ZMmjtAvjtlcfE79xF7QRzdxfPFp45e3g2871xp5yWOrZfndtvsP+ur/YD+Tpretr1xQPr9bv5cpM9Bbx/9Uoe6kdFguf/eeu1g8Zd6LvLXVd7A6W2r5y75pJndRAnmmJJt45vYbwd3nt3Hay4+g3ff9w3ccfJ6nFpZN+qLCeWxyLLYCjuOKK9QfevtuIV+IcfcEOkcNf8IvttUXYbqlno7joz1DNZlDmv0Bvraw5lf6u04orwi6Qcz7nHc3uL12iyrWGHHkbFeYft2HCk93ojyDNZlDo5Hno0+bz3YnFKHMt+rqD5DddfhmcPSqzjDK9rMjiNjPUN1lceKmfV2XEIyJ5ueiQSb2XFEeQxkFtVd5fiVx0DGUH3lIyaX7yPIuz28zIPNYy5F5fax9IdEtCg/xNA8L2cZcyltLmsyKETNVz5lHR0nd8/LUsasUdI9SmcONLs4PHNi520PfOL6b9q4Ujlu6neuVCqVyg3mC7/yK4fXP/Wpp3Z/75OfvufNr/sns/nGbzeY76HBlQDMEMKZpmk2IS58W9IL4nEju3get7OL8blnLlvP2Uc67vneestPRvRmwoh9LwPehbqJIrZh9p878h0vTftdIalrN/IbMd2w781+2TEvxuq5M5822WvU6/d95pLs2uE2vnjlDE5vT3F6c4rTmzNMkhtalecIdmPluDjijtbyRRzIcdj/QNaF3c8qqDWUPw7WsS+1hvLHxXHtL1n3uHaxdtSBWm/HEeXHsq51jsK6jqF0ndJeyipzjsKY/amu8mMYWGMgXuIVvez5znN17Gq/yjO8rpeNZPRS6/pMMHrHLavOWxer7F/NUT4ylI/FW8/LIHLmUo6aD6HmKx8ZylHQcfK1fR4vZV37K1hnMpuELcx//eeenP+2zSqV46beXKlUKpXnkKc++cnrV3/3k19+3x/9wC9/5YnLvzmfhG9uhPlXm6a5FhBON2hOswviEXZBXF4oNwsoH2HfqaH20are34g/hmo5zDbZzQQU/L6V3lg4dqw0N+Oy5yP5e3Dfi1HqFpjn1NtHAjtO25HHZHz/OJfkv18nYHMW8JWrZ7H11CbOnzzAudP1dwU+pxR8keFy1PmRwnWyc3RdFO7fZR1rMI7rQR/X8R7Xugq1P+WP6/k8Kup4lX8+c9RjHpg/EC8pLh4fN/wClIc6lsSrysqM/e+t9ABKe6ty3OuPRR3PGM/cEOrcGLPWmO6qjN2H1181WxdkH/J9RPnIUF7K0DpDeULxeeRlCm+Ol6EgZ7RzVplaxKoLD80byuF01v0/ZA0tNpSneF0vS2kATDHZ3Gm+8ufeddc/+2ufvjy1lUrlOKk3VyqVSuV5wMc/+tHp5c9+4onrn/30b7zuXe/451em8y9shPDZeQgbocF8svg5WafsvOziebuRXTyP4/ZCeW+eLbX0vysi/TOfQ4/D/sir3nrtdjJg3h5a0/5hPV2beHVsbN8WdkzdNvu9LuQ402PqubidDPJjHu5akc3NbqIsN6xPj/W23UOcOQx46xcv4eIXZ7jt8iG2z86wcXKOpn6SOF5Kv6gYS3bSrAlxvEKPYy2L+ITujzVQuo7qKX9cHNM5IS8ujaV0ndKeQs1Xfiyl66he4lXleYe6qEPlMaL2p/w6GLP2mO46UPtTHgNZiuq17zMqHsWYRVRXeYbqjvUvZsY8Zq/rZWMZu5bXV5nyq7DqWmye9+8660dM1ht689aNt68jZrIig0LUfOUjQ/kRWdvya1tovWuFAIQpsHWAL504+ezf+ytfwKHtVCrHifd2W6lUKpXniDf9/M9vfexP/InDe973vrs3Qnjt9d35j4VJ+J4JwiyE5kE0WP7YsJb+xfPlp5XY6V+MT/LevwS5Z+vZGxDZcQBAegOjt+9FhuyY2r/Nj5vqfCLM7rPfedJtJz+Wqz+H3AyJ29ni9jjz5za9uZIe5+Iv0+8K+XHR52Op2m313CXPW7fv+HebkZso1jcAdmYBBxvAy67s4+ZrB7j9ygEeenoXp/cPEQBsbzXYuX8fZ998Hadec32x63Thymr0T/0lzI+5WFnqPFi/1EFcYGduCDvHjiPMM4el78Wqy1DdUm/HkbGewbrMYaRnjkBf94jKSr0dR5RnmG4grmMdnjmF6ia+V2H9UgfHK1ifOSx8FmUiwctSVG8NXp67yjO8rs3sOKI8lllWyYRA9cZ6kMyOI+xcGIJNKHVwPAayFK+nMuXhZNbbcQnJnGx6JoSD4yEy5jxUv/U0prJFZcozvO6ITL5/RLzcyxRsDnMpXp5kvVrhnGKG5ng5y5hLaXNZk0Ehar7ykaPm0J3Bc7GUMesMdYdyFHYisXvQYHIQnrrrvWdefvHnLj1rWpXKsVIvhVQqlcoLgEd/6qcuzsLmK568evl7JvPme8IEJ8N8/oamaU7CXCRf/LX4lNG7kN4Nhr5zpf9juWDXIzc32AX79KZCWmA3dvrrOT8WjPWP+MvsYY/fPrieI/OSfXQu2bDP3ZL8uNjzkW+385Kg91wvhJnn/zL76E7MgbMHM5yYTfG2r17B1myOW68d4Py1A0ySeQEAJg22bpri3Nuv4eS37WLz3CxpVEajvohwfBZlQjg4nqG6zDMH54s75Rm2a8eRI/hgxkWofqm348hYb1G9dXjmBKNee+ZAvB2neBmj7Ydkm8Iy5rCCZ6hu4nsV27fjyFivsH07jqTPr4VKx1tYj7mIyowfdc56qD7zzEVYlrhezLoMrzc2K3VYeBVRVJl55uB4DGQpXk9lzDMXYRlzHkk/m5qJFuaZg+MxkFm8rjpHqHQ8BjIFm8NcisnlewjybofyJbC5zMHxyLOsmokEL1N4c1bJlI+ocwsFcz28uV6GghwFHZG75+FYStZaR2coTzHdZgpsTZtLJy9ufd99v7r76/20Ujle6g/zqFQqlRcAT3ziE3tPfvLjX3vk4Zf/5qXZ1m+cPLn12TnCRgN8a764NH7BXihvh8vt3sV47uOnFNlt/+hNSTpZlwy630FiFlkM+/vP1iOeuW6bfUcJGXcdW2phz8dyH2Jt9lp0YvlpkO072wcZs34qsn0bH//ebgICJnjFlX3cd3kfL3/qGr7nC8/gpuuHuOnaAc4czHprdUc+D8DhBNc/t4Ptm+fYvDhFszXmE3HlpYL84k55xpjuUcn+g1ojR30cpfNVT3nF2L5hLa89Y12vkT0Ota7tPVeo47DejtfNOtZXayhvUT31GirUOpbS3ip4a3vZUVDPk9qf8gzVVf448fbpZSmqpzwGslLWscYLjefyMa+y71XmrBO1f+WPgremlylWmQNnnvIYyFCQr8LQmkM5jtaRn7/GUrJOSQcDPS+zqO4EwHSyMcHkt37u8enHbFypHCf15kqlUqm8gPjG5z53eO3zn3n8/nvu+vLu2TO/fOuVS//l1Z3tsDkJTwc0hwDupBfVxcX4MTcTum114b63Pfz7ViD2w1y3zdYhjnWzfRM/9Hxk+wCyH0nG9m19z8XtZECPDeh9mmTHlIpsLnnd7rx2gAvTgO/90rO468o+vu2Ja3jZU9exMwvYmgdsxN0lB5euEeaLD+/zK5vA3gQbt04x2VGfeCvPG9bxErE1mFsX9kRf177YOswpVFd5S2kvYp+HdTH2OI7COval1lD+ODjOfRWs7VbGnifuYoSR6xcvX1x0UGsob5AXpEY+Zrk/5Rmqm3hVGWTliYZ1rcMYs/aYLlboHzfHfTxqfeaZ81hzn8ZUDrDKHMaIdeT7B8atUwx7X/L2U5h5tYxR5RZvjpcpvDlDj4vKQo4yl712KUNri9w9B8ewrnVQsNZQHhnoNQGYH4aNkyc2v/jX/oN/7R9/6O9/bG47lcpxUW+uVCqVyguQx7/whcMrn/rU5ce/8IXDBx59ze/edHj4/7u6sbk7Aa4BeCYAtzbAVhPCHM3iyji7GD90MwFA/iOvyEV6d7u3FnqfjPJjauhNhm6bfJdIFKyb+ixn29ni9rnow46pv+/8uUtR+2bH3POk20Mc03YIODkLeOjyPl7+zB5e/dQ1vPuLz+Di7iHuuLyPU8l3qfQ+vw58Up9emeDg6zvYOBkwOTvHxsn6WXYtqKddeXsyqN46uJH7Alnf7j9iexHlE0L3xw3kGB7HaI5jTQ/1mBWlx1fa8xizhnocag3lLQW9wYoqKD+W0nVUT3n1nB4Vtb8xrGON46b0GFVP+TVSvAuv6GXPZ9RxKz8Gbw0vs6iu8mPx1lHZWI+BjKH6ymMgG8sqa60yR2HW6r0VH+N+RnOE+UeYOo6SHQ11hvLnC0PHOZRjjR20X//OmrAxD89e3Jr94oc+9o36S+0rN4zj+ghbqVQqlRvMa9/zntOvfMc7Dn/jM5952+7e9A9vhMM7A5rvBpo75c2S7F+BRcb6nWIX7s22+n0riyHbR8T5fSvtRnbIzi+zR/sdNHZOdtMjbttiz/X3s9yHWK9Z+tQtIMfcrZW4bFs9d/nzHSsbCJgDeMWVPWzPgVc8s4ubrx3gZc/s4mACbCX3QUJyE6X3OZb51qW9jfMBp161h/PvvIqtW6ZJUhmk94Q7DkufxZkY4TxYv9T1T59EWjEA65c6DPsuVj2F6jNf6rCCt7Aec3A8RMacYNRrX+rtOKK8wvQDcVAOa/QM1k1cLx7oui7iZRbWZQ5Ln8WZaFHeonrKw8mMp+cs8t4gqm+9HUeURz/r1bw5KV6PZcyBeDtOaTOv0kMVmWcuwjLmPFifOTgeTsY8c0Oo5zgTLcwzB8djILN43bHHDydTnuF1R2by/QO83+FlCjaHuUhhltUy0aL8EGqe8im2Y8eW4/odK3DmKx/xci+LOB33/CulZI2SDgZ6XmYZ0Q2HDbZ3m8+88n/80dc3r/nIgc0rleMivW5TqVQqlRcJb3rve089deLEvfuHhz+6OcGZ+Sy8N6B5PewvZO/9K7D85NK/0L/wTfuH/Ycjjvs3AsynILZedoNgkbk3Gcj+09+r0inie/ug3j4fSxaezHP8wiXPXbeRPM/xb7PfxhxXdPy5y5/rBsCJAJzan+LEpMHrH7+M04dzvOzp69iZznBiupyTzk5vrsB+lhU3WHrzATQbGzj3xqs49dpdnHjgAM2mOb5KjnqKHJ9FmRAOjmeoLvPCMc2lA+uXOgz7LlY9huqWejuOKI+BLIX1mMMavcH9It9mdpxiMzuOKK9I+sGMeygPktlxipelqJ49Xjog4xSVKc+wXTtOGfvfv/IW1Tuil+es8h5szlFcxB5ztlGA6h7V23FKm3mVHqrIPHNYwVu8nsqUh5Mxz5xH0s+mZqKFeebgeAxkFtUd+14BJ1Ne4fVVRvxK7x9eNoSda8cpI7Le0JuHgjxlqOvlLGMupc1pjcoRqPnKR4ZyDHREJs+9MYxZo6SrOsozxnQjhw02D5tP3/zyEz922/905XM2rlSOC3vtplKpVCovIt7zx95z+nMbd52dX7r0hzY3J2cPD2c/GEJ4N4CTyC7qLz7B5Dc9Wh8duRGQ/m376b80+gZB+3f7XSip622Lmytt1Pt70TXHAgDsZog5nhR1I6Pp/liut3TxL/VckBtCvf30/15uq+du4bfaG0ovf3YPO2HxXSp3Xd7D7dcPMAmLr1zt59R0fNTvXInbm6cDzrxuD2feeB3bd9f/aWgQ+6JEmG9dFllhxyleZlFd5omTX/Apz2Bd5iA8c+j7YMbFqDnMW2fHkbHeonpjPHMRL0sY/dozX+rgeEXb76ap+evwzClY17je0PbtODLWK1ifOSx8FmWiRXmG6o7xxI0+ZxWqb70dR5THMssqmXBgXebgeJDMjlPYuaBQReaZg+MxkKV4PZWtwzPnYfrd0FvHZnacojLlGV63zWiFyhW8QvWVh85Wev/wMoWaozzKs16tcE4xao7yEZYzZ/Hec2RQgJqrfOQYc3nujaFkjaN2vCyltEcIM2Bzv3nyvntv/f4zv/SN37R5pXJc2Gs7lUqlUnkR8uEQNj78b79/+ze+HN4dQjgVZoc/hNC8JzS4Z9lafJJRF+7jjYP8gr8d819mv9hcflqi36Hi3VwpuLHSbTfoHUd/nvL8BsvSkZsyyQ2czinfW5scdzuQxyafu4W/+/oUp+ZzPPrUVZzfn+Ley/vYmAecOJx18yLpZ9beNruJsgjS0SJTN1didxM4+eAhLrx1Fyce3kOzU38Pi6T/9C5xfBZlQjg4nqG61ttxi/yCT3mG7dpxisqYT1ww4yJUv9TbcWSst6ge88zB8RjIEuhrz1yEZdbZcUR5RdLvNtUazDMXYRlzDK/XZr0K6zMH4Zkbws6x4wh7n4LfL4Z1mcM4T89Z8K7E69rMjiMFvldRfYbqrsMzh4VXEUWVmWcOjsdAluL1WMYcHA+S2XEJyZxseiZarLfjFJUpz/C6bZZVMpGwapbi9UZk8n0DebeHl3mweczB8ZEk71VHzCvC66+SKY9lJisyKMTOt2PGUMfLncw990opWWMdnaEchR2HOH1nd+PSiTP4D+7/zYO/biqVyrFhr91UKpVK5SXAq37iJx6+frD7Wkw23hRm8x8IIbwKCNsAmqHv1LD/cLCbAep3rhz19630xoC+udJm2Rr22NL92AfWwm6upMeUPUedR2/OciPvu4+7G/efuzPTOa5tTvDGp6/h4t4Ud1/bx/2X93HqYIoAIP40LvujvmA+u/a21c0V9D/Bh2RM12p/XNjWuYCNU8Atf+QZbJybYfN8fqOnwp5s4bD0WWyFHUeUV7C+dXbcQk69JV5msV07jhzBBzMugvWZi9jMjpWD4xmqO8YzB8cb5GuvPERmnR1HlFck/WDGPcZ6iIw5hurZ46UDMo6M9QrWdxyLuHS8RfXW4Ol5y5yH6jPPHIQ3rjdkfYXqjvGlDkuvYooqM1/qIl6WonrKw8nGeOaGSOb0pqu1mGcOjsdAZlFd78abCsZ6DzVHeeQZfd+IqEz5Idg85iKFWa/mzUFBbvH6XgaRMxdRjylCZSHe3FUzrJ67510pJWuUdOD0lLeU9hwCAMyByW4zP3XziX/jwT/+U/+f5k/8Qv2l9pUbgr12U6lUKpWXEN/7//h3z//+v/zcO8N0dtd0jp9oNpq3IszPxpzdIEj/4eDb/DtX4loQNxMgft9KN2aZurnSoHcc/Xz56a3n7U5blsdE5rHf69J7jpLj6yQ55mTAjxndvDPzOe67uocTYYI3ffMSTswDbr1+gNMHyxsX6efTtdxcYd78vhXEjNx0OXHvFKdfvY8L33UlsRXAPtEJAz6LrbBj5YZgc6yz4wRy+rl9iu3bceQIPpjxIF5XZdbbsXJwPIN1mcNIz5yAvu5w1ij1dhxRnmG6gbiO4/YW1mPHS7x0WMErbN+OI63P4ky0KG/xeipjnrjR56xC9a2340iBzyqZcFBd5pmD8Mxh4VUkYRNKHVbwDNVVHk42xjPnYfrdUK0zxjMX8TKL6raexlQ6HgOZxeuqTHj53gE9R3oPNoe5FJUnPqtkIsHLGEN9lSsPJ2u9inVQgJqrfOSYcvecK6VkjaN0lGeM6RLS6c0caK5PwpkLG//+/f/y3/2PmuZD9UcnVG4I4lJSpVKpVF5qvPIn/8ibr0/Dy5rp4Y+iaV6HEB5JP6405iZAdPk2+26N/g0CejMh+ZFgqe+2yXfNeDdX6M0Q9qO94na2uD1Osh777ph2I+t3BXLMvf30/waAi4czXN+c4F2PX8bdu4c4sz/FfZf3sD0POJg02J4HeWNkLTdXgPwGC7mJ4vmd2wMuvPMqTr5iD5sX6new9MiebOGw8DSy0o4jyjNU13o7biGn3gLlFbZvx8rB8VhmXcXrWlS31NtxZKy3qN46PHOCUa89cxGb2bFyHkm/21RrjPHMRbws4nXarFdhfeYgPHND2Dl2HCl9n4oob/F6LGMOuZfnK/LuIKxf6lDmexXVZ6juOjxzWHgVUVTZejtOUZnyDNVlnrmIyqy34xKSOdn0TLQwzxwcj4HMorqtpzGVjsdAZlFd5ZFnK79veJkHm8ccHI88y6qZaFFeMdT3cpYxl+K918igADVXeQxkkaGOyN3zroSS+evoDOUo7Dhk01sxOWhwemPyN+//vtv+T5O/9tVdW6tUjoMNKyqVSqXy0uSpT37m65c//ZlPvfO7vueXnr6+9+mA+R6AQwTc2iBMMOn9xDDA3iAgLh2wmwnZeqSf3pjor738SJXtO7kRk+1Dbdtiz5GbMuq7eMyxxq6F7Tt12wG4eTrFy68c4IHdQ/z4F7+F+64e4KHL+7hp97D7sV8bgd9AWStj1idPZANgdn2Cg69vodkATjxwQJ+TlyQjnlr5haOVdhxR/hiQp4zyN5obeRxH3Vfp/NLeMXPDX/vjei9Rx6u8orSvHkfpfMVR50eOus5R53sc59pjuNHHMWZ/Y7pjUWurf7MUo8oCtYbyDNVVfh2o//5XYcxxjulGxswZ6NKYygFWmTOGda2/6jqrznOgS1Lp+FXx1vMyxlB/KPdQc5UvZWi+yOXnq3Wyjn0MrTGUD+BOD0A4bBD2m0ubZ/CLf/nTe/u2UqkcB+v8Z7xSqVQqLyK+92d/9vzXLl9+aPfw2nvnIbxjArwxzMPFpmm2Yqd3A6HbTj7yJMFis/97VVIPcZOhSURvqvqulTZjxwZ2kyTZr2X45kr/493SY/mYuj+WLlX2htJ91w9xIgS88tk9nDuc4v6r+7iwe4CteXIM5NO1+q4TduOll6fbYo3su1ZaR9cR37kSxdYtAWdeex1nX7uH7Tvrj8E1p9AS5luXRVbYcYqXWVTXejtuIafeAuUZtmvHkTHeuEDcIKzPXMRmdhwZ6y2qxzxzcDwGspbRr3upt+OI8gzTDcR1HLe3qF7iexXbt+PIWK+wfTuOtD6LM9GiPIN1mYuozPjR56xC9Zkvdej7XkX1GV6XZcxBeOaw9CrO8Io2s+MI88x5qP66PEhmxyUkc7pNbx2WMYcVvEL1W5/FmUhQmfIMr6sy4eX7BvQcYCBT2Dl2nKIy4nuK5B1eZhnqrpIzl6Ju5FJZiDdXZcqnDHVE7p5vpQytMZRjoONlKaU9g5xmg8MGO7Pw5bu+7cRbzv73154waaVyLIjLSZVKpVKpLHjTe997avfWEw/sXtl/rJnjO+YBb0cIdzUNTsTO8h8T7/etoPv0Y28oQPwy+962/bFgR7y50pvXL3WwmyvpPtJxkwwWf5nja4gDsIWA09M5bpoGPPzsdZydz/HI09exPQ84v3eIkPS7z47kE7a6MbLqzRXYz6p2fXUTpc0y34oAYONcwPm37uLC269i48xL/Efh5i8Pd1h4GllpxxHlGarLPHHktFugvML27TiFZQOu22Q9D9ZnDsKXOjjeonrH7Q2jX3vmSx0cz0i6wYwzVMY8c3A8Q3XtMdMBGUfGegbrMoelz+JMtChvUb01eHrOMjcEm1PqUOZ7FdW3qJ7ycDLr7ThF/ZvFUEXmmYPjMZCleD2VMc9chGXMeZh+N/TWsZkdp6hMeYbXVecGlY7HQGbxuiojnr5ngHc7vMyDzWMuojLje8PCOcWoecpHWM5cpM1kRQYFsLnMpXi5l0VER55vpQzNH8pR0BnKI6U9QjY1Ey1T4MRh88zF8yfffuu/vPJZG1cqx0H9sWCVSqVScfnG5z53+ORvf/rJ97z/j/7O5em1XwkHB5/CpHkGIZwEcAYhNE3TdP+e9O5TkJsNSG5aLLuNf3PF3ljpAt5NfZaz7WzxBflxJmP2Y8G6fvJYEx83ttvRa67u4YHrh3jD07t4x+OX8eiz13DvlV2cPZzh5HSe7VehbqwwhvJIrzdi/aGvABoA8/0Ge1/eQbi2gc1zc2yee4n+Dhb/qaJk50TpGqW9sRzXumO5kcdx1H0ddf4Y1rWvo66j5itvKe0dNy+041A95ddEtnwmWpQ/Lsj+Bv7JKqd0ndIeoTf1COsMso611cXz54J1HIhaQ/kxHHGNoulFpZYxXYW3hjo3qBxglTljOO71h2D7Zw6OJxRXsw+dAxQvTLBz7XgMR5mLFeevMici5q7t36fjpuQ4SzqCbGom+gQAzXwSNk9M/sFf/frhF21eqRwHY98uK5VKpfIS5v0f/vDG+wH8rb/7d0//Qbj2itkcPxAODn9sNsejAPabBmfMfYSOeMOB30Th37mSrpX9g6W+c6XBYr38EPKbHnHbFjNnvnOlHdD1kh8XljoA2G4C7rh+gFMB+I4nruL0bI5brh/g3MEU2/Pld3B0q5IvQAP4p211g8V+Nwpsnm6LNejNFfPdKTDHlu2jFanfujjH6Vce4MJjV7B5do5my674Ioc9XOYi5HwA2JNNUF6h+tbbcQs57RYoz2DdUgfHY5mFZLsY1S/xqgMnU96ieswzhxU8YdRrzxyEL3UeST+YcY/j9hbVs8dLB44D8XZcgp1jx5GS96gU5Rmsyxwcjzwbdb56qL71dpzCMnu82UYBqrsOzxwWXkUUVWaeOazgLaqnPJxsjGfOI+lnUzMxwkVYxpyH12fnRiYSVs1SvN7ITL5ngPcBx3uwOcxFRmTd0JuDgtyi+spHWM5cpM28ih8K1BzlI17uZRHWKXmMQ5RMHup4uZdFSjqCbGomOGEObF7HwebOxr/z8Af+wn/WfOhDL/Efk1C5EZDLSZVKpVKp+ITFd6uEt73vfSefmkweRtj/ofls+t2Yh+9o7y4sfmRYdxMC3ScidhMFyc2V3k2PZCP7Byv50V+dan23bffRbZv92IVaFp7Mc/zCLY9hu1lsvO2pa2gQ8Mgzu7j/+gHO7y9+30izeD6TldrZ5EN1t02+slM3RuzasHm6LdZYCJOpmyhtlvlW2HUnJ4Azj+zj7Buv49TDL7HfOWifjAjz4vnLxQjnofrW2/Hi5ecoz2Bd5nA0322qLkN1mS91EJ45htdjGXNYwRtGv/al3o4jyivafm+aXcOOU1TGPHMK1U28e8xjHBzPYF3mIJ5fKlqUt6jeGvzoc1ah+tbbcaTA9yqqz2Bd5jDSM4elV3GGKjLPHFbwDNVVHk7GfKnzMP3eUK3FPHNwPAYyi+q2nsZUruAZXndEJt8vkHc7lB+CzWMuUpBllUwkeBnD64/NmEtRjwdKFsLmMpdylNzJ3HOthJL5Qx0v97KU0l6CnCKDhLYzuTaZnTu/9e/d+5v/zn/aNPXmSuX4EZeTKpVKpVIp5/0f/OD273/x4/fuHuCx6cHhO2cBH2hvNpxa3rtYfNphN1ea9oZI6nrb4uZKGy1V+0f2nSMAwG6GmONJ6R+nOb4GvfXS49xCwBTAPQdT3L43xZn5HN/1zcuYIuCWvQPszAImbT39jJjd2GiHvU630f90aW+gqHVhs2Qb7BiWQe7X8J0ri/HCXHjrPm5611VMLsww2batFyHqITqeRlbacUR5hepbb8fLUyBHeYXt23HkCD6Y8SCqO8aXOjje4vVYxhxW8IbRrz3z1tlxRHmPZE4w4x7MM4cVPEN1W9+LWZc5rOAZtmvHKaXvU8opVPeIfvT5qlB95ktdpM2ySiYEqrcOzxycY1aoovV2nKIy5RmsyxwcDyez3o5LSOb0pntrsYw5rOAVrK/eHyD6cDwGMovXZRlzcN4zoOdI78HmMAfHI896Q28eCvIUr+tlEDlz6HtaobIQNpc5i9fxMojc+++klJIFjtJRPqWkI8imZkIQe3OgOWzCmcnGLz7wE3/+J+t3rlRuBOKSUqVSqVQq4/nwhz+88cH//u88FMLGw5hP3jybHn5ghnBvE3CiabCF5KZF70aHd3PFubGC9CZJMhi6uWLXYzdYlo7clElu4KD9HSqHAF65e4D9jQZvfvo6bts/xN3X93H2cIoTs8UthMa70UFvYOSfJwNAv7qj843vnNoWa6ibK72xObbcJ9udX442zwIn7p3ipseu4MQDB0nrRUz+0iywnjx3HVbacUR5huoyTxw55RYoz2Bd5iA8c+j7blN1Gao7xpc6ON6iemM8c3C8Qb7ucNZg3jo7TvEyS9INZtxjjGcu4mUpqmePlw7IOKI8BjKL7dpxpPVZnIkW5Rmqyzxz4F6es8orWL/Uocz3Kqpv8XoqY545+F5FGV7RZnYcUR4DWYrqjfVwMuaZ80j6vaneOjaz44jyGMhSvJ46L6h0PAYyi+oqD57J9wvwPuB4DzVnrEc/69UK5xTjzVHZWI9lRitUFqLmKo+BDAO5k7nn2RAlc4/SUT6lpCPIpmbCwXQn+w12JpN/vnn75gce/Oj1b/bTSmX9kMtJlUqlUqkcjRBC88Z//Y/eee3ytVdtb+KW/YPZvx4Q3to0zUkAO+j9AzT8+1Z6Y0B/10qbZWugfzOk58W/hOzmSnpMDQLOz+aYAnjF3iHuv3aAk7MZXvvsdZwIofuxX+lnPXXzgvp2o9frNvqfIO0NFLV259Q2O45FkI4WmbqJ0mb9dZNBNmc5ajYanH1kD+fesIeTr9pHs5kf+4sG9dAcn0WZEA6OZ6iu9XbcYl/vhbSiADvHjpVDme82VZehuqXejiNjvYX1mIuojHnmCPR1hzO/1NtxRHlF0g9mnMGyUhfxshTVs8dLB2ScwjLmPGzfjiOl71ERL0tRvTX40ecsQ3WZZw5lvttUXYbqHtXbcUqbeZUMVi51EJ45D9Uf6yGyUudh+t3QW8dmdpyiMuUZqtt6GlPZwjLmPFRfeeSZfK9A3u1Qfgg7z45TvAwrPu/KK7z+2Iy5iPdY4AUFsLnMRbwMq+fueVZCyfyhjpd7WaSkY8imZMJBdJvDBjvAb89uetl3PvIvPnvF5pXKuhGXlCqVSqVSWQ8/8zM/c+Jj4fGHMdt61cHe9P8Q0PwQQthtb7QA4vetdGOWqZsrDRbrpa7bXn76GnNzxc47M5/j9HyO2/cPcWE6xxufvYazhzPcuj/FqcNZ9yO/Fizmpp/71A0M6s3FqqXPP0nS+caDfAZV3V6PeXsDJfG9cdxuRd/bowE2TwXs3DXDxe+8ilOvfBH/Dpb8oXMXKblwaccR5Rmqyzxzy1MgR3kG65Y6lPlgxkWwPnMQnjms4FNUR3mIjDk43jD6dS/1dqzcEO2cbqpaY4xnDo63qF7is4oVdhwZ6xVpX821z20KlY63sB5zEZUZP/p8Vag+88xBeHu82UYBqntUb8cpbeZVeqii9XYcUR4DWYrXYxlzcDxIZsclJHN609VazDMXYRlzHqrf+izORILKlGd4XZYxB+f9AnoOMJAp7Bw7TlEZ8Z0iWYeXMbz+KlmBzyqZGIE3V2XKp3gdkbnn2BAlc4/SUT6lpGOQU2SQ4HRCADYCsHF18yvn7936/rt++eqnbadSWTfiklKlUqlUKuvlfe9738nf29x8CJv7r987PHxvmM5/EghPNsDNaJb3JNgNk+wfK+fmir0ZsoD8aK+4nS3edyfCHPtNg7umM5yYzvGq63t4+dU9nJvOcMf1A2zOA07M2W2ChUm9vHnBsnbYm99t2NlkPvGdU9tiDbu/xfEtXLaW9Ml25/NjQwjApMHJhw5x87uu49Qje7bxwoc8bMDxWGRZbIUdR5RXsH6pW54CRloxgO3bcWSMNy4QN4jqM2+dHaewjDmG6h23T6CvOQbmqsx6O44oz0i63SabzxwcD5LZsYfqsuPNBiMdHK9gfcdlUSZalLeonvIQGXErnbMM1bfejiMFvldRfQbrMgfHg2R2nML+rVKoIvPMYQXPUN11eZDMjodI+tnUTLRYb8cpKlOeobqtpzGVK3iG11UZ8fK9ArwPOH4INo+5iMoSn1Uy0aK8hzdnTGbHljanNSoLUPOUj3i5l4Hn7vlVireGl0VUR/mUko6ATqUyYSjHotNMG2wHPLs12fr+hz6z+2u2UqmsG3JJqVKpVCqV4+PDH/7wxn/w9/6/DzbzjVdNDw9+BCH8VECYAc3JBtiM/zDFmyXJX+1g+amq1203hn7fCkbcXLn7YIqdEPDGy9dw8XCGRy9dBwCcO5giAIs7Qu3h8M969sdjLUfKI2Zk3YXP96TWhVpbjOU6zMubKMon273MmHb+5CSweTrgjp+8hO1bp5icfJH9LkL7RCiHhaeRlXYcUZ7hdbMXNYecnguUZ7Auc1jdh2R7FGwOcyDejiNjvUX1mGcuojLlE+TzyRxG+lLnkfTlseIGeIvq2eM1roM5rOAVtm/HkdL3KOUUqntEv5b3KTh95pnDsM/iTAhUbx2eOSy8iiiqzDxzEJ45D9ZnLqKyMZ45j6Tfm6rWYZ45rOAZXledF1S2qEx5htdVGfErvV94mcLOseOUEVlvOGKei9f1MoicuUib0QqVBah5ymMgw+q5PL9KKJl7lI7yKSUdA51CJcHrJVmYNtg+mFw/cSL86Qc/ffi301qlchyQS0qVSqVSqRw/IYTmNT/5o/eErfkrwmH4wVmYv3cyC3cEhJNN02wP3VyhN0vE71tBwc2Vpmlw2+EhntjawmOXruLm6RRnpnO89tnrODudYTKf40QgNyDaIf+sl906yOd7/hh+LBhsnm6LNdTNFbqO8YhZK/tzbHO5r5icetkUZ1+9jwvfca29m/UigDzsDpuR563DSjuOKM9QXeaJI6fbAuUZrMschGcOfd9tqi5DdUu9HSsX8bIU1mMOa/SG0a8786UOjmck3W5TzT9un6I6xrvHzBxW8Arbt+NI63vxQLcI1WWeuYh9TlVXeYXqW2/HKSyzx5ttFKC6Y3ypw9KrmKLK1ttxZKxnqK7yEBlzIN6OS0jmZNMz0cI8c3A8BjKL6rKbK5lIUJnyDK87IpPvFci7PbyMwfrMRQqzXq1wTjFqjvIQGXMpbZ7VMjECNpc5i+oon2I67rlVireGl0VUR/mUko6BTqGS4PVYFoDmGuY3b09+5q7PHf5XNq5U1k29uVKpVCqV55y3/Mz777h+ePVl89nmY2E+fR9CeKBBcwrAzuK7UQzJTRQc4ebK5gYwmwN3T+e4c/8Q52czfNeTlzEHcMvhFGcPp2gAzNvvUqE3H9gXjUDXSDM633jErFW9XreR77F0bdg83RZrLITJzE2QYZ9sdz7bC51/4q6Ac2+5irOPHmDz3CxJXqCQhw34PosyIRwcz1Bd6+24hZxuC5Rn2K4dR47ggxkP4nVVZr0dKxfxshTVY545rOAN8nUHWcOOU2xmxxHlGUm321TzmWcOjsdAFlEddrzZwHEQnrkh7Bw7jrD3KIg+cwzVG+uRZ/J8VV6h+tbbcaTA9yqqz2Bd5jDSM4eFV5GETSh1WMEzVPe4vB2XkMzpTffWspkdR5THQJbi9dR5QaXjMZBZVFd58Gz0e4XyQ7B5zEUKsqySiQQvswx1vdxmdpyiHkdEBgOoecpjIMNALjJ5bpUyNH/VXPmUkg6BTqMyYSgH74QAbO5iev7szs/e/e3X/6vmF3BoO5XKOtmwolKpVCqVG83XP/7pq09+4vNfufN1b/7kxkb45e3N8FvzOe5Bg3sQwm7TNFtdWX3nSvwOlNQB3SeuON4AcLJpcO/+IcLGBt77rct41zPX8MbLV/Ed37qKW6dT3DSdYWc2R9PO69ZMfoZYtv8MbhnpuqugboqMubHiotZPto+TwysNDp/awtb5OXbumtr4xcFRn0w1X3mG6ipfylHns/88jrDmSlPZMcBZTPlSSuernvKMMd2xsLXHPpeW0l7E7k/NV34sa1pncBlVUH4speuonvI3GnMc5J/FBcqPpXSd0t4qHOfa66L0GEt7q6DWHuufT6zrGNexzjrWuFGQY5XvFeuG7Yc5OB7HlI3BW8fLVmGd6w2t5eVeBp6v5bzy1vCySElHscJcOoVKw1DHyxugOZxg50Tz1avN637pr37uG/XmSuVYqTdXKpVKpfK84YlPfGLviU/87jce/b4HPn/t2tZv75zY/Mfz2fwUgFeGgGtNg217E6XbTnz/WlqDBsBN84Az84Bv2z3Aa6/u4vVX9/BHv/EM7t7bx8PX9nDhcIbNdsaYmxWrYq/3ZQwWlsibPuSmTfa8rYn1PTN8rdk1YPbMJjBvsHV+hskOa70AeD4f9jpPiHXCnrOxx5qsMXYqII5hDGo+OxjVvdEc9Tie6/kRuw57zteF3dcR6B3mGtctgu2Puec7x3nMpWuX9gi9qUdYZ22oY1D+OFH7VN5S2jsK69iHWkN59v6mujcAumsqHY+BzKK6yhPcj/teNpZ1rpXQW9bbh5cdN96+28yrjGaVxVaZEznKXI+jrOvN9TIU5AQ6hcqRFKwxmQFNCKE5wDfuf+XGL37o45depP93XuX5Qr25UqlUKpXnHV/4lS8cPvHJz331T/zoT37uS5ef+uTscPr3sNHsAHg0NLg6AbbTfgNk39GyEwJOh4ATAN5++Tpetn+A9z51Ga++todvv3QND+7u4/RsjjOzgk9ohOFZfiNN6c0cNZ18xbfOmz5DqJsz3Ta5oSMfi4CsAMTvYLm8ickOcPLeF+j/gKQenEL9SI3joHRHoreW03AdawwQuj9GwF63sWsw2BpsX+uA7WsNjH7dx/bXzTr2v441xmDPibH7H9sfSfHyxUWBmq/8cXGc+zvq2mPnq77y6+C41l7HumoN5TGQpZT2BEXTi0otqqs8Q3XHeo8xc1RXeQxkFtVVfhXUWsqjn3m1I+EtrDLlPdo5dCqVR+Ao660wd/TnpZSSuSUdxqrzBrAfXYpRx6M8owFw2DSbk41v3fSu7/47H/rop18EP1e68nxm5fO9UqlUKpUbyVt+4kcf3m1m9zfz2Y/NEX4cYX4STXMO7T9mzaTB+dkUlyYTvOX6Hk7P53hg9xD37B3god19bM7nmIQGJ8K8W7P7jGZ/Obv59Kuy5Xz1ee8I67bDXqfbMOvYuQnuPtNtp0d/LJh9zhLfG8ftVvS9PVpnfpsFABsnG9z02HWcf8Mutm56gX1WJg8ZEJ48Z1yMcB6qb70dt8gvGpVn2K4dp7CMOZDnUvUUqs98qYPwzDFUb6wHyezYYfTrznypg+MZSbfbVPOZZw4reAbrGieP2Y4jY72C9R2XRZloUd6iemvw9HxlzsPr28yOI8wb1xuyPkP1jurtOEV+BiJ4RZvZcUR5DGQpqsc8c5ExmR0PkfSzqZkY4SIsY07hddssq2QiQWXKM7yuyoin7xPg3Q4vU9g5dpyiMuN7QzUHAxnD66vsCJ5WqCxAzRvrI17uZPK8KmForpevmkVKOoZsSiYIQ52hHKZz0ODM1uY/OP3A2f/j7f/wyW8mSaWydurNlUqlUqm8oHjb/+V9N+0+fu0RzMMPbs2bP76HcPJV08Pzp6ZznJnN8B3PXsN2CLhr/wAXpjNshoB5WPxC+hT7+ax3g4LdTFC+3bDrRTM4P45tRtZd7tPOJvOJ75zaFmuU3FxBd9wLm+2jFX1vV8jXTfcXx81GgxN3TnHhLXu48I7rrUwmPZ8hDxkQnjxnHVbacUR5hupab8ct5FRboDzDdu04cgQfzHgQr6uy1Jd0UpS3qN5xe8Oo1505CF/qPJJ+t6nWYJ45rOAtqseONxsIZ8cpXsawfTuOtD6LM9GiPIN1mUO5H3Wueqi+9XYcKfBZJRMC1mMuojLr7Tgy5sYK/HUymMMK3qJ6ysPJxnjmFKbbG6p1rLfjFJUpz/C66rygcgXPUF3loTP6XsFcxMsUbA5zEZUlPqtkokV5heorH2E5c1jxcZSg5iqP9Wf0fCqlZO5QR+XKR4ZyQjYlEwKv52UpptfsN9iaNh975RcP3tI07Y+4qFSOiRfKpYhKpVKpVDrCY4/d8j9sHj72B6dPnn7oqUt/8pnN5tGbDw9P3bV3iNPTOZoQej+dKnR/9OmUvaDPbiYYD7NuvvzCqPmDnqy72B/ZE5sfx+yYxViuw7y8iUJ8Msj3bwybL/z2zQHnX7+P82+9/sL5Dhb7BESYL704YccR5Rmqyzxx5LRcoLzC9u04sqLvYtVjeF2WHcXB8RbVG+OZg+MNo1/3MZ45OJ6RdIMZ9xjjmYPjLV6vzbKKFXYcGesZrMscFp5GVDreonrMM4fcy3MVeXcQ1i91KPO9iupbVE95iGykY5FElZlnDit4i+qty4NkdjxE0s+mZqKF+VIX8TKL6q7rfUF5heqP8Cu9TyjvoeYwz1zEZL3hiHkuXndsxlykzWiFykLYXObg+BSvQzL3nCrBm+9lEdVRPqWkk0DrVBpUR3kG6TaHDU4Bnz1/8cSP3fJrVz9j80plndSbK5VKpVJ5QXDtba+7G6eApy/Pf+igmd/dTJtXz+fT75mhudog3N6g2bY3EpB+1sqjJCu7uQKWtUPbW5DdOsjne958gZoeb4p93Gpd2CzZhjqGRdD35EZHemzZut0fdo5tevPzfWKy+Bhzzx+9ghP3HWDr4uz5/cnGPrCI8lhkvZh1mYPjGarLPHPLlygRZlyCnWPHykVYlrhuk/UUqlvq7TjCPHMK1mUOa/SE7HWHM7/U23FEeYbpBuKgXERlzDOnYN3E9eKBruvgeIXt23GKfX9qHUV5i9djGXPIPT1PI15mUV3mmUOZ7zZVl6G6R/V2HGm9ijNUkXnmsIJnqO4Yz1yEZcx5qOc2Ewk2s+PIWM9QXXXcUNLxGMgsqqs88ky+TyiPgUxh59hxSmHWqxXOGWSo6+U2s+OUNqMVKgtQ85THETLwXJ5PJZTM9ToqUz6lpGPIpmSC4HW8LEX0JnNgHhpsXsdXN+9ufvjhXzn8LdupVNbJ8/kSRKVSqVRewnzjta89fWlr7+RNGzuPXD+cP7C1Nbl3/2D+h0MIWyHMHwUC0Ey2YT5XyZsJ5MPXMiu7uUI9u7gEdI3B+eqYW9XrdRumb8fpNvlkT9d0ji+7uZK4bC3pk+3O58eWvRaJ742TwzpxxxxnX3mIm77vCjZ2yJrPJ9jhMYeFp5GVdhxRnqG6zBNHTrMFyjNYt9ShzAczLoL1mYvYzI4jzDOnUN0xnjk43jDqdWcOwjMHxzOSbjDjHspDZMzB8RbVs8dLB2ScojLlGbZrx5HS96eI8gzWZQ7lftS56qH6zJc69H2vovoM1WWeuYjN7DiizgGFKltvxykqU57BuszB8XAy6+24hGROt6nWGeOZi3iZRXW9c0IFzDPnofojPX2fYC7iZQo2h7lIQZZVMtGivMLrq2ysxwqPowQ2l7mIl2EgFxk9n0rx5npZRHWUx0AmyKZkQjDUO2oOAIcNtqa4dPGWre+/49d3f9XGlco6qTdXKpVKpfK8ILzpTVvf2tk5ceu/+BdXvvTGR39m0uDaLMy/B6G5fzafvxUhbAfgVNM0G8vPU4ut9POVvJmQ66WyF/TZzYQ4tlk7tL2hY1MezroLT/ZUuC5snmzDWUfdXMnmt77bjj4Z9PdvVxDzk0ytu3Uh4JbvvobT90+xffdh0noeQR4uIHzrsigTI5wH65c681r0UJ5hu3acojLrzTgQNwjrMwfhmYPwzClYlzmM9MwJRr3uzIF4O07xMkvb7aaoucftLaxnXG9o+3YcGesZrOu4LMpEgpelqN4YTxw9V5kbgs0pdSjzvYrqW1RvrAfJ7DjiXUi3eEWb2XFEeQxkKap3XN6OS0jm9KartZhnDit4Beu3LosykaAy5RmqqzzyjL4/RFbNGKrPPHMRe/xyYPAyhuorD5LZscV7H5HBAGwecykqVz7Fvh4lczyG5nu5ypRPKekYsimZIHgdL4uUdNofC3ai2XgGk/DHX/GZg//B5pXKOqk3VyqVSqXynPHMY49duADsffXwytsnoTk/Ozx4BWb43jnmtwLNnfP5/DSAszCfo5bb9mJ7/mmrMybqDbOL9ukeuEfMWpXvGYPHp7L0mHudbiPfG50/sE87VmuU3FwZ9mYM++xEqeYvtvrHm2wD2Lkp4OLb9nDTd13t/c6d5w3k4QLCk+eLC+HgeIbqWm/H5nXI8DKL7dpxZEXfxaqnYH3mQLwdR8Z6i+qtwzMnkK8988yBeDuOKK9I+sGMezDPXERlyqd4nTbrVVifOQjPnIft23GEHWuESeYUrMtcRGWJD2bcwZyH6ltvxykqU89pJgSqd1RvxxF1vB6sfBQHxzO8rsrG+FI3RDKnN12txTxzWMEzVLf1WZyJBJUpz1Bd5ZFn8t8y5N0O5T3YHObgePSzXq1wziBed2zGXKTNaIXKQuxcO07xMgzkInPPpxLUfOVTVEd5DGSCbEomCF7HyyxD3TafzAHsTQ5vvu3UT9/xa5d+sWkGZ1YqK/N8vPRQqVQqlRcp4U++/wxed3H/qf/yX77p6nR6anNz44HZbPpuhPnZgOY1YR4uALil63cb+WX4xTj9s/XqZoJdwFlf3WSgXv4fV/6xDfp2o9fD4lgtdH4cs77aVuuw55Td7FA+GfT7+bHZ1wIj1z1xa8Cpl+3jpsd2sXPrdFl4PmAfWIR5dV4xWeo8WL/QkVNsgfIM1mUOwjMXabOu4nUtXtdmdqwcVvApXkdlzDMHxxtGv+7Mlzo4XtH2e9PsGnYcUR4iY46heom/IcersF07jox5f4LjLV6PZcyBe3q+Mueh+tbbcQrLEteLWZfh9VTGfKnD0qs4QxWtt+OI8hjILKrLPHMY6Zkbgj23ah3mmcMKnuF1x74vQGTMebA+cxGS0feHCMuYG4LNYS5SkGWVTLQor/D6KhvrschkLAMHNUd5HCFDnrvnUQlD871cZcqnlHQMvSml872el0WGOjafA5uHze6Z05O/eO+P/YW/1nzoQ3PTqFTWRr25UqlUKpVj5/r3fu99l5/51is3Tm6c3ts7fF8ICJjP3zAHbg9hfhJoTjRNswGQC/zsonqyZT9H2ZsJ3cgWe5m+uQK77+z4ku0Mva7tZxlZd+HtTDKX+M6pbecxp/vstuxzlvjeuDvuZLvz+fHp+cQng9Tv3BRw7g17uO0Hrib2OYY8VGDY92LWZQ6OZ6iu9XackJ1qdlyCnWPHykVYlrhuk/UUqlvq7Tgy1ltYjzms0Ruy1zxyFF/SKcH0A3EdzDOHFbzF67VZV2Fd5rCCV9i+HUfYBbFMtCjPUN0jenmuIu9KvJ7N7DhS4HsV1WewLnMY4e04hZ0DClVknjms4Bmqe5yeOY+k35uq1rHejlNUpjzD67JzIhMtymMgS/F6KiNevj8oj4FMweYwh3LfG6o5GMgsQ12VM88cll7FOhjAzrNjy6q58nDOpyG8eV4WUR3lMZAJ6BQqE7zcyyIlHeS9BkBzfRLOnN/+yw98/Npf6KeVynqpN1cqlUqlsjbCY49tPgGcuO2f/andp7/j//7WZoJrVw/nP4x5uKcJeHA2n70lAMAcJwCcaJr8hzdlNwrYRfVkq+fJJ9rOmMiblx2D59sNtefB+XFsM7Lucp92NplPfOfUtlhj7M0Vu8fQ/WH3bZrea83WTURvTgjYuSXgwlv2cP5Ne9i+OEvS5xD7AJTDwtOIPjkEL7OorvV23EJOsQXKM1iXOQjPHPo+mHERrM8chC91cDyDdZnDGn2CfM3hzGf+KM4j6Qcz7jHGMxfxshTVs8dLB2QcGesVtm/HicuiTCR4WQrrMQfHI8/k+ao8Q3WZL3Xo+6ySCYHqrcMLx7RElZlnDsIz58H6zEVUVurteAjT7w3VWsyXuoiXpahe62lM5Qqe4XVVRvxK7w9eprBz7DhFZYnPKploUV6h+srDyQY8jaksQM0b6zGQgefyPCqhZK7qKI+BDAW5IatnwuDlXpZS0hOdSQCwh/mpM5P/4sFX/ej/ufnIR54nXxBWXoxkF7UqlUqlUhnD577/+3ce/p//5/1vvfP1r945vdXsXt7/9oNp826E+UEIeBdC2AzAQyGEAzTNdpynPoTSC/zswnr2Z+vJwqH7g3jk69NjUF5eZPCPbdCTdRePw1ox3/jOOWO1jrq50hub4+uvm2ynPjsaMV95tW4MmgZ3/fA1nHvDHjbPPsffCU4eKuD7LMrECOfB+qXOvA49lGfYrh1HxnjjAnEuqqs8SGbHEeaZU7AucxjpmRPQ1505jPB2nOJllqQbzLjHGM8cHM9gXeN6Q9u3Y+XgeAXrM4eFz6JMtChvUT3lITLiRp2rCtYvdSjzvYrqW1RPeTiZ9XYcYa+/hypbb8eRsZ6huspDZMyBeDsuoZ1DpzJZ6rCCZ6ju2OPGCp6huiM8fW+IsIy5Etg85uB49LNerXDOIF53TGbHKW0mKzJwYHOYS/HyFTL3XBrCm+tlEDlzKUM5IZuSCYLX8bLIUGcoBzC5PsGZncl/c/8dd/zJ5qNfetbmlcq6qDdXKpVKpTKK8MEPbjYf+tD06be//f7r02s7p7Y2b9+bTr8rYOPcfD59GwJeBuAOAJiHMGuAxY/7StcQH4bszYCwkMvt1Ldb/XXzhTuTR0mm17HTsqwd2t4CvS7sYypYNz3elGwu8Z1T22KNhbDHthjTtdSNsFb259imN5/sMxlkc9pw55aAc2/Yx8W37GL75ufwf1iyBxhhnjxXXIxwHqrfe7KT7QRyii3xMovt2nFkjE9ct8l6HqzPHIi348hYb1E95pnDCp4gX3vr7TjFZnYcUV7R9rtpaj7zzGEFb1G9xGcVK+xYOTheYft2HLHPrfGDTqG6R/TF5+kQrF/qUOZ7FdW3eD2WMQfi7TjSehVTWLnUYQVv8XoqO6q34yFMvzdUa1lvxxHlMZBZVJfdbMtEgsqUZ6iu8sgz+d6AvNuhvAebwxwcjzzrhiPmuHjdsRlzkTbLKpkYAZvLHBwfWSF3zyWPoXlevmqGgjyBVqk0qI7yKSUdDPeaOYCDBqfP4P/94MenP1t/oX3lOKk3VyqVSqVSRPjw+7e/8Vc+/7ITp7a2D65P342A04fT6bcD84eaZnIB8/ntYdJs9eZ0G4ut9BON+iBKL/Lbmx/JVn/NfNHlGsKTefQYlGdfVAJdY3A+23/3h+l1G/p4Yed4z4ndFseX3VxpHV2HvdaJ6Pv82Lx1+8eaDOy65nibzQ3c/p6ruPDmPWxdeI5usJCHCghPnisuRjgP1h/hmObSwfbtOMI8c8h9IM5FdZkvdVjBp6iO8iCZHad4WYL9769jjC91cDwj6XabbD5zcDxIZsceqsuONxuQcWSsZ7Auc1j6LM5Ei/IW1WOeOXA/+lxVsH6pg/DGdUPWVajuUb0dp6j3fYYqWm/HKSpT3qJ6Yz2czHo7HiLp96Z669jMjiNjPUN11blAZYvKlGeorvLIM/negLzbobwHm8McHI9lllUykeBlFtVVHk6mPBYZjakcQM1RHuvP3PNoCG+ul0Vsx44ZJR1Db8rQfC/3skhJBwW9Nm8OG+yEyW+/4vN/4U1NU3+hfeX4qDdXKpVKpUIJP/PYiSe/eOleAJgezL9nvrFxEKbz72im83eFgB0gXARwEk2zaedGus89AxfGU+yF8Vb255ut/tr54qH7g3iQ9dkxKN9u5Mv7xzboyRcfAYtjtdD5xndObMNZp+TmCszx9Y8j2U59toKYr7xalxzvyTtmOP/6A9zy2HU022S/x4na3YDvxazLHBzPUF3r7ThCzlPA6St6L2CynTLWgzyXXteiuiVedeBkyqd4HZYxhxW8gby1+HNZZp0dR5RXJP1gxj2O21tUzx6vcR3MQXjmPFifOSx8FmWiRXmL6q3B03MVvCvxummmegW+V1F9BusyB8eDZHYcYa+/hyozX+rgeIvXU9k6PHMebT+blokEm9lxhHnmPFg/cVmciRblMZBZVJd55rDie4OXMVifOTgeznNdOKcI1VceJLPjlDajFSoLsXPtOMXLMJCTTJ5DQ5TM8zoqUx4DmSCbkgmC6iifsuZOEwDsNTi5tfHRE/dt/5F7/smVp2y1UlkX9eZKpVKpVPC1977p1N1//2PXv/Wd3/5Ic/H81d3Hn/juyWx+MyaTB+ez2XcD2A0BDyKEM+nvTRmi+/yT3bxIBgn2ZkBYyOV26nt/tp4svDwG4cGObzlSHt3xJdsZel04a6t1u227jp2b4O4z3XZ62c0V+ZosMu7NGPbZiVLNJ/tMBn3fXzce89bZCW566y7Ov3kPO7dPe51jhzxU6rDwNKJPjEF5DzbHOjtuIf/Jya6E9Usdyny3qboM1WX+KA6Ot6jeOjxzBPqaY2A+y6yz44jyiqQfzLjHGM8cHG9RPXusdOA4rOAZrCsc01w63qJ6R/QrnasM1We+1GHpszgTAtVbh3cciySsXOqwgreonvJwMuZL3RDsuVXrjPHMwfEMrzvmPYG5iJeleD2VGS/fF5B3O5T3YHOYi6jMHn+2QfAyi9cdmzEXaTNaoXIANUd5OJnyEZK759EQ3lwvg8iZs5R0WrJqJgiqo3zKujqR2J0DzazBToNP4eypH3n4Ny//vmlWKmuj3lypVCqVlyDh/e/fbj7ykYMrP/b226ZXN08fXLr8isOAd28ETGcI7wxznEcT3jifz683TbMDAE3TbNh1hug+Bw1cGE+hNwrUBXdyeZ5eWO9tkKFdnx2D8uoLy9YOzle+3ej1sDhWC50fx+r5IGO5DvPH+J0r/Q73rVpu9zw/XrS/g+Wmt+zj5u+6jmbTrnhMqN04PosyIRwcz1Bd6+24hZyOsiuxfTuOjPHGBeJcVHeML3VwvIX1mIPjITLmCPQ1hzO/1NtxRHmG6QbioBxW8BjIIqqT+F6F9UsdHM9gXeaw9FmciRblLao3xhM3+lxVqL71dhxh3rhuyLoK1R3jSx2WXsUZqmi9HUeUx0CWonrr8iCZHQ+R9HtT1TrMM4cVPEN1W5/FmWgZ6xleV2XEj35vUN6DzWEuojL1PENJxzO8rsqYZy6yymMYgs1jLrLGTJ4/JQzN9XKVKY+BTJBNyYTBy70scoyd5rDB5rT56i137rzn1l+5+rs2r1TWRb25UqlUKi8B4s2Ub3z7tz9w9vBwf7YzefDq9OA7JwGnZ/P5owAeDcDFObDZADvNiO9O8QhYfgJNP+94H0qzC+NsfrJll5I3E2yxl42/uYLu+JLtHuS4C9a1x9vrYXGsFjqfHC9snm6zx9YNyPr2OUt8b2wOuT8nPz46X3m1rjjeSLM5wcV37OHmt+zixN034DtYyMMEhG9dFllhxxHlFarfe0KT7QRyei3xshTWYw4jfeK6TdbzYH3mIHypg+Mtqsc8c1jBG+TrzjxzEZvZsXJDtHO6qWoN5pnDCt6ievZYs4HjsIJn2K4dp7AbvxBzmFOwLnMo9/I8Rd51UV3mmYPwievFrKtQXeaZg/DMYeFVRFFl6+04MtZbVE95ONkYz5zCdHtDtY71dpyiMuUtqtf6LM5EgsqUZ6iu8sizld4blFeo/hF8r6L6GMgYqq88RMYclp7GVBbA5jEXWTVDnrvnTwlqvvIptmPHjJJOS1bNBEF1lE+5AZ2wG3Cy2fzY3ffd+qOnP/q1r9q8UlkX9eZKpVKpvIi59thb77myP714+uzZcPXS5R+cNWFnPpu/bRLC3QjhbADuGfNjvsbSfdaxF+K9D0H2wji7qJ792Xqy8GINa/152TF4vt3Id+Efn+1nGVl3uU99vLBzvCzZBjuGZdD38jVZZNyT/VkzYt1WLbd73hzvQnaumTTYuX2Gm950gJu/+xpCAJrj/ERkDzzi+CzKxAjnwfqFzpxaS5RX2L4dR8b4xHWbrKdQXeZLHYRnTsG6zGGNnpC99nYcUR4ks+OI8oyk222y+cxhpGdOobolx2vHKSpTnmG7dhxpfRZnokV5hupab8cpJsvO0YjyCtVnnjkIn7hezLoM1VuHZw4Lr6IMr2gzO46M9RbVW5cHyex4iKTfm6rWYZ45rOAtXs87F1TAPHMerM8ctKfvDcxFvExh59hxisqM7w0L5wyi+srDyQY8jakcQM0Z6yMqF56ePyUMzfNylSmPgUyQTcmEQeXKR4ZyFHYiTrc5aLDZ4Eunz2994L6P7f66zSuVdXGclxIqlUqlcoMJ73//+ce/8fn7T2Dj6u7+wQ/NNyZnMZ8/PJ/iXZMmzOYh3AnghPdL6NdJ91ln4MJ4irowntZto5epmwlkf3J9dgzKyy8w/WMb9GTdgMWxWuh84zsntuGsk+5zeXyLrWw95pNBv2+PYFHO1mx9b+yt6xxvyolbAy68cR8X3r6LrXNzG6+PfNfcYemz2Ao7jijPUF3r7biFPKULlFfYvh0rB8fDPJdej6H6zFtnxykqUz5FdcZ45iJeljDqdWcOxNtxRHmG6QbiOsZ45uB4huomvtu0XTtOYRlzHrZvxxHyb1IuErwsRfXGeOJGnaceqm+9HUcKfLepugzVPaq340jrVZyhisyXOjieobpjPHMRljHnkfR7U9k6pQ6Ox0BmYd3WsYjLFTxDdUf4ld4XvExh59hxisoSn1UykeBlKV5PZcwzF2kzWqGyADaPOTg+4uUkk+dPCWqu8hGWM2cp6bRk1UwQvI6XoSDH+jrNQYPNSfP44fnJO177L/e/YPNKZV3UmyuVSqXyAufJb3/jm7a3Tl3Zm177Q/MZbkYzv302n/9IAC41aC6G2fwsJs0pO+9GELD8JJp+/lEfTu3NADk/2eqvmy/cmTxKMr2O8uiOL9nOWO+6C5/vqXRd2DzdFmsshMm812TgRlp/jm2K+a3vtqNX69Ln064KTE40CPsB9/wrV3H6vim2bprZynrId80dlj6LrbBj5YZgc6yz44TsabXjEuwcO1YOZb7bVF2G6jJvnR2nsIw5huqN8czB8Ybs9Y6M8aUOjmck3WDGGSob45ljqJ49Xjog48hYr2B969qx1YCSjreo3hhv3Ojz1IPNOYqLqOc0EwSvwzLmIDxzcI5XwYqlDit4BusyB8dDZMzB8QzT7YbeGjaz44jyGMhSVI/daIXfl3iZRXVH+NHvDcorVP+IvjcsnDOI6isPkTEXGXuuDMHmMRdZYybPnSGG5nn5KpnyDr0pQ/O93MtQkGONnZbmoMEO8AcnT03+5L2fOPifbF6prIt6c6VSqVReAITHHtvE2avbzd//2PUnH3v7q/Yms52d63uv2jsMb9jc3Ayz+ez7wjycahq8CvOwGybNDkJomuZYf9jRIN1nn+zmRTIwZBf52UX1ZKu/br7wYg1rzXrpPtmF+bhtj63dIMt3jcH5ap+t6vW6DdO343TbyexYHV+6v/QY1LFxb8ZAfnPFe63tunZqui2OlxFCwMm757j46CFu+UPXbHx0+G5dn0WZGOE8VN96O24RT6nsU2zXjiNjvHGBOBfVLfV2HBnrLazHHBwPktmxw+jXnPlSB8czkm4w4wyWMYcVvEX17PHSgXB2HFFewfrMYeGzKBMtylu8nsqYNy4QB+U8VN96O05RWet7sepaVO+o3o5T2OuvUEXr7ThFZcpbVO+4vB2XkMzpTVdrMc8chGfOg/VbxyIuV/AMr8sy4uS/X+B96oZgc5iD49HPerXCOYOorvIQGXORNssqmSiEzWMussbMPXeG8OZ6GUTOXMpQnkCrVCaoXPnIUfNIaa+lOWiwedg8e/LWjfc+8LG9/93mlcq6eE4vulUqlUqFE97//o3LT//BhfP/5DeeeuY73/yGyXy+vT+bP7R/OHvXBiaHM4RvQ5g/BDQPIoSrATjZNM2GXee5JmD5iTT9LOR9SFUXxnvzzVZ/7f7iyzV6uq/s+uwYlJcXHPxjG/Rm3fRYLXS+8Z1T2+p5Q3+f6XHY1UPru+3ok0F//3aFNa0rjpcRuydvBW7+3us488oDbJ9f448I47vlXp1LVtpxRHmF6ltvx/rppF0J6zKHkT5xwYyLUP0x3jo7TvGyFNZjDmv0hlGvO3MQvtR5JP1gxj2O26d4nTbLKlbYcYR55jxs344jpceqnEJ1j+hHnacKr2szO44U+F5F9S2sxxwcD5LZcUT926RQZeaZg/DMMbyeysb4UjdEMqc3Xa1lvR1HxnqG12XnQyZalMdAlqJ6yiPP5HsC8m6H8h5sDnNwPPpZr1Y4ZxDVVR4ks+OUNqMVKgdQc8Z6rJa554/H0DyVKw8nU16Q1TNh8HIviwx1hnIUdgzNQYPt0Dx7sLHzjkd/7+pnbF6prIt6c6VSqVSeB4R/+tjmk//+lVtv++e/+Y1vfseb3hMwP9HM5xthhh+aYX4izJv7JwEPzEK4FQjbTdNM7BrPRwKWn0jTz0PqQ6p3Ubw3P/uz9WTh5TrCY7EPtc6gbzfyPQNwvrPG9rOMrLvwdiaZS3zn1LZYw+4vPQa6ln0uzUY/y49Pzyf7TAZ9vxzZ+Zau2zTYuWWOWx/bw03fsWtrq8N36/osssKOU7zMorrW27F+OmnXxfbtODLGJ67bZD2F6pZ6O44wz5yCdZnDSM+cgL7uzMHxMJnqKa9I+t2mXcOOU1TGPHMM1WPHmg1GOjheYft2nFLy3qScQnWZZy5iMnqeIu8NwvqlDsLbY5UDB9ZjLsKyUoeFVxFFla2348hYz1Bd5pmD40EyOy6hndObqtZhnjms4Bmqq84FKlfwDNVVHnkm3xOQdzuU97Bz7DhFZYnvVQr6Rai+8hAZc5E2yyqZKITNYy6ypsw9b4bw5noZRM5cylCeQKtUtqhM+ZShzlCOwo7isMHWHM/efLr5k7d94vC/sXGlsi7qzZVKpVJ5jrj23W+7+2vbF751/uqTb543zT2b0/n5/cPpDyI0UzTzOxCal8/D/CSA08/H70opofssxL4bwYqW7MI4u6iebPU8WXR5DMLbfZo1ZC8J872is+58z5O1F/vM90bnx7HzeOxYrsO8cxMk20ci+nNM03ut7f7EmmCPgzxnEds9/eAcZ195iJvfvovNdfySe7Zr5rD0WWyFHUeUZ6iu9XbcIp9S5RW2b8fKocwHMy5C9Zm3zo4jY71F9ZhnDo7HQJZAX3fmMNKXOo+kH8y4B/PMYQVvUT17rHRAxpGxXmH7dhwZc0GVOYbqjfXIM3qeIu+5qK71dhxRHsusV/H6FtZlDiO8HUfYsXqoIvOlLuJlKap3nJ45j6Tfm6rWsd6OU1jGnAfrty6LMpGgMuUZqjvCj35PUN7DzrHjFJUlPqtkokV5htdVGfPMRcb8e1ECm8dcRGXKR0guz5shhuZ5ucqUx0BG6NVL5qqO8pGj5ijsKOZAE4Cdw42rFy9u/citv3ntl2ylUlkX9eZKpVKp3CB23/PWBy8fhN3Z9b2HG0we2tyY7Owdzn5wMsFWmOOV8zC7vUEzD8CpF+rNFEvA8pNp+tnI+7BqL3bT+cmWXUreTLBFb317DJ5vN/Llj75ur9NtkD2x+cZ3Tm2LNRaCZPZmR+J7Y3PI/TnZnvh85dW64ngZtjvZmGD7thlu+65dXHzLXq+7Emy3zGHps9gKO1ZuCDvHjpVTTydzQ9g5dqwcyny3qboM1WXeOjtOYRlzDNVbh2eOQF9zOPOZL3VwPCPpBjPOYFmpi3iZhXVbl0VW2HFkrGewruOyKBMJXhZRnSP60eepgvVLHcp8r6L6Fq9nMzuOMM8cll7FGapovR2nsIw5BesyF1EZ86XOw/R7Q7WW9XYcGestXq/NskomWsZ6huqO8Cu9J3gZg/WZi6gs8b2K6mMgs3hdlTHPHJaexlQOoOYoDydTHjyT580QQ/PG5nbMKOm0ZNVMJKhM+ZR1dIbyIQLQTBts7OPg/M3Nv3b3bx/+17ZSqayLenOlUqlU1szX3vSmU3d/7GPXww++5Y7HL09vC7OtW+YHe2/d3NwKB2H6zmY2v3feNLc18/kZNJgCzUW7xouFgOWn0/TzkfrAai90t7I/7raJJwsvjsFafx49DuXV/6E1cHx2Tpa1w978bmP88XZObYs1FsIe22KcraV8u2HXzW6uuPOz9tpvriDpn75njpvftYcLb9hHs8XnFsGmMgf+HAGkb8cR5Rmqa70dt4inU/YprFvqUOaDGQ+iuqXejiNjvUX1mGcOK3jDqNecORBvxyleZkm6wYwzWMYcVvAW1bPHa1xHqYPjGazLHJY+izPRorxF9cZ44kadpx6sX+pQ5rtN1WWo7lG9HUfUv0sMr2gzO46M9RavxzLmMMLbcQnJnGx6JkY4rOAZqqvOBSpX8AzVHeFHvyco78HmMIdy3w1VHwMZg/WZi6hswNOYygHsHDtO8TIM5Pa597pDeHNXyZTHQEbo1Uvmqo7ykePOSwiL17GZNtiYTfYu3r7903f+2R/4u80HPjKz1UplHdSbK5VKpXJEvvLYo/fc+9FPfPWrP/qjN88f/9q3ncT+5nSKt6Jpbp0H3B1m8zcH4PQc4fQE2EbT7AQgNC+B9+Dus5H9LgfnQ5O6MN6bn2z1180XXq4hPJlHj0F59cVmfuuAz1eerBsA+uTR+eRxwebJNpx10n0uj0+8Jm23fxzJduqzI/DXVWvCrmuP15YTsm7LZLvBZDvgvj92FafuO8TGSb2GRE1hnrzeAOnacUR5hepbb8fe06k8g3WZw0ifuGDGRah+qbdj5eB4BusyhzV6w+jXnfmjOI+2301T88d45uB4i9ezx2t8tp0y1its344jpe9NyilYlzmM86PPU4bqMl/q0Pe9iuozVJd55kC8HUdar2IKKx/FwfEM1T1Oz5zCdHtDtY71dhxRHgNZiuqNeR+A4zGQWVS30Mv3A+TdDuUVrM8cynxWyUSCl6V4PZUxz1ykzWiFygHYHOYiq2SOV5GLN8nLIHLmUobyhKyaiQSVKZ8y1BnKUdjxSOaHwwYbM+xfPL/x5+7++P5/ltYqlXXyor+wV6lUKusivP/9GwDwtW9++q57/vmnvvL0d7/ztYe7uw9vbuH67vWDn0DT7GE2eSBMZq9HwGaDMAloLiwmhxleJD/qq5Tuc83AxfYUezMgLORyO/XtVn/dfOHlcfR9p9j64oK7XX8xP9nusdq66fHaNdPj7Xk2nxwvbJ5uizXs/tJjoGuN+Q6TrCnmt77bjl6tyx4LeS6gusn26YdmuP0793HudSN/RBjf3QKVkdc8E3ac4mUpXs9mdtw6prl0sH07jozxiQtmXITql3o7jjDPnIJ1mcNIz5yA/ifEHEZ4O44or0j6wYw7mIPjQTI79lBde6x0MNLB8QzWZQ4Ln0WZaFGewbrMYZwfdZ4qvH6aqV6B71VU36J6R/V2nMJef4UqWm/HEeUxkKWoHvPMRVRmvR0PkfR7U711bGbHkbHeonqtpzGVK3iL11OZ8fS9IKIy5T3YHObgeDjPcyZalGd43TGZHaeo9woqB2BzmEvxcpUR7543Q6i5ykdYzlzEywxZNRME1mEuZShHQWcoH4LNnzVo9jA7eRp/6eW/O/1LNq5U1kW9uVKpVCqC+Z/5MzvNTTeFr/3SP7j98PLhlVNnNl8zn4aXN5P5/nQ2/zHMcQsabGM+f3UAMAEwfxH/iK9V6D7jDHzXQcTeDAgLudxOfe/P1pOFF2tYq+fZNWQv2SDLDx6f8jDH3Ot1G6Yv1oVam207vXR/i2NbjOla9rVONvreHunIdc30fmaOdyE7l0K7LRvbwImLU1x8dIqL37WLyckw7pOTXVA5LH0WW2HHEeUZqss8ceKppF0J65Y6lPlgxkWwPnMQvtTB8RbVY545rOANo1/zMd46Oy4hmRPMuIO5CMuYg+MtqmeP1bgO5iA8c0PYOXacuCzKRIvyDNZlDuV+9HmqUH3r7Tgy4Hux6jJU96jejiPy8w1BFZlnDit4i+odp2fOo+1n0zKRYDM7jjDPnEJ113HMEeUtqqc88ky+HyDvdijvYefYcUR59LNeTc1RXuH1WcYcHI9FlsWZKITNYw6Ox2qZe94ohuZ4uc3smFHSacmqmUhYNcMNyIdQ86cNmn0c3HzL1r915w8/+LebD336wFYqlXUw5hJBpVKpvKiZ/7E/dhoArnz2s3dfaw43d05s3r+3d/i9k0nzrfls/sb5PLx8EhBCEx6YB2w2TXPWrlHpE7D8lJp+5vE+uNKL3fbCerJll5I3CUyxN7Trs2NQnn0xAQwe29h1l96uKuYb3zm1rZ439PeZHoddPbS+244+GfT3b1fI13X3p9a1x0ueh0jWbdk4FXD65hluft117JydYeNmYON2oDmj18pQVeZbl0VW2LFyQ9g5dqycejqZG8LOsWPlUOa7TdVlqG6JL+mkKG9RvTGeOTieMOp1L/V2HFGekXS7TTafOazRp6iO8b2hnWPHEeaZ82B9x2VRJlqUt6jeGG+fS9aJeBmD9Y/ikPtuqPoM1R3jSx2WXsU9VIl55iA8cwrVPS5vx0Mk/WxqJlqst+PIWM9QXfY5NxMJKlOeobrKI8/ke4LyGMgsqss8cxF73NkGwcssqqs8SGbHKW1GK1QOoOaM9XAy4eU5M4Q3b5VsrBf06iVzWYe5lKEca+wovLkzAAfN/PSZzb/40Pv+8H/afOgj9eZK5VioN1cqlcpLlm899tg9N926c/3Zb1x69d7B9cnmia2zB3vT70WDM2Ee7g8BD2+gmczn85tDg82mabbtGhWfgOUn1fRzj/rwSi90s/nZn60nCy/XER6Lfah1Bn27ofY8OF95sm7A4lgtdL7xnVPbYo10f8tjW2zRtexz2QvtnPz46PzW98b9Qxt+LOS5gOhungq47Q3XcfquKTZPLX/v4eaFCZrbAnAioJl0WsN2yRwWnkZW2nFEeYbqWm/HLeKplH0K65Y6lPlgxkWwPnMg3o4jY71F9ZhnDit4w6jXnDkQb8cpXmZJusGMM2xmxxHlMZClsJ49VjpwHIRnzsP27TjS+sFjheMZqjvGGyfPUeRdF9VlnjkIn7ii55PBusxhpGcOC6+iDFW03o4jYz1DdZlnDo4Hyex4iKTfm6rWYZ45rOAZrNu6LMpEgsqUZ7Auc9CevicwF/EyhZ1jxxHlscJzrDzD647J7Dhl7PEPYefZccqqGfKcni8lDM1TOfPMpQzlCVk1EwnHkaEgR2FHUTJ3Dmzub0zPnJv8X+/98Yf+ev3OlcpxUW+uVCqVFz3hvW861fz9j11/5g899sCFm3D1ic8/86Ypwn1hc2t7fnD43Zg0J5sQbg4Btwfg7GQeToQGO81L7HekHAfdZx57wdz5MJRd7GYX1bM/W08WXqxhrZ6X7T8hy9qh7S3Ibx1k8z1P1l7s064q5sex6WfrpWO1jvXyNVlkmW9Ftj9r1LrMJ4NsXXG8DNu98MAhzr5sHydunmLz5LzXxWSCyRlg486AZugX3Kt4wPdi1i11HqpvvR17T6XyCtu348gYn7huk/UUqlvq7Vg5ON6ieuvwzAlGv+7MW2fHKV5mabvdFDV3jGcOjreoXuJ7Fdu348hYz7BdO05RF9epdLyF9ZhDuR99jipUn/lSh6XP4kwIVG8dXjimJaxc6rCCt6jecXrmFKbbG6p1mGcOK3iL6rU+izPRojwGshTVG+FXej/wMgbrM4cyn1UyIZyH12cZc3A8FlkWZ6IQNo+5iMqUh87kOePhzVklG+sFWT0TBpYzlzKUo6AzlCtGzGtmDZp9zE6dDn/9oc/M/pzNK5V1UW+uVCqVFwUhfHDSNB+ah/e/evubz969dec/+kfXLv3AOx9+en54cOrSwasOprPv2NzAtYMZ3roBXAxh/m0NsBXm2AEQMGlO2TUrRycAgxfGU+iNADY/2bJL0TV6G0vk+vbivOfZFxVA1xicr/xz+GPBslk2Y89Zt0GyZNCfk+0JYDdnWt8be+va413IzqXE7omLAedesYsTF+c4dYf/PzVt3tagOVfwI8JYzBwWnkb0yTAoz/C6NrPj1jHNpUPJ44KTDfiQbBfD+sxFbGbHEeaZU9iuHaeobKw30P98mMMIb8cR5RlJt9tU85lnDit4i9drM/d4mcMKnsG6zGHhsygTLcpbVG8NPjtP7bgENcd6O44U+G5TdS1eT2XMlzosvYozVDH1qgMnU96iesfl7XiIpN+bqtYZ45mD4xmqy94DIPrMRbwsxeupjPjsvSAy1itYnzmU+96wcI6L11UZ88xh6WlM5QBqjvJwMuWRZ/JcKcGbOzZjLmUob6E1Kh2PI2QoyFHYUZTMbTtNAGbXNsLNF8JfuueTP/ofNs1Hlj+SoFJZI/XmSqVSeUEyf9/7Tk5+8Rd3w488duFrT187e/f/9p9841tv/7d/YLbRbE6ns/MT4PvmobmC2eyNocEDmANNEzZDwA6a5qRdr3I8BCw/taafg9QHWXVR3NbTFfvr2mY8Bmv9efQ4lFdfeA4cn/Iwx9zrAfTJK10XNk+3xRrZjZXEZWtJn2z3MmPU/DbL5ieiN8c5ZksIASduneHCyw5w6q4DbJ6aY7LBux2bE2zcAmzcMgc2bdiilmBenUNW2nFEeYbqMk+ceBppV8K6zEF45tD3wYyLYH3mIHypg+MtqjfGMwfHG0a/5qXejpUbop0Tku2MdXjmFKqb+F4lHai5EBlzHrZvx5HS96WI8hbWYy6iMuNHn6cM1bXejlNU1voszgRBdY7q7ThFvf4MVWS+1MHxFq+nMuaZg/DMeST93lS2TqmLqEx5Buu2Losy0aI8BjKL6jJPnHwvAO9TN4SdY8cpKkt8VslEi/IM1VUeImMOS09jKgewc+w4ZY2Ze74ohuZ4OcuYi3iZIatmwsBy5ixex8tQkHuUzDWdZvE7Vw7Ond/68/d/Yvev9dNKZX3UmyuVSuUFwdPf+6bzN/3jj136+ltf/+pZE2675eJNX7n07NM/DDQn57PQzEP4Q808XA4N7gXCffPQnADCdtMU/WaEyjHRfb6x343gfDjKLox7F9zN5Xl5MyHXcp5dQ/aSkCw/eGwq67bIhY3FPq0V88k+YfNkG8466gYLXYv5RPQzcwTea23XVWuy55k8DwCwsQPsXDjExVft4dRdh5hstz1e7xGaCTYvAJNbA5pT9nH0hz1YRl5rgHTtOKK8gvWts+MW8VTKPoV1Sx3KfDDjQbwuy6yz44jyGMgiqjPGMwfHE+jrzhxGeDtWzsP0A3FQDiM9cwrWZcdKfDaOjPUK27dj47I4Ey3KW1SPeebA/ahzVKH61ttxCsvU88m6DNVjnrmIzew4Rf27xFBF5o/iFKp7nJ45hel2Q28Nm9lxisqUt6ieOgeoXMEzVLfQ0/eBiMqU92BzSl0kyXo1NUd5htdlGXNwPBYZjakcgM1hLrJKxrx6DEN4k1bJlMdAZsiqmUhQmfIYyFCQo7DDKJnHOtMGm/uT2ckzzV954NEf/veaj9TvXKkcD/XmSqVSeV4Rwvs38AtfmISP7Nx65dLh/nxz/77r08kjp05uf2N3d++HQ4PzmIfbZgFvmKD5+hy4p5nPz9Uf6/X8o/t8wy6Ysw8/EBf32fxkq79uvvBynb7vFFufHYfy8oP5etdd+nxvdL7xnVPbYg27v5A4utaY7zDJmmJ+67vt6NW67LEkrpksPv7c/Mgezr/6OjZOztHYT0T2IAwhAM32BJvngck980U/XYPNZw4LTyMr7TiiPEN1mSeOnFILlGewbqnDsO9i1VOwPnMQvtTB8RbVY545rOANo15z5iB8qfNI+sGMezDPHByPgSyiOvZY6cBxEJ45D9u340jp+5JyDNU7opfnKPKui+pab8eRAt+rqL6F9ZiLqMx6O46o116hysyXOjjeonrMMxdRmfV2PETS701V6zDPXIRlzDG8njoPqBSeOYXqKo88W+m9QHmG6h7Rd0PVx0BmUV3lQTI7TmmzrJKJQuw8O05ZJRPePV8UQ3NUzjxzKUN5Qq9aMs927JjhdbwMBblHyVzRCXNg63ASTpzd+jce+sT1X7B5pbIu7KWESqVSuaE8/thjd9x6zz3Xn/7y775qbzY52Aizu8N89voGk+l0NnsEwENNwPlZmD/YNJNrkzC/aQ5s1F82/8IgAIMXxVPURXFbT1fsr2ub8Ris1fPsGrKXbJDlB49PeZhj7vUA+uSVrgubp9tiDbu/9BiytZRvN/o+PzZ/vr2RlgzsHPZYEnfmrhkuPrKLnVsOsXHC/NJ6mMUEcbnJ1gRbNwO4aQ7sxDBtJgz4Xsy6pc6D9Utd/2lMpBUD2L4dR8Z44wJxLqpb6u04wjxzDNVbh2eOQF/vCMuYA/F2nOJllrbbTVFzmWcOK3iL6tljNV6OI2M9g3WFY5pLx1u8ns3sOMVk8jxVXsH6R3Ho+6ySCQHrMYeR3nEskrByqYPwzDFUT3k4GfOlziPp96aqday344jyGMhSvB57H8hEy1jP8LosI270e4HyCtZnDo7HMssqmWhRXqH6YzxzEXZuYGCOgs1hDo7H+EyeK0OoecrDyZTHQGbIqplIUJnyGMgiQ52hnFEyZ6DTzIDJHg7PnN340P2fOfi/2bxSWRf15kqlUjl2vvy2t52871d/dRcAnn3HG182vevOPXzjG/dO57M7gObkbBreGUK4OAcebkK4F00zD/PZ2QbNPDTNaYTQNE32/5VXXgAELD+9pp99vA+02YVxNj/Z6q+bL9wZE3nzsmNQvh3me4V7bLZPs+xmRNyws8V84zuntu1z0BuQ9e3NDuFbtdxOvW16r7Xdn1gT5rGEhQAAbJ1qcO7luzj30D62z0+XExh2UUPcRXxr2rwP2DgbELZiYdml45TSL1LtWDkP1bfejlvIKSW7Etu348iKPiTbo7Bz7DjFZnYcYZ45BesyhzV6A33NIeYzB+LtOKI8I+l2m2o+88xhBW9RvdLjZQ4reIbt2nGKfV8a6BahemM8cfQcZW4INSf1JR1LmxU/nymqN8aXOohj9VBF6+04RWXKp6jOcXk7LoE9p2od5pnDCp6huva//wiVK3iL11OZ8fR9AHmvh5cxWJ85lPleRfUxkFlUV3mQzI5Txp4bHmrOWA8nI16eK0N488ZmzKUM5QlddWiOypWPHCX3siFK5g51Zg0mB5PprRc2/vJtb3v1h5pf+NihrVQq66BerKxUKmshvP/9G3/wxBNbD370o3ufecc7zt555crmuftOn3r86d3Xh9Pbj4er07fNp/MHJ5ifDMAjG5jszRBe04T56dkcO0BAM5nUH+31ImL5QS+7hC4/1GYXxRcyn5/92Xqy8HId5f11Bn27ofY8OF/55/DmSm8W8+w5c70Zd9v58dnX292nWpcc87n7DrB9NuDCq68DW3NsbKmvDlu8rCXd/8apCSYXgcktc/3piq3ZuizKxAjnwfqFjpxOC5RnsC5zEJ459H23qboM1WX+KA6Ot6jeGM8cHG8Y/ZozfxTnkfSDGfcY45mD4xmq2/pebLt2nKIy5Rm2a8cR9fbIJHMK1mUuwjLjRp+jCtVnvtSh73sV1bd4PZvZcYrN7DiiXnuGV7SZHUfGeovqjfHMRWxmx0Mk/d5UtQ7zzEF45jxYv3VZlIkElSlvUb0RfvR7gfIedo4dp6gs8b1KQX8Q1VUeImMOS5/FmSjEzrPjlDVm8lzx8Oasko31hKyaiYRVMuVThjpDuWJo3lCORaeZNtgM2DtzovlP7v3M4b9vK5XKulBf/lcqlQol/PzPbjV/4hcOP/f9L98598zNF+74tV97/OnveNM7N3dOPr2/e+3O2az59vkmnsF0dh/C/NvCvAlzhJcBOAXgwbhOE8JeaJoT/dUrLzYCMHhRPIVdFKfzsz9bTxZeHIO1eh49hji2WTu0vQX5rYNsvufJ2ot92lXFfOM7p7bFGgthMvWaSJ9sdz7bizOf+GRgV0ofy4kLARsnD3Hu5Qc4dddB/8eA2YkpXtZin97JiQ1s3j7H5EzyHSwpak12McsKO07xshSvlz3pOfbxdijPsF07jhzBBzMexOuqrOD5Gu0tqjfGMwfHE7LX3Y5TVHaU50uR9IMZ91iHZ07BusZ1Q9u148hYz2Bdx7GIS8enqM4RfSAOynmovvV2HGGeHSvxLqo7xo90LKJ4RZvZcWSst7Aec3A8nMx6O/Yw3d5QrWO9HUfGeobqtp7GTDIHx1u8nsqIz/6tioz1CtZnDmU+q2SiRXmG12UZcxj2NKZyADvHjlNUpjzyTJ4jJXhzVcY8cylDeUKvOjSP5cyleLmXoSD3GJo7lCPpzBo0e5P56Zvm//ZDn5j+nGlVKmuj3lypVCqUEMLi/eFH332++bsfffaL3/66B05tbF+49T0Pf+GJf/ipD2ArNPN5sx+msw+gwdPA5JYwD68MIYSmac7Mw/yW+ntRKgEYvDCeYm8GyPnJVn/dfOHOmGjpyfrJOoOeXRgHBo9NZSEJe51uI99bNp/4zqltscZC2ONbjOla7DuNEtGfY5v5fLWufWj2sUw2AzZPBZy66xAXH7mOzTMzNJOkBPZAE7yM7D8y2Zlg644AXCQFoqDOHyvtOKI8Q3WZJ049ZtaVsC5zEJ45LH0Xqx5Ddcf4UgfHp3gdlTHPHBxvGPWaMwfhS51H0g9m3GOMZw6Ot6iePVY6IOPIWK9I+2pu62nMJHMM1TuiH3WOKryuzew4wnziejHrKliXOYzwdhxpvYozVJH5UgfHM1iXOazB23EJ6jnNxBFdxMssqlv6uSQy1jNYlzloT98LmIPjPewcO05RWeJ7lYL+IKqrPEhmxynqvMDAPIbqKw8nG+HpOTKEN8fLIHLmIl6WQGtUOh5HyLCGXDE0byiH6Rw22AqY7pyc/NkH3/Xo/6v+WLDKcVFvrlQqFQDA/H3vOwkAV77y+XsOw/bjs1OzR+f7uGt7Z+vrB7u7PzgH7gjzsB1m4c3NRvMU5uFsmIdXAAihwU69kVKxdJ9r2IV48cGIXuC3F9XNVn/dfOHQ/UF83Dbz6HEoL7/Y8I9v0JN1F4/FWjHf+M6pbbFGur/lseW3RdJjy/bRinyOMWp+m2XzE5Fmmyfn2Dg9x02vv4aTt0yxsU1+aT3IAaV4WQt5egEAW2cbNLcDzemw/KQluuq5yYQdR5RnqK71dtxCHy9zHrZvx5ExPnHdJuspVJf5UgfhmVOwLnMY6Zkj0Nc7wjLmQLwdR5RnJN1uk81nDmv0KV6HHW82IGPlIl5mYV3hmObS8RbVY565iMnkeao8Q3WZL3VY+izOhED1jurtOKJeewUrlzqs4BmsyxxG+lLnkfR7U9U61ttxRHkMZClOj/43xRwcj4EsRfUKPT3eiMqU97Bz7DhS6HtDNoc5D9Uf45nD0tOYygHsHDtOWWPmnisKb87YjLmUobwlq2UigWXMpXi5l0VKOgxvnpdFWGcOTA4290+dnP/VB//DH/2LzQc+MrOVSmUd1JsrlcpLkPDzP7v1rY988tYz+9OdS9PZ6yZovoQwf8V0PnvnRtN8/WA6f3uDcFcAGjS4L4RwPQTc1gDb9SZKZQzdZxx7g4R9+EH/Aj/ifHnBnXiy8GINa/U8dZPBrp2uS5YHjvKdK+2GXXexT2vFfLJP2Dzddo4v3Wd6DHQt+1onYd/nxybXZT4Z9FZqGtz6xqs4++A+Nk4NfH4mh9BjICdPLxB/yf1pYOt2oDlLHnwKeZ0B0rdj5TxYv9Spx8ucB+tbZ8cpKkufZtXxYHOYA/F2HGGeOQXrMoc1+gT6ekdYxhyIt+OI8oq2301T85lnDit4i+rZY80GIx0cr7B9O46w96RMJHhZCusxh3FenqfKM1TXejuOFPhuU3UZqntUb8cR9torVJF55rCCt6ge88xhpGfOI+l3m94aNrPjyFhv8XrqHKByBW9RPeWRZ/I9AHm3Q3mG6h7B9yqqj4HMorrKg2R2HGk9jakcwM6x45RVMuLd80ThzfEykNyOU7wsgdaobFHZWJ/idbxsiKG5QzlEZ9pgc46Dk2cn/+4Db7zzbzR/50t7tlKprIN6c6VSeRHS/kiv5toPvfu2+TVMm3Dlzmu74baNTWB3Pn/7ZKN5amMaXnk4n795AlwJ8/Bw00y2Q4MGs/lNoUHT1N+HUjki3eebgQvjKfQmAZuf/dl6svBynb7vFFufHYfy6gtRcvuAzme+HfY63UZ/VfuY1bqdU9v2GJZBOtLPWbehb66YTfIMifnEt2q5DeDs/Yc4/cAeTt+9j8mmbRO8ipe1kKd3SQA2zjaY3Ao054L+wMXOn0yMcB6sX+rU42XOw/btOMI8c8h9IM5FdZkvdRCeOYbqjfHMwfEG+nrDmc98qYPjGUk3mHGPMZ45OJ7BuvZY6YCMU1SmPMN27ThS+p4U8bIU1mMO5X70OcpQXeaZQ5nvVVTfonrMMwfhmfOeT4bqMl/q4HiG6o7xzEF45hRJtzdNrcE8cxCeOYXXZf/9w5kz1lu8HsuIc89bljHnwfrMwfFYZr1KQX8Qr6eyMZ4dd4RKB9VXHk420rvniULNUR5OpjwGMkNXLZnDOsyleLmXoSBnlMwZ6jj5/LDB1nTj8PTZ8B/e/20/8h81H6nfuVI5HuTX+pVK5flH+OAHJ82HPjQHgG+857Wn7/xHv3MtfPC9p5797Svb892ds7NLTz06b2YHsxAeRJjfutlszA9m80ebpjnRBFwIYf6a0GBvPg8XG2CnCWiAgNA0m03T1PeDytoJAL8QLz4E0Qv86mI7uTQvbybk2hxPsiq7mRC36fHR5bvG4Hzl241eD6BPHp1vfOfUtlgj3d/y2Mhz3/puu+eT7c7bFZz5bdY/3uX2iZvmOP3gLnZunuLUHQdJawByCD0GcvL09mg2Jmg2G2w9PEPTAO1vsurDzh8r7DiiPMPr0ie8j3ysyjNYlzkIzxz6PpjxIKqrPMqer9HewnrMRVjGHBxvoM+lHaeo7CjPlyLp0+OMrMMzp2Bde6x0QMaRsZ7Busxh4bMoEy3KW1SPeebA/VrelyD6pQ7CG9cNWZeheuvwzGHhVZShitbbcWSsZ7Auc1iDt+Mhkn5vqlrHejuOjPUM1fVefxYwB8czVLfQy/cA5N0O5RWszxzKfK+i+hjIUryeyqy345Q2yyqZKIDNYQ6Ox8jMO6+HUBOVB8ns2DKUt2S1TCSoTHkMZBjIvWwIb66XoSDH4neuhGmYXTjf/On7Pzn9GzauVNYF+zK/Uqk8x4T3v3+j+chHZl987LETD370o3sA8MR3fvsrbr397BNPfu3ya+dhdvNGOJwdzvA2TCZPz4DbMZu9doLmcpjjVXOEW5sGdyCEKwjYxKQ52czD4XzSbCIE1BsplRtFAPgFc+fDUHaRn83P/mw9WXixhrV6Xrb/hCxrh7Y3dGy2n2Vk3W6bPUY7n/jOqW3T7Y3s+vI1WWSZb4U9muwGi1qX+bD4EWAnbzvAmfsPcPrufWycJr+0fgh7UCle1kKe4iUBwKTB1kWguan9HSw2Z7vJxAjnwfqFTj5O5Rm2a8cpLGMO5HlUPYXqM38UB8eneB2VMc8cHG8Y/ZozfxTnkfSDGfcY45mD4y2qZ4+VDsg4wjxzHrZvx5HW09hKO/ZQ3TGeuNHnKEN1rbfjSIHvVVTfonpH9XYcab2Ke6gS88xhBW9RvXV46+y4BPV8ZmKEwwreonpjjjeiMuUZrMscuF/pPcDLLKzLHMp9b1g4x0V1lQfJ7DhF3ZygcgA2hzk4Hk5GvDxHPLw5YzPmIl5m6FWH5tncjhmqo3xKScdSMmcdncMGW/Pm6qkzW3/qyqsf+G9f85FPj/i/8CqVcuoF1krlOSKED06a5kPz8MEPTr7yv/wvO/f96q/ufukdb7jr/JXp7onbL95y9cqzj25Otr+yi9lrpod4cHNjHmaz8KamwWyO5lQzn715DoQJgIDmYrvoHuqP86o8T+g+67DvcrCihd4kYPOzP1tPFl6uo7y/zqBXX3QMHN+gN+va410OzTjddjI7psewCHLPnjPXJ9u9zJrFGtn81qfjrVMBJ+6Y4tT9uzhz1wEwIWuV4E3zshZyyi1Jsu07JsAtczQbyacvde5YaccR5RWsb50dt8jHqTzDdu04cgQfzHgQ1S31dhxhnjkF6zKHkZ45AX3NmcMIb8cR5RmmG4iDclijt6he4nuVdFAwt4fyCtu340jrszgTLcpbVI955sD9qHNUofrW27FykSTr1bw5KarHPHMQnjksvYozWNE6O05hGXMK1V2Ht86OhzD9bqjWYZ45rOAtqtf6LM5EgsqUt6jeCE/fA8C7gOMVtm/HKSpLfFbJhHAerM9chGXMYemzOBMFsDnMRVSmPHgmzxEPb47KxnoMZAm9mjdHZcpjIIuojvJDDM0bylHQafNm2gB7zeG5i82fv//TB3/V1iqVdVFvrlQqx0h3A+Wxxzav7u3dfPbXfu3xZ9/55od2Nw7nd/yVP/m1x/+tv/kDzfbmU+Hg2s3zefOOjTB5djqbPQJM7gkh7COEewOwDeDOgHCqaZqNEObXmmZy2u6rUnk+EoDsoniiMugFfnWxvd3qr9tfeLlGT2eqt192DHFss3ZoewvyWwfZfM+TC++LfVor5hvfObUt1jiumyv5s+PNX/rJBjDZCrjw6l2ceeV1bGyRJ2oM3lwvayFP8ZIka3Ym2LqAxQ2WrWVOp1tpxxHlGaprvR23yMepPIN1rbPjFJW1votVj6G6zJc6CM8cQ/WYZy6iMuUT5OsNMZ85EG/HEeUZSbfbVPOZZw4r+BSv02a9CuszB+GZ87B9O46w96RMtChvUb2xHv0smHEHcx6qb70dRwZ8L1Zdi+od1dtxCnvtFapovR1HxnqL12MZcxjh7XiIpN+bqtZhvtTB8QzVVa8/k8xFvMyiuoVe/js11nvYOXYcUR79rFdTc5RnqO4YzxyWnsZUDmDn2HGKypRHnsnzYwhv3tiMOTiekFUzkcAy5lK83MtQkDNK5ngdL0M/D1j8Qvvt0IQzpyb/5ubdF/6rO//R49eSdqWyNurNlUrliIQQGvyr/+oO/uAPpo/v7d0czu1evX755JnTO4e33f7RX/jdJ9/5sz92OJ2d39ra+Mb0YPa9AJp5CJMwD+9uAj4fGtwPhAcCmstNCLcHYKtpmg27n0rlhUgA+AVz8cHI3gyQ85Ot/rr5wp0x0dL7a6hscWzJdoZeV3k466bHayldGzZPt8UaC2Ey7zWxz2cvtHPMngrWPffyfZx92R62L04x2Z6T4kiG5g3k5CleYrNJg627gcm5AGwt817NzhnjPFTfejtuoY+TOQ/bt+PIGG9cIM5FdZkvdRCeOQXrMoeRnjkCfb3hzGe+1MHxjKTbbbL5zGGkZ46heuxYswEZR8Z6he3bceKyKBMJXhZRnSP60ecoQ3WZL3Xo+15F9RmqyzxzIN6OI+rCukKVrbdj5SJelqJ6x+mZU7TdbEomRjis4Bmsq15/Kh2PgcyiuswTN/o9QHkPO8eOIwW+VynoD+J1VcY8c1h4FelAwPrMRVSmPPJMnh8e3pxVsrGe0FWH5qh8rE9RHeWHGJo3lGN8p5k2CNexe/am5k8/+JnDv5XWKpV1Um+uVCqFhMceOwNg7+vT6V2Tw8MNbGxcm4S9Nx6ePPnFrb39R8N0+spmc/Ll6TS8AZi9fCNM/mCK2buBZjfMm3NNM789YHIphPlNAE7XGyiVFzvLD4P2JkMyMNAL/Ha+2eqvnS8euj+IR77+Qtm9OF5+8eEf36Av/LFgC0XmGw+T2bFaI7ux0jq6VtvNjvv/z96fR8uW5Xd94HefiDu8e9885PRynqoqs1RVqipNJYmS0EAtIRZ4Ua/AMt3CBoTXMqLB2N100+1UGUw3NmCQAIMMdONeXm5nCS+jVlsyGIsyGLCkZKGhNFeppsysnDPfeIeIs/uPe3bcfX7n+/2dfSLufTnU+aylq/h9vt+949yIEy/jxqn7XiPa3u7grAewfiLi7AevYfOOfUxPzrNGA9muGG+tl7UfHo7Jw1bA2nkgXDx4guly9gBYlGeoLvPEye9ReQbrlroEyzIXzVwE6zOXyDPVG+otqjfEMwfHG+hzzhwcjxUfL49mTcxudxjimYPjGaqbH6txck4M9QzWZQ4HvhN1RIPyFtUb4omj5yh4V6K61ts5x2Zmbo22q1C9Ib7U4cCriKLK1ttZuYSX5bAecwmVlXo7e2TdzrKOIM7OOSpT3qJ6je/EHdGgPHqyHNUr9PL1j253gfIK1i91iaGPLXqyHK/HslKXYH8udEQhdp2dc1SmPHjmniMKb82QzM45XpbRqXVEhsqUxwoZCnKFt87LUJBDdPYCqjrc3LwQPv7ov977SRuPjBwV48WVkZGMeOXKmfj667Nbe2+cu3p9957tE6d+69bu1Q/OJ5MwnUzCbH/v6yaTye5sXt8xn88/VoXwW7GO94dQnatjvF6FeGeNUIcYtyKwPl5AGflqJwL8A3P25gfiA371QX7ra+PJxgfHYK1eR4+B7J3vS7YHnN9cgbP34tYxXFyBzfPbYg97fzFznb2kz24vfPfY2HNdbQacfuwGJhsRp9594+CNC3v3YheW4q3zsgbyEB8isrXTFao7I+JGBOx/JdiaUufB+qVOfZ/MebRPAA3LmMOhX8Sqp2B95iB8qYPjLazHXIJlzMHxBvp8w1nP/CrOI+tHM7cY4pmD4y2qZ4+VDmRODPUM27VzovGduCOEU7Aucyj38vxEt+uiusyXOgx8LBmsx1yCZdbZOaGOVaGKzJc6ON6iespDZMxBeOYUWbezrCOIs3MOy5hjeD32ITqcNcwz58H6zCVMJv8MGOoVrM8cynyrovroyXK8nsqst3NOk3UqHVEAW8MclvDgmTw/PLw1QzPmEl6W0ar1rWE5cwkvQ0/uZYq+NX05Cjoir/YDpjVeOH926/9wxy9c/W9tPjJyVLCPJ0ZG3pHUf+C7tsPknvkrL7984drLL58+tzbf3Zntv7+eV1/aANZuxfqD02l4DfP48DzE+0IdJvtx/g2TgOuhri7PUJ8NIbwaEDaa3z4BgMl4AWVkhLN4j8M+cBdvgOgH/Gx952vjycaH+yjf/UCfHgfzzWjXH6Avrth+JyP7Hni7svs9q/tcOHXbHsNhkE+t46B7sd80ykQ7M8dn9t26e4a1CzOcfPAW1s7MELx/tN6JevHWeln34elC8mpaAWsRa/cA8aR9DNpjZ04oz/C67SeEIr9H5Rm2a+fECj6auRfVLfV2Tgz1FtZjDgM9cwL6nDOHAd7OCeUZphuJg3I4Qm9hPXasdCCzcnA8g3WZw6HvxB0hnEJ1mWcO3A86RxWsX+pQ5hc3Vdfi9VTGvHV2TjRexR1U0Xo759jMzh6qe1zezn1k/dZStY/1dk4M9Ravxy6udETDUM/wuiwjjr7+wbvU9cHWMIcyv7ipuujJLKqrPEhm55wm61Q6ogC2hjk4Hk5GvDw/PNQa5SEy5nL6clbpiAbl4WTKoydLlHQs3hovQ0EOp1Mf/ObKdIZbFy9Xv/eOnxt/c2Xk+Bgvroy8I4g//dPT+ON/fW3n1569Y3NyYucrb9w4v767e2+o6udjPXnXHvZihfWtWT3/UFVNbsU6Tus4/wgQdiLiPQG4GCJenMd4f1WFnVjHzQCsRyCEENbt/Y2MjPSzeJ9DL14Y0dD5gN/7EL/70XznYsLhMbR0W9mLAWoPdnzNDbL9otG7Xvm34G+u5MdA91HPVyPavntsaf30dI21M3Ns3buD7ft2UW3W5qAIfbmHt9bLGsjDfIiTTc4HTM4AOJ2VbN/OCeUZqss8cfL7U57BusyBeDvnNNmi4nUtXtdmdlYOS/gcr8My5rCEz1jq+baZnZWD4xlZN5q5g83snKMy5XO8TpN1KlbYWTk4XmH7dk6o/5YxyRxD9YZ44pY6Rxmsb52dE8rjMGtVvH6O6q3q7ZxQzzvDK9rMzomh3qJ6zDMHx4Nkdu4j67eWqn2Yt87OOV6Wo3rq+adyCc9Q3UK/1Ovfyyyqyzxz6PrFqProySyqO8QzhwNPIyp7sGvsnKMy5cEzeX54eGtUxjxzCS8zdKod0cA8czlevmym6FvTl6Ono7LkI4DdgI318MbpU+vffPfP3/iMaY6MHBnjxZWRtwXxykdPvvH8jTtOXzpx6+rzV+/bC9XmPFY78zh7cjKvbsW1+jRmeLAOk51Yzx6vYjgTYpzPQnw8VHgtzuv3hBAqoLqFWJ9ExASh+ctYxosnIyPHRgT4B+7izRD9gJ+t73xtPNn44Bis1evoMSjf3Ohu7x+b7Xcysu/hfdrVZD3xC6duiz0OhD2+g7mzl/TZ7YXv3AtCBayd3cfWnfs4+a6bmG7PgaoJu/UuJR2Gt87LGsjDfIiThUmF6Xkg3FXr79POCeUZqmu9nRvo98ech+3bOTHEZ25xk/UUqlvq7ZxgnjmG6h2FZ04w6Dkv9XZOKM9ouq0lbD1zGOiZU7Bu5tzjtXNiqGewrnBMc+l4i+qt4Om5CWetB1tjnZ0TBb5VUX2L6jHPXMJmdk6o517ByqUOwjPHUL2hHiIrdQrTbY1qH+vtnGCeOQXrNo5FXArPnEJ1B/jBfwYor7B9O+eoLPOtSkG/F9Ud4pnDoe/EHVEAW8McHA8nI16eGx7emqEZcwkvMyyq3hqVKY8VMhTkDG+Nl6Egh9PJfLVXoQp4eWur+v0P/sruP85rIyNHyXhxZeS28uyHPrR1+ZlnbgLAZz/0oTOPPPPMG/HKlTOvXHvx1Pn3XHrl9Z/9/Nfv7tc7E9Tna8QLCLiBGB+qY3VHrOdriOE+hBBqxNMh1g8DIdbA6QpxPUZMAQARE1RhK8a4l/7arhhjDCGM5/vIyG3k8I1h92N09eaXfsDP1ne+Np5sHBdfiMfhwah9er38YGKF34hpxlZnccPsY9dmePdpZ7kP8+wxc312u5W1zcn7dnH6fTcwOTXDZM207WJLX+7hrfWyBnLaHdKTVZMK4UzE5AKAbXIy2Vk5D9Yvder7Y87D9u2sXEJljY/Z7UHYNXZOMF/q4HiL6jHPHJbwBvp8Q6xnLpFnqqe8IutHM7cY4pmD4y2qZ4/VuAXMQXjm+rBr7Jy5TtQRDcrneB2VMU8cPUeZ81B96+2cYN641sj6FtU5Cs8cDryKOqii9XZOKI+eLKE6x+XtXEKzprVU7WO9nRNDvUX12LFS0TDUM1RXeXQz+vpHt7dAeYXt2zlHZUMeW+Y8VH+IZw4Dj7sPtoY5OB7DMnlueHhrVMY8cwkvy+jUOiKDZczlqFx59GSKkjV9HS9XmfURwH7A5qT6xfP3n/yei59+9cumMTJyZIwfNo8MJj71VBU++ckaAOqPfWyj+qmf2s3zz37oQ2eme3vV/b/wC1df+Y5veNdGqCbhxt7atRp3V+vrr9eznXfX87AVqno31vP3oQq36hoAwtdhjhCrMKtifUcETgJhs0Zcr4DziPEaIiYREaGqtgAgxjgf/82TkZG3Jov3N+wDd/vmp4F+wK/+CqrOR/POxQRb7BxPtis7hjTbrBlt7wD/+OT9Zzc66wH64NH1xi+cui32UBdX6D7suc5E2x9Om+dqnP6aa1g/v4/pqXnWyuh+K11KOoy+dT05eZgP8TIc5GG9+Q2WO5u//ix/d8bWM+fB+qVOfX/Medi+nZVLsMy4SJyL6jJf6iA8cwrbtXOOyphnjkCfb4j1zEH4UueR9Rc37R52zlEZ88wxVK/xndgKOyeGegbrCsc0l463sB5zKPeDzk8P1bfezsqh7TuVjhCwHnMY4O2caLyKW6gS88xhCW9RvSGeOQjPnEfWby1V+1hv5xyWMcdQvaN63SvPYF3mEiSjfwYwB8crWJ85lPvFWNh38boqs97OOUPPCYXqM89cQmXC03PDw+sPzZiD4wmtqlo31KMnQ0/uZQpvjZehIIfTYX63wuZ6/PXHPnj/14dPfe4NG4+MHBXjxZURNL/U0fqjqP7Yxzaen740ufwTz9x84aNPnJzcOlld/Jmfufrit3zd4xcfuPCVm8+9+tCt3dn5EzXeuFbN3zevq1fWQtyYzeJ7I+ILIeByjOE9iPFkqONuXYUzAbGKNc4hRASEjTrGhxBCFRCvAuFMcyx7479xMjLyziEC/AN39ubn4M+A9nwgD2/nvvW18WTjgz2szZS9UMAuJpC983272/vHpjycffPjzaHr0231eLDb4vgOhMnkc3KQdXwj2j5ishGw9cAtnHxoB+sX9hAmnXtu0xP35h7eWi9rPzwcL2+yyWaF6iyAO2osfs9SrVOe4XU7T1QX+b0pz2DdUocyH83ci+qWejsnhnqL6jHPHJbwBvqcM4cB3s4J5RmmG4lbwDxzWMJbWI8dKx3IrBwcz2Bd5nDo3eNMKM9g3VKXsI+l6iqvYP1SB+EzV/RYWlRviC91OPQq7qCK1ts5wTxzCtZlDkfkmVOY7mL09rCZnRNDvUX12AfpHdGgPHqyHNUb4Ae//pVX2L6dE8qjnbVqao3yFq+nMuvtnMPOB/SsUdg1ds5RmfLoZvK88PDWDMnsnONlhlbVW8cy5nK8fNmMUdL3Ol6GnpxkoQbCfoUpws9fvGPyAxefufUztjMyclSMF1fe4fz6xz628fhP/dTuF7/xG0/cd3E/hOZiyZ2f/uXrAPCF7/jww/f/hQ9+aec//KX7d6aT+uxH3vPCc//Dz/2OzUl4cR+zO+oaD8bp5HrYq89ExLtChf16Ft8dQ9itgFhj/g0xVNdQ13UI4f4AYH5wYp0L6vyq631U1ZrVIyMj7ywW73Hsh+3kzU+CfsBv15tb7b27m8fFF+LR3f9A2XtxvPphZJXfXGnGVmdxo71rZ22GfTzofmlW+zDPHrPGL263fHa7Yfu+XaxdmOHEA7ewdqJGWO/5R+u9LFHSYXjrvKyBnHaHeBkO8zCpEAIweSgirEc0f9ElX8+cB+uXOvX9MeeR9721LGMOh34Rqx5DdUu9nRNDfY7XYVmpS3hZA32u0bPWZnZWDo5nZN1o5g4sYw5L+BzVsceaY4WdlYPjFXnfW6v+O8YkcwrWZQ7lfqlz1KK61ts5UeAXN1WXobrMMwfhmcOBV1EHVbTezomhnqG6zDOHAd7OfWT9ztKOWNHB8RbVa3wn7oiGod6iesqjm8nXPrrdBcozWJc5lPlOpSMalLeonvIgmZ0Tyxy3h11j5xyVKY9u5p4bCm+NyphnLuFlGa1a3xqWM5c4jkzhrfGyRF+H5cw1RADVrSpun6z+f9MHLn3//f/wy6/azsjIUcE//B55S1J/7GMbOPl6Vf3Yv7z1/He9b/vuf/QLNwDgs9/8xP2P/K+//MXrVz56187N3cn5amv2xhu37tkLIW7v7+P1+c4HppPpq5jF7VnAPesBr+/O6gfXJpNJVcUXdmb176hCeDbEWMc6fgQIdR3qW1WsLtWIk0kM1bzCFDHeCSAEICDGawjhlD3GkZGRkZwI8A/cxRsh+gH/ChdXDvdo6Y5q3S87BrV3o8j2wCr/5kpzo9VZ3OjeG11P7hM2z2+LPY764srauRrTrRlOP3ED6+f2UW3Wpuywau7hrfWy9kPE8XKTTbYCJucBXHA+9VKeobrW27lBfm/KM2zXzokhPnOLm6ynUN1Sb+fEUJ+jOkfhmRPQ55w5DPB2TijPyLrRzC2OwjOnYF17rHQY6OB4Bus6rhN1RIPyFtUb4okbdH562DV2Vg79vhWrLkN1mWcOwgvHtESVrbdzYqhnsC5zGOhLnUfT7yzriAbr7ZxQHj1ZDuuterzKKVR3oB/0+ldewfrMQXjjWiPrw/EM1VUeJLNzwvvzQAYC1i91CZUJT88LD68/NGMu4WUNnUpHNAz1OKZM0bfGy70MPbmThRqY7yBubYRfPfc1j3zDpR//tWu2MzJyVIwXV46YeOXKJHzqU+IvjAfUb5C8/PVff/riz/zM1Vc/9KEzN8/emF5+19fsXv2VZy8DwEa1H3f25g/tzSa3QpidncX6vgmqV+Z1fDAiTBHrl+q6/lgM4dkK1V6N+oMVwsuosR5D/UBEuBFiPBNjqBDiCcR4HgCqKtya1/FSCCHUMV6rxoslIyMjR8jivQ77wF28EaIf8LP1na+NJxvHxRficbC/2sMu62TNaHt9x9bryb4H90fuia1PM+ur22ofs0d+HHSvzuN58P+r9YDq1D42L+zjzJM3UG3PEKqsmOge8iFelijpMLx1XtZAHupDBmaTUxXCHRHViQgMfYwYrG+dnRvk96U8g3VLHfp9zG4Xw/rMQfhSB8dbVI955hIsY44w6PlmDsKXOo+sH83cgnnmsIS3qJ49VuMWMAfhmfNgfeGY5tLxOaqjPERm3KDz00P1rbdzosAvbqquRfWG+FKHQ6/iDqpovZ0TQ71F9YZ45kC8nUvI1ixuqn2YZw5LeIvqsdd9RzQM9QzVZZ44+doH7wOOV7B+qUPbtyqqj57MwrrMJVjmuE7UEQWwNczB8XAy4t1zQ6HWKA+RMQfHE1pVbx3LmEt4GZxc+T7UOuVzvI7KlM+Is4DpPMStE/H//cDFM3+s+uevjBdXRo6N8eLKkqSLIb/1/vefffBf/+s34l++svnKTz537sL9F6/d+OxzD9yab+6d2t7fe/2N2R1rG5Nqurtb34zVfZNJuFbP4/k61HdNgC8A1Z2YxY15VV+vIr4uonq2Rr2JGD+MEF6saqzXwEMI4VpA3IoxTiOwXQN3VgE1Im7EOt6LgFAFXI0IZ+2xjoyMjLwZLN7ziA/bGZ0P+L0P8Xv+2i20jqGl26pzfGIPdnzNDbL9otG7XvnC31wpPV7YLLsNdQwHQdfbxyzzrbm5Pd2usX5mjpPvuYH1S3uo1rLfVrHYA8vxskRJh+Gt87IG77x215MsVBXCRsTkMhC2SIEoiepab+cG+n0x52H7dk4M8Zlb3GQ9heqWejsnmGdOwbqlLsEy5gj0+YZYz1zCZnZOKM/Iuoubdr2dc1TGPHMM1Wt8K2Zd5rCEZ7CucExz6XiL6jHPHLp+0Pmp8Lo2s7NyaPtOpSMIqrOKVx0cZF7cgZVXcXC8xeupjHnmIDxziqzbWqb2YJ45CM+cQnTpa4k5LOEZrMscuKfHC95d4GUW1mUOZb5VUX30ZDmqN8Qzh0PfiTuiALaGOTgeTka8PDc81JohnrmElxkWVW+NyoZ6rJAp+tZ4uZclWIe5nJTPA8Is1ptr4b967Ldm/7ZpjYwcKV8VF1difKoCgPjvf2YjnN6O8bPPTcJunN588eqpre04e2ljM1x6X/Ua8K7q2j985v616dbujXjjjlkdq+n6eh139u5AqCb79X61FqrNnbqeVjGuI4ZL0+nk2qyOd8U6Tqoq7NR1/YEQ8CIC1ut5uHdS1bcQq3qG+o4QMMU8rAH1JIRwAogXEMOroQqY1/V9IYQYEG9GhHP2exgZGRl5OxIB/oG7eFNEP+BXfwVV62vj1cUEu4GzPz0G5Zsb3e39Y7P9Tkb2zY/X0llP/MKp22IPdXGlNS+Ou+1DBVRrEWc+eA0n7ttFtTnvfvMWL/cyFOQe3lovayAP9SFLZtM7wsE/cr+ZlZw+hfUHOKa5FLBuqUuwzD4krOPB+swl8kz1hnqL6jHPHJbwBnkeM88ciLdzQnmG6UbiFjDPHJbwFtXL/OIm65Y6OJ7Buszh0Lfinm4vqreip+cnc32oNdbbWTm0fdFjaVG9Ib7U4cCrqIMqMs8chGeOoXpH4UudR9ZvLVX7WG/nxFDPUF32/HdEw1BvUb0Bnr72wbuA4xW2b+cclTW+Ffd0i/C6KrPezjnsXEDPGgbrM5dgGXMJksnzQuH1h2bMJbysoVPpiAyWMZc4jkyh1iif43VUpnxO6sSAcAvYPjn92w89ced/GP7BF143zZGRI2PliysxxgAAIYSYbidyd3j7hyb4IdT4NlT4ticj/slnDta89GQEPjUBAHzmiRle+uWtuHHvHPgSbjz/6umTL1c72Nxfi2uba9f3d/avvTbbOjmZbdRhc39/99r52TyexHRyq4r794b55OYszCMQ71uL0xfm03gSsb4fMVQhYj3EWM1CnFQhbMY6bNYhzgPwSF3jWlWFU3E23whV2Ash1vM57kXAvEIAEE/HgJN1xD4i1gNwNoS4E4EqAHHxWyPZv0cS6/pmqKqt7GEZGRkZ+apg8d6HXRyxooF+wM/Wd742nmwcF1+IR3d/u4fK8n3J9oDzb64oD2ffA9+9p9J9QY5T9Vs95hunji8CmGwAp99zA+v37WDt7D5C/g7BHkjOslmipMPoW9eTk4e7jZerbL3C9DxQ3THg36WxsH6pU98Xcx62b+fEEJ+5aOYiWJ85CF/q4Pgc1VEeJLNzjpc10OcaztpSb+eE8oysG83cgWWlLuFlCdWxx5pjhZ2Vg+MZtmvnnCEfrDGnYN1SlzDZ4HOUobrW2zlR4Bc3VZfBusxhoGcOB15FHVSR+VIHx1tUj3nmEirLvep4NGtaS9U+zDOHJbxF9djxUiEcHM9Q3UIvX/fodhcor7B9OycK/WIs7Lt4XZaVugT7s6AjCrBr7JyjMuXRzdzzQuGtURnzzCW8LKNV89awjLnEcWSMvr6Xe1mCdZjLsfk8IOyHva2T4T9++M/+7v9H+IT+5xtGRlZl8VFH/OhHp+HTn57F7//oJj6PGQDgDmyGT336evz+79/E5z+P8OlP78QrV87gxRd3AcxubNaXbm5tYWs6iTfeuHHy0rve9+JrP/+zDwBAePf7vrj3m7/8QJhObm6f2b5+/YWXHgqbWy+t7+6fvDm7+cR0e/r5vZ14tprPz9aTyetr+/Mzs1MnvhB39s5OdmcfnK6v/y+o9x/b3YsfmYb4XAzVSdQxxCpO63l8PFTVrx4cePy2SQz/cL+uvyMExBDCZyPiRwPwW7HGBQScC8DzNcKZgBgDqmdjnD8JhGcxwS3U+NoK4Z/HgHOxru8AsB9jPF2HsDOpwvVYx/MVwssxxpMx4GRVhd0YsR5jnIZQRSCuLx5NQozxZgACQjgBYAfAZhPsI4Q1xDgDQkDAJAIxHMEFr5GRkZG3Aov3N52LF9lg6HzArz7Eb2619+1ufHgMbd9SneMzx5DRyZrR9g4gF4Xses8X/rVgB4qsNx7kOFW31WPePmbGn7h/Dycf3MHk7D7Wzu5nzdSzIsPLcAS5h7fWyxrIU3PIklm1UaG6UGNyBohrfreD16VPYBv5/SjPYN1ShzIfzdyL6pZ6OyeGegvrMYcj9Ab6nDOHAd7OCeUZWTeauQPLmMMS3sJ69ljpMNDB8QzbtXPOkA/WlLeoHvPMgftB56eC9UsdhDduMbKugnWZw0DvOBZRWLHUYQlvYT3mEipjvtQpsm5rmdrDejvnqEx5i+o1vhN3RAPzzClYlzlwT1/34F3A8R52jZ0TzBvXGlkfjmeobqm3c6LxNKayB7vGzgnl4WTEy/PCw1ujMuaZg+MNrZq3RmXKw8mUR0+m8NZ4GXpylSmfYzvzgDAPe6e3Jn9v97vv/cHHf+Q3d01jZOTIOLy48r0fugicRFzDZqhxHbNXQ1w/vx32Xr2BsH7wGyXXTu7g1PVNXDu5g22cfGUvnguTeTUJ6zuzWzcuTU9sv1Tv7W8D+7i6dvalk9dfeqDaWLt59ls/9vnXfvp/fGCydeLm+qnJ/tUX3ri8dmb9ary6f2o2jWH/rgtfWvvyi/eunT5xrd4+8drsC6++u6rW9s6sb730xt7VSyc313dv7tb1+uZ0bX9/H6h363o+vYgQ4mx3fmJtrar36/nuJE62YzU/G/fjL8wn4YFpiGerefj1vVA/Ma1DDYSrcS1cjHV8fhrCpAYenaxVn5nvzx+Z1cB0Y/2z873db62AFyaTjc/MZrsfiJMQp/OwPov1yckkvjGfx3sQJhUQv1LX9btCVU1jwIsTxDP1PG6EqroZYpzUodoKMb4xR32xCtWsivHmPODREMNOFePuPOChCvFXauDREMM6UH8ZCI8DcQOx+nJE/SAQng0I63Wo7wwIzwbgdETcDDFcjTHeEUOYIWCKiHUEBHlhJmIHobmo09LjxZyRkZHjJQKLd7/5+x31hph+wM/Wd742nmx8cAzWtvdXe/R69qEU0HtsysMcb6u3uGH6ds5vq8eD3RbH17m/zNm9Ni/tY/Phm1g/Ncf03D4mmwe/cdE5io7IWDZLlHQYfet6cvJQH+Jl6M/DRoW1OyNwVp5wHNVlnjj5PSnPsF0759jMzjlNtqh4XYvXtZmdlYPwzDFU7yg8c4RBzzdzEL7UeWT9aOYWQzxzcLxF9eyxGreAOQjPnIft2zmh/kih0vE5qqM8SGZnDDw/PVi/1KHft2LVZbAucxjg7ZxQzztDFa23c47KlM9RnePydu4j67eWqn2st3NiqLd4PfX8M8kcHG9RvUIvX/fodhcor7B9OyeUx2HWqXSEcArVVR4ks3Mi851KRzio7lAPkQnHtItaoDycjHnmCJ1aR2TYzM45Xoae3MsYfX2VK5+jOspDZBFAHVDNq92z5/Dn7/2Fvf/YVkZGjpKVPliPMVb5mO3Hbh+c8j/0QwE/BABPBvzQZyJ+CMCnngzhE5+Yx/hUhR8CkgM+BeAKwic+MQeA+AM/sBZ+9EcX/xPY3/r+j24+9Pc+vZPm+L3fuxV+4iduppkRn3pqGj/zmTUACJ/4xB4+9RdOxmc36vDe9+688ey/OHn1xLt27nvyyXl89dUQvvVbZ2/85R868+LO3uSxe99948VXf+vuV3HmRQCY7r1x9pH1M6//0rVr0/dub4cv37t1Ily/Hi5X25PXbuycqqv9/VOTrfrWzVvbt+bzydZ6mOzvxXmcYAvzeE8dwi9jEu6a78+21+vwbF3hgbVQf2VnXk2qaXw3gBdRTzdR1XdNAl7e348PY1LX07X135jt7n0jgN0aYRZifDwC+6jjPiahqkI1i7E+H+dxE5MqVIi39ut4/yRU1xDjVgzxQohxvw5hIwB3I+IziPFhIAABLwJ4NNbx5VCFKYCzMcaXqhDO1DFOQgjVqufMyMjIVw+L9zmdixfZYKAf8Nv15lZ77+7mcfGFeJD92cWEdNseXzOS7QHnN2tsv5ORfQ+8XUnWEr9w4jacffL7XNwyj9n0ZES1NcOp99zAxh17B/+2Soa9r67I8DIcQe7hrfWyBvKQH7Js1jDZDphcAnCqoJxQVevt3CC/H+UZtmvnxBCfucVN1lOobqm3c2Koz1Ed5plLsIw5wuDnm/lSB8czmm5riV1v54TyEBlzDNXLvDxetRZOpjyDdR3XiTqiQfkc1VnRDz4/Fay/ikPbtyqqb1G9Id46Oycar2IKK1tn58RQb1G9IZ65hM3s7JF1O8s6YoDDEt6ieupDaSqX8BbVK/TydY9ud4HyDNZlDmW+VSno96K6QzxzOPAq0gFBdZlnDo5HN3PPCYW3RmXMM5fwsoxWzVvDMuYSy2TKe3hrvAw9ucqUT6g8AmEeUO2F3ZPnw5++/+P/5x8On/xk9vcsj4wcLeMH5UdAjDGEECIAxKefnqSLQYz64x8/Uf3Yj92yPideuTLB1tZafO65Sfgjf2TnjR/+s6ers+uTVy689/q5X/vZrRsXH96pdnfDqZ1XTn9pvnn91N7e2Vm1N714+czOtRd3zt95392v3XjpxQu39vbWIiaXdvbmL08nuDCZ1RfmVfziWoz37tfhdDXFcyHi8TnCC9MYNmaxfu+kqn4jznH3PO4/Np1UvzKbhY8E1K/HUO0h1h+JCM9XiJs1sB2AmwGYROAcEOoacRMhnA6IG4ioAExixDUgTkIIW/lv0MQY90II6+Nvz4yMvHNZvNdh/2aKFQ30A3578SO71fJk08M9hAfZnx0D2T8uvnS2b9D7wtk7P+ZWZ3Gje290PblP2Dy/LfbwLq5Ua0C1OcfW3TOcePwapqdnCNOmlW3SPQolG5bNEiUdhrfOyxrIw33IsllDrCpMNgOmD86BIf9TB7a3dXZukN+P8gzbtXNiSR+z28WwPnMQvtTB8RbVY545LOENg55v5iB8qfPI+tHMLZhnDkt4i+rZYzVuAXMQnjkP27dzgn241hENyltUb0U/6PxUeN08U70C36qofo7XURnz1tk5hz3vClW03s6Jod7CeszB8XAy6+3skXVby9Qe1ts5oTx6shzVY899R2SoTPkcr8My4uTrHrxPXR92jZ0TBX5xU3XRk+V4PZVZb+dE4ztxRxTA1jCHJTx45p4XDK+vMuaZS3hZQ6fSEQ3MM5fwMji58h7emmUziJy5HCcPNVDPgDAP8zMnp9/2wK/v/DPbGRk5Skp/NB95GxCfeqrKr8bmv+nzxY9//MT95KJOfPrpCa5cQfzu794M99wzx0u/fPbl19eq1z50+pWz//KVB+qNnVnYnd+MaxsPrd/Cc/snJ5f36tmZ6cUzvxKef/0D1WRtcxpwc7feeyBGnK1iuIZ5fQcm1fYM8VXE+EgVJ1Ws5i/EGh+oYryJCnFe44Ooqi8gxjsR4wUg/EZAfDwCqBBeq2O8HAJu1gcXZSbh4KOkkZGRtxGL9zvNO+D8/Y96U0w/4GfrO18bTzaOiy/E42B/tUevb250t/ePrdeTfSMOjtVC16fZ9Dt5flvtw/aIEZPNiOmpGqfeew0bd+4C6+R/DES+jwVUNiybJUo6DG+dlzWQp+eQZbOcKmByFqjOAmG7YJGqWG/nBvr9MOdh+3ZODPHGReJcVLfU2znBPHMK27Vzjsqst7PDoOdbeZhM9ZRnZN1o5hbKQ2TMwfE5qmOPlQ4DHRzPsF07JxpPYyvt7MG6zMHx6Gb0/ES356K6zJc6OI9lRxBUZ1Vv5wT7cN1Dla23s3JwPEN1mWcOA7ydS2jWdJZaYWflsIS3qJ46VigpPHMM1Sv08jWPbneB8grWL3Vo+06lIxqUt7AecwmWMYdD34k7ogC7xs45KmOeOfScFwq2hrmEyphnjtCpdUQGy5iD47FCxujrL5srjxUyNPl+hY0JXtvanv6R+z5z6+/bysjIUTJeXBkZRLxyZYIrWPx1bfGpK+vxM3Hy/M5OuHt3N+DGjQoAwn/yn9yKP/d3Nr78E5+5+747Tl+//sLupVm8ef1aNZls7c4ejPPp63tVPDeN9d04sfa5+V58Is7j+mR98quzvb3vrFDdqhHOh3r+JEJ4LdT1qTpgDaj26np+ZwROVVW11vzX9QEgvo4Ypgg4iRhvIoSt5ohvNB9Bjb8hMzJym4nA4h1w/v7He1Pc+YCfrc9u2a3kxQRbbGVlF1egMvlBhd4X9nuy+zZjq7O4Yfaxa4lfOHXb7tka2vtPNiImG3Nsv+cG1i/vYro9y9uHmLtv75kPBC/3skRJh+Gt87IG8pAfsmxGWLuzQjhfA1ObZHh72szO3veiPIN1mYPwzKHto5mLYH3mQLydE0O9RfWYZw5LeMOg55w5EG/nhPIM043EQTkcobeoXuNbMeuWOjieYbt2zmH//eqIBuUtqjfEE0fPT+Y8WL/UQXjjFiPrMlRvVW/nzLFIosrW21k5OJ7BusxhoC91Hlm/tVTtY72dE0O9RfUa34k7omGoZ9iunXNMRl/z6PZaeBnD9u2cKPCtSkHfxeupzHo757A/+9GzhsH6pS6hMuLlOeGh1igPktk5x8syWjW1Rnk4mfJwMuX7UOuUR08GkTOX05fj4FyJu8CkDm/c+8D2bz/773/3z4dPfEr+DUMjI6syftg88qYT49OTeOXp9bC9HeONGyF84hN7V/+z/+js6a1Ta7+6v3bjwnTv0fnG2v75WRXfuHbj4vqJtc1bs/k0hHguxOpezPefm9X1YwjVOYTwKub1BwDshwr78xofiQi/BMR7AuKDQPitGOMDIYSbiHESgUuoqlshxpP2uAAgxjgPIUysHxkZ6Wfxvqd5J5y/D1JvjumFAnvxI7tlt5EXCUyxNdr92TEo39ywx5FM7/o024zse3ifdjVZT/zCqdtij/z+piciTjx6E1sP3US1NUdYI7+tkkO+jwVUNngZjiD38NZ6Wfuh4ni5lxmqzQqTs0C4UPu/18n2LHXq+2HOI+97a1XGfOMWEesoVLfU2zkx1OeozhDPXMLLGuhzDWct86s4j6wfzdziKDxzDNVrfCe2ws4J5pnzsH07J4Z+uKa8hfWYS7DMuMHnJ0N1mWcOwmeuFbOuwnbtnKMy6+2cUM87QxWtt3NiqLeo3hDPXMJmdu4j6y9uenvYzM7KwfEM1VXPPZPMJbwsR/UKvXzdo9tdoDzDdu2co7LMtyqsz5xCdY/CDzkP+rBr7JxQHk5GvHtOMLz+kMzOOV7W0Kl0RIbN7JyzbIaCPKev6+UqUx4rZIZ4q8LWyepnLl3c+L6z//zqZ20+MnKUjBdXRt4WxKeeqvDkkwEA0r9pE7/3e7fCT/zETQD4wtd8zbmXvumbrj/5/K/c+8rrt2Zb07Vqd/fmw3OsPRdm+w+EOp7cOnXiCzdv7P229Qqz/Spcw2z/vUAV6jqcrzG/HBHeqBDvQsRGrKopYr0BhLtDjDHGOEUIp2OMN5uLLRuIcQ8hrNtjHRkZOWDx3ueI/80VLLL8a+PJxnHxhXh096fHQPbO9+1u7x9bryc/+Bzcn7ViPTle2Dy7DWcfxIhqCmxe3sXmfTtYv2MX1ckZUBe8i8g2svfXFRlehiPIPby1XtZAHvZDls0I1VqFyd3x4Hcz2W+wePt5J0KD/D6UZ7BuqUOZj2buRXVLvZ0TQ32O12FZqUt4WYN8HJnDAG/nhPKMrCuPM2EzO+eoTPkc1bHHyga1Fk6mPIN1mcOBl8dp8bKE6qzg5Z9FcNYrWH8Vh0PfiTtCoHrMMwfhHcciiipab+ccljHHUL0hnjkIz5wi67aWeXvYzM7KwfEM1m1cJ+qIDJYxp2Bd5tD1S73ulVewPnMQ3h5z5wbBy3JUj/lSl7B/7ieo7MGusXNiqEc3c88JhVpzFJ45QavqrWMZcwmVKY+eTKHWKJ9YJmcupy9vCBHAXsDapPrFu+6Z/KGz/+LWz9rOyMhR0vexyMjIO4b6B39wI1y9GvDKKxWuvXD6S5ceeGP+hV8+sxa31jar6o2d6f6Tlza3b+zt3jp/c7Z/fjJdO1fvxWt1qB9FjOfqEK7FGJ8IEZfqMH89zvFNoQrPxohtRFwOAc/WMd4BYB1VFdRvw4yMfLWweO/TuXiRDYbOB/zN3Fqf3Wrv29348BjavqU6x2eOgXgsji+73YFcFCrYW+2bH29OZ20GPWZ22+mtX9jHiQd2ML2wi427dg8uqlTkzhhZp1PviIxls0RJh9G3ricnp2AbL/cyQbUVMLkIhDNiMdOFTn4vyjNYdxWXaLJFxetavK7N7DzEwfEW1RvimYPjDYOeb+YgfKnzaPqLZWr9EM8cHG9Rvcy7x8schGfOw/btnBjyARtzDNUb4okbdH4qVNd6OycK/OKm6lq8HstWcTj0Ku6gitbbOTHUW1SPeeYwwNu5j6zfWqr2sd7OiaHeonqN78Qd0TDUW7wey4yTr3l0u9L1YdfYOVHgW5WCvovqDfHM4dDTmEqB6g7xzCVI5p4TDK+vMuaZg+MNrZq3hmXMJVSmfKIvt3j9o86UR09miPHgg+76ZoWNrfDpe9538fee+e+fe8X2RkaOkvHiyshIRnz66clv/NO/O30UQPUjP7ULAK9+53eeOXf58i5ufv7sV7584+LmtLox299/7049e6kKW9OAvQfXp7h5c2/+5FoVJuvV5Lmbs71vDzGcq4CbdR0eiCGGEEME4rkYcBoxRoRw8eBOD/6NmBjjPkKYjv82zMg7hcV7oObdcP6eSL1BphcK7MUPc6u9b3vjwz1auq3s/uwYlFcfTvUcm/JIWaNavcUN07dzfps80HRPcnyTrTnWzs2w9eAtbFy+hbAWgSpb0d26i1fvCIOXexkKcg9vrZc1kIf8kGUzh7VzFXA+ImyZDdR+1tu5QX4fyjNs186JIT5zi5usp1DdUm/nxFCfwzrMwfEgmZ0dBj3fzCVsZmflPJr+Yhlbz1yCZaWOoXrGDz5e5uB4Bus6jkVUMsdgPeYwzNPzkzkP1bfezsol1GPZEQSvwzLmQLydE/I9C0EVmS91cLxF9Y7Dq45Htqa1nO1V6iA8cwyvp557JpmD4xmqW+jpax7dXgsvs7BuqUs0WafSEQ3KW1RviO9xnbgjerB9O+eoTHl0M3k+eKg1ykNkzMHxGZ1KR2TYzM45x5ExvP6yGUhuZ0ZJJ2ceEGax3t4M//O5y9tXzn36jddtZWTkKBk/xB0ZWYEY48H/fvvbvm376vTmxqv3PnHj4q//09PXTz5y465H19ef/aVX33PPierGV964cU+IuGdjEvZ2Z7MJqsldMdbrMVYnI+KHqhierzH/mhjDHRHxRcT4KIAbAaFCwAUAOwA27f2PjLyVicDi3XD+fsh7g2w/4G9ke7251d67u/nBcVjr7M+OIc02a0bb6zu2Xk/2Pbg/ck9svfELp25n3elGjbgRceKBHWw+eAOT7Rmqte5egNmEkeW0SmXDslmipMPw1nlZA3nYD1k2cwhrFcJGxNr9EdH+C2FsT+vs3EC/D+Y8bN/OyiVYlrlo5iJYn7mEzeysHBxvUT3mmcMS3kCfb4j1zEH4UueR9aOZFzCHI/QW1Wt8K2Zd5iA8cx55X61lx0lFg/IW1WOeOXA/6PxUqK71dk4wn7lWzLoM1VvV2zlzLJKocu5LOjnKM1iXOQz0pU5huotR7cE8c1jCW1SPXVzpiAbl0ZPlqB7zxA1+zSuvsH07J5THYdaqqL7yDNUt9XZOsONNUOnA+szhaLw8HxRen2XMwfHoyRpaFa/PMuYSy2TKK/r6KlceTqY8ejJFbC6u7FX1ic3w4498+JHfFz71y3u2NjJylIwXV0ZGjpEYY8CnPlWFT3xiHr//+ze/8txzk7v/0T+6EePTE+AKXvmub3z8/HT35Vd2q/vnN+PltVC/shvj+yahuhGqamN3f/4dAfgK6vpdCNhEjb1Y4X4AW4jYiDGeC82/+xJivBVDOBFjnIUQ2N/APzJyW1m8F+pcvMgGQ+dCQTO31me32vt2Nz48BuHBjs8cg+ebG917Ru/xqSzfu9VZ3DD72Dm/7WXZbQAIazXCeo2N8zOceNd1TC/uoZqW/YP1Lt5jRGXDslmipMPw1nlZAzkND1k26yMCa/cAYTsAJ7wHnHg7N9DvgzkP27ezcgmWZS6auQjWZy5hMzsrB8fnqI7yEBlzcHwGfa7hrGW+1MHxjKwbzdxiiGcOjreonj1WOpA5MdQzbNfOCfZBK/x+EazHHMr94POTobrW2zlR4FsV1bewHnMJlVlv58yxiKKKzJc6ON6ieswzh4GeOUXWbS1TezBf6uB4i+od1etdeYvqDfCDX/fKK2zfzokC36oU9HthXeZAvJ1zhp4HCtZnLsEy5sC9PBc81BrlQTI753hZQ6fSEQ3MM5dQmfLoyRh9fZUrn2A5czl9OSEAiPsB2Ec8eS7+3x/+5fmfsZ2RkaNmvLgyMvIWIz51ZR3P3Jq+cPPzp27d96E3tn7j5y6vxfXZuXsvx+eff/aJ9RrbYY7prXr/3slk/VyM9XY9ry8hhAcQ41dijB8GcBrAVwA8EYEvBcTzQNgGMAP/p49HRo6cxXsh9g/SW9HALzKQ9Z2vjVcXE+wGzv70GJRXP6j0HFuvb260ejg4Vgtdn2b1eORzAKabNapTc5x4/DrWL+5isjU7+HdV+rAbWkzeqXdExrJZoqTD6FvXk5On6BAvQ0GuiAe/wTK5FFFdlCflATazs/c9KM9g3VKHMh/NXATrMwfi7ZwY6i2sxxyO0Bvoc84cCr3qoCezZN1o5g42s3NCefRkCdWxx0oHMieGeobt2jnH/lHR0+1FdVb09NxEt9cL65c6CJ+54scyR/WYZw7CO45FFFYsdRCeOYXqMs8cBnrmFOqx7IgBDkt4C+upY4WSwjOnUN0Bnr7umYPjFazPHIQ3rjWyPhxvUb1Sb+cc+2d+4wZj19g5oTycjHh6LvSh1gzxzMHxhlbNW8My5uB4rJAxvL7KlE+wnLmEl/UQI4B9oKpDPL05+Xcf+Ozuj9rOyMhRM15cGRl5mxCvXJngCoDPYIJnbk2/srsb7vqHf2Qn/uQ/nd74Sz/7+M26uhn2d96zf6veDdP5FPXkw9Va/Eo9i4/EeXU5hrqqga8LiC/EOt4ZQrjz4N97qc5HxCoA0xjjzRDClr3vkZFliEjvbtrvj7w3yZ0LBWx9dstuJS8m2GIrK7u4ApY1o+0dULYvPWay74Hv3lPpvrB58/8nJ4AT77mKE/fdRHWiRuj7bZWc7l10Id/LAiobvAxHkHt4a72sgTz0hyybeTTrqs0K1bmI6kLzLzla2P7Mqe+BOY+8761VGfONW0Sso/C6LLPOzgnmmWOo3hDPHBxvoM81nPXMr+I8sn40c4shnjk43qJ69ljpQOYE88x52L6dE+xDNog+cwrWZQ7lfvD5yVBd6+2cKPCLm6rLYF3mMMDbOdF4FbfwSjazc4J55hSqyzxzGODt3EfWX9xUe1hv5xyVKW9hvcZ1oo5oGOoZqss8cYNf88orbN/OiQLfqhT0Xbyeyqy3c2LIn/l92DV2TigPJyNeng8K1R/imUt4Wcai5vVVxjxziWUzS1/Xy5fJlEdP1kcEsF8h7Mf9Cw+v/567/9cbPxlCWGXHkZFe2I/eIyMj7wDi009P4t/98+dRTzevPr97fe/M5qV6f7ZZb0w2wv7u11eTzc/O9/a/oa7re8OkmsV5PI26fqAOYaMC1iLi+xFxFYhrCOEEYtxFCBv2fkZGFIdvKtlFECMaOhcKmjmv542WJ5seHoPwZF3nGDyvflhpbO/6NNusGVvrFzfsarKeeJgsTCO23nUTGw9dR7VRY3JinqWFdA+lS9bp1Dsiw8twBLmHt9bLGshTdMiymUdaV1WotiKmd+Hwrwez5FpVhFd9CuuWOvT7Rax6DNUt9XZODPU5XodlzGEJnzH4+Wa+1MHxjKwbzbyAOTgeJLOzB+satxht186JoV5h+3bOHIuoZI6heswzB+7p+cmch+pbb2flEuqx7AiC12HZKg4HXkUdVJH5UgfHW1RviGcOwjPn0fQ7yzqCODvnsIw5huqp553KJbxF9Qo9fb0nVKY8g3WZQ5lvVQr6Ll6PZQMdi7jswa6xc+IIvHs+MFRfeZDMzjleltGqeWtsZuecZTLlPdQa5bFkpjx6sj5i83+zgOkkPHfyxMa/d98n/tSPh09+csD/enBkZDjjxZWRka8y4lNX1vHklXn8p/90+mvPPLMOABeq/bsvnT2z88KrX7lcxcn5iMmDe7P9vQnCg0D1BGL9el3XH0YVdkKMp2uEuxHwKhAuIMZ1AOv2fkZGFu+LOr8Zkg0GepGAXZzpfG082TwuvhCP7v70GJRXP7T2HFuvJ/sefB/WivXGLxyAahKxcd8uTjx6A5PT+6i2Z907K6VkXdbp1DsiY9ksUdJReGu9jD9Fbbzcy/rI1k7PBFTnAZw0G7L9iZPfg/IM1i116Pcxu10M6zMH4UsdHG9RvSGeOTjeMOj5Zg7ClzqPpr9YptYP8czB8RbVs8faGRwH4ZnzsH07Z45FVDLHUD3mmQP3g85Phepab2flEuyx9Po5qjfElzoceBV1UEXr7ZwY6i2sx1xCZcxbZ+c+sn5rqdrHejsnhnqL17PPfU+XorxF9Qq9fL2j25XOg/WZQ5lf3FRd9GQ5qlfq7ZxoPI2pdGD9UgfHo5u554LCW8My5rCEz+hUOqKBeeYSKlMePZmlr+vlKhvq0ZOVkNbfDKgm+Py9F0//vrM//+rPmNbIyJEzXlwZGRlp8cWPf/zE/T/2Y7cA4NZH3//gxsaJqy9dm7272p/tT+/Y2r/5+s0PT2OY783qB6uIk2EymdXz2QcA3AVgLdb1OYRwJiLuIWKt+WvG9sYLMF99RGDxzjh/n6TeLNuLAXJ9dqu9b3fjhelGWab3UR6L48tudyjbFywj+x54u5KsJT6xce8u1u7cw/rdtzA5OUM1rREDOaAh9K3N8k61Iwxe7mUoyD28tV7WQB76Q5bN+sjWhrUK01NAuGz+R1p2fzs3yONXnmG7dk4M8cZF4lxUt9TbOcE8cwrbtXNCeZDMzg70+WYOjofJVE95RtZd3GTrmcMR+hzVMV4er50TQz2DdYVjmkvHW1iPOZR7em6i23NRXeZLHdq+VVF9C+sxB8fDZKrXeBV3UEXr7ZwY6nO8jsqYZw7E27mPrN9aqvax3s7KJbwsR/WGvN6Zg+MtXk9lxg9+zSuvYP1Sh7ZvVQr6vbAucwmb2Tkx5BzwYH3mcDRengsKr68y6+2c42UZi5rXV9lRefRkDNVXHj0ZRM5cTl+uyNfVAXEnYnM7/NL5O9b+nUv/4tbPZunIyLEwXlwZGRkpJsanJ/ihz0T83H935vlnb03DpYduYueFO87cc9fs6suv3YubOw8GrJ3bnc+rSV0/gTA5VYV4bT6bf0usQlUB8zrifTHit0LA5RjjJIQwsfcz8s7g8M3lwa38PY96w0wvFNiLH9mt9p7dTQ/3EJ6so8egvPqBpbG969n9L76Y3uKGPl7YNU22fscMk60ZNh++ienFXWBtjpD/g/X8myijZC35fhZQ2bBslijpMLx1XtZATsVDls36MGvDeoXJGSBcrBGmvNOZG+jxM+dh+3ZWLsGyzEUzF8H6zCVsZmfl4HiL6jHPHJbwBvp8Q6xnDsKXOo+mH7PbHYZ45hJellCdzLcqrG+dnXO8zGK7ds6x/+1SXeUtqreiH3RuerC+dXbOsZk9Tjk4sB5zGOgdxyIKK5Y6CM+cgnXBjjZZAAD/9ElEQVSZwxF4O3uYbmtU+1hvZ+XgeAbrNo5FVJY6heoO8PQ1z1zCyyysyxzKfKtS0HdRvSGeORz4TtQRBdg1ds5RGfPMQZwLCq+rMuaZg+MNrZq3xmZ2zjmOjKH6ymPJTHn0ZH1ka6s6IO5VcTqd//zZd23+jrv/0Y0X8+rIyHEwXlwZGRk5MuJTV9bDJz+1BwCvfOu33nf+VLV/9ebOA7OdcHM37q3XEd84nYRX57P9b4kxnIyId4dYPxgR9mMIp1HX55vfdDncE4hh/LPqbUkEFu+M8/dK3ptlegHCubjSnrsXGrA4Dmud/dkxKN/c6G7vH1uvNz8I5cdqoesbPz0ZUW3NsH55FxsPXsd0a45YdfcA6DdRRsm6rNOpd0TGslmipMPw1nlZA3maDlk268OsDZMKMUasPwTE9XhwgcXub+cGevzMedi+nRNDfOaimYtgfeYSNrOzcnB8juoM8cwlvKyBPtdw1jJf6uB4RtaNZm4xxDMHx1tUr/Gd2Ao7J4Z6hu3aOcE+aIPoM6dgXeZQ7gefnwzVtd7OiR7filWXwbrMYYC3c0I95wxVZL7UwfEW1WOeuYTKrLdzH02/tUztwXypg+MtqseONcEkc3C8RfWYJ27w6115he3bOUdl7DHt6RahuqXezgl2vFT0oPrMM4dyL8+DPtS6IZ45OD6jU+mIBuaZSyyTKc/wul6Gntxmdrb05Qq2bhYQ9yNObEz+2dr77/5dD/2DL7xuKyMjR834geXIyMhtpf7ubzx/89baxtV4bYb96v7ptLpjUseTu/X+/UC1VdfxPXFe31dV4eQc8dUQ8c0xYjcEzACcjzHOx992eXuweK/TuXiRDRn2wkg8kIe3c9/62niy8eExCA92fIdTr29uqHtW6+FkMQtbncUNs49dC6DaAKoTM6zdsYvNx6+jav4KMEn3Gyinb63JO/WOyFg2S5R0GH3renJyKh7iZSjIFWJd2AqYXASqM+TTNTt7x648g3VLHcp8NHMRrM8ciLdzYqi3qB7zzGEJb6DPOXMo9KqDnsySdaOZFzAHx0NkzDFUzx6rcQuYg/DMedi+nTPXiTqiQXmL6jHPHLgfdG4qVN96OyuXyLLFTa+fo3rMMwfhmcOBV1EHVWSeOQjPHEP1hnjmIDxziqzbWqb2sN7OOTazs4fqquedSuGZY6ie8uhm9PWObm+B8grbt3Oi0C/Gwr6L6jJf6nDoO3FH9GD7ds5R2QAvzwWF6isPktk5obyhVVNrjtujJ2N4fZUpDydTHj1ZH2ztfkCIiCe38XcffOzSHw8/8fxNWxkZOWrGiysjIyNvKvHppyf4s3/29Jfe9a6dV37jNzY+8F//mZtf/MG/ct/GrXorVHsf2tvdv74+mTy4H/HNoZpfq+vwRKjj+QgExHg5RrwRqnDR7jvy5rN4r8P+QXorGtiFArs+b9ht5AUMU2yNdn92DMqrH1x7jq1k39acbpMHzq6fnppjem4fW09cRTi9j2qjuajSXdqmL1eUrCPfzwIqG7wMR5B7eGu9rIE8VYcsm3k466bnKoSLEdV6PPg3dhJiDT125jzyvrdWZcw3bhGxjsLrssw6OyeYZ46hekfhmSPQ5xrOeuZXcR5Nf7FMrR/imYPjLaqX+VYlH9RaiIw5D9u3c+ZYRCVzDNUb4okbfH4yVNd6OyuXYI+l189RvSG+1OHAq6iDKlpv58RQb2E95nAE3s4eprsYvT1sZufEUG9RPfa8d0SGypTPUZ0Bnr7emYPjPewaOycKfKtS0HdRvSGeORx4GlHpYPt2TigPJzOengd9sDXMJVjGHBxvaNXUGuaZg+PhZMorvP5RZswlvKwPtXYWUM0Qtzer//Khz+39URuPjBwH48WVkZGRtzyvfvvXPnB2bePal97Ye2gyietra+uT2c29bw5VnMUYH47z+FBV1bNZDPeHiG1E3AOEXYR4DgDG33Z5c4jA4h1y/t5HvWmmF0bY+uyW3Yru0bpxyGE2/OIKFseX3W5Bjrtg3/x47Z4H92dte/3ahTm2P/QKJmdnCBvzVg+gB3qIl3mUrMs6nXpHGLzcy1CQe3hrvayBPFWHLJt5OOsm6xWwBVR3Of/+SoM8buUZrFvq0O8XseoxVLfU2zkx1Od4HZvZOUdlymcMer6Zg/ClziPrRzMvYA4DPXMK1jVuMdqunRNDPYN1hWOaS8dbVI955tD1g85NheoyX+rQ9q2K6ltUj3nmQLydE+o5V7ByqcMSPkd1lAfJ7JxjMzv30fQ7yzpiRQfHW1RvyLFiCW9RvUI/+PWuvIL1S11iyGPKnEJ1h3jhmObSgfWZw9F4eS4oVF95kMzOOV7W0Kqo/lF5OJnyDK97lBlzCS/rQ6yNNYAaqHZDPHFp8oce/aXd/6ftjIwcB+PFlZGRkbcd8fu/fxO/8+b+F//sr54O29tbp7/2a2/e+t/+tw+c3JpUN2f7l/fns4uhmj5WxVjX8/h4RPxgiPhCjfhuAKhDQAWcsPuOHC2L9zydixfZYOhcaJAXV4gnGx/sYa2/rnMMnlc/uPQcn13TyZqxtX5xo3u86xdmWHvwBtbvu4XJqf1W3sLecY6XeZSsyzqdekdkeBmOIPfw1npZ9ynq4uVe1oe3tgpYuzMibAdgsymSvjx25RW2b2fl0O9jdnsQdo2dE8yXOjjeonpDPHNwvGHQ880chC91Hlk/mnkBcwmWMQfHW1jPHicdBjo4nmG7dk40nsZW2tmDdZlDuafnJnN9sDXW2TnHZvY4OzcKYF3mMMDb2TgWU1Qx96oDkTHHUL2j8KVOYbqtke1jnZ0TyqMny2G9xnWijmhgnjkF6zIH7unrHbwLOJ7BusyhzLcqBf1eVJf5UocDTyMqHWzfzomhHt1MngcKr68y6+2c42UZrRpbwxyW8HAy5T3UGuXhZEM9ejKFsyadP9V+hTDH7vqpyR9+7P2/678Jn/oU+V8cjowcLePFlZGRkbc9McYQQojxqSvrX/nnr6/dCQA3blQ4tXPyldfn75qEEHfn8Rvn0zir9qtL8zj/nVUIL9QR90bErSqE7RjrCghn7d4jy7N477PKxZUD2V5vbrX3bm9+uEdLt5Xdnx2D8uoHl57fqllm34iDY81ZPzvH5N4bWL/3Fqqz+wgBCJMl/20VL+ujb22Wd6odYfByL0uUdBjeOi9r8M7z3vV9uaJnXdiosHYxAufICdYgj1t5hu3aOTHEGxeJc1HdUm/nBPPMKWzXzjkqY545An2+mYPjYTLVU56RdRc32XrmMNAzx1C9xndiK+ycGOoZrCsc01w63sJ6zKHc03MT3Z6L6lpv50SP78QdIWA95jDA2zmhnnOGKjJf6uB4i+oxz1yCZdbZuY+s31qq9rHezomh3qJ66nlnkjk4nsG6zIH7Qa935vqwa+ycKPCLm6qLnixH9Uq9nRONpzGVAtZlDkt4dDN5Hii8PstKHRxvaNW8NTazc47KlEdPZvG6y2RH5Usga/PzJkQgzipMI16/eKb6N+/85d2fyrsjI8fFeHFlZGTkq4L6B39wA7/6q9NXbrx2LzC/FsPk/dVsfqJem6zPdnbfH6vwcJzF9Yj6ToTJQ0C9ESM2QghbIcZbMYTxN10GEnH4bid/H6TeOPOLDGR9dqu9b3fjw33avqWWuLiClDWquz057oJ97fG2ejg4VgCYbtdYf+AGJqfmmN5/A3ESMVkr+LdVvAwFuaJkHfmeFlDZsGyWKOkwvHVe1kBOx0OWzfroWxuB6amAcA4IpyJ9FyiPW3mG7do5McRnLpq5CNZnLmEzOysHx1tUj3nmsIQ3DHq+mYPwpc6j6cfsNsVmdk4oj54soTqZb1Vs387KJbzMYrt2TrAPXDsiw8sSqsM8c+B+0LmpUF3r7Zxg3rjFyLoM1WOeOQjPHA69iluoEvOlDo63sB5zcDxEVuoUWbe1TO1hvZ0TzDOnEF36+mEOS3gG6zKHrqfHim5vgfIK1i916PrFqProyXJYj7mEzeycaHwn7ogebN/OOSob4OW5wPC6KmOeOTg+o1Xx+ixjLqGyoV6h+spjyWyo70Osa503dUC1X2Fto/6NuzdOfO+ZX73261k6MnJskB+rR0ZGRt75xKevTIAreOMv/9CZGxcf3lnf2Tlb7d84P9/bfWA227+IKtwf6/BYFePOrI6/PVR4rY64CMRLIYZbCLho9xxps3if07l4kQ2GzoWGZm6tz2619+1ufLCHtWa//D7NHrKX3SDbLxq969V9NqrVAzDZqLF2zy1MT86x9tB14MQcVbqokhc9vNzLPErWZZ1OvSMyls0SJR2Gt87LGsjpeMiyWR99ayMQJhUmp4HqzhpI//5KXmF7MOdh+3ZODPGZW9xkPQXrMpewmZ2Vg+NzVGeIZy7hZQ30uYazlvlSB8czsm40c4shnjk43qJ69ljpQObEUM+wXTsn2H+zOqJBeYvqDfHGyXMT3a6L6lpvZ+USTdaqeP0c1RviSx0OvIo6qKL1dk4M9RbVY545DPB29jDdxejtYTM7KwfHM1SXPe8d0TDUW1SPeeLo6525hJcxbN/OiQLfqhT0XVRPeZDMzgn2/MPpK1i/1GGYp+dBH2wNcwmWlTpCq6bWMM9cQmVDvcLrq0z5hM3tbOnLFWSdPW9CDIh7EWvr4Rdnj2z/nvf94zc+126MjBwP48WVkZGRkYb49NOT8IlPzAHg2nd90x0n4/buq7PX3rt7o95dO7F2arY3f2+IcX1Wzz5QxXh2HuNmiNXDNepTIYRLhxvFfYSwlu/91UjE4Tue/H2PfROU07kAwdabW+2925svJnKfh5m+SNPr1Q8vPcfW682+YT1ienEP6+f2UV28hfU7dxDXxV//xQ/ogGWzPvrWmrxT74iMZbNESYfRt64n985zoGe9l3mUrIsH//7K5AwwuQhgI1ukzmcqBazLHIRnDm0fzVwE6zMH4u2cGOotqsc8c1jCG+h5yhyEL3VwPCPrRjMvYA6OB8ns7MG6xi3Ggq50cDyDdR3XiTqiQXmL6jHPHLgfdG4qWH8Vh7ZvVVTfonrMMwfhhWNawsqrODjeonpDPHMJm9nZI+u2lqk9mGcOwjPHUL3Gd+KOEA6OZ6hugaev84TKlGewLnMo860K6zOnUN0h3nGdqCN6YH3mcDTePRcYqj/EMwfHG1o1tYZ55rCER09m8bpHmTGX8DIPso6eM3VA2ANObFX/6MJ33Hvl/I9+7g1bGRk5DsaLKyMjIyMFxL/1t9Zw7n+qb/z1z1+6sTs7efrCdn19Z+dC3J9cnN3cfTIiPhIDHq9Q35hHvB8xnooIVwPwQIxxL4Swbvd8pxNx+K4nf+9D3whBXWQg/3ZJ52vjycaH+wiP7n3Q41C+uaHuuXc9Oe64+ALEAFRbc2w+sINwcQdrd91EpS6qJLoH08bLvcyjZJ18rJTM8HIvQ0Hu4a31sgZySh6ybOZRsq7phI0K03NAuNg+n+gxM+dh+3ZODPGNW0Sso/C6LLPOzgnmmWOo3lF45gj0uYaznvlVnEfTXyxT65lnDkt4i+rZY+0MZM6xmZ1LyNeo9ew4E1ba2YN1mcMwT89P5jxY3zo7J5g3bjGyroJ1mYPjYTLVO4qLKyi8LziZ8jmqM8QzB+GZU2Td1jK1h/V2Tgz1FtVrfCfuiAbmmVOwLnPgnr7WwbvUedi+nXNYZtxiZF04nqG6zJc6HPpO3BE92L6dE8pDZMTJc0Ch+sqDZHbO8TIVM8kclvAQGXMeXl9lyoNkdrb05Qqxjp03YR5Q1ajX1sP/8Pj/7v/yu8MnP9nzg/PIyNEwXlwZGRkZWYL41FMVAHz+8/9k/aG/9+md1//Qd59/49defui+S3e88MIXX/qmuLZ/od7H12KCW6jj+xDxEEKYx7p+AKGaA3HD7vlOY/F+h10gsaKhcwGimfN63mh5sunhMQhv75Nd6Ei3O8eW3e7Avmez3vGhigjrEXESsP2BVzG55yaqjYJ/UyXhdZbNPErWZZ1OvSMMXu5lKMg9vLVe1kBOyUOWzTxK1mWdyWaFcCmiOn3w768sfbw5rFfqUOajmXtR3VJv58RQb1E96+2cozLlM+TzzTxzCZvZWTmF6UbioByO0FtYjx0r8Z05MdQzWFc4prl0vEX1mGcOXT/o3FSorvV2TvT4TtwRAtVjnjkQb+eEes4Zqsh8qYPjLao3xDMH4u3cR9Zf3FR7MM8clvA5Xkc970wyB8dbVK/Qy9c6ut0FyjNs186JAt+qFPRdVG+IZw4HnkZUOti+nRMrevccUKg1QzxzCS9rWFS8rs3snKMy5dGTWbzuMhnzzCW8zIOsk+dMffCbK3EX9dlL6/+nB37pd/7nIXxqbmsjI8fBeHFlZGRk5Bio/8B3bf/myy9tXbhZ3XVrvz51bmu6//q1+jsD6jPzOj4JxA3E+BAizsaAC+Hgz+M9AO+Y33CJOHz3k78HUm+I6IUNtj67Zbeie7RuHCL3Jxc7pFc/wDS2dz3xYQ2opsD6u97A2mNXUU0jwiRbwe+wjddZNvMoWed9Cx2R4WU4gtzDW+tlDepcB3rWe1kffWuzPFQVqrWAycNzoHKWyoDAusxBeObQ9oubqsuwXTvn2MzOysHxFtUb4pmD4w3y/GSeOQhf6jyyfjTzAuYSLGMOjs9RHXucdBDOzjleZrFdOyca33uccLxF9YZ44ui5yZyH6ltv5wTzxhU9ljmqM8SXOhx6FbdQJevtnGCeOQXrMgfHQ2TW2bmPrN9ayvYpdRCeOYbqqfelVC7hLao3wA96vSvPYN1Sl8iyVk2tUd6iekO84zpRRxRg19g5wTxzCZPR578PtabU2zmhvKFVU2uYZw6Oh5Mpz/C6R5kxl/AyhVjDzpnQ/NkX9ipMq3hj42T1+x/51b2fsL2RkeNivLgyMjIychuof/AHN8K3fuvs+R/+8+dns3DmzKntC6+9dvXx9YD3RmAbQIjz+ltjFU4gxtNAuCNGXA8BJ+1ebxciDt/95O+B2BsioHuRoZHteXGbeLLxwTFY66+jx6G8+iG25/iYTxdQNr/mKqb33UQ4MeN/BRi/wzZeZ9msj761WU6rVDYsmyVKOoy+dT05OSUP8TIU5IqSdaYzOR9QnTf//kqO0BTbtXNiiDcuEueiuqXezgnmmVPYrp1zVMY8c4LOOWrnBPOlDo5nZN3FTbaeOQz0zDFUr/Gd2Ao7J4Z6hu3aOaH+e0Wl4y2sxxzKfOeczPGyHK9nMzsnmM+PM/dUEFRniLfOzjnqOWeoovV2Tgz1FtVjnjkM8HbuI+svbqo9rLdzYqi3qJ56zqlcwud4HZYRJ1/vQz3Ddu2cUB6HWaui+sozVLfU2znBjpeKHli/1MHx6GbyHFCo/hDPHByf0al0hHBYwsPJlGd43WUy5pmD40sga73zJdQBYT+iCuHV7ZPVDzz4a3t/33ZGRo6L8eLKyMjIyJtA/IEfWAs/+qP7v/KRj5y6iFunpmvTO27sxXCimt11czd+R1XFnbrGbw+IO/OIe6uIuxEwAXDC7vVWZfHep/NvmmSDgV6AsOuzW+19uxsf7iE8WUePgflm7N4reo/NZmESceKJa5g+cAM4OUM1JRdVcvidHuLlXoaCXFGyznvMqGxYNkuUdBjeOi9rIKfkIctmfZSsJZ2NywHxdESsbML7EtYtdej3MbtdDOszl7CZnZWD4y2qxzxzWMIb5PnJPHMQvtQpsm40cweb2TlHZcrnqI49VuMWMAfhmfOwfTsn2IeuHdGgvEX1mGcO3NNzkzkP1i91ED5zrZh1GarHPHMg3s4J9nx7sHKpg/DMMVRviGcOwjOnyLqtZWoP5ksdHM+w3Wa2GlBSeOYYqlfo6esc3V4LL7PYrp0TBb5VKej3wrrMQXjmcOBpRKWAdZnD0Xh5HjC8rsqYZw6Oz2hVVH+IZy6hMuUZXneZ7Ki8h7NGni8RwDxgMq+wth5/9sTW2e+7/5df+k1bGxk5LsaLKyMjIyNvIeJPPzXFS0/GF374P31gPo/ra5vrd8xv3HosIJ7am8ePVBVORuAC6ngnYryMEKYxxpshhC2715vJ4n1P8w4ofx+k3hR1Ll4cyPa8uE082fhwn7ZfKLY/Ow7lmxvd7cv33XjsOqZ33UJ1YReTk7PO3hQvw4q5l3mUrMs6nXpHZCybJUo6DG+dlzWQU/KQZbM+StaSzmQ7oDoH4IwJSdfF9u2cGOLZIbGeQnVLvZ2Vg+NzvA7LmMMSPkOem0N8qYPjGVk3mrnFEM8cHG9RPXusbFBr4WTKM2zXzpnrRB3RoLxF9ZhnDl0/+NxUqH7uSzoW+1h6XQvrMocB3s4J9SGrgpWts3NCefRkCdUZ4plL2MzOHlm3tUztYb2dE0O9RfXY894RDUM9w3btnGOywa915RW2b+cE8/ZY5ZChvEX1Sr2dc4Y8/wrWZw4DPXHyHFB4fZVZb+eE8oZWTa2x3s45KlMePZlFdZWHkzHPXMLLPMg691xpsjAPQB2xMQn/5K47T3z8zM9ee8VWR0aOi/HiysjIyMhbmPjUlXU8eWX+2l/4C5ervb1rkzu2771669bd01jdub87fzhW8U4gfHeI9Ut1DI8FxC1UYYqINbvX7WbxHsj+5ol4c2QvjsQDeXg7962vjScbH+xhrV5n95C97AbZvvf4IoCNe3ew9tB1YGuG6aWdViY2PcDLEl7Hy1CQK0rWZZ1OvSMyls0SJR2Ft9bLoM/1BV7uZX30rRX55GSF6p4amABIv8EiuhLbt3NiiM9cNHMRqs+8dXZODPUW1WOeOSzhDfT8ZA7Clzo4npF1FzftejsnhnjmFKxrnDzWIQ6OZ7Cu4zpRRzQob1E95pkD94POTQXrr+LQ9q2K6ltUj3nmILxwTEtYeRUHx1tUb4hnDsIzp2i6nSUdMcBBeOYYXo897x0hXMLLclSv0NPXObq9BcorbN/OyqHtO5WOEI7h9VRmvZ0T7LmH01ewfqnDMC/PAQXrM5dgWakjdGod0WC9nXNUpjx6MovqDvUQGXMJL1OINe650mShBsJ+mG9sTH587f13/TsP/YMvvG6rIyPHxXhxZWRkZORtRHzqqWn45CdnaX75Gz74DftVdaOKsw/OAs5hP94X6/jdIeB6HecPA1hHqM61d7k9RBy+E8rfD3lvjuwFCLo+u2W3khdHTLE1di7+mGPwvPpBxvlrwdYu7qO6tIO1+24Cp/YxObF4Og+6nRsEL8OKuZf10bc2yzvVjjB4uZclSjoMb52XNXjnu7veyzxK1olOmFQIp4HJxQisNyXRldi+nRPMM4dD34pV1+L1WGadnRNDfY7qHIVnjiDPyyF+FeeR9aOZWwzxzMHxFtVrfCtmXeZAvJ1LyNeo9aXHCcdbVG+IJ27wuclQXevtnGDeuMXIugzVG+JLHQ69iluokvV2TjDPnIJ1mcNAX+o8sv7iptrDejvnqEz5HNVpfCfuiAbmmVOwLnPgnr7WmYPjFazPHITPXCtmXTje4vVYNtCxiEsH27dz4gg8PQcUqqs8SGbnHC+zsddlGXM4Qq9QfeWxRMZcwssUZI17nmRZNauAedw7e6p66t5v+5q/FH70mf28OjJynIwXV0ZGRkbeAcSnrqzj81vVK5/9lYd3dupr08n+R0Oozs4jztb17F2I4WtjjJcD4qsR4WEAuwA27D5HScThu6H8PZF6g8QvXpALKJ2vjScbH+4jPLr3QY9D+eaGuufcT+/YRbU1w/Sxa5ic3kc4MWMLO3tTvCzhdZbN+uhbm+WdakcYvNzLEiUdhrfOyxrIaXnIsplHyTqvE4G1ywFxOyKsH7pibNfOyqHMRzP3orql3s6Jod7CeszhCH2GPC+ZZy5hMzsrpzDdSByUwxF6C+uxYyW+MyeGegbrCsc0l463qB7zzKHr6bnJnIfqW2/nBPOZ68QdQVCdId46O+eo59zilWxm5wTzzClYlzms6FXHI1uzuKn2Yb7UwfEW1WPPeUdksIw5htdjmXH0dY5ub4HyCtu3c6LAL26qLnqyHNUr9XZONJ7GVAps1845Kiv08hxQqP4Qzxwcn9GqqD7zzMHxcDLlGV5XZcqDZHbO8TIPss49T7IsxIA4D5jU2D11buNPPvCZ6/9FXh0ZOW7GiysjIyMj70DilSvreAJ47X/63F3nvuXhN57/J599FKjvqIHfHea4GTF/IkZ8OALXEON9EdirQjhh91mFxfudzsWLbDB0LmCwizOdr40nGx/sYa1e17n/jE7WjLZ3wOH3PL1jD2FzhrVHrmN6fhfYmLl/5dJCkWyBlyW8zrKZR8k602mNfeu93MtQkHt4a72sgZyWhyyb9dG3tievNgMmFwCcZZ/UOLAucxCeObT94qbqMlSXeevsrBwcb1G9IZ45ON4gz0vmmYPwpc4j60czL2AuYTM753hZQnXscdKBzMolvMxiu3ZOsJdyR2R4WUJ1hnji6LnJnAfrlzoIn7lWzLoM1RviBzoWUVix1EF45hSsyxwG+lKnyLqtZWoP6+2cGOotrNe4TtQRGSxjjqF6hZ6+ztHtLVCewbrMod+34p5uEazLXMJmdk6wP+Ph9BW2b+ccljEH7uU5oFB95ktdwssaWhXVZ545OB5OpjzD67KMuQTLmEt4mUKscc+TPIsA9ipUMb5x/vLkyuVndv9Rlo6MHDvjxZWRkZGRrxLiU1fW8cyt6c7+S3e8/NL+w5snp3F/Z/+7EeebNfB4jPV9scZmQDiHgIsAEGOchRCmdq8SIg7fEbXe+4g3SfbiiFyf3Wrv2914YbqR3t9eRPG8+mEGEdXZfUxO7WNy5w6mD94A1mcI6aLKYY1ycGzWZnhZwussm/XRtzbLaZXKhmWzREmH0beuJyenZRsv9zKPknVeJwKTUwHVBQAn5UnOybtq3RBvXCTORXVLvZ0TzDOnsF0756iMeeYEnXPTzjk2s7NycDwj6y5usvXMYaBnjqF6je/EVtg5MdQzbNfOCfYy7ogML0uozhBvXOeczPEyi+rmvqSTk/nFTdVlsC5zGODtnGDPtwcrW2fnhPLoyRKqwzxzGOiZU2Td1jK1h/V2Vi7hZTms17hO1BENQ71F9ZgnTr7WmWeuD7vGzgnmM9eKWReOt6jeEM8cDnwn6ogC7Bo7J1b08vlXqH6pt3OOlzV0Kh0hHAZ65hJeZlFd5TEws3OOl3mYde45QrIwD8B+xMZm+I1Tp6Z/+J5f3PlfbGdk5DgZL66MjIyMfJUSf/qnp/hLf2n9S9eevWeyOzu9dfZc3Hv1jY/UwJN1CFWo49l5HT8K1JuI2EQIm3YPj4jDd0b5eyD1ZolfvDAXUMyt9r7djQ+OwVp/HT0O5ckPM2GzxuTsHqZ33cL04WvAJrmokrCLG9RxtzjO3Ms8StY1HVqlsmHZLFHSYXjrvKyBnJaHeBkKckXJOq8TgVBVCKeAyT314W9a9cH2LHXo9zG7PQi2hjkQb2fl4HiL6jHPHJbwBnleMs8ciLdzQnlG1o1m7mAzO+eoTPkc1bHHatwC5iA8cwrWZQ4HvhN1RIPyFtVjnjl0fSQOynmw/ioObd+qqL5F9ZhnDsILx7SElVdxcLxF9YZ45iA8c4qm21nSESs6ON6ieuo5Z5K5hJclVEd5dLNB/w2C4xm2a+dEge9UrLCzh+qWejsnGt+JO6IH1i91cDy6mXz+Fao/xJc6Qqum1lhv5xyVKY+eLMfrLZMxzxwc34dYJ88T5ucA9gPW1/CV9W+8/92PfOpzb9jKyMhxMl5cGRkZGRkBANQf//iJf3X+/Oz0F//1ia1648zmzt67443Z/l5Vf0MdZ98yATCL8dsrVC8A8e46xvUQwsTuk1i877EXSNgboobOBQx2cSa71d63u/HBHtaa/fL7tPef0cmaMdmwWSNMI9Yfvo7po2/4F1US9k4aFlrkQE+W8DrLZh4l67JOp94RGctmiZIOw1vnZQ3ktDzEy1CQK0rWeZ0sm14IqC5ExLW8ILB72jkxxBsXiXNRXeZLHYRnzuJ1VMY8c3B8hjwnh/hSB8czsm40c4shnjk43qJ69ljZoNbCyZRn2K6dM8eijrSzB+syh3IfiYNyHqxvnZ0TBX5xU3UtqjfElzoceBV1UEXr7ZwY6i2sxxwG+lKnMN3FqPaw3s45LGOOoXqNb8U9XYqX5bAec+Ce/neIOTiewbrMocyv/HjmqB7zpQ6HvhN3RA+2b+eE8hAZcfT5V3hdlVlv54TyhkXN69vMzjkqUx49WY7XU9lxew+ypvf8IHk1q4D9GDdPVf+fc99w/7978b/+zau2MzJynIwXV0ZGRkZGOsQYQwghAkD9Xd+1fXPv9VM3Z/Fr53v1pJ7Mn4j79ddXE2zM5/ExRJxGCHcjxlto/t2WxXsednGEvCHCwX0e3j6U7Xlxm3iy8eE+bb9QbH92HMrH5qJKANYfu4rq/hsImzOEzfmi60KOC4tjs9awSu5lKMgVJeuyTqfeERlehiPIPby1XtZATs1Dls366Fvr5VkW1itM744Hfz1YH7Zi58QQn7nFTdZTqC7z1tk5MdRbVI955rCEN9BzkjkM8HZOKM/Iuoubdr2dc1hW6hSsa5w81iEOjmewruM6UUc0KG9RPeaZA/eDzk0F61tn50SPb8Wqy2Bd5lDoezoqprCydXZOMM+cgnWZw4pedTzYY6n2sd7OiaHeonrqghqTzMHxFtVjnjj6GgfvAo5n2K6dc1SW+cXNgq6L6pV6O+cMee4VrMscVvfy+fdga5iD8KWO0KqpNcwzl2AZc3A8w+uqTHmQzM45XuZB1slzRPgYgWoeUEXMNjfDX5zce88nH/r0F3Zsb2TkOBkvroyMjIyMFBFjDADCy9/8wbtu3fPIa5tf+c2vj/PwcB1xMsb5XbMa3xTmuD+gPh9DOBdj3AGwCfNeSL1h4hcv2r+dgkWWf2282fhwj5buKPWbK/B6zf8Pk4i1d13D9KFrqDZnwOYcIQKx9L+u5NgScfFF4GUJr7Ns1kff2iynVSobls0SJR2Gt87LGtQ5D/Ss9zKPknVex2STkwE4C1RnvEXddZ05wTxz6PpInIvqMr+Kg+Mtqsc8cxCeOYI8H1f1dlbOI+tHM7cY4pmD4y2q1/hWzLqlDo5n2K6dE6XHCcdbVG+IJ27wuclQXevtnGDeuMXIugzVG+JLHQ68ijqoovV2TjDPnIJ1mcNAX+oUWbe1TO1hvZ0TzDOnYN3GdaKOaGCeOYXqMm+cfI2j212gPIN1Sx3avlVRffRkCdUZ4oVjmksH1mcOwjMH7t1zgKH6pd7OOV7W0KqovvV2TigPJ1OeobrKw8mYZw6O91Br1DkNvSYCqPYrYFbPT18If/LBX579iO2MjBw3pR//jIyMjIyMdIhPXVn/4n/3q9sXH728feOlV7bWqvnlG9dnv61aqy7t788/GhDnQLw7IpwBsAH4b6o7FzCaOV+SN1qebLwwJlLr7B6qh2nExpNvoLrvBsKkRtjeP/DL/Fe1e9jyuFt4WcLrLJv10bc2yzvVjjB4uZclSjoMb52XNZBT85BlM4+SdV7HZGFaoToDTO6s/QuHdk87J5hnLtFki4rXtbAucyDezomh3sJ6zGGgZ44gz0fmmUvYzM7KeWT9aOYFzOEIvYX1jFuMtmvnxFDPYF3hmKaSOQXrMocyL89LOOstXs9mdlYO5jhzTwVBdZhnDsTbOcN9LC2qm/uSTo7yFtVjnjkM8HbuI+u3lqp9Vnm80JMlVKfxnbgjGphnTqG6zBvnnpssY87D9u2cKPCtSkHfRfWYL3U48DSi0sH27Zw4Au+eAxbVVR4ks3NC+YxWRfWZZw6Oh5Mpz1Bd5SEy5uB49GQM0nfPDScLdUDci1hbC18+fXL7D977K2/8Y9sZGTluvB+RR0ZGRkZGluLFb/m6x+u9nfNYW7u7vjX/+tkknq/n8w+GELZCHS/PgTognMvXdC6sHMjOe6mDOf/aePKOLC6+EI/Dd3FqH+vDtMbkgZuYPnIdk9N7wMbsoLTKf03d42v7Fl6W8DrLZn30rTV5axy4toWXoSD38NZ6WQM5NQ9ZNuujZK3XsVlVYXI2IlyMCOrfX7Fr7Jxgnjm0/eKm6jJUl3nr7JxgnjmG6g3xzMHxBnk+Ms8chC91Hlk/mrkF88xhCZ+jOvY46UBm5RJeZrFdOyfYh28d0aC8RfWGeOLoucmcB+uXOgifuVbMugzVG+Kts3Oi8SruwIqrODg+x+uobIgvdQr1OHbEig6Ot6gee41D9JmD4y2qV+jpaxzd3gLlFaxvnZ1zmqxT6QjhFKzLHIi3c0IdK5QUsC5zWN3L51/h9Vm2ijN0Kh3RwDxzOELPUN2hHiSzc46XeZB17vmhsnhwcaXeiVhbxy+dvf/Elcv/4vqv2trIyHGzysdBIyMjIyMjLvVHPnIq/Ik/cfP5v/aXHo/TeHGyU5/bm9+6N8Tp18bZ/KE6xjuB8F4EPBfreE9at3j/xC5+dL42nrwji4svxKfb+cUUcWElTAImD17F5M4dhHM7CCdnCJP64L+iZP9BiPXq2Bd4WcLrLJv1UbK26dAqlQ3LZomSjsJb62Xo+WEBPeu9zKNkndch2eREQHUXgC0Sgqyxs3JwPA6zmN0uQnVLvZ0TzDOnYF3mMNAzJ+ick3bOUVnuSzp9ZN3FTbaeOQz0zDFUjx1rZyBzYqhn2K6dE+yD147I8LKE6jDPHLq+c07meJmFda2zc6LAL26qLoN1mcMAb+cEe74Vqmi9nRNDvUX1mGcOA7ydPbJua5naw3o7J4Z6i+qx57wjGpRHT5ZQnQGevtaZg+MZrMschM9cK2ZdOJ6husxbZ+ecIc+9wvbtnKMy5omjz72H6pd6OyeUz2hVVH+IZw6OR0+W4/VUpjxIZuccL1OQNe650ZOFOgB7wOaJyX9/+eHtP7b9P7/6rK2NjBw348WVkZGRkZHbQnzqqeq5Z57ZBIC7X/7c5rXt7YuvvXzjoxsb6/XefP47Ma9RI3wYsb4QQzgBIOiLKwe3Wp68K1sYEx168psx2T5hA5jcdQvYnGPy6BvAyV1Uk9j+r6fdYChivTr2Fl6GFXMv8yhZ13RolcqGZbNESYfhrfOyBnJqHuJlKMgVJeu8jsiqUwGTswBOmwLrMwfhmUPbRzMXwfrMQXjr7JxQ3qJ6zDOHJbxBno/MMwfi7ZxQnpF1o5k72MzOOSpTPsfrNNmiwrrMQXjmFKzLHA58J+qIBuUtqsc8c+CenpvMebD+Kg6HvhN3hED1mGcOwlunjtODla2zc4J55hSsyxxW9KrjoR7LjiDOzomh3qJ6R/EaV96ieoWevsbR7UnnYft2zmFZ5lox68LxFtUr9XZOsOcdTl/B+qUO5V4+9x5sDXMQnjk4PqNVUX3mmcMSHj1ZjtdT2RDPXMLLFGaNe270ZRGo6gDEsLe+Fn/s2ne//w9++Eefaf6+7pGR28d4cWVkZGRk5E0lfud3nnn55ivbO3NcjLuzJ+MUd8xnsytAdSIC51HHkwi4iNb7q4Nb+fsteXGlqw+VuLgy2QRw6RYm5/cQ7rqJ6tQusDE3zQy7yRDE2sNjbPsWXpbwOstmHiXrsk6n3hEZy2aJkg6jb11PTk7NQ7wMBbmiZJ3XEVm1VmFyGsBdtY3aa8R66UEyM0fiXFSX+VIH4ZlTsC5zEJ45OD5jqXPRejsrB8czsm40c4shnjk43qJ69ljpQObEUM+wXTtnjkUdaWcP1mUO5V6em8ozVNd6OycK/OKm6lpUb4gvdTjwKuqgitbbOTHUW1iPOQz0pU6RdVvL1B7W2zkx1FtYr3GdqCMamGdOwbrMoevlaxzd7gLlGbZr5xyWHcVjyVC9Um/nzHWijuiB9ZnD0Xj3HLCo7hDPHByfsah4XZvZOUdlzDPnwfrMJVQ2xDNXglgnzw3lcZBFAGEvIM5Rn79z44/f93/7nr8ZPvEp54f2kZHjYby4MjIyMjLyluKzH/rQmbWwf1915vReuHbtiVmNb5nP999Tx3BPiPEDEXgeiHfDvN9a6uKKXTeJmJzbRXX3DnDxFsKFHVQbc7rHAi8rQaxXx95ildzLUJArStZlnU69IzK8DEeQe3hrvayBnJ6HLJv10bd2yXyyUSGcAcLF5q/Gg+iWOvT7Rax6CtZnDsaXdHKUt6ge88xhCW+g5yJzGODtnFCekXUXN+16O+eojHnmGKxnnDzWIQ6OZ7Cu4zpRRzQob1E95pkD951z084lsDXW2TnBfOZaMesyVG+It87OOaUXV7ySzeysHBxvUb0hnjkQb+c+sn5rqdrHejsrB8dbVK/xnbgjGphnTqG6zBvXeX3nsIw5D9u3c6LAL24WdF28nsqst3PmOlFH9GD7dk4oD5ER5z7/DNUv9XZOKJ/Rqqg+88wlWMYcHM9QXeXhZMwzB8d7kDXueaGyxkc0v7Uyj5hMwpdOn63+6H2/uPeTtj4ycjsYL66MjIyMjLwliU9fmQBX8Mpf/IvbW2frMy+/tPOdk7WqurU3+93h4FdOHpvH+EAVwkYEJvLiSuuG9c2tzTnCRo3JPbcweegq6u19VOvZ/+ilu3WbvrwPsT4uvgi8LOF1ls366Fub5bRKZcOyWaKkw/DWeVkDOT0PWTbzKFnndZwsVBVCFTB5oEZcjwgV6ds5wTxz6PpInIvqMl/qIDxzDNVjnjks4TMGn4fMgXg7K+eR9aOZWwzxzMHxFtVrfCtmXeYgPHMK27Vzjv2wXXWVt6jeEE+cPDeVZ6iu9XZOMJ+5osfRonpDvHV2zrHPt4cqWm/nBPPMKViXOQz01tnZI+t2lnVEg/V2Vg6OZ7Cuer6pFJ45huoV+sGvceUZrFvqEk3WqVhhZw/VLfV2TpQeax+2b+fEil4+9x5qDfOlDo5v6MQd0WC9nXNUNtQzVHeoB8nsnONlCrJGnhvKo51VdQD2Iiab4XNnT69/4p5fvPlMXh0ZuV2MF1dGRkZGRt42xO/8zjO/9Prrpy+ejnfvX5s9Vs9nd8/m898NYDtGPFDHeCqEsIb8fRd5c5ZUdWKOemOOybk9VA9exeTCDmJ+USWH7LPAy0og673jX+BlCa+zbNZH39osp1UqG5bNEiUdhrfOyxrkDw/oWe9lffSt9XIvAwAEVCeB6hIQtsSnO6UO/X4Rqx5DdZm3zs6Jod7CesxhoGdOQM9F5jDA2zmhPCPrRjO3GOKZg+MtrGfcYrRdOyeGegbrCsc0l463sB5zKPP0nEx4mUV1rbezcjDH2blRAOsyhwHezgn1fCtY2To7J4Z6i+oxzxwGeDv30fRby9Qe1ts5MdRbVI895x3RMNRbVK/Q09c5c3C8R75GrS/wrUpB30X1mC91OPRFx+ph19g5saKnz72H6pd6O+d4mY1Vl3nm4Hg4mfIWr8cy5jDQM1cCWSfPC+XRzUJdAbOIzc3qH9f3X/j97/708y+3GyMjt4fx4srIyMjIyNuO+PTTE3zmM/G1H//x+57HDs5tbL5nd2/v3UB4cj6bPV6HcBdifDwivoIYLtj1mEaEEzNUd+6geugq4pnd1f76Ly8rgaxfKJIt8LKE11k266Nvrclb48C1LbwsUdJheOu8rEH+AIGC9X25omSd1ynIJndWqM7UwBrPOzDPHNp+cVN1GarL/CoOjrewHnMY6JkT0HOROQi/ivPI+tHMLZhnDkv4HNWxx0kHMieGeobt2jlxFB+8WlRviCdu0HmpYP1SB+Ez14pZl6F6Q/xAxyIKK1pn58RQn+N1WMYcBng796Eex44gzs4J5plTqO5RvMaVz/E6KjN+8Gvcyyy2a+dEgV/cVF30ZAnVUR4ks3OCPe9w+gzWLXVwPLoZfe49VL/U2zmhfEarovrMM4cj9BavpzLlQTI753iZwqxxz4kBWTWvEID9tQ387cf/9kf+ePj2T8/ajZGR28N4cWVkZGRk5G3PFz/+jSeAe7Hzm//65MnTpy7eemP3O6op1vf3698dEXYqxEfnEfeESb0ZphGTu3ZRvftVYHsf2JgBVbPRgDdzLbysBLE+Lr4IvCzhdbwMBbmiZF3ToVUqG7wMR5B7eGu9DD0/RKBnvZd5lKzzOgVZdSJgehaI501ZrV3SL2LVY7AucxB+FadgXeYw0DMnoOcicyj0JZ0+su7iJlvPHAZ65hiqx461M5A5MdQzbNfOCfYBXEdkeFlCdZhnDtwPOi8VrG+dnRMFfnFTdRmsyxwGeDsn2POtUEXr7ZwY6i2qxzxzGODt7JF1W8vUHtbbOTHUW1SPPecd0TDUW1iPOXA/6DWuvML27awcur41Fq6hqM4Q77hO1BEOrMscjsbT517hdVlW6uD4jFZF9a23c+KoPMPrqmyIZw6O9yBr3HNCZcSHWUCI2K1Obn3/E//mn/xU+OQna9sZGbkdjBdXRkZGRkbekcTv+bq7fv3Fna2TG+uPzHDjyb2b4Xx48Nr3Ve969Z64MT9Rbc66/xUkb9oWeBkKcg+xdqFFDvRkCa+zbOZRsi7rdOodkbFslijpMPrW9eRL/RCR6MsVJeu8TmE2PVkh3hlRbXpPagPzzKHto5mLYH3mIHypg+NzVGeIZw6ON8jzkHnmQLydE8ozsu7iplrPPHNYwud4nSZzj5U5CM+cgnWZw4HvRB3RoLxF9ZhnDtzTc5M5D9a3zs6JHt+KVZfBusyh0Pd0VNzCK9nMzsrB8RbVG+KZA/F27iPrL256e9jMzsrB8RbVa3wn7gjh4HgG6zKHrqev7wTLmPOwfTsnmM9cK2ZdON6ieqXezonGd+KO6MH27ZwY4olzn3uG6pd6OyeUz2hVVJ/5UpdYNstRPeUhslKX8DIG6ctzQnl0sxiBgICwB6yt48X1zenvfeTXd/5ZuzUycvuwHyuNjIyMjIy8Y4jxyiT+g2e3nv/8v/pd+zfqP4KqfqSO8XKoFr+r0mbAm7oOfXkfZP1CkWyBlyW8zrKZR8m6rNOpd0TGslmipMPoW9eTyx8kEl7uZR4l67yOl+Ewr6YVqlMA7qwRJu2sBXMJlmUumrkX1VUeJlM95plTsC5zGOiZI8jzcIi3zs45XpaT9aKZWwzxzMHxFtWzx0oHMieYZ87D9u2cORZ1pJ09WJc5OB7mcVQ95Rmqa72dEwV+cVN1Lao3xJc6HHgVdVBF6+2cYJ45he3aOUdlzFtn5z6yfmup2sd6OysHxzNYt3GdqCMamGdOwbrMoesHv8aVZ7BuqUPbtyqsz5yCdZkD8XbOUa9zKgWsW+pQ7uXz7sHWMAfhmYPjM1oV1bfezjkqG+oZrMscHA+S2TnHyxRmjXtOqEz4qg7ADAhV/PzpMH/i/i/jlu2MjNwuxosrIyMjIyPvSGKM4bm/vP6Hd+fxe0IdP4SA+w4C28w4jqwEsT4uvjgcZ+5lHiXrsk6n3hEGL/cyFOQe3lova1jqBwr0ZH30rV0lz7MqYHJXRHUSB//+ClvHHMp8NHMRrM8ciLezcgkvS6gO88xhCW+g5yBzGODtnFCekXUXN9V65pmD8MwpbNfM7rGWOjiewbqO60Qd0aC8RfWYZw5dP+i89GBrrLNzgvnMdeKOIKgO88yBeDtn0MdRwbqrODjeonrMM4cB3s59ZP3FTbUH86UOjreoHvuQvSMahnqL6jFPnDw3mWfOw/btnFAeh9miorrKM1SX+VKHA9+JOqIAu8bOymGYl889Q3WVB8nsnFA+Y1Hxujazc+KoPEN1h3qIrNT1IdbIc2KIjwf/mH29H7G1gX9w9dKl7/vwM8/ftLWRkdvFeHFlZGRkZOQdxRt/79SFm6/ufOfufvyjMcY7ATzRKrA3aAkvQ0/uZSWI9XHxReBlCa+zbNZH39osp1UqG5bNEiUdhrfOyxrkDxPoWe9lHiXrvM7ALGwGrN0BxJMkTKiI+cxFM/eiusyXOgjPHEP1hnjm4HiDPAeHeOvsrJxH1o9mbjHEMwfHW1Sv8a2YdZmD8Mx55H1vrf0Qrqfbi+oM8cQNPi8Zqmu9nRPMZ674ccxRvSHeOjvn2OfbQxWtt7NycHyO11EZ88xBeOYYWa+zxAo7K4clfI7XYc93RzQM9TleR2X5Y1nQaaG8wvbtnCjwrQrrM8dQvVJv5wR7zuH0Faxf6lDu5XOvUP0hvtQZOpWOGOAgPHMJL7Oo7hDPHJbwCtGX58RAH+qAqg6Y13U8dSL8Rw9/bvbnbGdk5HbC/1qUkZGRkZGRtxk3/osTl7/wF9f+4Osv3PqbO/v1n4oxfnvnwgp6/mcFXjYy8nZj1fPZW0+yuBMxuwrEGySE/gFJ+oaeeHXs4Q69Q7t+COq+lGcM6TLUeuVLWOUxwRGsPy6yx6R1iPZ41WOn/BDsHva+E+xDONUtZdX16O4hP2g5DtR9Kc8Y0mWo9cqXwp5vhSpab+ejYOg5tOoxDFmvjo3tobpHze26H4+hx2AerzB0/e2EPbdw/JvJcR7TkL1VV/njgt0fc8tQuo/qKa9eC6o/BLWH8gzVVX4g8r/3yjtEALGOCFW4VWNq45GR2456eY+MjIyMjLwt+NJfWX9sPo+/LSB+ez2LXxcCLkXgnPtG7XZnJYj1cfFF4GUJr7Ns1kffWpN36h2RsWyWKOkw+tb15PKHCvSv7c0VJeu8ztBsWmF6DgiXapscYNfYOafJFhWva1Fd5ldxcLxF9ZhnDkt4gzwHmWcOxNtZOY+sH83cgnnmsIS3qF7jWzHrljo4nsG6wnV0R2R4WUJ1hnji6HnJnAfrlzoIn7lWzLoM1WOeOQhvXTNb7WLLdlYOwjOnYF3mMNCXOkXWbS1Te1hvZ+XgeIvqsdc3RJ85ON6ieoWevr7R7UnXh11jZ+XQ9q1KQd9F9Uq9nRNDnneF7do5R2XMGyefd4Xql3o753hZw6KiuswzhyP0Fq+nsiGeOTjeg6yR58QyPgZUswAgvnp+a/27Ln/25r+ytZGR28l4cWVkZGRk5G3JV35k7Wt2buEbwwSX61n9byHgTkScQMBUvhmD80Yt4eXLZiWI9XHxxWGV3MtQkCtK1jUdWqWywctwBLmHt9bLGuQPFuhZ72UeJeu8zhJZWK9QnYmoLsT270iLPvWZW9xkPYXqMl/qIDxzDNZjDgM9cwJ6/jGHAd7Oynk0/cUytZ555rCEz/E69lg7A5kTQz3Ddu2cGPIhHHMM1RviiRt0XipY3zo7Jwr84qbqMliXOQzwdk6o55uhitbbOTHUW1SPeeZQ6FVHkfVbS9U+1ts5wTxzCttVx0lFA/PMKViXOXQ9fX2j21ugPIN1Sx0OfSfuCOEUrMschO9xrZh1PWzfzjksYw5dL593heoP8aWOsKh5fZvZOTHEM6fwuior9XbO8TIG6cvzYahvCPOAuA+cOBl+8vS5rT9218+98TnbGRm5nYx/LdjIyMjIyNuK609fuuv5H974g3v7+HfqUD81n9X/xwg8BOAUQvN7wd7/dMDLVmHVfb31XlaCt97LbhNHegg9b8ZXYsW95Q8WWH3vtxL1Xo3ZdQD7KzyzdulRPD6r7rHqeob9Pt/q2MfAzsuQ7fF2eziOhKN4DEt5p97XMfOW+VbUgSjPGNJlqPXKW1RPeYbqKn8clN5XaU/B1jd/ULKIUlwUDFk/pMt4k9a3/tuz5B4Ljmv90Od9VW7bHR3Rfa2wR9HSopLTU/4oUHsP9YwhXYH7888yRCDGiBDibH8fm+sPXXjFVkZGbjfjxZWRkZGRkbcFb/zoqcef/Str3/f6F1/7c7u3Zj8wn9U/ECIuh4ATIWBi+8fCV+UnfyMLjvP5P669j2tf6L0DANyKmL8I1LdEqY/sB7Gw+LIiag/lbwdH/QOnw5H/cAvnsVOekXXdQ3TDQlbdY9X1twt1nEOel1LUfSnMMRzJeXkUezgs9bAdxTHZPdSBKM8Y0mW82euPC/tY92G/j6HrjwB7CMdyDGpP5Utf38oP4Sj2aDjCrTqPwZEx5LfTFKUblPaOCvWYqeNQ3lLQK6jwEnPHibo/5YdwFHskjnIvRsTBXwkWJgBC3D4d/sdz+NB1WxsZud2MF1dGRkZGRt7SfOWvb7/vi391+tHXrt7607N5/R/MYvwDCPimAGzZ7rFznG8Y3657K9QPSkeBt7eXvcm8Zf9RV++4vEyQTrd6N6DaNeESxMWXFVF7WG/ntwrquJZ4jnpR92VRPeUZpd2j+D5L9yjtDaH0+/RYdY9V1zOGPlbHcQzHQXacrUMe+v2WUPqYqN7b6UPXIeuHdFcle15bd6uOwfo34bzoiY8G9X0pbw5Kvu9Rfgir7pEd66pbtRjyxJR2S3tDOap9V93nzV6fKN2ntNfHUe1zXBzB8ckLrHD27/EBQJzVCCFer+fV521tZOTN4Ej/OzIyMjIyMnJUPP+fn/iGGPYuzOfh36jr+C2IeCQGrAGHb67Uey+gJ1w2Q0/uZSWI9XHxReBlCa/jZSjIFSXrvOeSyoZls0RJh+Gt87KGpX7IQE/mUbLO6yyZxebLZCugOgeEs86nf8w3bhGxjofqM2+dnRPMM8dQvSGeOTjeIM+9Id46OyeUVzT9mN3uMMQzB8dbVC/zi5usyxyEZ84j73tr1UuOSeYsqqM8SGZnLHFeMlTXejsnmM9cK2ZdhuoN8dbZOdF4FXdQxdyXdHKUz/E6LGMOA7yd+2CPI9uj1EF45hiqdxSvbeUtqlfoB7++lWfYrp0TBb5VYX3mGF5PZbnv6dCYSoHt2jmxopfPO0N1lQfJ7JxQPqNVUX3r7Zw4Ks9QXeaZS7Cs1PVh1rjnwTJZPPi/KlaoZxGTKX7t3gfv+aaz/+yLr9nqyMjtZvzNlZGRkZGRtwwxYu3zP7zx0Bf+cvWJPez9zr19/NX5PH5/BN69uLCCI/ifBnjrveyrEfUG9yjI9h4f9mNi1QfWW+9lDfO9gHjNKfacX85KjdpT+VVY6gAz2Hp1nKwLx5eg7kv548De1yrfT2LVPdh6e5wJ21U95Ydg97D3nRjy4Wsp6r4U7L7MHqxyrLDvQR3EkG4par3yAyjeQhWVP0rYY/p25HZ9H+x+hj5PbA84fhWGHttRo74n5YdQuofqqcfGerWeVAElj4njui/ne6aUHkdp7+2A+l6UV7A+c0eE/M01D3U8ja+rg9s1gI1p+Cxmry9zLyMjR854cWVkZGRk5E0n/jROvvQjJ+554a+f+J64X/8p1OGH6xn+rwAeRX5RZQjjW62R281xnnNvx70DgFmN+Q5Qv1jpH5gcFkuO4hjZHkscU4vjWM+OE6ILx5eg7qsUtn7o8dg9hqxXXeVLYeuz42zFtmu/n4Tyx0E4hruz3+cymD3kMR7DfUmnDmJIt5TjWM+O04PtMQS2vvQYVE95huoqX8qQ9aXd0p6CrWePvwfbA45fhaHHZln1mNR65RtaseoqbyntKYasH9IdwtB9h/Ytb+L6t9Rz/3aHfP/yN1eG+owqBsS6xhRxP07X/6ffvPjYju2MjLwZrPqfwJGRkZGRkaV5/m/gjls3Nk+cPxcuXX9j/4/szePHq4BNlPx7Kup/mZvwQi9DT75sVoJYHxdfHI4z9zKPknVNh1apzPByL0NB7uGt9bIG+cMGetZ7mUfJOq+zRBYXX4AQKsQQsf5oPHjnObFFQubzvYpQ3VJv58RQb7E9O+eozHo7O9DzjjkM8HZOKM/IuoubbD1zEJ45OD7H6zRZp5KLTtgw1DNs184J9d9HJplTsC5zEJ44el6CdyWqe0TPy+Km6jJYlzkM8HZOqOeboYrW2zkx1FtUj3nmUOhVh2G6i9Hbw2Z2Vg6Ot6he4ztxRwgHx1tYj7lElg1+bSvPYF3m0O9bcU+3CNu1c47N7Jxgr/GO6IH1Sx3KvXzeFarPfKmD4zNaFdYvdThCb/F6KmO+1CW8jGH68jxQHk6W+RADwh5QTXC9OjH5Xe/57O4/yasjI28W42+ujIyMjIzcdp7/z7D90o+cuGcSN98zncz+3Guv7z29P4+/vwo4X3RhpQTvfz7gZX14a72sBG+9l5Ww6vpjZvDhqTfg6MlWZcW95Q8b70SaJzXGGqgjZs8HYH/wM33AkGWqq3wJ6nlT3sJ66nhYF8KrPUpZZT07nqGwPZhTDOmWMvQxsccwdP0qsPtqjodFK2G/T48hXcaq60H2WPIBaW2z5B5Hgv1+lmHVPdR65S2qpzxDdZUvYejzusp9HRFvgUPoYg5K/pVAyg/B7vFWeUDYcdhjTbDu7WTo/bPvY+geq8KO4ShQ38ftvr8hqD2Ut3g9L1uVFR7TGA+OrQ7AdCP8/D2nTj0br1zJ/ydbIyNvGiuc2iMjIyMjI8OIP/3R6Quf+5f3Vzfjh27szr4fMXwQwNkAnLDdXpo3fu77Py9cNkNP7mUlkPULRbIFXpbwOstmHiXrsk6n3hEZXoYjyD28tV6GgosrXu5lffSt9XIvg87j4ssh03sCqu2IxV/2x9Yax/ZxUd1Sb+cE88wpbNfOOSxjDo7PkOfdEF/q4HhG010sUWuZZw5LeIvq2WPtDGROMM+ch+3bOcH+V84QfeYYqsc8cwmT0XOTOYXqWm/nRIFf3FRdi+oN8aUOB15FHVTRejsnmGeOoXpDPHMg3s4eptsa7T52Vg7CM6dgXfVcUyk8cwzVK/T0tY1ub4HyDNYtdWj7VoX1mWN4PZZZZ+dE42lMJYH1mMPqXj7vCtZnLpFnqqd8Rqui+syXOjgePVmO6jHPXMJmdk4o72HWyHNAeThZyweEeUCY1/PpNPzU2fMXft/dv/DCjbwxMvJmMV5cGRkZGRk5dur/6s7tG9vXt1/6wu6/OYnxyrzGe0LEmVBhIt9M9dGsc5d74XFkKMg9nLVx8UXgZQmvs2zWR9/aLKdVKhuWzRIlHYa3zssa5A8dKFjflytK1nmdgdlCmWyyFVCdAcK5JiBrgUOv9umF9ZmD8SWdHOUtqsc8c1jCG+h5xxwKveqgJ7Nk3WjmFswzhyW8hfWMW4y2a+cE88x52L6dE41vxT3dXlSPeebQ9fScRLfnorrML+E6cUcQVId55kC8nRPqw3YFK6/i4HiL6jHPHAZ4O/fR9FvL1B7W2zkx1FtUzz7nqgcnUz7H69jMzlji9a08g3VLHdq+6LFUPsfrsMw6Oyca34k7woF1mYPwzIF7+bwzVHeIt87OglZNrbHezomj8hbVUx5OZr2dE8orSF+eA0M92lmIAbGOiHPMz56a/OkHf2PvL+bVkZE3k/HiysjIyMjIsRAjQnz69LmXXto9v7M3/wTq+D11xHvCwV/9lRVbUznNOne5F3oZevJlsxLE+rj44rBK7mUoyBUl67znksqGZbNESYfhrfOyBvlDB3rWe5lHyTqv42XQeVx8aTM9XaG6FIEN+wlRg3FqH4nqMl/qIDxzFq/DMuawhM+Q59wQv4rzaPqLZWo988xBeOYYqpf5VsX27ZxgnjkP27dzQry0qGSOwXrMJVhm3ODzkqG61ts5wbw9zs6NHlRviB/oWERhRevsnBjqLarHPHMQvtQpsm5rmdrDejsnmGeOoXpH8dpW3qJ6hX7w61t5hu3aOdHjW3FPtxfVK/V2Tgx5zj3yvlo71KObyeedobql3s4J5Rtasepab+cclQ31FtU7Cl/q+jBr3Od/aGZdXQF1xBR4bePk+r/16K/f/EnTGBl50xgvroyMjIyMHCnxpzEFgK/8yva7d/f2vg91/b11jccqYNN2AfLGaQjqB46EG/bkx5GVINbHxReBlyW8zrJZHyVrs06n3hEZy2aJkg7DW+dlDUf6g0cpfWtXyUUWF1/aVNMKk1NAdXetH4vGqz0kXldluS/p5ChvUT3mmcMSPqPvce7A/CpOYbqROCiHgZ45BetmrhXbrp0TzDOnYF3hmObS8RbWYw7lfvB5yVBd5q2zc06TdSodQWAd5jDA2zmhnm+GKlpv58RQb1E95pnDAG/nPpp+a5naw3o7J5hnjsF67BgTTDIHx1tYjzlwT1/fzMHxDNZlDv2+Ffd0e2E95hI2s3PmOlFH9MD6pQ7lnj7nHqzPHIRnDo5vaMWqyzxzEJ45OJ6hukN8qYPjPcgaeh4wB8ejnUUA01hhNouYVvhXuOvUv/HeZ177Yl4fGXkzGf9B+5GRkZGRI6H+q9gAgK/84vrv+NLPT//LvZ2d/1ec138cEV8T4uJfWOiy4mV+d7kbjowsiXdeeVkJ3novW5VV9vbWkqye1dh/I2J+rfAHMLKHZEgXK97Xqtj7Xoaj2MNyHHsqVn282Xp1/KzLUOsZQ7qrUnr8obxajPo+1R0xr/awlPY82B7MseOE6MLxJaj7KmXV9TiCPdj60sdE9ZRnqK7ypQxZX9ot7Q2BPf63G3UMyltKex52j+N4rI+b0mO23+tRUXr/Hqvu8SauX+phVfen/HGh7k/5pb7ZAiK/T/q+fhnMPgFAXUcEIJ44Wf3ck+89fbXdGBl5cxkvroyMjIyMrET8W9gCgOfqtd/zW395+rd3Z/M/F+fx98SIDwVgGwBCwMSuW7DimzB3uRu+DfHeIHtZCd56L+tjwNrBT5e3t5e9yYS38LEthffEqayOmL8UgL232IOhjnek+5o6iscq22Op7dgie5wJ1l2C1jbqvizqvkvXM9SeyjNKu+o41Xrm1R6W0p6H3YMdj4ddfxQMPQbLqutxBHuw9aWPVWnPo3QPdpyKIV2QYxi6/giwh3Bbj0Hdl/HyA1blh2D36DwgDbaXUJ4xpLsK6n6UH8KqexSul8+5Qj1vpaj1BcfRW+ktNJT2luGo9i7dp7TnIM8B5UuJQAgBcR4AxJ04Dy8BD+7Y2sjIm4n6I2lkZGRkZKSX+l8+evrln/vCx27uxX87Il4KEY8j4gTCwV8NtqDvTVVfrmjWucu9cNkMPbmXlUDWLxTJFnhZwussm3mUrMs6nXpHZCybJUo6jL51Pbn84SPh5V7mUbLO6yyRLbTIAWByMWByJgLrmcz60cxFqD7z1tk5MdRbWI85CM8cHG+Q5xzzzEH4UufR9GN2m2IzOyeUR0+WUJ3ML26ybqmD4xmsyxwOfCfqiAblc7yOzeycYzJ6XjLnwfqrOHT9YlR9i+oxzxyMVx0cZF7cQhWtt7NycLxF9YZ45kC8nfto+q1lag/mSx0cn+N11PPNJHNwfI7XYZlx9LWNbm+B8gzWZQ7E2+OUQ4byOV6HZdbZOdH4TtwRDqzLHIRnDtzL552husyXOjg+o1VhfevsnKMy5pljeD2VlXo7J5RXkL77/LOMOXR9iEBEQNwHJhVe3zxx6nse++xr/6LdGhl5cxkvroyMjIyMDObLf3fzvv1rs99bRXxzrOPjscaTCAjB+41I9QYKPZlHs85d7oXLZujJvawEsn6hSLbAyxJeZ9nMo2Rd1unUOyLDy3AEuYe31ssaBv8AkvCyPvrWrpKLLC6+cMJ6hemliHA6K7Gbzh4dWJc5EG/nBPPMKViXOQz0zAk655ydc1SW+5JOH1k3mrnFEM8cHG9RPXusbFBrQTI7l1ByX43vxB0hnIJ1mUO575yTCeUZrGudnXNYlrlWzLoW1RniSx0OvIo6qKL1dk4wzxxD9YZ45iA8cwzTa412DzsrB+GZU7Cueq6pFJ45huoV+sGvbeUZrFvqcOg7cUcIx1C9Um/nxNDnnGG7dk6s6OVzrlB95q2zc0L5jFZF9ZkvdVjCW7wey5iD8MzB8QrTd59/lRX6CKCaAfUcOLk9+R83L0z/9L0/e/Nft1sjI28u+kOwkZGRkZGRhhivTGJEuPb3t+/4wl+d/pn66uyvhTr+e7GOHwfwvhAwcS+svNNQbwaPkbft/xpi1QP31ntZCauuVxzXvnh77V3yMol7NeqrQLzm3HnJRkeFcxhLM+T4VVf5QugPvep7ZV04/nbAjlUdD+uuirov69V92x6crsLuMXT9m439sMR+PwnlGaVd9Vj1rO+JOeq+3qqUfpOlvaNg1fsasj57vlrL2B6rPrdv9vpVYY8JHF/Km7S+9XAuuYeL2lN5y1FcWLlNyD/P3ykM+f6GdIey6t6rrk8M2Ud1lSdUCIgRqCrMduu4cfMbf9uv2M7IyJvNV88HYSMjIyMjS/FLT2P9hb/z//36L/7w2idf+9Lun4vz+B/Udfx2RDxqu7ed4/xB09vby95MjvO43q57vxkM+IFhMG/W3l4mKH1aZzcCwq3S9jGzxPd5pKiHQfnjgN1X6eNS2hsK25cdJ0R3VbL7crd3Q8OQLsNZ70TLceQbvj3+7amlPnwt7R0Ft/O+3qqs+hisun4IpfelesozhnRLUa9Z5UtZdT2j4PsvqBwPpd9vKK/edsyDN/jPc/XgK/9OYNXvbdX1HivuvdTFNXXO2HMLQKiBGANijXrjTPgHj53/hv12a2TkzWe8uDIyMjIyQnn2b2Hr5b+x8Z0nv7L2n+5en/2Z+az+U/M6fh+AswBOtcrqDVIpq6738Pb2srcjy7y5LeU49854pz0lR85xPkDe3l62IqGuMb8K1K8EoLbpWwB17h/HY6LuS/lVUHsyX/q9lvYUbD07nttNdgzsEJfiyDZ6k1DPi/KGpT6Muc20DvE4ni/1GNj7Uj0/alNaLO29VbCP1VuB43gMmz3f1G931e9LrVeeMaTLGLJ+SHcIpfuW9jxK91A95Q1viT/PC46hoFJYOkaO6v5L9yntLYPaOzqZIeLgD74QgMkkvDSdbfyM7YyMvBV4U//7PDIyMjLy1qN+/n3bX/mxX/n4/jx+FxDfEyMei8BGANbdN0JehiPIFc06d7kX3u6sBLE+Lr4IvCzhdbwMBbmiZF3W6dQ7IsPLcAS5h7fWy1Dwg6iXe1kffWu93MvA84UiWYtQodqMmF6OwPRAFa/NUV3mV3FwvEX1hnjm4PgM91yzmZ1zbGZn5TyyfjRziyGeOTjewnr2OOkw0MHxDNu1c4L9VTId0aC8RfWGeOPkeak8w+vmmeoxn7lWzLoM1WOeOQgvHNMSVrbOzjk2s7MH6zIH4ZmD8Mwpsm5rGdtjFQfHW1RPPd9MMgfHW1iPuYTJ6OubOTieYbt2zrGZPUY5ZCif43VYZp2dE43vxB3hwLrMgXg759jH0utavC7LSh0c39CKVdd6OyeUB8ns7KG6q3o7J5RXkD59/plLqEz4OAMwB9Y2q2dOvevO777/H375VdsZGXmzGS+ujIyMjIwAAF7+b06+5/pLO793GsO9+3X9YUQ8DOB0CJgA+g3PglVyL+tD/bCZcMOefNkMBbmHWLvQIgd6MqyYe1kffWuzvFPtCIOXe1mipMPw1nlZA/1hJLFs5lGyzusskcXFlx6azuRsQHUpIuQXWErWJ1S31Ns5MdTnsA5zGOiZE9BzjTkM8HZOKM9ouoslbC1zOEKfozrGy+O1c2KoZ9iunRPsv4kdkeFlCdZhDuWenpPo9lxU13o7J3p8K1Zdhu3aOaE8TKZ67DgVqmS9nRNDvYX1mMNAb52dPUy3Nap9cl/SsXhZgnXY6xqiC+GZU7Auc+j6wa9t5RmsW+pw6DtxRwinYF3mQLydE0OfcwbrljqUe/mcM1S31Ns5oXzGouJ1bWbnxFF5i+oxz1zCZnZOKK8wffncKw8nYz4C9X4AYownz639B4/+ySd/JPzRZ8a/FmzkLcf414KNjIyMfBUTf+uBzWf/5tYHv/jXpn/q+os7/yHm8X+/X9f/dgA+FALOLS6s4Agux3vrvawAd7kb9uCt9bJVebvurWBvlo8Kb28vS5R0jgH5w8g7jLD4UkZ9E4g3DxYc6UPEjqH0DlRP+RLY8cDxjCFdxqrrGUs+Ju6huOHtZ8lvscuRbbQCqxzDW+F5YcdQ+j2pXubZ9r2wfYduZPdw1tuqxNmjBesV34lg1fU4oj0s2ffa2l7dl/XssfKw6xmqcxT//kbpBs4xdFDd28WS99/6VpbcY8GQ9aVd1VNeYZ+zoesZq+5hjynB/Kr3dbtZ9XjVeuUVQ/u3E3VsyuPgw4jJBDsb+9PP4bnvndvGyMhbAfZH2MjIyMjIO5wv/71TF+Y39p8I8/rbEesn53X8cAAuATil39x4b3x6soTX8TKPZp273AuXzdCTe1kJZP1CkWyBlyW8zrKZR8m6rNOpd4TBy70MBbmHt9bLGtwLLMtmffStXSUXWVx86aHpTLYDJpcAnIjlaxOqW+rtnLDezh6syxwGeuYI8jxb1dtZOY+mH7PbFJYxB+GZY6he5lsV27dzYqhn2K6dM9eJOkI4Besyh3I/+LxkqK71dk70+FasujmqozxIZmflcOBV1EEVrbdzgnnmFKzLHAb6Uqdoup0lHUGcnRPMM6dgXfVcUyk8cwzVK/SDX9vKM2zXzoke34k7QjiG6jFf6nDgO1FH9GD7dlYuwTLi5HPOUN1Sb+eE8hmLiupab+fEUI+eLKE6q3o7J5RXkL587plnLkGygIBQB8xnEWvr+LXqxJmve8+vvXLN9kZG3gqMF1dGRkZGvop47q+evFRXe98WJ+HcfG/+e+sYvy4AGyFga1Eib24WLJslvI6XeTTr3OVeuGyGntzLShDr4+KLwMsSXmfZrI++tVlOq1Q2LJslSjqMvnU9ufyBJOHlXuZRss7rDMwWimQdmk5YqzA9DeCO5l+3L1mbYF3mIHypg+Mtqsc8cxCeOQE915iD8NbZOaE8w3QjcQuYZw5L+Byv02SLCuuWOjiewbqO60Qd0aC8RfWYZw7cd85LO3uoLvOlDm3fqqi+RfWYZw7E2znBPnxVqGLuSzoWL0uoDvPMYYC3cx9Nv7VM7WG9nRNDvUX0Oq8X6C71zCls184J4lc+TgXrMgfhM9eKWReOt7AecxDecZ2oIxxYlzkIzxy6nj7fHqzPXMJmdlbO0KlYYWflcITeonpDfKmD4xWmL5/7oR48q2IAYoX5bB5PbOJvPH5h/ifDMxj/SrCRtyTjXws2MjIy8lXAy//t+cvP/fW1PzCrdv/9WT3/wdnu7C8C8duqg7/66/DCytuRVf9nAt56L3ursuoxe+u9bFWOc+83A/JDwiC89V62Kke89zJPa9yvMb8OxGvLrCaobZS3lPYY6vFUnjGkS5A//K7CKo8JwT1ENzSorvKlsPWlj0Fpz8PuwY7Hw67HgD1UT3kG6dLzkh2nQnWVt5T2hsC+p+PiKO7L7qEeE+Xt+qNA3ddxcBzHryi9L9VTnjGky2Dr1fOivKW052H3YMfpYdcfBasew9D1q3A770uhjsE+LscNO47jOgZ2X0NQ65U/Lo7z/tjeEUANxLpGVWG3xvpvPPOhD9nWyMhbhuP6I2RkZGRk5C3Ac3/3xNftXt//bdMQHqlRv6+e4wMhYrP560s57A1Ojpd7GY4gV5T8rze9wu3OShDr4+KLwMsSXsfLUJArStZlnU69IzKWzRIlHUbfup6cfriY8DIU5IqSdV5niWyhRb4gy6tphckmgHub314phd0Hc4k8U72h3qJ6zDOHJXyGPM+GeOvsnFCekXUXN9V65pnDEt7CeqXHWurgeAbrCsc0l463sB5zKPODz0mG17WZnZXDoe/EHSFgPeYwwNs5oZ5vBitaZ+ccljHHUD3mmcMAb2ePrNtapvaw3s4J5pljqF7jO3FHCAfHW1iPOXBPX9/MwfEM1i11aPtWhfWZU7AucxBeOKa5FNiunRMrevp8e7A+cyDezgnlMxYV1WW+1GEJz1Bd5pmD8KXOg/Tlcz/EM4cDX8UKdR2xtobfXI/rv//RL958xtZGRt4qjBdXRkZGRt5hxKfPnXnp5Vvvm4X9U3t74U8gxnsBPAJg3XYp6k1Owsu9LOF1vMyjWecu98LbnZUg1sfFF4dVci9DQa4oWZd1OvWOyPAyHEHu4a31sgb5gwl61ntZH31rV8lJtlAk65B1wqRCdSEinI0Ipb9rre6D+VUcHJ+jOkM8c3C8QZ5jQ7x1dk4or2j6MbvdYYhnDo63qF7mFzdZlzkIz5xH3vfW2g/lerq9qM4QTxw9L5nzYP1VHNq++HFMqA7zzEF4x7GIwoqlDsIzx2A95jDQW2fnPrJ+aynbZxUHx1tUz76uE0wyB8dbWI85cD/ota08w3btnGDeuNZY0JeoHvOlDoe+9zg9bN/OiSGeOPp8K1SX+VIHx2csKl7XZnZOMM8cHG9RvSG+1MHxCtKnzz1zWMYHVBGYR8T1CX78zMcufd/lH33+pq2NjLxVKP1RdWRkZGTkLUyMqG78bdzzxR9e/z3PvnTjD+3OZn9sbxd/BzF+F4D3FF9Y6UO9ASrFW+9lBay4/OhZ9X++INaHxZcV8NZ72Sqsuq+33stKWHX924lVXyje+mWzhOnEeY35ixHVPHQySknHY9X1DHVuKT+Eo9jDchyPgcLe11F8P6vuwdbb40zYruopPwS7h73vBPsAVnVLWXU9gX4gg+O5r+4DsgSleww5ftVVfhVKj1+x6vrbxXE8dolV9151PdtiyPMypLsC8rV9HHQeEIesezsPscWQ42XHOXB9B7a+cyc92D2Grn+TKDrMotKA3luBozpWss+xvtYjUEUg1kAV4+4kTP+31147N7O1kZG3EvaPx5GRkZGRtxkv/J2t98e9+OB+PfvOOsZHwjx+Yw2cY2+EivHWLpslvI6X9cE+VMrxQi9DT75sVgJZv1AkW+BlCa+zbOZRsi7rdOodkeFlOILcw1vrZSj4wcTLvayPvrVe7mXQeVx8cRD55ExAdR7AhijkqArzqzg4Pkd1hnjm4HiDPM+YZw7ClzqPph+z2x2YZw5LeIvq5cdpXAvmIDxzCtYVrqM7okF5i+oxzxy4p+clcx6sb52dEwV+cVN1LarHPHMQXjimJay8ioPjLazHHIRnDsTbuY+sv7ip9mC+1MHxFtVjz3dHNAz1OV7HZnbG/5+9Pw+XLUvP+sB37TjDPXe+efPmXJk1ZE1ZqaxRE2WhwS4hgRlsKOFubNzYfqSmjaGNjf146pK622A3CIPANgI1EmJqVdndAtNgLHAJNWayCrCGoqQasrKGHCrn4U7nROzVf5y9dq797ff99to77s3KYf2ep+KJ7/e+X9zI2DtunDhR5x7xvAbvUudh+3ZOFPj+akHXRfWYn+lG0Ug4sC5zEJ45cC+POUN1md/GGQYV1i91mOmZY3g9lTFvnZ1zvMxiuu4xV9kcH4EGDTbriJ19PNysdn7HA5+/9vdtrVJ5NVE/XKlUKpXXKI/+qf3vadv2fLuJ39vG+M0x4h60OBGa7vepsC9WSvF2l2YJr+NlHt2eu+6FXoaJfGlWAtnvFcl6vCzhdZZmU0ztZvmoOhIGL/cyFOQe3q6XdSx6g4KJbIqSXa+zIIv9xQSis3dXQDwV4fy2KLkLiMw6Oyfm+hzVuRGeOQI9x5iD42Ey1VOekXX7q2yfOcz0zFm8TpeNKts8JsozbNfOCfYNWIg+cwzVY545cD/rvGSorvV2ThT4/qrqWlRvjrfOzonOq3iAV8oz1WOeOQXrMoeZvtQp1GM4Eh0ljxVIZmcP1p3zvIbwzDFUr9DT5zXGvR7lGbZrZ+USXTaoqL7yFtZjLmEzO3eOaS4FtmvnHJYVOnm8GaqrPEymespnDCqsb52dc1TGPHMK1mUOM7ydE8orTN897ixjDtpHBKyOIjYAVjvx5x48034kfBqHtlepvJqoH65UKpXKa4jLf+niXU8//8J3rmK81Lb45nYdP4yA26P6Z7/EFy2TeHtLs4TX8TKPbs9d98KlGSZyLytB7Mf+QuBlCa+zNJuiZNc7llR2LM0SJR2Ft+tlmHiDgol9L/Mo2fM6M7NekWyE6DSnAppzQDgrCgkWMwfi7ZxgnjmG6s3xzMHxBnmOMc8chLfOzh6mG4nrYZ45LPAW1ev8IGbdUgfHM2zXzpljEZXMMVSPeebAPT0vmfNgfevsnGA+c4OYdRmqxzxzIN7OCfUNWIYqMl/q4Pgc1WGeOTgeJvN6jK4/WFO3Yb2dE3O9RfXY8R6JjrneYnt2zjHZrOe18gzWZQ7CZ24Qsy4cb2E95iC8cExzKbBdO+ewjDmMPT3eHqzPHIQvdRmjeCS2dFjgLap3I7x1di7B7MjjfgN8iECIAe0GiDHi5MnVf/32D97/+8MnPl0/XKm8qqkfrlQqlcqrnPanL555/Kkr7zy6unlLQPsRAPe1MX4AERfdv8fJFyzFeLtLs4TX8bIp1JuRhBtO5EszFOQeYrfXIgcmMmyZe5lHyV7WGdVHImNplijpMLw9L+uQb1Awse9lU0ztbpOLLPYXEzid1fkG4ZaIsOeUWMQciLdzgnnmFKzLHGZ65gj0HGMOwpc6OJ6RdaOZB8zxzMHxFtXr/CC2XTsnmGfOw/btnFCvg0wyx1A95plLZBk9JzGxb1Fd6+2cYD6/j8K7qN4cb52dc9TxtrBSqYPwzClYlznM9KVO0XVHKyNBnJ2Vg+MtqrfN/Uwob1G9Qj/ruc2cR973dlXGHseJrovqMF/qMPN+KmzfzoktvTzeDNVlvtTB8Rl9RXWZL3VY4HNUR3k4mfV2TijPIF163JmD4yGyCDQhIK6BZgePnD114nfe+89e+jlbq1RebehvylUqlUrl68qXfhgHO6cPHtxtcMeV60e/a7OJ72uAWxFwBhBfkFhKOoypPS/3MtyAXNHtuete+EpnJYj92F84bJN7GQpyRcle1hnVRyJjaZYo6TCm9iZy+gYl4WUoyBUle15nQdZrkfc4edhr0JwGmttaG70M22cOxNs5wTxzDNVjnjks8AZ5jjHPHIi3c0J5RtaNZu5hDjM9cwrWtfeTDmROzPUM27VzovPu/Uwob1E95pnD2M86JxWqa72dlcPQjyojQWAd5jDD2zlR+sEK/Ntw58Rcn6M6zDOXYJl1dvYw3X5Ut2G9nRNzvYX1OjeKRkI4ON7CesyBe/rcZg6OZ7BuqcPQDyqsz5yCdZmD8aqD44zGVApYt9Sh3NPjrVBd5ksdHN8xiFWX+VKHBd6ieswzB+LtnFCeQbrymN8gHxHQbCLaFljt4p9cPn/6t37LLzz/sO1VKq82GisqlUql8vXl0Z+649Kjf2rvX949tfd7j46O/qOrVw//XGzjr2sC3tJ/sHKzuZkfvd/M267cGF5vx+hm/vdsedvB2/eybdj2dr19LyvB2Y+HLcLVAFwL8k3Zaxrnv30ps98Es/ugupbSnsFdY/cHjmfM6b5SuP/R2zG66Zvx3z/6QxzmdLel9M+a+5iU3i5j7p9Vwjb3J7HtbWy7z1CPVcmfVdIRbLE6ZNsbcvad6OajjstrhZv14M25Xdud+5ja/bnM2Vdd5V/lzH2ogZn/raqrvEX1lN+WRQ/IK8cKQIzHX+fvrnZ+7v67Lj1tO5XKq5FX+VOrUqlU3jg8+ucOPnR05fDuJjb//KaN34A2vj+2ON3/gnpLyRddJR2Gt+dleAVyhfp/euV4haUZJnIvK0Hsx/5C4GUJr7M0m2JqN8tplcqOpVmipMPw9rysQ34DHBP7XuZRsud1FmS9FnnPRB6aABwAO3dH/n8RYvvMgXg7KwfHW1SPeeawwBvo+cUcZng7J5RnZN1o5h7mMNMzp2Bd4/rRdu2cYJ45Besyh2M/ikaiQ3kL6zGHck/PSYx7LqrLvHV2zumyvuJ1LazLHGZ4OyfYsVaoovV2TjDPHIP1mMNMX+oUptuP6jast3Nirs9Rnc4P4onuCOUtrMccxn7281p5BuuWOojHkArhGKrHfKnDsR9FIzFB3le7yoNkdoZzvBmqqzxuwH9Dx6DC+tbZOUdl1tvZQ3WZZy5hMzsnlGeQrjzuzDMHxwNoYkC7BlYrPHLqoPn9b/ns4f/bdiqVVyP1w5VKpVL5OhIjdr7yo3u/LoTNyc1R+C0hxve2wNuRfkG988UHcANyD293aZbwOl42BXtDkuOFXoaJfGlWAtnvFcl6vCzhdZZmHiV7WWdUH4kML8MNyD28XS/rkG9UMLHvZVNM7Xq5l0Hnsb+YoKCzcxfQnAJi/tGz2mN+GwfHW1RvjmcOjs+YdW7ZOcF8qfPo+v2a2meeOQjPHEP1Mj+o2L6dlYPjGazLHI79KBqJDuVzVEd5kMzOEOclcx6sX+ogfOYGMesyVI955kC8nTPHIooqWm9n5eB4i+rN8ds4RdYdrLHbKHUQnjmG6t2I57XyOV6HZcbR5zXGvR7lFXlf7Rb4/mpB10X1mJ/pRtFIOLAucxCeOYy9PN4K1mcOwpe6jFE8EsTZOYdlzMHxFtVjnjkIX+qmyHfY30VwbneGDwAQA9AGxE2LnV380+sXT37fB/7pi5+13Url1Uj9cKVSqVReYeInsfP4F3FPe7T7YbThns26/bZNjN+IiEshkL+XyRcgPV6WKOkwvL2lWcLreNkU6ou+hBd6GSbypVkJYj/2FwIvS3idpdkUU7tZPqqOhMHLvSxR0mF4e17W4b5B9TIU5IqSPa+zIIv9xQQFnXAQsHs7EE9kZbVX6u2sXMLLEqzDHGZ65gT0/GIOM7ydE8ozum6/wnaZw0zPHEP17P00Xs6Jud7CesIxTSVzCtZlDuWenpMY91xUN/clnZzM91dV16J6c3ypw7FX0QhVtN7OysHxFtZjDjN9qVN03dHKSHRYb+cE88wxWE8dZyqFZ46heoV+9vNaeYbt2jkx4QfxRHcS1mMukWeqx+4nFQ62a+fEll4eb4bqlno7J5TvGMSqa72dEzfKW1iPuYTKcl/SKYH06XFnDvN8ABBiQNwAbRtxcGL13556263/2T1/+9H6z4JVXhOMv4lXqVQqlZtC/FGcfLzZ/6bQhHuOjtbfE9fxG9rY/R4V8kVGz9IsUdJheHtLs4TX8TKPbs9d90Ivw0S+NCtB7Mf+wmGb3MtQkCtK9rxjSWWHl+EG5B7erpdBvFHJ8XIv8yjZ8zoLsthfTFDSAbC6DWjOANjthNpjfhsHx1tUb45nDo7PcM8tm9k5x2Z2Vs4j60czD2CeOSzwOapj7ycdyKwcHM9gXeZw7EfRSHQon+N1bGbnHJPR85I5D9bfxuFlP4pHQsB6zEF46+ycw441Q5WYL3VwvIX1mIPwzCVsZmePrNtfVfvW2zkx11tUjx3rkeiY6y2qx7xx9HmNcU86BesyB+EzN4hZF463sB5zEF44prkU2K6dE1t6ebwZqlviVQcTmY1Vl/lShwU+R3VuhC91HqYvjznzzMH3TQQ2a2BnN3ytbfGfP/TV9Y/YWqXyaqV+uFKpVCo3mRf/ym23P/f4s9/dtPGWdYsPxjb+WgTchog9BKzkFxkJL/cyFOQe3q6XYcvcy6ZQb0oSbjiRL81QkHuI3V6LHJjIEl5naeZRspd1RvWRyFiaJUo6DG/PyzrkmxVM7HvZFFO72+Qii/3FBCUdAM1+g9VtETjVLai9Um/nxFyfwzrMYaZnjiDPrTl+G+fR9WN2ncKyUgfHW1Qvv5/Ey1m5hJdZ8q7aK72fyjFUb0s/+7xksK51ds6xmb2PchCozhxf6nDsVTRCFa23s3JwvIX1mMNMX+oUXXe0MhIzHIi3swfrbns/4XiL6hX6Wc9r5jzyvrerMvY4TnRdvI7N7KwcZt5Phe3bOTHHEyePN0N1mS91cHxGX1Fd6+2cmOOZY6jeHF/q4HgG6cpjzjxz0D7EALTApgWaEJ9anz/1rR/89Aufs71K5dVK/XClUqlUbgLtn7/l7FPttbddu3L4kYBw+9EmvnWF+B1txJkQyC+oF19oAFtkiZIOY2rPy70s4XW8zKPbc9e98JXOShD7sb9w2Cb3MhTkipK9rDOqj0TG0ixR0mFM7U3k8s1Kwsu9zKNkz+t4GXjeK5INmMozVhcCmvMA9p3vNDK/jYPjLarHPHNY4A30/GIOwltn54TyDNONxPUwzxwW+BzVyXx/lXVLHRzPYF3HjaKR6FDewnqlLpE/hqqnPEN1mS91WPAY5qjOHG+dnRPOX3cjVNF6Oyfm+hyvwzLmUOhVh2G6/ahuw3o7J+Z6i+qx4z0SHXO9hfWYw9DPfl4rz2DdUgdzP4V3nYJ1mYPxqoPjjMZUCljXOjvnqCx/HFVHwfrMQfhSZxhUWH8bl2AZcwzWYw6OB8nsnFCeQbryuDPPHLiPLdA0AfEIiDHi4GD3j4fVzn/+js+99KTtViqvVuqHK5VKpXIDef7P7r39hSM8dGJ3dXjt2tH/ad3GtzYBt0XgPPtioudmZImSjsLbXZolvI6XeXR77roXvtJZCWK/1yIHJjJsmXvZFFO7WT6qjoTBy70MBbmHt+tlHfINCyb2vWyKqd1tcpL1imQjSjoAmr0GqwsRuKC+I+HclvV2TlhvZ4XqzfHMwfEGeV7N8ds4RdaNZh4wxzMHx1tUz95XOpA5wTxzHnlf7XbevY8J5S2qN8cTN/u8ZLDuNg5D319VXYvqzfEzHYsorGidnRPMM8dQvTmeOQjPnCLrDtbYbZQ4O+d4WUJ1Oj+KR0I4ON6ieswTN+t5zZyH7ds5wXzmBvFE10X1mC91OPajaCQmsH07J5hnDtzL481QXea3cRmjeCQ6rLdzgnnm4HiL6s3x2zgP05fH+4b4gAYBm8MWu/vhK6vd5oeb++/9b9/xP37uum1WKq9W6ocrlUqlcgN47CdOvWd9uPngKrZvPlq33xlifG8L7CPgZF+iX0x03IwsUdJhTO15uZfhBuQK9qbE4hWWZpjIvawEsR/7C4GXJbzO0myKkt2uQ6tUdizNEiUdhrfnZR3yTQsm9r3Mo2TP6yzIei3ynqncsDoVgFuA5iRZJAog3s6Jud6ieswzB+GZE9BzizkIb52dE8ozTDcSB+Uw0zPHUL3M91dt186JuZ7BusIxzaXjLbZn5xyWGUfPR4x7LqprvZ0TE34UjwRBdZhnDsTbOaGONUMVrbdzYq63qB7zzIF4OyunMN1+VLdhvZ0Tc72F9To3ikaig3nmLF6HZfYxZB2Mez3KK2zfzsph5mPIHEP1mC91OPajaCQmyPversqstzOc481Q3VJv54TyGX1Fda23c+JGeQvrMYcZ3s4J5RmkS485cwmVER9iQNtGYIO4avBIuPuWb33wf33ycdurVF7N1A9XKpVKZSHtr95/9om/++UPHR21vxGId8V1vLuNeD8i9kPzCv7TX9vmHt7u0izhdbxsCvbGJMcNJ/KbkZVA9ntFsh4vS3idpZlHyV7WGdVHIsPLcANyD2/Xyzrom5bE0myKqd1tcpHF/mKCkk5HWDXYOQfgUmujY9htlToIz5xFdeZ45uB4gzyv5vhtnCLr9lfZPnMQnjk43qJ6r+R9VeR9tdv5QTzRnUT15nji6HnJnEJ1rbdzosD3V1XXonrMMwfhhWNawsrW2TnHZnZWqN4czxyIt/MUXX+wpm6D+VIHx+eoDjvWI9Ex11tUj3niZj2vlVfYvp2Vw9D3Vwu6LqrH/Ew3ikbCgXWZg/DMYezpsfZgfeZAvJ0TyncMYtW13s45NrNzjpclVGdbb+eE8oqs7x5vlTFPXACA2KBdR8Q2xjPndv+jg3dc+BN3/7XHrthupfJqpn64UqlUKjOIP//B3cf/wS+8Azt48CiE+2K7+b4IXIhr3Ec/UMkhX1AM8PKlWaKkw/D2lmYJr+NlU7A3ojle6GWYyJdmJYj92F8IvCzhdZZmU0ztZjmtUtmxNEuUdBhTexP5ojcuialcUbLndRZksb+YoKST0ew3WN0agdNm0budPFO9ud6ieswzhwU+Q55Xc7x1dk4oz8i6/VW2zxxmeuYUtmvmwZgPdi8x1zNYVzimqWSOoXpzvH0MWQfjnovqWm/nxIQfxKprYT3m4HiYTPXY/VSokvV2Tsz1Ftuzc47KmLfOzh6mOxjZ7Vhn5wTzzDFUb87zGsIzx2A95jD2s5/XyjNs186JCT+IJ7qTsB5zCZvZOXOjaCQcbNfOiS29PN4M1S31dk4on9FXVNd6OyfmeOYYqrett3NCeQbp0mPOHOb5EAJCG7BeR+yE+OT+/t7vfvuH/sWfDp/4xMZ2K5VXM/XDlUqlUnGIEU0IaB/+cZzYu37ygbZZf0+ziXetY/vrY8R5BFx4uTxY5Xidm5ElSjoMb29plvA6XjaFeiOa8EIvw0S+NCtB7Mf+wmGb3MtQkCtK9roOrVLZ4WW4AbmHt+tlHfSNS2Jp5lGy53UWZLG/mKCkk9M0aE4Bqzvb8Ve37La2cXB8jurM8czB8QZ5TjHPHIi3c0J5RdeP2fURczxzcLxF9fL7adyAUgfHM2zXzgn22jcSHcpbVI955jD2kTgo58H61tk5wXzmBjHrMlSPeeYgvHBMS1jZOjsrB8dbVI955jDD29kj6w7W1G1Yb+cE88wxVI8d65HomOstqse8cbNea+B4hu3aOcG8vZ+jKwblLazHHIQXjmkuBaxb6lDu5fFmqC7z1tk5x8tsrLrW21m5BMuYY6ge88xB+FLnYfryeDPPXIJkAQFxA8RNxO5O+IWjN138yPv+/hNfs71K5dWOfftZqVQqlYzLP33xrqe/9sK3hw0+FBHfF2N8ewvcEoBTtsu+YBjg5V6GidzLEiUdhrfnZdgy97Ip1JuTHK9wMzIU5FOQ/V6RrMfLEl5naeZRspd1RvWRyFiaJUo6DG/PyzrkGxdM7HvZFCW7XmdBFvuLCUo6lhCwujWiOQcMfo5Q3VbuSzqeU7Auc5jpmSPI84p55kC8nRPKM7Juf5XtM4eZnjmL6rD7ycQo7JjrGbZr54R67WOSOYbqMc8cxn7WOalQXevtnJjwg1h1LazHXMJmdlYOx15FI1TRejsnmGdOwbrMQXjmQLydPbLuYI3dRqmD8MwxVI8d65HoYJ45Besyh7Gf9bxmzsP27ZyY8IN4ouvidVSW+4lO0f1U2L6dE3M8cfJ4M1SX+VIHx3cUPY7W21k5LPAW1ZvjSx0czzBdebzneOYANLHBZh0BxPXByfD73/n59Z+wnUrltUD9cKVSqVQM8ZOXTj/++ee//XDdvjdE3LdB/EgTcQERp2LAru33iC8aBnidpRluQO7h7S7NEl7Hyzy6PXfdC1/prASxH/sLh5uZe5lHyV7WGdVHIsPLcANyD2/Xy+C8cUl4uZdNMbXr5V4GnveKZAOmckE4EbBzB4D97gbU7TBf6uD4HNVhnrkEy5gjyPOKeeYgfKnz6Poxuz6CeeawwFtYL3ODeKLrOjiewbrW5Y8l8SOUt6ge88xh7Gedkx6sb52dE8xnbhCzLoP1mMMMb+cE+4a7QhVzX9KxeFlCdZhnDjO8nafo+oM1dRvW2znBPHMM1WPHeiQ65noL6zEH7ulzu9QpWLfUYegHFdZnTsG6zIF4OyfYsYbTZ7CudXbOUVn+OKqOh92xc8J6OyeUz+grqst8qcMCb2E95jDD2zmhPIN06TFnDvN8CAFxDaAFQhMfP3fu7Efv+/Szf9f2KpXXAvXDlUql8oYnRqzwswhPfW3vbddfiN+y3sTvChGXYozfGFtcmPxdKgnyRcMIr7M0ww3IPbzdpVnC63iZR7fnrnvhzchQkHuI3V6LHJjIsGXuZVNM7Wb5qDoSBi/3skRJh+HteVkHffOSWJpNUbLrdWZmvSLZiJIOobkQsDoPYK+7AXs7dlYOwjOnYF3mMNMzR5DnFPPMgXg7J5RnZN1o5gFzPHNwfI7X6bJRJRejsIN55jxs386JOd+YY46heswzh7GfdU4qVNd6OyeYz9wgZl2L6igPktl5wrGIwoqlDsIzx1A95pnDDG9nj6w7WGO3sY2D4y2s1zkWUckcHJ+jOswTN+t5zZyH7ds5MeEH8UR3EtWz3s4Fruh+KmzfzgnmmQP38ngzVJf5bVzGKB4J4uycwzLm4HgL6zGHGd7OCeUZpiuPtfIQmXURQAzABogxYm+/+ZvNuZO/+12/8PzDplmpvCaoH65UKpU3NI/9JE6F9d6/cLiO39XGeHsT4zdjg3Nt/rtUSrFfNDC8zs3IEiUdxtSel3tZwut4mUe356574dIME7mXlSD2Y38h8LKE1/EyFOSKkj3vWFLZsTRLlHQY3p6Xdcg3MJjY9zKPkj2vszCL/YXDVO7Q7DVYXYzAWfXdZnH7pQ6Ot7AecxCeOTjeIM8p5pkD8XZOKM/IutHMA5hnDsIzp2Bdez/pMNPB8QzbtXPmRtFIdChvUT3mmcPYzzonFaprvZ2Vw9D3V1WXwbrMYYa3c8L5q22EKuZedSAy5hiqxzxzmOHt7JF1B2vqNqy3s3JwvIX1OjeKRqKDeeYUrMscxp4+r5lLeJnFdu2sHIZ+UGF95hiqV+rtnFDPayoFedfbUxnzxtFjrVDdUm/nhPIdg1h1rbdzYo5nTsG6zGGGt3NCeYbtzj0vS30MCDEgthFNiC+cON98/9t/+einTKtSec1QP1ypVCpvSK7+tXNvffLxy78htPhw28Y72ohvwvFfigejF/9SSva8jpdhIvcyFOQe3q6XYcvcy6ZQXwgm3HAivxlZCWS/VyTr8bKE11maeZTsmc5gnNr3ci9DQe7h7XpZh/uGdWk2xdTuNrnIYn8xQUmHEYGdUwHNrUA8EH8ZWGfnBPPMMVRvjmcOjjfIc4p55kC8nRPKM7JuNPOAOZ45ON6iep3vY9ZjDsIz52H7dk6wU30kOpS3sB5zEJ44ek4y58H6pQ7CZ24Qs67F69jMzjk2s3PmWERhxVIH4ZljqB7zzEF46+w8RdYfrLLb2cbB8RbVY89rkL6dc7wsoTrME0ef1+Bd6jxs384J5jM3iFkXjrfYnp1zbGbnzI2ikXBgXeYgPHMYe3msFazPHIi3c0L5jkGsusxbZ+eE8pjIEqrDPHMQvtR5mL483swzlzBZiAFogXYTsbMbHjl36ey/8qZ//Mw/GLYqldcO9cOVSqXyhuCJj186fXJ95dSVo/X7rl9f/3pEfDBucBEBb40RK4Tsn/7yvjCYYmp3m3xplijpMLy9pVnC63jZFOrNaMILvQwT+dKsBLEf+wuBlyW8ztJsiqldk4/qI5GxNEuUdBhTexO5fAOT8HIv8yjZ8zoLsthfTFDSYUSg2W3QnAPCxdamx9jbtnNirrfYnp1zWMYcHG+g5xRzmOHtnFCekXWjmXuYg+NBMjt7sK69n3Qgc2KuZ9iunRPsdW8kOpS3sB5zKPf0nMS456K61ttZOQx9f1V1GazLHGZ4OyfYsVawonV2zmEZcwzWYw4zfalTZN3BmrqN3Jd0LF6WYB11nKkUnjmG6hV4+ZxG2f4k2zz++f0cXTEob1G9Um/nBDveIzGB7ds5wTxzGHv3eFtUt9TbOaF8Rl9RXevtnJjjmWOo3hxf6uB4hunK4808c4ksixFo0CBuImIbcfLk6idvO3Hi3z3/6ReeyVcqldcSjRWVSqXyeiBGhF/949gHgEd/bOdDhy89+28//cL1H792df2H4ga/e7PBQwh4F4C9kH+wgpv8sfPNvO1KhbHtOefte9m2ZLftfa1O8e6Xl23LlrcdttyvvEx71KJ9KQKXt3hQ1YmnvIX1trg7Nx1239h/A6O0Nwd2f+B4dh9Ut5Rt9tn9geMZc7pfb9hjVXr/S3sepbfB7qdiTpexzb7671GeUdpV97N0//WA+m+1Xj1WCrvPUJ1A/jjVVYxu4AZg7oP82kXdV+UZtqv+rDnciNsoxd5/RWnPo/Q2SnuvNDfwfk3e1GShQ/WUvxmU/lmqpzxjTncO5nZXCAid298Lzxyt8dn6wUrltU79cKVSqbzueObjF84BH1tdPLf7m7/0Z3b/q6M2/vHNYfy9AfF7EfAAAnabgDP5zuDr7Jv1hQVu8m1/PfDeoHhZCdvue3i37WVTeLteVoK372UlbLt/k5l997znmZdty5a3Lf/fYdj+tl91zD6oM+huu10HbF7Y4g9Sq8pbSnuvFtg5VvrfUNozsD+yR4XKM0q7qqd8CeoxUZ4xp/v1hj1Wpfe/tOdhb4PdHzieUdpVPeUZtmv/exLKM+Z034AMHnL1WFlvj5PHnC6D/SSDvT+JUbFD+VcCdl+3vT/b7uMG3UYp7DG4WdyMP+uVfKxeSW7GY/VqZMvjJ9+XKM8eV9KN4ThoY8R6E9fPHpz5s7ZTqbzWYKd/pVKpvOaIn/z2naee/0e3HVwLl55+6fA7wjr+tgjcEYFbAnA6AruD/wMYe6GXwwxK9rzO0gw3IPfwdpdmCa/jZR7dnrvuha90VoLYj/2Fw83MvcyjZC/rjOojkeFluAG5h7frZR3yjQwm9r1siqndbXKS9YpkI0o6jG6v2WuwujUCZ8wNsdu1zs45XpZQnTmeOTjeIM8n5pkD8XZWziPrRzMPYJ45LPAW1ev8ILZdOysHxzNYlzkc+1E0Eh3KW1iPOQhPHD0nmfNg/W0chn5QUX2L7dk5h2XW2TnReRUPUCXmSx0cb2E95iA8c4k883qMrN9fVbdhvZ0Tc71F9bZ9XjPHYD3mwP2s57XyDNYtdXjZD+KJ7iSqx7x1dk6w4wynz2DdUodyT4+1h+3bOcdmdlbO0FdUl/lShwXewnrMYYa3c0J5BunS480cyn2Ix/8kWNvGePbs3r938r6zf/rOn3ni8rBVqby2qB+uVCqV1yxP/jTOXH/+zN4ZAFfW17/1+qb9bSHGXxMjzgTgDtsfYV7oB6P64mCKkj2vszTDDcg9vN2lWcLreJlHt+eue+HNyFCQezi7sb8QeFnC6yzNppjazXJapbJjaZYo6TC8PS/roG9iEkuzKUp2vc7MrFckG1HSYXR7cdVgdz8gvGlDczknmGeOoXrMM4cFPkOeS3N8qYPjGVm3v2r37ZxjMzvneFlCddj9HA1kTsz1DNu1c+ZG0Uh0KJ+jOnM8cbPPS4bq5r6kI1w/si5D9eb4mY5FFFW03s7KwfE5qjPHMwfhmVOox3AkiLOzcnC8RfW2uZ8J5S2qV+jp85o5OJ5hu3ZOFPj+akHXRfWYt87Oic4PYtX1yHfUPvPMgXt6rBWqy/w2LmMUjwRxds5hGXNwfI7qKA+S2Vk5OJ5huvJYz/HGhRgQ24DYRjR7+NzOauf/8sAXrv3lYatSee1RP1ypVCqvOX7pT+L0mdP7t58+sXNw/aWj33K02XwkALdH4J19ib24W+wXEHKYQcme17kZWaKko/B2l2YJr+NlU6j/F1jCC70ME/nSrASxH/sLh21yL0NBrijZ6zq0SmXH0ixR0mF4e17WId/IYGLfy6aY2vVyL4POY3/hMJV7ZLthp0FzMaI5n0l723ZOMM8cQ/WYZw4LvEGeT8wzB+LtrJzCdCNxPcwzhwXewnqZG8S2a2fl4HgG6zpuFI1Eh/I5Xsdmds4xGT0nmVOoLvOlDgseQwvrMQfhrbNzYuprmxxVtN7Oibk+R3XmeOYSeeb1LFl3sKZuw3o7J+Z6C+t1bhSNRAfzzDFYjzmMPX1OY9zrUZ5hu3ZOMJ+5UTwSwjFYjzkQb+eEel5TKWDdUocyL481Q3WVh8lUT/mMvqK61ts5Mcczp2Bd5lDoVQcTmcV05fFmnrlEl0UATQhor0cgoG2a8Cu333/hu27/O08+blcqldca9cOVSqXymiDGD+4++6kvnNz8yuU7r1+L34p28xvbNnyoBU6hxTkACE32i+m9F/gE6fSKZMVM7Xq5l2Ei9zIU5B7erpdhy9zLplBvVHK8wiudlUD2e0WyHi9LeJ2l2RRTuyYfjDN3B3gZCnIPb9fLOuQbGUzse9kUJbteZ0EW+4sJSjqMfC80CKuAnbd1P73CbpM5CM8cQ/WYZw7CMyeg5xNzEL7UwfGMrtuvqN1Sb+ccL0uoTuYHFdu3c4J55jxs386ZG0UjIRxD9eZ44ug5Cd6VqG7uVQckM/NgtF2G6szxMx2LKKxonZ0TzDPHUL05njkIz5xCPYYjUejsnFDeonrq61gmmYPjLazHHMZ+9nNaeYbt2jnBfOYGMevC8RbVY946Oyc6X3Q/GazLHIRnDmMvj7WC9ZmD8KXOMPk4ljg756hM+RzVYZ45CF/qPExfHm/mmQPxLRA3QIhod04d/NYH/oN3/n/DD3zqyLQqldcc9cOVSqXyqqX969h/5mu4tT3cO3V00Nx+dHX9rwbEb0XEm2PEyRCyD1MY9sXcYr+AkMNMSna9zs3IEiUdhre3NEt4HS+bQr0pTbjhRH4zshLEfuwvBF6W8DpLsylKdrPOqD4SGUuzRElH4e16GZw3Mgkv9zKPkj2vsyCL/cUEJR2F2W0uBjS3RITGZN6fwTLmGKrHPHNY4A30fGIOM7ydlVOYbiQOymGmZ07BupkbxPnA9hIsY07BusIxzaXjLapnvZ1z8sdQ9ZRnqK71dk5M+EGsugzWZQ7CW2fnhDrWDFW03s6JuT7H69jMzjk2s7NyCtPtR3Ub1ts5MddbWK9zo2gkhIPjc1Sn0M9+XivPYN0FbhRbYWeF6pV6OyfU85pKge3aOTHHGyePNcPr2szOysHxGX1Fda23c2KOZ46henP8Ns4j68tjPdfjOAsRQBPQrgG0ETur8PD5Uwf/6t0Pfc8/DJ/4hPm3eyuV1x71w5VKpfKq47GfxKl4dPpks7v58Hp9dP/6KP72EHAvgNtsd+qF3MXko/pIFFKy53VuRpYo6TC8vaVZwut42RTqjUrCDSfym5GVIPZ7LXJgIsOWuZdNMbWb5aPqSBi83MtQkHt4u17WId/QYGLfyzxK9rzOgiz2FxOUdBhib/dtABryFbDoU88cQ/WYZw7CM0eQ59Ecv43z6Poxu06xmZ1zVKZ8jupkvr/KusxBeOY8bN/OmRtFIyEcQ/XmeOLoecmcB+tv4zD0g4rq56gO88xBeOGYlrCydXZOMM8cQ/XmeOZAvJ2n6PqDNXUbzFtn5xwvS6gOO9Yj0THXW1SPeePocxrjnnQetm/nBPOZG8SsC8dbWI85CG9dN1sNKElgvVKHci+PtYL1mQPxdk4o3zGIVdd6OyuXYBlzDNVjnjkQb+eE8gzSlcebeebwsg8IQAxo1y0a4Fqzu/r46p4zv+fdf+/pF+1KpfJaxL61rFQqla8LMcbw9MfPvDscrS+0MT549drRR9oYPgJgJwAnbR9wXsQxkSVIp1ckK2Zqd5t8aZYo6TCm9rzcy3ADckW356574dIME7mXlUD2e0WyHi9LeJ2lmUfJXtYZ1UciY2mWKOkwpvYmcvlGBtO7k7miZM/rLMh6LfKeqdyD7K7Oh+PfvbJnAtIFhGeOwXrMYaZnTkDPJ+ZQ6Es6U5huJA7KYaZnjqF6nR/FVtg5wTxzCtu1c4J9ExZ+vwjWYw5lnp6PcHYZqmu9nRMTfhCrrkX1mGcOxNs5oY41QxWtt3NirrewHnOY4e2snMJ0+5HdRqmD8MwxVE8dayaZg+NzVKfQz35eK8+wXTsrl+iyvlLQdVGdUm/nBDvWIzGB7ds5wTxz4F4ebwbrMgfi7ZxQPqOvqK71dk4wzxwcb1E95pkD8XZOKM8wXXmc5/jMhRiANqJtgZ2d8NV2b+83P/T5K5/K65XKa5n64UqlUvm6ET+O1ZPXcdvh4f574k64Mx5tHkBsvycC74gt9kODFX2hzvFyLwPPB4rkRZTseZ2lGW5A7uHtLs0SXsfLPLo9d90LX+msBLHfa5EDExm2zL3Mo2Qv64zqI5HhZbgBuYe362Ud8g0NJva9bIqp3W1ykvWKZCNKOgyxt3tvAPbj8Ktg1mUOjreo3hzPHByfIc8j5pmD8KXOo+v3a2qfeeYgPHMM1cu8e19LHRzPYF3HjaKREI6heswzB+7pecmcB+uXODvnsMfQ6+eoHvPMgXg7J9g3YRWqaL2dE8wzx1A95pnDDG/nKbr+YE3dRu5VByJjjqF67FiPRMdcb1E95o2jz2mMe9IpWLfUYegHFdZnTsG6zMH4iQ6NqRTYrp2VQ7mXx1rB+syBeDsnlO8YxKxrnZ1zWMYcHG9hPeYww9s5oTzDdOWxnuM7FwAENNisIxAjdnbw9x788ubDtl6pvJapH65UKpVXnMd+EqewOnhP26z2cfn6b2+b+LbNOn5TCLjFdgHxYp1YmiXsFxJymEHJntdZmuEG5B7e7tIs4XW8zKPbc9e9cGmGidzLShD7sb8QeFnC6yzNppjazXJapbJjaZYo6TC8PS/rkG9oULA/lStK9rzOzKxXJBtR0mGIvdXZgOY8gBNZQXSpZ47BesxhpmdOQM8l5lDoVQcTmaXr9itslznM9MwxVM/eT+PlnGCeOYXt2jnBvgkL0WdOwbrMoczT8xHOLkN1rbdzYsIPYtW1qB7zzIF4OyfY/VSokvV2TjDPnMJ27ZyjMuats7NH1h2ssdsodRCeOYbqsef1SHQwzxxD9Qr9rOc1cx62b+fEhB/EE10X1WG+1OHYj6KRmMD27ZxgnjmMvTzWDNUt9XZWLmMUj8QMB+GZg+MtrMdcwmZ2Vg6OZ5iuPNZzfOcCwvEvsm+BGCMOdvf+naNvfsuffvATnz60K5XKa5X64UqlUnnFeOIvnHzf9cOjD8QY7gxof82mje8LAecDcJK+ICduRpawX0jIYQYle15naYYbkHt4u0uzhNfxsinYm5UcL/QyTORLsxLEfuwvHG5m7mUeJXtdh1ap7FiaJUo6DG/PyzrkGxpM7HvZFFO7Xu5l0HnsLyYo6TCcvd07AnA6Hv/+FYguc3C8RfXmeObg+Ax5HjHPHIi3c0J5Rtbtr6p95pmD8MwxWM+4wWj7dlYOjmfYrp1z2OvdSHQon6M6zDMH7ul5yZwH62/j8LIfxKprYT3mMMPbOcGOs0IVrbezcnC8RfWYZw4zvJ09su5gTd2G9XZOMM8cg/U6N4pGomOut7Aecxh7+pzGuCedgnVLHYZ+UGF95hSsyxyMVx0cZ6N4JCawfTsrh3IvjzVDdUu9nZUz9BXVZb7UQXjmFKzLHGZ4OyeUZ5iuPNbMM9cR2uMPVzbt8S+y3z3R/L3ddfM73/Hl65+33UrltUz9cKVSqdw04iex87Uv778ZTXzo+uHmA00b3tki3hkjHkLACQC7x0W7afDypVmCdHpFsmKmdr3cyzCRe1mipMPw9rwMr0CuYG9WLF7hlc5KIPu9IlmPlyW8ztJsiqldkw/GmbsDvCxR0mF4e17WId/QoGB/KleU7HmdBVmvRd4zlXuI3eZUwOoCgJNdQfSoZ46heswzB+GZI8jzaI4vdXA8I3/Y1d4czxwcb1G9/H4SL2fl4HiG7do5oV7rmGSOoXpzvHHynMS468K61tk5wby9n6MrE6jeHG+dnROdV/EAVip1EJ45hurN8cyBeDt7ZN3BGruNbRwcb1E99rweiQ7mmWOoHvPEyec188x52L6dE9abeTDabkL5HNVhfqYbRSPhwLqlDsLbx5B1PFSf+W2cYVBh/VIH4ZmD43O8js3snGC+1HmYvjzezDOH3DfAOiI08YWd3ebPrU+f/NhDv/j8s8NypfLapn64UqlUbjhP/hjObJr9b2l34jev1+2b0MZva4HbA8Q/+wXnRRkTGSZyL8M4H9VHopCSPa9zM7JESYfh7S3NEl7Hy6Zgb0xz3HAivxlZCWI/9hcO2+RehoJcUbKXdUb1kcjwMtyA3MPb9TI4b2gSXu5lHiV7XmdB1muR90zlHs7u7qUGONsCK9FjDo63qB7zzGGBz3DPI5vZOWG9nRPKM7Juf1XtM88chGeOoXql97XUwfEM1nXcIGK9hJclWIc5lHt5TirPUF3mSx0WPIY5rMccZng7J6a+rslRRevtrFzCyxKqwzxzmOHt7JF1B2vqNqy3c4J55his17lRNBIdzDOnYF3mMPb0ec1cwstyWK/UYegHFdZnjqF6zJc6HPtRNBIOtmvnxBxPHD3WCtUt8SUdQV/xutv8Wcwzx1C9Ob7UwfEM8piM1kciw2b9OR0Q10BARABeunj25Afv+cyLv2ralcprnvrhSqVS2Zr2j9+/j7c/s//ss1fec329/sjRGt8KxIttxNsa4ASAk3ZnhH1BzvEyTORelsg6o/pIFFKy53VuRpYo6TC8PS/DlrmXTcHerOS44US+NENB7iF2ey1yYCJLeJ2l2RRTu1k+qo6Ewcu9LFHSYXh7XtbhvoFdmnmU7HmdBVnsLyYo6TCm9g4Cds4C4ZzzFwXzzDFUj3nmIDxzBHkOzfGlDo5ndN2YXR8xxzMHx1tUL7+fxg0odXA8w3btnGCn8Eh0KG9RvTmeuNnnJcN27awchDeuH1mXoXpzvHV2TnRexQNYaRsHx1tUb45nDsarjiLr91e927CZnZWD4y2s1zkWUckcHJ+jOswTR5/TzMHxCtu3c4L5zA3iia4L6zEH4YVjmksB6zIH4QsdPdYK1mUOwpc6w6DC+ts4LPA5rMMcHA+TqZ7yDNKVx5p55gAgBjQxYLNuAQAnTq/+1P7Jg//oLf/b88/ZaqXyWqd+uFKpVGYTP45VPI0dAHjymd13X2/jd8cjfHsIONhs4jtXDW5pW+yHMOPvGPWijC0yLMt7RbJipna3yZdmiZIOY2rPy70s4XW8zKPbc9e90MswkS/NSiD7vSJZj5clvM7SzKNkL+uM6iORsTRLlHQYU3sTuXxDk/ByL/Mo2fM6Xgadx/7CYSr38HYjsHOhAc63CMf/SOUopyhvUT3mmcMCnyHPI+aZS+SZ6inPMN1IHJTDTM8cQ/Uy31+1XTsn5noG6wrHNJeOz2Ed5lDuZ52TCtW13s6JCT+IVdeieswzB+LtnFDHmqGK1ts5MdfnsA5zmOlLnSLrDtbUbVhvZ+XgeAvrqeNMpfDMMVSvwC96TnuZJe+qvQk/iCe6k6heqbdz5kbRSDjYrp0Tczxx8ngzVJd56+yc42U2Zl3r7Jxgnjk43qJ6c/w2ziPry+M8x0cc/yr7TUTbAqHB83sHe//W2XPn//rdn3rsiq1XKq91yr/xWalU3vA89pM4dbB/dv/cXefjVz/76P8ODd7XbuIH2oh7A3ApAldCyU+pMNiLco6XL80SpjMYS/YZJXtex8swkXsZCnIPb3dplvA6XubR7bnrXngzMhTkHmK31yIHJjJsmXuZR8le1hnVR8Lg5V6GgtzD2/WyDvnGBhP7XjbF1O42Ocl6RbIRJR2GtxeBsN9gdTYiXBBFppljsB5zmOmZI8hzaI7fxnl0/ZhdH8E8c1jgLaqX30/jBpQ6OF6R99Vu6f2E4y2qN8cTNzov7VwC27HOzgnmjetH1mWoHvPMgXg7J9Q33RW2bOc5Do63qN4czxyMVx1F1h+sstvZxsHxFtVjx3okOub6HNZhDtyPntPgPcDxDNZlDsJnbhBPdF1YjzkI77hRNBIOtmvnBPPMJfKMnY8erMwciLdzQvmMvqK6zJc6CM+cwnbtnMMy6+ycUJ5Buts+r0MEYgyI6RfZ74V/fPXNl37dh/7OY0/ZbqXyeqB+uFKpVFxixC5+9tL+40889+ad2Nx+/er6+9YR7w/ArQG4tQX2EbETAhr2wjoLb/9mZAnTGYwl+4ySPa/jZZjIvQwFuYe3uzRLeB0v8+j23HUvXJphIveyEsR+7C8EXpbwOkuzKUp2vWNJZcfSLFHSYUztTeT0TU3Cy1CQK0r2vM7MrFckG1HSYXh7XbZzpgEuRoQ9UiaKOgbrMYeZnjkBPY+YQ6Ev6UxhupE4KIeZnjmG6nV+ENuunRNzPcN27ZxQ3/RikjkG6zGHck/PR4x7LqprvZ0TzGduELMug/WYwwxv54Q61gxVtN7Oibk+h3WYw0xf6hRdd7QyEls6OD5HddRxZpI5ON6iegVePqdRtj9J3lV7Bb6/WtB1Ub1Sb+fMjaKRcLBdOyeYZw7cu8fborrMW2dn5QiDmt2xs3IQnjk43qJ6c7x1dk4ozzBdeZyZJy5EIIaAuAlA2yIEXFvtNv/H9/zrR38+/BCO/42wSuV1Rv1wpVKpjIgRzeM/gXuvbk7Eg5Pxbeu2/fZ4GD/cxvj+ELGPgFN2B+AvrrPw9m9GlrBfUMhhBiV7XmdphhuQe3i7S7OE1/GyKdQb1IQbTuQ3IytB7Pda5MBEhi1zL/Mo2es6tEplx9IsUdJheHte1iHf2GBi38ummNrdJhdZ7C8mKOkwpvYiEHYb7JwFcNG831O7yltYjznM9MwR5DnEPHMQvtR5dP2YXafYzM45LGOOoXqZ76+ybqmD4xm2a+dE/ngaN0J5i+oxzxy4p+clcwrVtd7OymHoix5Di+oxzxyIt3Ni6muaHFbcxsHxFtVjnjnM8Hb2yLqDNXYb1tk5MddbVI8d65HomOtzWIc5cD/rOa08g3VLHV72o3gkhGOoHvPW2TnBjjOcPoN1Sx3KPD3OCtUt9XZOKN8xiFXXejsn5njmGKzHHGZ4OyeUZ5iuPNYzfIOAdg3ENqJpwmMX7r7wvffc9x2/FD7xiY3tViqvB+qHK5VKpSfG79997OM/8fawCXdsNpsPt4f4ttDEt7Utbg8Bp+QLbWIqn8LbvxlZgnR6RbJipna3yZdmiZIOY2rPy70MNyBXqDctOV7hlc5KEPuxvxB4WcLrLM2mmNo1+ag+EhlLs0RJhzG1N5G7f996GQpyRcme11mQ9VrkPVO5h7fbZfSnV9Se8hbWYw4zPXMCeh4xh0Jf0pmCPcRsnznM9MwxVK/zg9h27ZxgnjkP27dzQr3OMcmcwnbtnGMzO0Ocj+Bdiepab+fEhB/EqmthPeYgfKnDsVfRCFW03s4J5plT2K6dc2xm5wTzzCm67mhlJLZ0cLyF9dRxZpI5ON6ieoW++Hlt5xLyHbXPvL2PoysG5S2qx7x1dk50fhSPxAQ36LHqIV4ea4bqMl/i7EwYVFTfejsnmGcOjreoHvPMgXg7J5RnmK48zsU+ILQRbfcxyom9nT/45JkTf+TbfvH5Z22zUnm9UD9cqVTewMSI5ssfx/md9cm3IF6/DVi9J27imzeb9vsQcQYBDYA9s6PxshK8fS/DRO5lGOej+kgUUrLndW5GlijpMLw9L8OWuZdNod6gJtxwIr8ZWQliP/YXDtvkXoaCXFGyl3VG9ZHI8DLcgNzD2/WyjsV/33qZR8me11mQ9VrkPVO5h7fbZc2qQXMaCLdnP72i9pS3sB5zCZvZOaG8QZ4/zDMH4u2cUJ6Rdfurap955iA8cwzWM869r6UOjmfYrp0TnR/EE91JVI955jD2s85Jhepab2flMPRFj6GF9ZjDDG/nxNTXNDmqaL2dlYPjLarHPHOY4e3skXUHa+w2rLNzYq63sF7nRtFIdDDPnMJ27ZwwfvZzWnkG65Y6iMdwojsJ6zEH4u2cUM9pKgWsW+pQ5uWxZqhuqbdzQvmOQay61ts5wTxzcHyO12EZcyDezgnlGaRLjzdzID77XSs7u+Hzu2Hn33jnF6/9nGlVKq8r6ocrlcoblK/99yc/cHTYvmvVtpeODuP9Ee13xhbvCg1WoxfIDPpCm/CyEqb2vXxpljCdwViyzyjZ8zo3I0uUdBjenpdhy9zLplBvWnK8ws3IUJBPIfZjfyHwsoTXWZpNMbWb5bRKZcfSLFHSYXh7Xtax+O9bL/Mo2fM6C7LYX0xQ0lF4u1m2c2J1/OHKfifVnvIW1mMOMz1zBHn+zPHW2TnHyyz5Q6z25njm4HiL6uX307gBpQ6OZ9iunRPqdY5J5hiqV+rtjAXnJEN1rbdzgvnMDWLWZbAecxB+gWPxCFYqdRCeOYvqKA+S2TnHZnb26LqjlZHY0sHxFtbb9n7C8RbVY564Wc9r5hS2a+cE88b1I+vC8RbVY946Oyc6P4hVV2H7dk4wzxzGXh5nBeszB+FLXUbRY2i9nZXDAm9RPeaZA/F2Vs7D9OWxZt64EAKwCWjbCMTY7uyG/+7WM7f83jt+6WtPDJuVyuuL+uFKpfIGIf78nSef/uyL9x221763acML60387oj45hjxLkTsIuDEy+XB6gD5Ygt/rwhvf2mGZflAkbyIkj2vczOyRElH4e0uzRJex8umUN94Snihl2EiX5qVQPZ7RbIeL0t4naWZR8le1hnVRyJjaZYo6Si8XS/DxN+1mNj3simmdr3cy6Dz2F84TOUe3m6WhZ0GzRmgudT99IraU97CesxBeOYSXtYhzyHmmQPxdk4oz8i6/VW1zzxzEJ45BusZ597XUgfHM2zXzonOD2LVxUSWYB3mUO5nnZMK1c296kBkmSt+DHNYjznM8HZOTH09k6OKJY/VXG9RPeaZwwxvZ4+sO1hjt2GdnRPMM6dgXXWcqRSeOYXt2jknfwxVb65nsG6pw8t+FI+EcAzWYw7E2znBjvVITGD7dk7M8cbJY83wujazs3JwfMcgVl3r7Zxgnjk43sJ6zEH4UgfHM0xXHusCH0KD9vDlnwI/d3r/e9/8K5f/ZghBbVcqrwvqhyuVyuuUh38cJ97yu3DtK39h931NDPe3IX4Qm3hfG+O7AnBru8FdocHK7gHOC6f3YpuYyj2mdr18aZawX1TIYSZTu17uZZjIvSxR0mF4e0uzhNfxMo9uz133wpuRoSD3ELu9FjkwkSW8ztJsiqndLB9VR8Lg5V6WKOkwvD0v63D/vl2aTVGy63VmZr0i2YiSDsPbM1mzv8LqthY4YN/t6FA+R3XmeObgeIM8f+Z46+yc42WWrhuz6yPmeObgeIvq5ffTuAGlDo5n2K6dE+x0HYkO5S2qN8cbR89J5jxYv9RBeHs/R1cmYD3mEjazs+OYlrDyNg6Oz/E6LGMOhV51FFm/v6pug/lSB8dbWK9zo2gkhIPjLarHPHGzntfKM2zXzgnmjetH1oXjLazHHIi3c4I9r0diAtu3s3Io9/Q4e7A+czBedTCR2Vh1rbezcljgLazHHGZ4OyunIF16rJmD8QFo2oBN90+C7R+s/sLu7s4fu/8zVz6VtSqV1yX1w5VK5XVI/OSdt37tiad+/foQ723b+FBEfFMAbm8jdkPAqeOS3crwMvWCm/CyErz9m5ElTGcwluwzSva8jpdhIvcyFOQe3u7SLOF1vMyj23PXvXBphoncy0oQ+7G/EHhZwut4GQpyRcmedyyp7FiaJUo6jKm9iXyrv2unckXJntdZkMX+YoKSDsPbI1k4CNh5E/tuR4fyFtVjnjks8Bny/GGeORBv54TyjKzbX2X7zGGmZ47BesbJ+2rnxFzPYF3hRnokMrwswTrModzPOicVqmu9nRPMZ24Qsy6D9ZjDDG/nBDvWClXMfUknR3kL6zGHmb7UKbLuYI3dxjYOjrewnjrOVArPHEP1Cvzs57TyDNu1c2LCD+KJ7iSsxxyIt3OCHeuRmMD27ZyY442Tx5qhusyXOjg+o6+orvV2TjDPHBxvYT3mIPw2zsP05bF2/PFOQLMB2hiBgBd3d3b+m1vOnf+/3fkLT1y2K5XK64364Uql8honfhKnn3/03C5w7cJ1hLuO2qNf37b47hARN8BbA3AaEasQyE+pqBdI+Jl8wYW/V4S3fzOyhP2iQg4zKNnzOl6GidzLUJB7eLtLs4TX8bIp2BuXHDecyJdmKMg9xG6vRQ5MZNgy9zKPkr2sM6qPRMbSLFHSYXh7Xtax+O9aL5tianebXGSxv5igpMOY2iP56h4gHIgvlEl/hOrM8czB8QZ5/szx2ziPrh+z6yOYZw4LvEX18vtp3IBSB8czbNfOCfYaNxIdyltUb44nbnRe2nkK1t/GYez7UfUtrMcchJ/hmJaw8jYOjreonvV2zmGZdXaeIuv3V9VtMF/q4HgL63VuFI2EcAkvS7AOc+B+9JwG7wGOZ7CudXbOybL+quorb2E95iC8cExzKbBdOyuHck+PswfrMwfi7ZxQvmMQs651dk7M8cwpWJc5zPB2Vk5BuvRYM4fcBzTx+HetxDZi1YR/fHTixPd84HMvPTlcqFRen9D3jJVK5dXPkz+NM1df2L/95AHeeu1K++1tiO9HG9+FgLfIF78cr+Nl6gU34WUlePtLMyzLe0WyYqZ2t8mXZomSDmNqz8u9LOF1vMyj23PXvfCVzkoQ+7G/EHhZwusszaaY2jX5qD4SGUuzREmHMbU3kW/1d+1UrijZ8zoLsl6LvGcq9/B2SRb2A3buisCOTXifwnrMYaZnjiDPH+aZS+SZ6inPyLr9VbbPHGZ65ixep8sGFdu3c2KuZ9iunRNzvjnHHIP1mEO5n3VOKlTXejsnmM/cIGZdi+rM8aUOx15FI1Qx96oDktnZg3WZw0xf6hRdd7QyEls6OD5HddRxZpI5ON6iegV+1nOaOQ/bt3Niwg/iie4krMdcIs9Ujx3rkZjA9u2cYJ45cC+PN4N1mQPxdlbOMKiwfqmD8MzB8RbWYw7Cb+M8TF8eZ+Z7FxBaoN1ENAGXY9P8nvd++egnhuVK5fVL/XClUnkN8dLfuPXOy1eev22vaS48f3nz0KqNvw3Am9sWJ0PARQCHAPYA8eKXs0UuX3Dh7xXh7XsZJnIvS2SdUX0kCinZ8zo3I0uUdBjenpdhy9zLpmBvXCxe4ZXOShD7sb9wuJm5l3mU7GWdUX0kDF7uZSjIPbxdL+tY/Petl3mU7HmdBVmvRd4zlXt4uyLbuRPASSA0JhD9EazHHIRnDo43yHOHeeYgfKnz6Poxuz6CeeawwFtUL7+fxg0odXA8w3btnCi9n3C8RfWYZw7cj85LO3t4XZvZWTkMfdFjaFE95pkD8XbOHItGqBLzpQ6Ot6ge88xBeOvsPEXWH6yy27HOzom5PsfrsK9dR0K4hJclWIc5cD96ToP3AMczWLfU4WU/iCe6k7AecyDezgl2nOH0GbZrZ+UgPHH0OCtUt9TbOaF8xyBmXevsnLhR3sJ6zKHQqw4mMovp0mPNHIDYAgjdT61sjv99sNCEz544s/uvvfOfXf2Htl+pvF6pH65UKq9yHvspvCUc7Z4+bNu791bhgaMW34YYv7WNOImI0yGI57F4ARzgdZyMvuAmvKyEqX0vX5ol7BcWcphByZ7XuRlZoqTDmNrzci/DDcgV6o1LjldYmmEi97ISxH7sLwRelvA6S7MppnaznFap7FiaJUo6DG/PyzoW/33rZR4le15nQdZrkfdM5R7ersjoT6+ILoV1mcNMz5yAnj/ModCXdKbIuv1Vts8cZnrmGKrX+UFsu3ZOMM+ch+3bOaFe45hkjsF6zEF44uj5CN6VqK71dk4wn7lBzLoW1ZnjZzoWUVQx96oDktlZoXpzPHMQnjmFegxHYksHx+eozo14TitvUb0CL5/TIPt2nsL27ZxgPr+Pwg9Q3sJ6zIF4Oyc6X3Q/GazLHIRnDty7x9tiu3bOsZmdlTNMPoalDsIzB8fnqA7zzIF4OyeUZ5CuPM7MRwAxAC0Q2+PCiXO7/+HBzv6fue8Xn3/W1iuV1yv8m7KVSuXrSvs3b7/tmWefe6jdi7tHl+N3bdr4FiB+VwT2ArpfSD8Fe/GzeB0nky+48PeK8Pa9DBO5l4HnA0XyIkr2vM7SDDcg9/B2l2YJr+NlU6g3qgkv9DJM5EuzEsh+r0jW42UJr7M08yjZyzqj+khkeBluQO7h7XpZx+K/b71siqldL/cy6Dz2FxOUdBjenpPt3g7EU0DIf2uZ0x/AesxBeObgeIM8d5hnDsTbOaE8I+tGM4+wmZ1zWMYcg/WM68eCrnRwPMN27Zzo/CCe6E6ieswzh7GfdU4qVNd6OyuHoS96DC2sxxxmeDtnjkUjVMl6OyfmeovqMc8chLfOzh6mOxjZ7Vhn58Rcn6M6nR/FI9HBPHMM1mMOYz/7Oa08g3VLHcRjONF1UZ1Sb+eEen9CpcB27axcwmZ2hnOsGapb6u2cUL5jELPuNg7CM8dQvTm+1MHxjKwrj7PyLdBEYNMed1Ynmp9Ztbt/5IEvXvmfbLVSeT1TP1ypVL7OxI9jFb4Pm0f/8t674zq8KYbNQ1iFN2Ed3x7beE8LvBMtVqEhv5DeQ70A5ngdJ5Mvuomp3GNq18uXZgnTGYwl+4qp3W3ypVmipMPw9pZmCa/jZR7dnrvuhTcjQ0E+hdiP/YXAyxJeZ2k2xdRultMqlR1Ls0RJhzG1N5G7f996GQpyRcme15mZ9YpkI0o6DG/PyZr9gHAH0Ox1Jac7gnWZw0zPHEGeO3O8dXZOKM/IutHMA+Z45uB4i+p1fhDbrp0TzDPnYft2Tsz55hxzDNZjLmEzO2PBOclQXevtnGA+c4OYdRmsxxyEn+lYRGHFUgfhmbOozhzPHIRnTqEew5HY0sHxOapzI57TyltUj3nj5HMa4+5o9mBd5iC8vZ+jKwblLarHvHV2TnR+EKsug3WZg/DMYezdY81gfeZgfElHMPkYbuOwwOd4HZvZOWG9nRPKM0hXHmviAwJCG7DZtAgtru/sNT9x5tTBf3zvp194xnYrldcz9cOVSuXrSHz4vvNf+9Tj33x4tf0XGgAR7XdsIt4SI/aagDPHJbs1g6ndLXL5ogt/rwhv/2ZkCdMZjCX7iqldL/cyTORelijpMLy9pVnC63iZR7fnrnuhl2EiX5qVIPZjf+GwTe5lKMgVJXvesaSyY2mWKOkwpvYmcvfvWkzse5lHyZ7XWZDF/mKCkg7D2/MyADu3AeEkgN1OTPR7WI85zPTMEeS5wzxzIN7OCeUZWbe/qvatt3OOzezswbrGufe11MHxDNu1c6Lzg3iiOwnrMYdyP+ucVKhu7ks6OZnvr6oug3WZwwxv58yxiKKKN+ixclE95pmD8KVOkXUHa+w2rLNzgnnmFKw758MVCM8cg/WYw9jPfk4rz2DdUoeX/SCe6LqoTqm3c4Id65GYwPbtrFzCZnaGc6wZqst8qYPjOwax6lpvZ+UgPHMM1ZvjSx0cz8i68jgTHyIQQoN2ExHbiFXAY9fPnv2WD3362S/ZbqXyeqd+uFKpvALEiCb+eRy8sH92//DktYub63hXOGzvX2/wvTHEU22L96HFPgDQn1AhL2ZFlOx5HSeTL7zw94rw9m9GliCdXpGsmKldL/cyTORehoLcw9v1MmyZe9kU7M2LxSvcjAwFuYfY7bXIgYks4XWWZh4le1lnVB+JjKVZoqTD8Pa8rGPx37VeNkXJrtdZkMX+YoKSDmNqz8kX/fSK6szxzMHxBnnuzPHW2TnHy3KyXjTzgDmeOTjeonqdH8SsW+rgeIbt2jnBXt9GokN5i+qVejtDnJPMebB+qYPwmRvErMtgPeYg/AzHtISVt3FwfI7qzPHMgXg7T9H1B2vqNpgvdXC8hfXUsWaSOTjeonrMEzfrea08w3btnGDeuH5kXTjewnrMgXg7J9ixHgkH1i11KPf0OHuwPnMwvqQj6Cuqy3ypwwKfozrMM5e4QY9VD+nSY01caIHYBsRu4cSp3Y+989/7nX8o/MCfPrLdSuX1Tv1wpVK5yTz3F89duH726N69w83Fa9fb713H+FBEfCda3NX//2DJi1WPl00xtevlXqZedBNeVoK3vzTDsrxXJCumZNfr3IwsUdJReLtLs4TX8TKPbs9d98JXOitB7Mf+QuBlCa+zNJuiZDfrjOojkbE0S5R0FN6ul2Hi71pM7HuZR8me1/Ey8LxXJBswlXt4uxPZzu3ZT6943RzVY545LPAZ8txhnjkQb+eE8oys219l+8xhpmeOwXrGyftq58Rcz7BdOyfmfHNOeQvrMYdyP+ucVKhu7lUHIstcf5X1FKzLHGZ4OyfYsVaoYsljNddbWI85zPSlTpF1B2vsNqyzc4J55hSsq44zlcIzx2A95hL5Y6h6cz3Ddu2cmPCDeKI7CesxB+LtnGDHeiQmsH07J+Z44+SxZqgu86UOju8YxKprvZ2Vg/DMMVRvjt/GeWR9eZytD0DYBMR4/IvsQ8Ajp0+d+E+uPnTfJx78xKcPTbtSed1TP1ypVG4gMSLEv4LTj7en79lpr11ab5rbmrZ953oTf9Omxb0BaBFwVwCO4sv/wMj4xcoylStK9ryOk8kXXvh7RUzte/nSLJF/cZF7Kgop2fM6NyNLlHQY3p6XYcvcy6Zgb14sXuGVzkoQ+70WOTCRYcvcy6aY2s3yUXUkDF7uZSjIPbxdL+tY/Petl3mU7HmdBVmvRd4zlXt4uxNZcyJgdTuA/ZK/SJzbm+OZg+MN8ryZ462zc0J5RdeP2fURzDOHBd6ievn9NG6AdXbO8TKL7do5wU7LkehQ3qJ6c7xx9JxkzoP1t3EY+35UfQvrMQfhrbNzDjvWClbcxsHxOV5HZcwzB+NVR9H1B2vqNpgvdXC8hfXY/aRCODjewnrMgftZz2vlGbZrZ+Uw9v3I+swpWJc5EG/nBHtOj4QD65Y6lHt6nBWqW+JVBxOZjVnXOjsn5njmFKzLHAp9SWcK0qXHOnMhAggBaIG4iYgAdveb/+oIe//F+75w+Wv5WqXyRqF+uFKp3CCe+qnTD2ya9fk2xHdj07756LD9zhhwdwDuBLDPXrgGeLmXeZTseR0noy+6OVO5x9Suly/NEqYzGEv2GSV7XudmZImSDmNqz8u9DDcgV3R77roXLs0wkXtZCWI/9hcCL0t4naXZFFO7WU6rVHYszRIlHYa352Ud7t+3SzOPkj2vsyDrtch7pnIPb7cg27k1IJwGsOuVM1iNOcz0zBHkecM8cyDezgnlGVm3v8r2mcNMz5xFddj9HA1kTsz1DNu1c2LON+eUt7Aecyj3s85JhermXnUgsswNYta1qM4cX+pw7FU0QhWtt7NyCS9LsA5zmOlLnaLrjlZGYksHx+eojjrOTDIHx1tUr8DPek4z52H7dk5M+EE80Z2E9ZgD8XZOsGM9EhPYvp0TzDOHsZfHmqG6zG/jDIMK62/jsMDnqA7zzEH4UueR9d3jnGUNGrRH7fGwCr+wt2r+03c/fPg/vNyoVN5Y1A9XKpWFvPDJ07defxG3Hl2+/o2hwd5mjfcA7Te1LR6KAasAnLQ77gvd0syjZM/rOFnpCy+Ou5sQyO+S6YgR6xAQ0z+TFls8GYALMaAJQAPgCiI2CDiDiJcAnAbwQmxxEBpcicBeAA4i8HyIOIeIJwDcEpvjn1hFxJUAPNNG3A7gMiJOBmAXAVcBtABeBHApRlwPwLkAPByBMwCaNmI/BEREXAZwewB+tY24MwTsAdgH8BIiroSACzHiJQRcQMQLCDiNiMsIACLO9P+twEvh+P4jRhx1/917iEAAnovA+ZcfGBwhYBdx/BhGoA1AYx/rEdvmHt7u0izhdbxsCvYGJscNJ/KbkZVA9ntFsh4vS3idpZlHyZ7pDEZv38twA3IPb9fLOub8fTvAy6aY2t0mF1nsLyYo6TCm9rw8As1+g9WlePxqM4VXsZmdc1jGHEGeN8wzB+FLnUfXj9n1EcwzhwXeonr5/TRuQKmD4xm2a+cEe20biQ7lLarHPHPgfnRe2rkEu2PnOQ5DP6iovoX1mMMMb+cEO9YKVtzGwfEW1WOeORR61WGYbj+q27Dezom53sJ6nRtFIyEcHG9hPebA/eg5Dd4DHM9gXevsnMMeQ9VX3sJ6zIF4OyfUc5pKAuuVOghPHD3OCtUt9XZOKN8xiFnXOjsn5njmFKzLHAp9SWcK0qXHOnMBAc0a2MSICKybnfAXT1y49Q+8458+/mS+Uqm8kagfrlQqhTzxSZy+/Tvx0qM/tfPtcYP3B4Q7Yojvbtt4IQJvxgZ3pV9Gz16PuMzwci/zKNmLuI7jDzBe/mfKgHUEjtBiD8C1EHCqCfjqJuKWBrjaAie6F92XQsAtAH41RJyJAdcBnEPEChFPhYAnY8BJtDjVNOHLiPFMCOFKBJ5t23hfaHAlxHAZIXwOm3iAJr49InwBEXch4rGmCc/GiOsR8Y4A7CAgxhhe2gGeWUc0TcBBDNhbhfD5VQxXj0K8AGDVtLi8ifHNO6H5+bgT2hDjbruOpzYBF7CJeztNeCY2zaPxKJ5v9tBu2nhiFcLhpm3vQghPrSJOb1psQoM97IQvNWvsbTbxZAR2m1U8H2J4oQ24GjbhcN3EM6sYXoixfSC0WDcrvLhuw1ET410IuIyAwxARIuKdCOHLiPG+CNyKiMtNE74YW5yNiG+KEYexjZdWTXimBa4E4ChG3BOAoxiwA8RLscWVAFzbAGcD8I5VwC8g4Oxmgwsh4mwIuNwCqwDcGoBH2oiLOJ4PEHENASsEXEVEwPGHR8enQMQ6ADvHpwNiKH1t8M6vpVnC63iZR7fnrnvhzchQkE8h9mN/IfCyhNdZmk0xtZvltEplx9IsUdJhTO1N5PRNTsLLUJArSva8zoIs9hcTlHQY3l5htnOx++mV9MvtPViFOcz0zBHkecM8c4k8Uz3lGVk3mnnAjfDMWbxOlw0qtm/nBPPMedi+nRNzvjnHHIP1mIPwxM06JxWqa72dExN+EKtujurM8TMdiyisuI2D4y2sxxyEZw7CM6dQj+FIFDo753hZQnVuxHNaeYvqFfhZz2nmPGzfzgnm8/so/ADlLazHHIi3c+ZG0Ug4sC5zEJ45cC+PN8N27ZxjMzsrZxhUWH8bhwXewnrMQXjr7JxQnkG68jhHoEEAYkBsgdi2AHBt/8Lq/e/6pcPP2Hql8kai7BtolcobkPbv4eDJ65dWwOXTq2fim69vDn89NuG9bUSLGD/cAqea4+rxT6hkL0Lq9UgHs7KYnrsBuBqBgzbipeb4JyVeQIOd2CIg4HKIOBeAX+l+0gKIWCPgCBFPI+BaDOHqTsSVGOOldid8qdngegg4bIG7EMOvNCHuIzZfQAO063hfbMKjK8TdZtU8tdOEZ65HrHG0OQghnNvdXT3atri+iWhO7O9//vDw6OKqjafRrOO63fvC7m37bXj+8MLFi5f+2aOPPvoNVzZ45NKpWy/j3Fmsn//SHYcvASfvvvfxwye+fOvTR3uPnbh29VTT7F4/d0e8pTk6+cJz2Hnp9NFLt134HR957IX/z/9yJj79Urx+bv/wtksPrIFP7zz/tet753/7C8889z/ec8u5X/dvPvfZH/mLu+/4fZ+7DgDxr37wJB7D0eMHX9m783c+cbn96Xee+dwjm0MAePud74/xsX8SvnLHtebe3/6Vq+1PfctBeO6RgL29Fv+HP3wE/K0m/pX//sTnHrlweOG+1d6tv/kzL33m/3nr6VuuNfH23/PkSzF+fAV8AvHP/9yJ5nc+cTn+xXsvAM/jM1d31recvT0CT+LU5cunT/+uK48/+WNn3nnrl9/0cHz/Zj+cu+Poa4/8k7vX19vdU/fd+7X4ta+eO3frpUcf+/LTt+/d3qwPn738lp3Le0+cevOFl648/tydAYeroxjiiaY5uHz9aC804erBXnNhvY4nQxtXV65j72C/eTK2ca9ZYf+oXb8nhLCJR3HVhnAtAPubTbylaXAtxPjWGPB82+L2ZhUe3iC+CRucb2M8t9OEL8SIi22M94aANh5/QPN0AN6E45/oeVM4PgdPI+JKjNgNAbsADgHsZWfpBhA/reSd6wmv42VTqDerCS/0MkzkS7MSxH7sLxy2yb0MBbmiZK/r0CqVHUuzREmHMbU3kcs3OQkv9zKPkj2vsyCL/cUEJR2Gt+dleDm/IT+9wjxzEJ45gjxvmGcOxNs5oTwj60YzD2CeOSzwFtaz95MOMx0cz7BdOxs3eT/heIvqMc8cxn7WOalQXevtrBwWPIYW1mMOM7ydE1Nfx+SwonV2Tsz1FtVjnjkUetVhmG4/qtuw3s6Jud7Cep0bRSMhHBxvYT3mMPazn9PKM1jXOjvnsMdQ9ZXPUZ1Sb+eEek5TKbBdOyuHci+PNUN1S72dE8p3DGLVzb3qQGTMwfE5qjPHlzo4nmEeE7rayYAAbI5/iT0A7O/t/Mi5S+f/2J3/6ImHhwuVyhuL+uFKpZLx2E/i1Drgwu7B/l5EfE+7id+EGO9rN/HXxIhT4fiffNqB+ieuuhcd9oIUY/fPOOUOOAoRTQSa9NMCAfhie/xPQ61CRNv9s1Jf3Ql4ukW4smnjW5omPIyAQwBAg6dxhBMIuNw0WO3sNJ+OAe36OtA0iHuxeeowtG86ee7E/3R0dXPmKLYv7gWEzd7Ozm6Mu+11fO3Fa+2zu/u4867vvP9Xn/5bD99z8S17jz78aNu89aM/+lL88h/d++rf+dWLVy/e8uT9qxd3wnf/2mv45V9e4X+93ABA+F2PXDv+7/voKoRPbI6vx+P/lhAGD0XeednFYHuVcn7pYw/svecHf/kIAD77I2/fe8fv+9z1+PGP7uGj2Dz6p//u/t0/8NiVJ3/snWfWzz7XAsDB+d396+euH66fvXrPXd//Zz/7tR/9t978bGifv2Nndfb60V44Ci/eHq/HE83Oavfw+rrZO727xro9vW7b25u2vSuGcBRavIQG+zHG2+IaG8R4H5p4GxC+FgPOhhjPxRZ3BODRFrgYgXPN8U/iXEDAfgCuAThCxC0BuBaBE+m/54b9c2cK9QVjjldYmmEi97ISyH6vSNbjZQmvszTzKNnLOqP6SGQszRIlHYa352Ud7htaL0NBrijZ8zoLsl6LvGcq9/B2C7Pin15hMXOY6ZkjyPOGeeZAvJ0TyjOybjTzgDmeOTjeonqdH8W5GIUdzDPnYft2TqjXNiaZY7AecxCeuFnnpEJ1rbdzgvnMDWLWtXgdm9k5x2Z2zhyLKKxY6iA8cwzWYw7CMwfhmVOox3AktnRwfI7q3IjntPIW1WPeOPmcxrg7mj1YlzkIn7lBzLpwvIX1mAPxdk50vuh+KmzfzgnmmcPYu8eawfrMwfiSjqCvqC7zpQ4LvIX1mIPw1tk5oTyDdNWxDhFo2oA2Hn+4EgK+dLCz+5995b7bP/6df+f4e0KVyhuV+uFK5Q1P/CROP//C2TvW6yu3HjbNLc219oPrGH9LPP4dHLeEgFM4/mbwCfbi0xNxFUATW4TQYC8CLyDieQRcBPBEBC4G4PMh4oVw/NFDbIGvNcDu7k740iaGr6yacO3oqH0HGrx4YtU8dngYH29O7n9ldbS+tN/EZ69v2ovX1/ufefbo6MpdFw5wYTc2j74Y2qPV9aP7Tt91JazPreMtX1yFR9Y74Xc8/+yTP33xzKXf8vSLMX50BQD5Bxvsg45KxZLOncf/yM+duPMPPHG5/bGLZwAgnL09PvHoU6duP1i9iNO7+89feS68cHlz18Gbb3nmyiNP33nyVHxsFVZvvXJ1fVdsmhdD3LxlF+Glq0dxN4R4Dpv2gSag2bS4A8C6Bc6sgGdaxPc0AZtNi3Pd7y26hojzMaBtgFMAXgBwNrb+7/GRdM9h76nshq90VoLYj/2FwMsSXsfLUJArSvayzqg+EhlehhuQe3i7Xgb9JqfHy71siqldL/cy8LxXJBtR0mF4e4VZ8U+vqJh55iA8cwR63jCHGd7OCeUZWTeaeYTN7JxjMzt7sK5x/VjQlQ6OZ9iunROdH8UjIRyD9ZhDuafnJMY9F9W13s7KYej7q6rLYF3mMMPbOaG+6c5gRevsnJjrLazHHLb0qsMw3cHIbsc6OyeYZ07Buuo4Uyk8cwzWYw5jP/s5rTyDdUsdXvajeCSEs6hOqbdzgh3rkZjA9u2cYJ45jL081gzVZb7UwfEdg1h1rbdzwno753hZQnXm+FIHxzNMlx3r0B7/1EpsQ/rnwLCzt/rLCPsfe88XXvys7VcqbzTqhyuVNyRf+ikc7DZ4a7PZe1fcwbvbNVbr2P7aGOP7muP/1/zJGLFCgzYAu/H4n916vm2xD6BtGuw2IXwqRgABz8SAfcR4f4PmZ3YQvny4QbPaQYPQfBFtPBN2m6f3Qnh4s9rZ3cTNufOn9h99+plrB2cuN1/+6sX9a3eeONg9d8/Zwxe/9MzBmZdueR7PPrsTfuCxK8DL39yuH4RUXovEH/3gLi68tcVHXz6HX/xvbr/tsaMzz99y8Myli+dXz331qWt3753Zf2HzwuUPHV1rvnhwgEtXN5vbdhrstZt4utnEW47iZn9n1cTDdXzr8U+2xAcjwhcD4ntDCL/QtvE7AByFgL3unySLAM4BuA5gv78/EcfPWg/yBWXPzchQkHuI3V6LHJjIsGXuZVNM7Wb5qDoSBi/3skRJh+HteVkHe6PTszTzKNnzOl4GnveKZAOmcg9vd0Y2+dMrQs/yzMHxBnnOzPHW2TmhPCPrRjMPmOOZg+Mtqtf5QWy7ds6xmZ2nsH07J+Z8c055i+rN8cbNPicZrFvqIHzmBjHrMlSPeeZAvJ0zxyIKK27j4HgL6zEH4ZkD8XaeIuv3V9VtMF/q4Pgc1bkRz2nlLarHvHGzn9PKM2zXzgnm7f0cXTEob2E95kC8nRPsWMPpM2zXzsqh3MtjrWB95kC8nZUz9BXVZb7UYYG3sB5zEH4bpyBddqxDPP5gBTECMWIV8ItHDX7f+x/ZfNJ2K5U3Iv43mCqV1xExPrB37We/etezT17+dQ1CbGP8DZtNfCsanAbwXIi4jhAuxxhPNyF8KbR4DiG8hBCeDiu8EIDT+3urzxwdxievxubKXhvv2rnl1k+daS6ff/ap682VZu/Lb7mraQEgfPipy/Hj37ofvu9Nh8OfFvnY8T+lFX7o+OP+SqVCiR97YA8/+J4Nsp+aiT9+6Q7g5HOPX3vujnB9ffXw/P7O/tHqYGd99fYXX7r+1r39ncuH1+OpnZ323nUbD5oQ748tzsWIBg1CaOPFNuJtIeLhNuC+ELEKQNsCp7rfG9P94ccfwoRAXiPJF5sDvHxpVoLYj/2FwMsSXmdpNkXJbtehVSo7lmaJkg7D2/OyDvZGp2dp5lGy53W8DDqP/YXDVO7h7c7Iin56RUXMMwfhmSPQx9LOOSyzzs4J5Rldd7DC9pnDTM+cRXWM70fbt3NirmewrnBMU8kcg/WYQ7mXf48pz1Bd6+2sXKLL+orXtbAuc5jh7ZxQx5rBits4ON7Cesxhpi91iqw7WFO3kfuSjucUrKuOM5XCM8dgPeYw9rOf08ozbNfOiQk/iCe6Ll7HZnZWDsd+FI3EBLZv58Qcb5w81gzVZb7UwfEdg1h1rbdzgnnm4Pgc1WGeOQhf6jxMf3SsY/qpFQBtRADWMYS/erbZ+7ff8siVx027UnlDMv7GUaXyOuTK/3L+vitPbe68vr7+Te2m/fBuaH5pFVb/FACutOtHd9rViQ0Onj9/5ujc9aP9h1eHl3euHu2cvPt3vPSZx//Wbbffdu/Z58Inz7XhBz51lN9u/X0hlcrXl/w5+KUfvufg3n/vK1ef/LF3nrn1y6vrX73tsdvvvrTz7NNPXn1Tc2pn98Xnr9wH7DzaxPhmbNpbjvfbt61bnNtZ4enYxves2/j+BmgjsBsing4N3oqIr0TgbYgAAvZixDoAO/a+AOMvTgcszUog+70iWY+XJbzO0syjZM++CZADwcu9DAW5h7frZR2jNzo5S7Mppna3yUUW+4sJSjqMqT0vN9nOLQE4DYR9skQUMNMzB8cb5DnDPHMQvtQpsm4084A5njk43qJ6nR/ErMsciLezB+syh2M/ikaiQ3mL6s3xxs06JxWsu43D0A8qqm9RPeaZg/ETHRUPUCXmSx0cb2E95hI2s3NOyWOlyPr9VXUb1ts5MddbVG/b5zVzDNZjDtzT5zVzcDzDdu2cYD5zg3iiOwnrMgfhhWOaS4Ht2lk5lHt6nBWqW+rtrJyhr3jdPFO9OZ45BesyhxnezgnlGaZrj3UTun8ObN39/4NbHJ28/ZYH7v/HX/t8/V5YpXJM/XCl8oYgfuyBPbwH+Owdz5x7+7f9wNP42Z/YA4DwnfUXb1Uqb0S+9MP3HLzphbPHP1X25kvNC+c+e+r5h5958ML9d37m6S89cXdzuHkhbuJ7EJrzMWzetwo4bFscxDaeBuK7Y8QRAu5BxHlEXEXAiQicDBEn7J/V433p6WUliP3YXwi8LOF1lmZTTO1mOa1S2bE0S5R0GFN7E7l9ozPCy73Mo2TP6yzIYn8xQUmH4e15GcZ52G2wc2sETotFppnDTM+cgJ43zEF46+ycUJ6RdfurbJ85zPTMKWyX3c/RQObEXM+wXTsn5nxzjjmG6jHPHMaeno8Y91xU13o7JyZ8H6ueRfXm+FKHY6+iEapovZ2Vg+MtrMccZvpSp+i6o5WRIM7OOTazs0L1trmfCeUtqlfo6fOaOTieYbt2Tkz4QTzRnUT1mLfOzok591Nh+3ZOMM8cxp4eZ4Xqlno7K2eYfAxLHYRnDo7P8To2s3OOzeysnIfp58c6AGjQILYR7eY4OHmw++/vrk7/pTd/5qnHXm5WKm9s6ocrlUqlUqkIfv5jd5780A89duXhHz93/sJVhOc3h2/biauXws7qVHttfQHY3BJjvLBZt+/CKjwW2vahuMFdQDyIwP0N8GQLvDsCj4WIO9PtRqANQNP/QXO/CLaI/V6LHJjIsGXuZR4le12HVqnsWJolSjoKb9fLUPCm1su9zKNkz+ssyGJ/MUFJhzG15+UkW50LCGeBcMKEpAs4HiSzc46XdchzhnnmIHyp8+j6/RrbZw7CMwfHW1Qv87PvK3NwPMN27Zy5UTQSHcpbVI955jD2s85JBetu4zD0g4rqW1SPeeZgvOrgOPPiAapovZ2Vg+Mtqsc8cyj0qqPI+v1VdRvW2zkx11tUjx3rkehgnjkG6zEH7unzmjk4nmG7dk4wn7lRbIWdPViXORBv5wQ7znD6DNYtdRDeOHqcFapb6u2cUL5jEKuu9XZWDsIzp2Bd5jDD2zmhPCPrDj5YiQC6X2IfEBHbiNDg86dOnvjdX7r91v/fd/6d+n9UrlQS9cOVSqVSqVQWEuNHV/jZrwU8eVsT9/7n/We+ev2egzvOvfjk55++L5zev7a6fHjXerN5y6qJF2PA2c0m3toAhxG4By32IuL7EdFEIISIGIETg9//MgfyRXSvSNbjZQmvszTzKNnL3wjknoqMpVmipMOY2pvI3Te1XoaCXFGy53UWZL0Wec9U7uHtzsya3QarixE4Q0KiqMNMz5yAnjfMQXjr7JxQnpF1o5kHzPHMwfEW1rP3MycXo7CDeeY8bN/OiTnfnGPO4nVYxhzGnp6PGPdcVNd6Oycm/CBW3RzVmeNnOhZRWLHUQXjmLF6HZcxB+FKnyLqDNXYbpQ7CM2dRnc6P4pEQDo63qF6hp89r5uB4hu3aOcG8vY+jKwblLarHvHV2Nm4Qs66CdZmD8MyBe3qsFarLvHV2TijfMfkYbuOwwFtUj3nmYHxJZwrSHX7AEhA3L8vdEzt/8MJbzv/BO3/micsvtyqVSv1wpVKpVCqVm0D6fTCP/eHbT935B564HD/2wN5n97507rYT5zcvtM/etb+Kd202WK1jewFx80C7iZeaJrSbdXwbEO8DcA0Bd0XgRABOx4gXQ8AZ++cA/AtjJC2ynm1yL0NBrijZyzqj+khkeBluQO7h7XpZh/umdmk2xdTuNjnJekWyESUdhre3ILshP73CHBb4DHm+MM8ciLdzQnlG1u2vsn3mIDxzcLyF9YybfV+Zg+MZtmtn4wYx68LxFtVjnjmM/axzUqG61ts5wfzcx9DCesyh0KsOjjMvHqCKJX/WXG9RPeaZwwxvZ4+s219V+9bbOTHXW1ivc6NoJDqYZ46heswbN/s5rTyDdUsdZj6GzDFYjzkQb+eEek5TKbBdOyfmeOPksWaobqm3c0L5jL6iutbbOTHHM8dgPeYgfKmD4xmm+/KxDghtPP5wBcDubvjbh234A+975OifZPVKpVI/XKlUKpVK5etL/Nh9J/Bm4Bcfjwfn8DxCc/2h0/urZ1+4dvSOvb3mYH09nkfT3rnZxA+FiBibeEcDXG43eFto8Fjb4kEATTh+TV8D2Bncfn8h8LKE11maTTG1m+W0SmXH0ixR0mF4e17W4b6xXZpNMbXr5V4GnveKZAOmcg9vd0Emf3qF9ZnDTM8cQZ4vc3yJs/MUWT+aecAczxwcb1G9zo/iXIzCDuaZ87B9OyfmfHOOOYbqMc8cxj4SB+UUqmu9nRPMZ24Qsy6D9ZhL2MzOjmNawsqlDsIzx1A95pmD8KVOkXUHa+w2tnFwfI7qdH7yPmKBt6ge88TNeq1hTsG6pQ5D318t6LqoHvMz3SgaCQfbtXOCeeYw9vI4K1ifORBv54TyHYNYda23s3JY4C2qxzxzIN7OynmYfjrWoQ2IbSdWeHYF/Jmzp079l/d++oVnhhuVSqV+uFKpVCqVyqucJ3/k9Lte+tTFL+59w9Nvbo6Orm1W8RsDVuujuP7GnRarNXA2bLBpY/ttaHAVGzzQvcKfiAHXY8Sp7sOXMSVfgHsdL0NBrijZ6zq0SmXH0ixR0mF4e17W4b6xXZpNMbXr5V4Gncf+wmEq9/B2vQw6X50LaM4B2M8Koks9c1jgM+j5whxmeDsnlGeYbiQOykF45hJellCdzPdXbdfOibmewbqOG0Uj0aF8Duswh3JPz0mMey6qa72dE8xnbhCzLoP1mMMMb+fEnA9YVDH3qgORMcdgPeYw05c6RdYdrKnbKHms5noL66njTKXwzClYlzmYx7CgM0B5BuuWOrzsR/FICMdgPeYSeaZ67FiPxAS2b+fEHE+cPN4M1WXeOjsnlM/oK6prvZ0TczxzDNZjDjO8nZXzsP2I428VbwJijECMm9Dgy0dx78Mf/PLVR027UqnUD1cqlUqlUnlt8qv/zv377/gTn7ve/tjFMy8crnfiDs5ffrbdW+21dx4ert/VxPbutsXeOsZvWEWsNm28KwC3x4BTOP4C4CRAvqBmeJ2l2RRTuyYfjDN3B3gZCnIPb9fLOtw3tUuzKUp2vc6CLPYXE5R0FN7ukmynwc6FiHA+K7AucxCeOTjeIM+XOX4b59H1Y3Z9xBzPHBxvUb38fho3oNTB8Yq8r3ZL7yccb1G9OZ640Xlp5ylU33o7J5g3rh9Zl6F6zDMH4u2cORZRWHEbB8dbVI955lDoVUeR9fur6jaYL3VwvEX1Sr/pzlzCyxKqwzxxo+c0eA9wPIN1Sx2Gvr9a0HVhPeYgvHBMcymwXTvn2MzOOflj6PUYrM8ciLdzQvmOQay61ts5Mcczx2A95jDD2zmhPMN2W6CJwKbts/WJM6e/9x0/9N2fDN/3ie4fCatUKjn1w5VKpVKpVF6HfOmH7zkAgLPAwfWrz9x7pVnftb/bXLq6jru7aN+62cS3ReA2tPFNCFjFiLMA2gDcCmADYNXfmP2iO8fLUJArSva6Dq1S2bE0S5R0FN6ul6Hgja2Xe5lHyZ7XWZDF/mKCkg7D2/My+PnqdEBzFsCprqS6zDOHBd5AzxnmUOhLOlOYbiQOymGmZ46hepnvr9qunRNzPYN1hWOaS8fnsA5zKPf0fMS456K61ts5wXzmBjHrMliPOczwdk6oY81QRevtnJjrc1iHOcz0pU6RdQdr6jast7NycLyF9dRxplJ45hiqV+Dlcxpk384l5Dtqf8IP4onuJKpX4ic6o3gkHGzXzok5njj3eFtUl3nr7JxQPqOvqK71dk4wzxwcb1G9Od46OyeUZ5huwPE/BxY3x38RhQa/dMfJC9996bf/20+EH/qhdtiuVCqoH65UKpVKpfLGIcYYAODyH77t9lO/45tf+NJP/K0PXrrzli8+8+Tz72jj+l607Ts2m3hPjPEDEbgG4F0h4kqMuICAwwAcxIgYgvn6wfsC3ss8Svayzqg+EhlehhuQe3i7XoaCN7Ve7mUeJXteZ0EW+4sJSjqMqT0v97JV99MrF7oS6zIH4ZmD4w3yfGGeOQhf6jzyh8jbtZmdc1jGHEP1Mt9fZV3mIDxzHnlf7eaPp3EjlLeo3hxPHD0vmfNgfevsrBzGvh9V36J6zDMH4u2cUN90V9iynec4ON6ienM8czBedRRZf7DKbsc6OyfmeovqsWM9Eh1zfQ7rMAfuZz2nlWewLnMQvnOjaCSEY6ge8zMc01wKWLfUoczT46xQ3VJv54TyGX1FdZkvdVjgc1iHuQTLrLNzQnlG1g1tQAgBmzYC7fHJuTqx/29c+653/4UP/elPHeVrlUrlZeqHK5VKpVKpvIGJH//oKnzfJzbxr37wJH7jW69/9Yf/1l13nW+e+9LjV99+4txq/9rz135Ts1r9Ynu0+bUR7bvaFvc3Ac9G4MEIXA3AgfsFvJd5lOxlnVF9JDKWZomSDmNqbyJ339h6GQpyRcme11mYxf7CYSr38HaXZvanV1iXOcz0zAnoOcMcCn1JZ4qs219l+8xhpmeOoXqdH8S2a+fEXM+wXTsnxOlGJXMK27VzDsuMo+cjxj0X1bXezokJP4hV16J6zDMH4u2cUMeaoYrW2znBPHMK27VzYo4vdQrT7Ud2G6UOwjPHYL3OjaKREA6Ot6hegZfPaZTtT5J31V6B768WdF1Uj/mZbhSNhIPt2jkxxxPnHm+L6jJf6uB4Fo0EcXZOMM8cHG9RPeaZg/ClzqN7bWliwGYDhO5gNzvNn2pC+KPv+cLhZ+1KpVJ5mfrhSqVSqVQqFZf2p77loPnt/+Dq43/o1DesdzfPtYfxX1hH7MVN+64G8e2xjXc3ITzVIr4nRpxDxH44/gpjNfuL+0TJXtYZ1UfC4OVehoLcw9v1sg73je3SbIqp3W1ykvWKZCNKOgxvb2mG9LtXgHC+1V3mmYPwzBHkucI8cxC+1Hl0/X5N7Vtv5xyWMcdQvcy797XUwfEM27Vzwj6eoyFDeYvqMc8cuKfnJXMerF/i7Jwz5zG0qB7zzIF4OydeqQ9XmIPjLarHPHOY4e3skXUHa+o2cl/SyVHeonrsWI9Ex1yfozrMEzfrOa08g3VLHYZ+UGF95hiqV+InOqN4JBxYt9Sh3NNjrWBd5hIzHiuPvqK61ts5Mcczp2Bd5lDoVQcTWU7XCyEgbIB1e/zhStM0Px9C82NH50781Pv/t+efs2uVSuVl6ocrlUqlUqlUZtP+9DvP4KmnEM42p556uD334vrye3cQL8VNexuAi5sQ71xFHKw38X0BSP9f/uOfdCll6k1BltMqlR1Ls0RJh+HteVmH+8Z2aTbF1K6Xexl43iuSjSjpMLy9pVlHcxCwOgfgNCkTBcz0zAno+cIcCr3qYCLLyXrRzAPmeObgeIvqdX4UW2HnBPPMKWzXzgn2TViIPnMK1mUOZZ6ej3B2GaprvZ0TE34Qq65F9ZhnDsTb2TgWj2ClUgfhmVPYrp1zVMa8dXb2UI8hu41SB+GZY6gee16PRAfzzDFUj3niZj2vmfPI+96uyjrfx6qHiSyhOsyXOhz7UTQSE9i+nZVDuZfHmqG6zG/jMkbxSMxwEJ45OD5HdZhnDsKXOo8WaND0/xxYAK5EhJ+9eOrgd97zmReftvVKpTKkfrhSqVQqlUplK2L86CqET2zij35w97O/9Hxz8r6nb7t6FTh34vqDl6+vsYrhLoR419G6fWAHOLNB/NYYEQKwd/zlPM7Y2wQK3xh0HVqlsmNplijpMLw9L+tw39guzaaY2vVyL4POY38xQUmH4e15Gabz2DTYOw/gFvE7P9k+c1jgM+S5wjxzIN7OCeUZWbe/qvaZZw4LfA7rGDcYbd/OysHxDNZ13CgaCeEYqsc8cxj7WeekQnWZL3UQj6HqWliPOczwdk6wb8IqVNF6OyeYZ46heswzhxnezh5Zd7CmbiP3qgORMcdgvc6NopHoYJ45Besyh7Gf9bxmTsG6pQ5DP6iwPnMK1mUOxqsOjrNRPBITlPxZczxx8lgzVLfU21k5Q19RXevtnJjjmVOwLnOY4e2cUN4Q4/EvsW/XL/9zYAC+eBia3/qNXzr6x8N2pVJh1A9XKpVKpVKp3FQe+8O3n7rjrv29X/rCi6fvOoFzl69dfW9cYQdte2G9br+tAc60bbw3BNyKiDMRQAjYm3xTYPJRfSQylmaJkg7D2/OyDveNrZehIFeU7HmdBVmvRd4zlXt4u0uzjp395vgX29ufXlG7czxzBHmuzPGlDo5ndN2YXR8xxzMHx1tUL7+fxMs5wTxzCtu1c4J9Yw6izxxD9eZ44+Q5iXHXhXWts3OCeXs/R1cmUL053jo7Jzqv4gGqZL2dE8wzx1C9OZ45EG9nj6w7WGO3sY2D4y2qdyOe18rnqE6hl89r5pnzsH07J5jP3CBmXTg+R3WYn+lG0Ug4sC5zEJ45mMdQdRSqz/w2zjCosP42Dgu8hfWYg/DbOEGIATEGxPRL7IENQviZh37X+jeEH4L4fwpVKpWc+uFKpVKpVCqVV5z48Y+u8FHg+T/6989dO3z27uuHR29tAt68jjgVY/vugPjOuMFdETgXAk7Lf1Kse/NA30NQ2eFluAG5h7frZR3uG9ylmUfJntdZkMX+YoKSDsPb8zKU5XHVYPc8ENhPr7B95rDAG+i5whyE38YpTDcS18M8c1jgLbbH7icb7F5irmewruNG0Uh0KJ+jOswzh7Gn5yPGPRfVZb7UYcFjaLE9O+ewzDo7J9Q33BmqaL2dE3N9juowzxyEL3WKrDtYU7dhvZ0Tc30O63RuFI1EB/PMKViXOYz9rOc1cx62b2flMPSDCuszx1C9Um/nhHpeUynIu2pvjidOHmuG6pZ6OyeU7xjEqmu9nRPMMwfH56jOHF/q4PicCDRtgxgj2uMPVgAAZy6c/Ja3vPN7fj584hObQb9SqVDqhyuVSqVSqVReFcT40RX+9N/df/iJl9509gzOX37+2ptDs1odrdvbA9p/Lsb4VgTcGo7/GbETAPbzNw6j9xAjkeFluAG5h7frZR3um9ulmUfJntdZkMX+YoKSDmNqz8u9LBGBZvf4p1eac2ZB7TPPHByfIc+TOX4b59H1+zW2zxyEZw6Ot6he5m/6fVXYvp0zN4hYD463qN4cT9zs85Khurkv6QjXj6zLUD3mmYPwwjFNUUXr7awcHG9RvTmeOQjPnKLrjlZGgjg7KwfHW1SPHeuR6JjrLazHHMaePqeZg+MZrMschM/cIGZdOD7H69jMzgWu6H4yWJc5CM8cxp4eaw/WZw7Gl3QEfcXr2szOymGBt6ge88yBeDsnlM+JAWENtNnBPTi595tWp0/83Ns+9ezzg26lUpHUD1cqlUqlUqm8aok/+sGT+P6fv/7oHzzz9t1TJzbXnr78YLMX9zabzYObGD+INn4IwJOIuCMCZxCw+/Ly4KaGLM0SJR2Ft+tlKHhj6+Ve5lGy53W8DDqP/YXDVO7h7XoZyvKwatCcBprbzE+vsF3msMAb6PnCHGZ4OyunMN1IHJTDTM+cgnUzN4jzge1hgWewrnBMc+l4C+sxB+GJm3VOMlTXejsnCnx/VXUZtmvnHJZZZ+eEOtYMVbTezom53sJ6zEF45kC8nT2y7mBN3Yb1dk4wz5zCdrvZakBI5uD4HNUp9PQ5jXGvR3mG7do5wXzmBvFE10X1Sr2dE+x5PRIT2L6dE3O8cfJYM1SX+VIHx3cMYtW13s6JOZ45i9dRGfPW2Vk5QwgBYROw3sT+d62s9po/tb+7+2fe/pkr9XetVCozqB+uVCqVSqVSeU0Q40dXIXxi89Qfv//sM5/D9VvvfeqOy7s7e+sXX/rQTtve3sZ4cd3G+2OM3xkiDgDsd//jeG88vAwFuYe362Ud7pvbpdkUU7vb5CTrFclGlHQY3t7SLNF16E+vqH3mmYPjM+R5wjxzEL7UediHg+0zl7CZnXO8LKE69n4a18MchGfOw/btnJjzzTnlc1SHeebAPT0vmfNgfevsnGMzM/ej7SlUj3nmILxwTEtYeRsHx+eozhzPHIi38xRdf7CmbsN6OysHx1tUb5v7mVDeonrMEzd6Xts5x8sstmvnBPPG9SPrwvEW1mMOxNs5wZ7XIzGB7dtZOZT70XGegvWZA/F2TijfMYhV13o7KwfHYyJLsA5zmOHtnFC+I8SAEBpsDrt/+avBw3t7qz926uJtf+bef/CVq7ZfqVQ09cOVSqVSqVQqr1li/FgDAPHjf3MfL3525yuPXP4ADsKVo8tH37S3Fy6tj+KdLeKDAN4N4CwiriPg5PGyvbUML0uUdBjenpd1uG9ul2ZTTO1uk5OsVyQbUdJheHtLs0TXCasGqzNAuNT99IraneOZE9BzhTnM8HZOKM/ouv0K22UOMz1zDNWz99N4OSuX8DJL3lV7pfdTOQXrModyP+ucVLC+dXZOFPj+quoyWJc5FHrVwXHmxQNY0To7J5hnTsG6zEF45kC8nT1Mtx/VbVhv5wTzzClYVx1nKoVnzqI6hZ4+pzHuSedh+3ZOTPhBPNGdhPWYA/F2TrBjPRIT2L6dE3O8cfJYK1SfeevsnFA+o6+orvV2TjDPHBxvUb05fhvXExBaoG2Rfok9dvabP9Rc3/mT7/7y1Udtu1Kp+NQPVyqVSqVSqbwu+Wf/5TvPvOub/pWrX/7bf+hfbFar9vq6fdNq1T4QY3xH28a7A3BXDDgZWxyF9IFLwn1D0lHSYXh7Xtbhvrldmk0xtbtNLrLYX0xQ0mFM7Xm5l2GYN6sG4UKL5sI4G8A8c3C8QZ4rzDMH4u2snEfWj2YewDxzWOBzVMfeT+N6Sh0cz2Bd5nDsR9FIdCifozrMMwfu6TnJnAfrb+Pwsh/FI0FQHeaZA/F2TrDjrFBF5ksdHJ+jOswzhxnezlNk/f6qug3r7ZyY63NUp/ODeKI7QnkL6zEH7mc9r5Vn2K6dlcPQTz6GzClYlzkILxzTXAps186JOd44epwVqlvq7ZxQPqOvqC7zpQ4LfI7qzPHbOBz7Bg3iJh7/rpUIrHbDXwlt8+Pv+eLhX7H1SqUyTf1wpVKpVCqVyhuGL/ynZ9556uSJzeWrz7/n1P5q59rR+r2xjfdv2vgBBJxExFlEnAKwY3dHqDctU0ztTeTum1svQ0GuKNnzOguyXou8Zyr38HaXZomsEw4Cdu5R3z2ZuD2b2dmBnivMYYa3c0J5RteN2XUKy5iD8MwxVC/zg4rt2zkx1zPyrtrLH0/iJ52CdZlDuafnJMY9F9a9ga4fWZehenO8dXbOcf4qGaGKuS/peE7Busxhpi91iq47WhkJ4uycYJ45huqp48wkc3C8RfUK/KznNHMetm/nxIQfxBPdSVSP+Zmu6H4qbN/OCeaZA/fyeDNUl/ltXMYoHokO6+2sHBb4HNVhnjkIX+oAhAjETUDsDmYDPB/R/Nc4d/KPPPSLzz9r+5VKZZr64UqlUqlUKpU3JI/8oXsv3HstXP3q9WfuPTi/s/vC1avvjWjvQdu+AxFvi218EBEnEbAPYGX31ZuWIrxdL+tw39wuzTxK9rzOgiz2FxOUdBjenpdhWd5cCGguRITGJrwPLPAGeZ4wzxyML+lMYbqRuB7mmcMCn+N1umxQsX07J5hnTsG6jhtFI9GhvEX1mGcOQz/rfFSoLvOlDgsewxzVYZ45EG/nhPqGO0MVmS91cLxF9ay3cw7LrLOzh+n2o7oN6+2cmOstrNe5UTQSwiW8LME6zIF7+txmDo5nsG6pww18DBOqU+rtnFDPayoFrFvqUO7psVaoLvPW2TmhfEZfUV3r7ZyY45lTsC5zmOHtnLA+AE3boG0jYvfPgSHg7+zvH/y2d/3qS0+ZdqVSKaR+uFKpVCqVSuUNT4wfXQHAL/4X//DsmWvPx3Zvfe8p4NLVw8Nvb9p4RxtDG2P74TbibgBnAwBE8oFLKfbNTo6XdbhvbpdmHiV7XmdBFvuLCUo6Cm93aZYwnXAiYHVnRFBnjbpN6+0skOfIHF/q4HhG1+1X1O4czxwcn6M6mR9UbN/OCeaZ87B9O2eORSNpZ4XqzfHEzT4vGaprvZ0TzGduELOuRXXm+JmORRRWtM7OOTazs0L15njmIDxzCvUYjsSWDo7PUZ0533BnDo63qB7zxNHnNXNwvCLvq13mjetH1oXjLarHfKnDsR9FIzFByWMFktk5xz6OXteiusxv4wyDCuuXOgjPHByf43VYxhyItzNzAQhtA6R/DgxACHgkAr/7vY9s/oZpVyqVGdQPVyqVSqVSqVQI6QOXr/3gLx+sDx675drzV+9brdrvAOItm9i+PwCn4gbvBRARsGf3XewbnhwvQ8EbWy/3simmdr3cy6Dz2F84TOUe3q6XYVkezgXsnI/ArglIF1jgDfJcYZ45EG/nhPKMrBvNPIB55rDAW1jP3k86kDnBPHMK1hWOaS4db1E95pkDeQxZjzmF17WZnZXDy34Uj4SA9ZjDDG/nzLGIworW2Tkx11tUj3nmUOhVh2G6g5HdjnV2Tsz1Ftbr3CgaiQ7mmWOoHvP2MWQdjHs9yjNYt9Rh5mPInMJ27ZyTZ6o3534qbNfOiTmeOHm8Gapb6u2cUL5jEKuu9XZWDgu8hfWYwwxv50TyEWhCwHoNhHQQA15cRfx1hP3/84OPXHk8X6tUKvOoH65UKpVKpVKpFBI/9sDe10598ZZ2s3vi6Or1D7exfQvQvrXd4FyM8TtDxLUYcGeMaEMA+wegjlFvgjCRdbhvbr0MBbmiZM/rzMx6RbIRJR2Gt7c0S5BO2AvYuRXASRISBQjPHIGeJ8wlbGbnOc4j60czD5jjmYPjLaxn7ycdyJxgnjkP27dzYs4HLMxZVGeOJ272OclQfevtnGA+c4OYdS2qwzxzEN5xLKKwYqmD8MwxWI85CM8chGdOkXUHa+w2tnFwfI7Xsc/rie4I5hiqxzxx9HkN3qXOw/btrByGfvJxZI6heszPdKNoJBxYlzkIzxzGXh5rhte1mZ3nOMOgwvrbOCzwFtVjnjkI77gQAtAGxO6fA4tAGyIuN5vd93zDo9e+bNcqlco86ocrlUqlUqlUKguJH3tg7/kTXz115XDz0OEa6xAPv6lF++7Yxm8JAdfaFt8YI66EgJPDxcE0xMs63De3S7Mppna3yUUW+4sJSjoMb29plhCd1ZmA5jyAfVNgfebgeAM9T5jDDG/nhPKMrBvN3MMcZnrmFKxrXD/arp0Tcz3Ddu2csN+E7RxFeQvrMYdyT89JjHsuqpv7kk5O5vurqstgXeYww9s5wY61ghW3cXC8hfWYw0xf6hRZd7CmbiP3JR3PKVhXHWcqhWdOwbrMwTyGqgOxz5zH0scf5n6OrhiUt6heqbdzgh3vkZjA9u2sHMq9e7wtqlvq7ZxQPqOvqK71dk7M8cwpWJc5zPB2TrQAcPz/+Nqsj0sRiOfPHHz0vt/7zr8afuBTR3alUqnMo364UqlUKpVKpXIDiDGGp3/w4pmLp1Ynv3r58h3xqH0o7rSX2nV8+wbtuxDx7QCeAnBrbBFDEF+HqTdHGe6b26XZFFO72+Qii/3FBCUdxtSel3sZdB72GqzORYQzEYOfbWJ95uB4Az1PmEuwzDo7K+eR9aOZB8zxzMHxFtXr/CC2XTsnmGfOw/btnJjzjTnlLazHXMJmdsaCc5LB+qUOwmduELMuQ/WYZw7E2zlzLKKw4jYOjreoHvPMQfhSp8i6/VW1z3ypg+MtqncjntfK56gO88TNel4rz2Bd5iB85gYx68LxFtZjDsTbOXOjaCQmsH07J5hnDmNPj7UH6zMH4u2cUL5jEKsu89bZOUdlyueoDvPMJfJM9WL3u1bWAW1EfgD/0e13XvxNt3/P734y/NAPtcOlSqUyF/6mvlKpVCqVSqWyNfFHP3jys0/9yqmDuHnb4XVcQrv+ribGCxvEb8UGCAHviBHXQ8D+cHEwjZh8c+vlXuZRsud1vAw87xXJBkzlHt7u0iwhOs1BQHMOCKezAusyB8cb6HnCHGZ4OyeUZ3TdwQrbZw4zvJ0Vqmd8P9q+nRNzPcN27Zy4Ed+EtbAecyj39JzEuOeiutbbWblEl/UVr5ujett6OyfYsVaoovV2TjDPHIP1mMNMX+oUXXe0MhId1ts5wTxzDNZTx5lK4ZljqF6hn/28Vp6Rd9We8ng56ysFXRfVKfV2TrDjPRIT2L6dE3M8cfJ4M1SXeevsnFA+o6+orvV2TszxzDFUb46f4QIC4gaI7cuF/RN7/9L6vW/56w9+4tOHg36lUllE/XClUqlUKpVK5RUgxo+vgI+2T/3grXcCV/DCZv1duxEPrjftrwFwLkbcHQL2I3CavkEyuG9ul2YeJXteZ0EW+4sJSjqMqT0v9zL4edhpsDoNhAstsOok6zMHxxvkOcI8cyDezgnlGVk3mnkA88xhgbeoXucHMetaZ+ccL7PYrp0Tc74xp7xF9ZhnDmM/65xUsO42DkM/qKi+RfWYZw7GT3RUPMAr2czOysHxFtWb45kD8Xb2yLqDNXYb1tk5MddbVO9GPK+Vt6ge88bR5zVzcDyDdZmD8JkbxKwLx1tYjzkIb103Ww0oKbBdOyuHck+PtQfrMwfi7ZxQPqOvqC7zpQ4LvEX1mGcOxJs5AggRwDogZgduZ7X6Ty5tdn78ti9deWywUKlUFlM/XKlUKpVKpVL5OvHMHz5/36Mv3fXY6fYL37jX4C2Hh+uPtBH3xhgfDMdvjG61Own3De7SzKNkz+ssyHot8p6p3MPbXZolnE6z16A5FxHOdSXVZZ45w+zzgzkQb+eE8oys219l+8xhpmfOojrsfjIxCjvmeobt2jnBvgkL0WeOoXrMM4exl+el8gzVtd7OiQk/iFXXwnrMQfhSh2OvohGqaL2dE8wzp7BdO+ewjDkQb2cP0+1HdhulDsIzx1A9dqxHIsNmdlaoXqGf9bxmzsP27ZyY8IN4ouuiOsyXOsy8nwrbt3NijidOHm+G6jJvnZ1zvMzGqmu9nZVLsIw5hurN8RMuIACb4+OVfmpl1YT/18HO6s++7XPXf+blZqVS2Zb64UqlUqlUKpXKq4D2x955Jrztjqtf+Zv/6INnzu2tX3zx6ofXbfuNbRt/XdPgStviAgLOpr775nZpNsXU7ja5yGJ/MUFJh+HteRm2z3cOGuCOFiH/3Ss5al95gzxHmGcOxNs5obyi67vHl3nmsMBbVC+/n8YNKHVwPMN27Wzc5P2E4y2qxzxz4J6el8x5sL51dk4wP/cxtKge88yBeDsn2DfcFarIvHV2TihvUT3mmcMMb+cpuv5gTd2G9XZOMM8cQ/XYsR6JjrnewnrMYezpcxrjXo/yDNu1c4L5zA3iie4krMsciLdzgh1rOH0G65Y6lHt5vBmqy7x1dk4onzGosP42Dgu8hfWYwww/mANWbcCmjf0HKyHgS81u8xeeu+3sf/HP/b2nX8zblUplO+qHK5VKpVKpVCqvMtp/53v2w4+cWT/7f/+ZezYHq4NrL7z0be1h+/YN4t2I8Z+PwH6MOG/3euwbLstUrijZ8zozs16RbERJh+HtLc0SXicCzW6D1VkAt7S6yzxzAvpNEOYgvHV2TijPyLrRzAPmeObgeAvr2fuZk4tR2ME8cx62b+fEnG/MMadgXeYgvHH0fMS456K61ts5wby9n6MrE6jeHG+dnROdV/EAVip1EJ45Besyh5m+1CnYY8j2Sx2EZ46hejfiea28hfWYw9jPel4z52H7dk4U+P5qQddF9Zif6UbRSDjYrp0Tczxx8ngzVJf5UgfHZ/QV1bXezgnmmYPjLao3xwsXATQIaI8wOFg7O82fPNw0P/z+R65/cbBTqVS2pn64UqlUKpVKpfIqJn78oysAeP6X//6565dWey889vhv3F/hxPqwfXds248gYBOB+2NEE9LXduwNV8LLppja3SYXWewvJijpMLw9L8OWeZc1uys0d20QVgDYT7Co21A+Q34DhHnmQLydE8ozsm5/le0zB+GZg+MtrGfc7PvKHBzPYF3HjaKR6FA+R3WYZw5jP+ucVKgu86UO4jFUXQvrMYcZ3s4J9Q13hioyX+rg+BzVYZ45zPB29si6gzV1G9bbOTHXW2xP3U8qZjgF6zIH7ulzmzk4nsG6pQ4v+1E8EsJZvA7LrLNzYs79VLBuqUO5p8daobql3s4J5TsGseoyX+qwwOeozra+BYCApg1o48s/tdI04ad3Q/OX3vXw4SfMRqVSuQHUD1cqlUqlUqlUXkPE+LHml3/wEzsXTz+9e/Xx67di99q3hGbzreuj9oMNwjqG+B0x4loATthdgLwRm0PJrtdZkMX+YoKSjsLbXZolvE6XNacDVrdGYMcWxD5zBPkNkDm+xNl5iqwfzTxgjmcOjreoXudHsRV2Vg6OZ9iunRPqG+5MMsdQvTmeuNnnJYN1rbNzgnnj+pF1Gao3x1tn50TnVTxAlay3c4J55hiqN8czB+GZU6jHcCSIs7NycLxF9W7E81p5i+oxT9ys5zVzHnlf7TJvXD+yLhxvUT3mSx2O/SgaiQls384J5pkD9/J4M1SXeevsrJxhVBmJjtyXdHKYZ46heswzl7BZBEIMaI8GweNNaD4RTh384IOffuGZPKhUKjeG+uFKpVKpVCqVymuc+Mlv3/mnP/1PT9966vpvOmo3727b+AAQzyPi1wJ4CsCtw4XBNI+pXS/3MvC8VyQbMJV7eLtLs4TXybLduwOwH8c/vaL2lc+g3/xgDo6HyVRPeYbpRuJ6mGcOC3yO6mS+v2q7dk7M9QzWFY5pLh2f43VsZuec/DFUPeUZqst8qcPLfhSPBEF15njr7JxQx5qhitbbOTHXW1iPOQjPXCLPvJ7FdPtR3Yb1dk7M9RbW69woGokO5plT2K6dc7Js9vNaeQbrljqY+ym86xSsyxyMVx0cZzSmUlDyZ83xxMnjzVDdUm/nhPIZfUV1rbdzYo5nTsG6zKHMH39zN6BdB2DT9n5nJ/x3Z06c/IF76wcrlcpNo364UqlUKpVKpfI64uF//b4TX7nzuYM3r669H8DbDo82/3JosLfZxAcB7ATgFvkmbYqSPa+zIIv9xQQlHcbUnpd7GWbmJwNWF4FmP5NqX3mD/AbIHL+N8+j6Mbs+Yo5nDo63qF5+P40bwByEZ87D9u2cuVE0EsIxVG+OJ46el8x5sL51ds6xmZkHo+0yVId55iC8cExLWHkbB8fnqM4czxyEZ07RdUcrI7Glg+NzVGfb+wnHW1SPeeLo8xq8S52H7ds5wXzmBjHrwvE5Xsdmdi5wRfeTwbrMQXjmwL083gzVZX4blzGKR2KGg/DMwfEW1WOeORgfA0Ib0W5e9rEJP7PT4P/64BfWfzdrViqVG0z9cKVSqVQqlUrldcpjP/nQqTv+tXde+8J/+Nc+uLeDNx1tjv6lNuJ8iPEbY8ReBE4FYNfuSdSbuxyvszCL/YXDVO7h7S7NEl4nyyKA3dsCcCoe//4V0hmgvIF+A4Q5FPqSzhSmG4mDcpjpmWOoXuYHlZLHBCJjTsG6wjHNpeMtrMccynw0cw9zCtW13s6JAt9fVV0G6zKHQq86OM68eAArWmfnxFxvYT3mMNOXOkXWHayx27DOzom53sJ66jhTKTxzCtZlDmNPX2sw7kmnYN1Sh6HvrxZ0XVSv1Ns5Mfd4M2zXzok5njh5vBmqW+rtnFC+YxCrrvV2Vi7BMuYYqrfQN21A2+L496xEAAFf2Nlp/uJqtf8j7/rVl56ya5VK5cZRP1ypVCqVSqVSeQMQf/T7d/H9z7ZP/Cd/7RtXB83JF68efbBdt98c2vjuGHAHIvYAnLZ7I9Sbu8Q2uchifzFBSYcxteflXobyPAIIJwJ2zwM4nS2xfeYI8psfzDMH4UudR/bfPbximOOZg+NzVCfz7n1lDsIz52H7dk6wb8yNRIfyOaozxxNHz0vmPFi/1EH4zA1i1rWoDvPMQXjhmJaw8jYOjs/xOixjDsJbZ+cpsn5/Vd0G86UOjreoHjveI9HBPHMM1WOeuFnPa+UZrMschM/cIGZdON6iesxbZ+dE50fxSDjYrp0TW3h6rD1YnzkIX+oMgwrrb+OwwFtUj3nmEi2wCg3aNdDGCMSI0OI5rMKn2mb/f/++L1z+ml2pVCo3lvrhSqVSqVQqlcobjPij378LfApf/Pyv3H/qAJcuXzv84KZtPxQCTsY2/gYARwBO2j1g4g1ewuvMzHpFshElHYa3tzRLeB2TRQA75xuEcy1C+nkits+cgH4ThDnM8HZWTpF1+6tsnznM9MwxVI/d19FA5sRcz8i7aq/zo3gkhFOwLnMo9/ScxLjnwrrbOAx9f1V1Laq3rbdzgn3DXaGKuS/peE7Busxhpi91iq47WhmJDuvtnGCeOQbrbXs/lWOoXqGf/bxWnmG7dk5M+EE80Z2E9ZgD8XZOzLmfCtu3c2KOJ04eb4bqlno7J5TP6Cuqa72dE3M8cwrWZQ7ahzYAG6BtXy40Df5+i+YH3vvw0S8OypVK5aZQP1ypVCqVSqVSeQMT40dXAPDFP/Czlw4Orrzn2nr91vXh5jvQ4Axi/G4ATwG4++WFfJuwTS6y2F9MUNJheHtehhuXp1rYbbBzFggXul9GqvaVN9BvgDAH4bdxHlk/mnkA88xhgc/xOl3WV1i31MHxDNZlDsd+FI1Eh/IW1mMO5X7WOalg/W0cXvajeCQEqsc8czDe6ahohCoyX+rgeIvqzfHMofCxUmT9/qp3GyV/1lxvUT12vEeiY663qB7zxI2e23bO8TKL7do5wbxx/ci6cLyF9ZiD8MIxzaWAdZmD8Mxh7EfHegrWZw7E2zmhfMcoHoktHRZ4i+oxT49BQGjD8T8Flj5cCfhCAP7qQ1/c/LvDjUqlcrOoH65UKpVKpVKpVHpi/OjqM//B/3zyrguHd16+vHnr5cPDfzOEeAktvj1GPBOAW+zOCPamMLEg67XIe6ZyD293aZbwOl2WV8L+CjuXWoT8l9tbnCghv/mxrbdzQnmG/e9mu8xhpmeOoXqZH1Rs386JuZ6Rd9WefTxzrLSzB+syh3I/+7xkqK71dk4wn7lBzLoW1ZnjSx2OvYpGqKL1dk4wzxyD9ZjDTF/qFFl3sMZuo9RBeOYUrKuONZXCM2dRnUI/63nNnIft2zkx4QfxRHcS1SvxqoPjbBSPxAS2b2flUO7l8VawPnMg3s4J5TMGFdXPfUnHwjLmGKpX4iMQ2gZxExFfPiBXAPziCvu/5cFHrjyetSuVyk2kfrhSqVQqlUqlUqHE+NFVCJ/YfPE/PvmBgPimzeHRDwBAG+OHInAqLPmnw7wMPO8VyUaUdBje3tIs4XWyLF0NTQPsR+zcbn65fY53mxnyGyDMMwfjVQcTmcX+d6td5pnDAm9Rvc4PYtu1c4J55hSs67hRNBIdyltUj3nmMPT9VdZljuH1bGZn5SDu52hwUD3mmQPxdk6wb8AqVDH3JZ0c5S2qxzxzmOHtPEXXH6yp27DezsolvCyhOtvcz4TyFtZjDtzT1xvm4HiG7do5h2XsMaSiQ/kc1mEOxNs5Mfd+Mli31KHc02PtwfrMgXg7J5TP6Cuqy3ypwwJvUT3mMxcBIAaEI+QfrADAr4ZV+B0PfWH987msVCo3l/rhSqVSqVQqlUplkhg/vgJ+OX7pP/h/fGDvRLj96vX1e7BpP9IifgAB52KLoxBw4rhstzMWZMdvIq0llHQYU3te7mUJr2PfLGesLgGrAwDp96/k2DJBfvNjji91cDyj6/Yrapd55rDA56hO5gcV27dzgnnmPGzfzgn1DXcmmbOozhxP3OzzkqG61ts5wXzmBjHrMlSPeeZAvJ0zxyIKK5Y6CM8cQ/VuhLfOzh5Zd7CmbsN6OyeYZ46hejfiea28RfUK/OzntfIM27VzosD3Vwu6LqrHfKnDsR9FIzGB7ds5MccTJ485Q3WZL3VwfMcgVl3r7ZyY45ljqN6EDzEgxIDNUfdPyAIIDb6KFr/noUc2P/3yQqVSeSWoH65UKpVKpVKpVGYRP/btJ/CDtx198T/8G+/A3ubdOFp/82bdfgTACsBDiDgEsGf3AOcNY0Lksb9wmMo9vF0vw5Z5ltlas99gdUtEOGkTUhbIb34wzxyIt3NCeYb972a7zOEGegvrGdePtmvnxFzPsF07GzeIWReOt6ge88xh7GedkwrVZd46O+d0WdFjaGE95jDD2znBvgGrUEXr7ZyY63NUh3nmMMPb2cN0+1HdhvV2Tsz1Ftbr3CgaCeESXpZgHebAPX1uMwfHM1i31OEGPoYW1mUOwgvHNJcC1i11KPP0WE/BdpgD8XZOKN8xiFWX+VKHBd6iesx350doA+L65QMRAq4g4H+Ih3v//nu/evX/z96fx1l2nuW99/WsvWvqWS3JkixZlmzJkjUYyxZ4IoAJs80ULJOJkOScxEyBMBh4c5JjzBgghpcPJ+Q1hOQ1kDdgA0nACQ42iY2NbQw2BhvZlmTNo1tSq+eq2nut5/1jr2f3Wve67mevVVUtdUvX9/M5pJ7ffa9d1bWr+rjXVnfdby8TkTNLL66IiIiIyJbFN123DAAPrz/w7M248QXTsvzSKlavGgWsVxE3x4gqBBTti1qnNmcW5/9ngT47zKLrcvPcLMnt1DO2MtobUOwFwpqZsmXCvQEypNtmz17LaexHc24Z0llDplveXt1bY7trzwnrrOXYfXtOhtyUY41he6wlbGba4K9Jhu32bXB6o7XGbJfx9ob0Ps37OHPYom32nLDOGuPtDemswemseerdziWdsM2GTG/ydnbi+9rrlrfHOmmDvrdZy7H79pws6K3xgt2FvD3WbbPnZMjHmdO8xrueddbAu/t8M95u327PidcbFn4ubbPnZKe65e2xHusXVioglo2FgEeLzaWX3Pjg+n3NdRF5cujFFRERERHZMY/++lX7jtz60Np4Ov1GhOq6yaT6QgTsB/C8+RL7A2NCZvNEZh19dpjcdVudJbkdM2sdIxCWCoz3AeG80//0Q5r1QW9+sIYB3Z4TrzON3fmb9np7bmIz1pDpFtszbfDHOrQzdteek524CWuxPdbQv9OvSXT3srxd1vs2nO6dcScQbIc1DOj2nHgfJ+Mt2W7PydBueXusswan22bPOWa3dWSPY5s9J0O7xfbq1hl1Qo111jxslzW0+5a+r3Mzy+7as9dgPk6nZxvj7fXt9pwM+X3cw3b7NvTv7nPOeLt9uz0nXm+Yr3i7rPdt2EK3vD3SQwyoNhvDCCDgWFWEr77pzumfmHUReZLoxRUREREROSPiz1x48e2PHh+PyvLloYgvjWX1TRE4gIg1AHvsPsD/MImUnVlLnx1m0XW5eW6G/nO6FoHRcoHiQAT2R4S0RJe73JsfQ7pt9uy1RZq/bu/6IZ01ZLrl7TU/TtNa+jZkOmN37TlhN+U6oeZ1y9sb0kmjX5esebxd2+05Yd20+ZHtMt4e66zB6U5j2cWWbbPnJjuzZ4+3N6SzBqez5mnsti5jj7Gdhkxvyu14zzeLrCHTm7wd1kmj39fgu7Tl2H17TlhvtNaY7SLTLW+P9b4Ns94ZdcICdt+eE9ZZA+/uc854u6z3bch0NuqEmu32nLDOGjLd8vZML5D+xgoQq9kwRpQhxnd/3r3VV7e3ReTJpBdXREREROSMe+jH9l958fTSB+44dvs3FgVegbL6ghjxMgRMAKzMF50/ZM6zM59bNM/JXbvVWZLbacw6axEIRYHRXqA4v0LrH1jrLHe5Nz5YZw2k23PidYb9mtn1rGFgZ83ydkxvHZuHntfPeZ1hu05jmcdMb/J2hnT7OWQ76O5lebu223PSo8/f9HYZtssaevYFO964xVuy3Z6Tod1ie6xhYLfNnhdp7Lcu9R6n2fvsWLlZwnZ24vuaNQ/bZQ3dPvh72+sM2+3bcLp3xp3gNMbb69vtudE6o05YoLnvXet1ZGaN7j7fHrbPGpzOGjK91hp7u6z3bdhCt9heo4UYgBgQqzj/58BiRBmAWK2Pr77pkY27T2+LyJNNL66IiIiIyJPq0BvPfzZG00uOTE/9jVGsXlpW8XIAXxQjJiFgif0hTmxXbAAAk09JREFUc57IrKPPDpO7bquzJLfTmHXWGmG0P6A4EBGW2CLn3vxgnTU4vW/Lqfdj4+0O1lnDFrrl7TX6/E22yxqczlpOcz93rb0Ru2B3IW+HddbAO/26ZC2H7W+nod3nb3q7lrfHOmtwutNYdrHl7TRkusX2WMPAbps9L9LYb13KHmc7DZlueXvs+e6E2tBueXusm0a/r9Hdm/M6Y3ftOenR52/22M3y9lgf2DqjTshgu6zB6ayBd/c5Z7xd1rfTjNZKbr858/Z2qlveXt1DDKgm7U94BI4vhfA11981ff/pC0TkqaAXV0RERETkKXP7D++7arWavLiM5ZVVWb0sxnhtjLje7sX5/1mgz44nd+1WZ0lupzHrrDVCsRIwPh/ALnanjXNvfAzpttlz4nWG/ZrZ9axhYGeN8fbq3hk3Q2dYG9oZu2vPifdlwSJrHrbLGvr3wV+XjLe7Q8/L/E1v1/L2hvS+DbPujTq8Rdvt2WvIdIvtsYaBvW/z1LudSzqhZrs9J6yzxnh73nPNImvI9CZvp2cf/H3tdcbu2nPSo8/f7LGb5e317facDHm+PXbXnpMhnTT3OWe83b7dnhOvN8xXvF3b7TkZ2rFglng7ERhVAVUsUJXV/BMegSMR8aduurv6aXuJiDz59OKKiIiIiDzlqp++Zu+t99y3e2V18sVLIVwzrcqvA3AAFS5GwG6kP3t6fwBNFs1zctfmZtjmvDGja4042h1Q7AfCGt3scG98sM4anN635dhfN7ueNTidtSQ3S7wd+3GaNte3IdMZtssaZr0z6oSa15tyO3Zmzwnp9OuStRy2v52G070z7gSHt8c6azB9wY43bskt2Zk9ew2Zbnl7QzprIN2ecxq7rcu8x2h2bwfOjDXG29uJ72uvW94e66QN+t72OsN2WYPTG601ZrvIdMvbY902e07q3hl3QgbbZQ1OZw280+fc4+2yvp3W0Bl3woAGp7OGTLecvVAFoAKqaWMhYiOE+Pthc/n7bnxw/b7mvog8NfTiioiIiIicVR74ofMuf/ZLzzty94fv+5qiwOdNy+q1MeK5MWIVwNjudzh/SO0ld+1WZ0lup57RlUYMSwXG+4BwoGpuuNybHtvt9uy1nOav2bt2SGcNmW55e82Pk3T3nAztjN2150brjDrBaR62yxr698Ffl4y32+zeDjIz9nn0dpu8nSG9b8Ose6MOb9F2e05YZ81jd+25ic1YA+n2nNPYbV3GHqNvg9NZ87Bd77mm0emsMd5ej+5+X6Pf9QvZXXv2GszH2ews2LPH2+vb7Tmpe2vs7eY0r/GuH9JJyz7nlrfbt9tzU25mx96u7facDOmseTq7YfbiyhSIMSLWn+wQcO/q5vKrXvDAqfvtFSLy1NCLKyIiIiJy1rr9+857ztre0dr60aPfGGL14grYhxi/MgIhtH+8+2mdP6D2lLtuq7Mkt2NmnVUTipUCo70RYX9nk3JvfrDOGkzvs7MI+zV717POGrbQm7ydRm+t2H179hoynWG7mdYZdULN65a3xzpr6Hb6NcnaIvYaex7S0O6tFW/f8vZYZw2k23Pi3XBnvEXb7dlryHTL22OdNQzo9rxIvd+6zHsM2+05Gdqbcjvs+e6E2tDexHZYA++Dvre9zrBd1uB00+ZHtotMt9gea3C601jm0cF2WYPTWUO30+c7h+2zBqf3bUZrxdtnnTU4nTVkumX2QhkQKqCsf4A9AKDAnaHE97/onvK/NndF5KmlF1dERERE5KwWYwwA8NkfuPjCteUT10wmkxdPJ+VXxhCfhYjPr/9Ievp/1/b9g6y16LrcPDfDsHln1f6Be1SgWA4YXVLWoT1vcm98DOl9GzKdqXdj422KzVjDFnqTt9PorRW7b88J66zl2H17TthNuU6oed1ie6zB6aQN/rpkvF3b7TlhvdFaY7bLsD3WEjuzZ6/hdPfGLWypb4PTWfOwXdYwsPdtTGOvc0knkGbPCeusMd4e+76Gs88aMt3y9nr2Qd/brOXYfXtOFvTWeMHuQt5e327PCXvOO2EBu2/PyZBOmvucM95u327Pidcb5iveru32nOxUZyIQIhBjQChnl8b04krAfQF412S6/CMvve/Ug/ZSEXnqZP4oJiIiIiJy9onxltGR7/uf+w+PT30DKlxRltU/RESIEfsRsHfQH2St3LVbnSW5ncass9YJQCgKYFfE+DwgLJOFBvfGB+uswfQ+O4uY3UgavIYd7Bbba7TWeMFutiHTGbtrz43WGXVCzeuWt8c6a+j2QV+THm/XdntOWG+01pjtMmyPNQzo9pywm68eb9F2e06G9iZvZ0hnDaTbc47ZnR+9x7DdnpOh3fL22PPdCbWh3WJ7rKHbB39ve51hu6zB6XXrjDqh5nWL7e1A64w6YQG7b8/Jdjr7ulyEXcAanN63Ga0Vtr+dhkzHgllTBEIMQBVQVRFIL6xUOBpGuGNvtfKaK+85+bC9TESeWnpxRURERETOWQ/80HmXH14dP77riSf+VlHg5ZNYfWmMeEGI2ASwYvcXyv0BeKuzJLfTmHXWOuG08UUBo7WIOLKTmR250bWdlmN/zd71QzpryPSm3E49m6+wXdbgdNZy7L49J96NLhZZY7w91llDt0fSOudF2H7fBqezj5N0l7c3pNtmz0ndvXGLt2S7PSdDe5O3M6SzBqez5vE+h50woMHprDHe3k58b3vd8vZst2cM/P/nsLZI8xrv+h59/maP3Sxvj/W+DbPeGXXCAnbfnpMhnTT3OWe8Xa/DzPruEa2xt2u7PSdDOmueOPvnwKqy/sTW18aAPxlXxXfdcM/k4/YSEXnq6cUVEREREXlauO+Ne69GwPmb6xtfEkP1FSHGvRVws93Lyv0heKuzJLfTmHXWOuG0YjVgtBcI+/wleuODNQzo9px4nbG/ZnYtaxjYWfOwXftx0gM5J0M7w3Ztq882A05kjWF7rKF/p1+T6O5lebus923IfB47gfB2hnTb7DlhN1893qLt9pwM7Za3xzprGNDtOaex27rMe4xm93bgzFhj2F7dOqNOqLHOmoftsgbe6fc3a8h0hu32bRj4eWTNw3ZZg9OdxjKPDrbbt6F/p893DttnDaTbc+L1htaKt886a3A6a8j0hhABlAUQA6qy/mdfAaDAR2KF9774rvKHmvsicvbQiysiIiIi8rQR33TdMgDceey+K0Kx+cVFVV2zOa2+NgB7ADzb7nfk/gCcm2Hn5nSNxpmlPQVwMAJLkf6Pe/fGB+usgXR7TrzONHajObcM6awh0y1vr+6tsd2154R11nLsvj0nfT7OxOuWtzekk0a/LlnLYfu22XPCumm9Po9N3g7rrMHpTmPZxZb7NjidNSu3481st+cmO7PnnMZu6zL2GNtpyHTL2/OebxZZQ6Zb3h7rpNHvbfBd2nLsvj0nC3prvGB3IW+PddvsuYk9552wgN2352RIJ819zhlvl/W+DZneMF/J7dqZPSdDOmtGUQVUUyBWjeWIR4sifKDEyhtefOeJzzX3ReTswf78JSIiIiLytPDQD+2/Yv2JdUxXyr+LEV6AMr4Ws5/NMra7c7k/BG91luR2Wn+eNjrhtGJUACtAcUGFYslOnZserGFAt+fE60y9O7/Eu3YnOmsM2zPN/XjtORnaGbbrNJZ5zPQmb4d11pLGjH5NYsH1lrdruz0nPfr8TW+XYbusoWf3djCb5cYt3mKf9zW0W2yPNQzsfZunsdu6zHsM2+05GdqbvJ26d8adUGOdNcbbY90093sb3V235dh9e/Zawj6PbJ81xtvr2+05YR8nDQvYfXv2WuLNmn3I70MJu4A1kG7Pidcb5iveLut9W+LNMj39nJVYxdaLK2EUfm+K1f/zJXccP9S6RkTOKnpxRURERESeEe754V0v3bMyWjn8xMarQlV9ZRXiiwGc31ry/vCLBTNsc25mndVOMELA6GDEaFcAzA+4d292sc4anN63eRq70ZxbWGcNW+iWt2c/VtPmWIPTWctp7nvX1r0z7gSnMd4e66yBd/p1yVoO2+/b4PRGa43ZruXtsM4anO40ll1seTsNmW55e0M6a3A6a556t3NJJ5BmzwnrrDHenvd8s8gaMt3y9lgnjX5vg+/SlmP37Tlh3bT5ke0i0y1vj/W+DbPeGXXCAnbfnhPWWQPv7nPu8fZZt82em3IzO/Z2bbfnZId6QEAsC8RJ458CA1CMwruKgJ+8/vbp+1sDETnr6MUVEREREXnGiDEGAPjsD+56aVHF66uyfFksq68PAaci8HzvD79zuXluluR2GrPOWid0haUC44MRYU93uXPjw56b7MyevYZMZ9ivl13PGgZ21hhvr+6dcTN0hrWhnbG79pywm3Fw9lnzsF3W0L93viYTrzNsdzsN7T5/09u1vL0hvW/DrHujDm/RdntOhvYmb4d11jCg23OO2Z0fvcew3Z4T1lnzsF3vuabR6ax52C5r6PbB39teZ9hu34bTvTPuBKd52C5rIN2ek6HPOcN2+zb07+5zzni7fbs9N+VmbNwJ22wY1kMMKGLAtARQxdOfyIA/CyH85vJo9deuve34o/Y6ETm76MUVEREREXlG+uSbrlt+7vHHDjy8fuyyYrT5z1DgoqqKXx2BMkSM7D7A/3A8l5sluZ3GrLPWCdxo1+wH3GN3nP8vffemB+uswel9W069P7/Mu5511uB01hhvr9GzH2vfhkxn2C5rmPXOqBNqXrfYHmtwOmn065K1HLa/nYbTvTPuBIe3xzprIN2eE/Zce7xF2+05YZ01xtsb0lkD6fa8SL3fusx7DNb7NmS65e2x57sTakO75e2xbhr93kZ3b87rHrtvz15Du7dWeuxneXus22bPTUOec4/dt+eEddbAu/u8M94u630bMr1hvpLbtTN7ToZ01ioAk4DY/uQ9MCrCu/at7PrBy289+nhzICJnJ724IiIiIiIC4LPfu/YFy4jXnppOfrQAygg8C8Ce1hL7w3GSmyW5ncass9YJXBgVGO8GcLBCqF8ecm94DOm22XNTbmbVu7HxdseQzhoy3fL2Gr21YvftORnameaud13z80n6wuZhu6yhfx/8dcl4u7bbc7Kgt8beblNuh81YA+n2nLAbrx5v0XZ7TlhnzcN2WcPA3rd56t3OJZ1Qa3ZvB86MNYbtDf04QWb27PH2evbB39teZ+yuPSc9emuF7bPGeHt9uz0nde+MO2GB5r53rdeRmZnuPu+Mt9u323Pi9Yb5Sm7Xzuw52WIPAAoExGlAVVatz10YF78UYvFzN96x8dnTVUTOZnpxRURERESk9ugvXLVv4/ET01OHH/2GMMLL4zS+ICJ+ZQTKAIzcPzAj84fpptxOY9ZZ64SMIqDYDYzPi8BS5oYH66yBdHtOvM6wX693PeusYQvd8vbq3hrbXXv2GjKdYbuZ1hl1Qs3rlrfHOmvgnX5tssbk9uzMnr2Gdm+tePuWt8c6ayDdnpMz8eLKkIZMb8rt2Jk9N3mzZvd2PI39+ZveY9huz8nQbnl77PnuhNrQbnl7rJM26Hvb6wzbZQ1Ob7TWmO0i0y1vj/WBrTPqhAy2yxqczlpiZvQ5z/H2We/bkOkN8xVv13Z7bvJmrKcWA4oyomr8mJUYgRDCfxsthd+7/jOT/3B6IiJnO724IiIiIiJCfOL7znvOBUubz9/YnLxoc1r+MwDTAFxL/8Cc5GboP6drNHLFSoHRvoiwL/o3PIb0vg2ZzthfL7uWNTidNWS65e01emvF7ttzwjprOXbfnhN2AxbOPmuWt+N1kJk9I3MjzuuMt2u7PSesN1przHYZb29It82em7znm/EWm73PTq552C5rGNj7Nk9jt3UZe4y+DU5nzcN2veeaRqezxnh7Pfvg72+vM3bXnpMFvTPuBKcx3l7fbs/J0Oecsbv2nAzppLnPOZPb9WbN7u1gwcyOvV3W+7aEzSqgCAGYArFC658Di8BtS+PRv3tsZe1tf+MTRw63rhORs5peXBERERERyYhvfemuQ5/61P6T2HxdrMJV06p6HSIuRMCS3aV/mLZyO41ZZ60T8kZrAaPzAKw5L7CwBqdvp3nMbiQNXsMOdovtNVprbHftOWGdtRy7b8+mZT/OxOuWt8c6a+h2+jWJ7l6Wt8t634bTvTPuBILtsIYB3Z4T78Yr4y3abs/J0G55e6yzhgHdnhep91uXeY9huz0nQ7vF9tjHSUNtaG9iO6yBd/r9zRoy3WP37Tnp0VsrPfazvD3WbbPnpO6dcSdksF3W4HTWwDt93j3eLut9GzK91hl3Qs12e05YZw1AqGY/wL6cVHaE8Xj8ndXG6HdvuOfkw3YmImc3vbgiIiIiItLTXd+z54WrB4q9xx5bfxVC9doQ400AzpsvOH+gnsvNzayz2gl5xahAWAGKiyqEQC7vhBrr22k59f78Mu/6IZ01ZLrF9hqtNba79pywzlqO3bfnxLvhziJrjLc3pJvm3oTzOpPbbc68Pdbtx9l5YwFvb0gf2NiIYot9G5zOGuPtsc4aBnR7zmnsti7zHsN2e05YZ43x9ureGXeC05DplrfXsw/6/mYtx+7bc9Kjz9/ssZvl7fXt9pzUvTX2dnPsNfacDOmkuc874+327faceL2h1+eT9b4N3R4AoCyAabQ/wB7FaPzde0aj377i0ycfag1E5JygF1dERERERAaIMQYAuOO71l4extXLiqr6/DLGb4gRmwE4YPc7vD+Ioz3rrHXCYmFUoNgPFHsqYGyG3uP17faceJ2xv152LWsJm7GGTLfYnmnzo92152RoZ9iu01imkTXG22OdNXS7exPO64y3y3rfhtO9M+4EB9tjDQO6PSfe8814i83u7cCZscZ4e6yzhgHdnnMau63LvMew3Z6Tod3y9tjz3Qm1od1ie6yBd/o9zhoynWG7rMHpdeuMOqHmdYvtsQanO41lHh1slzU4nbWkOfM+1hzvAta304zWSm7fzuw5Yd20IhaIk4hYtQch4M/37d/9tx9Y3vfgKz98/6nWUETOCXpxRURERERki/78tZfsuuylJy8+dXRybTnZ/McxxucBuMnutbA/hCeNGV2jcbGliwOwGoHCDLzHY902e/Zajv31etcP6awh0y1vr+6tMdtlDU5nzWN37TlhN7g6oeZ1y9sb0kkbdPPVw/b7Nji90Vpjtmt5O6yzltiZPTcaG1FssW+D01ljvL0hnTU4nTWP93nshAENTmeN8fZ24vvb65a316PT7+2EzVjLsfv2nCzorfGC3YW8vb7dnpMhz7nH7ttzMqSTln3erdyuN7PdnhOvN8xXvF3b7bnJm9W9qAKqKYDGCysRKBFRHdiz5xWX/6uv+Hh4/TsaP95eRM4lenFFRERERGSbYrxlFMI7yru/e+VvThBfFsryu2LAeagQELDSXm6d2hqzzlon9BfWAsa7AezLvYNa327PidcZ9uGw61nDwM6a5e2Y3jo2Dz2vn/M6w3adxjKPmW6xPdbQr2dvwuVmlre7Q8/L/E1vl2G7rGFAt+fEe74Zb9F2e06G9qbcDpuxhp7d2/E09luXssfZTkOmW2yvbp1RJ9RYZ83DdlkD7/R7nDVkusfu27PXEva59Pa9bnl7fbs9J973OI0OtssanM4aup0+5zne/pDetxmtFbbft8HvIQIFAuIUqMr2ExkC7i+Wl77wuhu+9v7wDr2wInIu04srIiIiIiI76N5/cfDSC/cuLT1w/+Gvjyj/ThEwqiJuni84fwgH2jO6RmM/49UC4WBEXIkI6U8B7PFYg9P7tpx6Pzbe7mCdNWyhW94ee27YLmtwOms5zf3ctexmXCfUvN7k7bDOGninN+JYy2H7fRuc3mitMdtlvD3WWYPTncayiy3bZs8J66wx3t6Qzhqczpqnsdu6jD3Gdhoy3fL2vOebRdaQ6Za3xzpp9PsbfJe2HLtvz0mPPn+zx26Wt9e323NS99bY282x19hzMqST5j7vjLfbt9tz4vWGXp9P2+05IT3U36tFGRArnP7nwCIQAz49jfi/Xnpn+bv2OhE59+jFFRERERGRHZb+Jstd37Xn2jCefPl0Wn5xVcZvDAGbCFhlfxCfO/3n7y4aB1gOWL4AiKuZd8IaSLfnxOtMY3f+JrueNQzsrDHenvcps8GevYZMZ+yuPSc7cfOVYbusoX93b8J5nfF2bbfnZEFvjb1di+2xhgHdnhPv+Wa8RdvtORnaLbbHGgb2vs3T2G1d5j2G7facDO0W26tbZ9QJNdZZ87Bd1tDtg7+/vc6w3b4NAz+PrHnYLmtwutNY5jHD7tuz1xJvZrr7vHvYPmtwet9mdFY6YUBDt4cYEKow+xsrjX8OLETcBuD395Qr/+bKe04+3LpIRM5JenFFREREROQMe/iH9z9vOp0+b31j44eKGHdPS7wwBBywe0D7D+idP8N3wkARGJ8XEPYCWHLu2LAGp/dtOfbXy65nDTvYm7wd+3GaNte3IdMZtssaZr0z6oSa1y22xxr6d/cmnNcZb9d2e/Yaun1+9PYtb4911uB0p7HsYsvbach0y9sb0lmD6d5OTn1N59JOIM2eE9ZZY7y9IR8nnM6ah+2yhm53v7/R3e2c+7DX2LPX0O6tlR77Wd4e630bZr0z6oQF7L49J9vs2eed8fb7dntOvN7QWvH2bbfnxPTRNKAs25+QKuLhcRE+dGiy/B2v1gsrIk8benFFRERERORJdPv3LH9dgXhzLOO1sYq3AJgAWJovNP6A3vkzfCcMFIEwKjA+AMT9lf+HAfZ+ttNy6v3YeLtjSGcNmW55e82Pk3T3nAztjN2152TIjTivW2yPNfTv7k04rzPeru32nCzorbG3a3l7Q3rfhln3Rh3eYrN7OyAze85hu6xhYO/bPGZ3fvQew3Z7TlhnzcN269YZdUKNddY8bJc1dPvg72+vM2y3b0O7t1bYPmseb7dP93Ywm9ExjQ6227ehf3ef9xx2DWtwet9mtFa8fdZZw6ynv7ESp0CMVWs8CsVbUYW3XH/n5u2tgYic00Y2iIiIiIjImfOLf1p+5ru+4Fmf3L2Gvy6n5RNAvCAEHAJwod09I2JEKMPshZUxEAo7N+fEvhLj7Q3ReIww/z+E1xlv1+uWt1d3b5y1E5+rvp7M97WlT8Zp85/9sx19H6PvXk7fx+i7h8zzZR/D2/M64+3abt93YveQ2e3Lu97rzJBd5sm8fsgus93rsQOP0fN69/vb60P0fYweewtXFi5skf1+WvB+FowX6/sA3p7XDfd599jPwyJ9H7/HXo+Vnkv1ryMAxaT7N1YAAEX4raUivOe6OybvbQ9E5FzX97cJERERERHZYfGtL126/ZOfOTAKG98Vy3hpjPHrEE+/yELvOdDYU/PFjOWA0UEg7CIPSFLvhkxn6t35Jd61QzpryPQmb6fRWyt2354T1lnLsfv2nAz5r5xZ87Bd1tCv23tPLbmZ5e02e58dp82PbJfx9ob0vg2z7o06vEXb7TlhnTUP22UNA3vf5ql3O5d0Qs12e05YZ83Ddr3nm0ans8Z4ez27+z0+tDNst2/D6d4Zd4LTPGyXNZBuz8mQjzXH7ttzss3uPu8ets9aYmf2nHi9obXC9vu2KqCIAdW0/TNWAAABnxovj38+HNjzmy/84GPH2kMROdfpxRURERERkbPA/d+366Zi73h08tD6VyGWfycCVwJYW/gH/yHM9cWugGIfeYHFez+227PXPOzdsutZw8DOmoftNlprvGA325DpDNvNtIUfZ5KbJd4O66yh290bcF5nvF3W+za0e+/PY5O3xzprIN2eE+9mO+Mt2m7PydBusT3WMLDbZs+LNPbnb+Yeoznz9oZ2y9tjz3cn1IZ2y9tjnTT6Pc4aMj1nh56H1kqP/Sxvj/W+DbPeGXXCAnbfnhOvw5mRRp97j7fLet+W5GZ27O3abs4hAqEKKCdAIL/wpeXx/3FqsvT7L7nj+CE7E5Fzn/1HAERERERE5Clw2c+d/ItL8JV/9fx/u/FTMY6/r1gKv4EQ/ldrabv/aZS9fiMgrgfE0nSme79g++zH4/H2vM4M2WW8620/E58nT+Z9dUb240w6izvAe1+G+8/HeJ3xdr1u9d3bCWfic30mHnOos+FjsHbiefUew/56vT2v9zXkem/X62dC3/fl7XndY5+HnTL049iO7b6vJ/v6np9z8vpC3pCPg+2yhv4f75z3OFZzLwJFVQBVgYJcP1oef3sZRv9DL6yIPH2Rb30REREREXmqPfG9+w4e3tz8qlhUV02n5T8FsB/AnsE3CyxyfbE3YLQPwEo9JDsA6faceJ1p7EZzbhnSWUtys4TtmDY/2l17ToZ2hu06jWUeM93y9lhnDd3u3oTzOuPt2m7PCeuN1hqzXYbtsYYB3Z4T7/lmvEXb7TkZ2i1vj3XWMKDb8yL1fusy7zFst+dkaLe8Pfacd0JtaLe8PdZJo9/jrCHTGbbLGpxu2vzIdpHplrfHet+G070z7oQF7L49J6yzBt7p857j7bPetyHTG1or3r7tsf6v1WNAXAeiWYgR06LAn12ytv/1j1968NAL3nXHRmtBRJ429OKKiIiIiMhZLL7pwotx0cUbd9x6299DNf17scL1APbavd7sDQIAYbnAaA8QDlSzQHYA0u058TrT2I3m3DKks4ZMt7y9urfGbJc1OJ21HLtvz43WGXVCzetN3s42O70Bx1oO2+/b4PRGa43ZLuPtDekDGxtRbNE2e25iM9YYb4911hI2s82eF/E+j52wzYZMb/J2hnycCZuxxnh7PTr9/k68mdcZttu3YeDnkjXG2+vb7TkZ8rHmsP2+Df179rn3sGtYg9P7NqOz0gndFgCEaYFQRZTT9jBGHA/AI2uru7/qqlu+987w5jfX/+NKRJ6O9OKKiIiIiMhZLsZYAIh3f/eul0WUX1GW1efHKr7W7vXCbhoAKJYKFPsjsDf6f0iw19pz4nXG3pAhDV7DwM4a4+01emulefCuhTNjLcfu23OjdUadUPO6xfZYQ//u3oDzOuPtst63YQufR4vtsYaefcGON+5gi7bZczK0W94e66xhQLfnHLM7P3qPYbs9J0O75e091X9zhTXwTr/HWUOme9g+a3B6o7XGbBeZbnl7rA9snVEn9NC8Jnc9m7EG3ulz78ntslnfhkxvmK/kdhuzIgZUmwCq7i80Au8bTVf+9g33nHy4NRCRpyX3z00iIiIiInL2qd54/t67N0/cVMR49ebm9LsicGkALrR7Lu/GQVGgWAooDlYIy+nfuzDYtX1bTr0fG29TdmbPTd7M603eTqPP32S7fRsy3WP37TnZiZuvlrc3pJvm3nzzuoft22bPCev24+y8sYC3xzprcLrTWHax5b4NTmeN8faGdNbgdNY8jd3WZewx+jY4nTXG2/OecxZZQ6Zb3l7PPvh73OuM3bXnpEdvrfTYz/L2+nZ7ToY87x67a89N3qxnd597D9tnLWGzvs1orXj7qVcBoyqgmkbEqr0cRuG/FBE/f/3t0/e3BiLytMX+yCQiIiIiImep4mcfO/a8X1j/48PnXfw7V/+76c0BxQ+PQvjPAB63u5T3n1dVFaqNEtVhIK47SzZ7NyCGsI9h30di95DZ9bDH2K6+H4O35/W+2PXer5PtItP78N6X18+EM/G+tvM5wcDrvV2vW6H/qmu7D9D3em/P64y3a/uZ+LpI7Psaqu/13t6Q59xb9LrVd88Rtnn9IN778npDj5UnT+aDyYy2ZugDDvi+2pHn3nsM9nGwhsxjNPRYQYxAqAKKEqhK8sJKCP99VIR3PL66+5OtgYg8rfX5/UNERERERM5i93z3rpdWVfWCspq+tqri3w3AJAJLdg/I3HzA6dlod4FwXkRYMf+ZLLu2b8tp7EdzbmGdNWyhN+V26llrxe7bc8I6a4s0r/GuZ/+FcyfUvG55e6yzBt7pf93MWg7b79vg9EZrjdku4+2xzhpIt+dGYyMXW7bNnr2GTLe8vSGdNTidNU9jt3WZ9xi227PXkOmWt1f3zrgTakO75e316PT7O/FmXmfsrj0nC3prvGB3IW+vb7fnhH2sCY0Ou2vPyTZ79rn3sGtYA+n23JSb1VorZD+UAaH+GyuInf+f7MfHS+NfCgf3/OYLP/jYsdZERJ7W9OKKiIiIiMjTwAOvvWTX6IaTFx8/tfniuLn5xljiOShwqd0D+E2DuVj/E2G7gOK8CqH5Eg27jjVkOlPvzi/xrmWdNTidNcbba/TWit2352RoZ+yuPSed+z41FlnzsF3W0L+7N+C8zni7ze7twJk1WmvMdi1vZ0jv23C6e+MWb8l2e06GdovtsYaBvW/zmN350XsM2+05Gdottle3zqgTaqyz5mG7rIF3+j3OGjLdw/ZZg9N34nPJsD3W4PQFrTPuhAy2yxqczhp4p899jrfPet+GTG9orZj9AACbASiBmH5R6f8JWN+zZ/Xrdl2454OXvPuRE83rROTpT/8smIiIiIjI08Cl73zo5MX/+sid6wde+86rfmn6ymI0+m6E4v+JEYft7kJVhepERDgWEDca/z2W/U+zvJsVXl/APvyO6/sOvD2vW333dkLmfWVGbX0XhzyvQ3aZ7V4P8hjer9PuEd6lLu8CrzNsl7Vaj1/GTOYxWvru7QTvfXmdYbuseRq7rc9l38fou7cTvPfldWbILuNd73Wr795Q3jeC12tn6sNp8d6J1616r/NL6YQF2PtjzePtev1MOZPvr/HYRQwI0wKIxekXVuqdCHy2iEv/9Mpdl31YL6yIPDOdyd+KRERERETkKXTHt+2+YWUtXr65ufkN0yr+wxhRFsBq9kZMY1aMCoz2AHF/hTB2buCwhkxnGrvRnFuGdNaQ6Za3V/fOuBk6wwY7s+c++ryvPh9nrnnYLmvo393/stnrjLdruz0nC3pr7O1a3t6Q3rdh1r1Rh7douz0nQ7tl9+w58TqcmW32vEhjv3Wp9zi223MytFtsr26dUSfUWGfNw3ZZA+/0+5w1ZDrDdvs2tHtrxdvHglni7QzpTmOZRwfbZS1hM9bAO33uPbldNuvbkOkNrZUKAAJCGRCnETA/YwXAR0LAn9x4e/l9diAizxz6mysiIiIiIk9TV/1/TnzyyL4r3rPngvP+7+XxytcVIXw4ALfbPU9VVpgejagOh9k/h/FU/qdZnXsaNa+zj9Xb7atxfevh7eOy9w2yh8yuxz7G0OuZ7T7GNq8/oz/0+OnGPv+J15khu4x3vdcttuc9f15nj3GmbPd9edd73crsZUb9eJ/fvrzrTXdvrnvXD9H3Mby9RvdWWrxfy3b1euezvb6rriEP4P16vcfw+plyBt9fCEBRBoC/sHJ3KMId5412/YQdiMgzyxn8bUhERERERM4WMb6pCOHN1e3fvvTNIcTXVtP4GgScZ/cAcjNlqcB4DQjnV7NZ808RdtdrOY39aM4tQzpryHTL27MfKz2Qc8I6azl2354bjY1oZI1he6yhf3dvvHqd8XZtt+eEdftxdt5YwNsb0vs2zLo36vAWbbfnhHXWPGyXNQzsfZunsdu6zHsM2+05YZ01D9v1nm8anc6ah+2yhm53v8fR3Z3zOmN37TlZ0DvjTnCah+2yBqdnGhvx6GC7rGFnevZrwPJ2h3TWkOkNEbMfXh/LgFBGxO4LKxiNih/dRPEfb/rMxt12JiLPLHpxRURERETkGeaOf7L7xtFaef10Y/r1FeItIaBCxOkfXd+9j4BiqUCxNyLsjsC4MSC7QKYzjd35m+x61rCDvcnbYR9r50DOCeus5dh9ezYt+3EmXre8PdZZQ7e7N928zni7rPdtON07405weHusswbS7TnxbrYz3qLt9pwM7Za3N6SzBtLteZF6v3WZ9xis923IdMvbY895J9SGdsvbY520Qd/nrOXYfXtu8mZ1b40X7C7k7bHet8H5WGlYwO7bc7ID3X3+GW/X6yAze0683hSBMCkQp7H9M1ZqK8ujH8DS6P3X/OWpj9iZiDzz6J8FExERERF5hrnqV058YvXx/b+/d7zyk7t2LX9ziPhTRDxg95qqMmL6BBBPBWDaGOzEf661E4/RV/c+ydNT/Tnt/HKfzM91z/fl/rNgXme8Xds7n5Ca3TMWjDnvfXl9B2zp49wp2/11edd7nf1ivd2+Gte3Hp69ryGezOu9Xa/3NeT6IbvMmbre+/rw+nZ5HwfDdlmrnZEP2Xt/Xu+JvD6R570/rw95fO8xakUZEKoCoaK7pxDwgV3n7XrP2tXnf8IOReSZqftbhYiIiIiIPGNUb3n5WvH9Hz71mTcs/cMQ4lehil8BOP9cGICwEjBeC8CBavanCe+mhtcZsxtJg9cwsLPmYbvsYyW9c06GdobtOo1lHjPdsnv2nHgd7Zl7483rjLfLet8G83E6PYvtsYYB3Z4T7/lmvEXb7TkZ2i1vj3XWMKDb8yKN/fmb3mPYbs/J0G55e95zTuMWelNuh81IG/S9zlqO3bfnhHXT5ke2m+RmTd4e630bZr0z6oQe7DX2nAzppLnPvcfb79vtucmZxQiEaQAmQExL6f+pcLwo8LldF5/31Yeve+5dN//yRyeti0XkGUsvroiIiIiICADgju9cu3kUqxvKafmaCvF1dg7UNxrCCMXBCqP0T4SxGxWs5bTvY/jXD+msIdMtb89+rJ0DOTfZmT330bzGu77Px5l43fL2hnTS6I031nLYft8Gp5s2P7Jdxtsb0gc2NqLYYt8Gp7PmYbusYWDv2zyN3dZl7DH6NjidNQ/bZTfY4ezC6awx3l7PTr/H0d1ryc0sttu3od1bK2yfNQ/bZS2xM3tOhj73Hrtvz01sxhq63X3+c7xrWO/bks7HFzCaBsQSiGj8nJW0V4Q/LGL4oRtun3y8eZ2IiF5cERERERGRuYf+/kW7w/7jz9uoyps2ysm/QsCFiNg/X4gAQkBYChjtjwh7vTs83ZsXWeY+RvdAzonXQWb27PH27A2ZzhvOORnaGbbrNJZ5zHSL7bGG/t298eZ1xttlvW/D6d4Zd4KD7bGGnn3Bjjfu8BZtt+dkaLfYHmvYZvd2ctjn0nsc2+05Gdotb499n3dCbWi3vD3WSaPf56wh03Oa1+SuZ7NGa43ZLjLd8vb6dntuGvLce+y+PSdehzMjjT7/Od5+327PiekBADZn/+RpZYcRCKPwtiLG37r+tvIP2kMREf3MFRERERERabjkNx45cfG/PfGJ/fuf9ftXv/VvXRvK4o1FCO9CxHGgvgsRI+JmhXgMwPEAVPZRujcv+pr/11/s+qH/adh2HsPb87rl7Xl9iL6PEfqvbtuZeEfs+cvp+zEMedzGbuvh+z5G3z1kdm1f8OtcMD6z7Mfq6buX4z2G7UM/Ifb6nTL049gO7315/Uzo+768Pa977PM29Hpv3+t9bfd6j/31Jtt9f9u9Ptmpx2H6PnafvSoglAViSV5YARACbsW4+J3iggMfsDMREfT8rUZERERERJ7B7n7D6qumRfWqWFVfFGN8Tbr/EIoCYRxRHATCWvemBLlP4Wvszt9k17OGgZ01xture2dsgz0nrLOW09zPXdv3v2xmzcN2WUP/7v4XzV5nvF3b7Tnp0edversM22UNA7o9J+z59niLtttzMrRb3h7rrGFAt+ccszs/eo9huz0nQ7vl7bHnvBMavJnXm3I7bEYa/V5nDZnOsF3W4HTTWke2j0y3vD3W+zac7r0+1hx7jT0nO9Dp8+/J7Xoz2+25FiugCEA1CQhTINoPLGISgbiytvo1u64574OX//b9p9oLIiIzenFFREREREQW+tQbz9+7sn78FdiML55W5fcAeHaajXYFFHsB7OrcnBjG3ihi17OGgZ01hu3lfol23569hkxn2C5rmPXOqBNqXre8PdZZA+/23tYs2rAA2+/b4PRGa43ZLuPtsc4anO40ll1suW+D01ljvL0hnTU4nTVPY7d1GXuMvg1OZ43x9rznnEXWkOlWbs+bNT+X3g76Xb8Q2+3bYD5Wp7d4nWG7rIF0e06GPPc5bL9vQ6ajO8t+DTC5fTbr2UIZEGJAnERU6eerNIyADxRF+N5rf+wb/yK8/h2lnYuIJHpxRUREREREejv+zy+4ZNcla+GOOx/+9lhV3wrgQBgVe4s1IOyPKJYbNym69yt89jLv2iGdNWS65e3Zj5UeyDkZ2hm7a8/JkJtvrHnYLmvo3+lNN9ZyvH3b7TlhvdFaY7ZreTteR2bW7At2vHGLt8R634ZMt9gea8h0ZGZ9Pl+exn7rUu9xbLfnZGi3vD32fd4JtaHdYnusgffB3+e5mcV2WYPTG601ZrvIdCu3x2Z9G2a9M+qEHuw19pwM6aTR5z/H2/c6yMycAwIwDSgnESF2P4EFwm+Nl/GL1/719E/aExGRrpENIiIiIiIinp/88MnjP/Luf3/y/FPVex+/67bbQ8AIVSziBBeF6eymRVi2V22B95+BeZ3xdr1ueXte3w57M2gHdT7c7b6vIdd7u14/E/q+rx57nc/lIt4FXvc+Btu968mqK/MYTxnvY/K694u13bv+yfZkfhxnw/vyutV3bxH7OPbrYBF7feL17fI+vu2+v+1ev1N24uPY4ccIEcC0QDWpTufm+wjhfy+Ni189NNr15//xcxvrjYmICLUTv02JiIiIiMgz1Me/bfez9pUb/yAWuKFCeG2xjPPDwYgwjrP/lMu7ecTUu/NL2LWsJWzWtzHeXqO3Vuy+PSess5Zj9+056f5HuTMssuZhu6yhf3f/i2avM96u7facLOitsbdreXvb7faceM854y3abs/J0G6xPdYwsPdtHrM7P3qPYbs9J0O7xfYarTVmu4k387rF9lgD7/R7nTVkOsN2WUO/3uvz6XXL22O9b0vY93wnLGD37bnJm7FOGn3+c7x9r4PMKsz+GbAyANPY/RkrFSahwF2ra8s/tOdZ+959ybsfOdFeEBHh9OKKiIiIiIhs2x1vWH3VeIQrJtPpV4cl/L3RQQCr9u5GhlmNpMFrGNhZ87Bd9rGSPqgh0xm2m2mdUSfUvG55e6yzBt7t/a5ZtGEBtm+bPScLemfcCQ62xxp6dm8Hs1lu3MGWbbPnZGi3vL0hnTU4nTVPY7d1GXuM7TRkuuXtec85i6wluVmS2/FmptPvc3T35rzO2F17Tnr0zkonOI3x9vp2e07qTsc0Otgua9h+d5//HHYNa4mZhRgQNoFyyi+KBf5819ruv3PVz910d3j1+6Z2LiLi0YsrIiIiIiKyI5743ssOro+OX3bqxMkvw3L8vrgnXlSsxnEs7Kajcc8jmnPLkM4aMt3y9ureGdtgzwnrrOU093PX7tSN18TbGdrRnrk33LzOeLu223PCummtI9u3vJ0hvW/D6e6NW7wl2+05YZ01D9tlDZkOZ2abPS/S2G9d6j2O7facDO0W26tbZ9QJNdZZ87Bd1hIzG/y97nWG7bIGp9uPtfMGkZs1eXusb6F1xp2wgN2358TrcGakuV8DHm9/UY9AUQUgBsQJUFWVWQSA8HsB+Jkbb9PPWBGR4fTiioiIiIiI7KjqjdfsvfvEPQcrlG8pzo9fGlbjeXaHYjeJ2I0T1jCws8awPdNax+aBXYstdIbtOo1lHjPd8vZYZw3d7t5s8zrj7bLet6HdWyvevuXtsc4aSLfnxHvOGW+R9b4NmW55e0M6ayDdnhdp7M/fzD2GndlzMrRb3p73vLPIGjLd8vZ69sHf61732H17Tnr0+Zs9dhfydvt2e07q3hl3wgJsv29LvJnp7tdADruGNZzuIQZUUyBOMPvh9VYRfnVpufiDsL78vmtvO/6oHYuILKIXV0RERERE5Iy58wdW3zRam359uRSvCyOs2HlL475HNOeWIZ01ZLrl7dmP1bQ51uB01nLsvj0nO3HT1fL2hnTS2L0vgO+6vF3b7TlhvdFaY7bLeHtDet+GWfdGHd6i7facsM6ah+2yhoG9b/OY3fnRewzb7TlhnTUP2220zrgTaqyz5mG7rIF3+r3OGjLdw/ZZg9O9zyfbRaZbuT02G9g6o07owV5jz8kOdPo1kOPtOz2UAaGKKDfr0NyLmBYF/mJ1Zflfr11+4F2XvvOhk42piEhvenFFRERERETOqDt/eN9XjFdPvbFcqr7MzloaNz7mb7KbJqxhYGfNw3bZx9o5kHMytDN2154T70Y7jZlu2T17bvJmzc9jj51evH3b7TlhvflxOj3L29tOX7DjjTu8RdvtORnaLW9vSGcNpNvzIuxz6T0G630bMt3y9nbq+9zrlrfXsw/6fmctx+7bc5M3q3trvGB3odyeN7PdnpOhz7+H7fdtyHR0Z+7XgMfbJ72oAqrN+n1U9UJjrwI+Ntpz8PU3PHv8UNALKyKyDXpxRUREREREzrh737L7xri++eayqr4oFDjfzufsPRBy04S2hM1YQ6Y3eTuN3lqx+/bstSQ3s+yuPSf2c9o5NHjd8vaGdNLozTbWcth+3wanmzY/sl3G2xvSBzY2orxF2+05YZ01D9tlDZkOZ2abPS/S2G9d6j2O7facsM6ah+0OvbnOOmseb7dnp9/r6O7NeZ1hu31b0pi11rxrvG6xPdYSNsu0zqgTerDX2HPCOmsJmblfB0xutzErpgHVBIjpRZWmCCCE/4wq/ocbb5v+UQiBLImI9Nf3R0uKiIiIiIhs2frdl9y28fBz/w5GxR9H4IkYs7dJtmbnH7GXwf/F2uALeso8budT4+163eq7l9P3Mfru5bDHYM3T2G19Lvs+Rt+9nL6P0XdvqCGPO2SXGXp95wv8HDT012wF5yFodAzZPVN24mPo+xh99860IR+H97XuPYbXz5Tc+8vN+lhwfYgBxbRANc0sFuFXR0X4gxfdXr5HL6yIyE7I/I4jIiIiIiKys+756bWbYzX9JpTVt8eA/XbevHEUzbmFddawhW55e3Vvjdkua3A6azl2354T9l+1d0LN65a3N6STRv9LZtZy2L5t9tzEZo3WGrNdxtsb0gc2NqLYYt8Gp7PmYbusYWDv2zxmd370HsN2e05YZ83j7bLvc+T3O1jzsF3W0O30+xzdvZbczGK7fRu6fX709rFg1sT2WIPTWcPp3hl3QgbbZS3xZqyT5n4deNh+BIoIVJuzH14fyFIEDgPhL9aWxv+h3Lf79174wceO2R0Rka3QiysiIiIiIvKkuu0XLr5w5fijv1Ahfj6Aq1rDxj2R+Zvd+yS8YWBnjfH26t4Z22DPXkOme5r7uWvZTddOqHndYnusJWxmmnujzeuMt2u7PSc9emvF27fYHmsY0O05qbs37vAWbbfnZGi3vD3WWcOAbs+LsM+l9xi223MytFve3pCPFZmZ1y1vj3XSBn2/s7aIvcaekx59/qa3iwWzJm+vb7fnpO50TKOD7bKG7Xf3ayDHXBPKgCIGTCdx9vNV7PsIeBAhfGa8b+0N133/V90ZXv+Osr0hIrJ1enFFRERERESedA/97O4bynLyTZOy/BE7a90g8m68sM4attAtb6/R52+y3b4Nmc6wXdYw651RJ9S8bnl7rLMG3unNNtZy2H7fBqebNj+yXcbbY501ON1pLLu8ZdvtOWGdNcbbO1Pdnhep9zuXdcKABqez5mG73vNO4xY6w3ZZQ7fT73V09+a87rH79pws6J1xJzjN4+0O6QtaZ9wJC9h9e27yZqyT5n4deOr9EGf/FFgsA6pJPP1A5vFG4+KnUI3eev2n1u9pT0REtk8/c0VERERERJ50l7zxxCerpT3/PsbwIwH4xHww9CZL09nwn471/Ri8Pa8zQ3aZJ/N6b9frVt+9nO0+RuP6LX2ZDnn/3q7XLe/nbzyZ+n4A3p7XnyK9PpxeSxk7cP12H2KQLX0j9PCk/iIy76/u3ril19IC3mN43eq7txU79dg78Tj1Y1QIiBOg2qy8V2gOFUujf7Fr19Lb9cKKiJwpenFFRERERESeEpd//+MPVCvn/7tiafwriLjNzsP8/xBeZ7xdr1ventetvntn0pm46UrvZZ0hQ9/Xdn+xC65vjRfszg39NTyZ+v4avD2vnwnbfV/bvT7nyXyOh/w6vF2vn622+/F61w993rzH6cu7fsjH4T3GwIdxZR6/t56PEXruJSHO/imw0SQgVnZaC/hAAH7r4l2X/9sr3via0/8Bh4jIDhv4W5iIiIiIiMjOivFN4/t+5qdvqabTf1ohflGIs/8ILM7/j8Ob2W7PTblZ4u00emelGTrDGuus5dh9e06G/HNBrHnYLmvo3/l/gNzdy/J2bbfnpEefv+ntWt7edrs9J3X3xh3eou32nAztTbkdNmMNA7o95zR2W5d5j2G7PSdDu+Xt1b0z7oTa0G55e6yTNvj73eseu2/PSY/eWumxn+XteR1kZs/JkN/vc9h+35Z4M9PdrwOjiACqgGodiPyiChGfCePiXbHY9WMv+sSRw3ZBRGQn6cUVERERERF5yh3/8QsuObl68qXH1zd+JkQ8CwHnI91/YfdPWMMOdovt2ZtDnTca+jZkOsN2M60z6oSa1y1vj3XWwDu9Z8ZaDtvfTkO3z4/evuXtsc4anO40ll1seTsNmW55e2eys+apdzuXdMKABqezxnh7Qz7WhM1YY7y9np1+r6O715KbWWy3b0O7t1Z67C/EdlmD01nD6d4Zd0IP9hp7TrwOZ0aa+7VQC5j9jZUwiZhO7RSIEZshYDpeXvo/jk2L977s1pMP2x0RkZ2mF1dEREREROSscd9PrXxpDNUt02n1DwKwK4LfhAEGdtaQ6Za31/cmlj0nrLOWY/ftOfFutrPImoftsob+3b3J5nXG27XdnpMFvTX2di1vb7vdnhPvOWe8RdvtORnaLbbHGgb2vi2nsd+61Hsc2+05Gdotb489751QG9oZb5d10uj3O2vI9Bx7jT0nPfr8TW8XC2ZN3l7fbs9N7GsAC65h2H7flngz0+nXQS1UAaiAOA1AFRGr7nKM4Q9DCP8CS5fc+aJP3Ku/sSIiTwq9uCIiIiIiImeVo//u4HWPHz76Q9MyflERcIW9ATN3pnuTt9PorZXmoce1HblZE9tb0NyPs8nrlrfHOmvodvcGm9eZ3K6d2bPXsIXPo+Xtbad7O5jNcuMOtrydhky3vL0hnTU4nTVPY7dzWSeQZs9NbMYa4+15zzuLrCHTrdyeNzN98Pe81z12356THr210mN/IbbLGpzOGk73zrgTerDX2HPCOmsJmdGvhQDE9QCU9QLZKRB+fVSE//3CWyf/0c5ERM4k/UB7ERERERE5q+xd3XvnUlz9qfGo+G/8NsoWeI/i9e2wj+n9J21et9fneI9h1Xudh+57/U7o+b7cH27sdWbILtPj+h4rZ4Z9Ehd8IAvGi9kHsO8/sXuJ18+EJ+F9td6F97noy7u+76/D2wv+qMNb9Lrl7Xm/tnOR92s8U7z35/UhnuzHyO3mZkkVEDYLhMhfeQkBj8aADy4tj9+DA/t+285FRM60Pr+ViYiIiIiIPOkO/eL5zz5x9OhXo6r+SQW8zM7dm3dDOmsetttorbHdtedkaGfYrtNY5jHTLW+PddbQ7eQe2ozXGW+X9b4N7d5a8fYtb4911kC6PSfec854i6z3bch0y9vzOpwZa3A6a556t3NJJ2yzIdMtb8/7WOFE1pDplrfXs7vf7+juznmdYbt9W+J9TjvBaR5vd0hf0DrjTliA7bMGp7OWkFmMACogxABMgaoC0PxnwOo3A/A5RHx25dkHv+Xqy3c9EN52z/rpJRGRJ4deXBERERERkbPWvT9+8FIsnfySyWTy4yHiIIB9rQVyYwZwOmvIdMvbq3trzHb7NmS6p7mfu9a72c4ia5a343U4M9Pcm61e93j7tttzsqC3xt6u5e0N6X0bZt0bdXiLtttzwjprHrbLGrbQYWa5Paax37rUexzb7TkZ2i22532sNNSGdovtsQbe6fc8a0luxth9e0569NZKj/2s3J43s92ek7rTMY0Ou2vPTd7M6+CzuDF7YSWyL4w6FePiZzfL8Csv+dTm7XZFROTJohdXRERERETkrFb912v23nfrXa+uYvXPYhW/bD4g91yAHexNuZ3GbP6m3bfnZGhn2K7TWOYx0y22xxr6d3Y/DejuZXm7rPdtaPfWirdvsT3WEm/W7N4OZrPcuMVbZL1vQ6Zb3t6QzhpIt+dFGvutS73HYb1vQ6Zb3p73vLPIWpKbNXl7Pfvg73mve9h+34Z276x0gtM83u6QvqC1xmw3h+2zlrAZa0nz44wBYRoQJ/yH1gNAjNgsRqN/uasoPvz8T6y/385FRJ5MenFFRERERETOCQ/+67XXrU83vxcR1wI4CDg3bFjDFrrl7bEbWGyXNTidtRy7b88Ju+HaCTWvW97ekE4avdnKWg7b79vgdNPmR7bLeHtD+hYaG1PeYrN7O3BmrHnYLmsY2Ps2j9mdH3OPsZ3PGTLdYnt164w6ocY6ax5vd0Af9D3v9Rx7jT0nrJvWOrJ9ZLrl7XkdZGbPyZDf83PsNfbc5M28jnpWBmATiJXzN1ZmPlCE4kPXveHb/lV4/OAkvPnNlV0QEXky6cUVERERERE5J8QYw70/ufaFZZz+oxjjtwagcG/WDOmsMd5e3TtjG+w5GdoZu2vPCbvRhvx+L2yPNfTv7r01rzPeLut9G073zrgTHGyPNQzo9px4zznjLbLetyHTrdyeN2OdNZBuz4s09udveo/Bet+W5GZN3p733LPIGjLdyu15M9MHf8973cP2+za0e2ulx/5CbJe1hM2cxjKPGWyftYTNWKvFaUDcMD9bpW0DwGfDePSfJ6eW3/qSO44fsgsiIk8FvbgiIiIiIiLnlIffcuDG9ZPHf6KM8WoALwhA0Vrw7s14HQtmibfT6K0Vu2/PXktyM8vu2nNS9+zH2ZSbJd7ONvvgG60eb7/ZvR04s0br/bls8vaG9IGNjSi22LfB6ax52C5r2KHOmqex27rMewzb7TlhnTWPt1v3zrgTaqyz5mG7rCVkRr/vWUOm5zSvyV3PZqbNj2w3yc2avL2+3Z6b2AssndCDvcaem7yZ6SECmBZAGVCVFf2nwCLw6LjA/auru9+wfzT+9AUfefyo3RERearoxRURERERETnnfPZNe1+wtLzxDdOq/FeI2GPn9gaO25DplrfX6K0Vu2/PydDO2F17TthNNjj7rHnYLmvo3+lNVnT3srxd2+056dFbK96+xfZYS7xZs3s7mM1y4xZvkfW+DZlueXuss4YB3Z77qK9pXeo9Dut9GzLd8vbYx0pDbWi3vL2e3f2eR3d3zuuM3bXnJm825HPKWg7bZw2k23OT9/1PYwbbZy1hs2arAsIkoJrE3D8DhiKM/u8Q8ZvX3bpxRwjBXxQReQroxRURERERETknVf/+mr33PXzXV1VV9U0R8ZtbQ+/2y9BueXt1b43Zbt+GTGfYLmuY9c6oE2pet7w91lkD7/R+G2s5bL9vg9NNmx/ZLuPtsc4anJ5pbORiy7bZcxObseZhu6xhYO/bPGZ3fsw9hp3Zc8I6ax62W7fOqBMa2Iw1D9tlDbzT73nwXSDTGbbLGvr11kqP/YW8Xdb7tmTI7/s59hp7bvJmEYhVQNwsgGnp7wEPL49G/+/x8vg9V33s5EftUETkbND+6/MiIiIiIiLniOL//MyxjXDwvStLq78UgL9CwP3z4Zn4z8j8G0DcmfgYPNt9X0/m9d6u162+eznbfYzG9UO/LICB79/b9brVdy/Z0i+oh74fx5l6/xjwMXi2e/1Q231/3vVe9z733n5f3vVeH2LIYwzZ9XiP4fUhhjzGkF3PmX4MNquAMCmAzYBQRWcJiEV4dxHCL60sLf/e83/4NR+3cxGRswX/XUxEREREROQcEWMMD//rA889VZ16PcryOwFc7t4kHNotb6/R52+y3b4Nmc6w3QWtNWa7yHTL2xvSSaP/FTtri7BrbLPnJjYb+rm0vD3WWYPTncayiy33bXA6a4y353VkZqz3bR6zOz+yx+jbsIXOsF3vuafR6azlsH3WwPug73uve9g+a+jXWys99rNye2zWtyXsa6ETerDX2HPS7BEIVZj9jZXJ7AfXz/8psPbeJgI+tbQ0/tXlpV2/9vyPHj7SmIqInHX04oqIiIiIiDwtPPrrX7Dv+D0ff0NVlf8QwHMRsdvu9LoJlOPtNXprxe7bc8I6azl2354TdoMNzj5rHrbLGvp3epMV3b0sb9d2e0569NaKt2+xPdaQ6SAze068553xFm2352Rot7w91llDpoPM7HmRer91mfcYrPdtyHTG2/WeexZZQ6ZbuT1vZvqg73vWFrHX2HPSo3dWOsFpTG7Pm9luz0nd6ZjGDLbPGmY9RqCIAdUGgBLdn6/SOI5C+MPRhfu/59Dj00f+xieOHG6uiYicjfTPgomIiIiIyNPCBd/ykaMH1p71q+Px0k8GgP/77N5/XuZ1q++eZ8j1Q3aZzPWZUVvvRcc2rw/bvB4Y8DH03SO2cWnb0AfybmhaffeSvh+Ht+f1M2Ho+xr6uehr6Mdhbfd6T/3r7f3wvRcd3vUDPu+Dvu+H7Hq8x/B6Q4+VnksL9nKzJm+v7t54kIEPUkwDsBmAyn9hJQKbS+PiRyfj4p9d851ferteWBGRc8XA3xJFRERERETObn/+1pcuPfvwJ75sOolfV1bVl0XgqtaCd5PP603eTqN3VpqhM6wN7Z4+7wuzGR2zyJrH7tpzkzcz3d6Lm/M64+3abs/Jgt4ae7sM22UNA7o9J95zzuQWmzNvz+tYMGvy9lhnDQO6PS/S2G9d6j0O630bMt3y9ure62NFZuZ1y9vr2d3veXR33baIvcaekx59/qa3iwWzptyeN7PdnpO60zGNGWzftFCF2d9UmQSUVax/xkpXiLhrvDT++X3j0Z9c+rGTH7NzEZGzmf7mioiIiIiIPK3c/IaPTpYuuPIDGC//0mhUvBsBk9k/RpLB7/l09fjP01orfR93J9j35X2s3k12Ggdg12c+Bsp09yar1z3ex3EmbPd9PdXXI/MY9vPu7Xns9R5vz+tDPw5ru9cP9RT8OjrvMrO7bWfysZmh76/zycjo8djzldxubtbUdy/He4y6e+NBcg8SAZQBcQMo14GqrNwXVlCE96IIvzSKxX956OYXfsKORUTOdrnfDkVERERERM5pj/zMvuefOLnxpSim/xgRLwcyN9a8bnl7dW+N2S5rcDprOXbfnpMhL7Cwxnh7QzppO/ICi7druz0nPfr8TW/Xyu15s77dnhPveWe8RdvtORnaLbbHWuLN+nZ7XqSxP3/Tewzb7TnxOhbMmrw99tx3Qs3rWDBr8vZYJ23w973XPXbfnpu8WaPP3/R2sWDW5O15HWRmz0nd6ZjGDLYfAUwDsA5UzSfR7EZgIyB8cLw0+s8bWH3HTX955In2hojIuUEvroiIiIiIyNPe/T+5+s2T6eS7Y8S1AA7aGz1A9+ZPFtv17iPZXXtOhnbG7tpzwm60Ir/fi7fHOmvo9sE3WRlvl/W+De3eWvH2LW+PddaS5mzBXm7cwZa305Dplrc3pLOW2Jk9L1Lvdy7rhAENTmcth+17zz2NW+iWt9ezb+n7Pjez2C5rCZs1WmvMdpPcrMnbG9JZw+neGXdCD81ryoCiDCgnQKzqn2TP9gCMivB7VRx/141/vX5feyIicm4Z2SAiIiIiIvJ085b3/P8+vfHhP/jkpCrHiPFFAMZ2p7et3IA6C3X+S7vt/rq8673ek/vDrb3OeLtet7y9RvdWdoz3Duzn19vbKX0f39vzutV3L2cnHsNTP3avd9FrKWPI9fbrIQnDHuaM6flB7Mj3fc6Qx8l8TgfxHmcnDP1YmG08RpwGhClQbdYvrDiKgLtGK6MfK8b499f/1ebtdi4icq7Zxm+dIiIiIiIi55ZDP7/3muMnN74mTsu/i4ibW0P/flCbt2f6/Gj37TkZ2hm26zSWecx0i+2xhv59S/8FO+Pt227PyYLeGXeCw9tjnTWQbs+J97wz3iLrfVuSmzV5e0M6a3A6a57GbueyThjQ4HTWmNye9/zT6HTWmNyeNzN98Pe+1z1sv29LGrPWmneN1xlvd0hnDad7Z9wJeSHOfmB9tQEg86IKAIwQ/mM1Wv6ty2668E/Pe9s9+mfARORpQX9zRUREREREnjF+5l3/r8OPvu8v7t+9Fj42nUyvAbAGYBcw4D898/YaPXuLqcf1W9b3MZ7M/4rde0deN9z/gv1s0HiiWx9m9gtgG/p+Lry9Ic+7t+h1y9vb7udm6PXex+H1Lej13G/3/fW9fsHegvFifR+g716G+73v9aH6Pk5uLzd7su3ExzLkMcqA0bQApkX2hZUQ8EkU4feXl8Zvm1bLf3HFHz6iF1ZE5GljyG+bIiIiIiIiTwvxTdct37/nrpuqjenryrL6akRcPxvYTSK30+e/Bu4Ma0O7x+7bc7IT/xU7w/ZYQ/8++L9gZ7xd1vs2tHtrxdu32B5ryHSQmT0n3vPOeIus923IdMvbO5OdNU9jt3UZe4y+DVvolrfnPfc01tiMNcbb8zq6s8Hf+173sH3W4HT78bqHBq8z3i7rrCHfO6NOIKqAUAKxDIiTiBjZA9UC7hmj+I3q4gt++fpX/dP7w5vfXNkVEZFzmV5cERERERGRZ6zqA6/ce//7Pvr6cjJ9YwVcGCIO2h3Ku5HU6PM32W7fhkz32H17TureGi/YXcjb24E++CYr4+3abs8J643W63NpeXtD+hYaG1Peou32nAztFttjDVvoMLPcHuN9Pr3Hsd2eE69jwazJ22P3wTuh5nUsmDV5e6yT5n7fg+/Ttoi9xp6THr210mN/IW93SGcNs05HNNb7VQBKAPZnq5hrQsQTMeCRlbXV7/rcxvijf+MTRw63N0REnh704oqIiIiIiDyj3fvjBy8tljaunW5s/JOqjN9s51Tm5hN5s7tvz8nQzthde06G3FhjzcN2WUP/7t5g9brH2292bweZWd07405wsD3WMKDbc+I97x5v2XZ7ToZ2y9sb0lkD6fbcR31N59JO2GZDpjPervf8s8hakps1eXs9u/u9j+7unNc9bJ81ON1+zO6hwetWbo/N+raEfT10Qn33sAyIJzD7mypWnSIQA4ClcfHTq+N9b7vizx/9TAiBXCAi8vSgF1dEREREROQZL779ltF9j/3RxfGxE19bTctvjDF+hd3p8G4Xnb7J1GktfRsynWG7rGHAjTVkuuXtsc4aeGf389heFtvv29Cvt1a8fcvbG9IHNjai2GLfhi10hu2yhoG9b8tp7Lcu9R7HdntOhnYrt7cT3/deZ7xd1kmj3/sJm7GWw/ZZQ7/eWumxn5Xb82a223MT+1pA+5oQA8I0IE4DqmmVfXEFBf5kCcs/s7oaPnLln5182GyJiDzt6MUVERERERERADG+fXT3z37nhcvTEy+aTDa/tyzjzSHgArsHZG5WeTfYbOgMa0O7x+7bc9Ljxlq2edgua+jf2f08oLuX5e3abs9Jjz5/09tl2C5riTez3Z4T73lnvEXW+zZkupXb82asswbS7XmRxn7n0k7YZkOmW7k97/lnkTVkupXb82amb+l7Pzez2C5rCZvZj9k9NHjdyu2xWd+WsK+HOPv/QjV7UWXRz1aJEdOlUfHzY+AzL/irya/auYjI05VeXBEREREREWmI8e2j+3/qW28uJ9NbyrL6phBwhd0BnJtV3g22HrtuQ6YzbHdBa43ZLjLd8vZ2oNObrKzlsP2+DU4f+rm0vD3WWUvszJ6TunvjDm/RdntOWGfNw3ZZQ6bDmfVtHrM7P+Yew87sORnaLW+v7p1xJ9SGdiu3x2ak0e998F0g0z12356bvFmjz9/0drFg1pTb82a223OTfc0kzn5oPcqAaj06v7CGgD8bh+Jju3bt+uXDp3DnTX955Am7IiLydKUXV0RERERERIiHfvai3dNTj39TWVXfVkXcAGBva4HdZMLp3hnbYM8J66zl2H17TuxNtYRF1jxslzX074Nvrnq8fdvtOVnQW2Nvl2G7rGFAt+eEfaw53iLrfRsy3fL2WGct8Wa22/Mijf35m95jsM4attAtb2/I9z220K3cnjczfUvf/7mZxXZZS9jMfsydN4jcrCm3x2Z9W1J/TcQIFNOAasP8wPqmlCNOhIA7sTR6+6OPj//9q+/RPwMmIs88enFFRERERETEcdtPXHzhSnn08qqcfEtE9T12Tm9WNVprvGA325DpDNvNtM6oE2pet7w91lkD7/QGK2s53r7t9pz06K0Vb9/y9lhnDU53Gssub5l11uB01jxslzXsQLfnRRr7rUu9x7HdnhOvY8GsydtjXwOd0ODNvG55ewM6/f4H36VtEXuNPTd5s0afv+ntYsGsKbfnzWy356Y4+9sq838CrMwsz0b3hiJ8slhZ+cEXvvySO4pfvGPDromIPBPoxRUREREREZEF7v/pvddsnjz19YjxHyHguQDW3BtV7OYaC51hbWj39HlfmM3omEXWPGyXNfTvg26uerxd2+056dHnb3q7jLe73W7Pife8M96i7faceB0LZk3eHuusYUC35z7qa1qXeo/Det+GTGe8Xe/5Z5G1JDdr8va8ju5s8Pe/1z1sv29L7MfceYPIzZpye2w2oBVlgVgC1RSIZf3zVZgIFAGfXVpZ/sHlED6oH1ovIs90enFFRERERESkp4d/Zu8rTp449b1VjK8ogAMA9tgde/PKvblmz8nQzrDdBa01ZrvIdMbbZZ018E7v+bGWw/a309Dt86O3b3l7rLOW2Jk9J3X3xh1ssW+D01nzeLs70fs2j9ltHb3Hsd2ek6Hdyu2xF1g6oeZ1LJg1eXusk0a/9xM2Y20Re409J17H6Vlrpcf+Qrk9b2Z74xwAoAyIJRCnmP2/mR9aD2BaFOHXVpbWfvWq3QdvDe+7Rz9bRUSe8fTiioiIiIiIyAAP/MSea8vJ5FVTTP8xKrzSzoEBN9dYg9NZy7H79px499JYZI3x9rbZB99c9Xi7tttzsqC3xt4uw3ZZw4Buzwn7WHO8RdvtORnaLW/vTHV7XqSx37rUexzW+zZkupXb24nvfa8z3m7PvqXvf6972H7fltSzzkonNORmTbk9NnNajABiQNwAMK1fVGnMrRDCe4owftuu8fjPr/zo8U/buYjIM5VeXBERERERERkovum65XuKO768CLh2Oi2/DcBV7QX6ZvemlT0nQzvDdp3GMo+Zbnl7rLOGbndvrnrd4+3bbs/Jgt4Zd4LD22OdNTh9QWNjii32bXA6a4y3N7TDmfVtHrM7P+Yew87sORnaLW+v7p1xJ9SGdsbbZZ009/cA8H3aFrHX2HPidTif2x77C+X2vJntEYgbQLkZENgntJ1uGxXhr5aXil8/8fjSh19854nPtaYiIs9wenFFRERERERkC+Kbbll+eP97ro4nT77q1Ob020PEVRFYCwGj5s2p7M01e06Gdk9zP3ftkBdYWGO8vSGdNHYvEOC7Lm/XdntOevTWirfPsF3WMKDbc+I970xu0c7sORnaLW+PddaQ6SAze16ksT9/M/cYdmbPydBueXt1p2MWWUOmM95uz+5+/6O7O+d1D9vv2xLvc9sJNa8zuV02a7ZpQCwD4mZErNhyLWIjAveNivALu5bW3n3lD37VHeH17yjtmojIM51eXBEREREREdmm+9+8+ooQqy/arMpvicD19gbX/GjvZdlzMrQzbHdBa43ZLjKd8XZZZw3d7t5c9Trj7bLet2ELn0vL29uJ7jSWXWy5b8MWuuXtDemsJXZmz4s09luXeo9juz03eTOvW2zP+3hpqA3tVm6PzUhzfw8A36dtEXuNPSdex+lZa8Xb9zqT23VmYRKAMmBaAqgiUDqLs4d4OABHVldGP7D63Gf90eW/ff8puyMiIjN6cUVERERERGQH3Pu9l61h3yPfOI3xlhjjVwRgF+y9LnY/izU4nbUcu2/PCbvJ3gk1r1ve3jb74BurHm/XdntOevT5m96u5e0N7TCzBXu5cYu3aLs9J0O7ldtjM9YwoNtzH/U1rUu9x2G9b0tysyZvz3v+adxCt3J73sx09/cAr2PBjGH7fVtSzzornVDzOpPbbcxCGWY/U6X+gfVV+uSR62PEeihwfBxGbyknxX+68a/X77M7IiLSphdXREREREREdkh860t33ffwrddPq8m3o4pfCODqCoih+Wcve1PLnpOhnWG7TmOZx0y32B5r6N+3dGOV8fZZ79twunfGneDw9lhnDaTbc+J9rDlseTsNmW7l9rwZ66zB6azleJ/TTqjZbs+J17Fg1sT2hn68yMy8buX22Iw0+vsAa0lu5rHX2HPSo7dWeuwvlNuNQKgCYgWEDWA6BUJ9Qe7jGI3Cr4yXVn/9/IPLf3nBux4/2p6KiAijF1dERERERER2WIyxeOBH9nzpRtz4lgLxZVXENaeHrdXu2WtJbsY093PXshdYOqHmdcvbG9JJozdWwXddud0+nzOv4/SstZLbb/L2hvS+Dc7HmuMt2m7PydBueXtnqtvzIo391qXe47DetyHTGW+Xfe8jv0953fL2vI7ubEu/B+RmlrfLOmto985KJ9S8zpDdGIGiDKg2Zn9bxX6iWqd0COF/haXxryyNcP+1f7r+geaKiIjkFTaIiIiIiIjI9oQQqtGePR/atff87wih+N0Q8GeIeNzuuXbqP4MjN98ob8/7OLx+JjyZ7wvkczH0/dvrk76P4+15nRmym/mQO3ovPo0M/Fy6vMfxutV3LyfzGJlRf30fpO9eRtiBx8hij+99/bNdtLu3sqMiENcDqpNAnMTOCytWAB4Yj4ufKYrwGzf8k3/wO9d81Q990O6IiEjek/L7u4iIiIiIyDPVIz9z4cXl+qnz1qfr/7Kq4hcG4HK7Q2/asYZMZ9gua6hvzJFGed3y9rbZs/cMczPL27XdnhPW7cfaeWMBb8/rcGZ9G2bdG3V4i7bbc+J1LJg1eXuss4ZMB5nZ8yKN/fmbucdgs74NmW7l9ryvARZZS3KzJm/P6+jO3N8HhnYP22cN/XpnpRNqXmfS7iSgOlX/sPqMenocRfhdxOLTu1eW33/q8ss/csM7bt20uyIispheXBEREREREXkSPPr/PXjpiXtOvWQymXx3iPE5CJl/KiwZ2hm7a8/JTt1ctdgua+jf3Zuq6O5mebus921o99aKt2+xPdYSb2a7PSfec894i6z3bUlu1uTtDemsJXZmz4s09luXssfp2xI2Y83j7da9M+6E2tDOsF3WEjKjvxewhkzPsdfYc5M3a/TWSo/9hTYDwjSgms5eWIn0EzJXBeDhUBRvW1le+sDJk0sfetEnjhy2SyIi0p9eXBEREREREXmSPPKmC/c8frIKq7uOfj/K6m+WwFUBuJjeTGMNme5h+6xh1jujTqh53fL2hnTS6D1E1nJy+3ZmzwnrjdYas13G2xvS+7aEPfceb9F2e06GdsbbZZ01DOj23Ed9TetS73Fst+cmb+Z1y9tjH2/CImvIdMbbHdDp7wPgu0Cme9g+a+jfW8ee11ihDAibAXEKVFVEXPA3VhBxKAB3ry4v/dzq8aV3X/bpY4/ZFRERGU4vroiIiIiIiDzJHvg3l1wwPnnk0o3p5PXTsvraCNxodwDnBhtrizSv8a6vOx2zyJqH7bKG/n3wTVUmtzvgc0Z5n89OcLA91jCg23Pifaweb5H1vg2ZbuX2vBnrrMHprOV4n9NOGNCwhc6w3UbrjDuhxjprOWyfNfA++PcBr+fYa+y5yZt5n98e+02hDEBV/zNgk8UvqgTgcASeWCpGv1gcW/6NF9xx/JDdERGRrdOLKyIiIiIiIk+Rh37pec/a/NyDry6n0y+PMb4SwAtbC959M68zbHdB287Nv47cnjdjnTR6Y5W1HLbft8HppvX6fFre3pDet2HWvRHlLdtuz8nQbrE91hJv1rfb8yKN/dal3uPYbs+J17Fg1uTt1Z2OWWQNmc54uz07/T0g8WZe97B91tC/t449rgllAEoglgHlRkRIQ+faGHG8AI4Wy6NfHq/uecfV33Ll7eENH53YPRER2R69uCIiIiIiIvIUit/63NW7nvP4c5eXN1+xuVn+vRjj82LEc0LA0mzBXuG0HLtvz4l3g51F1jxslzX071u6qcp4u7bbc9Kjz9/0dhm2y1rizWy358R77pncop3ZczK0W97emeyseRq7ncs6YUCD01nLYfve1wCNNTZjzePtDuju7wVDe469xp6bvFmjt1Yy+6EMs/k0oNokf1OFX3t4FIrfWtm98p+q3Uv3XP2Hh++Lb79lFF7/jtIuiojI9ujFFRERERERkbNA9ZaXrz2y+amLTq6vvxbT8m8B8dWAe/PM7wzbZQ2z3hl1Qs3rlrfHOmvgnd5UZW0Rdk3fBqebNj+yXcbb24nOGmbdG3V4i7bbc+J1LJg1sT3WsIUOMrPnHLPbOnqPY7s9J0M74+2yr4FOaPBmXrdye97Mfm69PXR357zuYfusoX9vHe011ezHz8dpQFyP/i+ykWPA5gjhT8J49Dt7xsWfXf7hUx/RiyoiImeWXlwRERERERE5izzwpkt2LVWHP/9kKL+hqqqbq4iXhVj/LZbEuc+W1bzGu77udMwiax62yxr6d+9+o93Lyu3amT0nC3pr7O0ybJc1ZDrMbMFebtziLbLetyHTGW93SGctsTN7XqSx37rUexzWWYPTWcth+97XAI01NmPN4+0O6IN/L/B6jr3Gnpu8WaO3VtKhAgICqimAdcz+por3WEkEEPDnoRj97vIIn3jBn22+85O3XLd8wztu3bSrIiKys/TiioiIiIiIyFkmxltGj/7I/7poHSdfPqkmXxvL+E31LbR9p5dal+Sx3UxjIx4zvSm3w2asgXd6U5W1HG/fdnv2WtKYtdZy1zR5e0P6FhobU96i7facsM6ax9s9U92eFzH782PucezMnpOh3crtsfv5ndDgzbxu5fa8mf3cenvo7s553cP2WUP/Pj9WAGJAmAKTU0DR/AV5jzXzcED4s6VR+M/x2Mq7V15x/vEr33bPul0SEZEzQy+uiIiIiIiInMWO/cSzLjp04uhXFuPpq8pJ/LsI2AMsvOHWZfftOWE3VuHss8bk9rxZz+7eVPU64+3abs9Jj95a8fYZtssaBnR7TurujTu8Rdb7NmS6ldvzZqyzBtLtuY/GNa3Lvcey3Z6b2Iw1Jrc35PcAbKEz3u6APvj3Aq/n2GvsucmbNXuc/X/VJACngMh+ESQBuCcCJ0ej4h3jULxtz8UHH770nQ+dtEsiInJm6cUVERERERGRc8ADP3H+tevrR/92KOPzS8SvGAH7Y8SK3XOxG3SZ1hl1Qs3rlrfHOmvodnYfci43Y9j+dhq6fX709q3cnjdjfWBjIyq3aGf2nLDOmsfb3Ynet+U09luXeo9juz03eTOvW7k99gJLJ9S8jgWzptyeNzN9S78feN3D9lnDgh5nd+TmL6qU3nItjQPuBnAyhOKPx7t2/7v9ayufveTdj5ww2yIi8iTRiysiIiIiIiLngBhj+PQPXrtn93kPXRumGzdtrk+/GxGXxYilELDL7lP2/p09J+zGKpx91hhvb0gnzb2h6nWPt2+7PSc9+vxNb5dhu6wl3sx2e068557JLdqZPSdDu+XteR3OjDWQbs991Nd0Lu2EAQ1b6Iy3630d0LiFzrBd1hIyo78fsJbkZh57jT03mVkIQKyAOAmoTgGoGguZx4kRJwrgzlCEP8do5S2TMQ593gePHwohZK4SEZEzTS+uiIiIiIiInIPu+fG1m0fTeP3mZPrNIcbPryIusDst7BbcgtYas90kN2vy9lhnDd1Ob6aiu5eV27Uze04W9M64ExzeHuusJXZmz4n38XrYYt+WsBlrHrbLGjIdzqxv85jd1tF7HNvtOfE6FsyavL26d8adUPM6FsyavD2vozvb0u8HuRnD9llDu8cIxGlAPGleVJkv2AAAKENEhVH4nVGx9JbRZHTPCz5+/JBdEhGRp4ZeXBERERERETlHxbe+dNdDD3/qi9enk1ehrL4EEVdG4Nl2b87evLPnhP1X651Q87rl7Xkdzoy0Ld1Qtbxd2+25yZvVvTX2dhm2yxoGdHtuYs+/x1u03Z4Tr2PBrMnbY521xJvZbs+LNPY7l3bCNluSm1lst25sxKPTWcth+6wlZEZ/P2Atyc089hp7rgXMZnEaUJ4EkPvnvxqjGFGGgOloHN4Rw/iXR+X4U9d+9PijzXUREXnq6cUVERERERGRc9yjv3DVvmPHHrluNNm8YTKd/mgRMakqXIKApdYiu6/nNJZ5zHSL7bGWeDPT6c1UdPeyvF3W+za0e2elExzeHuuswems4XT3xh1ssW+D01nLYfusYYc6ax6z2zp6j2O7PSdex4JZk7dX9864E2pDO+Pteh3d2ZZ+P8jNGLbfaFUFFMXsn/8qTwIh/U0Vdl0S6xdVCkyLIvxmWSz917ASP3rj+9fvs6siInJ20IsrIiIiIiIiTwMxxnDk555zXlUd3/vE4fUvDph+UxXj19m9zs09e07YCyydUPO65e0N6aRt6WYq4+3bbs9Jjz5/09tlvN3tdntO6u6NO7xF2+05Gdqt3B6bsYZMB5nZ8yKN/dal3uOwzhqczloO22e/ByTegHXWctg+awmZ0d8TWEtyM4+9ZvbiCBCBMA0o7c9UqXc8EVgvQvi9UVj6T9Wu8lPX//Hm7XZHRETOLnpxRURERERE5GnogZ9YfdXkRPk1VYyfFxFfAeAgYG7uZW70wbuxSmOmW2yPNfTv9EYqunu9sGu209DurRVv3/L2dqI7jeUsdkHfBqez5vF2d6L3bTlmf37MPY6d2XMytDPeLvta6IQGb+Z1xtv1OrqzLf2ekJsxzf0IoAqIU3R/UH0Tz6ciwrvHS6P/uQTcevWfbrzXLoiIyNlJL66IiIiIiIg8DcV4y+j2n3z/weX1Yy9CnLyyLMvvrm+U7g3AyunF1mWn1b019naxYNbk7Q3ppG3pZirj7dtuz8mC3vvz2eTteR2Zme32nLCb6p7cop3ZczK0W97emer23EfjmvmbucdhM9bgdNZy2L73dUBjjc1Yy2H7rCVkRn9PYC3JzTwlEGJANQXiKSB6L6okjXEAJgjhfWFU/O/VcfH+539w/f33vu6ytct/+/5TzUtEROTspRdXREREREREnuZifPvogR/9R18SUR2Yrm/+81jhhTHg/NnQbteG3FRlzcN2WUu8men0Riq6e1neLut9W1LPOiud4PD2WGctac4W7OXGHWy5b0vYjDUP22Ut8Was9205jf3WpbnHsTN7ToZ2xttlXwud0ODNvM54u15Hd7al3xNys4ZYAUU5e1GlXAdCemc9ro8VHh2F8Ekg/Onq7vHvLj22dMf91+079Uq9qCIics7RiysiIiIiIiLPEPE/fvHq/fd+6G9Wm+Hy6XT6LTHgQABe6N4QHHJT1euWt7cDfUs3Uy1v13Z7Tnr01oq3b3l7Q3rflrDn3+Mt2m7PidexYNbk7bHOWuLNbLfnPuprOpd2woCWsBlrTG7P+zqgscZmrOWwfdYSMqO/J7CW5GYAUAGhDIhlQLkeu//8V+76iJMB4U/G4/Dp5WL0Ow+cWPmrL/xXX3E0vP4dpV0VEZFzg15cEREREREReYapfvr8vTh5Xrgf93/NdDL9+qqMLwbwLEQcCAHFfHHITVXWPGyXNfTv9CZqkptZ3i7rfRvavbPSCQ5vj3XWQLo9J3X3xhRb7tuwhc6wXdaQ6XBmfVtOY791qfc4tttzkzfzupXbY78XdEKDN/M64+0O6O7vC16HM4sANsPs56psRFT2RZWE50MFwh+FIty5fGDlfywfKz71uRddfezmX/7oxC6KiMi5RS+uiIiIiIiIPEM98v9ct+fIvQ8fWFs+9QXTavpF1bT6+0j/XFgy5Kaq1y1vb0gnjd5IZW0R7xrb7Tlh3bT5ke0yuT1vxnrfhln3RpS3bLs9J0M74+2yzhoyHWRmz4s09juXdsKAlrAZa0xuz/taoLHGZqx5vN2BffDvC41ZrIBiGlCVsxdVBv1MlYBPR4S7x8C7qmL8sYP793/s4j/8tlMhvLlqXiIiIucuvbgiIiIiIiIiuOf/2vf8olh/QTWNXzyN1StihRcE4GKw+5CdUPM6w3ZZQ/9Ob6Kiu7eQt8963wZz09bpWd7edrs9J94N9Rx2Qd8Gp7Pm8XbPZGfNY3ZbR+9xbLfnxOtYMGvK7bGvh06oeR0LZk25PW9G+pZ+XygDMAmIFVBuRIRFL6okEUDEZ0II943HxR8FjP53+IJLP/6CX7xjw66KiMi5Ty+uiIiIiIiICIDZD77HO94xOnrnu17y+OPrr0GIL6oQr68irgjA6PRi67LTvG7l9rwZ66TRG6ms5eT2m7O+e6S1xmyX8fZ2orOGWfdGlLdsuz0nQ7uV22Mz1pDpIDN7XqSx37m0E7bZktysKbfnfS3QuIXOeLsD+8LfF0J9LgOKzdkPqp9uRgTvAbs2QsDHgXB/COHWfbt3/85l3/7ln9TPUxEReXrTiysiIiIiIiLS8cSbLjt4aOPowSKc+vthGl9Shfi1MeJUCFgDnJuYrHnYLmvIdHRn9CYquntZ3q7t9px4HadnnZVOcLA91pDpIDN7Trwb6h5vmXXW4HTWmNyeNxvS+7Ycs986eo9luz0nXseCWVNuj309dELN61gwa8rteTPS3d8XqvrOWBlQbATEacC0qoDSu6DjiRjx0KgIt45GxUcOXnLxr1/4u//oEf3TXyIizwx6cUVERERERESy7v/RvddU08nNVVneXG5U/7gKqAJwoIqIRTB/rux7T9LbY521xMzcm6he97D9vg1Otx+re8jw9rbb7bmJ3VD3eIu223OTN/O65e2dqW7PfTSumb+Zexw269uS3KzJ26s7HdO4hc54uwN78/eGUAIxBFQTAKeAEANijECMvZ6PEHAfKkxiwOeWRuNfmx5b+a315+1ev/mdD520uyIi8vSlF1dEREREREQkK8ZbRgBw7C3/6+ojh49fPC2rryqreFMs45WhwNXt5dYpj+2yhv79jL64AtLtOenRWyvePsN2WcOAbs9NQ15cgfNYfVvCZqwx3p7XkZmx3rflmP35Mfc4dmbPidexYNbk7dW9M+6EmtexYNaU2/NmpMcIhDLMZtOAaj0ikr+hMi/dEQLwIIDHihA+i5Xxbz1rc9f/OP+rL14Pb7510+6KiMjTn15cERERERERkUGOv+nCi+87WZ1YWzr2HdW0+sIyxhfFEruLEc4H+E1JyttjnTXwTl9gYW0Rdk3fBqeblruR6/J2h/S+Dae7N+7wFm2358TrWDBr8vbOVLfnPhrXzN/MPQ6b9W3IdMbbrTsd07iFzni7PXvcDEAJIM5eVEH0XzG0z0UMmIwijsUQPjQqwl+HMPq9PeXSpy/9mucc04sqIiLPbHpxRURERERERLbsjn+59+rVUfXc6ebkleW0emWs4isisApgFAJGdr/Fubm53U5fXEF3Lyu3a2f2nPTo9kZuL97udrs9J3X3xhRb3k5LcrMmb29ohzPr23K8z2snNNiZPSdDO+PtDv24vY4Fs6bcnjeLADYDQhkQS6DciN1l59o4+z+PRuBkKPC55WL8a8XKyh9cdcV594e33bNu90VE5JlJL66IiIiIiIjItsR4y+hzP/veC5fLzdUjx9e/vNrEdVWcvjpWuCoU2G3355wbmzvR6QssrOV4+7bbcxObNVprzHYZb8/rcGZ9G2bdG1Hesu32nAztjLfLOmuJN7Pdnvuor2ldmnscNuvbkOmMt8s+5oTGLXTG2230UM3O1WZAUQXEMqCcVM5vCPQxJwVwd1XgaIHwl3tXVn7jxInwiWs/evxRuygiIqIXV0RERERERGRH3faDBy9bGx9/2bTCCyab5WsA7CsK3Gj3yI3NmaEd7Zl3HxVY8BiWt2u7PSdex+lZayW3b7Fd1pDpIDN7Toa+uALnsbbTkOmMt3smO2s5jf3Wpd7j2G7PTd7M64y3W/fOuBNqXseCWVNmr5gERADVBoBNoKq8T6xxenYiRByLRfhQMSo+Mt114O1Lp8pDL/zgY8da+yIiIg16cUVERERERETOiENvPH/vqbB+RTmefn45Kb+4KuOLAnB5KHBwvuTd+GSdNXT7jr24Ame/b4PT7cfrHjK8ve12e24a8gJLbtHO7DkZ2q3cHpuxhkwHmdlzH/U1rUu9x2GdNWyhM95u7mvBGwztTL0b0pv131CZbkRUUyCwb36SkhhxdxFwFCHcO1odv31Srb33ko1w5Pw/fexYCCFzpYiIiF5cERERERERkTMsxreP4q//+OpDt9/54s3J5peUm+W3I6CKwMWxQlEU5GezeLc1WSeN3WMF+G6Wt2+7PSc9emvF22fYLmsY0O25KXdD3cot2pk9J0O7ldvzZqyzlrAZax6z2zp6j2O7PTd5M68z3q739UBjpmPBrGkKoACwUSBOgVgCmEZE9xuePnZEwO1FDHegwP1hafS716xe84HwuqXN8IaPTuyyiIiIRy+uiIiIiIiIyJMixltGR/71n+4blydXD5/ceElZrX9huRmuiLH8ohhxQRhhuaoQi6L+s2r3pihv4J3eb2VtEXZN3wanmzY/sl2Ptzuk922Jd0Od8RZtt+cmb+Z1K7fHZqwh00Fm9rxIY791qfc4rLOGLXTG2819LXiDoT3ZrG9frQPTyez1lRgAVLkPopbmEXcBQBiF9xTF6BMX7Nnz7gtecdGd4c23brYvEBER6UcvroiIiIiIiMhT4t7vvWyt2HPkxRvlxgXlevGSIpY3TSfVzWGEg6Mx1tybpqyTRl9cAd915XbtzJ6THn3+prfLeLvb7fac1N0bd3iLrLOGLXTL2/M6nBlrcDprOWa/dfQey3Z7bvJmXme8Xe+1DRozHY1ZnN2tihHAJACTgDiNiFPwb2qSkgjEIoT3IGI9RDy0Z/fqf3rs8dFfvfgbLj2pF1VERGS79OKKiIiIiIiIPOXu+P6LnjVeXd+NyamvXV/HTaOi/LxyGg4WRbw0FBiF9LdZkLmZSjq7F8v2sth+35awWaO1xmyX8fa8Dme2hcbGlLdouz0nXseCWRPbYy3xZn27PffhfW69x2KdNWyhM97u0BdXkJlFIJZh9vNUNgJQAqEEyirO/oaKx44CTgC4twAORRQfWkZxP1ZW3lUcHx163r950Ynw6vdNzRUiIiJbohdXRERERERE5KzyyA/sungSRvs3p5Ovm8Zyf6iqv11G7BqNcVEIKDo3UxPTI2lzXme8XdvtOfE6Ts9aK7l9i+2ylngz2+058W6me7xl1vu2JDdr8va8DmfGGpzOWo7Zbx29x7Ldnpu8mdet3B77muiEhnoWq/rnp1RAmAagAuIEqDYxe1U0pL++0u/xQsTdoQifBbC5NBr/5sru5U/jftxx+a1HH7eXiIiI7AS9uCIiIiIiIiJntTt+cPeNsaqeV4Tpt26crD5/eRmX2R2gewOW/q2VJDdj2P52WuLdO+4Eh7e3Ez3T2MjlLdtuz4nXsWDWxPZYS7xZ327PfTSuaV3uPRbrfVuSmzXl9tiLKyDXxPouVAWEMsyu2wBCCChLAJPMD6Z3MmYvqjyIovjdcRHuXl4ef+r+R5c+9Lzn7tq49J0PnbS7IiIiO0kvroiIiIiIiMg54S++Z/+Bg3vWz988Gl45KeMNY1RfWobqqqVlHAD4DVjvXi3bzfL2bbfnpEdvrXj7DNtlDZkOMrPnxLuZ7vGWWe/bkOmMt3smO2s5Zn9+zD2Ondlz4nUsmDXl9tjXRAoRCBUQY0DYDIgBiJOIOMHsxZQiLP7B9I1ZBDYjcM84hI+UIdy3XBR/NI3jh677nq/5NACE17+jbFwpIiJyxujFFRERERERETmnxPj2Ee7+70t3/vwf7B+tHP2yJz6Hi1d2ld843YyXrO6Nz4tALOo/7+7YiytwrtlOQ+emcVsnOLw91llL7Myek7p7447cop3Zc8I6azlsnzVkOjIz2+25j8Y18zdzj8NmfVuSmzXl9shrI6EMwBSoSiCuA8WoQCwjyjIidLb9x48R6yFgNVY4PhqFDyOEjxQIh/bu3vuuWK4cuvQ9DzweQnCuFhEROXP04oqIiIiIiIics2J8++jBt/zL8+56JCzvP3zfS5aW4pdMp9MrR0W8AQEXjpbiXgSMwuznZJuLbVjA27fdnpMeff6mt+th+6xhQLfnJnIz3ZVbZLO+DZnOeLtnsrOWY/bnx9zj2Jk9J17HgllTbq8EQpz9E19hM6Cq6n/qK/fD6JvaaxWACSKOhFH42KgoPhiKpQ+NR9XRBw8t337Vxaubl7z7kROtK0RERJ5k3f9xKSIiIiIiInIOu//7znvOo4fDs8+7cOO5Tzw6+ZLxUvUKVLhwaTVeFCOKYoQC6NzMzcvtslnfhnZvrXj7Vm6PzViD01nD6e6NO7xF2+25ic1Y83i7QzsyM9vtuY/GNfM3c4/DZn1bkps1Nffi7K5SKMPsB9GXAeWpiID6B9G7f22MCxGHEBBjxG6E8MdFKP6wLMafWl2rjl249KxPHb4gnLriNV8w0T/7JSIiZwu9uCIiIiIiIiJPW4feuPbsE9XagVMnNl48DpO/eWodzx2tli+Ok7C6vBxXUGAcZi+1LObdK7bdnpu8Wd1bY2/Xyu15s77dnhP28eZ4i7bbc5M387qV2/NmO9FZy/E+t53QYGf2nHgdC2ao/y5JAYSN+uemTIFqs0CBiHJSv5iy6DGIWGEzjHDbCHisGI/eOVpe/tBmtXkonNr70As/+Ngxuy8iInK20IsrIiIiIiIi8ozx2e/efdETTyxds7Sy/vkbR+Irl1bK563ujdcXAUUVEUbj+m+1MN6NY9b7tmQrN9SbvL2d6AsaG1NssW9L2Iw1j7e7Ux1kZs991Ne0Ls09Dpv1bYmdxfqu0TQgRKBcB0YhIFZAuen8c18kWSHicAw4BCAghHtRFH+0VBYfOBVHn3lRWD0V/vmXnoR+ML2IiJwD9OKKiIiIiIiIPCMdeuM1e49uHL7y+JFjf2PvgbDn8KOTV6ysxC8IwMrynniwmiKGEUJA40/P3s1j2+058Tq2cEO9ydvzOjIz2+05YR9vjrfIet+W5GZNuT1vxjprCZuxluN9bjuhwc7sOWG9/ksnAbMXUyIATIGiDJhOIjDF6X/my/vY4MVawIMB4WMj4FEgPLBr99rvPVrsuuumP3jDYyG8ubLrIiIiZzu9uCIiIiIiIiLPeDHeMjr+A398/iPrGxcdX6+u2zheXbU8Lm8s4vTGpd3x+aNxHBVLGMcK9ast9gFsGNDQ7p2VTnB4e6yzlrCZ01jOYhf0bdhCZ7zdneogM3vuo76mdWnucdjMa7G+I1QBKAMQgDgBQhWAaUQ5ae6aB8k977PH3kDASgi4PwbcPwrhrqrE5mhU/BeMw7FHN/b82aVX75lc+bZ71u3lIiIi5xL2PwlFREREREREnrHi298+wi1/HUN4c3XXd1z44hPHTnze0cN42Z6D1ZWTzeqytT3V8wtgPFqLS7EC5j+zxd5xtueE9e79a+eQ4e0N7SAze05yN9oZb5n1vi3JzZq8Pa/DmbGWsBlrOfV+57JOqLGeWjz9YkqoAmIJYDMABRCnEXECAAEREagWPKnk44oR0wg8WBQYjSLuQFG8dzQa3Q6E9UsvP//D993zxMa17zv+aOMSERGRc55eXBERERERERFZ4N7XXbY2OnhReODQA9fvfc6pav3B6d+ebFbPXt07fdVoFPeNd8UDYVz/pZZ0Izu9bbGGdm+tePuMt8s6a4md2XOy4D58h7fMOmvYQmfYLmuJN/M6yMyeF2nsty71HqfRQ/0aSRGBOA2IESimAVUJlJOIEIEiBMS4hZ+dUs9ixG0BWMUIT4QQPhHj6AOhWP74GjaeAPY/gSt2PXHiit3VDW++ddM+hIiIyNOBXlwRERERERERGSjGt4/efsvPLT/2kQdXv+SLjn7tBjZeOC6r58VQ3bQ0woXFUtyDpTgqRo0/dzf/BM5uXps2P7JdJrfnzVjv25IhL7DkFtmsb0OmM96u1+HMWMMWOtPY7VwW6/+v/poK5exf+CqmAYhArIA4mf0g+ukkIlQRKMLsFZfmY3jsLGIaAx4LwEMFwmdQhEerCuO1pfH/eODR5fcfuGRjz41/uH6fuUpERORpTS+uiIiIiIiIiOyA+Kbrlh97fHP1jrsP37xrN54dpydfvblZXre2J15UAM8a7Y6rIcQiLCGgatwbJy+62Hvb3eDI7bEZa3A6a5h1b0R5y6yzBqezlsP2WUu82ZDOWk5jP70uEgIQ63/SK0wAxIA4icB01qpJrH9OSuj+vJQmZxSBKlSoUKBExDiMw6+FCmWI4cR4eendEeHEs/bu/8SRcXHyOd/5/El49fum9jFERESeCfTiioiIiIiIiMgZEGMsPv2D1+4++qnDN1Rxct7+tY3P25yG547Gk8+rpvHZy3twwWgprhYBRVyKQJjdOEd937t179u5Ed6R2/NmrPdtyZAXWHKLbNa3IdMZb9frcGaswemsWRWAov5/IxARgM1Zq0pgVAZUZZz9IPoIxDIishdRSOo4vXMkzP7Cy11AeGxUhNsKFB8PS0u3FShPlHH58X3F6iOT/UvV5b99/6nWY4iIiDxD6cUVERERERERkSdBvOWWEa67Lvz+O9+5fMOVtz3n6KnVK8Lm+os2YnX9ngPTl5eo9q/sis8KI4QwQqgAhBARi/QA9U33uOBP895N9Z3omcZGLm/ZdntuYjPWctg+a8h0ZGaspxZnz2eYBMSi/psn1ewvm4RpQARQTYAQAmKsUJWzn6EC4PSLKezxEzKLESdCwG4AxwLwWIXwpwGIxSjcMyrGf1ZOq4+uP7H6xE1/eeQJADj0yvP3XvjBx47ZxxEREZH8/xwTERERERERkTPs1u989vnnXXHB+l2//9nXXPS8tYeOPHryb62MqsvCavWS6am4Z3k39oeIEFbiMgJiGNc/QmMUUVUBxTjObso3X4SJ5E/85Gb7nDez3Z6THvf6W7xF2+25yZt5nfF2t9lDBGKY/SyUWP/rXKEKs1dHJrMXUaoyoMDsB8zHCTBaCign9U+iD+mi9FeZnHfsZGA2C8B9MWAVFUII+GxRhL8Oo+KOgOKeoiqeqPau3r20Mnr8iu/4jkfxJbfGEN5R2ocRERERzv5PLRERERERERF5isS33zIKr39H+dA377/iT3df/NjVRx68brqOixDLFy6vxs8rq/L6WAFhjIuXirgWY9wTlkMVxnEUYwBGEUUBVKOIEAGMgVDN/oWp5n369Pbpd2zOCeuZxkYutty3JWzGmsfbJT3Unzugnof6n+4CEMuAUNSvqNQ/gaSazH4GCqYRRRFQTeJsLwKxqv8pr2B+yPxQ3UtvjQHrRcSJAqhiCI+EovjQ8mh86zSOjh589tJ9k4cue+LiV04nuP76MrxeL6aIiIhslf2fUyIiIiIiIiJyFokxBgB4+Nuff+HFp8qjt504/KJQYv/m5saVq2vF2mSzvHEyCdcvjatL4ijsHhXVBXEcThUF1ooCKOt7+GEUZzf7w+ymfDWKCNOAsBxnf1ki/ZyPxk7rBYX5B2TOyZCfu4L842TPTd7M61Zzr/mCSQBiCYwDUAJAefqf7goAMMXsZ6FM68ti+psoEXEzIhahft2kfpELsxdUXPlRDM37NxFHEHAMwPECOBYR7ipGxSdDCA+XMV6wtrTyv0OIo0lZPHLVKy6799PvfmTl2huuWA+//NFJ64FFRERkW/TiioiIiIiIiMg56rbXXXzhC3774UOf/abdLyqm06OnlkbXY6NYKcvN146W4+UhxksnG+HI0lK8JCCsIsbzwiggjuNSRKiKgGI0AiZVxHgcECNQhPqFlwqIo/pfqBphdpu/wOzVhgAghtnPhIlAGM1+Gnqs1wIa/0xZ3egdiJL8HJn6xY369Z3uCw/1izhhvnD6n+GaP079z3GFWM9mW0D9glIM9Q+ED0CcAkVRX79ZP0Q9Qzn7hFRlRJzO/hmvqooI9b/1FdMHYD5G+yEDXqydnk1mf98I64g4jALnIeJ4gfD+UOB4DChCMfowYji6tmfl1pVi5fBFF110+MHy0dElD+/b+Nhr9qyvPngq3PDmWzdbjy8iIiI7jv1PGxERERERERE5Rz3w2kt2XfrOh04+8q0XXrx7N/DQg8dfNl4eTzYn06tiGXdVVbkXwDiMcD0m1YUI4UCM8VkhYgNLxYFYRQTElRACUMz+pkYYxdnPDqmAYtR44SGE2YsoZUQYB8QKwLh+daW+6RAwuw7pBYzUSiCMT/9tmfQCSSxnf4smVrOG0awBs91YzP6pMyzNfqYJAlBNZy8Kof7ZJlWc7cQRUG3Ofi5NrOLs42j8G2mhmv3A+KqsUBQFqkk1e8GkCO0XQ+KCv5ZDZq10+rABYCUCR+t/NAwx4IEAHA0IdyPiIBBuD8B6EcL9EeNbY5jcX4yWihf8zxN/deSW55y3//WvOIJbALz3cyG8+n3T9E/JNd+diIiInHl6cUVERERERETkaS7dgK9e9/K1zzx4+3jPdav7i8eP7JnuWZtsHjtxdRhhhFhdEMvqsqqMB0MIu8uqfGGMRRFQfWGMuDcGHBwBh2PEJfXLBUsR2AjACgBUEdWoKIqIiCKE2T+JVb8ugSKgiLMXNcpYIdR/NaUo6tcd6p9dUpYRoyIgxogQAmL9N0diFRERUBRAqNKLH7NXLKoSCKPZTgizaxHj7MUSNF4USf++GXkhZG5rsykixukQgWMRWA+zf1XscAWUBcKtAVhBiLsjio+FgI0iFHeOx+M7qwqTalyWK9VoaQoc2j3dc2e1UsRL3/nQyfa7ERERkbOJXlwREREREREReYaKb79lNHvrFuCWv46f/vrf3H3tf/uxk/fc8k8uXwuXHjpW3XXt5OR0o1gd3TRC8Vg1nb4khLi7iNiIIZRxWj2vLLAXVbwkAucVwKkyIMQK+wAcDBGPI+CKAJyMwO763aZ7EbMXJSI2EbCcPibAfyEjRlTpb3xsUeuFkI4KGwhYiRHHQsDeCBwLEaPZCMcLYC0At0dgHyIOhwK7AayHGO4HcLwMKJZHxV+FEqewPLoXZVwpxqu3TrCxMqpQTY7s+szkit3jG//Ty47iDXeufBSY4KXAzW/Qz0MRERE51+jFFRERERERERFZ6JNvum75hjffuvmprzt/74WbMZx/zd7irgcev+hkeM4DS9MHn39wZePQkRPxypXdo5VTJzefu1YsPXyyLJ+DGPcB8YIY40UhYi0C0xixFmO8bFSEB8uIAwE4gQKjKuJzIcbnIeK6EPDZGLCKChsAnhci7qoKXF2UuLeKeE4IOAJgNQIrAXg4FFhFhQdjwFoscXEoZj+LPgL3hoBRmP2olBAqHETA5xBxIUK4J8Z4TYh4AKNwfBTD7VMgIsaVEMITRUCoEB5cGY1u2yzjShHLMYrxZrVUPH7+8ujoiVNx+djS5L6lU+Pdm0ujR/YDuPyCF58C7sanbz++9MIPPnbs3tddtnb5b99/yn4+RURE5NymF1dEREREREREZMfFb/3i1fC2960/9OUX7V5/9mp57NEn1m781l85iv/+b5c+9fhHXrxn5fy/BI5euhKmxw+fKg7suWDfieNHjlw9jvHI6t5dx04eWr9ktFqeKtfj2vKu8XSyUT67rMLx5WVU5WZ51fJyePRUWW2srS0/ullWu8vN6sB4VBwrUT5rVzG+t5wgbMTq2DjE5aXlYjc249rxgIf3rew6vL6xccHucTxy9GR53mbE3WvPe/bGsVN7Nw8euev85RhKnFw9dOjCleUbr95z4r6/Pjoqd4/ilW+7Z33+a9PPORERERERERERERERkadajOnH3c9evDj9T5a1vfWtL13687e+dCmdb/tnV60AwL2vu2wNAGJ8U+efDYvx9GPFW/zHFhERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERH5/7cHByQAAAAAgv6/7keoAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMBRI6R2kPq77XEAAAAASUVORK5CYII="
 # ==============================================================================
 # --- SECTION 1: APP CONFIGURATION & STYLING ---
 # ==============================================================================
@@ -25,409 +35,33 @@ st.set_page_config(
 )
 
 # Custom CSS for Glassmorphism UI
-st.markdown(
-"""
-<style>
-/* 1. CLEAN IMPORT: Single line for both fonts */
-@import url('https://fonts.googleapis.com/css2?family=Inter:wght@200;300;400;600&family=Michroma&display=swap');
-
-/* 2. HEADER FIX: Makes the header transparent
-header[data-testid="stHeader"] {
-background: transparent !important;
-backdrop-filter: none !important;
-} */
-    
-/* FIX: Make the "Hide Sidebar" arrow visible at all times */
-button[data-testid="stSidebarCollapseButton"] {
-color: white !important;
-opacity: 1 !important;
-}
-button[data-testid="stSidebarCollapseButton"] svg {
-fill: white !important;
-}
-    
-/* 3. BACKGROUND IMAGE */
-.stApp::before {
-content: ""; position: fixed; top: 0; left: 0; width: 100vw; height: 100vh;
-background: linear-gradient(rgba(0, 0, 0, 0.4), rgba(0, 0, 0, 0.4)), 
-url("https://images.unsplash.com/photo-1663104192417-6804188a9a8e");
-background-size: cover; background-position: center;
-background-attachment: fixed; filter: blur(2px); transform: scale(1.1); z-index: -1;
-}
-.stApp { background: transparent !important; }
-
-    /* 3. THE "RESULT BOX" FIX (Force Dark Background & White Text) */
-    div[data-testid="stVerticalBlockBorderWrapper"] {
-        background-color: #1E1E1E !important; /* Solid Dark Grey */
-        border: 1px solid rgba(255, 255, 255, 0.2) !important;
-        border-radius: 10px !important;
-    }
-    
-    /* Force ALL text inside the result box to be white */
-    div[data-testid="stVerticalBlockBorderWrapper"] * {
-        color: #FFFFFF !important;
-        -webkit-text-fill-color: #FFFFFF !important;
-    }
-
-/* 4. TEXT DEFAULTS (RESTORED & FIXED) */
-/* I removed 'li', 'ul' from here so they go back to the "smaller" standard size */
-h1, h2, h3, h4, h5, h6, p, label, strong, b, .performance-row, .performance-row div, .performance-row b {
-font-family: 'Inter', sans-serif !important; 
-font-weight: 200 !important;
-color: white !important; 
-letter-spacing: 1px !important;
-}
-    
-/* ... (Your h1, h2, h3 rules remain the same) ... */
-
-h1 { font-size: 2.2rem !important; font-weight: 700 !important; color: white !important; }
-h2 { font-size: 1.5rem !important; font-weight: 600 !important; margin-top: 20px !important; margin-bottom: 10px !important; }
-h3 { font-size: 1.1rem !important; font-weight: 400 !important; text-transform: uppercase !important; letter-spacing: 2px !important; opacity: 0.9 !important; color: white !important; margin-top: 10px !important; }
-h4 { font-size: 1.1rem !important; font-weight: 400 !important; text-transform: uppercase !important; letter-spacing: 2px !important; opacity: 0.9 !important; color: white !important; margin-top: 10px !important; }
-
-/* 🎯 TARGETED FIX FOR THE RESULT BOX (TITANIUM VERSION) */
-    
-/* 1. The Glass Container */
-div[data-testid="stVerticalBlockBorderWrapper"] {
-background-color: rgba(0, 0, 0, 0.6) !important; /* Slightly darker for max contrast */
-backdrop-filter: blur(10px);
-border: 1px solid rgba(255, 255, 255, 0.2) !important;
-border-radius: 10px !important;
-}
-
-/* 2. THE TEXT OVERRIDE */
-/* We use -webkit-text-fill-color to force the paint, and opacity to kill transparency */
-div[data-testid="stVerticalBlockBorderWrapper"] * {
-color: #FFFFFF !important;               /* Standard White */
--webkit-text-fill-color: #FFFFFF !important; /* Forces white even if browser wants grey */
-opacity: 1 !important;                   /* Removes any "ghosting" or transparency */
-        
-font-family: 'Inter', sans-serif !important;
-font-size: 0.85rem !important;           /* Your requested small size */
-font-weight: 400 !important;             /* Normal weight */
-line-height: 1.5 !important;
-}
-
-/* 3. Headers (Teal) */
-div[data-testid="stVerticalBlockBorderWrapper"] h3 {
-color: #70C4B0 !important;
--webkit-text-fill-color: #70C4B0 !important;
-font-size: 1.0rem !important;
-font-weight: 600 !important;
-text-transform: uppercase !important;
-letter-spacing: 2px !important;
-margin-bottom: 10px !important;
-}
-
-/* 4. Bold Text (White & Thick) */
-div[data-testid="stVerticalBlockBorderWrapper"] strong,
-div[data-testid="stVerticalBlockBorderWrapper"] b {
-color: #FFFFFF !important;
--webkit-text-fill-color: #FFFFFF !important;
-font-weight: 700 !important;
-}
+# The theme lives in styles/theme.css and is served minified as a static file
+# (see .streamlit/config.toml), so each rerun only sends this one-line import
+# instead of the whole stylesheet; the browser caches the file itself.
+st.markdown(f"<style>@import url('{theme_stylesheet_url()}');</style>", unsafe_allow_html=True)
 
-/* 5. METRIC & PLOT STYLING */
-[data-testid="stHorizontalBlock"] div, [data-testid="stMetricValue"], [data-testid="stMetricLabel"] { 
-color: white !important; 
-}
-    
-div[data-testid="stVerticalBlock"] > div:has(div.stPlotlyChart), .performance-row {
-background-color: rgba(255, 255, 255, 0.03) !important; 
-backdrop-filter: blur(10px) !important;
-border-radius: 15px !important; 
-padding: 20px !important; 
-border: 1px solid rgba(255, 255, 255, 0.1) !important;
-margin-bottom: 10px !important;
-}
-
-.performance-row {
-display: flex !important;
-justify-content: space-between !important;
-
-/* CHANGE THIS LINE FROM 'center' TO 'flex-start' */
-align-items: flex-start !important; 
-        
-background-color: rgba(255, 255, 255, 0.03) !important;
-border: 1px solid rgba(255, 255, 255, 0.1) !important;
-border-radius: 12px !important;
-
-/* Optional: Adjust padding if 'top' alignment looks too squeezed */
-padding: 15px 25px !important; 
-
-margin-bottom: 12px !important;
-transition: all 0.2s ease !important;
-}
-
-/* 6. EXPANDER STYLING */
-.stExpander {
-background: rgba(255, 255, 255, 0.05) !important;
-border: 1px solid rgba(255, 255, 255, 0.1) !important;
-border-radius: 10px !important;
-}
-.stExpander p, .stExpander span, .stExpander label, .stExpander table, .stExpander th, .stExpander td {
-color: white !important;
-background-color: transparent !important;
-}
-summary[data-testid="stExpanderSummary"] {
-color: white !important; 
-}
-summary[data-testid="stExpanderSummary"]:hover {
-color: #70C4B0 !important;
-}
-
-/* 7. BRANDING */
-.brand-wrapper {
-display: flex !important;
-flex-direction: column !important;
-align-items: center !important;
-width: 100% !important;
-margin-top: 30px !important;
-margin-bottom: 80px !important;
-}
-.title-container {
-display: flex !important;
-flex-direction: column !important;
-width: min-content !important; 
-}
-.title-main {
-font-family: 'Michroma', sans-serif !important;
-font-size: 3.2rem !important;
-line-height: 1 !important;
-color: #ffffff !important;
-text-shadow: 0 0 15px rgba(112, 196, 176, 0.4) !important;
-margin: 0 !important;
-white-space: nowrap !important;
-}
-
-.title-sub {
-font-family: 'Inter', sans-serif !important;
-font-size: 1rem !important;
-font-weight: 200 !important;
-letter-spacing: 8px !important;
-color: #70C4B0 !important;
-text-align: right !important; 
-width: 100% !important;
-margin-top: 4px !important;
-text-transform: uppercase !important;
-}
-
-/* LOGIN BUTTON (Main Page) */
-a[href*="intervals.icu"] {
-display: block !important;
-width: 100% !important;
-margin: 5px auto 0 auto !important;
-text-align: center !important;
-background: linear-gradient(135deg, #70C4B0 0%, #008f7a 100%) !important;
-color: white !important;
-border: none !important;
-padding: 15px 30px !important;
-font-family: 'Inter', sans-serif !important;
-font-weight: 600 !important;
-font-size: 1.1rem !important;
-text-decoration: none !important;
-border-radius: 50px !important;
-box-shadow: 0 4px 15px rgba(112, 196, 176, 0.3) !important;
-transition: all 0.3s ease !important;
-text-transform: uppercase !important;
-letter-spacing: 1px !important;
-}
-a[href*="intervals.icu"]:hover {
-transform: translateY(-3px) !important;
-box-shadow: 0 8px 25px rgba(112, 196, 176, 0.5) !important;
-background: linear-gradient(135deg, #82d8c2 0%, #00a892 100%) !important;
-color: white !important;
-}
-
-/* LOGOUT BUTTON (Sidebar Fix) */
-/* This targets the standard Streamlit button in the sidebar */
-section[data-testid="stSidebar"] .stButton button {
-background-color: rgba(255, 255, 255, 0.1) !important;
-color: white !important;
-border: 1px solid rgba(255, 255, 255, 0.2) !important;
-transition: all 0.3s ease !important;
-}
-section[data-testid="stSidebar"] .stButton button:hover {
-background-color: rgba(225, 108, 69, 0.8) !important; /* Orange hover to match theme */
-border-color: #E16C45 !important;
-color: white !important;
-}
-
-/* TABLE STYLING */
-table {
-color: white !important;
-background-color: rgba(255, 255, 255, 0.03) !important;
-border-collapse: collapse !important;
-width: 100% !important;
-border-radius: 10px !important;
-overflow: hidden !important;
-}
-th {
-background-color: rgba(112, 196, 176, 0.2) !important;
-color: white !important;
-font-family: 'Michroma', sans-serif !important;
-font-size: 0.85rem !important;
-font-weight: 400 !important;
-text-transform: uppercase !important;
-padding: 12px 15px !important;
-border-bottom: 1px solid rgba(255, 255, 255, 0.1) !important;
-}
-td {
-color: rgba(255, 255, 255, 0.9) !important;
-padding: 12px 15px !important;
-border-bottom: 1px solid rgba(255, 255, 255, 0.05) !important;
-font-family: 'Inter', sans-serif !important;
-font-weight: 200 !important;
-}
-tr:nth-child(even) {
-background-color: rgba(255, 255, 255, 0.02) !important;
-}
-[data-testid="stDataFrame"] {
-background-color: rgba(255, 255, 255, 0.03) !important;
-border: 1px solid rgba(255, 255, 255, 0.1) !important;
-}
-
-/* SIDEBAR STYLING */
-section[data-testid="stSidebar"] {
-/* Dark Burnt Orange Base with Dark Gradient Overlay */
-background-color: #3d1e10 !important; 
-background-image: linear-gradient(180deg, rgba(30, 10, 5, 0.95), rgba(61, 30, 16, 0.8)) !important;
-border-right: 1px solid rgba(255, 255, 255, 0.1) !important;
-}
-
-section[data-testid="stSidebar"] h1, 
-section[data-testid="stSidebar"] h2, 
-section[data-testid="stSidebar"] h3, 
-section[data-testid="stSidebar"] label, 
-section[data-testid="stSidebar"] span, 
-section[data-testid="stSidebar"] p {
-color: rgba(255, 255, 255, 0.95) !important;
-}
-
-section[data-testid="stSidebar"] div[data-testid="stThumbValue"],
-section[data-testid="stSidebar"] div[data-testid="stTickBarMin"],
-section[data-testid="stSidebar"] div[data-testid="stTickBarMax"] {
-color: white !important;
-}
-   
-/* The Main Expander Box */
-div[data-testid="stExpander"] {
-/* Darker glass background for better contrast */
-background-color: rgba(30, 30, 30, 0.4) !important; 
-border: 1px solid rgba(255, 255, 255, 0.1) !important;
-border-radius: 12px !important;
-margin-bottom: 20px !important;
-overflow: hidden !important; /* Ensures header background doesn't overflow corners */
-}
-
-/* The Clickable Header */
-.streamlit-expanderHeader {
-background-color: rgba(255, 255, 255, 0.03) !important; /* Slight transparent tint */
-color: white !important; /* Force text to be white */
-font-family: 'Inter', sans-serif !important;
-font-size: 1rem !important;
-font-weight: 600 !important;
-border-bottom: 1px solid rgba(255, 255, 255, 0.05);
-}
-
-/* Remove any default Streamlit background */
-div[data-testid="stExpander"] details > summary {
-background-color: transparent !important;
-color: white !important;
-}
-
-/* Ensure the SVG arrow icon is white */
-.streamlit-expanderHeader svg {
-fill: white !important;
-color: white !important;
-}
-
-/* Hover Effect for Header */
-.streamlit-expanderHeader:hover {
-background-color: rgba(255, 255, 255, 0.1) !important;
-color: #70C4B0 !important; /* Teal glow on hover */
-}
-
-/* The Content Inside the Expander */
-div[data-testid="stExpander"] div[data-testid="stVerticalBlock"] {
-color: white !important;
-padding: 10px !important; /* Adds breathing room inside */
-}
-
-/* The Selectbox Main Container (The box you click) */
-div[data-baseweb="select"] > div {
-background-color: rgba(0, 0, 0, 0.3) !important; /* Darker for input fields */
-color: white !important;
-border: 1px solid rgba(255, 255, 255, 0.2) !important;
-border-radius: 8px !important;
-}
-
-/* The Text Inside the Selectbox */
-div[data-baseweb="select"] span {
-color: white !important;
-}
-
-/* The Dropdown Arrow Icon */
-div[data-baseweb="select"] svg {
-fill: white !important;
-}
-
-/* The Dropdown Menu Options (The list that pops up) */
-ul[data-baseweb="menu"] {
-background-color: #1E1E1E !important; /* Solid dark background for readability */
-border: 1px solid rgba(255, 255, 255, 0.1) !important;
-}
-
-/* Individual Menu Items */
-li[data-baseweb="menu-item"] {
-color: rgba(255, 255, 255, 0.9) !important;
-}
-
-/* Hover State for Menu Items */
-li[data-baseweb="menu-item"]:hover {
-background-color: #E16C45 !important; /* Orange Highlight */
-color: white !important;
-}
-</style>
-""",
-unsafe_allow_html=True
-)
+# Debug profiler: per-rerun timing spans + a waterfall in the sidebar (see the end of
+# this file). Off unless the DEBUG_PROFILER secret or AETHERIUM_DEBUG_PROFILER is set.
+try:
+    PROFILER_ON = is_enabled(st.secrets.get("DEBUG_PROFILER", PROFILER_FLAG))
+except Exception:
+    PROFILER_ON = is_enabled()
+if PROFILER_ON:
+    st.session_state.profiler_runs = st.session_state.get("profiler_runs", 0) + 1
+    begin_rerun(st.session_state.setdefault("profiler_log", TraceLog()), f"rerun {st.session_state.profiler_runs}")
+    section("setup")
 
 # ==============================================================================
 # --- SECTION 2: MAPPINGS & CONFIGURATION ---
 # ==============================================================================
 pretty_labels = {"ctl": "Fitness (CTL)", "atl": "Fatigue (ATL)", "tsb": "Form (TSB)", "date": "Date"}
 
-TYPE_MAPPING = {
-    "Ride": "Cycling", "GravelRide": "Cycling", "VirtualRide": "Cycling", 
-    "Run": "Running", "TrailRun": "Running", "Treadmill": "Running", 
-    "Walk": "Running/Walking", "Hike": "Running/Walking",
-    "WeightTraining": "Strength", "Yoga": "Mobility", "Pilates": "Mobility"
-}
-
-MUSCLE_KEYWORDS = {
-    "Legs": ["squat", "leg", "quad", "hamstring", "glute", "calf", "deadlift", "lunge"],
-    "Chest/Push": ["bench", "press", "push", "chest", "tricep", "shoulder", "dip"],
-    "Back/Pull": ["row", "pull", "back", "deadlift", "lat", "bicep", "chin"],
-    "Core": ["plank", "core", "abs", "situp", "crunch"],
-    "Full Body": ["crossfit", "hiit", "metcon", "full"]
-}
+# TYPE_MAPPING (sport per activity type) and MUSCLE_KEYWORDS live in classifier.py,
+# which applies them to the whole history at once
 
 # ==============================================================================
 # --- SECTION 3: UTILITY FUNCTIONS (Logic & Processing) ---
 # ==============================================================================
-class ProPDF(FPDF):
-    def header(self):
-        # We leave this empty because we draw the background manually in the function
-        pass 
-
-    def footer(self):
-        # Professional Footer
-        self.set_y(-15)
-        self.set_font('Arial', 'I', 8)
-        self.set_text_color(128)
-        self.cell(0, 10, f'Aetherium AI Project | Page {self.page_no()}', 0, 0, 'C')
-
 def get_status_label(metric, value):
     m = metric.lower()
     
@@ -455,15 +89,7 @@ def get_status_label(metric, value):
 
 def get_muscle_focus(activity_name):
     """Detects multiple muscle groups from the activity name."""
-    text = str(activity_name).lower()
-    matches = []
-    for focus, keywords in MUSCLE_KEYWORDS.items():
-        if any(word in text for word in keywords):
-            matches.append(focus)
-    
-    if not matches: return "General"
-    if len(matches) >= 3: return "Full Body"
-    return ", ".join(matches)
+    return muscle_focus(activity_name)
 
 def elegant_hero_item(col, icon, label, value):
     """Renders a single glassmorphism metric card."""
@@ -495,26 +121,21 @@ def elegant_stat(col, label, value, color):
         """, unsafe_allow_html=True)
 
 def infer_primary_sport(activities):
-    if not activities:
+    """Most frequent sport in the ActivityFrame (ties go to the most recent)."""
+    if activities is None or activities.empty:
         return "General Fitness"
-    
-    # Count occurrences of mapped types (Running, Cycling, etc.)
-    type_counts = {}
-    for a in activities:
-        # Use your existing TYPE_MAPPING dict
-        raw_type = a.get('type', 'Other')
-        # Map 'VirtualRide' -> 'Cycling', etc.
-        sport = TYPE_MAPPING.get(raw_type, raw_type)
-        type_counts[sport] = type_counts.get(sport, 0) + 1
-    
+
+    # 'sport' is TYPE_MAPPING applied by the classifier ('VirtualRide' -> 'Cycling', etc.)
+    sport = activities['sport'].astype(object)
+
     # Return the most frequent sport
-    return max(type_counts, key=type_counts.get)
+    return sport.value_counts(sort=False).idxmax()
 
 def show_login_screen():
     # Re-applying your clean branding
     st.markdown(f"""
         <div class="brand-wrapper">
-            <img src="data:image/png;base64,{LOGO_BASE64}" style="width: 70px; margin-bottom: 20px;">
+            <img src="{asset_data_uri(LOGO_LOGIN)}" style="width: 70px; margin-bottom: 20px;">
             <div class="title-container">
                 <div class="title-main">aetherium</div>
                 <div class="title-sub">PROJECT</div>
@@ -529,7 +150,7 @@ def show_login_screen():
         'response_type': 'code',
         'scope': 'ACTIVITY:READ,WELLNESS:READ'
     }
-    auth_url = f"https://intervals.icu/oauth/authorize?{urllib.parse.urlencode(params)}"
+    auth_url = f"{AUTHORIZE_URL}?{urllib.parse.urlencode(params)}"
 
     # Create 3 columns: [Spacer, Button, Spacer]
     # The middle column (2) is where the button goes.
@@ -540,246 +161,165 @@ def show_login_screen():
         st.link_button("🚀 Connect with Intervals.icu", auth_url, type="primary", use_container_width=True)
 
 def get_access_token(auth_code):
-    token_url = "https://intervals.icu/api/oauth/token"
+    token_url = TOKEN_URL
     payload = {
         "client_id": st.secrets["INTERVALS_CLIENT_ID"], "client_secret": st.secrets["INTERVALS_CLIENT_SECRET"],
         "code": auth_code, "redirect_uri": st.secrets["REDIRECT_URI"], "grant_type": "authorization_code",
     }
-    response = requests.post(token_url, data=payload)
+    try:
+        response = requests.post(token_url, data=payload, timeout=TIMEOUTS["token"])
+    except requests.RequestException:
+        return {}
     return response.json() if response.status_code == 200 else {}
 
-# --- PERSISTENCE HELPERS ---
-TOKEN_FILE = "auth_token.json"
-
-def save_token_to_disk(token_data):
-    """Saves the token to a local JSON file."""
-    with open(TOKEN_FILE, "w") as f:
-        json.dump(token_data, f)
-
-def load_token_from_disk():
-    """Loads the token from disk if it exists."""
-    if os.path.exists(TOKEN_FILE):
-        with open(TOKEN_FILE, "r") as f:
-            return json.load(f)
-    return None
+def refresh_access_token(refresh_token):
+    token_url = TOKEN_URL
+    payload = {
+        "client_id": st.secrets["INTERVALS_CLIENT_ID"], "client_secret": st.secrets["INTERVALS_CLIENT_SECRET"],
+        "refresh_token": refresh_token, "grant_type": "refresh_token",
+    }
+    # Runs under the token's lock (other tabs of this login wait on it), so it must not hang
+    try:
+        response = requests.post(token_url, data=payload, timeout=TIMEOUTS["token"])
+    except requests.RequestException:
+        return {}  # Keep the old token; the next rerun tries again
+    return response.json() if response.status_code == 200 else {}
 
-def get_ytd_data():
+# --- PERSISTENCE HELPERS ---
+# Tokens are stored per login (encrypted, see token_store.py); the browser keeps
+# only an opaque handle in the URL, so a reload reconnects the same athlete
+# without another OAuth redirect - and never picks up somebody else's login.
+# Handles expire (AETHERIUM_SESSION_TTL) and are replaced on every reconnect.
+SESSION_PARAM = "s"
+
+def save_token(token_data):
+    """Stores a new login and returns its handle."""
+    handle = TokenStore.new_handle()
+    st.session_state.token_data = TokenStore().save(handle, token_data)
+    st.session_state.token_handle = handle
+    return handle
+
+def restore_token(handle):
+    """
+    Loads (and if needed refreshes) the token for a handle from the URL, then
+    moves the login to a new handle so the old URL stops working.
+    """
+    store = TokenStore()
+    token_data = store.load_fresh(handle, refresh_access_token)
+    if not (token_data and token_data.get("access_token")):
+        return False
+    new_handle = store.rotate(handle)
+    if new_handle is None:
+        return False  # Another tab reconnected with the same URL first
+    st.session_state.token_data = token_data
+    st.session_state.token_handle = new_handle
+    st.query_params[SESSION_PARAM] = new_handle
+    return True
+
+def refresh_session_token():
+    """Refreshes this session's token if it is about to expire (same handle)."""
+    token_data = TokenStore().load_fresh(st.session_state.token_handle, refresh_access_token)
+    if token_data and token_data.get("access_token"):
+        st.session_state.token_data = token_data
+
+# --- DATA CACHE ---
+# Widget changes rerun the whole script; this keeps them off the network.
+DATA_CACHE_TTL = int(os.environ.get("AETHERIUM_DATA_TTL", 15 * 60))  # seconds
+DATA_CACHE_MAX_ENTRIES = int(os.environ.get("AETHERIUM_DATA_CACHE_SIZE", 64))  # LRU bound, shared by all sessions
+
+@st.cache_data(ttl=DATA_CACHE_TTL, max_entries=DATA_CACHE_MAX_ENTRIES, show_spinner=False)
+def fetch_intervals_payloads(athlete, token, oldest, newest, refresh_nonce=0):
+    """
+    Cached per (athlete, token, window). Bumping refresh_nonce forces a refetch for that user only.
+    The typed ActivityFrame is built here, once per payload, and shared by every section; the raw
+    activities JSON is not returned, so cache hits don't unpickle it on every rerun.
+    """
+    store = AthleteStore(athlete)
+    # Only traced on a cache miss, which is exactly when it costs something
+    with span("fetch_dashboard_data", "io", oldest=oldest, newest=newest):
+        well_json, act_json, ath_json = fetch_dashboard_data(store, token, oldest, newest)
+    with span("build + classify activities", n=len(act_json or [])):
+        activities = classify_activities(build_activity_frame(act_json))
+    return well_json, ath_json, activities
+
+HISTORY_OPTIONS = [1, 2, 3, 5]  # Years of history the athlete can pick in the sidebar
+METRICS_SOURCES = {"server": "intervals.icu", "local": "Local estimate"}
+DEFAULT_METRICS_SOURCE = os.environ.get("AETHERIUM_METRICS_SOURCE", "server").strip().lower()
+if DEFAULT_METRICS_SOURCE not in METRICS_SOURCES:
+    DEFAULT_METRICS_SOURCE = "server"  # Unknown value: don't take the whole app down over it
+
+def get_ytd_data(history_years=1):
     if "token_data" not in st.session_state or st.session_state.token_data is None:
         return None, None, None
         
     token = st.session_state.token_data.get('access_token')
-    headers = {"Authorization": f"Bearer {token}"}
-    base_url = "https://intervals.icu/api/v1/athlete/0" 
     
     # --- CHANGED LOGIC HERE ---
     # Old: datetime(datetime.now().year, 1, 1)  (Jan 1st of this year)
-    # New: datetime.now() - timedelta(days=365) (Exactly 1 year ago today)
-    start_date = datetime.now() - timedelta(days=365)
+    # New: datetime.now() - timedelta(days=365 * years) (N years ago today)
+    start_date = datetime.now() - timedelta(days=365 * history_years)
     end_date = datetime.now() + timedelta(days=1)
-    params = {
-        'oldest': start_date.strftime('%Y-%m-%d'), 
-        'newest': end_date.strftime('%Y-%m-%d')
-    }
+    oldest = start_date.strftime('%Y-%m-%d')
+    newest = end_date.strftime('%Y-%m-%d')
+    recent_oldest = max(oldest, (datetime.now() - timedelta(days=RECENT_DAYS)).strftime('%Y-%m-%d'))
     
     try:
-        well_res = requests.get(f"{base_url}/wellness", headers=headers, params=params)
-        act_res = requests.get(f"{base_url}/activities", headers=headers, params=params)
-        ath_res = requests.get(base_url, headers=headers)
-        return well_res.json(), act_res.json(), ath_res.json()
+        athlete = athlete_key(st.session_state.token_data)
+        nonce = st.session_state.get("data_refresh", 0)
+
+        # Older years are fetched quarter by quarter in the background; until they
+        # land we render the recent year so the page doesn't wait on them
+        complete = True
+        st.session_state.history_backfill = None
+        if oldest < recent_oldest:
+            job = start_history_backfill(AthleteStore(athlete), token, oldest, recent_oldest, attempt=nonce)
+            if job is not None and not job.done():
+                st.session_state.history_backfill = job
+                complete = False
+            elif job is not None and job.error:
+                st.warning(f"⚠️ Older history could not be loaded ({job.error}). Use Refresh data to retry.")
+                complete = False
+
+        # Only ask the API for what the local store doesn't have yet (usually the last week),
+        # with all three calls in flight at once - and only when the cache entry is stale
+        return fetch_intervals_payloads(
+            athlete, token, oldest if complete else recent_oldest, newest, refresh_nonce=nonce
+        )
     except Exception as e:
         st.error(f"Fetch failed: {e}")
         return None, None, None
 
-def build_ai_prompt(sport, discipline, goal, time_str, form, recent_activities):
-    """
-    Constructs the prompt for the AI, now including the specific Discipline.
-    """
-    # 1. Summarize last 3 workouts
-    recent_context = "None"
-    if recent_activities:
-        sorted_acts = sorted(recent_activities, key=lambda x: x['start_date_local'], reverse=True)[:3]
-        recent_context = ""
-        for act in sorted_acts:
-            name = act.get('name', 'Unknown')
-            type_ = act.get('type', 'Workout')
-            date = act.get('start_date_local', '')[:10]
-            recent_context += f"- {date}: {type_} ({name})\n"
-
-    # 2. Determine Biological State
-    bio_state = "Neutral"
-    if form < -20: bio_state = "High Fatigue"
-    elif -20 <= form < -5: bio_state = "Fatigued"
-    elif -5 <= form <= 15: bio_state = "Fresh"
-    elif form > 15: bio_state = "Very Fresh"
-
-    # 1. Handle Time String
-    if str(time_str).lower() == "no limit":
-        time_text = "Unlimited (Design the optimal duration for this specific workout)"
-    else:
-        # Strip " mins" from the string if it exists to get just the number
-        clean_time = str(time_str).replace(" mins", "")
-        time_text = f"{clean_time} minutes"
-    
-    # 2. The Strict Prompt (Update the 'Time Available' line)
-    prompt = f"""
-    Act as an elite {sport} coach. Write a specific {discipline} workout for today.
-    
-    **Context:**
-    - Macro Sport: {sport}
-    - Specific Discipline: {discipline}
-    - Goal: {goal}
-    - Time Available: {time_text}
-    - Athlete Status: {int(form)} ({bio_state})
-    - Recent History:
-    {recent_context}
-    
-    **Strict Output Rules:**
-    1. NO conversational filler.
-    2. BE CONCISE. Use short bullet points.
-    3. Format exactly like this:
-       **Workout Name**
-       **Warm Up** (Bullet points)
-       **Main Set** (Bullet points, specific intervals)
-       **Cool Down** (Bullet points)
-       **Coach's Logic** (1 sentence explaining why this fits the history/status)
-    """
-    return prompt
-
-
-# 2. DEFINE THE GENERATOR FUNCTION
-def create_pdf_from_text(raw_text, sport):
-    """Generates a premium PDF with background, logo, and card layout."""
-    try:
-        # Initialize the class we defined above
-        pdf = ProPDF()
-        pdf.add_page()
-        pdf.set_auto_page_break(auto=True, margin=20)
-
-        # --- A. SETUP IMAGES ---
-        # 1. Background Image
-        bg_path = None
-        try:
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".jpg") as tmp_bg:
-                bg_url = "https://images.unsplash.com/photo-1663104192417-6804188a9a8e"
-                response = requests.get(bg_url, timeout=5)
-                tmp_bg.write(response.content)
-                bg_path = tmp_bg.name
-        except:
-            bg_path = None
-
-        # 2. Logo (Check if global variable exists)
-        logo_path = None
-        if 'LOGO_BASE64' in globals():
-            try:
-                with tempfile.NamedTemporaryFile(delete=False, suffix=".png") as tmp_logo:
-                    tmp_logo.write(base64.b64decode(LOGO_BASE64))
-                    logo_path = tmp_logo.name
-            except:
-                logo_path = None
-
-        # --- B. DRAW VISUALS ---
-        # 1. Draw Background
-        if bg_path:
-            pdf.image(bg_path, x=0, y=0, w=210, h=297)
-
-        # 2. Draw "Card" (White Box)
-        pdf.set_alpha(0.85)
-        pdf.set_fill_color(255, 255, 255)
-        pdf.rect(10, 10, 190, 277, 'F') 
-        pdf.set_alpha(1.0)
-    except AttributeError:
-            # Graceful fallback for older FPDF versions that don't support alpha
-        pdf.set_fill_color(255, 255, 255)
-        pdf.rect(10, 10, 190, 277, 'F')
-        # --- C. DRAW HEADER ---
-        if logo_path:
-            pdf.image(logo_path, x=15, y=15, w=20)
-            title_x = 40
-        else:
-            title_x = 15
-
-        pdf.set_xy(title_x, 18)
-        pdf.set_font("Arial", "B", 24)
-        pdf.set_text_color(30, 30, 30)
-        pdf.cell(0, 10, f"{sport.upper()} SESSION", 0, 1, 'L')
-        
-        pdf.set_xy(title_x, 28)
-        pdf.set_font("Arial", "I", 10)
-        pdf.set_text_color(112, 196, 176) # Teal
-        timestamp = datetime.now().strftime("%A, %B %d, %Y")
-        pdf.cell(0, 5, f"Designed by Aetherium Project | {timestamp}", 0, 1, 'L')
-        
-        pdf.ln(15)
-
-        # --- D. PARSE CONTENT ---
-        lines = raw_text.split('\n')
-        
-        for line in lines:
-            clean_line = line.strip()
-            if not clean_line:
-                pdf.ln(2)
-                continue
-                
-            # HEADERS
-            if clean_line.startswith("**") and clean_line.endswith("**"):
-                header_text = clean_line.replace("**", "").upper()
-                pdf.ln(5)
-                pdf.set_fill_color(112, 196, 176) # Teal
-                pdf.set_font("Arial", "B", 11)
-                pdf.set_text_color(255, 255, 255)
-                width = pdf.get_string_width(header_text) + 10
-                pdf.cell(width, 8, header_text, 0, 1, 'C', fill=True)
-                pdf.set_text_color(50) 
-                pdf.ln(2)
-
-            # BULLETS
-            elif clean_line.startswith("* ") or clean_line.startswith("- "):
-                bullet_text = clean_line[2:]
-                pdf.set_font("Arial", "", 11)
-                pdf.set_text_color(40)
-                pdf.set_x(20) 
-                pdf.cell(5, 6, chr(149), 0, 0)
-                pdf.multi_cell(0, 6, bullet_text)
-                
-            # BOLD
-            elif "**" in clean_line:
-                clean_line = clean_line.replace("**", "")
-                pdf.set_font("Arial", "B", 11)
-                pdf.set_text_color(20)
-                pdf.multi_cell(0, 6, clean_line)
-                
-            # TEXT
-            else:
-                pdf.set_font("Arial", "", 11)
-                pdf.set_text_color(60)
-                pdf.multi_cell(0, 6, clean_line)
-
-        # --- E. CLEANUP ---
-        try:
-            if bg_path: os.remove(bg_path)
-            if logo_path: os.remove(logo_path)
-        except: pass
+@st.fragment(run_every=2)
+def show_backfill_progress(job):
+    """Polls the background history fetch and reruns the page once it has landed."""
+    if job.done():
+        st.rerun()
+    done, total = job.progress()
+    st.caption(f"⏳ Loading older history... {done}/{total} windows")
 
-        clean_name = f"Aetherium_{sport}_{datetime.now().strftime('%Y%m%d_%H%M')}.pdf"
-        return clean_name, pdf.output(dest='S').encode('latin-1')
-
-    except Exception as e:
-        return "error.pdf", str(e).encode()
+def deferred(name, fn, *args):
+    """Download button payloads are built on click; timed as their own profiler trace when it's on."""
+    if PROFILER_ON:
+        return partial(traced, st.session_state.profiler_log, name, fn, *args)
+    return partial(fn, *args)
 
 # ==============================================================================
 # --- SECTION 5: APP ROUTING & SESSION STATE ---
 # ==============================================================================
+section("5 routing")
 if "authenticated" not in st.session_state:
     st.session_state.authenticated = False
 
-# 1. CHECK DISK: Try to load a saved token first
-if not st.session_state.authenticated:
-    saved_token = load_token_from_disk()
-    if saved_token:
+# 1. CHECK STORE: Reconnect this browser's login from its handle in the URL
+if not st.session_state.authenticated and SESSION_PARAM in st.query_params:
+    if restore_token(st.query_params[SESSION_PARAM]):
         st.session_state.authenticated = True
-        st.session_state.token_data = saved_token
-        # Optional: You could add logic here to check if the token is expired
-        # and refresh it, but for now, this persists the session.
+    else:
+        del st.query_params[SESSION_PARAM]
+
+# Refresh a token that is about to expire before the dashboard uses it
+elif st.session_state.authenticated and needs_refresh(st.session_state.get("token_data")):
+    refresh_session_token()
 
 # 2. CHECK URL: Handle new login via OAuth Redirect
 query_params = st.query_params
@@ -787,12 +327,13 @@ if "code" in query_params and not st.session_state.authenticated:
     token_response = get_access_token(query_params["code"])
     if "access_token" in token_response:
         st.session_state.authenticated = True
-        st.session_state.token_data = token_response
-        
-        # SAVE TO DISK for next time
-        save_token_to_disk(token_response)
-        
+
+        # SAVE TO THE STORE for next time; the handle replaces the one-time code in the URL
+        handle = save_token(token_response)
+        remove_legacy_token_file()  # Plaintext token from the single-user version
+
         st.query_params.clear()
+        st.query_params[SESSION_PARAM] = handle
         st.rerun()
 
 # 3. SHOW LOGIN: If still not authenticated, stop here
@@ -803,48 +344,80 @@ if not st.session_state.authenticated:
 # ==============================================================================
 # --- SECTION 6: HERO DASHBOARD (LAST SESSION) ---
 # ==============================================================================
+section("6 data + hero")
 with st.sidebar:
+    if st.button("🔄 Refresh data"):
+        # New cache key for this user only; other sessions keep their cached payloads
+        st.session_state.data_refresh = st.session_state.get("data_refresh", 0) + 1
+
+    history_years = st.selectbox(
+        "📆 History", HISTORY_OPTIONS, key="history_years",
+        format_func=lambda y: f"{y} year{'s' if y > 1 else ''}"
+    )
+
+    # Where CTL/ATL/TSB come from: intervals.icu's own values (in the wellness rows)
+    # or our estimate from the activities
+    metrics_source = st.selectbox(
+        "📐 Fitness metrics", list(METRICS_SOURCES), key="metrics_source",
+        index=list(METRICS_SOURCES).index(DEFAULT_METRICS_SOURCE), format_func=METRICS_SOURCES.get
+    )
+    show_drift = st.checkbox("Show drift report", key="show_metrics_drift", help="Compare the local estimate with intervals.icu")
+
     if st.button("Logout"):
-        # 1. Remove the persistent file
-        if os.path.exists(TOKEN_FILE):
-            os.remove(TOKEN_FILE)
+        # 1. Remove the stored token and the locally synced data
+        if st.session_state.get("token_handle"):
+            TokenStore().delete(st.session_state.token_handle)
+            st.session_state.token_handle = None
+        remove_legacy_token_file()
+        st.query_params.clear()
+        if st.session_state.get("token_data"):
+            athlete_store = AthleteStore(athlete_key(st.session_state.token_data))
+            cancel_history_backfill(athlete_store)  # Or its windows would write the history back
+            athlete_store.clear()
+            forget_training_state(athlete_store)
             
         # 2. Clear Session State
         st.session_state.authenticated = False
         st.session_state.token_data = None
+        st.session_state.history_backfill = None
         st.rerun()
 
-well_json, act_json, ath_json = get_ytd_data()
+with span("get_ytd_data", "io", years=history_years):
+    well_json, ath_json, activities = get_ytd_data(history_years)
+has_activities = activities is not None and not activities.empty
+if st.session_state.get("history_backfill"):
+    show_backfill_progress(st.session_state.history_backfill)
 
-if act_json:
-    latest_act = act_json[0]
-    raw_type = latest_act.get('type', 'Other')
+if has_activities:
+    latest_act = activities.iloc[0]  # Newest first
+    raw_type = latest_act['type']
     display_type = TYPE_MAPPING.get(raw_type, "Workout")
+    act_name = latest_act['name'] if pd.notna(latest_act['name']) else ''
     
     # Common Data
-    secs = latest_act.get('moving_time') or 0
+    secs = int(latest_act['moving_time'])
     duration_str = f"{secs // 3600}h {(secs % 3600) // 60}m"
-    load = latest_act.get('icu_training_load') or 0
+    load = float(latest_act['icu_training_load'])
 
     # STRENGTH Logic
     if display_type == "Strength":
         hours = secs / 3600
         intensity = load / hours if hours > 0 else 0
         h3_icon, h3_label, h3_value = "🔥", "Intensity", f"{intensity:.1f} pts/hr"
-        focus_text = get_muscle_focus(latest_act.get('name', ''))
+        focus_text = get_muscle_focus(act_name)
         h4_icon, h4_label, h4_value = "🧬", "Focus", focus_text
             
     # CARDIO Logic
     else:
-        dist = (latest_act.get('distance') or 0) / 1000
+        dist = float(latest_act['distance']) / 1000
         h3_icon, h3_label, h3_value = "🗺️", "Distance", f"{dist:.2f} km"
-        hr = latest_act.get('average_heartrate') or 0
+        hr = float(latest_act['average_heartrate'])
         h4_icon, h4_label, h4_value = "💓", "Avg. HR", f"{hr:.0f} bpm" if hr > 0 else "N/A"
 
-    st.markdown(f"### 🚀 Last Session: {display_type} - {latest_act.get('name', 'Workout')}")
+    st.markdown(f"### 🚀 Last Session: {display_type} - {act_name or 'Workout'}")
     h1, h2, h3, h4 = st.columns(4)
     elegant_hero_item(h1, "⏱️", "Duration", duration_str)
-    elegant_hero_item(h2, "⚡", "Impact", f"{load} pts")
+    elegant_hero_item(h2, "⚡", "Impact", f"{load:g} pts")
     elegant_hero_item(h3, h3_icon, h3_label, h3_value)
     elegant_hero_item(h4, h4_icon, h4_label, h4_value)
 
@@ -853,63 +426,47 @@ st.markdown("<hr style='border-top: 1px solid white; opacity: 1; margin: 2rem 0;
 # ==============================================================================
 # --- SECTION 6.1: METRICS CALCULATION (The Math) ---
 # ==============================================================================
+section("6.1 metrics")
 import pandas as pd
 from datetime import datetime, timedelta
 
 # # 1. PREPARE DATA
-if 'act_json' not in locals() or not act_json:
+if not has_activities:
     # Fallback if no data exists
     current_fitness = 0
     current_fatigue = 0
     current_form = 0
     df_daily = pd.DataFrame() # Create empty DF to prevent errors
+    drift_summary = drift = None
 else:
-    df = pd.DataFrame(act_json)
-    
-    # Ensure date column is actual datetime objects
-    df['start_date_local'] = pd.to_datetime(df['start_date_local'])
-    df = df.sort_values('start_date_local')
-
-    # 2. CALCULATE DAILY LOAD (TSS Estimate)
-    def estimate_load(row):
-        if 'suffer_score' in row and row['suffer_score']:
-            return row['suffer_score']
-        elif 'moving_time' in row:
-            hours = row['moving_time'] / 3600
-            return hours * 50 
-        return 0
-
-    df['TSS'] = df.apply(estimate_load, axis=1)
-
-    # 3. CALCULATE ATL, CTL, TSB
-    # We set index to date to resample daily
-    df_indexed = df.set_index('start_date_local')
-    daily_load = df_indexed['TSS'].resample('D').sum().fillna(0)
-
-    # Constants
-    ctl_decay = 42 
-    atl_decay = 7 
-
-    # Calculate Exponential Weighted Averages
-    ctl = daily_load.ewm(span=ctl_decay, adjust=False).mean()
-    atl = daily_load.ewm(span=atl_decay, adjust=False).mean()
-    tsb = ctl - atl
-
-    # 4. SAVE TO A DEDICATED PLOTTING DATAFRAME (The Fix)
-    # We create a new DataFrame specifically for the chart
-    df_daily = pd.DataFrame({
-        'ctl': ctl,
-        'atl': atl,
-        'tsb': tsb
-    })
-    # The index is already the date, let's make it a column for easier plotting
-    df_daily['date'] = df_daily.index
-
-    # 5. GET CURRENT VALUES (For the top dashboard cards)
-    if not ctl.empty:
-        current_fitness = ctl.iloc[-1]
-        current_fatigue = atl.iloc[-1]
-        current_form = tsb.iloc[-1]
+    # 2. DAILY ATL, CTL, TSB
+    # "server": intervals.icu's own values from the wellness rows - nothing to compute.
+    # "local" (and the fallback when wellness has no ctl/atl): TSS estimate -> EWMA,
+    # vectorized in metrics.py and carried forward from the athlete's saved state.
+    with span("server_training_load"):
+        df_server = server_training_load(well_json or []) if metrics_source == "server" or show_drift else None
+    athlete_store = AthleteStore(athlete_key(st.session_state.token_data))
+    if metrics_source == "server" and not df_server.empty:
+        df_daily = df_server
+        df_local = None
+    else:
+        with span("incremental_training_load"):
+            df_local = incremental_training_load(athlete_store, activities)
+        df_daily = df_local
+
+    # Drift report: how far the local estimate is from intervals.icu (rendered under the chart)
+    drift_summary = drift = None
+    if show_drift:
+        with span("reconcile_training_load"):
+            if df_local is None:
+                df_local = incremental_training_load(athlete_store, activities)
+            drift_summary, drift = reconcile_training_load(df_local, df_server)
+
+    # 3. GET CURRENT VALUES (For the top dashboard cards)
+    if not df_daily.empty:
+        current_fitness = df_daily['ctl'].iloc[-1]
+        current_fatigue = df_daily['atl'].iloc[-1]
+        current_form = df_daily['tsb'].iloc[-1]
     else:
         current_fitness = 0
         current_fatigue = 0
@@ -918,12 +475,14 @@ else:
 # ==============================================================================
 # --- SECTION 7.1: AI WORKOUT PLANNER (INDENTATION FIX) ---
 # ==============================================================================
+section("7.1 ai planner")
 st.markdown("---") # Visual Separator
 
 # 1. SETUP CLIENT
 try:
     api_key = st.secrets.get("GEMINI_API_KEY") or os.environ.get("GEMINI_API_KEY")
-    client = genai.Client(api_key=api_key) if api_key else None
+    http_options = {"base_url": GENAI_BASE_URL} if GENAI_BASE_URL else None
+    client = genai.Client(api_key=api_key, http_options=http_options) if api_key else None
 except:
     client = None
 
@@ -948,7 +507,19 @@ GOAL_SETS = {
     "Hyrox": ["Race Simulation", "Sled Power", "Running Engine", "Muscular Endurance", "Technique"]
 }
 
-# --- C. HELPER: GET GOALS FOR SELECTION ---
+# --- C. HELPERS ---
+def render_ai_card(placeholder, text):
+    """(Re)draws the workout card; called for every streamed chunk."""
+    # We use f-string with newlines to ensure Markdown renders inside the HTML
+    placeholder.markdown(f"""
+<div class="ai-card">
+
+{text}
+
+</div>
+""", unsafe_allow_html=True)
+
+
 def get_relevant_goals(sport, discipline):
     d = discipline.lower()
     if "strength" in d or "plyo" in d or "upper" in d or "lower" in d: return GOAL_SETS["Strength"]
@@ -958,9 +529,9 @@ def get_relevant_goals(sport, discipline):
 
 # --- D. SMART AUTO-DETECT DEFAULTS ---
 default_sport_index = 0
-if 'act_json' in locals() and act_json:
+if has_activities:
     try:
-        detected_raw = infer_primary_sport(act_json)
+        detected_raw = infer_primary_sport(activities)
         mapping_map = { "Run": "Running", "Ride": "Cycling", "Swim": "Swimming", "WeightTraining": "General Fitness", "CrossFit": "Hyrox / Functional" }
         detected = mapping_map.get(detected_raw, detected_raw)
         sport_keys = list(SPORT_DISCIPLINES.keys())
@@ -975,197 +546,206 @@ with c3: user_goal = st.selectbox("Goal", get_relevant_goals(selected_sport, sel
 with c4: time_avail = st.select_slider("Time Available", options=["30 mins", "45 mins", "60 mins", "75 mins", "90 mins", "120 mins", "No Limit"], value="60 mins", key="time_select")
 
 # 3. GENERATION ACTION
+WEEK_PLAN_SIZE = 7  # Sessions kept for the week export (see F below)
 b1, b2, b3 = st.columns([1, 2, 1])
 with b2:
-    st.markdown("""<style>div[data-testid="column"] { margin-top: 15px; }</style>""", unsafe_allow_html=True)
     generate_btn = st.button("✨ GENERATE NEXT WORKOUT", type="primary", use_container_width=True)
+with b3:
+    # Same settings normally return the cached workout; this asks Gemini for a new one
+    regenerate_btn = st.button("🔁 Regenerate", use_container_width=True, help="Skip the cache and design a fresh workout")
 
-if generate_btn:
+if generate_btn or regenerate_btn:
     if not client:
         st.error("❌ AI Client not connected.")
     else:
-        with st.spinner(f"Designing {selected_sport} ({selected_discipline}) session..."):
-            ai_prompt = build_ai_prompt(selected_sport, selected_discipline, user_goal, time_avail, current_form, act_json)
-            
-            try:
-                # 1. GENERATE
-                response = client.models.generate_content(
-                    model="gemini-2.0-flash-lite", 
-                    contents=ai_prompt
-                )
-
-                # 2. SAVE TO SESSION STATE
-                st.session_state.last_workout = response.text
-                st.session_state.last_sport = selected_sport
-
-                # 3. INJECT CSS (CORRECTED INDENTATION)
-                # Note: This is now indented INSIDE the try block
-                st.markdown("""
-                <style>
-                .ai-card {
-                    background-color: #1E1E1E !important;
-                    border: 1px solid rgba(255, 255, 255, 0.2);
-                    border-radius: 10px;
-                    padding: 20px;
-                    margin-top: 20px;
-                }
-                .ai-card p, 
-                .ai-card li, 
-                .ai-card strong, 
-                .ai-card h1, 
-                .ai-card h2, 
-                .ai-card h3, 
-                .ai-card b, 
-                .ai-card span,
-                .ai-card div {
-                    color: #FFFFFF !important;
-                    opacity: 1 !important;
-                    font-family: 'Inter', sans-serif !important;
-                }
-                </style>
-                """, unsafe_allow_html=True)
-
-                # 4. DISPLAY RESULT
-                st.markdown("---")
-                st.markdown(f"### ⚡ Recommended: {selected_discipline}")
-                
-                # We use f-string with newlines to ensure Markdown renders inside the HTML
-                st.markdown(f"""
-<div class="ai-card">
-
-{response.text}
+        ai_prompt = build_ai_prompt(selected_sport, selected_discipline, user_goal, time_avail, current_form, recent_activities(activities))
+        from_cache = not regenerate_btn and cached_workout(ai_prompt) is not None
 
-</div>
-""", unsafe_allow_html=True)
-                
-                st.markdown("###") 
-                c_dl, c_void = st.columns([1, 2])
-                with c_dl:
-                    # New Pro Function is called here
-                    fname, pdf_data = create_pdf_from_text(response.text, selected_sport)
-                    
-                    st.download_button(
-                        label="📄 Download Workout Card (.pdf)",
-                        data=pdf_data,
-                        file_name=fname,
-                        mime="application/pdf",
-                        type="primary",
-                        icon="📥"
-                    )
-            except Exception as e:
-                # This except block is now correctly aligned with the try block above
-                if "429" in str(e):
-                    st.toast("⚠️ Primary model busy. Retrying...", icon="🔄")
-                else:
-                    st.error(f"Generation Failed: {e}")
+        try:
+            # 1. DISPLAY RESULT (.ai-card styles live in styles/theme.css)
+            st.markdown("---")
+            st.markdown(f"### ⚡ Recommended: {selected_discipline}")
+            if from_cache:
+                st.caption("⚡ Same settings as an earlier request - showing the saved workout. Use Regenerate for a new one.")
+
+            # 2. GENERATE, streaming into the card as tokens arrive
+            # (identical prompts are served from the response cache in one go)
+            card = st.empty()
+            waiting = get_scheduler().stats()
+            queue_note = ""
+            if waiting["queue_depth"]:
+                queue_note = f" ({waiting['queue_depth']} request(s) ahead, ~{waiting['avg_wait_s']:.0f}s wait)"
+            render_ai_card(card, f"*Designing {selected_sport} ({selected_discipline}) session...{queue_note}*")
+            workout_text = ""
+            with span("gemini stream_workout", "io", cached=from_cache):
+                for piece in stream_workout(client, ai_prompt, use_cache=not regenerate_btn):
+                    workout_text += piece
+                    render_ai_card(card, workout_text)
+            if not workout_text:
+                raise ValueError("the AI returned an empty answer (it may have been blocked). Please try again.")
+
+            # 3. SAVE TO SESSION STATE
+            st.session_state.last_workout = workout_text
+            st.session_state.last_sport = selected_sport
+
+            # Collect the week's sessions for the batch export below (last 7 kept);
+            # Regenerate swaps out the session it is redoing instead of adding a day
+            week_plan = st.session_state.setdefault("week_plan", [])
+            if regenerate_btn and week_plan:
+                week_plan.pop()
+            week_plan.append({"text": workout_text, "sport": selected_sport, "discipline": selected_discipline})
+            del week_plan[:-WEEK_PLAN_SIZE]
+
+            # 4. DOWNLOAD (only once the stream has finished)
+            st.markdown("###") 
+            c_dl, c_void = st.columns([1, 2])
+            with c_dl:
+                # The PDF is only rendered when the button is clicked (and then cached by content)
+                st.download_button(
+                    label="📄 Download Workout Card (.pdf)",
+                    data=deferred("get_workout_pdf", get_workout_pdf, workout_text, selected_sport),
+                    file_name=pdf_file_name(selected_sport),
+                    mime="application/pdf",
+                    on_click="ignore",
+                    type="primary",
+                    icon="📥"
+                )
+        except Exception as e:
+            # 429s were already retried (with backoff and model fallback) by the scheduler
+            if is_rate_limited(e):
+                st.error("⚠️ All AI models are at their rate limit right now. Please try again in a minute.")
+            else:
+                st.error(f"Generation Failed: {e}")
+
+# --- F. WEEK PLAN EXPORT ---
+# Every generated session is collected here; coaches download the set as one
+# booklet or as a zip of per-day cards (rendered in a process pool on click).
+# Session i of the plan is scheduled for today + i days.
+if st.session_state.get("week_plan"):
+    plan_start = datetime.now()
+    week_plan = [
+        dict(item, label=f"{(plan_start + timedelta(days=i)).strftime('%A, %B %d')} - {item['discipline']}")
+        for i, item in enumerate(st.session_state.week_plan)
+    ]
+    with st.expander(f"📅 Week Plan ({len(week_plan)} session{'s' if len(week_plan) > 1 else ''})"):
+        for item in week_plan:
+            st.markdown(f"- **{item['label']}** ({item['sport']})")
+
+        w1, w2, w3 = st.columns([1, 1, 1])
+        with w1:
+            st.download_button(
+                "📘 Download Booklet (.pdf)",
+                data=deferred("export_week_booklet", export_week_booklet, week_plan),
+                file_name=f"Aetherium_Week_{datetime.now().strftime('%Y%m%d')}.pdf",
+                mime="application/pdf",
+                on_click="ignore",
+                key="week_booklet",
+            )
+        with w2:
+            st.download_button(
+                "🗂️ Download Cards (.zip)",
+                data=deferred("export_week_zip", export_week_zip, week_plan),
+                file_name=f"Aetherium_Week_{datetime.now().strftime('%Y%m%d')}.zip",
+                mime="application/zip",
+                on_click="ignore",
+                key="week_zip",
+            )
+        with w3:
+            if st.button("Clear Week Plan", key="week_clear"):
+                st.session_state.week_plan = []
+                st.rerun()
 
 
 # # ==============================================================================
 # --- (NEXT SECTION: YEARLY TRAINING LOAD) ---
 # ==============================================================================
 st.markdown("<hr style='border-top: 1px solid white; opacity: 1; margin: 2rem 0;'>", unsafe_allow_html=True)
+section("7.2 fitness chart")
 st.markdown("### 📈 Fitness Progress (Chronic Load)")
 
 # Check if our new 'df_daily' exists and has data
 if 'df_daily' in locals() and not df_daily.empty:
     
-    fig = go.Figure()
-
-    # PLOT ONLY FITNESS (CTL)
-    # We add a fill to make it look like a progress mountain
-    fig.add_trace(go.Scatter(
-        x=df_daily['date'], 
-        y=df_daily['ctl'], 
-        mode='lines',
-        name='Fitness (CTL)',
-        line=dict(color="#70C4B0", width=4), # Teal color, slightly thicker
-        fill='tozeroy', # Fills the area under the line
-        fillcolor='rgba(112, 196, 176, 0.15)', # Semi-transparent teal glow
-        hovertemplate="<b>Fitness</b>: %{y:.1f}<extra></extra>"
-    ))
-
-    fig.update_layout(
-        hovermode="x unified",
-        hoverlabel=dict(bgcolor="rgba(30, 30, 30, 0.9)", font_size=14, font_color="white"),
-        paper_bgcolor="rgba(0,0,0,0)",
-        plot_bgcolor="rgba(0,0,0,0)",
-        font=dict(color="white"),
-        showlegend=False, # Hide legend since there's only one line
-        xaxis=dict(
-            gridcolor="rgba(255, 255, 255, 0.1)", 
-            tickfont=dict(color="white"), 
-            title=None, 
-            hoverformat="%b %d, %Y"
-        ),
-        yaxis=dict(
-            gridcolor="rgba(255, 255, 255, 0.1)", 
-            tickfont=dict(color="white"), 
-            zeroline=False, 
-            title="Fitness Score"
-        ),
-        margin=dict(l=0, r=0, t=10, b=0) # Tighter margins
-    )
-
-    st.plotly_chart(fig, use_container_width=True)
+    # A box selection on the chart (kept in its widget state) zooms to that range;
+    # double-click clears it and goes back to the whole (downsampled) history
+    selection = (st.session_state.get("fitness_chart") or {}).get("selection") or {}
+    boxes = selection.get("box") or []
+    x_range = None
+    if boxes:
+        start, end = sorted(pd.to_datetime(boxes[0]["x"]))
+        x_range = (start, end)
+        st.caption(f"🔍 {start:%b %d, %Y} - {end:%b %d, %Y} (double-click the chart to reset)")
+
+    # Rebuilt only when the daily series (or the zoom window) actually changed
+    with span("cached_fitness_figure", points=len(df_daily)):
+        fig = cached_fitness_figure(df_daily, x_range)
+    st.plotly_chart(fig, use_container_width=True, key="fitness_chart", on_select="rerun", selection_mode="box")
+
+    if drift_summary is not None:
+        with st.expander("🔍 Metrics reconciliation (local estimate - intervals.icu)", expanded=True):
+            if drift.empty:
+                st.info("No days with values from both sources to compare.")
+            else:
+                st.dataframe(drift_summary.round(2), hide_index=True, use_container_width=True)
+                st.line_chart(drift[['ctl', 'atl', 'tsb']], height=200)
 else:
     st.info("Not enough data to generate Fitness Chart.")
 # ==============================================================================
 # --- SECTION 8: PERFORMANCE HISTORY ---
 # ==============================================================================
-if 'act_json' in locals() and act_json:
-    df_history = pd.DataFrame(act_json)
-    
-    if not df_history.empty and 'start_date_local' in df_history.columns:
-        
-        # --- A. DATA PROCESSING ---
-        df_history['date_dt'] = pd.to_datetime(df_history['start_date_local'])
-        df_history['month_period'] = df_history['date_dt'].dt.to_period('M')
-
-        if 'icu_training_load' not in df_history.columns:
-            df_history['icu_training_load'] = 0
-        df_history['icu_training_load'] = df_history['icu_training_load'].fillna(0)
-
-        # --- B. AGGREGATION ---
-        monthly = df_history.groupby('month_period').agg({
-            'start_date_local': 'count', 
-            'icu_training_load': 'sum'
-        }).reset_index()
-
-        monthly.columns = ['MonthPeriod', 'Sessions', 'Total Load']
-        monthly = monthly.sort_values('MonthPeriod', ascending=False)
-        monthly['MonthDisplay'] = monthly['MonthPeriod'].dt.strftime('%B %Y')
-
-        # --- C. RENDER UI ---
-        st.markdown("### 📅 Monthly Performance History")
-
-        # 1. THE HEADER ROW
-        st.markdown("""
-            <div style="display: flex; justify-content: space-between; padding: 10px 25px; margin-bottom: 5px; border-bottom: 1px solid rgba(255,255,255,0.1);">
-                <div style="flex: 2; text-align: left; color: #70C4B0; font-family: 'Michroma'; font-size: 0.8rem; letter-spacing: 2px;">MONTH</div>
-                <div style="flex: 1; text-align: center; color: rgba(255,255,255,0.6); font-family: 'Michroma'; font-size: 0.7rem; letter-spacing: 2px;">SESSIONS</div>
-                <div style="flex: 1; text-align: right; color: rgba(255,255,255,0.6); font-family: 'Michroma'; font-size: 0.7rem; letter-spacing: 2px;">LOAD</div>
-            </div>
-        """, unsafe_allow_html=True)
-
-        # 2. THE DATA LOOP
-        for _, row in monthly.iterrows():
-            st.markdown(f"""
-            <div class="performance-row">
-                <div style="flex: 2; text-align: left; font-family: 'Michroma', sans-serif; font-size: 0.9rem; color: #70C4B0;">
-                    {row['MonthDisplay']}
-                </div>
-                <div style="flex: 1; text-align: center; font-family: 'Michroma', sans-serif; font-size: 0.9rem; color: white;">
-                    <span style="opacity: 0.6; margin-right: 5px;">🏃</span> 
-                    <b>{int(row['Sessions'])}</b>
-                </div>
-                <div style="flex: 1; text-align: right; font-family: 'Michroma', sans-serif; font-size: 0.9rem; color: white;">
-                    <span style="opacity: 0.6; margin-right: 5px;">🔥</span> 
-                    <b>{row['Total Load']:.0f}</b>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-            
-    else:
-        st.warning("⚠️ Activity data found, but date information is missing.")
+section("8 history")
+if has_activities:
+    # Same ActivityFrame as the metrics above (dates already parsed)
+    # --- A. GRANULARITY ---
+    h1, h2 = st.columns([3, 1])
+    with h2:
+        granularity = st.segmented_control(
+            "Group by", list(GRANULARITIES), default="Monthly", key="history_granularity",
+            label_visibility="collapsed"
+        ) or "Monthly"
+    with h1:
+        st.markdown(f"### 📅 {granularity} Performance History")
+
+    # --- B. AGGREGATION + RENDER ---
+    # One groupby and one HTML element for the whole table, however long the history is
+    history = aggregate_history(activities, granularity)
+    period_title = {"Weekly": "WEEK", "Monthly": "MONTH", "Yearly": "YEAR"}[granularity]
+    st.markdown(history_table_html(history, period_title), unsafe_allow_html=True)
+
+    # --- C. MUSCLE FOCUS OVER TIME (strength sessions only) ---
+    muscle_counts = muscle_distribution(activities, granularity)
+    if not muscle_counts.empty:
+        st.markdown("### 💪 Muscle Focus Over Time")
+        st.plotly_chart(muscle_distribution_figure(muscle_counts), use_container_width=True)
 else:
-    st.info("No activity history found for this year.")
\ No newline at end of file
+    st.info("No activity history found for this year.")
+
+# ==============================================================================
+# --- DEBUG: PROFILER PANEL (DEBUG_PROFILER only) ---
+# ==============================================================================
+if PROFILER_ON:
+    end_rerun()
+    profiler_log = st.session_state.profiler_log
+    traces = [t.to_dict() for t in reversed(profiler_log.traces())]  # Newest first
+    with st.sidebar.expander("🛠️ Profiler", expanded=False):
+        picked = st.selectbox(
+            "Run", range(len(traces)), key="profiler_run",
+            format_func=lambda i: f"{traces[i]['label']} - " + (
+                f"{traces[i]['duration_ms']:.0f} ms" if traces[i]['duration_ms'] is not None else "interrupted"
+            )
+        )
+        trace = traces[picked or 0]
+        if trace["spans"]:
+            st.plotly_chart(waterfall_figure(trace), use_container_width=True, key="profiler_waterfall")
+        else:
+            st.caption("No spans recorded for this run.")
+
+        # Both exports cover every kept run (the Chrome format opens in chrome://tracing or Perfetto)
+        st.download_button(
+            "Export JSON", data=profiler_log.to_json, file_name="aetherium_profile.json",
+            mime="application/json", on_click="ignore", key="profiler_json"
+        )
+        st.download_button(
+            "Export Chrome trace", data=profiler_log.to_chrome_trace, file_name="aetherium_trace.json",
+            mime="application/json", on_click="ignore", key="profiler_chrome"
+        )
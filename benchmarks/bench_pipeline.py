@@ -0,0 +1,84 @@
+"""
+Dashboard hot paths over 1, 3 and 10 years of synthetic history.
+
+    pytest benchmarks
+"""
+import pandas as pd
+import pytest
+
+from activity_frame import build_activity_frame
+from ai_coach import build_ai_prompt
+from classifier import classify_activities
+from history import aggregate_history
+from metrics import ATL_SPAN, CTL_SPAN, daily_load, estimate_load, ewma, server_training_load
+from synthetic import SAMPLE_WORKOUT
+from workout_pdf import create_pdf_from_text
+
+
+@pytest.fixture
+def raw_frame(activities):
+    return pd.DataFrame(activities)
+
+
+@pytest.fixture
+def activity_frame(activities):
+    return classify_activities(build_activity_frame(activities))
+
+
+# --- Ingestion ---
+
+def bench_dataframe_ingestion(benchmark, activities):
+    """The old path: every field of the payload into a DataFrame."""
+    df = benchmark(pd.DataFrame, activities)
+    assert len(df) == len(activities)
+
+
+def bench_activity_frame_ingestion(benchmark, activities):
+    """Typed ActivityFrame + classification, as done once per fetched payload."""
+    frame = benchmark(lambda: classify_activities(build_activity_frame(activities)))
+    assert len(frame) == len(activities)
+
+
+# --- Metrics ---
+
+def _load_and_ewma(df):
+    load = daily_load(df)
+    return ewma(load.to_numpy(), CTL_SPAN), ewma(load.to_numpy(), ATL_SPAN)
+
+
+def bench_estimate_load(benchmark, raw_frame):
+    benchmark(estimate_load, raw_frame)
+
+
+def bench_load_and_ewma(benchmark, raw_frame):
+    """Local estimate from the raw payload frame: load estimate, daily binning, CTL + ATL."""
+    ctl, atl = benchmark(_load_and_ewma, raw_frame)
+    assert len(ctl) == len(atl) > 0
+
+
+def bench_load_and_ewma_activity_frame(benchmark, activity_frame):
+    benchmark(_load_and_ewma, activity_frame)
+
+
+def bench_server_training_load(benchmark, wellness):
+    df_daily = benchmark(server_training_load, wellness)
+    assert len(df_daily) == len(wellness)
+
+
+# --- Aggregation ---
+
+def bench_monthly_aggregation(benchmark, activity_frame):
+    table = benchmark(aggregate_history, activity_frame, "Monthly")
+    assert table['Sessions'].sum() == len(activity_frame)
+
+
+# --- AI prompt + PDF ---
+
+def bench_build_ai_prompt(benchmark, activities):
+    prompt = benchmark(build_ai_prompt, "Cycling", "Threshold", "Build FTP", "60 mins", -8.0, activities)
+    assert "Threshold" in prompt
+
+
+def bench_create_pdf_from_text(benchmark):
+    name, data = benchmark(create_pdf_from_text, SAMPLE_WORKOUT, "Cycling")
+    assert name.endswith(".pdf") and data[:4] == b"%PDF"
@@ -0,0 +1,31 @@
+import os
+import sys
+
+import pytest
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))  # The app modules live in the repo root
+sys.path.insert(0, BENCH_DIR)
+
+from synthetic import make_activities, make_wellness  # noqa: E402
+
+HISTORY_YEARS = [1, 3, 10]
+_payloads = {}
+
+
+@pytest.fixture(params=HISTORY_YEARS, ids=lambda y: f"{y}y")
+def years(request):
+    return request.param
+
+
+@pytest.fixture
+def activities(years):
+    """Synthetic /activities payload, generated once per history length."""
+    if years not in _payloads:
+        _payloads[years] = make_activities(years)
+    return _payloads[years]
+
+
+@pytest.fixture
+def wellness(years):
+    return make_wellness(years)
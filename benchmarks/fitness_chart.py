@@ -0,0 +1,53 @@
+"""
+Fitness Progress chart: per-rerun cost with and without the figure cache.
+
+Times what a rerun does for the chart on unchanged data - build the figure
+(or fetch it from the cache), then the conversion st.plotly_chart applies
+before sending it - over 1, 3 and 10 years of daily CTL.
+
+    python benchmarks/fitness_chart.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+import plotly.io
+import plotly.tools
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from charts import cached_fitness_figure, fitness_figure  # noqa: E402
+
+RUNS = 30
+
+
+def daily_frame(days, seed=0):
+    ctl = np.abs(np.cumsum(np.random.default_rng(seed).normal(size=days))) + 20
+    df = pd.DataFrame({'ctl': ctl, 'atl': ctl, 'tsb': 0.0}, index=pd.date_range('2015-01-01', periods=days))
+    df['date'] = df.index
+    return df
+
+
+def rerun(build, df_daily):
+    # Same steps as st.plotly_chart's marshalling
+    figure = plotly.tools.return_figure_from_figure_or_data(build(df_daily), validate_figure=True)
+    return plotly.io.to_json(figure, validate=False)
+
+
+def per_run_ms(build, df_daily):
+    rerun(build, df_daily)  # Warm-up (and cache fill for the cached variant)
+    start = time.perf_counter()
+    for _ in range(RUNS):
+        rerun(build, df_daily)
+    return (time.perf_counter() - start) / RUNS * 1000
+
+
+if __name__ == "__main__":
+    print(f"{'history':>8} | {'rebuild (ms)':>12} | {'cached (ms)':>11} | speed-up")
+    for years in (1, 3, 10):
+        df_daily = daily_frame(365 * years)
+        before = per_run_ms(fitness_figure, df_daily)
+        after = per_run_ms(cached_fitness_figure, df_daily)
+        print(f"{years:>6} y | {before:>12.1f} | {after:>11.1f} | {before / after:.0f}x")
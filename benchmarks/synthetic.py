@@ -0,0 +1,78 @@
+"""
+Synthetic intervals.icu payloads (activities + wellness) for benchmarks and
+load tests: 1-3 activities per day, deterministic for a given seed, with the
+fields the dashboard reads plus filler shaped like the real API response.
+"""
+import random
+from datetime import datetime, timedelta
+
+ACTIVITY_TEMPLATES = [
+    # (type, names, moving_time range in s, distance m/s)
+    ("Ride", ["Endurance ride", "Sweet spot intervals", "Group ride"], (2700, 14400), 8.0),
+    ("VirtualRide", ["Zwift race", "FTP builder"], (1800, 5400), 9.0),
+    ("Run", ["Easy run", "Tempo run", "Long run", "Track 6x800"], (1500, 7200), 3.2),
+    ("TrailRun", ["Trail loop"], (3600, 10800), 2.5),
+    ("Swim", ["Pool 3k", "Open water"], (1800, 4200), 0.9),
+    ("WeightTraining", ["Leg day", "Bench press + triceps", "Pull + core", "Deadlift day", "Full body metcon"], (2400, 5400), 0.0),
+    ("Yoga", ["Mobility flow"], (1200, 3600), 0.0),
+]
+FILLER_FIELDS = 60  # The real payload carries ~100 keys per activity
+
+
+def make_activities(years=1, seed=0, end=None):
+    """Activities for `years` years up to `end` (default today), newest first like the API."""
+    rnd = random.Random(seed)
+    end = end or datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    activities = []
+    for day_offset in range(int(365 * years)):
+        day = end - timedelta(days=day_offset)
+        for slot in sorted(rnd.sample(range(5, 21), rnd.randint(1, 3)), reverse=True):
+            type_, names, (t_min, t_max), speed = rnd.choice(ACTIVITY_TEMPLATES)
+            moving_time = rnd.randint(t_min, t_max)
+            act = {
+                "id": f"i{seed}_{day_offset}_{slot}",
+                "start_date_local": (day + timedelta(hours=slot)).strftime("%Y-%m-%dT%H:%M:%S"),
+                "type": type_,
+                "name": rnd.choice(names),
+                "moving_time": moving_time,
+                "elapsed_time": moving_time + rnd.randint(0, 600),
+                "distance": round(moving_time * speed * rnd.uniform(0.8, 1.2), 1),
+                "icu_training_load": rnd.randint(10, 250),
+                "suffer_score": rnd.choice([None, rnd.randint(5, 300)]),
+                "average_heartrate": rnd.randint(95, 170),
+                "max_heartrate": rnd.randint(150, 195),
+            }
+            act.update({f"field_{k}": rnd.random() for k in range(FILLER_FIELDS)})
+            activities.append(act)
+    return activities
+
+
+def make_wellness(years=1, end=None, ctl_start=30.0):
+    """One wellness row per day (oldest first) with server-side ctl/atl."""
+    rnd = random.Random(1)
+    end = end or datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    days = int(365 * years)
+    rows, ctl, atl = [], ctl_start, ctl_start
+    for day_offset in range(days - 1, -1, -1):
+        load = rnd.uniform(0, 200)
+        ctl += (load - ctl) * 2 / 43
+        atl += (load - atl) * 2 / 8
+        rows.append({
+            "id": (end - timedelta(days=day_offset)).strftime("%Y-%m-%d"),
+            "ctl": round(ctl, 2), "atl": round(atl, 2),
+            "restingHR": rnd.randint(42, 55), "hrv": rnd.randint(40, 90), "weight": round(rnd.uniform(68, 72), 1),
+        })
+    return rows
+
+
+SAMPLE_WORKOUT = """**Threshold Builder**
+**Warm Up**
+- 15 min easy, building to Z2
+- 3 x 1 min high cadence, 1 min easy
+**Main Set**
+- 3 x 12 min @ 95-100% FTP, 4 min easy between
+- Keep cadence 85-95 rpm
+**Cool Down**
+- 10 min easy spin
+**Coach's Logic**
+Form is positive after two easy days, so this is the right time for threshold work."""
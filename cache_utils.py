@@ -0,0 +1,157 @@
+"""
+Small helpers shared by the in-process caches (PDFs, AI responses) and the
+single-flight layer that merges identical in-flight AI requests.
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+
+
+def content_key(*parts):
+    """SHA-256 over the given parts; used as a compact cache key for long texts."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(str(part).encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+class LRUCache:
+    """Thread-safe, size-bounded LRU mapping (Streamlit sessions run on separate threads)."""
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._data:
+                return default
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def get_many(self, keys, default=None):
+        """get() for a batch of keys under one lock acquisition."""
+        data = self._data
+        with self._lock:
+            values = [data.get(key, default) for key in keys]
+            for key, value in zip(keys, values):
+                if value is not default:
+                    data.move_to_end(key)
+        return values
+
+    def put_many(self, items):
+        with self._lock:
+            for key, value in items:
+                self._data[key] = value
+                self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key, default=None):
+        with self._lock:
+            return self._data.pop(key, default)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._data
+
+    def __len__(self):
+        with self._lock:
+            return len(self._data)
+
+
+class _Flight:
+    """One outstanding call; its output pieces are replayed to every caller that joins."""
+
+    def __init__(self):
+        self.parts = []
+        self.finished = False
+        self.error = None
+        self._cond = threading.Condition()
+
+    def push(self, piece):
+        with self._cond:
+            self.parts.append(piece)
+            self._cond.notify_all()
+
+    def finish(self, error=None):
+        with self._cond:
+            self.finished = True
+            self.error = error
+            self._cond.notify_all()
+
+    def follow(self):
+        """Yields every piece so far, then new ones as they arrive; re-raises the call's error."""
+        seen = 0
+        while True:
+            with self._cond:
+                while seen == len(self.parts) and not self.finished:
+                    self._cond.wait()
+                new = self.parts[seen:]
+                seen = len(self.parts)
+                finished, error = self.finished, self.error
+            yield from new
+            if finished:
+                if error is not None:
+                    raise error
+                return
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical calls: the first caller for a key starts
+    `produce()` on a background thread and everyone asking for the same key
+    while it runs streams the same pieces instead of making their own call.
+    The call keeps going if a caller disconnects, so the others still get it.
+    """
+
+    def __init__(self):
+        self._flights = {}
+        self._lock = threading.Lock()
+        self.started = 0
+        self.joined = 0
+
+    def stream(self, key, produce):
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+                self.started += 1
+            else:
+                self.joined += 1
+        if leader:
+            threading.Thread(target=self._run, args=(key, flight, produce), daemon=True).start()
+        return flight.follow()
+
+    def _run(self, key, flight, produce):
+        error = None
+        try:
+            for piece in produce():
+                flight.push(piece)
+        except BaseException as e:
+            error = e
+        finally:
+            # Unregister before finishing, so a caller that arrives after a failure
+            # starts a fresh call instead of joining this one and getting its error
+            with self._lock:
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+            flight.finish(error)
+
+    def in_flight(self):
+        with self._lock:
+            return len(self._flights)
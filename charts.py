@@ -0,0 +1,199 @@
+"""
+Fitness Progress chart (plus the smaller figures: muscle focus, profiler waterfall).
+
+Multi-year daily series are thinned with Largest-Triangle-Three-Buckets down
+to roughly one point per horizontal pixel before they are serialized, which
+keeps the shape (peaks and dips) while sending a fraction of the points.
+Box-selecting a range on the chart redraws just that range, at full
+resolution once it fits the point budget. Large series can be drawn with
+WebGL (Scattergl). Built figures are memoized on a fingerprint of the daily
+series, so reruns that don't change the data skip the Plotly build.
+"""
+import hashlib
+import os
+
+import numpy as np
+import plotly.graph_objects as go
+
+from cache_utils import LRUCache
+
+CHART_POINTS = int(os.environ.get("AETHERIUM_CHART_POINTS", 1000))  # ~ chart width in px (wide layout)
+CHART_RENDERER = os.environ.get("AETHERIUM_CHART_RENDERER", "auto")  # "svg", "webgl" or "auto"
+WEBGL_MIN_POINTS = 2000  # "auto" switches to Scattergl above this many plotted points
+FIGURE_CACHE_SIZE = int(os.environ.get("AETHERIUM_FIGURE_CACHE_SIZE", 32))
+
+_figure_cache = LRUCache(FIGURE_CACHE_SIZE)
+
+
+def lttb(x, y, threshold):
+    """
+    Indices of the points Largest-Triangle-Three-Buckets keeps out of (x, y).
+    The first and last points are always kept; threshold >= len (or < 3, too
+    few for a first, a last and one bucket in between) means "all".
+    """
+    n = len(y)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
+    # threshold - 2 buckets over the inner points
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    keep = np.empty(threshold, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        # Twice the triangle area between the last kept point, each candidate and the next bucket's mean
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        keep[i + 1] = a
+    return keep
+
+
+def downsample(df_daily, column='ctl', points=CHART_POINTS):
+    """Rows of df_daily picked by LTTB on `column` (all rows if it already fits)."""
+    if len(df_daily) <= points:
+        return df_daily
+    x = df_daily['date'].to_numpy().astype('datetime64[ns]').astype(np.int64)
+    return df_daily.iloc[lttb(x, df_daily[column].to_numpy(), points)]
+
+
+def use_webgl(n_points, renderer=CHART_RENDERER):
+    if renderer == "webgl":
+        return True
+    if renderer == "svg":
+        return False
+    return n_points > WEBGL_MIN_POINTS
+
+
+def fitness_figure(df_daily, x_range=None, points=CHART_POINTS, renderer=CHART_RENDERER):
+    """
+    The Fitness Progress (CTL) figure. `x_range` = (start, end) limits it to a
+    zoomed window, which is then downsampled on its own (so a short window is
+    drawn with every day).
+    """
+    if x_range is not None:
+        df_daily = df_daily[(df_daily['date'] >= x_range[0]) & (df_daily['date'] <= x_range[1])]
+    plotted = downsample(df_daily, 'ctl', points)
+    trace = go.Scattergl if use_webgl(len(plotted), renderer) else go.Scatter
+
+    fig = go.Figure()
+
+    # PLOT ONLY FITNESS (CTL)
+    # We add a fill to make it look like a progress mountain
+    fig.add_trace(trace(
+        x=plotted['date'],
+        y=plotted['ctl'],
+        mode='lines',
+        name='Fitness (CTL)',
+        line=dict(color="#70C4B0", width=4), # Teal color, slightly thicker
+        fill='tozeroy', # Fills the area under the line
+        fillcolor='rgba(112, 196, 176, 0.15)', # Semi-transparent teal glow
+        hovertemplate="<b>Fitness</b>: %{y:.1f}<extra></extra>"
+    ))
+
+    fig.update_layout(
+        hovermode="x unified",
+        hoverlabel=dict(bgcolor="rgba(30, 30, 30, 0.9)", font_size=14, font_color="white"),
+        paper_bgcolor="rgba(0,0,0,0)",
+        plot_bgcolor="rgba(0,0,0,0)",
+        font=dict(color="white"),
+        showlegend=False, # Hide legend since there's only one line
+        dragmode="select", # Box-select a range to redraw it in full detail
+        selectdirection="h",
+        xaxis=dict(
+            gridcolor="rgba(255, 255, 255, 0.1)",
+            tickfont=dict(color="white"),
+            title=None,
+            hoverformat="%b %d, %Y"
+        ),
+        yaxis=dict(
+            gridcolor="rgba(255, 255, 255, 0.1)",
+            tickfont=dict(color="white"),
+            zeroline=False,
+            title="Fitness Score"
+        ),
+        margin=dict(l=0, r=0, t=10, b=0) # Tighter margins
+    )
+    return fig
+
+
+def fingerprint(df_daily, columns=('date', 'ctl')):
+    """Cheap content hash of the plotted columns (raw bytes, no per-row work)."""
+    digest = hashlib.sha1(str(len(df_daily)).encode())
+    for column in columns:
+        digest.update(df_daily[column].to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def cached_fitness_figure(df_daily, x_range=None, points=CHART_POINTS, renderer=CHART_RENDERER):
+    """
+    fitness_figure(), memoized per (data fingerprint, zoom window, settings) and
+    shared by all sessions. The returned figure is shared: don't modify it.
+    """
+    window = None if x_range is None else tuple(str(v) for v in x_range)
+    key = (fingerprint(df_daily), window, points, renderer)
+    fig = _figure_cache.get(key)
+    if fig is None:
+        fig = fitness_figure(df_daily, x_range, points, renderer)
+        _figure_cache.put(key, fig)
+    return fig
+
+
+MUSCLE_COLORS = ["#70C4B0", "#E0A458", "#7A9CC6", "#C67A9C", "#B0B0B0"]
+
+
+def muscle_distribution_figure(counts):
+    """Stacked bars of strength sessions per muscle group (see history.muscle_distribution)."""
+    fig = go.Figure()
+    for group, color in zip(counts.columns, MUSCLE_COLORS):
+        fig.add_trace(go.Bar(
+            x=counts.index, y=counts[group], name=group, marker_color=color,
+            hovertemplate=f"<b>{group}</b>: %{{y}}<extra></extra>"
+        ))
+
+    fig.update_layout(
+        barmode="stack",
+        hovermode="x unified",
+        hoverlabel=dict(bgcolor="rgba(30, 30, 30, 0.9)", font_size=14, font_color="white"),
+        paper_bgcolor="rgba(0,0,0,0)",
+        plot_bgcolor="rgba(0,0,0,0)",
+        font=dict(color="white"),
+        legend=dict(orientation="h", y=1.1, x=0),
+        xaxis=dict(tickfont=dict(color="white"), title=None, type="category"),
+        yaxis=dict(gridcolor="rgba(255, 255, 255, 0.1)", tickfont=dict(color="white"), title="Sessions"),
+        margin=dict(l=0, r=0, t=30, b=0)
+    )
+    return fig
+
+
+SPAN_COLORS = {"section": "#70C4B0", "io": "#E0A458", "call": "#7A9CC6"}
+
+
+def waterfall_figure(trace):
+    """Horizontal timeline of one profiler trace (profiler.RerunTrace.to_dict())."""
+    spans = trace["spans"]
+    labels = [f"{'  ' * s['depth']}{s['name']}" for s in spans]
+    fig = go.Figure(go.Bar(
+        y=labels,
+        x=[s["duration_ms"] for s in spans],
+        base=[s["start_ms"] for s in spans],
+        orientation="h",
+        marker_color=[SPAN_COLORS.get(s["category"], "#B0B0B0") for s in spans],
+        customdata=[s["duration_ms"] for s in spans],
+        hovertemplate="<b>%{y}</b><br>%{base:.0f} ms + %{customdata:.1f} ms<extra></extra>"
+    ))
+    fig.update_layout(
+        paper_bgcolor="rgba(0,0,0,0)",
+        plot_bgcolor="rgba(0,0,0,0)",
+        font=dict(color="white", size=11),
+        height=max(160, 22 * len(spans) + 40),
+        xaxis=dict(gridcolor="rgba(255, 255, 255, 0.1)", title="ms", rangemode="tozero"),
+        yaxis=dict(autorange="reversed", type="category"),
+        margin=dict(l=0, r=0, t=10, b=0)
+    )
+    return fig
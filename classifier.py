@@ -0,0 +1,143 @@
+"""
+Activity classification: sport (TYPE_MAPPING) and muscle focus (MUSCLE_KEYWORDS).
+
+All keywords are compiled into one overlapping-match regex, so a name is
+scanned once instead of once per keyword, and only the distinct names of a
+history are scanned at all. Results are kept per activity id (and reused
+until the activity's name or type changes), so a rerun or a longer history
+only classifies activities it hasn't seen.
+"""
+import re
+
+import numpy as np
+import pandas as pd
+
+from cache_utils import LRUCache
+
+TYPE_MAPPING = {
+    "Ride": "Cycling", "GravelRide": "Cycling", "VirtualRide": "Cycling",
+    "Run": "Running", "TrailRun": "Running", "Treadmill": "Running",
+    "Walk": "Running/Walking", "Hike": "Running/Walking",
+    "WeightTraining": "Strength", "Yoga": "Mobility", "Pilates": "Mobility"
+}
+
+MUSCLE_KEYWORDS = {
+    "Legs": ["squat", "leg", "quad", "hamstring", "glute", "calf", "deadlift", "lunge"],
+    "Chest/Push": ["bench", "press", "push", "chest", "tricep", "shoulder", "dip"],
+    "Back/Pull": ["row", "pull", "back", "deadlift", "lat", "bicep", "chin"],
+    "Core": ["plank", "core", "abs", "situp", "crunch"],
+    "Full Body": ["crossfit", "hiit", "metcon", "full"]
+}
+MUSCLE_GROUPS = list(MUSCLE_KEYWORDS)
+
+CLASSIFY_CACHE_SIZE = 200_000  # Activity ids, across all athletes
+
+
+def _keyword_masks(muscle_keywords):
+    """keyword -> bitmask of its groups, including groups of keywords it starts with."""
+    groups = list(muscle_keywords)
+    masks = {}
+    for i, group in enumerate(groups):
+        for word in muscle_keywords[group]:
+            masks[word] = masks.get(word, 0) | (1 << i)
+    # The regex only reports the longest keyword at a position; a shorter one
+    # starting at the same spot is a prefix of it, so fold its groups in
+    for word in masks:
+        for other, mask in list(masks.items()):
+            if other != word and word.startswith(other):
+                masks[word] |= mask
+    return masks
+
+
+class ActivityClassifier:
+    """Sport + muscle focus for whole histories, with a per-activity-id cache."""
+
+    def __init__(self, type_mapping=TYPE_MAPPING, muscle_keywords=MUSCLE_KEYWORDS, cache_size=CLASSIFY_CACHE_SIZE):
+        self.type_mapping = type_mapping
+        self.groups = list(muscle_keywords)
+        self._masks = _keyword_masks(muscle_keywords)
+        words = sorted(self._masks, key=len, reverse=True)
+        # Zero-width lookahead: every position is tried, so overlapping keywords all count
+        self._pattern = re.compile("(?=(" + "|".join(map(re.escape, words)) + "))")
+        self._cache = LRUCache(cache_size)
+
+    def name_mask(self, name):
+        """Bitmask of the muscle groups mentioned in one activity name."""
+        mask = 0
+        for word in self._pattern.findall(str(name).lower()):
+            mask |= self._masks[word]
+        return mask
+
+    def focus_label(self, mask):
+        """Same labels as before: "General", "Full Body" for 3+ groups, else the groups joined."""
+        matches = [group for i, group in enumerate(self.groups) if mask >> i & 1]
+        if not matches: return "General"
+        if len(matches) >= 3: return "Full Body"
+        return ", ".join(matches)
+
+    def muscle_focus(self, name):
+        return self.focus_label(self.name_mask(name))
+
+    def _classify(self, names, types):
+        # Distinct names only: "Leg day" x 200 is scanned once
+        lowered = names.fillna("").astype(str).str.lower()
+        codes, uniques = pd.factorize(lowered)
+        unique_masks = np.fromiter((self.name_mask(n) for n in uniques), dtype=np.int64, count=len(uniques))
+        masks = unique_masks[codes] if len(codes) else np.zeros(0, dtype=np.int64)
+
+        raw_type = types.astype(object).fillna("Other")
+        sports = raw_type.map(self.type_mapping).fillna(raw_type)
+        return sports.to_numpy(dtype=object), masks
+
+    def classify(self, frame):
+        """
+        Adds `sport` (category), `muscle_focus` (category) and one boolean column
+        per muscle group to an ActivityFrame (see activity_frame.py).
+        """
+        frame = frame.copy()
+        n = len(frame)
+        sports = np.empty(n, dtype=object)
+        masks = np.zeros(n, dtype=np.int64)
+
+        ids = frame['id'].astype(str).to_numpy()
+        names = frame['name'].astype(object).to_numpy()
+        types = frame['type'].astype(object).to_numpy()
+        missing = []
+        hits = self._cache.get_many(ids)
+        for pos, (hit, name, type_) in enumerate(zip(hits, names, types)):
+            if hit is not None and hit[0] == name and hit[1] == type_:
+                sports[pos], masks[pos] = hit[2], hit[3]
+            else:
+                missing.append(pos)
+
+        if missing:
+            idx = np.asarray(missing)
+            new_sports, new_masks = self._classify(
+                pd.Series(names[idx], dtype=object), pd.Series(types[idx], dtype=object)
+            )
+            sports[idx], masks[idx] = new_sports, new_masks
+            self._cache.put_many(
+                (ids[pos], (names[pos], types[pos], sport, int(mask)))
+                for pos, sport, mask in zip(idx, new_sports, new_masks)
+            )
+
+        frame['sport'] = pd.Categorical(sports)
+        unique_masks, inverse = np.unique(masks, return_inverse=True)
+        labels = np.array([self.focus_label(m) for m in unique_masks.tolist()], dtype=object)
+        frame['muscle_focus'] = pd.Categorical(labels[inverse])
+        for i, group in enumerate(self.groups):
+            frame[group] = (masks >> i & 1).astype(bool)
+        return frame
+
+
+_classifier = ActivityClassifier()
+
+
+def classify_activities(frame):
+    """classify() with the shared, process-wide classifier."""
+    return _classifier.classify(frame)
+
+
+def muscle_focus(name):
+    """Muscle focus label for a single activity name."""
+    return _classifier.muscle_focus(name)
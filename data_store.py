@@ -0,0 +1,165 @@
+"""
+Local per-athlete store for intervals.icu activities & wellness.
+
+Every athlete gets a small SQLite file holding the raw JSON rows plus the
+date range that has already been synced, so a page load only has to ask the
+API for the days since the last sync (and a short overlap to catch edits).
+"""
+import hashlib
+import json
+import os
+import sqlite3
+from contextlib import closing
+from datetime import datetime, timedelta
+
+DATA_DIR = os.environ.get("AETHERIUM_DATA_DIR", ".aetherium_data")
+SYNC_OVERLAP_DAYS = 7  # Re-fetch the last week on every sync so edits/deletes land
+
+
+def athlete_key(token_data):
+    """Stable per-athlete key: the athlete id from the OAuth response, else a token hash."""
+    athlete = (token_data or {}).get('athlete') or {}
+    if athlete.get('id'):
+        return str(athlete['id'])
+    token = (token_data or {}).get('access_token', '')
+    return "t_" + hashlib.sha256(token.encode()).hexdigest()[:16]
+
+
+def _row_timestamp(kind, row):
+    # Wellness rows use the date as their id, activities carry a local timestamp
+    if kind == "wellness":
+        return str(row.get('id', ''))
+    return str(row.get('start_date_local', ''))
+
+
+def _shift(day, days):
+    return (datetime.strptime(day, '%Y-%m-%d') + timedelta(days=days)).strftime('%Y-%m-%d')
+
+
+class AthleteStore:
+    """SQLite-backed cache of one athlete's intervals.icu payloads."""
+
+    def __init__(self, athlete_id, data_dir=DATA_DIR):
+        os.makedirs(data_dir, exist_ok=True)
+        safe_id = "".join(c for c in str(athlete_id) if c.isalnum() or c in "-_") or "default"
+        self.path = os.path.join(data_dir, f"{safe_id}.sqlite")
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS rows (
+                    kind TEXT NOT NULL, row_id TEXT NOT NULL, day TEXT NOT NULL,
+                    sort_key TEXT NOT NULL, payload TEXT NOT NULL,
+                    PRIMARY KEY (kind, row_id)
+                )""")
+            conn.execute("CREATE INDEX IF NOT EXISTS rows_day ON rows (kind, day)")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS sync_state (
+                    kind TEXT PRIMARY KEY, oldest TEXT NOT NULL, newest TEXT NOT NULL, synced_at TEXT NOT NULL
+                )""")
+            # Carried-forward CTL/ATL state (see metrics.incremental_training_load): one row,
+            # the per-day series stored as float64 blobs so a rerun reads them in one go
+            conn.execute("DROP TABLE IF EXISTS daily_metrics")  # Old one-row-per-day layout
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS training_state (
+                    id INTEGER PRIMARY KEY CHECK (id = 1), first_day TEXT NOT NULL, last_day TEXT NOT NULL,
+                    ctl REAL NOT NULL, atl REAL NOT NULL, loads BLOB NOT NULL,
+                    ctl_series BLOB NOT NULL, atl_series BLOB NOT NULL
+                )""")
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=10)
+
+    def sync_range(self, kind):
+        """Returns the (oldest, newest) days already synced for this kind, or (None, None)."""
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT oldest, newest FROM sync_state WHERE kind = ?", (kind,)).fetchone()
+        return row if row else (None, None)
+
+    def windows_to_fetch(self, kind, oldest, newest, overlap_days=SYNC_OVERLAP_DAYS):
+        """Works out which (oldest, newest) windows still need to come from the API."""
+        synced_oldest, synced_newest = self.sync_range(kind)
+        if synced_oldest is None:
+            return [(oldest, newest)]
+
+        if oldest > _shift(synced_newest, 1):
+            # Nothing synced since before this window starts: take the whole window. It
+            # doesn't touch the old range, so it replaces it (see _extend_sync_range)
+            return [(oldest, newest)]
+
+        windows = []
+        # Backfill if the requested range now reaches further back than what we have
+        if oldest < synced_oldest:
+            windows.append((oldest, _shift(synced_oldest, -1)))
+        # Delta since the last sync, plus an overlap to catch edited activities
+        delta_start = max(oldest, min(_shift(synced_newest, -overlap_days), newest))
+        windows.append((delta_start, newest))
+        return windows
+
+    def replace_range(self, kind, oldest, newest, rows, mark_synced=True):
+        """
+        Replaces everything stored in [oldest, newest] with a fresh API response.
+        Pass mark_synced=False when the window is one piece of a larger fetch and
+        call mark_synced() once every piece has landed.
+        """
+        records = []
+        for row in rows:
+            stamp = _row_timestamp(kind, row)
+            row_id = str(row.get('id', stamp))
+            records.append((kind, row_id, stamp[:10], stamp, json.dumps(row)))
+
+        with closing(self._connect()) as conn, conn:
+            # Anything in the window that the API no longer returns was deleted upstream
+            conn.execute("DELETE FROM rows WHERE kind = ? AND day BETWEEN ? AND ?", (kind, oldest, newest))
+            conn.executemany("INSERT OR REPLACE INTO rows VALUES (?, ?, ?, ?, ?)", records)
+            if mark_synced:
+                self._extend_sync_range(conn, kind, oldest, newest)
+
+    def mark_synced(self, kind, oldest, newest):
+        """Records [oldest, newest] as synced (a window that doesn't touch the synced range replaces it)."""
+        with closing(self._connect()) as conn, conn:
+            self._extend_sync_range(conn, kind, oldest, newest)
+
+    def _extend_sync_range(self, conn, kind, oldest, newest):
+        current = conn.execute("SELECT oldest, newest FROM sync_state WHERE kind = ?", (kind,)).fetchone()
+        # Only merge ranges that overlap or are adjacent; min/max over a gap would
+        # claim the days in between as synced
+        if current and oldest <= _shift(current[1], 1) and newest >= _shift(current[0], -1):
+            oldest, newest = min(oldest, current[0]), max(newest, current[1])
+        conn.execute(
+            "INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?, ?)",
+            (kind, oldest, newest, datetime.now().isoformat(timespec='seconds'))
+        )
+
+    def load(self, kind, oldest, newest):
+        """Reads stored rows for a date range, in the same order the API returns them."""
+        # The activities endpoint lists newest first, wellness oldest first
+        order = "DESC" if kind == "activities" else "ASC"
+        with closing(self._connect()) as conn:
+            cur = conn.execute(
+                f"SELECT payload FROM rows WHERE kind = ? AND day BETWEEN ? AND ? ORDER BY sort_key {order}",
+                (kind, oldest, newest)
+            )
+            return [json.loads(payload) for (payload,) in cur]
+
+    def load_training_state(self):
+        """Returns the saved (first_day, loads, ctl_series, atl_series) as raw bytes, or None."""
+        with closing(self._connect()) as conn:
+            return conn.execute(
+                "SELECT first_day, loads, ctl_series, atl_series FROM training_state WHERE id = 1"
+            ).fetchone()
+
+    def save_training_state(self, first_day, last_day, loads, ctl_series, atl_series):
+        """Replaces the saved state; the series are float64 arrays starting at first_day."""
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO training_state VALUES (1, ?, ?, ?, ?, ?, ?, ?)",
+                (first_day, last_day, float(ctl_series[-1]), float(atl_series[-1]),
+                 loads.tobytes(), ctl_series.tobytes(), atl_series.tobytes())
+            )
+
+    def clear(self):
+        """Drops all stored rows, sync state and metrics (used on logout)."""
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM rows")
+            conn.execute("DELETE FROM sync_state")
+            conn.execute("DELETE FROM training_state")
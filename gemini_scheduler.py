@@ -0,0 +1,160 @@
+"""
+Process-wide scheduler for Gemini calls.
+
+Every session shares one token bucket, so a burst of users queues up instead
+of tripping the API quota. A call that still gets a 429 is retried with
+jittered exponential backoff, then moves down the model fallback chain.
+Queue depth and wait times are tracked for the UI.
+"""
+import os
+import random
+import threading
+import time
+
+FALLBACK_MODELS = [
+    m.strip() for m in os.environ.get(
+        "AETHERIUM_AI_MODELS", "gemini-2.0-flash-lite,gemini-2.0-flash"
+    ).split(",") if m.strip()
+]
+REQUESTS_PER_MINUTE = float(os.environ.get("AETHERIUM_AI_RPM", 30))
+BURST = int(os.environ.get("AETHERIUM_AI_BURST", 5))
+MAX_RETRIES = 3        # Per model, before falling back to the next one
+BACKOFF_BASE = 1.0     # Seconds; doubles every retry
+BACKOFF_MAX = 20.0
+
+
+def is_rate_limited(error):
+    """True for quota / 429 errors from the genai SDK (or anything that looks like one)."""
+    if getattr(error, "code", None) == 429:
+        return True
+    text = str(error)
+    return "429" in text or "RESOURCE_EXHAUSTED" in text
+
+
+class TokenBucket:
+    """Classic token bucket: `rate` tokens per second, holding at most `capacity`."""
+
+    def __init__(self, rate, capacity):
+        # rate 0 would divide by zero in acquire(); capacity < 1 never holds a whole token
+        if rate <= 0:
+            raise ValueError(f"token bucket rate must be positive, got {rate}")
+        if capacity < 1:
+            raise ValueError(f"token bucket capacity must be at least 1, got {capacity}")
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Blocks until a token is available and returns how long that took (seconds)."""
+        start = time.monotonic()
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return now - start
+                needed = (1 - self.tokens) / self.rate
+            time.sleep(needed)
+
+
+class GeminiScheduler:
+    """Rate limiting, retry/backoff and model fallback around any Gemini call."""
+
+    def __init__(self, models=None, requests_per_minute=REQUESTS_PER_MINUTE, burst=BURST,
+                 max_retries=MAX_RETRIES, backoff_base=BACKOFF_BASE, backoff_max=BACKOFF_MAX):
+        self.models = list(models or FALLBACK_MODELS)
+        if not self.models:
+            raise ValueError("no Gemini models configured (AETHERIUM_AI_MODELS)")
+        if requests_per_minute <= 0:
+            raise ValueError(f"AETHERIUM_AI_RPM must be positive, got {requests_per_minute}")
+        if burst < 1:
+            raise ValueError(f"AETHERIUM_AI_BURST must be at least 1, got {burst}")
+        if max_retries < 1:
+            raise ValueError(f"max_retries must be at least 1, got {max_retries}")
+        self.bucket = TokenBucket(requests_per_minute / 60.0, burst)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._in_flight = 0
+        self._stats = {"requests": 0, "rate_limited": 0, "fallbacks": 0, "failures": 0,
+                       "total_wait_s": 0.0, "max_wait_s": 0.0}
+
+    def _backoff(self, attempt):
+        # "Full jitter": spreads retries from many sessions instead of syncing them up
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    def _wait_for_slot(self):
+        with self._lock:
+            self._queued += 1
+        try:
+            waited = self.bucket.acquire()
+        finally:
+            with self._lock:
+                self._queued -= 1
+        with self._lock:
+            self._stats["total_wait_s"] += waited
+            self._stats["max_wait_s"] = max(self._stats["max_wait_s"], waited)
+
+    def run(self, call, models=None):
+        """
+        Runs call(model) under the rate limit, retrying rate-limited attempts and
+        walking the fallback chain. Returns (result, model_used).
+        """
+        chain = list(models or self.models)
+        last_error = None
+        for position, model in enumerate(chain):
+            if position > 0:
+                with self._lock:
+                    self._stats["fallbacks"] += 1
+            for attempt in range(self.max_retries):
+                self._wait_for_slot()
+                with self._lock:
+                    self._stats["requests"] += 1
+                    self._in_flight += 1
+                try:
+                    return call(model), model
+                except Exception as e:
+                    if not is_rate_limited(e):
+                        with self._lock:
+                            self._stats["failures"] += 1
+                        raise
+                    last_error = e
+                    with self._lock:
+                        self._stats["rate_limited"] += 1
+                finally:
+                    with self._lock:
+                        self._in_flight -= 1
+                if attempt < self.max_retries - 1:
+                    time.sleep(self._backoff(attempt))
+
+        with self._lock:
+            self._stats["failures"] += 1
+        raise last_error
+
+    def stats(self):
+        """Snapshot of queue depth, in-flight calls and wait-time counters."""
+        with self._lock:
+            snapshot = dict(self._stats, queue_depth=self._queued, in_flight=self._in_flight)
+        served = snapshot["requests"] or 1
+        snapshot["avg_wait_s"] = snapshot["total_wait_s"] / served
+        return snapshot
+
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler():
+    """The process-wide scheduler shared by all sessions."""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = GeminiScheduler()
+        return _scheduler
@@ -0,0 +1,82 @@
+"""
+Performance history (Section 8): sessions and load per week, month or year,
+and how strength sessions split across muscle groups over the same periods.
+
+The aggregation is one groupby and the rows are built with vectorized string
+concatenation into a single HTML block, so the page sends one element no
+matter how many periods the history covers.
+"""
+import pandas as pd
+
+from classifier import MUSCLE_GROUPS
+
+# Label -> (pandas period frequency, display format of the period start)
+GRANULARITIES = {
+    "Weekly": ("W-SUN", "Week of %b %d, %Y"),
+    "Monthly": ("M", "%B %Y"),
+    "Yearly": ("Y", "%Y"),
+}
+
+
+def aggregate_history(df, granularity="Monthly"):
+    """Sessions and total icu_training_load per period, newest first."""
+    freq, label_format = GRANULARITIES[granularity]
+    if isinstance(df.index, pd.DatetimeIndex):
+        dates = df.index  # ActivityFrame: parsed once at ingestion
+    else:
+        dates = pd.DatetimeIndex(pd.to_datetime(df['start_date_local']))
+    if 'icu_training_load' in df.columns:
+        load = pd.to_numeric(df['icu_training_load'], errors='coerce').fillna(0).to_numpy(dtype='float64')
+    else:
+        load = 0.0
+
+    table = (
+        pd.DataFrame({'Load': load}, index=dates.to_period(freq).rename('Period'))
+        .groupby(level='Period')
+        .agg(Sessions=('Load', 'size'), Load=('Load', 'sum'))
+        .sort_index(ascending=False)
+        .reset_index()
+    )
+    table['Label'] = table['Period'].dt.start_time.dt.strftime(label_format)
+    return table
+
+
+def history_table_html(table, period_title="MONTH"):
+    """One HTML block (header + every row) for the .perf-* styles in styles/theme.css."""
+    header = (
+        '<div class="perf-head">'
+        f'<div class="perf-head-period">{period_title}</div>'
+        '<div class="perf-head-cell">SESSIONS</div>'
+        '<div class="perf-head-cell perf-right">LOAD</div>'
+        '</div>'
+    )
+    rows = (
+        '<div class="performance-row"><div class="perf-period">' + table['Label']
+        + '</div><div class="perf-cell"><span class="perf-icon">🏃</span><b>'
+        + table['Sessions'].astype(int).astype(str)
+        + '</b></div><div class="perf-cell perf-right"><span class="perf-icon">🔥</span><b>'
+        + table['Load'].round().astype(int).astype(str)
+        + '</b></div></div>'
+    )
+    return header + "".join(rows.tolist())
+
+
+def muscle_distribution(frame, granularity="Monthly", sport="Strength"):
+    """
+    Strength sessions per muscle group and period, oldest first (for a stacked
+    chart). Needs a classified ActivityFrame (classifier.classify_activities).
+    """
+    freq, label_format = GRANULARITIES[granularity]
+    strength = frame[frame['sport'] == sport]
+    if strength.empty:
+        return pd.DataFrame(columns=MUSCLE_GROUPS)
+
+    counts = (
+        strength[MUSCLE_GROUPS]
+        .set_axis(strength.index.to_period(freq).rename('Period'))
+        .groupby(level='Period')
+        .sum()
+        .sort_index()
+    )
+    counts.index = counts.index.start_time.strftime(label_format)
+    return counts
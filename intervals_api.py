@@ -0,0 +1,207 @@
+"""
+intervals.icu API client.
+
+All calls go through one process-wide keep-alive session with a bounded
+retry/backoff policy, and every request carries its own timeout so a slow
+endpoint can't hang the dashboard. The three dashboard fetches run in
+parallel, so a page load costs roughly the slowest call instead of the sum.
+Multi-year history is backfilled quarter by quarter on a small shared pool.
+"""
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+INTERVALS_HOST = os.environ.get("AETHERIUM_INTERVALS_HOST", "https://intervals.icu")  # Point at loadtest/stub_server.py for load tests
+BASE_URL = f"{INTERVALS_HOST}/api/v1/athlete/0"
+AUTHORIZE_URL = f"{INTERVALS_HOST}/oauth/authorize"
+TOKEN_URL = f"{INTERVALS_HOST}/api/oauth/token"
+
+# (connect, read) timeouts in seconds, per endpoint
+TIMEOUTS = {
+    "wellness": (3.05, 20),
+    "activities": (3.05, 30),
+    "profile": (3.05, 10),
+    "token": (3.05, 10),  # OAuth code exchange / refresh
+}
+
+# Multi-year history is pulled in quarter-sized windows on a shared, bounded pool
+HISTORY_WINDOW_DAYS = 91
+HISTORY_WORKERS = 4
+RECENT_DAYS = 365  # Fetched up front so the dashboard can render before the backfill ends
+
+_session = None
+_session_lock = threading.Lock()
+_history_pool = ThreadPoolExecutor(max_workers=HISTORY_WORKERS, thread_name_prefix="history")
+_backfills = {}  # store.path -> (job, attempt): at most one job per athlete
+_backfills_lock = threading.Lock()
+
+
+def get_session():
+    """Returns the shared pooled session, creating it on first use."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            retry = Retry(
+                total=3,
+                read=0,  # A read timeout already waited the full budget; don't wait it again
+                backoff_factor=0.5,  # 0.5s, 1s, 2s
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset({"GET"}),
+                respect_retry_after_header=True,
+            )
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+        return _session
+
+
+def fetch_json(token, path="", params=None, timeout=TIMEOUTS["profile"]):
+    """GETs an athlete endpoint and returns the decoded JSON (raises on HTTP errors)."""
+    res = get_session().get(
+        f"{BASE_URL}{path}",
+        headers={"Authorization": f"Bearer {token}"},
+        params=params,
+        timeout=timeout,
+    )
+    res.raise_for_status()
+    return res.json()
+
+
+def sync_kind(store, token, kind, oldest, newest):
+    """Pulls whatever the local store is missing for one endpoint ("wellness"/"activities")."""
+    for win_oldest, win_newest in store.windows_to_fetch(kind, oldest, newest):
+        rows = fetch_json(token, f"/{kind}", {'oldest': win_oldest, 'newest': win_newest}, TIMEOUTS[kind])
+        store.replace_range(kind, win_oldest, win_newest, rows)
+
+
+def fetch_dashboard_data(store, token, oldest, newest):
+    """Syncs wellness + activities and fetches the athlete profile concurrently."""
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        well_job = pool.submit(sync_kind, store, token, "wellness", oldest, newest)
+        act_job = pool.submit(sync_kind, store, token, "activities", oldest, newest)
+        ath_job = pool.submit(fetch_json, token, "", None, TIMEOUTS["profile"])
+
+        well_job.result()
+        act_job.result()
+        ath_json = ath_job.result()
+
+    return store.load("wellness", oldest, newest), store.load("activities", oldest, newest), ath_json
+
+
+def _day(value):
+    return datetime.strptime(value, '%Y-%m-%d')
+
+
+def split_windows(oldest, newest, days=HISTORY_WINDOW_DAYS):
+    """Splits [oldest, newest] into consecutive windows of at most `days` days, newest first."""
+    windows = []
+    end = _day(newest)
+    start = _day(oldest)
+    while end >= start:
+        win_start = max(start, end - timedelta(days=days - 1))
+        windows.append((win_start.strftime('%Y-%m-%d'), end.strftime('%Y-%m-%d')))
+        end = win_start - timedelta(days=1)
+    return windows
+
+
+class HistoryBackfill:
+    """Older history windows being fetched in the background for one athlete."""
+
+    def __init__(self, store, token, oldest, newest_by_kind):
+        self.store = store
+        self.oldest = oldest
+        self.newest_by_kind = newest_by_kind
+        self.error = None
+        self.cancelled = False
+        self._finished = False
+        self._write_lock = threading.Lock()
+        self._futures = [
+            _history_pool.submit(self._fetch_window, token, kind, win_oldest, win_newest)
+            for kind, newest in newest_by_kind.items()
+            for win_oldest, win_newest in split_windows(oldest, newest)
+        ]
+
+    def _fetch_window(self, token, kind, oldest, newest):
+        if self.cancelled:
+            return
+        rows = fetch_json(token, f"/{kind}", {'oldest': oldest, 'newest': newest}, TIMEOUTS[kind])
+        with self._write_lock:
+            if not self.cancelled:  # Logged out while the request was running
+                self.store.replace_range(kind, oldest, newest, rows, mark_synced=False)
+
+    def cancel(self):
+        """
+        Stops the job: queued windows are dropped, and once this returns no
+        window writes to the store any more (so clearing it afterwards sticks).
+        """
+        with self._write_lock:
+            self.cancelled = True
+        for future in self._futures:
+            future.cancel()
+
+    def progress(self):
+        """Returns (windows done, windows total)."""
+        return sum(f.done() for f in self._futures), len(self._futures)
+
+    def done(self):
+        """True once every window has finished; the range is only marked synced if all succeeded."""
+        if self._finished:
+            return True
+        if self.cancelled:
+            self._finished = True
+            return True
+        if not all(f.done() for f in self._futures):
+            return False
+
+        errors = [f.exception() for f in self._futures if f.exception()]
+        if errors:
+            self.error = errors[0]
+        else:
+            for kind, newest in self.newest_by_kind.items():
+                self.store.mark_synced(kind, self.oldest, newest)
+        self._finished = True
+        return True
+
+
+def start_history_backfill(store, token, oldest, recent_oldest, attempt=0):
+    """
+    Starts (or returns the running) background fetch of everything older than
+    `recent_oldest` that the store doesn't have yet. Returns None if nothing is
+    missing. A failed job is kept (so the page doesn't retry in a loop) until
+    it is asked for with a new `attempt` number or a different `oldest`.
+    """
+    newest_by_kind = {}
+    for kind in ("wellness", "activities"):
+        synced_oldest, _ = store.sync_range(kind)
+        end = min(recent_oldest, synced_oldest or recent_oldest)
+        end = (_day(end) - timedelta(days=1)).strftime('%Y-%m-%d')
+        if end >= oldest:
+            newest_by_kind[kind] = end
+    key = store.path
+    with _backfills_lock:
+        if not newest_by_kind:
+            _backfills.pop(key, None)
+            return None
+
+        job, job_attempt = _backfills.get(key, (None, None))
+        # A running job is kept even if the window moved; once it ends, whatever
+        # is still missing gets a new one
+        if job is None or (job.done() and (not job.error or job_attempt != attempt or job.oldest != oldest)):
+            job = HistoryBackfill(store, token, oldest, newest_by_kind)
+            _backfills[key] = (job, attempt)
+        return job
+
+
+def cancel_history_backfill(store):
+    """Stops and forgets the athlete's background fetch (call before clearing the store)."""
+    with _backfills_lock:
+        job, _ = _backfills.pop(store.path, (None, None))
+    if job is not None:
+        job.cancel()
@@ -0,0 +1,178 @@
+"""
+End-to-end load harness: N simulated users drive app.py (through Streamlit's
+AppTest, one headless session each, on concurrent threads) against
+stub_server.py, and report rerun latency and throughput.
+
+Each user logs in through the stub OAuth flow, reruns the dashboard a few
+times (switching the history granularity, like a real visitor) and then
+generates a workout through the stubbed Gemini API.
+
+    python loadtest/harness.py --users 8 --reruns 5 --latency 120 --genai-429 0.1 --out loadtest.json
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+LOADTEST_DIR = os.path.dirname(os.path.abspath(__file__))
+APP_DIR = os.path.dirname(LOADTEST_DIR)
+sys.path.insert(0, LOADTEST_DIR)
+sys.path.insert(0, APP_DIR)
+
+from stub_server import StubConfig, start_in_thread  # noqa: E402
+
+APP_FILE = os.path.join(APP_DIR, "app.py")
+SECRETS = {"INTERVALS_CLIENT_ID": "stub", "INTERVALS_CLIENT_SECRET": "stub", "REDIRECT_URI": "http://localhost:8501"}
+GRANULARITY_CYCLE = ["Weekly", "Monthly", "Yearly"]
+
+
+def configure_app(base_url, data_dir):
+    """Points the app at the stub. Must run before the app modules are first imported."""
+    os.environ["AETHERIUM_INTERVALS_HOST"] = base_url
+    os.environ["AETHERIUM_GENAI_BASE_URL"] = base_url
+    os.environ["AETHERIUM_DATA_DIR"] = data_dir
+    os.environ.setdefault("AETHERIUM_TOKEN_KEY", "loadtest")
+    os.environ.setdefault("GEMINI_API_KEY", "stub")
+
+
+def _serialize_script_compile():
+    """
+    AppTest compiles app.py on every run, and CPython 3.11's ast.parse isn't
+    safe to call from several threads at once. Compile one at a time; the
+    scripts themselves still run concurrently.
+    """
+    from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+
+    if getattr(ScriptCache.get_bytecode, "_serialized", False):
+        return
+    lock = threading.Lock()
+    get_bytecode = ScriptCache.get_bytecode
+
+    def serialized(self, script_path):
+        with lock:
+            return get_bytecode(self, script_path)
+
+    serialized._serialized = True
+    ScriptCache.get_bytecode = serialized
+
+
+class SimulatedUser:
+    """One browser session; records (step, seconds, ok) for every rerun it triggers."""
+
+    def __init__(self, number, timeout):
+        from streamlit.testing.v1 import AppTest
+
+        self.number = number
+        self.at = AppTest.from_file(APP_FILE, default_timeout=timeout)
+        for key, value in SECRETS.items():
+            self.at.secrets[key] = value
+        self.samples = []
+
+    def _timed(self, step, action):
+        start = time.perf_counter()
+        ok = True
+        try:
+            action()
+            ok = not self.at.exception
+        except Exception:
+            ok = False
+        self.samples.append((step, time.perf_counter() - start, ok))
+
+    def session(self, reruns):
+        # 1. OAuth redirect lands with a code; the app exchanges it with the stub
+        self.at.query_params["code"] = f"loadtest-user-{self.number}"
+        self._timed("login", self.at.run)
+
+        # 2. Plain dashboard reruns, as widget interactions cause them
+        for i in range(reruns):
+            widget = self.at.button_group(key="history_granularity")
+            self._timed("rerun", lambda: widget.set_value(GRANULARITY_CYCLE[i % 3]).run())
+
+        # 3. Generate a workout (streams from the stub Gemini endpoint)
+        buttons = [b for b in self.at.button if "GENERATE" in b.label]
+        if buttons:
+            self._timed("generate", lambda: buttons[0].click().run())
+        return self.samples
+
+
+def summarize(samples):
+    report = {}
+    for step in sorted({s[0] for s in samples}):
+        times = sorted(t for name, t, _ in samples if name == step)
+        failures = sum(1 for name, _, ok in samples if name == step and not ok)
+        report[step] = {
+            "count": len(times),
+            "failures": failures,
+            "mean_s": statistics.fmean(times),
+            "p50_s": times[len(times) // 2],
+            "p95_s": times[min(len(times) - 1, int(len(times) * 0.95))],
+            "max_s": times[-1],
+        }
+    return report
+
+
+def run(users=4, reruns=3, config=None, timeout=120):
+    server, base_url = start_in_thread(config or StubConfig())
+    configure_app(base_url, tempfile.mkdtemp(prefix="aetherium-loadtest-"))
+
+    _serialize_script_compile()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=users, thread_name_prefix="user") as pool:
+        results = list(pool.map(lambda n: SimulatedUser(n, timeout).session(reruns), range(users)))
+    wall = time.perf_counter() - start
+
+    samples = [s for user in results for s in user]
+    report = {
+        "users": users,
+        "reruns_per_user": reruns,
+        "wall_s": wall,
+        "throughput_reruns_per_s": len(samples) / wall,
+        "steps": summarize(samples),
+        "stub": server.state.snapshot(),
+        "stub_config": vars(server.config),
+    }
+    try:
+        from gemini_scheduler import get_scheduler
+        report["gemini_scheduler"] = get_scheduler().stats()
+    except ImportError:
+        pass
+    server.shutdown()
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load-test app.py against the local stub server.")
+    parser.add_argument("--users", type=int, default=4, help="concurrent simulated users")
+    parser.add_argument("--reruns", type=int, default=3, help="dashboard reruns per user")
+    parser.add_argument("--latency", type=float, default=StubConfig.latency_ms, help="stub latency (ms)")
+    parser.add_argument("--jitter", type=float, default=StubConfig.jitter_ms)
+    parser.add_argument("--intervals-429", type=float, default=0.0)
+    parser.add_argument("--genai-429", type=float, default=0.0)
+    parser.add_argument("--years", type=float, default=StubConfig.years)
+    parser.add_argument("--timeout", type=float, default=120, help="per-rerun timeout (s)")
+    parser.add_argument("--out", help="write the report as JSON here")
+    args = parser.parse_args(argv)
+
+    config = StubConfig(
+        latency_ms=args.latency, jitter_ms=args.jitter, intervals_429=args.intervals_429,
+        genai_429=args.genai_429, years=args.years,
+    )
+    report = run(args.users, args.reruns, config, args.timeout)
+
+    print(f"{args.users} users, {report['wall_s']:.1f}s wall, {report['throughput_reruns_per_s']:.2f} reruns/s")
+    for step, stats in report["steps"].items():
+        print(f"  {step:<9} n={stats['count']:<4} p50={stats['p50_s']:.2f}s p95={stats['p95_s']:.2f}s "
+              f"max={stats['max_s']:.2f}s failures={stats['failures']}")
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
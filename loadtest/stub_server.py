@@ -0,0 +1,274 @@
+"""
+Local stand-in for intervals.icu (OAuth + athlete/wellness/activities) and
+the Gemini API, so the app can be load-tested without touching either.
+
+Responses are synthetic (benchmarks/synthetic.py, one history per athlete)
+or replayed from recorded JSON files, with configurable latency and a
+configurable share of 429 responses on each upstream.
+
+    python loadtest/stub_server.py --port 8765 --latency 120 --genai-429 0.1
+
+and point the app at it:
+
+    AETHERIUM_INTERVALS_HOST=http://127.0.0.1:8765 \\
+    AETHERIUM_GENAI_BASE_URL=http://127.0.0.1:8765 streamlit run app.py
+"""
+import argparse
+import hashlib
+import json
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlencode, urlparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+
+from synthetic import SAMPLE_WORKOUT, make_activities, make_wellness  # noqa: E402
+
+
+@dataclass
+class StubConfig:
+    latency_ms: float = 80.0        # Mean added latency per request
+    jitter_ms: float = 30.0         # Std deviation of that latency
+    intervals_429: float = 0.0      # Share of intervals.icu calls answered with 429
+    genai_429: float = 0.0          # Share of Gemini calls answered with 429
+    genai_chunk_ms: float = 40.0    # Delay between streamed Gemini chunks
+    years: float = 2                # Synthetic history length per athlete
+    replay_dir: str = None          # athlete.json / activities.json / wellness.json to serve instead
+
+
+class StubState:
+    """Per-athlete payloads (built on first use) and request counters."""
+
+    def __init__(self, config):
+        self.config = config
+        self._lock = threading.Lock()
+        self._payloads = {}
+        self.counts = {}
+        self.injected_429 = {}
+
+    def count(self, route, rate_limited=False):
+        with self._lock:
+            self.counts[route] = self.counts.get(route, 0) + 1
+            if rate_limited:
+                self.injected_429[route] = self.injected_429.get(route, 0) + 1
+
+    def payload(self, athlete_id):
+        with self._lock:
+            if athlete_id not in self._payloads:
+                self._payloads[athlete_id] = self._build(athlete_id)
+            return self._payloads[athlete_id]
+
+    def _build(self, athlete_id):
+        if self.config.replay_dir:
+            def read(name):
+                with open(os.path.join(self.config.replay_dir, name), encoding="utf-8") as f:
+                    return json.load(f)
+            return {"athlete": read("athlete.json"), "activities": read("activities.json"), "wellness": read("wellness.json")}
+        seed = int(hashlib.sha1(athlete_id.encode()).hexdigest()[:8], 16)
+        return {
+            "athlete": {"id": athlete_id, "name": f"Stub Athlete {athlete_id}"},
+            "activities": make_activities(self.config.years, seed=seed),
+            "wellness": make_wellness(self.config.years),
+        }
+
+    def snapshot(self):
+        with self._lock:
+            return {"requests": dict(self.counts), "injected_429": dict(self.injected_429)}
+
+
+def _athlete_for_code(code):
+    return "i" + str(int(hashlib.sha1(code.encode()).hexdigest()[:6], 16))
+
+
+def _token_for(athlete_id, expires_in=3600):
+    return {
+        "access_token": f"stub.{athlete_id}.{uuid.uuid4().hex[:12]}",
+        "refresh_token": f"refresh.{athlete_id}",
+        "token_type": "Bearer",
+        "expires_in": expires_in,
+        "athlete": {"id": athlete_id, "name": f"Stub Athlete {athlete_id}"},
+    }
+
+
+def _genai_body(text, finished=True):
+    candidate = {"content": {"parts": [{"text": text}], "role": "model"}, "index": 0}
+    if finished:
+        candidate["finishReason"] = "STOP"
+    return {"candidates": [candidate], "modelVersion": "stub"}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass  # Keep load-test output readable
+
+    # --- helpers ---
+    @property
+    def config(self):
+        return self.server.config
+
+    @property
+    def state(self):
+        return self.server.state
+
+    def _delay(self):
+        delay = random.gauss(self.config.latency_ms, self.config.jitter_ms)
+        if delay > 0:
+            time.sleep(delay / 1000)
+
+    def _send_json(self, status, body, headers=None):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _rate_limited(self, route, share):
+        limited = random.random() < share
+        self.state.count(route, limited)
+        if limited:
+            self._send_json(429, {"error": {"code": 429, "message": "Resource has been exhausted (stub).",
+                                            "status": "RESOURCE_EXHAUSTED"}}, {"Retry-After": "1"})
+        return limited
+
+    def _read_body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def _athlete(self):
+        auth = self.headers.get("Authorization", "")
+        parts = auth.replace("Bearer ", "").split(".")
+        return parts[1] if len(parts) == 3 and parts[0] == "stub" else None
+
+    # --- routes ---
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+
+        if url.path == "/__stats":
+            return self._send_json(200, self.state.snapshot())
+
+        if url.path == "/oauth/authorize":
+            # Log straight in: bounce back to the app with a fresh code
+            self.state.count("authorize")
+            target = f"{query.get('redirect_uri', '/')}?{urlencode({'code': uuid.uuid4().hex})}"
+            self.send_response(302)
+            self.send_header("Location", target)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        prefix = "/api/v1/athlete/0"
+        if url.path.startswith(prefix):
+            route = url.path[len(prefix):] or "/athlete"
+            self._delay()
+            if self._rate_limited(route, self.config.intervals_429):
+                return
+            athlete_id = self._athlete()
+            if athlete_id is None:
+                return self._send_json(401, {"error": "unknown token"})
+            payload = self.state.payload(athlete_id)
+            if route == "/athlete":
+                return self._send_json(200, payload["athlete"])
+            if route in ("/activities", "/wellness"):
+                oldest, newest = query.get("oldest", "0000-00-00"), query.get("newest", "9999-99-99")
+                if route == "/activities":
+                    rows = [a for a in payload["activities"] if oldest <= a["start_date_local"][:10] <= newest]
+                else:
+                    rows = [w for w in payload["wellness"] if oldest <= w["id"] <= newest]
+                return self._send_json(200, rows)
+
+        self._send_json(404, {"error": f"no stub for GET {url.path}"})
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        body = self._read_body()
+
+        if url.path == "/api/oauth/token":
+            self._delay()
+            if self._rate_limited("/oauth/token", self.config.intervals_429):
+                return
+            form = {k: v[0] for k, v in parse_qs(body.decode()).items()}
+            if form.get("grant_type") == "refresh_token":
+                athlete_id = form.get("refresh_token", "refresh.unknown").split(".", 1)[1]
+            else:
+                athlete_id = _athlete_for_code(form.get("code", ""))
+            return self._send_json(200, _token_for(athlete_id))
+
+        # Gemini: /v1beta/models/<model>:generateContent | :streamGenerateContent
+        if "/models/" in url.path and ":" in url.path:
+            method = url.path.rsplit(":", 1)[1]
+            self._delay()
+            if self._rate_limited(f"genai:{method}", self.config.genai_429):
+                return
+            if method == "generateContent":
+                return self._send_json(200, _genai_body(SAMPLE_WORKOUT))
+            if method == "streamGenerateContent":
+                return self._stream(SAMPLE_WORKOUT)
+
+        self._send_json(404, {"error": f"no stub for POST {url.path}"})
+
+    def _stream(self, text):
+        # Server-sent events, one line of the workout per chunk
+        lines = text.splitlines(keepends=True)
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for i, line in enumerate(lines):
+            event = f"data: {json.dumps(_genai_body(line, finished=i == len(lines) - 1))}\r\n\r\n".encode()
+            self.wfile.write(f"{len(event):X}\r\n".encode() + event + b"\r\n")
+            self.wfile.flush()
+            time.sleep(self.config.genai_chunk_ms / 1000)
+        self.wfile.write(b"0\r\n\r\n")
+
+
+def make_server(config=None, host="127.0.0.1", port=0):
+    server = ThreadingHTTPServer((host, port), StubHandler)
+    server.daemon_threads = True
+    server.config = config or StubConfig()
+    server.state = StubState(server.config)
+    return server
+
+
+def start_in_thread(config=None, host="127.0.0.1", port=0):
+    """Starts the stub on a background thread; returns (server, base_url)."""
+    server = make_server(config, host, port)
+    threading.Thread(target=server.serve_forever, name="stub-server", daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=StubConfig.latency_ms, help="mean latency (ms)")
+    parser.add_argument("--jitter", type=float, default=StubConfig.jitter_ms, help="latency std dev (ms)")
+    parser.add_argument("--intervals-429", type=float, default=0.0, help="share of intervals.icu calls that get a 429")
+    parser.add_argument("--genai-429", type=float, default=0.0, help="share of Gemini calls that get a 429")
+    parser.add_argument("--chunk-ms", type=float, default=StubConfig.genai_chunk_ms, help="delay between streamed chunks")
+    parser.add_argument("--years", type=float, default=StubConfig.years, help="synthetic history per athlete")
+    parser.add_argument("--replay", help="directory with recorded athlete.json, activities.json, wellness.json")
+    args = parser.parse_args(argv)
+
+    config = StubConfig(args.latency, args.jitter, args.intervals_429, args.genai_429, args.chunk_ms, args.years, args.replay)
+    server = make_server(config, args.host, args.port)
+    print(f"Stub intervals.icu + Gemini on http://{args.host}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
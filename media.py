@@ -0,0 +1,107 @@
+"""
+Static assets (logo variants, PDF background, theme stylesheet) read from disk
+once per process.
+
+The PDF background is built from the original photo by scripts/build_assets.py
+(assets/pdf_background.jpg); rendering never downloads anything.
+
+The full-size source is assets/logo.png; the variants below are pre-sized
+for where they are actually displayed so we never ship the 1623px PNG.
+The theme is edited in styles/theme.css and served minified from ./static.
+"""
+import base64
+import hashlib
+import os
+import re
+from functools import lru_cache
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+ASSET_DIR = os.path.join(APP_DIR, "assets")
+THEME_SOURCE = os.path.join(APP_DIR, "styles", "theme.css")
+STATIC_DIR = os.path.join(APP_DIR, "static")  # Served at app/static/ (server.enableStaticServing)
+THEME_FILE = "theme.min.css"
+
+LOGO_LOGIN = "logo_login.png"  # 140px, shown at 70px on the login screen (2x for HiDPI)
+LOGO_PDF = "logo_pdf.png"      # 236px = 20mm at 300 DPI, flattened on white for FPDF
+PDF_BACKGROUND = "pdf_background.jpg"  # A4 at 300 DPI (2480x3508), baseline JPEG
+PDF_BACKGROUND_URL = "https://images.unsplash.com/photo-1663104192417-6804188a9a8e"  # Source photo, build time only
+
+
+def asset_path(name):
+    return os.path.join(ASSET_DIR, name)
+
+
+@lru_cache(maxsize=None)
+def pdf_asset_path(name):
+    """
+    Path of an image for FPDF, or None if it isn't bundled. FPDF 1.7 only takes
+    file names, so the pre-sized files are handed over as-is (no temp copies).
+    """
+    path = asset_path(name)
+    return path if os.path.exists(path) else None
+
+
+def pdf_background_path():
+    """
+    The workout card background: the pre-sized asset built by
+    scripts/build_assets.py, or None if it hasn't been built (the card is then
+    drawn without it). Never touches the network.
+    """
+    return pdf_asset_path(PDF_BACKGROUND)
+
+
+@lru_cache(maxsize=None)
+def asset_bytes(name):
+    """Raw file contents, read once per process."""
+    with open(asset_path(name), "rb") as f:
+        return f.read()
+
+
+@lru_cache(maxsize=None)
+def asset_data_uri(name, mime="image/png"):
+    """Base64 data URI for inlining an asset into HTML, encoded once per process."""
+    return f"data:{mime};base64,{base64.b64encode(asset_bytes(name)).decode('ascii')}"
+
+
+def minify_css(css):
+    """Strips comments and redundant whitespace from a stylesheet."""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{}:;,>])\s*", r"\1", css)
+    css = css.replace(";}", "}")
+    return css.strip()
+
+
+@lru_cache(maxsize=None)
+def theme_stylesheet_url():
+    """
+    Makes sure static/theme.min.css is the minified styles/theme.css (comparing
+    contents, since a checkout resets mtimes) and returns its URL with a content
+    hash for cache busting.
+    """
+    target = os.path.join(STATIC_DIR, THEME_FILE)
+    with open(THEME_SOURCE, encoding="utf-8") as f:
+        minified = minify_css(f.read()).encode("utf-8")
+    try:
+        with open(target, "rb") as f:
+            served = f.read()
+    except FileNotFoundError:
+        served = None
+
+    if served != minified:
+        tmp = f"{target}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(STATIC_DIR, exist_ok=True)
+            with open(tmp, "wb") as f:
+                f.write(minified)
+            os.replace(tmp, target)  # Other processes see the old or the new file, never half of one
+            served = minified
+        except OSError:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            # Read-only deploys: keep serving the committed build
+            if served is None:
+                raise
+
+    version = hashlib.sha1(served).hexdigest()[:10]
+    return f"app/static/{THEME_FILE}?v={version}"
@@ -0,0 +1,224 @@
+"""
+Training load engine (TSS estimate -> CTL / ATL / TSB).
+
+Everything here works on whole columns at once: the load estimate is a
+couple of NumPy masks instead of a Python call per activity, daily binning
+is a bincount, and the EWMA runs as blocked cumulative sums.
+
+intervals.icu also computes CTL/ATL itself and returns them with the wellness
+rows; server_training_load() reads those directly, and reconcile_training_load()
+reports how far our local estimate drifts from them.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+from cache_utils import LRUCache
+
+CTL_SPAN = 42  # Fitness: ~6 week time constant
+ATL_SPAN = 7   # Fatigue: ~1 week time constant
+FALLBACK_LOAD_PER_HOUR = 50  # Used when an activity has no suffer_score
+
+# Upper bound on the EWMA block length; short spans get shorter blocks so
+# decay**-block stays well inside float64 range
+_EWMA_BLOCK = 128
+
+# Saved CTL/ATL state per athlete store (see incremental_training_load)
+STATE_CACHE_SIZE = int(os.environ.get("AETHERIUM_STATE_CACHE_SIZE", 256))
+_state_cache = LRUCache(STATE_CACHE_SIZE)
+
+
+def _column(df, name):
+    if name not in df.columns:
+        return np.zeros(len(df))
+    return pd.to_numeric(df[name], errors='coerce').to_numpy(dtype=np.float64)
+
+
+def estimate_load(df):
+    """Per-activity load: suffer_score when present, otherwise moving_time hours * 50."""
+    suffer = _column(df, 'suffer_score')
+    hours = np.nan_to_num(_column(df, 'moving_time')) / 3600
+    has_suffer = ~np.isnan(suffer) & (suffer != 0)
+    return np.where(has_suffer, suffer, hours * FALLBACK_LOAD_PER_HOUR)
+
+
+def ewma(values, span, initial=None):
+    """
+    Same result as pd.Series(values).ewm(span=span, adjust=False).mean(), but
+    vectorized. Pass `initial` to continue from a previous EWMA value.
+    """
+    x = np.asarray(values, dtype=np.float64)
+    out = np.empty_like(x)
+    if x.size == 0:
+        return out
+
+    alpha = 2.0 / (span + 1.0)
+    decay = 1.0 - alpha
+    if decay <= 0:
+        return x.copy()
+    prev = x[0] if initial is None else float(initial)
+
+    # Inside a block: y[k] = decay**(k+1) * (prev + alpha * sum_j<=k x[j] * decay**-(j+1))
+    block_len = int(min(_EWMA_BLOCK, max(1, 200 / -np.log10(decay))))
+    steps = np.arange(1, block_len + 1, dtype=np.float64)
+    grow = decay ** steps
+    shrink = decay ** -steps
+    for start in range(0, x.size, block_len):
+        chunk = x[start:start + block_len]
+        n = chunk.size
+        block = grow[:n] * (prev + alpha * np.cumsum(chunk * shrink[:n]))
+        out[start:start + n] = block
+        prev = block[-1]
+    return out
+
+
+def _has_dates(df, date_col='start_date_local'):
+    return isinstance(df.index, pd.DatetimeIndex) or date_col in df.columns
+
+
+def _activity_dates(df, date_col='start_date_local'):
+    # An ActivityFrame (activity_frame.py) already carries parsed dates as its index
+    if isinstance(df.index, pd.DatetimeIndex):
+        return df.index.to_numpy()
+    return pd.to_datetime(df[date_col]).to_numpy()
+
+
+def daily_load(df, date_col='start_date_local'):
+    """Sums load per calendar day, with empty days filled in as 0."""
+    dates = _activity_dates(df, date_col).astype('datetime64[D]')
+    if dates.size == 0:
+        return pd.Series(dtype=np.float64)
+
+    if 'load' in df.columns:
+        load = df['load'].to_numpy(dtype=np.float64)  # Precomputed by build_activity_frame
+    else:
+        load = np.nan_to_num(estimate_load(df))
+    first = dates.min()
+    day_idx = (dates - first).astype(np.int64)
+    totals = np.bincount(day_idx, weights=load)
+    index = pd.date_range(pd.Timestamp(first), periods=totals.size, freq='D')
+    return pd.Series(totals, index=index, name='TSS')
+
+
+def _frame(index, ctl, atl):
+    df_daily = pd.DataFrame({'ctl': ctl, 'atl': atl, 'tsb': ctl - atl}, index=index)
+    df_daily['date'] = df_daily.index
+    return df_daily
+
+
+def training_load(activities):
+    """
+    Builds the daily CTL / ATL / TSB frame used by the dashboard cards and
+    the Fitness Progress chart. Accepts the raw activities JSON, a DataFrame
+    or an ActivityFrame.
+    """
+    df = activities if isinstance(activities, pd.DataFrame) else pd.DataFrame(activities)
+    if df.empty or not _has_dates(df):
+        return pd.DataFrame(columns=['ctl', 'atl', 'tsb', 'date'])
+
+    load = daily_load(df)
+    ctl = ewma(load.to_numpy(), CTL_SPAN)
+    atl = ewma(load.to_numpy(), ATL_SPAN)
+
+    return _frame(load.index, ctl, atl)
+
+
+def _saved_state(store):
+    state = _state_cache.get(store.path)
+    if state is None:
+        row = store.load_training_state()
+        if row is not None:
+            state = (row[0], *(np.frombuffer(blob, dtype=np.float64) for blob in row[1:]), None)
+    return state
+
+
+def incremental_training_load(store, activities):
+    """
+    Same frame as training_load(), but reuses the series saved for the
+    athlete: the per-day loads saved with it show the first day that changed
+    (normally none, or just the days added since the last visit), and only the
+    days from there go through the EWMA again, starting from the saved CTL/ATL
+    of the day before. Editing an older activity moves that point back; a
+    different first day (a longer or shorter history) rebuilds it all.
+
+    The state lives in the athlete's store and, between reruns, in memory, so
+    an unchanged history costs one daily_load() and a compare. The returned
+    frame may be shared between reruns: don't modify it.
+    """
+    df = activities if isinstance(activities, pd.DataFrame) else pd.DataFrame(activities)
+    if df.empty or not _has_dates(df):
+        return pd.DataFrame(columns=['ctl', 'atl', 'tsb', 'date'])
+
+    load = daily_load(df)
+    values = load.to_numpy(dtype=np.float64)
+    first_day = load.index[0].strftime('%Y-%m-%d')
+
+    restart = 0
+    saved = _saved_state(store)
+    if saved is not None and saved[0] == first_day:
+        _, s_load, s_ctl, s_atl, frame = saved
+        common = min(len(values), len(s_load))
+        changed = np.flatnonzero(values[:common] != s_load[:common])
+        restart = int(changed[0]) if changed.size else common
+        if restart == len(values) == len(s_load):
+            # Nothing new since last time
+            if frame is None:
+                frame = _frame(load.index, s_ctl, s_atl)
+                _state_cache.put(store.path, (first_day, s_load, s_ctl, s_atl, frame))
+            return frame
+
+    if restart == 0:
+        ctl = ewma(values, CTL_SPAN)
+        atl = ewma(values, ATL_SPAN)
+    else:
+        ctl = np.concatenate([s_ctl[:restart], ewma(values[restart:], CTL_SPAN, initial=s_ctl[restart - 1])])
+        atl = np.concatenate([s_atl[:restart], ewma(values[restart:], ATL_SPAN, initial=s_atl[restart - 1])])
+
+    store.save_training_state(first_day, load.index[-1].strftime('%Y-%m-%d'), values, ctl, atl)
+    frame = _frame(load.index, ctl, atl)
+    _state_cache.put(store.path, (first_day, values, ctl, atl, frame))
+    return frame
+
+
+def forget_training_state(store):
+    """Drops the in-memory copy of an athlete's state (store.clear() drops the saved one)."""
+    _state_cache.pop(store.path)
+
+
+def server_training_load(wellness):
+    """
+    The same daily frame, built from intervals.icu's own ctl/atl in the wellness
+    rows (no load estimate, no EWMA). Days without values are dropped.
+    """
+    df = wellness if isinstance(wellness, pd.DataFrame) else pd.DataFrame(wellness)
+    if df.empty or not {'id', 'ctl', 'atl'} <= set(df.columns):
+        return pd.DataFrame(columns=['ctl', 'atl', 'tsb', 'date'])
+
+    ctl = pd.to_numeric(df['ctl'], errors='coerce').to_numpy(dtype=np.float64)
+    atl = pd.to_numeric(df['atl'], errors='coerce').to_numpy(dtype=np.float64)
+    index = pd.DatetimeIndex(pd.to_datetime(df['id']))
+    valid = ~(np.isnan(ctl) | np.isnan(atl))
+    order = np.argsort(index[valid].to_numpy(), kind='stable')
+    return _frame(index[valid][order], ctl[valid][order], atl[valid][order])
+
+
+def reconcile_training_load(local, server):
+    """
+    Drift of the local estimate against the server values on the days both
+    have. Returns (summary rows per metric, daily local - server differences).
+    """
+    common = local.index.intersection(server.index)
+    drift = local.loc[common, ['ctl', 'atl', 'tsb']] - server.loc[common, ['ctl', 'atl', 'tsb']]
+    if drift.empty:
+        return pd.DataFrame(columns=['metric', 'days', 'mean_drift', 'mean_abs_drift', 'max_abs_drift', 'latest_drift']), drift
+
+    summary = pd.DataFrame({
+        'metric': ['CTL', 'ATL', 'TSB'],
+        'days': len(drift),
+        'mean_drift': drift.mean().to_numpy(),
+        'mean_abs_drift': drift.abs().mean().to_numpy(),
+        'max_abs_drift': drift.abs().max().to_numpy(),
+        'latest_drift': drift.iloc[-1].to_numpy(),
+    })
+    return summary, drift
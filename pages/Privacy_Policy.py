@@ -12,7 +12,7 @@ This application accesses your Intervals.icu data via their official API. We onl
 * **Wellness Data**: CTL, ATL, and TSB scores.
 
 ### 2. Data Usage
-Data is used solely to generate your personal fitness dashboard. **We do not store your data** on any permanent database; it resides in temporary session memory and is cleared when you close your browser tab.
+Data is used solely to generate your personal fitness dashboard. To keep the dashboard fast, a copy of your activity and wellness data is kept in a local cache on the app server so only new days need to be downloaded. Your login token is stored encrypted on the server so you stay connected between visits; the link that reconnects you changes on every visit and expires after 7 days without one. **We do not store your data** anywhere else, and both the cache and the token are deleted when you log out.
 
 ### 3. Third-Party Sharing
 We never sell, share, or trade your fitness data with third parties.
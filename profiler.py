@@ -0,0 +1,169 @@
+"""
+Lightweight per-rerun tracing for the debug profiler panel.
+
+A rerun is split into top-level sections (section() closes the previous one)
+and nested span()s around outbound calls and heavy steps. Spans are only
+recorded while a trace is active on the current thread, so with the profiler
+off they cost one attribute lookup. The last few traces of a session can be
+exported as JSON or in Chrome's trace event format (chrome://tracing, Perfetto).
+"""
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+
+PROFILER_FLAG = os.environ.get("AETHERIUM_DEBUG_PROFILER", "")
+MAX_TRACES = int(os.environ.get("AETHERIUM_PROFILER_TRACES", 20))  # Kept per session
+
+_local = threading.local()
+
+
+def is_enabled(flag=None):
+    """Truthy secret / env values ("1", "true", "yes", "on") turn the profiler on."""
+    value = PROFILER_FLAG if flag is None else flag
+    return str(value).strip().lower() in ("1", "true", "yes", "on")
+
+
+class RerunTrace:
+    """Spans of one script run (or one deferred call, like a download)."""
+
+    def __init__(self, label):
+        self.label = label
+        self.started_at = time.time()
+        self.thread = threading.current_thread().name
+        self.spans = []
+        self.duration_ms = None
+        self._t0 = time.perf_counter()
+        self._stack = []
+        self._section = None
+
+    def _now_ms(self):
+        return (time.perf_counter() - self._t0) * 1000
+
+    def _record(self, name, category, start_ms, depth, args):
+        self.spans.append({
+            "name": name,
+            "category": category,
+            "start_ms": start_ms,
+            "duration_ms": self._now_ms() - start_ms,
+            "depth": depth,
+            "args": args,
+        })
+
+    @contextmanager
+    def span(self, name, category="call", **args):
+        depth = len(self._stack) + (self._section is not None)
+        start_ms = self._now_ms()
+        self._stack.append(name)
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            self._record(name, category, start_ms, depth, args)
+
+    def section(self, name):
+        """Ends the open section (if any) and starts `name` at the top level."""
+        self._close_section()
+        self._section = (name, self._now_ms())
+
+    def _close_section(self):
+        if self._section is not None:
+            name, start_ms = self._section
+            self._section = None
+            self._record(name, "section", start_ms, 0, {})
+
+    def finish(self):
+        if self.duration_ms is None:
+            self._close_section()
+            self.duration_ms = self._now_ms()
+        return self
+
+    def to_dict(self):
+        return {
+            "label": self.label,
+            "started_at": self.started_at,
+            "thread": self.thread,
+            "duration_ms": self.duration_ms,
+            "spans": sorted(self.spans, key=lambda s: (s["start_ms"], s["depth"])),
+        }
+
+
+class TraceLog:
+    """The last `maxlen` traces of one session (appended from any thread)."""
+
+    def __init__(self, maxlen=MAX_TRACES):
+        self._traces = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+
+    def add(self, trace):
+        with self._lock:
+            self._traces.append(trace)
+
+    def traces(self):
+        with self._lock:
+            return list(self._traces)
+
+    def to_json(self):
+        return json.dumps([t.to_dict() for t in self.traces()], indent=2)
+
+    def to_chrome_trace(self):
+        """Trace event format: one complete ("X") event per span, one row per rerun."""
+        events = []
+        for tid, trace in enumerate(self.traces(), start=1):
+            base_us = trace.started_at * 1e6
+            events.append({"name": "thread_name", "ph": "M", "pid": 1, "tid": tid,
+                           "args": {"name": f"{trace.label} ({trace.thread})"}})
+            for s in trace.to_dict()["spans"]:
+                events.append({
+                    "name": s["name"], "cat": s["category"], "ph": "X", "pid": 1, "tid": tid,
+                    "ts": base_us + s["start_ms"] * 1000, "dur": s["duration_ms"] * 1000,
+                    "args": s["args"],
+                })
+        return json.dumps({"traceEvents": events, "displayTimeUnit": "ms"})
+
+
+def begin_rerun(log, label="rerun"):
+    """Starts tracing this thread's run into `log` (finishing one that never ended, e.g. after st.rerun)."""
+    end_rerun()
+    trace = RerunTrace(label)
+    _local.trace = trace
+    log.add(trace)
+    return trace
+
+
+def end_rerun():
+    trace = getattr(_local, "trace", None)
+    _local.trace = None
+    return trace.finish() if trace is not None else None
+
+
+def current_trace():
+    return getattr(_local, "trace", None)
+
+
+def section(name):
+    trace = getattr(_local, "trace", None)
+    if trace is not None:
+        trace.section(name)
+
+
+def span(name, category="call", **args):
+    """Times the `with` block into the active trace; a no-op when there is none."""
+    trace = getattr(_local, "trace", None)
+    if trace is None:
+        return nullcontext()
+    return trace.span(name, category, **args)
+
+
+def traced(log, name, fn, *args, **kwargs):
+    """
+    For deferred callables (download buttons run theirs outside the rerun):
+    times the call as its own trace in `log`. Use with functools.partial.
+    """
+    trace = RerunTrace(f"deferred: {name}")
+    with trace.span(name):
+        result = fn(*args, **kwargs)
+    log.add(trace.finish())
+    return result
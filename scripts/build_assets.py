@@ -0,0 +1,65 @@
+"""
+Rebuilds the pre-sized image assets in ./assets.
+
+    python scripts/build_assets.py                 # logo variants + background from Unsplash
+    python scripts/build_assets.py path/to/bg.jpg  # use a local background image instead
+
+Needs Pillow, which is only required here (the app just reads the output files).
+"""
+import io
+import os
+import sys
+
+import requests
+from PIL import Image
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, APP_DIR)
+
+from media import ASSET_DIR, PDF_BACKGROUND, PDF_BACKGROUND_URL as BACKGROUND_URL  # noqa: E402
+
+PRINT_DPI = 300
+A4_PX = (round(210 / 25.4 * PRINT_DPI), round(297 / 25.4 * PRINT_DPI))  # 2480 x 3508
+LOGIN_LOGO_PX = 140  # Displayed at 70px
+PDF_LOGO_PX = round(20 / 25.4 * 300)  # 20mm at 300 DPI
+
+
+def build_logos():
+    logo = Image.open(os.path.join(ASSET_DIR, "logo.png")).convert("RGBA")
+    logo.resize((LOGIN_LOGO_PX, LOGIN_LOGO_PX), Image.LANCZOS).save(
+        os.path.join(ASSET_DIR, "logo_login.png"), optimize=True
+    )
+
+    # FPDF 1.7 can't embed PNG alpha channels, so flatten onto the white card
+    pdf_logo = logo.resize((PDF_LOGO_PX, PDF_LOGO_PX), Image.LANCZOS)
+    flat = Image.new("RGB", pdf_logo.size, (255, 255, 255))
+    flat.paste(pdf_logo, mask=pdf_logo.split()[3])
+    flat.save(os.path.join(ASSET_DIR, "logo_pdf.png"), optimize=True)
+
+
+def build_background(source=BACKGROUND_URL):
+    if source.startswith("http"):
+        raw = requests.get(source, timeout=30).content
+    else:
+        with open(source, "rb") as f:
+            raw = f.read()
+    img = Image.open(io.BytesIO(raw)).convert("RGB")
+
+    # Cover-crop to the A4 aspect ratio, then scale to print resolution
+    target_ratio = A4_PX[0] / A4_PX[1]
+    w, h = img.size
+    if w / h > target_ratio:
+        new_w = round(h * target_ratio)
+        img = img.crop(((w - new_w) // 2, 0, (w - new_w) // 2 + new_w, h))
+    else:
+        new_h = round(w / target_ratio)
+        img = img.crop((0, (h - new_h) // 2, w, (h - new_h) // 2 + new_h))
+    img = img.resize(A4_PX, Image.LANCZOS)
+    # Baseline JPEG: FPDF 1.7 embeds it as-is without re-encoding
+    img.save(os.path.join(ASSET_DIR, PDF_BACKGROUND), quality=80, optimize=True, progressive=False)
+
+
+if __name__ == "__main__":
+    build_logos()
+    build_background(sys.argv[1] if len(sys.argv) > 1 else BACKGROUND_URL)
+    print(f"Assets written to {ASSET_DIR}")
@@ -0,0 +1,112 @@
+"""AI coach response cache (ai_coach.py)."""
+import os
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+import ai_coach
+import gemini_scheduler
+from cache_utils import content_key
+from gemini_scheduler import GeminiScheduler
+
+
+class RateLimited(Exception):
+    code = 429
+
+
+class FakeModels:
+    """Gemini stand-in: `limited` models always answer 429, the others echo their name (or `text`)."""
+
+    def __init__(self, limited=(), text=False):
+        self.limited = limited
+        self.text = text
+
+    def _answer(self, model):
+        if model in self.limited:
+            raise RateLimited("RESOURCE_EXHAUSTED")
+        return SimpleNamespace(text=f"workout from {model}" if self.text is False else self.text)
+
+    def generate_content(self, model, contents):
+        return self._answer(model)
+
+    def generate_content_stream(self, model, contents):
+        yield self._answer(model)
+
+
+@pytest.fixture(autouse=True)
+def fast_scheduler(monkeypatch):
+    monkeypatch.setattr(gemini_scheduler, "_scheduler", GeminiScheduler(
+        models=["lite", "full"], requests_per_minute=6000, burst=100, max_retries=1, backoff_base=0
+    ))
+    monkeypatch.setattr(ai_coach, "FALLBACK_MODELS", ["lite", "full"])
+    monkeypatch.setattr(ai_coach, "AI_CACHE_DIR", None)
+    ai_coach._response_cache.clear()
+
+
+@pytest.mark.parametrize("stream", [True, False])
+def test_fallback_answer_is_cached_under_the_answering_model(stream):
+    client = SimpleNamespace(models=FakeModels(limited={"lite"}))
+    text = "".join(ai_coach.stream_workout(client, "prompt", model="lite", stream=stream))
+
+    assert text == "workout from full"
+    assert ai_coach.cached_workout("prompt", model="lite") is None
+    assert ai_coach.cached_workout("prompt", model="full") == text
+
+
+def test_answer_from_requested_model_is_cached():
+    client = SimpleNamespace(models=FakeModels(limited=set()))
+    text = "".join(ai_coach.stream_workout(client, "prompt", model="lite"))
+    assert ai_coach.cached_workout("prompt", model="lite") == text == "workout from lite"
+
+
+@pytest.mark.parametrize("stream", [True, False])
+@pytest.mark.parametrize("text", [None, ""])
+def test_empty_answers_are_not_cached(stream, text):
+    client = SimpleNamespace(models=FakeModels(text=text))
+    assert "".join(ai_coach.stream_workout(client, "prompt", model="lite", stream=stream)) == ""
+    assert ai_coach.cached_workout("prompt", model="lite") is None
+
+
+def test_empty_disk_entry_is_a_miss(tmp_path, monkeypatch):
+    monkeypatch.setattr(ai_coach, "AI_CACHE_DIR", str(tmp_path))
+    open(ai_coach._disk_path(content_key("lite", "prompt")), "w").close()
+    assert ai_coach.cached_workout("prompt", model="lite") is None
+
+
+def test_concurrent_disk_writes_of_the_same_key(tmp_path, monkeypatch):
+    monkeypatch.setattr(ai_coach, "AI_CACHE_DIR", str(tmp_path))
+    errors = []
+
+    def write(i):
+        try:
+            for _ in range(50):
+                ai_coach._cache_put("same-key", f"answer {i}")
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=write, args=(i,)) for i in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert not errors
+    assert os.listdir(tmp_path) == ["same-key.txt"]  # No temp files left behind
+
+
+def test_disk_write_failure_does_not_fail_the_answer(tmp_path, monkeypatch):
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("")
+    monkeypatch.setattr(ai_coach, "AI_CACHE_DIR", str(blocker))
+    client = SimpleNamespace(models=FakeModels())
+    assert "".join(ai_coach.stream_workout(client, "prompt", model="lite")) == "workout from lite"
+    assert ai_coach.cached_workout("prompt", model="lite") == "workout from lite"  # Memory copy still kept
+
+
+def test_disk_cache_is_bounded(tmp_path, monkeypatch):
+    monkeypatch.setattr(ai_coach, "AI_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(ai_coach, "AI_CACHE_DISK_SIZE", 3)
+    for i in range(6):
+        ai_coach._cache_put(f"key{i}", "text")
+        os.utime(ai_coach._disk_path(f"key{i}"), (i, i))
+    assert sorted(os.listdir(tmp_path)) == ["key3.txt", "key4.txt", "key5.txt"]
@@ -0,0 +1,120 @@
+"""Single-flight request coalescing (cache_utils.py)."""
+import threading
+import time
+
+import pytest
+
+from cache_utils import SingleFlight
+
+
+class Producer:
+    """produce() stand-in that yields `pieces`, pausing before each until released."""
+
+    def __init__(self, pieces, error=None):
+        self.pieces = pieces
+        self.error = error
+        self.calls = 0
+        self.release = threading.Semaphore(0)
+
+    def __call__(self):
+        self.calls += 1
+        for piece in self.pieces:
+            assert self.release.acquire(timeout=5)
+            yield piece
+        if self.error is not None:
+            raise self.error
+
+    def run_all(self):
+        for _ in self.pieces:
+            self.release.release()
+
+
+def collect(stream, out):
+    try:
+        out.extend(stream)
+    except Exception as e:
+        out.append(e)
+
+
+def wait_until(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.005)
+
+
+def test_concurrent_callers_share_one_call():
+    flights = SingleFlight()
+    produce = Producer(["a", "b", "c"])
+    first = flights.stream("key", produce)
+    produce.release.release()  # "a" is out before the second caller joins
+    late = flights.stream("key", produce)
+
+    results = [[], []]
+    threads = [threading.Thread(target=collect, args=(s, out)) for s, out in zip((first, late), results)]
+    for t in threads:
+        t.start()
+    produce.release.release()
+    produce.release.release()
+    for t in threads:
+        t.join(5)
+
+    assert results == [["a", "b", "c"], ["a", "b", "c"]]  # The late caller gets the replay too
+    assert produce.calls == 1
+    assert (flights.started, flights.joined) == (1, 1)
+
+
+def test_different_keys_do_not_join():
+    flights = SingleFlight()
+    one, two = Producer(["1"]), Producer(["2"])
+    streams = flights.stream("one", one), flights.stream("two", two)
+    one.run_all()
+    two.run_all()
+    assert [list(s) for s in streams] == [["1"], ["2"]]
+    assert (flights.started, flights.joined) == (2, 0)
+
+
+def test_error_reaches_every_caller():
+    flights = SingleFlight()
+    boom = RuntimeError("quota")
+    produce = Producer(["partial"], error=boom)
+    streams = [flights.stream("key", produce) for _ in range(3)]
+    produce.run_all()
+
+    for stream in streams:
+        assert next(stream) == "partial"
+        with pytest.raises(RuntimeError) as info:
+            next(stream)
+        assert info.value is boom
+    assert produce.calls == 1
+
+
+def test_finished_flights_are_cleaned_up():
+    flights = SingleFlight()
+    produce = Producer(["x"])
+    stream = flights.stream("key", produce)
+    assert flights.in_flight() == 1
+    produce.run_all()
+    assert list(stream) == ["x"]
+    wait_until(lambda: flights.in_flight() == 0)
+
+    # The next identical call is a new one, not a replay of the old result
+    again = Producer(["y"])
+    stream = flights.stream("key", again)
+    again.run_all()
+    assert list(stream) == ["y"]
+    assert again.calls == 1 and flights.started == 2
+
+
+def test_caller_after_a_failure_starts_a_new_call():
+    flights = SingleFlight()
+    failing = Producer([], error=RuntimeError("boom"))
+    with pytest.raises(RuntimeError):
+        list(flights.stream("key", failing))
+
+    # Without waiting: the failed flight is unregistered before its callers hear about it
+    retry = Producer(["ok"])
+    stream = flights.stream("key", retry)
+    retry.run_all()
+    assert list(stream) == ["ok"]
+    assert flights.joined == 0
@@ -0,0 +1,77 @@
+"""LTTB downsampling of the Fitness Progress chart (charts.py)."""
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from charts import downsample, lttb
+
+
+def reference_lttb(x, y, threshold):
+    """Textbook LTTB (Steinarsson, 2013), one point at a time."""
+    n = len(y)
+    every = (n - 2) / (threshold - 2)
+    keep, a = [0], 0
+    for i in range(threshold - 2):
+        start, end = math.floor(i * every) + 1, math.floor((i + 1) * every) + 1
+        next_end = min(math.floor((i + 2) * every) + 1, n)
+        avg_x = sum(x[end:next_end]) / (next_end - end)
+        avg_y = sum(y[end:next_end]) / (next_end - end)
+        best, best_area = start, -1
+        for j in range(start, end):
+            area = abs((x[a] - avg_x) * (y[j] - y[a]) - (x[a] - x[j]) * (avg_y - y[a]))
+            if area > best_area:
+                best, best_area = j, area
+        keep.append(best)
+        a = best
+    return keep + [n - 1]
+
+
+@pytest.mark.parametrize("n, threshold", [(0, 10), (1, 10), (5, 5), (5, 50)])
+def test_threshold_at_or_above_length_keeps_everything(n, threshold):
+    assert list(lttb(np.arange(n), np.zeros(n), threshold)) == list(range(n))
+
+
+@pytest.mark.parametrize("threshold", [0, 1, 2])
+def test_threshold_below_three_keeps_everything(threshold):
+    assert list(lttb(np.arange(10), np.arange(10.0), threshold)) == list(range(10))
+
+
+@pytest.mark.parametrize("n, threshold", [(4, 3), (10, 3), (10, 9), (1000, 100), (1001, 333), (3650, 1000)])
+def test_exact_size_endpoints_and_order(n, threshold):
+    y = np.random.default_rng(n).normal(size=n).cumsum()
+    keep = lttb(np.arange(n), y, threshold)
+    assert len(keep) == threshold
+    assert keep[0] == 0 and keep[-1] == n - 1
+    assert np.all(np.diff(keep) > 0)
+
+
+@pytest.mark.parametrize("n, threshold", [(10, 4), (500, 37), (2000, 300)])
+def test_matches_reference_implementation(n, threshold):
+    rng = np.random.default_rng(threshold)
+    x = np.sort(rng.choice(n * 3, size=n, replace=False)).astype(float)  # Uneven spacing
+    y = rng.normal(size=n).cumsum()
+    assert list(lttb(x, y, threshold)) == reference_lttb(list(x), list(y), threshold)
+
+
+def test_keeps_a_single_day_spike():
+    y = np.zeros(1000)
+    y[437] = 50.0
+    assert 437 in lttb(np.arange(1000), y, 50)
+
+
+def test_nan_values_do_not_break_the_selection():
+    y = np.arange(100.0)
+    y[40:60] = np.nan
+    keep = lttb(np.arange(100), y, 10)
+    assert len(keep) == 10 and np.all(np.diff(keep) > 0)
+
+
+def test_downsample_keeps_short_series_and_thins_long_ones():
+    dates = pd.date_range("2020-01-01", periods=1500, freq="D")
+    df = pd.DataFrame({"date": dates, "ctl": np.linspace(0, 80, 1500)})
+    assert len(downsample(df.iloc[:200], points=500)) == 200
+    thinned = downsample(df, points=500)
+    assert len(thinned) == 500
+    assert thinned["date"].iloc[0] == dates[0] and thinned["date"].iloc[-1] == dates[-1]
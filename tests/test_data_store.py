@@ -0,0 +1,49 @@
+"""Local athlete store (data_store.py): which windows still need to be synced."""
+import pytest
+
+from data_store import AthleteStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return AthleteStore("test", data_dir=str(tmp_path))
+
+
+def sync(store, oldest, newest):
+    for win_oldest, win_newest in store.windows_to_fetch("activities", oldest, newest):
+        store.replace_range("activities", win_oldest, win_newest, [])
+
+
+def test_first_sync_fetches_the_whole_window(store):
+    assert store.windows_to_fetch("activities", "2024-01-01", "2025-01-01") == [("2024-01-01", "2025-01-01")]
+
+
+def test_later_sync_fetches_the_delta_with_overlap(store):
+    sync(store, "2024-01-01", "2025-01-01")
+    assert store.windows_to_fetch("activities", "2024-01-03", "2025-01-03") == [("2024-12-25", "2025-01-03")]
+
+
+def test_longer_history_backfills_the_older_days(store):
+    sync(store, "2024-01-01", "2025-01-01")
+    assert store.windows_to_fetch("activities", "2023-01-01", "2025-01-01") == [
+        ("2023-01-01", "2023-12-31"), ("2024-12-25", "2025-01-01"),
+    ]
+    sync(store, "2023-01-01", "2025-01-01")
+    assert store.sync_range("activities") == ("2023-01-01", "2025-01-01")
+
+
+def test_window_after_a_gap_does_not_claim_the_gap(store):
+    sync(store, "2024-01-01", "2025-01-01")
+    assert store.windows_to_fetch("activities", "2025-03-01", "2026-03-01") == [("2025-03-01", "2026-03-01")]
+    sync(store, "2025-03-01", "2026-03-01")
+    assert store.sync_range("activities") == ("2025-03-01", "2026-03-01")
+    # A longer view later backfills the hole instead of trusting it
+    assert store.windows_to_fetch("activities", "2024-03-01", "2026-03-01")[0] == ("2024-03-01", "2025-02-28")
+
+
+def test_adjacent_window_still_merges(store):
+    sync(store, "2024-01-01", "2024-12-31")
+    store.mark_synced("activities", "2025-01-01", "2025-02-01")
+    assert store.sync_range("activities") == ("2024-01-01", "2025-02-01")
+    store.mark_synced("activities", "2023-01-01", "2023-12-31")
+    assert store.sync_range("activities") == ("2023-01-01", "2025-02-01")
@@ -0,0 +1,134 @@
+"""Gemini rate limiting, retries and model fallback (gemini_scheduler.py)."""
+import pytest
+
+import gemini_scheduler
+from gemini_scheduler import GeminiScheduler, TokenBucket, is_rate_limited
+
+
+class RateLimited(Exception):
+    code = 429
+
+
+def scheduler(**kwargs):
+    options = dict(models=["lite", "full"], requests_per_minute=6000, burst=100, max_retries=3, backoff_base=0)
+    options.update(kwargs)
+    return GeminiScheduler(**options)
+
+
+def script(*outcomes):
+    """call(model) that plays `outcomes` in order (exceptions are raised) and records the models it saw."""
+    seen = []
+    pending = list(outcomes)
+
+    def call(model):
+        seen.append(model)
+        outcome = pending.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    return call, seen
+
+
+def test_is_rate_limited():
+    assert is_rate_limited(RateLimited())
+    assert is_rate_limited(Exception("429 RESOURCE_EXHAUSTED"))
+    assert not is_rate_limited(ValueError("bad request"))
+
+
+def test_success_on_first_try():
+    s = scheduler()
+    call, seen = script("ok")
+    assert s.run(call) == ("ok", "lite")
+    stats = s.stats()
+    assert seen == ["lite"]
+    assert (stats["requests"], stats["rate_limited"], stats["fallbacks"], stats["failures"]) == (1, 0, 0, 0)
+    assert stats["queue_depth"] == stats["in_flight"] == 0
+
+
+def test_retries_rate_limited_calls_with_backoff(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(gemini_scheduler.time, "sleep", sleeps.append)
+    s = scheduler(backoff_base=1.0, backoff_max=20.0)
+    call, seen = script(RateLimited(), RateLimited(), "ok")
+
+    assert s.run(call) == ("ok", "lite")
+    assert seen == ["lite"] * 3
+    assert len(sleeps) == 2 and 0 <= sleeps[0] <= 1 and 0 <= sleeps[1] <= 2  # Full jitter, doubling
+    stats = s.stats()
+    assert (stats["requests"], stats["rate_limited"], stats["fallbacks"], stats["failures"]) == (3, 2, 0, 0)
+
+
+def test_falls_back_after_max_retries():
+    s = scheduler(max_retries=2)
+    call, seen = script(RateLimited(), RateLimited(), "ok")
+
+    assert s.run(call) == ("ok", "full")
+    assert seen == ["lite", "lite", "full"]
+    stats = s.stats()
+    assert (stats["requests"], stats["rate_limited"], stats["fallbacks"], stats["failures"]) == (3, 2, 1, 0)
+
+
+def test_other_errors_are_not_retried():
+    s = scheduler()
+    call, seen = script(ValueError("bad request"))
+
+    with pytest.raises(ValueError):
+        s.run(call)
+    assert seen == ["lite"]
+    stats = s.stats()
+    assert (stats["requests"], stats["rate_limited"], stats["failures"]) == (1, 0, 1)
+    assert stats["in_flight"] == 0
+
+
+def test_exhausted_chain_raises_last_rate_limit_error():
+    s = scheduler(max_retries=1)
+    last = RateLimited("full is out too")
+    call, seen = script(RateLimited(), last)
+
+    with pytest.raises(RateLimited) as info:
+        s.run(call)
+    assert info.value is last
+    assert seen == ["lite", "full"]
+    stats = s.stats()
+    assert (stats["requests"], stats["rate_limited"], stats["fallbacks"], stats["failures"]) == (2, 2, 1, 1)
+
+
+def test_run_uses_the_given_chain():
+    call, seen = script("ok")
+    assert scheduler().run(call, models=["pro"]) == ("ok", "pro")
+
+
+def test_token_bucket_serves_burst_then_waits(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(gemini_scheduler.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(gemini_scheduler.time, "sleep", lambda s: clock.__setitem__(0, clock[0] + s))
+    bucket = TokenBucket(rate=2.0, capacity=3)
+
+    assert [bucket.acquire() for _ in range(3)] == [0, 0, 0]
+    assert bucket.acquire() == pytest.approx(0.5)  # One token every 1 / rate seconds
+    clock[0] += 10  # Idle time refills up to the capacity, not beyond
+    assert [bucket.acquire() for _ in range(3)] == [0, 0, 0]
+    assert bucket.acquire() == pytest.approx(0.5)
+
+
+@pytest.mark.parametrize("rate, capacity", [(0, 5), (-1, 5), (1, 0), (1, 0.5)])
+def test_token_bucket_rejects_config_that_would_hang_or_crash(rate, capacity):
+    with pytest.raises(ValueError):
+        TokenBucket(rate, capacity)
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"requests_per_minute": 0},
+    {"burst": 0},
+    {"max_retries": 0},
+])
+def test_scheduler_rejects_bad_config(kwargs):
+    with pytest.raises(ValueError):
+        scheduler(**kwargs)
+
+
+def test_scheduler_needs_a_model(monkeypatch):
+    monkeypatch.setattr(gemini_scheduler, "FALLBACK_MODELS", [])
+    with pytest.raises(ValueError):
+        GeminiScheduler(models=[])
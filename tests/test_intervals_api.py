@@ -0,0 +1,80 @@
+"""Background history backfill (intervals_api.py)."""
+import threading
+
+import pytest
+
+import intervals_api
+from data_store import AthleteStore
+from intervals_api import cancel_history_backfill, start_history_backfill
+
+
+@pytest.fixture
+def store(tmp_path):
+    return AthleteStore("test", data_dir=str(tmp_path))
+
+
+@pytest.fixture
+def fake_api(monkeypatch):
+    """fetch_json stand-in: one activity per window; blocks while `gate` is clear."""
+    gate = threading.Event()
+    gate.set()
+    calls = []
+
+    def fetch_json(token, path="", params=None, timeout=None):
+        calls.append(params)
+        gate.wait(5)
+        if path == "/activities":
+            return [{"id": f"i{params['oldest']}", "start_date_local": f"{params['oldest']}T08:00:00"}]
+        return []
+
+    monkeypatch.setattr(intervals_api, "fetch_json", fetch_json)
+    yield gate, calls
+    gate.set()
+    intervals_api._backfills.clear()
+
+
+def wait(job):
+    for future in job._futures:
+        try:
+            future.result(5)
+        except Exception:
+            pass
+    return job.done()
+
+
+def test_backfill_fetches_and_marks_synced(store, fake_api):
+    job = start_history_backfill(store, "token", "2024-01-01", "2024-12-31")
+    assert wait(job) and job.error is None
+    assert store.sync_range("activities") == ("2024-01-01", "2024-12-30")
+    assert start_history_backfill(store, "token", "2024-01-01", "2024-12-31") is None
+
+
+def test_one_job_per_athlete(store, fake_api):
+    gate, _ = fake_api
+    gate.clear()
+    first = start_history_backfill(store, "token", "2024-01-01", "2024-12-31")
+    # The next day's window reuses the running job instead of adding another
+    assert start_history_backfill(store, "token", "2024-01-02", "2025-01-01") is first
+    assert list(intervals_api._backfills) == [store.path]
+
+
+def test_cancel_stops_writes_after_logout(store, fake_api):
+    gate, _ = fake_api
+    gate.clear()
+    job = start_history_backfill(store, "token", "2023-01-01", "2024-12-31")
+    cancel_history_backfill(store)
+    store.clear()
+    gate.set()  # Requests that were already running now return
+    wait(job)
+
+    assert job.done() and job.cancelled
+    assert store.load("activities", "2000-01-01", "2030-01-01") == []
+    assert store.sync_range("activities") == (None, None)
+    assert store.path not in intervals_api._backfills
+
+
+def test_read_timeouts_are_not_retried(monkeypatch):
+    monkeypatch.setattr(intervals_api, "_session", None)
+    retry = intervals_api.get_session().get_adapter("https://intervals.icu").max_retries
+    assert retry.read == 0
+    assert 429 in retry.status_forcelist
@@ -0,0 +1,58 @@
+"""Theme stylesheet build (media.py)."""
+import os
+
+import pytest
+
+import media
+from media import minify_css, theme_stylesheet_url
+
+
+@pytest.fixture
+def theme(tmp_path, monkeypatch):
+    source = tmp_path / "theme.css"
+    source.write_text("/* theme */\n.card {\n  color: red;\n}\n")
+    monkeypatch.setattr(media, "THEME_SOURCE", str(source))
+    monkeypatch.setattr(media, "STATIC_DIR", str(tmp_path / "static"))
+    theme_stylesheet_url.cache_clear()
+    yield source, tmp_path / "static" / media.THEME_FILE
+    theme_stylesheet_url.cache_clear()
+
+
+def test_committed_build_matches_source():
+    with open(media.THEME_SOURCE, encoding="utf-8") as f:
+        expected = minify_css(f.read())
+    with open(os.path.join(media.STATIC_DIR, media.THEME_FILE), encoding="utf-8") as f:
+        assert f.read() == expected, "run the app once (or minify_css) to rebuild static/theme.min.css"
+
+
+def test_builds_missing_stylesheet(theme):
+    source, target = theme
+    url = theme_stylesheet_url()
+    assert target.read_text() == ".card{color:red}"
+    assert url.startswith(f"app/static/{media.THEME_FILE}?v=")
+
+
+def test_rebuilds_stale_stylesheet_with_newer_mtime(theme):
+    # A checkout can leave the generated file newer than an edited source
+    source, target = theme
+    target.parent.mkdir()
+    target.write_text(".card{color:blue}")
+    os.utime(source, (1, 1))
+
+    theme_stylesheet_url()
+    assert target.read_text() == ".card{color:red}"
+    assert not list(target.parent.glob("*.tmp"))
+
+
+def test_read_only_deploy_serves_existing_build(theme, monkeypatch):
+    source, target = theme
+    target.parent.mkdir()
+    target.write_text(".card{color:blue}")
+
+    def read_only(*args, **kwargs):
+        raise PermissionError("read-only file system")
+
+    monkeypatch.setattr(media.os, "replace", read_only)
+    assert theme_stylesheet_url().startswith(f"app/static/{media.THEME_FILE}?v=")
+    assert target.read_text() == ".card{color:blue}"
+    assert not list(target.parent.glob("*.tmp"))
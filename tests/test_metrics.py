@@ -0,0 +1,190 @@
+"""Training load engine (metrics.py)."""
+import numpy as np
+import pandas as pd
+import pytest
+
+import metrics
+from data_store import AthleteStore
+from metrics import daily_load, estimate_load, ewma, training_load
+
+
+def make_activities(days, start="2024-01-01", seed=0):
+    """One activity on most days, with a mix of suffer_score and moving_time-only rows."""
+    rng = np.random.default_rng(seed)
+    rows = []
+    for day in pd.date_range(start, periods=days, freq="D"):
+        if rng.random() < 0.2:
+            continue
+        row = {"id": f"i{day:%Y%m%d}", "start_date_local": f"{day:%Y-%m-%d}T07:30:00",
+               "moving_time": int(rng.integers(1200, 7200))}
+        if rng.random() < 0.7:
+            row["suffer_score"] = float(rng.integers(10, 200))
+        rows.append(row)
+    return rows
+
+
+def assert_same_frame(result, expected):
+    assert list(result.index) == list(expected.index)
+    np.testing.assert_allclose(result[["ctl", "atl", "tsb"]].to_numpy(), expected[["ctl", "atl", "tsb"]].to_numpy(),
+                               rtol=1e-9, atol=1e-9)
+
+
+# --- Reference: the pandas pipeline Section 6.1 ran before metrics.py ---
+
+def reference_estimate_load(row):
+    if 'suffer_score' in row and row['suffer_score']:
+        return row['suffer_score']
+    elif 'moving_time' in row:
+        hours = row['moving_time'] / 3600
+        return hours * 50
+    return 0
+
+
+def reference_pipeline(activities):
+    df = pd.DataFrame(activities)
+    df['start_date_local'] = pd.to_datetime(df['start_date_local'])
+    df = df.sort_values('start_date_local')
+    df['TSS'] = df.apply(reference_estimate_load, axis=1)
+    load = df.set_index('start_date_local')['TSS'].resample('D').sum().fillna(0)
+    ctl = load.ewm(span=42, adjust=False).mean()
+    atl = load.ewm(span=7, adjust=False).mean()
+    return load, pd.DataFrame({'ctl': ctl, 'atl': atl, 'tsb': ctl - atl})
+
+
+def zero_suffer(activities):
+    """suffer_score 0 instead of absent: the reference counted a NaN score as no load (see below)."""
+    return [{"suffer_score": 0.0, **act} for act in activities]
+
+
+def test_estimate_load_matches_apply():
+    df = pd.DataFrame({
+        'suffer_score': [120.0, 0.0, None, 35.5, 0.0],
+        'moving_time': [3600, 5400, 1800, None, None],
+    }).drop(index=2)  # NaN suffer_score is covered below (deliberate change)
+    expected = df.apply(reference_estimate_load, axis=1).fillna(0).to_numpy()
+    np.testing.assert_allclose(np.nan_to_num(estimate_load(df)), expected)
+
+
+def test_nan_suffer_score_falls_back_to_moving_time():
+    # The old truthiness check let NaN through (counted as no load); now the fallback applies
+    df = pd.DataFrame({'suffer_score': [np.nan], 'moving_time': [1800]})
+    np.testing.assert_allclose(estimate_load(df), [25.0])
+
+
+def test_estimate_load_missing_columns():
+    np.testing.assert_allclose(estimate_load(pd.DataFrame({'moving_time': [7200]})), [100.0])
+    np.testing.assert_allclose(estimate_load(pd.DataFrame({'suffer_score': [0.0, 80.0]})), [0.0, 80.0])
+    assert estimate_load(pd.DataFrame()).size == 0
+
+
+@pytest.mark.parametrize("span", [1, 7, 42])
+def test_ewma_matches_pandas(span):
+    x = np.random.default_rng(span).gamma(2.0, 40.0, size=1500)
+    x[::9] = 0  # Rest days
+    expected = pd.Series(x).ewm(span=span, adjust=False).mean().to_numpy()
+    np.testing.assert_allclose(ewma(x, span), expected, rtol=1e-10, atol=1e-10)
+    # Continuing from a saved value gives the same tail
+    np.testing.assert_allclose(ewma(x[600:], span, initial=expected[599]), expected[600:], rtol=1e-10, atol=1e-10)
+
+
+def test_ewma_empty():
+    assert ewma([], 42).size == 0
+
+
+def test_daily_load_matches_resample():
+    acts = zero_suffer(make_activities(200)) + [  # Two sessions on one day
+        {"start_date_local": "2024-03-05T18:00:00", "moving_time": 3600, "suffer_score": 0},
+    ]
+    expected, _ = reference_pipeline(acts)
+    result = daily_load(pd.DataFrame(acts))
+    assert list(result.index) == list(expected.index)
+    np.testing.assert_allclose(result.to_numpy(), expected.to_numpy())
+
+
+def test_training_load_matches_pandas_pipeline():
+    acts = zero_suffer(make_activities(730, seed=3))
+    for act in acts[::11]:
+        act.pop('moving_time')  # Missing moving_time (and sometimes no suffer_score either)
+    _, expected = reference_pipeline(acts)
+    result = training_load(acts)
+    assert list(result.index) == list(expected.index)
+    np.testing.assert_allclose(result[['ctl', 'atl', 'tsb']].to_numpy(), expected.to_numpy(), rtol=1e-10, atol=1e-10)
+
+
+def test_training_load_empty_input():
+    for empty in ([], pd.DataFrame(), pd.DataFrame({'moving_time': [60]})):
+        result = training_load(empty)
+        assert result.empty and list(result.columns) == ['ctl', 'atl', 'tsb', 'date']
+
+
+# --- incremental_training_load ---
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path, monkeypatch):
+    """An athlete store; the "sqlite" variant forgets the in-memory state before every call."""
+    athlete_store = AthleteStore("test", data_dir=str(tmp_path))
+    metrics.forget_training_state(athlete_store)
+    if request.param == "sqlite":
+        incremental = metrics.incremental_training_load
+
+        def from_disk(store, activities):
+            metrics.forget_training_state(store)
+            return incremental(store, activities)
+
+        monkeypatch.setattr(metrics, "incremental_training_load", from_disk)
+    return athlete_store
+
+
+def incremental(store, activities):
+    return metrics.incremental_training_load(store, activities)
+
+
+def test_matches_full_recompute(store):
+    acts = make_activities(400)
+    assert_same_frame(incremental(store, acts), training_load(acts))
+    assert_same_frame(incremental(store, acts), training_load(acts))  # Warm rerun
+
+
+def test_new_days_only_run_the_new_days(store, monkeypatch):
+    acts = make_activities(400)
+    incremental(store, acts[:-5])
+    expected = training_load(acts)
+    new_days = len(expected) - len(training_load(acts[:-5]))
+
+    lengths = []
+    ewma = metrics.ewma
+    monkeypatch.setattr(metrics, "ewma", lambda values, span, initial=None: lengths.append(len(values)) or ewma(values, span, initial))
+    assert_same_frame(incremental(store, acts), expected)
+    assert lengths == [new_days, new_days]
+
+
+def test_editing_an_old_activity_backfills_from_there(store):
+    acts = make_activities(400)
+    incremental(store, acts)
+    acts[10] = dict(acts[10], suffer_score=999.0)
+    assert_same_frame(incremental(store, acts), training_load(acts))
+
+
+def test_sliding_window(store):
+    acts = make_activities(500)
+    for shift in range(0, 120, 7):
+        window = acts[shift:shift + 300]
+        assert_same_frame(incremental(store, window), training_load(window))
+
+
+def test_gap_and_longer_history(store):
+    acts = make_activities(700)
+    recent, older = acts[-100:], acts[:200]
+    # Recent months, then an older stretch with a gap to the saved days, then everything
+    for window in (recent, older, acts, recent, acts):
+        assert_same_frame(incremental(store, window), training_load(window))
+
+
+def test_deleted_last_days(store):
+    acts = make_activities(300)
+    incremental(store, acts)
+    assert_same_frame(incremental(store, acts[:-10]), training_load(acts[:-10]))
+
+
+def test_empty_history(store):
+    assert incremental(store, []).empty
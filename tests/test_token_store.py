@@ -0,0 +1,95 @@
+"""Per-login token store (token_store.py)."""
+import threading
+import time
+
+import token_store
+from token_store import TokenStore, remove_legacy_token_file
+
+EXPIRING = {"access_token": "old", "refresh_token": "r", "expires_in": 10}  # Inside the refresh margin
+
+
+def make_store(tmp_path):
+    return TokenStore(directory=str(tmp_path), master_key=b"test-key")
+
+
+def test_roundtrip_and_delete(tmp_path):
+    store = make_store(tmp_path)
+    handle = store.new_handle()
+    store.save(handle, {"access_token": "a", "expires_in": 3600})
+    assert store.load(handle)["access_token"] == "a"
+    store.delete(handle)
+    assert store.load(handle) is None
+
+
+def test_concurrent_sessions_refresh_once(tmp_path):
+    store = make_store(tmp_path)
+    handle = store.new_handle()
+    store.save(handle, EXPIRING)
+    calls = []
+
+    def refresh(refresh_token):
+        calls.append(refresh_token)
+        time.sleep(0.1)
+        return {"access_token": "new", "expires_in": 3600}
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(store.load_fresh(handle, refresh))) for _ in range(5)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(calls) == 1
+    assert {r["access_token"] for r in results} == {"new"}
+
+
+def test_slow_refresh_does_not_block_other_logins(tmp_path):
+    store = make_store(tmp_path)
+    slow, other = store.new_handle(), store.new_handle()
+    store.save(slow, EXPIRING)
+    store.save(other, EXPIRING)
+    release = threading.Event()
+
+    def hanging_refresh(refresh_token):
+        release.wait(5)
+        return {}
+
+    stuck = threading.Thread(target=store.load_fresh, args=(slow, hanging_refresh))
+    stuck.start()
+    try:
+        time.sleep(0.05)  # `slow` now holds its lock
+        start = time.monotonic()
+        fresh = store.load_fresh(other, lambda rt: {"access_token": "new", "expires_in": 3600})
+        store.save(store.new_handle(), {"access_token": "x"})
+        assert fresh["access_token"] == "new"
+        assert time.monotonic() - start < 1
+    finally:
+        release.set()
+        stuck.join()
+
+
+def test_handles_expire(tmp_path, monkeypatch):
+    store = make_store(tmp_path)
+    handle = store.new_handle()
+    store.save(handle, {"access_token": "a"})
+    monkeypatch.setattr(token_store, "SESSION_TTL", -1)
+    assert store.load(handle) is None
+    assert not list(tmp_path.glob("*.tok"))  # Expired files are removed
+
+
+def test_rotate_moves_the_login_to_a_new_handle(tmp_path):
+    store = make_store(tmp_path)
+    handle = store.new_handle()
+    store.save(handle, {"access_token": "a"})
+    new_handle = store.rotate(handle)
+    assert new_handle != handle
+    assert store.load(handle) is None
+    assert store.load(new_handle)["access_token"] == "a"
+    assert store.rotate(handle) is None  # The old URL can't be replayed
+
+
+def test_remove_legacy_token_file(tmp_path):
+    legacy = tmp_path / "auth_token.json"
+    legacy.write_text("{}")
+    remove_legacy_token_file(str(legacy))
+    remove_legacy_token_file(str(legacy))  # Missing is fine
+    assert not legacy.exists()
@@ -0,0 +1,209 @@
+"""
+Per-login OAuth token store.
+
+Each login gets a random handle (kept in the browser's URL) and its token is
+saved under a hash of that handle, encrypted with a key derived from the
+handle and a server secret, so a copy of the directory alone can't be read.
+Writes are atomic and serialized per handle with a file lock, which also makes
+sure that only one session refreshes an expiring token while the others
+(of the same login) wait for the result.
+
+A handle is a bearer credential, so it only works for SESSION_TTL after it
+was issued, and every reconnect moves the login to a new handle (rotate()):
+a URL copied from history or a log stops working once the user comes back.
+"""
+import base64
+import hashlib
+import json
+import os
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+
+from cryptography.fernet import Fernet, InvalidToken
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+
+from data_store import DATA_DIR
+
+try:
+    import fcntl
+except ImportError:  # Windows: the in-process lock below still applies
+    fcntl = None
+
+TOKEN_DIR = os.path.join(DATA_DIR, "tokens")
+KEY_FILE = os.path.join(DATA_DIR, "token.key")  # Only used when no key is configured
+REFRESH_MARGIN = int(os.environ.get("AETHERIUM_TOKEN_REFRESH_MARGIN", 5 * 60))  # seconds before expiry
+SESSION_TTL = int(os.environ.get("AETHERIUM_SESSION_TTL", 7 * 24 * 3600))  # seconds a handle stays valid
+LEGACY_TOKEN_FILE = "auth_token.json"  # Plaintext single-user token from before the store
+
+# In-process locks, one per handle (refcounted, so they go away with their last user):
+# a slow refresh for one login never holds up another
+_locks_guard = threading.Lock()
+_handle_locks = {}
+
+
+def _master_key():
+    """AETHERIUM_TOKEN_KEY if set, else a random key generated once and kept next to the data."""
+    configured = os.environ.get("AETHERIUM_TOKEN_KEY")
+    if configured:
+        return configured.encode()
+    os.makedirs(DATA_DIR, exist_ok=True)
+    try:
+        fd = os.open(KEY_FILE, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:
+        with open(KEY_FILE, "rb") as f:
+            return f.read()
+    key = secrets.token_urlsafe(32).encode()
+    with os.fdopen(fd, "wb") as f:
+        f.write(key)
+    return key
+
+
+def needs_refresh(token_data, margin=REFRESH_MARGIN):
+    """True if the token expires within `margin` seconds and can be refreshed."""
+    expires_at = (token_data or {}).get("expires_at")
+    return bool(expires_at and token_data.get("refresh_token") and expires_at - time.time() < margin)
+
+
+def remove_legacy_token_file(path=LEGACY_TOKEN_FILE):
+    """Deletes the old plaintext token file if it is still lying around."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _stamp_expiry(token_data):
+    # OAuth responses carry a relative expires_in; keep an absolute time instead
+    token_data = dict(token_data)
+    if token_data.get("expires_in"):
+        token_data["expires_at"] = int(time.time()) + int(token_data["expires_in"])
+    return token_data
+
+
+@contextmanager
+def _handle_lock(key):
+    with _locks_guard:
+        entry = _handle_locks.setdefault(key, [threading.Lock(), 0])
+        entry[1] += 1
+    try:
+        with entry[0]:
+            yield
+    finally:
+        with _locks_guard:
+            entry[1] -= 1
+            if not entry[1]:
+                del _handle_locks[key]
+
+
+class TokenStore:
+    """Encrypted token files in `directory`, one per login handle."""
+
+    def __init__(self, directory=TOKEN_DIR, master_key=None):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.master_key = master_key or _master_key()
+
+    @staticmethod
+    def new_handle():
+        return secrets.token_urlsafe(24)
+
+    def _path(self, handle):
+        return os.path.join(self.directory, hashlib.sha256(handle.encode()).hexdigest() + ".tok")
+
+    def _fernet(self, handle):
+        hkdf = HKDF(algorithm=hashes.SHA256(), length=32, salt=None, info=handle.encode())
+        return Fernet(base64.urlsafe_b64encode(hkdf.derive(self.master_key)))
+
+    @contextmanager
+    def _locked(self, handle):
+        with _handle_lock(self._path(handle)), open(self._path(handle) + ".lock", "a") as lock_file:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read(self, handle):
+        """The stored token, or None if there is none, it can't be decrypted or the handle expired."""
+        try:
+            with open(self._path(handle), "rb") as f:
+                token_data = json.loads(self._fernet(handle).decrypt(f.read()))
+        except (FileNotFoundError, InvalidToken, ValueError):
+            return None
+        if time.time() - token_data.get("handle_issued_at", 0) > SESSION_TTL:
+            return None  # Logins saved before handles expired count as expired too
+        return token_data
+
+    def _write(self, handle, token_data):
+        path = self._path(handle)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(self._fernet(handle).encrypt(json.dumps(token_data).encode()))
+        os.replace(tmp_path, path)  # Atomic, so readers never see half a file
+
+    def save(self, handle, token_data):
+        """Stores a fresh OAuth response (expires_in is turned into an absolute expires_at)."""
+        token_data = dict(_stamp_expiry(token_data), handle_issued_at=int(time.time()))
+        with self._locked(handle):
+            self._write(handle, token_data)
+        return token_data
+
+    def load(self, handle):
+        """The stored token, or None if there is none (or it can't be decrypted, or expired)."""
+        # No lock needed: writes replace the file atomically
+        token_data = self._read(handle)
+        if token_data is None and os.path.exists(self._path(handle)):
+            self.delete(handle)  # Expired (or unreadable): don't keep it around
+        return token_data
+
+    def load_fresh(self, handle, refresh):
+        """
+        Like load(), but refreshes a token that is about to expire first.
+        `refresh(refresh_token)` returns the new OAuth response (or {} on
+        failure, in which case the old token is returned as-is). The check is
+        repeated under the lock, so concurrent sessions only refresh once.
+        """
+        token_data = self.load(handle)
+        if not needs_refresh(token_data):
+            return token_data
+        with self._locked(handle):
+            token_data = self._read(handle)
+            if not needs_refresh(token_data):
+                return token_data  # Another session refreshed it while we waited
+            refreshed = refresh(token_data["refresh_token"])
+            if not refreshed.get("access_token"):
+                return token_data
+            # Providers may omit unchanged fields (refresh_token, athlete) on refresh
+            token_data = _stamp_expiry({**token_data, **refreshed})
+            self._write(handle, token_data)
+            return token_data
+
+    def rotate(self, handle):
+        """
+        Moves a login to a new handle, issued now, and returns it; the old handle
+        stops working. None if the old one is unknown or expired.
+        """
+        with self._locked(handle):
+            token_data = self._read(handle)
+            if token_data is None:
+                return None
+            new_handle = self.new_handle()
+            with self._locked(new_handle):
+                self._write(new_handle, dict(token_data, handle_issued_at=int(time.time())))
+            self._remove(handle)
+        return new_handle
+
+    def _remove(self, handle):
+        for path in (self._path(handle), self._path(handle) + ".lock"):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def delete(self, handle):
+        with self._locked(handle):
+            self._remove(handle)
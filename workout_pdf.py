@@ -0,0 +1,238 @@
+"""
+Workout card PDF rendering (FPDF).
+
+PDFs are built lazily (when the download button is actually used) and kept
+in a bounded in-process cache keyed on a hash of everything that ends up on
+the page, so downloading the same card again costs nothing. Whole training
+weeks can be exported as a booklet or a zip of cards via a process pool.
+"""
+import io
+import multiprocessing
+import os
+import threading
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+from fpdf import FPDF
+
+from cache_utils import LRUCache, content_key
+from media import LOGO_PDF, pdf_asset_path, pdf_background_path
+
+# Bump whenever the layout below changes so cached PDFs aren't reused
+PDF_TEMPLATE_VERSION = 1
+PDF_CACHE_SIZE = int(os.environ.get("AETHERIUM_PDF_CACHE_SIZE", 128))
+
+_pdf_cache = LRUCache(PDF_CACHE_SIZE)
+
+
+class ProPDF(FPDF):
+    def header(self):
+        # We leave this empty because we draw the background manually in the function
+        pass 
+
+    def footer(self):
+        # Professional Footer
+        self.set_y(-15)
+        self.set_font('Arial', 'I', 8)
+        self.set_text_color(128)
+        self.cell(0, 10, f'Aetherium AI Project | Page {self.page_no()}', 0, 0, 'C')
+
+
+def pdf_file_name(sport):
+    return f"Aetherium_{sport}_{datetime.now().strftime('%Y%m%d_%H%M')}.pdf"
+
+
+def _draw_workout_page(pdf, raw_text, sport, label=None):
+    """Adds one workout card page (background, card, header, workout text) to `pdf`."""
+    pdf.add_page()
+
+    # --- A. SETUP IMAGES ---
+    # Pre-sized files from scripts/build_assets.py: no download, no temp files (a
+    # missing background is just left out). FPDF embeds each file once per
+    # document, so a booklet reuses them on every page.
+    bg_path = pdf_background_path()
+    logo_path = pdf_asset_path(LOGO_PDF)
+
+    # --- B. DRAW VISUALS ---
+    # 1. Draw Background
+    if bg_path:
+        pdf.image(bg_path, x=0, y=0, w=210, h=297)
+
+    # 2. Draw "Card" (White Box)
+    pdf.set_fill_color(255, 255, 255)
+    if hasattr(pdf, "set_alpha"):
+        pdf.set_alpha(0.85)
+        pdf.rect(10, 10, 190, 277, 'F')
+        pdf.set_alpha(1.0)
+    else:
+        # Older FPDF versions don't support alpha
+        pdf.rect(10, 10, 190, 277, 'F')
+
+    # --- C. DRAW HEADER ---
+    if logo_path:
+        pdf.image(logo_path, x=15, y=15, w=20)
+        title_x = 40
+    else:
+        title_x = 15
+
+    pdf.set_xy(title_x, 18)
+    pdf.set_font("Arial", "B", 24)
+    pdf.set_text_color(30, 30, 30)
+    pdf.cell(0, 10, f"{sport.upper()} SESSION", 0, 1, 'L')
+    
+    pdf.set_xy(title_x, 28)
+    pdf.set_font("Arial", "I", 10)
+    pdf.set_text_color(112, 196, 176) # Teal
+    timestamp = label or datetime.now().strftime("%A, %B %d, %Y")
+    pdf.cell(0, 5, f"Designed by Aetherium Project | {timestamp}", 0, 1, 'L')
+    
+    pdf.ln(15)
+
+    # --- D. PARSE CONTENT ---
+    lines = raw_text.split('\n')
+    
+    for line in lines:
+        clean_line = line.strip()
+        if not clean_line:
+            pdf.ln(2)
+            continue
+            
+        # HEADERS
+        if clean_line.startswith("**") and clean_line.endswith("**"):
+            header_text = clean_line.replace("**", "").upper()
+            pdf.ln(5)
+            pdf.set_fill_color(112, 196, 176) # Teal
+            pdf.set_font("Arial", "B", 11)
+            pdf.set_text_color(255, 255, 255)
+            width = pdf.get_string_width(header_text) + 10
+            pdf.cell(width, 8, header_text, 0, 1, 'C', fill=True)
+            pdf.set_text_color(50) 
+            pdf.ln(2)
+
+        # BULLETS
+        elif clean_line.startswith("* ") or clean_line.startswith("- "):
+            bullet_text = clean_line[2:]
+            pdf.set_font("Arial", "", 11)
+            pdf.set_text_color(40)
+            pdf.set_x(20) 
+            pdf.cell(5, 6, chr(149), 0, 0)
+            pdf.multi_cell(0, 6, bullet_text)
+            
+        # BOLD
+        elif "**" in clean_line:
+            clean_line = clean_line.replace("**", "")
+            pdf.set_font("Arial", "B", 11)
+            pdf.set_text_color(20)
+            pdf.multi_cell(0, 6, clean_line)
+            
+        # TEXT
+        else:
+            pdf.set_font("Arial", "", 11)
+            pdf.set_text_color(60)
+            pdf.multi_cell(0, 6, clean_line)
+
+
+def create_pdf_from_text(raw_text, sport, label=None):
+    """Generates a premium PDF with background, logo, and card layout."""
+    try:
+        pdf = ProPDF()
+        pdf.set_auto_page_break(auto=True, margin=20)
+        _draw_workout_page(pdf, raw_text, sport, label)
+        return pdf_file_name(sport), pdf.output(dest='S').encode('latin-1')
+
+    except Exception as e:
+        return "error.pdf", str(e).encode()
+
+
+def _cache_key(raw_text, sport, label=None):
+    # The card shows today's date (or the label), so it is part of the key too
+    return content_key(raw_text, sport, label, PDF_TEMPLATE_VERSION, datetime.now().strftime("%Y-%m-%d"))
+
+
+def get_workout_pdf(raw_text, sport, label=None):
+    """Returns the PDF bytes for a workout card, rendering it only on a cache miss."""
+    key = _cache_key(raw_text, sport, label)
+    pdf_bytes = _pdf_cache.get(key)
+    if pdf_bytes is None:
+        fname, pdf_bytes = create_pdf_from_text(raw_text, sport, label)
+        if fname == "error.pdf":
+            return pdf_bytes  # Don't cache failures
+        _pdf_cache.put(key, pdf_bytes)
+    return pdf_bytes
+
+
+# ==============================================================================
+# --- BATCH EXPORT (training week) ---
+# ==============================================================================
+# FPDF layout is pure-Python CPU work, so batches go to worker processes rather
+# than threads. "spawn" keeps the children from inheriting the Streamlit server's
+# threads; they only import this module.
+BATCH_WORKERS = int(os.environ.get("AETHERIUM_PDF_WORKERS", min(4, os.cpu_count() or 1)))
+
+_batch_pool = None
+_batch_pool_lock = threading.Lock()
+
+
+def _get_batch_pool():
+    global _batch_pool
+    with _batch_pool_lock:
+        if _batch_pool is None:
+            _batch_pool = ProcessPoolExecutor(
+                max_workers=BATCH_WORKERS, mp_context=multiprocessing.get_context("spawn")
+            )
+        return _batch_pool
+
+
+def _render_card(item):
+    return create_pdf_from_text(item["text"], item["sport"], item.get("label"))
+
+
+def _render_booklet(items):
+    pdf = ProPDF()
+    pdf.set_auto_page_break(auto=True, margin=20)
+    for item in items:
+        _draw_workout_page(pdf, item["text"], item["sport"], item.get("label"))
+    return pdf.output(dest='S').encode('latin-1')
+
+
+def render_workout_cards(items):
+    """
+    Renders one PDF per workout ({"text", "sport", "label"} dicts) in the
+    process pool and returns their bytes in order. Cached cards are reused.
+    """
+    results = [None] * len(items)
+    misses = []
+    for i, item in enumerate(items):
+        results[i] = _pdf_cache.get(_cache_key(item["text"], item["sport"], item.get("label")))
+        if results[i] is None:
+            misses.append(i)
+
+    if misses:
+        rendered = _get_batch_pool().map(_render_card, [items[i] for i in misses])
+        for i, (fname, pdf_bytes) in zip(misses, rendered):
+            if fname == "error.pdf":
+                raise RuntimeError(f"PDF rendering failed: {pdf_bytes.decode(errors='replace')}")
+            _pdf_cache.put(_cache_key(items[i]["text"], items[i]["sport"], items[i].get("label")), pdf_bytes)
+            results[i] = pdf_bytes
+    return results
+
+
+def export_week_zip(items):
+    """Zip of one card per workout, e.g. for a 7-day plan (stored: the PDFs are mostly JPEG already)."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_STORED) as zf:
+        for i, (item, pdf_bytes) in enumerate(zip(items, render_workout_cards(items)), start=1):
+            name = "".join(c if c.isalnum() else "_" for c in (item.get("label") or item["sport"]))
+            zf.writestr(f"{i:02d}_{name}.pdf", pdf_bytes)
+    return buffer.getvalue()
+
+
+def export_week_booklet(items):
+    """
+    One multi-page PDF with a card per workout. A single FPDF document can't be
+    split across processes, so the whole booklet is one pool task (this keeps
+    the layout work off the Streamlit server process); the background and logo
+    are embedded once and shared by every page.
+    """
+    return _get_batch_pool().submit(_render_booklet, list(items)).result()